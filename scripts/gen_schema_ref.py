@@ -37,12 +37,26 @@ GROUPS: list[tuple[str, str, list[str]]] = [
     (
         "Transcripts",
         "Transcript text, per-segment timing, and the append-only correction audit trail.",
-        ["video_transcripts", "transcript_segments", "transcript_corrections"],
+        [
+            "video_transcripts",
+            "transcript_segments",
+            "transcript_corrections",
+            "video_transcript_raw_archive",
+            "transcript_segment_seams",
+            "transcript_segment_changes",
+        ],
     ),
     (
         "User Data",
         "The local user's own engagement data, keyed by the canonical identity.",
-        ["app_identities", "user_videos", "user_language_preferences"],
+        [
+            "app_identities",
+            "user_videos",
+            "user_language_preferences",
+            "user_watch_daily",
+            "user_watch_hourly",
+            "takeout_messages",
+        ],
     ),
     (
         "Playlists",
@@ -73,6 +87,8 @@ GROUPS: list[tuple[str, str, list[str]]] = [
             "entity_aliases",
             "entity_mentions",
             "entity_operation_logs",
+            "entity_video_associations",
+            "entity_cooccurrences",
         ],
     ),
     (
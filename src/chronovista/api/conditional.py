@@ -0,0 +1,123 @@
+"""Conditional GET support for read endpoints.
+
+Two kinds of validator are issued, both with ``Cache-Control: private,
+no-cache`` so the browser keeps the body and revalidates on every navigation
+by sending ``If-None-Match``:
+
+- Endpoints served from :mod:`chronovista.db.aggregate_cache` use the strong
+  ``ETag`` stored with the cached payload.
+- Other read endpoints derive a weak ``ETag`` from cheap data-generation
+  markers (a transcript's ``downloaded_at`` and ``last_corrected_at``, say)
+  with :func:`weak_etag`, and check it with :func:`not_modified` *before*
+  loading and serializing the full response.
+
+Either way an unchanged resource answers an empty ``304 Not Modified``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from chronovista.db.aggregate_cache import CachedAggregate
+
+# Revalidate every time (the data may have changed under a sync), but never
+# store the body in a shared cache.
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an ``If-None-Match`` header matches *etag*.
+
+    Uses the weak comparison RFC 9110 prescribes for ``If-None-Match``, so a
+    ``W/`` prefix on either side is ignored.
+
+    Parameters
+    ----------
+    if_none_match : str or None
+        The raw request header.
+    etag : str
+        The current entity tag.
+
+    Returns
+    -------
+    bool
+        ``True`` when the client's copy is current.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    current = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == current
+        for candidate in if_none_match.split(",")
+    )
+
+
+def weak_etag(*markers: object) -> str:
+    """Build a weak ``ETag`` from data-generation markers.
+
+    Parameters
+    ----------
+    *markers : object
+        Values that change whenever the response would: identifiers, query
+        parameters, ``updated_at``-style timestamps, counters. Their ``repr``
+        is hashed, so ``None`` and ``0`` stay distinct.
+
+    Returns
+    -------
+    str
+        ``W/"<hash>"``.
+    """
+    digest = hashlib.sha256(repr(markers).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Response | None:
+    """Set validator headers, and short-circuit when the client is current.
+
+    Parameters
+    ----------
+    request : Request
+        The incoming request (for ``If-None-Match``).
+    response : Response
+        The route's injected response; receives ``ETag`` and
+        ``Cache-Control`` for the ``200`` case.
+    etag : str
+        The resource's current ``ETag``.
+
+    Returns
+    -------
+    Response or None
+        A ``304`` to return as is, or ``None`` to build the full response.
+    """
+    headers = {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+def cached_json_response(request: Request, entry: CachedAggregate) -> Response:
+    """Answer with ``304`` when the client's copy is current, else the JSON body.
+
+    Parameters
+    ----------
+    request : Request
+        The incoming request (for ``If-None-Match``).
+    entry : CachedAggregate
+        The cached payload and its ``ETag``.
+
+    Returns
+    -------
+    Response
+        ``304 Not Modified`` or a ``200`` JSON response, both carrying the
+        validator headers.
+    """
+    headers = {"ETag": entry.etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(entry.payload, headers=headers)
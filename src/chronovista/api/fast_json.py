@@ -0,0 +1,115 @@
+"""Fast-path JSON responses for the high-volume list endpoints.
+
+A normal route returns nested Pydantic models, which FastAPI then dumps,
+re-validates against ``response_model``, encodes with ``jsonable_encoder`` and
+finally serializes with ``json.dumps``. For a 100-video page or a 200-segment
+page that work rivals the database time.
+
+With ``API_FAST_JSON`` enabled, the hottest list endpoints (video list,
+transcript segments, entity videos) instead shape each row straight into a
+plain ``dict`` with exactly the fields and types of the response schema and
+return a :class:`FastJSONResponse`. Returning a ``Response`` makes FastAPI skip
+``response_model`` validation entirely; the rows are trusted because they are
+built from typed columns, and the unit tests pin the fast payload to the
+model path's output byte-for-byte.
+
+The body is encoded by ``orjson`` when it is installed (``poetry install
+--with fast-json``), with ``OPT_UTC_Z`` so UTC datetimes render exactly as
+Pydantic renders them (``...Z``). Without it, a compact ``json.dumps`` with
+the same conventions is used, which still avoids the validation passes.
+"""
+
+from __future__ import annotations
+
+import enum
+import json
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSON_AVAILABLE = False
+
+
+def _default(value: Any) -> Any:
+    """Encode the non-JSON types the response schemas carry, Pydantic-style."""
+    if isinstance(value, datetime):
+        text = value.isoformat()
+        if value.utcoffset() == timedelta(0):
+            return text.removesuffix("+00:00") + "Z"
+        return text
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize *content* to compact UTF-8 JSON.
+
+    Parameters
+    ----------
+    content : Any
+        Plain ``dict``/``list`` data; ``datetime``, ``date``, ``UUID`` and
+        ``Enum`` values are encoded as Pydantic's JSON mode encodes them.
+
+    Returns
+    -------
+    bytes
+        The encoded body.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+    return json.dumps(
+        content, ensure_ascii=False, separators=(",", ":"), default=_default
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with :func:`dumps` instead of ``json.dumps``.
+
+    Examples
+    --------
+    >>> FastJSONResponse({"data": [], "pagination": None}).body
+    b'{"data":[],"pagination":null}'
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Encode the response body."""
+        return dumps(content)
+
+
+def fast_page(
+    data: list[dict[str, Any]], *, total: int, limit: int, offset: int
+) -> dict[str, Any]:
+    """Wrap fast-path rows in the ``ApiResponse`` envelope.
+
+    Parameters
+    ----------
+    data : list[dict[str, Any]]
+        The page's rows, already shaped like the item schema.
+    total, limit, offset : int
+        Pagination inputs, as for ``PaginationMeta``.
+
+    Returns
+    -------
+    dict[str, Any]
+        ``{"data": ..., "pagination": {...}}`` with the keys in schema order.
+    """
+    pagination = {
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "has_more": (offset + limit) < total,
+    }
+    return {"data": data, "pagination": pagination}
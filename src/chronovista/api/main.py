@@ -15,6 +15,8 @@ from starlette.responses import FileResponse, Response
 
 from chronovista.api.exception_handlers import register_exception_handlers
 from chronovista.api.middleware import (
+    CompressionMiddleware,
+    QueryInstrumentationMiddleware,
     RequestIdFilter,
     RequestIdMiddleware,
     get_request_id,
@@ -27,6 +29,7 @@ from chronovista.api.routers import (
     entity_mentions,
     health,
     images,
+    metrics,
     onboarding,
     overview,
     playlists,
@@ -42,6 +45,8 @@ from chronovista.api.routers import (
     transcripts,
     videos,
 )
+from chronovista.config.settings import settings as app_settings
+from chronovista.services.knowledge_base_cache import close_shared_http_client
 
 # Ensure application-level logs (chronovista.*) reach stdout/stderr.
 # Without this, only uvicorn's access logs appear in Docker.
@@ -74,6 +79,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     )
     yield
     # Shutdown
+    await close_shared_http_client()
 
 
 app = FastAPI(
@@ -107,6 +113,18 @@ if not _serve_static:
         allow_headers=["*"],
     )
 
+# Query instrumentation is opt-in (API_INSTRUMENTATION). Registered before
+# RequestIdMiddleware so it runs inside it and sees the request ID.
+if app_settings.api_instrumentation:
+    app.add_middleware(QueryInstrumentationMiddleware)
+
+# Compression wraps CORS and instrumentation so it sees their final headers,
+# and weakens any strong ETag on the bodies it compresses.
+if app_settings.api_compression:
+    app.add_middleware(
+        CompressionMiddleware, minimum_size=app_settings.api_compression_min_bytes
+    )
+
 # Register Request ID middleware early in the chain
 # This ensures request ID is available throughout request processing
 # Note: Middleware is applied in reverse order of registration,
@@ -279,6 +297,7 @@ app.include_router(
 app.include_router(settings.router, prefix="/api/v1", tags=["settings"])
 app.include_router(onboarding.router, prefix="/api/v1", tags=["onboarding"])
 app.include_router(tasks.router, prefix="/api/v1", tags=["tasks"])
+app.include_router(metrics.router, prefix="/api/v1", tags=["metrics"])
 
 # Conditionally mount static files and SPA catch-all for production/Docker mode
 # This MUST be registered AFTER all API routers so API routes take priority
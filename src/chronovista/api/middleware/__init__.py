@@ -1,5 +1,9 @@
 """Middleware components for the chronovista API."""
 
+from chronovista.api.middleware.compression import CompressionMiddleware
+from chronovista.api.middleware.instrumentation import (
+    QueryInstrumentationMiddleware,
+)
 from chronovista.api.middleware.request_id import (
     RequestIdFilter,
     RequestIdMiddleware,
@@ -8,6 +12,8 @@ from chronovista.api.middleware.request_id import (
 )
 
 __all__ = [
+    "CompressionMiddleware",
+    "QueryInstrumentationMiddleware",
     "RequestIdFilter",
     "RequestIdMiddleware",
     "get_request_id",
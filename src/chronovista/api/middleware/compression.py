@@ -0,0 +1,195 @@
+"""Negotiated response compression (brotli or gzip).
+
+Full transcripts, 200-item segment pages and entity video lists are large,
+highly repetitive JSON; over a tunnel to a laptop they are slow to transfer
+uncompressed. This middleware compresses single-body responses of a
+compressible media type once they reach ``API_COMPRESSION_MIN_BYTES``:
+
+- ``br`` when the client accepts it and the optional ``brotli`` package is
+  installed (``poetry install --with compression``),
+- otherwise ``gzip`` when the client accepts it,
+- otherwise the body is sent as is.
+
+Streaming responses (file downloads, images) and responses that already carry
+a ``Content-Encoding`` pass through untouched. A strong ``ETag`` on a
+compressed response is weakened (``W/``): the bytes on the wire no longer
+match what it was computed from, but the representation is semantically the
+same, which is exactly what a weak validator promises.
+
+Written as a pure ASGI middleware so the body is handled as bytes without a
+second response object, and so it composes with ``StreamingResponse``.
+"""
+
+from __future__ import annotations
+
+import gzip
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/problem+json",
+    "application/javascript",
+    "image/svg+xml",
+    "text/",
+)
+
+# Favour speed: these bodies are produced per request, not cached compressed.
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+
+
+def parse_accept_encoding(header: str | None) -> dict[str, float]:
+    """Map each coding in an ``Accept-Encoding`` header to its q-value.
+
+    Parameters
+    ----------
+    header : str or None
+        The raw header.
+
+    Returns
+    -------
+    dict[str, float]
+        Lower-cased coding names; malformed q-values count as ``0``.
+    """
+    accepted: dict[str, float] = {}
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def choose_encoding(header: str | None, brotli_available: bool) -> str | None:
+    """Pick the response coding for an ``Accept-Encoding`` header.
+
+    Parameters
+    ----------
+    header : str or None
+        The raw request header.
+    brotli_available : bool
+        Whether ``br`` can be produced.
+
+    Returns
+    -------
+    str or None
+        ``"br"``, ``"gzip"`` or ``None`` for identity.
+    """
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    candidates = ["br", "gzip"] if brotli_available else ["gzip"]
+    scored = [(accepted.get(coding, wildcard), coding) for coding in candidates]
+    # max() keeps the first of equal scores, so br wins ties.
+    quality, coding = max(scored, key=lambda item: item[0])
+    return coding if quality > 0 else None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress *body* with ``br`` or ``gzip``."""
+    if encoding == "br":
+        compressed: bytes = brotli.compress(body, quality=BROTLI_QUALITY)
+        return compressed
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class CompressionMiddleware:
+    """Compress large JSON and text responses the client can decode.
+
+    Parameters
+    ----------
+    app : ASGIApp
+        The wrapped application.
+    minimum_size : int
+        Bodies smaller than this many bytes are sent uncompressed.
+
+    Examples
+    --------
+    >>> from fastapi import FastAPI
+    >>> from chronovista.api.middleware import CompressionMiddleware
+    >>> app = FastAPI()
+    >>> app.add_middleware(CompressionMiddleware, minimum_size=1024)
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Negotiate a coding and compress the response body if worthwhile."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(
+            Headers(scope=scope).get("accept-encoding"), BROTLI_AVAILABLE
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+            if passthrough:
+                await send(message)
+                return
+
+            body: bytes = message.get("body", b"")
+            headers = MutableHeaders(raw=start["headers"])
+            if message.get("more_body", False) or not self._should_compress(
+                start["status"], headers, body
+            ):
+                # Streaming or not worth it: forward unchanged from here on.
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if etag is not None and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+    def _should_compress(
+        self, status: int, headers: MutableHeaders, body: bytes
+    ) -> bool:
+        if status < 200 or status in (204, 206, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        if len(body) < self.minimum_size:
+            return False
+        content_type = headers.get("content-type", "").lower()
+        return content_type.startswith(COMPRESSIBLE_TYPES)
@@ -0,0 +1,144 @@
+"""Per-request query instrumentation middleware.
+
+Binds a fresh :class:`~chronovista.db.instrumentation.RequestQueryStats` to
+the request's context so the engine's cursor hooks can attribute statements,
+rows, DB time and pool checkout waits to it. When the response is ready the
+middleware:
+
+1. Adds a ``Server-Timing`` header (``db``, ``pool`` and ``app`` entries) so
+   browser dev tools show where the time went.
+2. Folds the request into :data:`~chronovista.db.instrumentation.query_metrics`
+   under its route template (``/api/v1/videos/{video_id}``, not the concrete
+   path), which ``GET /api/v1/metrics`` reports.
+3. Logs a warning naming the request ID for every statement repeated more than
+   ``API_N_PLUS_ONE_THRESHOLD`` times — the signature of an N+1 loop.
+
+Registered only when ``API_INSTRUMENTATION`` is enabled, and inside
+``RequestIdMiddleware`` so the request ID is already set.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from chronovista.api.middleware.request_id import get_request_id
+from chronovista.config.settings import settings
+from chronovista.db.instrumentation import (
+    RequestQueryStats,
+    current_request_stats,
+    query_metrics,
+)
+
+if TYPE_CHECKING:
+    from starlette.middleware.base import RequestResponseEndpoint
+
+logger = logging.getLogger(__name__)
+
+SERVER_TIMING_HEADER = "Server-Timing"
+
+# Requests that never matched a route (404s, static files) share one bucket
+# instead of one per concrete path.
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_template(request: Request) -> str:
+    """The matched route's path template, e.g. ``/api/v1/videos/{video_id}``.
+
+    Parameters
+    ----------
+    request : Request
+        The request, after routing has run.
+
+    Returns
+    -------
+    str
+        ``"METHOD template"``, or ``"METHOD <unmatched>"`` when no route matched.
+    """
+    route = request.scope.get("route")
+    path = getattr(route, "path", None) or UNMATCHED_ROUTE
+    return f"{request.method} {path}"
+
+
+def format_server_timing(stats: RequestQueryStats, elapsed_seconds: float) -> str:
+    """Render a ``Server-Timing`` header value for one request.
+
+    Parameters
+    ----------
+    stats : RequestQueryStats
+        Queries attributed to the request.
+    elapsed_seconds : float
+        Total time spent handling the request.
+
+    Returns
+    -------
+    str
+        Comma-separated metrics with durations in milliseconds.
+    """
+    db_ms = stats.db_seconds * 1000
+    pool_ms = stats.pool_wait_seconds * 1000
+    app_ms = max(0.0, elapsed_seconds * 1000 - db_ms - pool_ms)
+    return (
+        f'db;dur={db_ms:.1f};desc="{stats.statements} queries, {stats.rows} rows", '
+        f"pool;dur={pool_ms:.1f}, "
+        f"app;dur={app_ms:.1f}"
+    )
+
+
+class QueryInstrumentationMiddleware(BaseHTTPMiddleware):
+    """Attribute SQL work to requests and expose it via ``Server-Timing``.
+
+    Examples
+    --------
+    >>> from fastapi import FastAPI
+    >>> from chronovista.api.middleware import QueryInstrumentationMiddleware
+    >>> app = FastAPI()
+    >>> app.add_middleware(QueryInstrumentationMiddleware)
+    """
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        """Collect query stats around the request.
+
+        Parameters
+        ----------
+        request : Request
+            The incoming HTTP request.
+        call_next : RequestResponseEndpoint
+            The next middleware or route handler.
+
+        Returns
+        -------
+        Response
+            The response with a ``Server-Timing`` header.
+        """
+        stats = RequestQueryStats(request_id=get_request_id())
+        token = current_request_stats.set(stats)
+        started = time.perf_counter()
+        try:
+            response = await call_next(request)
+        finally:
+            current_request_stats.reset(token)
+
+        elapsed = time.perf_counter() - started
+        stats.route = route_template(request)
+        repeated = query_metrics.record_request(
+            stats, elapsed, settings.api_n_plus_one_threshold
+        )
+        for statement, count in repeated.items():
+            logger.warning(
+                "Possible N+1: statement ran %dx in %s [%s]: %s",
+                count,
+                stats.route,
+                stats.request_id,
+                statement[:200],
+            )
+
+        response.headers[SERVER_TIMING_HEADER] = format_server_timing(stats, elapsed)
+        return response
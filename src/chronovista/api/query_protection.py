@@ -24,18 +24,31 @@ the same end; either is sufficient, and neither is needed twice.
 Applying that rule today: ``/entities/check-duplicate`` fires on every keystroke
 with no debounce, so it is limited. ``/entities/search`` is debounced 300 ms in
 its hook, so it is not. That asymmetry is deliberate, not an oversight.
+
+**A timeout must stop the query, not just the wait.** Cancelling the Python
+coroutine leaves the SQL running in Postgres until the engine-wide
+``statement_timeout`` (60 s), and a user retrying a slow filter piles runaway
+backends onto a small pool. So when :func:`run_with_timeout` is given the
+session, the statement budget is lowered to the API ceiling for that
+transaction (``SET LOCAL statement_timeout``), and when the ceiling fires the
+backend is cancelled explicitly with ``pg_cancel_backend``. Outcomes are
+counted per operation label in :data:`heavy_query_metrics`.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 import time
+from collections import defaultdict
 from collections.abc import Coroutine
-from typing import Any, TypeVar
+from typing import Any, Literal, TypeVar
 
 from fastapi import Request
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from chronovista.exceptions import QueryTimeoutError
 
@@ -63,6 +76,53 @@ disable it entirely for the browser.
 
 If the client timeout changes, this must move with it."""
 
+CANCEL_TIMEOUT_SECONDS = 2
+"""How long to wait for a connection to send ``pg_cancel_backend``.
+
+The cancel needs a second pooled connection. When the pool is exhausted —
+exactly the situation runaway queries create — waiting for one would stack a
+second hang on the first, so the attempt is abandoned and the per-transaction
+``statement_timeout`` is left to stop the query instead."""
+
+_QUERY_CANCELED_SQLSTATE = "57014"
+"""Postgres ``query_canceled``: raised by ``statement_timeout`` and cancels."""
+
+QueryOutcome = Literal["completed", "cancelled"]
+
+
+class HeavyQueryMetrics:
+    """Per-operation counts of bounded queries that completed or were cancelled.
+
+    In-process and reset on restart, like the rate limiter's buckets. A query
+    counts as cancelled whether the API ceiling fired first or Postgres's own
+    ``statement_timeout`` did.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: dict[str, dict[str, int]] = defaultdict(
+            lambda: {"completed": 0, "cancelled": 0}
+        )
+
+    def record(self, operation: str, outcome: QueryOutcome) -> None:
+        """Count one *outcome* for *operation*."""
+        with self._lock:
+            self._counts[operation][outcome] += 1
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        """Copy of the counters, keyed by operation label."""
+        with self._lock:
+            return {op: dict(counts) for op, counts in self._counts.items()}
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self._counts.clear()
+
+
+heavy_query_metrics = HeavyQueryMetrics()
+"""Process-wide outcome counters for :func:`run_with_timeout`."""
+
 
 def get_client_id(request: Request) -> str:
     """Identify the caller for rate-limiting purposes.
@@ -130,6 +190,76 @@ def check_rate_limit(
     return True, 0
 
 
+def _is_postgres(session: AsyncSession) -> bool:
+    """Whether *session* talks to Postgres (budgets are Postgres-only)."""
+    try:
+        return bool(session.get_bind().dialect.name == "postgresql")
+    except Exception:  # unbound session: nothing to budget
+        return False
+
+
+def _is_query_canceled(exc: DBAPIError) -> bool:
+    """Whether a driver error is Postgres cancelling the statement."""
+    orig = exc.orig
+    code = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    return code == _QUERY_CANCELED_SQLSTATE
+
+
+async def _apply_statement_budget(
+    session: AsyncSession, timeout_seconds: float
+) -> int | None:
+    """Cap statements in this transaction at the API ceiling.
+
+    ``set_config(..., true)`` is ``SET LOCAL``: it lasts until the request's
+    transaction ends, so pooled connections return with the engine default.
+    The backend PID comes back in the same round trip so a timeout can cancel
+    exactly this query.
+
+    Returns
+    -------
+    int | None
+        The backend PID, or ``None`` for non-Postgres sessions.
+    """
+    if not _is_postgres(session):
+        return None
+    budget_ms = max(1, int(timeout_seconds * 1000))
+    result = await session.execute(
+        text("SELECT set_config('statement_timeout', :budget, true), pg_backend_pid()"),
+        {"budget": f"{budget_ms}ms"},
+    )
+    _, backend_pid = result.one()
+    return int(backend_pid)
+
+
+async def _cancel_backend(session: AsyncSession, backend_pid: int) -> bool:
+    """Ask Postgres to cancel whatever *backend_pid* is running.
+
+    Sent on a separate connection, since the session's own connection is busy
+    with the query being cancelled.
+
+    Returns
+    -------
+    bool
+        Whether the cancel signal was delivered.
+    """
+    engine = session.bind
+    if not isinstance(engine, AsyncEngine):
+        return False
+    try:
+        async with asyncio.timeout(CANCEL_TIMEOUT_SECONDS), engine.connect() as conn:
+            result = await conn.execute(
+                text("SELECT pg_cancel_backend(:pid)"), {"pid": backend_pid}
+            )
+            return bool(result.scalar())
+    except Exception:
+        logger.warning(
+            "Could not cancel backend %d; statement_timeout will stop it",
+            backend_pid,
+            exc_info=True,
+        )
+        return False
+
+
 async def run_with_timeout(
     work: Coroutine[Any, Any, T],
     *,
@@ -149,16 +279,18 @@ async def run_with_timeout(
     work : Coroutine
         The query to bound. Cancelled if the ceiling is reached.
     operation : str
-        Human-readable label naming the query, used in the log line and the
-        error detail so a timeout report identifies which query hung.
+        Human-readable label naming the query, used in the log line, the
+        error detail and :data:`heavy_query_metrics`, so a timeout report
+        identifies which query hung.
     session : AsyncSession, optional
-        The session the query runs on. Rolled back when the ceiling fires.
-        Cancelling a query mid-flight leaves the transaction in a failed state,
-        and the next statement on that session raises ``PendingRollbackError``
-        rather than the timeout the caller is expecting. Callers that touch the
-        session again after a timeout — or that sit inside a broader
-        transaction — should pass it. Verified: the pooled connection itself
-        recovers cleanly, so this guards the session, not the pool.
+        The session the query runs on. On Postgres its transaction gets a
+        ``statement_timeout`` equal to the ceiling, and when the ceiling fires
+        the backend is cancelled with ``pg_cancel_backend`` and the session is
+        rolled back. Cancelling a query mid-flight leaves the transaction in a
+        failed state, and the next statement on that session raises
+        ``PendingRollbackError`` rather than the timeout the caller is
+        expecting. Callers should pass it whenever *work* runs on it; without
+        it the query keeps running server-side after the 504.
     timeout_seconds : int, optional
         Ceiling in seconds (default :data:`QUERY_TIMEOUT_SECONDS`).
 
@@ -170,20 +302,46 @@ async def run_with_timeout(
     Raises
     ------
     QueryTimeoutError
-        The ceiling elapsed first.
+        The ceiling elapsed first, or Postgres cancelled the statement at the
+        same budget.
     """
+    backend_pid: int | None = None
     try:
-        return await asyncio.wait_for(work, timeout=timeout_seconds)
+        if session is not None:
+            backend_pid = await _apply_statement_budget(session, timeout_seconds)
+        result = await asyncio.wait_for(work, timeout=timeout_seconds)
     except TimeoutError as exc:
         logger.error(
             "Query timeout exceeded (%ds) for operation %s", timeout_seconds, operation
         )
-        if session is not None:
-            await session.rollback()
-        raise QueryTimeoutError(
-            message=(
-                f"Query timeout exceeded. Maximum query time is "
-                f"{timeout_seconds} seconds."
-            ),
-            details={"timeout_seconds": timeout_seconds, "operation": operation},
-        ) from exc
+        cause: BaseException = exc
+    except DBAPIError as exc:
+        if not _is_query_canceled(exc):
+            raise
+        logger.error(
+            "Statement timeout (%ds) cancelled operation %s in Postgres",
+            timeout_seconds,
+            operation,
+        )
+        backend_pid = None  # Postgres already stopped it
+        cause = exc
+    else:
+        heavy_query_metrics.record(operation, "completed")
+        return result
+    finally:
+        # ``work`` is never awaited if the budget query fails; close it so
+        # Python does not warn about an un-awaited coroutine.
+        work.close()
+
+    heavy_query_metrics.record(operation, "cancelled")
+    if session is not None:
+        if backend_pid is not None:
+            await _cancel_backend(session, backend_pid)
+        await session.rollback()
+    raise QueryTimeoutError(
+        message=(
+            f"Query timeout exceeded. Maximum query time is "
+            f"{timeout_seconds} seconds."
+        ),
+        details={"timeout_seconds": timeout_seconds, "operation": operation},
+    ) from cause
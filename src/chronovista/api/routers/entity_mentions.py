@@ -21,6 +21,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from chronovista.api.deps import get_db, require_auth
+from chronovista.api.fast_json import FastJSONResponse, fast_page
 from chronovista.api.query_protection import (
     check_rate_limit,
     get_client_id,
@@ -65,6 +66,7 @@ from chronovista.api.schemas.entity_mentions import (
 )
 from chronovista.api.schemas.responses import ApiResponse, PaginationMeta
 from chronovista.config.database import db_manager
+from chronovista.config.settings import settings
 from chronovista.db.models import CanonicalTag as CanonicalTagDB
 from chronovista.db.models import EntityAlias as EntityAliasDB
 from chronovista.db.models import NamedEntity as NamedEntityDB
@@ -808,9 +810,10 @@ async def get_cooccurring_entities(
     if not entity_exists.scalar_one_or_none():
         raise NotFoundError(resource_type="Entity", identifier=entity_id)
 
-    # MAX_COOCCURRING_LIMIT bounds the result SIZE, not the query cost: the
-    # scan is over the entity's whole co-occurrence set before the limit
-    # applies. Measured at 923 ms on the most connected entity.
+    # Partners are read from the stored co-occurrence counts in panel order,
+    # so the cost is the first ``limit`` entries of an index range (it was a
+    # self-join over the entity's whole co-occurrence set: 923 ms on the most
+    # connected entity).
     partners = await run_with_timeout(
         _mention_repo.get_cooccurring_entities(
             session,
@@ -909,7 +912,7 @@ async def get_entity_videos(
     limit: int = Query(default=20, ge=1, le=100, description="Items per page"),
     offset: int = Query(default=0, ge=0, description="Pagination offset"),
     session: AsyncSession = Depends(get_db),
-) -> EntityVideoResponse:
+) -> EntityVideoResponse | Response:
     """Get a paginated list of videos where a named entity is mentioned.
 
     Each video result includes the mention count and up to 5 mention
@@ -934,8 +937,9 @@ async def get_entity_videos(
 
     Returns
     -------
-    EntityVideoResponse
-        Paginated list of video results with mention previews.
+    EntityVideoResponse | Response
+        Paginated list of video results with mention previews; a pre-encoded
+        response when ``API_FAST_JSON`` is enabled.
 
     Raises
     ------
@@ -975,6 +979,35 @@ async def get_entity_videos(
         session=session,
     )
 
+    if settings.api_fast_json:
+        # The repository already returns plain dicts; pick the schema's
+        # fields in order and serialize them without per-row models.
+        rows = [
+            {
+                "video_id": r["video_id"],
+                "video_title": r["video_title"],
+                "channel_name": r["channel_name"],
+                "mention_count": r["mention_count"],
+                "mentions": [
+                    {
+                        "segment_id": m["segment_id"],
+                        "start_time": m["start_time"],
+                        "mention_text": m["mention_text"],
+                    }
+                    for m in r["mentions"]
+                ],
+                "sources": r["sources"],
+                "has_manual": r["has_manual"],
+                "first_mention_time": r["first_mention_time"],
+                "upload_date": r["upload_date"],
+                "description_context": r.get("description_context"),
+            }
+            for r in results
+        ]
+        return FastJSONResponse(
+            fast_page(rows, total=total, limit=limit, offset=offset)
+        )
+
     # Map dicts to response models
     data = [
         EntityVideoResult(
@@ -2076,8 +2109,9 @@ def _get_scan_service() -> EntityMentionScanService:
     """
     global _scan_service
     if _scan_service is None:
+        # Scans run as background tasks; keep them off the API's pool.
         _scan_service = EntityMentionScanService(
-            session_factory=db_manager.get_session_factory(),
+            session_factory=db_manager.get_batch_session_factory(),
         )
     return _scan_service
 
@@ -0,0 +1,52 @@
+"""Process metrics endpoint.
+
+Exposes what the opt-in query instrumentation (``API_INSTRUMENTATION``) has
+collected since startup, alongside the heavy-query timeout counters and the
+occupancy of the interactive and batch connection pools (always reported, so
+pool sizes can be tuned without enabling instrumentation).
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query
+
+from chronovista.api.deps import require_auth
+from chronovista.api.query_protection import heavy_query_metrics
+from chronovista.api.routers.responses import STANDARD_ERRORS
+from chronovista.api.schemas.metrics import ApiMetrics, ApiMetricsResponse
+from chronovista.config.database import db_manager
+from chronovista.config.settings import settings
+from chronovista.db.instrumentation import query_metrics
+
+router = APIRouter(dependencies=[Depends(require_auth)])
+
+
+@router.get("/metrics", response_model=ApiMetricsResponse, responses=STANDARD_ERRORS)
+async def get_metrics(
+    top_statements: int = Query(
+        50, ge=1, le=500, description="Number of slowest statements to include"
+    ),
+) -> ApiMetricsResponse:
+    """
+    Get query instrumentation metrics for this API process.
+
+    Parameters
+    ----------
+    top_statements : int
+        Number of statements to return, ordered by total time descending.
+
+    Returns
+    -------
+    ApiMetricsResponse
+        Route latency histograms, statement totals, N+1 flags, pool checkout
+        waits, heavy-query outcome counters and current pool occupancy.
+    """
+    return ApiMetricsResponse(
+        data=ApiMetrics(
+            instrumentation_enabled=settings.api_instrumentation,
+            n_plus_one_threshold=settings.api_n_plus_one_threshold,
+            queries=query_metrics.snapshot(top_statements=top_statements),
+            heavy_queries=heavy_query_metrics.snapshot(),
+            pools=db_manager.pool_stats(),
+        )
+    )
@@ -42,7 +42,8 @@ def _get_onboarding_service() -> OnboardingService:
     if _onboarding_service is None:
         _onboarding_service = OnboardingService(
             task_manager=_task_manager,
-            session_factory=db_manager.get_session_factory(),
+            # Pipeline steps run for minutes; keep them off the API's pool.
+            session_factory=db_manager.get_batch_session_factory(),
         )
     return _onboarding_service
 
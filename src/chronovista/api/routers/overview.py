@@ -1,18 +1,25 @@
 """Overview dashboard endpoint (Feature 061).
 
 A single read-only aggregation serving every figure the dashboard displays
-(FR-026), so the cards are computed together and cannot disagree.
+(FR-026), so the cards are computed together and cannot disagree. Served from
+the aggregate cache with ``ETag`` revalidation; it is recomputed only after a
+write to one of its source tables.
 """
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from typing import Any
+
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from chronovista.api.conditional import cached_json_response
 from chronovista.api.deps import get_db, require_auth
 from chronovista.api.routers.responses import LIST_ERRORS
 from chronovista.api.schemas.overview import OverviewResponse
 from chronovista.api.schemas.responses import ApiResponse
+from chronovista.config.database import db_manager
+from chronovista.db.aggregate_cache import aggregate_cache
 from chronovista.repositories.playlist_repository import get_library_overview
 
 router = APIRouter(dependencies=[Depends(require_auth)])
@@ -25,8 +32,9 @@ router = APIRouter(dependencies=[Depends(require_auth)])
     summary="Library overview aggregates",
 )
 async def get_overview(
+    request: Request,
     session: AsyncSession = Depends(get_db),
-) -> ApiResponse[OverviewResponse]:
+) -> Response:
     """Return the library overview figures.
 
     Read-only. Takes no parameters and returns aggregates rather than rows, so
@@ -34,14 +42,27 @@ async def get_overview(
 
     Parameters
     ----------
+    request : Request
+        The incoming request (for ``If-None-Match``).
     session : AsyncSession
         Database session injected via FastAPI dependency.
 
     Returns
     -------
-    ApiResponse[OverviewResponse]
-        Saved & Forgotten headline, Watch Later depth (null when no such
-        playlist exists), the playlist inventory, and library rollups.
+    Response
+        ``ApiResponse[OverviewResponse]`` JSON — Saved & Forgotten headline,
+        Watch Later depth (null when no such playlist exists), the playlist
+        inventory, and library rollups — or ``304`` when the client's copy is
+        current.
     """
+    entry = await aggregate_cache.get_or_compute(
+        "overview", _compute_overview, session, refresh_session=db_manager.session
+    )
+    return cached_json_response(request, entry)
+
+
+async def _compute_overview(session: AsyncSession) -> dict[str, Any]:
+    """Compute the overview payload in its JSON wire form."""
     data = await get_library_overview(session)
-    return ApiResponse[OverviewResponse](data=OverviewResponse.model_validate(data))
+    response = ApiResponse[OverviewResponse](data=OverviewResponse.model_validate(data))
+    return response.model_dump(mode="json")
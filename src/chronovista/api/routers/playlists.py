@@ -23,11 +23,16 @@ from chronovista.api.schemas.playlists import (
     PlaylistDetailResponse,
     PlaylistListItem,
     PlaylistListResponse,
+    PlaylistOverlapPair,
+    PlaylistOverlapResponse,
     PlaylistRestoreRequest,
     PlaylistRestoreResponse,
     PlaylistVideoListItem,
     PlaylistVideoListResponse,
     PlaylistWatchStats,
+    SimilarPlaylistItem,
+    SimilarPlaylistRef,
+    SimilarPlaylistsResponse,
 )
 from chronovista.api.schemas.responses import PaginationMeta
 from chronovista.api.schemas.sorting import SortOrder
@@ -44,6 +49,10 @@ from chronovista.exceptions import BadRequestError, NotFoundError
 from chronovista.models.enums import AvailabilityStatus, PlaylistType, WatchedStatus
 from chronovista.repositories.playlist_repository import PlaylistRepository
 from chronovista.repositories.user_video_repository import watched_video_ids
+from chronovista.services.playlist_overlap import (
+    SimilarityMethod,
+    playlist_similarity_service,
+)
 
 router = APIRouter(dependencies=[Depends(require_auth)])
 
@@ -320,6 +329,85 @@ async def restore_playlists(
     return PlaylistRestoreResponse(restored=restored, skipped=skipped)
 
 
+async def _playlist_titles(
+    session: AsyncSession, playlist_ids: set[str]
+) -> dict[str, str]:
+    """Map playlist IDs to titles in one query."""
+    if not playlist_ids:
+        return {}
+    result = await session.execute(
+        select(PlaylistDB.playlist_id, PlaylistDB.title).where(
+            PlaylistDB.playlist_id.in_(playlist_ids)
+        )
+    )
+    return {row[0]: row[1] for row in result.all()}
+
+
+@router.get(
+    "/playlists/overlap",
+    response_model=PlaylistOverlapResponse,
+    responses=LIST_ERRORS,
+)
+async def get_playlist_overlap(
+    limit: int = Query(20, ge=1, le=500, description="Maximum pairs to return"),
+    method: SimilarityMethod = Query(
+        SimilarityMethod.EXACT,
+        description=(
+            "exact: every pair sharing a video, from the video -> playlists "
+            "index; minhash: LSH candidate pairs ranked by estimated Jaccard"
+        ),
+    ),
+    min_shared: int = Query(
+        1, ge=1, description="Ignore pairs sharing fewer videos than this"
+    ),
+    session: AsyncSession = Depends(get_db),
+) -> PlaylistOverlapResponse:
+    """List the most similar playlist pairs across the library.
+
+    Declared before ``/playlists/{playlist_id}`` for the same reason as
+    ``/playlists/hidden``. Hidden playlists are excluded.
+
+    Parameters
+    ----------
+    limit : int
+        Maximum number of pairs (1-500, default 20).
+    method : SimilarityMethod
+        Exact inverted-index counting or approximate MinHash/LSH.
+    min_shared : int
+        Minimum number of shared videos for a pair to be listed.
+    session : AsyncSession
+        Database session from dependency.
+
+    Returns
+    -------
+    PlaylistOverlapResponse
+        Pairs ordered by Jaccard similarity, then shared videos.
+    """
+    pairs = await playlist_similarity_service.top_pairs(
+        session, limit=limit, method=method, min_shared=min_shared
+    )
+    titles = await _playlist_titles(
+        session,
+        {p.playlist_a for p in pairs} | {p.playlist_b for p in pairs},
+    )
+    return PlaylistOverlapResponse(
+        data=[
+            PlaylistOverlapPair(
+                playlist_a=SimilarPlaylistRef(
+                    playlist_id=p.playlist_a, title=titles.get(p.playlist_a, "")
+                ),
+                playlist_b=SimilarPlaylistRef(
+                    playlist_id=p.playlist_b, title=titles.get(p.playlist_b, "")
+                ),
+                shared_videos=p.shared_videos,
+                jaccard=p.jaccard,
+            )
+            for p in pairs
+        ],
+        method=method.value,
+    )
+
+
 @router.get(
     "/playlists/{playlist_id}",
     response_model=PlaylistDetailResponse,
@@ -692,3 +780,78 @@ async def get_playlist_videos(
     )
 
     return PlaylistVideoListResponse(data=items, pagination=pagination, stats=stats)
+
+
+@router.get(
+    "/playlists/{playlist_id}/similar",
+    response_model=SimilarPlaylistsResponse,
+    responses=GET_ITEM_ERRORS,
+)
+async def get_similar_playlists(
+    playlist_id: str = Path(
+        ...,
+        min_length=2,
+        max_length=50,
+        description="Playlist ID (YouTube or internal)",
+    ),
+    limit: int = Query(10, ge=1, le=100, description="Maximum playlists to return"),
+    method: SimilarityMethod = Query(
+        SimilarityMethod.EXACT,
+        description=(
+            "exact: every playlist sharing a video; minhash: LSH candidates "
+            "ranked by estimated Jaccard"
+        ),
+    ),
+    session: AsyncSession = Depends(get_db),
+) -> SimilarPlaylistsResponse:
+    """Get the playlists whose videos overlap most with a playlist.
+
+    Parameters
+    ----------
+    playlist_id : str
+        Playlist ID (YouTube or internal).
+    limit : int
+        Maximum number of playlists (1-100, default 10).
+    method : SimilarityMethod
+        Exact inverted-index counting or approximate MinHash/LSH.
+    session : AsyncSession
+        Database session from dependency.
+
+    Returns
+    -------
+    SimilarPlaylistsResponse
+        Playlists ordered by Jaccard similarity, then shared videos.
+
+    Raises
+    ------
+    NotFoundError
+        If the playlist does not exist or is hidden.
+    """
+    exists = await session.execute(
+        select(PlaylistDB.playlist_id)
+        .where(PlaylistDB.playlist_id == playlist_id)
+        .where(PlaylistDB.deleted_flag.is_(False))
+    )
+    if exists.scalar_one_or_none() is None:
+        raise NotFoundError(
+            resource_type="Playlist",
+            identifier=playlist_id,
+            hint="Verify the playlist ID or run a sync.",
+        )
+
+    results = await playlist_similarity_service.similar_playlists(
+        session, playlist_id, limit=limit, method=method
+    )
+    titles = await _playlist_titles(session, {r.playlist for r in results})
+    return SimilarPlaylistsResponse(
+        data=[
+            SimilarPlaylistItem(
+                playlist_id=r.playlist,
+                title=titles.get(r.playlist, ""),
+                shared_videos=r.shared_videos,
+                jaccard=r.jaccard,
+            )
+            for r in results
+        ],
+        method=method.value,
+    )
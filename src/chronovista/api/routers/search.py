@@ -27,6 +27,7 @@ from chronovista.db.models import Video as VideoDB
 from chronovista.db.models import VideoTranscript as TranscriptDB
 from chronovista.exceptions import BadRequestError
 from chronovista.models.enums import AvailabilityStatus
+from chronovista.models.transcript_source import canonical_language_code
 from chronovista.repositories.transcript_segment_repository import _escape_like_pattern
 
 router = APIRouter(dependencies=[Depends(require_auth)])
@@ -194,9 +195,12 @@ async def search_segments(
 
     # Apply language filter AFTER computing available_languages
     if language:
-        # Case-insensitive comparison to handle BCP-47 casing variations
-        # (e.g., "en-US" vs "en-us" vs "EN-US")
-        query = query.where(func.lower(SegmentDB.language_code) == func.lower(language))
+        # Stored codes are canonical, so BCP-47 casing variations ("en-us",
+        # "EN-US") are folded on the parameter side and the column is compared
+        # directly -- wrapping it in lower() would defeat the segment indexes.
+        query = query.where(
+            SegmentDB.language_code == canonical_language_code(language)
+        )
 
     # Get total count from filtered result set
     count_query = select(func.count()).select_from(query.subquery())
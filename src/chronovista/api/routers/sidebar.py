@@ -1,18 +1,25 @@
 """Sidebar navigation endpoints.
 
 This module provides API endpoints for sidebar navigation elements
-such as category navigation with video counts.
+such as category navigation with video counts. The counts are served from the
+aggregate cache with ``ETag`` revalidation, since they only change after a
+seed, sync or enrichment run.
 """
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Query
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from chronovista.api.conditional import cached_json_response
 from chronovista.api.deps import get_db, require_auth
 from chronovista.api.routers.responses import LIST_ERRORS
 from chronovista.api.schemas.sidebar import SidebarCategory, SidebarCategoryResponse
+from chronovista.config.database import db_manager
+from chronovista.db.aggregate_cache import aggregate_cache
 from chronovista.db.models import Video, VideoCategory
 from chronovista.models.enums import AvailabilityStatus
 
@@ -25,12 +32,13 @@ router = APIRouter(dependencies=[Depends(require_auth)])
     responses=LIST_ERRORS,
 )
 async def get_sidebar_categories(
+    request: Request,
     session: AsyncSession = Depends(get_db),
     include_unavailable: bool = Query(
         False,
         description="Include unavailable records in results",
     ),
-) -> SidebarCategoryResponse:
+) -> Response:
     """
     Get categories for sidebar navigation.
 
@@ -41,14 +49,37 @@ async def get_sidebar_categories(
 
     Parameters
     ----------
+    request : Request
+        The incoming request (for ``If-None-Match``).
     session : AsyncSession
         Database session from dependency.
+    include_unavailable : bool
+        Count unavailable videos too.
 
     Returns
     -------
-    SidebarCategoryResponse
-        Categories ordered by video_count descending.
+    Response
+        ``SidebarCategoryResponse`` JSON ordered by video_count descending,
+        or ``304`` when the client's copy is current.
     """
+
+    async def compute(session: AsyncSession) -> dict[str, Any]:
+        response = await _load_sidebar_categories(session, include_unavailable)
+        return response.model_dump(mode="json")
+
+    entry = await aggregate_cache.get_or_compute(
+        f"sidebar-categories-{'all' if include_unavailable else 'available'}",
+        compute,
+        session,
+        refresh_session=db_manager.session,
+    )
+    return cached_json_response(request, entry)
+
+
+async def _load_sidebar_categories(
+    session: AsyncSession, include_unavailable: bool
+) -> SidebarCategoryResponse:
+    """Query categories with their video counts, most videos first."""
     # Subquery for video count per category
     video_count_conditions = [Video.category_id == VideoCategory.category_id]
     # Apply availability filter unless include_unavailable is True
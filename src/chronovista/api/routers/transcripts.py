@@ -2,13 +2,14 @@
 
 import logging
 import re
-from datetime import datetime
 
-from fastapi import APIRouter, Depends, Path, Query
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, Path, Query, Request, Response
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from chronovista.api.conditional import not_modified, weak_etag
 from chronovista.api.deps import get_db, require_auth, require_local_identity
+from chronovista.api.fast_json import FastJSONResponse, fast_page
 from chronovista.api.routers.responses import (
     CONFLICT_RESPONSE,
     GET_ITEM_ERRORS,
@@ -31,8 +32,7 @@ from chronovista.api.schemas.transcripts import (
     TranscriptResponse,
     TranscriptSegment,
 )
-from chronovista.db.models import TranscriptCorrection as TranscriptCorrectionDB
-from chronovista.db.models import TranscriptSegment as SegmentDB
+from chronovista.config.settings import settings
 from chronovista.db.models import Video as VideoDB
 from chronovista.db.models import VideoTranscript as TranscriptDB
 from chronovista.exceptions import (
@@ -42,6 +42,7 @@ from chronovista.exceptions import (
     RateLimitError,
 )
 from chronovista.models.enums import AvailabilityStatus
+from chronovista.models.transcript_source import canonical_language_code
 from chronovista.models.user_language_preference import (
     UserLanguagePreference as UserLanguagePreferenceDomain,
 )
@@ -55,6 +56,7 @@ from chronovista.repositories.video_transcript_repository import (
 from chronovista.services.preference_aware_transcript_filter import (
     PreferenceAwareTranscriptFilter,
 )
+from chronovista.services.segment_timeline_cache import segment_timeline_cache
 from chronovista.services.transcript_service import (
     TranscriptNotFoundError,
     TranscriptService,
@@ -201,17 +203,27 @@ async def get_transcript_languages(
     responses=GET_ITEM_ERRORS,
 )
 async def get_transcript(
+    request: Request,
+    response: Response,
     video_id: str = Path(..., min_length=11, max_length=11),
     language: str | None = Query(
         None, description="Language code (default: first available)"
     ),
     session: AsyncSession = Depends(get_db),
-) -> TranscriptResponse:
+) -> TranscriptResponse | Response:
     """
     Get full transcript for a video.
 
+    Carries a weak ``ETag`` derived from the transcript's download and
+    correction markers; a matching ``If-None-Match`` gets ``304`` before the
+    text is assembled.
+
     Parameters
     ----------
+    request : Request
+        The incoming request (for ``If-None-Match``).
+    response : Response
+        Receives the validator headers.
     video_id : str
         YouTube video ID (11 characters).
     language : Optional[str]
@@ -221,8 +233,8 @@ async def get_transcript(
 
     Returns
     -------
-    TranscriptResponse
-        Full transcript content with metadata.
+    TranscriptResponse | Response
+        Full transcript content with metadata, or ``304 Not Modified``.
 
     Raises
     ------
@@ -233,8 +245,11 @@ async def get_transcript(
     query = select(TranscriptDB).where(TranscriptDB.video_id == video_id)
 
     if language:
-        # Case-insensitive match for BCP-47 language codes (RFC 5646)
-        query = query.where(func.lower(TranscriptDB.language_code) == language.lower())
+        # Language codes are stored canonicalized (RFC 5646 casing), so compare
+        # the column directly and keep the primary-key index usable.
+        query = query.where(
+            TranscriptDB.language_code == canonical_language_code(language)
+        )
     else:
         # Default selection: prefer manual/CC, then by download date
         query = query.order_by(
@@ -257,12 +272,24 @@ async def get_transcript(
             hint=f"Run: chronovista sync transcripts --video-id {video_id}",
         )
 
+    etag = weak_etag(
+        "transcript",
+        transcript.video_id,
+        transcript.language_code,
+        transcript.downloaded_at,
+        transcript.last_corrected_at,
+        transcript.correction_count,
+        transcript.segment_count,
+    )
+    if (unchanged := not_modified(request, response, etag)) is not None:
+        return unchanged
+
     return TranscriptResponse(
         data=TranscriptFull(
             video_id=transcript.video_id,
             language_code=transcript.language_code,
             transcript_type="manual" if transcript.is_cc else "auto_generated",
-            full_text=transcript.transcript_text,
+            full_text=await _transcript_repo.get_transcript_text(session, transcript),
             segment_count=transcript.segment_count or 0,
             downloaded_at=transcript.downloaded_at,
         )
@@ -275,6 +302,8 @@ async def get_transcript(
     responses=LIST_ERRORS,
 )
 async def get_transcript_segments(
+    request: Request,
+    response: Response,
     video_id: str = Path(..., min_length=11, max_length=11),
     language: str | None = Query(
         None, description="Language code (default: first available)"
@@ -288,12 +317,20 @@ async def get_transcript_segments(
     limit: int = Query(50, ge=1, le=200, description="Items per page"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
     session: AsyncSession = Depends(get_db),
-) -> SegmentListResponse:
+) -> SegmentListResponse | Response:
     """
     Get paginated transcript segments for a video.
 
+    Carries a weak ``ETag`` derived from the content of the timeline the page
+    is cut from, so it is stable across workers and cache reloads and
+    revalidating an unchanged page skips serialization.
+
     Parameters
     ----------
+    request : Request
+        The incoming request (for ``If-None-Match``).
+    response : Response
+        Receives the validator headers.
     video_id : str
         YouTube video ID (11 characters).
     language : Optional[str]
@@ -311,8 +348,8 @@ async def get_transcript_segments(
 
     Returns
     -------
-    SegmentListResponse
-        Paginated list of transcript segments.
+    SegmentListResponse | Response
+        Paginated list of transcript segments, or ``304 Not Modified``.
     """
     # First, determine the language code to use
     if not language:
@@ -333,69 +370,68 @@ async def get_transcript_segments(
             )
         language = transcript.language_code
 
-    # Build segments query - case-insensitive language match (RFC 5646)
-    query = (
-        select(SegmentDB)
-        .where(SegmentDB.video_id == video_id)
-        .where(func.lower(SegmentDB.language_code) == language.lower())
+    # Segments are served from the in-process timeline cache: a transcript
+    # only changes on re-download or correction (both invalidate it), and the
+    # player issues many small overlapping range requests per video.
+    timeline = await segment_timeline_cache.get_timeline(session, video_id, language)
+    # ``version`` digests the stored segments and corrections, so it changes
+    # only with the data: not on a cache reload, and not between workers.
+    etag = weak_etag(
+        "segments",
+        video_id,
+        language,
+        timeline.version,
+        start_time,
+        end_time,
+        limit,
+        offset,
     )
-
-    # Apply time filters
-    if start_time is not None:
-        query = query.where(SegmentDB.start_time >= start_time)
-    if end_time is not None:
-        query = query.where(SegmentDB.end_time <= end_time)
-
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await session.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Apply pagination and ordering
-    query = query.order_by(SegmentDB.start_time.asc()).offset(offset).limit(limit)
-
-    segment_result = await session.execute(query)
-    segments: list[SegmentDB] = list(segment_result.scalars().all())
-
-    # Derive correction metadata for all segments in a single query
-    segment_ids = [seg.id for seg in segments]
-    correction_meta: dict[int, tuple[datetime | None, int]] = {}
-    if segment_ids:
-        meta_query = (
-            select(
-                TranscriptCorrectionDB.segment_id,
-                func.max(TranscriptCorrectionDB.corrected_at).label(
-                    "latest_corrected_at"
-                ),
-                func.count().label("correction_count"),
+    if (unchanged := not_modified(request, response, etag)) is not None:
+        return unchanged
+
+    matching = timeline.contained(start_time, end_time)
+    total = len(matching)
+
+    if settings.api_fast_json:
+        # Timeline segments already carry the schema's types, so the rows are
+        # shaped directly and serialized without per-row models.
+        rows = []
+        for index in matching[offset : offset + limit]:
+            seg = timeline.segment(index)
+            rows.append(
+                {
+                    "id": seg.id,
+                    "text": seg.text,
+                    "start_time": seg.start_time,
+                    "end_time": seg.end_time,
+                    "duration": seg.duration,
+                    "has_correction": seg.has_correction,
+                    "corrected_at": seg.corrected_at,
+                    "correction_count": seg.correction_count,
+                }
             )
-            .where(TranscriptCorrectionDB.segment_id.in_(segment_ids))
-            .group_by(TranscriptCorrectionDB.segment_id)
+        # A returned Response bypasses the injected one, so carry its
+        # validator headers over.
+        return FastJSONResponse(
+            fast_page(rows, total=total, limit=limit, offset=offset),
+            headers=dict(response.headers),
         )
-        meta_result = await session.execute(meta_query)
-        for row in meta_result.all():
-            correction_meta[row.segment_id] = (
-                row.latest_corrected_at,
-                row.correction_count,
-            )
 
-    items = [
-        TranscriptSegment(
-            id=seg.id,
-            text=(
-                seg.corrected_text
-                if seg.has_correction and seg.corrected_text
-                else seg.text
-            ),
-            start_time=seg.start_time,
-            end_time=seg.end_time,
-            duration=seg.duration,
-            has_correction=seg.has_correction,
-            corrected_at=correction_meta.get(seg.id, (None, 0))[0],
-            correction_count=correction_meta.get(seg.id, (None, 0))[1],
+    items = []
+    for index in matching[offset : offset + limit]:
+        seg = timeline.segment(index)
+        items.append(
+            TranscriptSegment(
+                id=seg.id,
+                text=seg.text,
+                start_time=seg.start_time,
+                end_time=seg.end_time,
+                duration=seg.duration,
+                has_correction=seg.has_correction,
+                corrected_at=seg.corrected_at,
+                correction_count=seg.correction_count,
+            )
         )
-        for seg in segments
-    ]
 
     pagination = PaginationMeta(
         total=total,
@@ -657,6 +693,10 @@ async def download_transcript(
                         if enhanced_transcript.raw_transcript_data
                         else None
                     ),
+                    compact=settings.transcript_compact_storage,
+                )
+                segment_timeline_cache.invalidate_on_commit(
+                    session, db_transcript.video_id, db_transcript.language_code
                 )
 
                 transcript_type_display = (
@@ -837,6 +877,10 @@ async def _download_single_language(
             if enhanced_transcript.raw_transcript_data
             else None
         ),
+        compact=settings.transcript_compact_storage,
+    )
+    segment_timeline_cache.invalidate_on_commit(
+        session, db_transcript.video_id, db_transcript.language_code
     )
     await session.commit()
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from collections import defaultdict
@@ -18,10 +17,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from chronovista.api.deps import get_db, get_recovery_deps, require_auth
+from chronovista.api.fast_json import FastJSONResponse, fast_page
 from chronovista.api.query_protection import (
     QUERY_TIMEOUT_SECONDS,
     check_rate_limit,
     get_client_id,
+    run_with_timeout,
 )
 from chronovista.api.routers.responses import (
     CONFLICT_RESPONSE,
@@ -39,7 +40,6 @@ from chronovista.api.schemas.videos import (
     TranscriptSummary,
     VideoDetail,
     VideoDetailResponse,
-    VideoEntityMatch,
     VideoListItem,
     VideoListResponse,
     VideoListResponseWithWarnings,
@@ -48,6 +48,7 @@ from chronovista.api.schemas.videos import (
     VideoRecoveryResponse,
     VideoRecoveryResultData,
 )
+from chronovista.config.settings import settings
 from chronovista.db.models import (
     NamedEntity as NamedEntityDB,
 )
@@ -66,6 +67,7 @@ from chronovista.exceptions import (
     CDXError,
     ConflictError,
     NotFoundError,
+    QueryTimeoutError,
 )
 from chronovista.models.enums import AvailabilityStatus, EvidenceScope
 from chronovista.repositories.canonical_tag_repository import (
@@ -126,6 +128,30 @@ RECOVERY_IDEMPOTENCY_MINUTES = 5
 router = APIRouter(dependencies=[Depends(require_auth)])
 
 
+def _transcript_summary_fields(
+    transcripts: list[VideoTranscript],
+    has_corrections: bool = False,
+) -> dict[str, Any]:
+    """Shape a transcript summary as a plain dict in ``TranscriptSummary`` order."""
+    if not transcripts:
+        return {
+            "count": 0,
+            "languages": [],
+            "has_manual": False,
+            "has_corrections": has_corrections,
+        }
+
+    languages = list({t.language_code for t in transcripts})
+    has_manual = any(t.is_cc or t.transcript_type == "MANUAL" for t in transcripts)
+
+    return {
+        "count": len(transcripts),
+        "languages": sorted(languages),
+        "has_manual": has_manual,
+        "has_corrections": has_corrections,
+    }
+
+
 def build_transcript_summary(
     transcripts: list[VideoTranscript],
     has_corrections: bool = False,
@@ -145,23 +171,7 @@ def build_transcript_summary(
     TranscriptSummary
         Summary containing count, languages, manual indicator, and corrections flag.
     """
-    if not transcripts:
-        return TranscriptSummary(
-            count=0,
-            languages=[],
-            has_manual=False,
-            has_corrections=has_corrections,
-        )
-
-    languages = list({t.language_code for t in transcripts})
-    has_manual = any(t.is_cc or t.transcript_type == "MANUAL" for t in transcripts)
-
-    return TranscriptSummary(
-        count=len(transcripts),
-        languages=sorted(languages),
-        has_manual=has_manual,
-        has_corrections=has_corrections,
-    )
+    return TranscriptSummary(**_transcript_summary_fields(transcripts, has_corrections))
 
 
 def _validate_filter_limits(
@@ -318,6 +328,102 @@ def _build_parent_path(
     return " > ".join(path_parts) if path_parts else None
 
 
+def _video_list_row(
+    video: VideoDB,
+    *,
+    has_corrections: bool,
+    topic_cache: dict[str, TopicCategory],
+    entity_filter_active: bool,
+    required_entity_ids: list[UUID],
+    raw_matches: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """
+    Shape one loaded video as a plain dict in ``VideoListItem`` field order.
+
+    The dict is what the fast JSON path serializes directly, and what the
+    default path validates into a ``VideoListItem``, so the two cannot drift.
+
+    Parameters
+    ----------
+    video : VideoDB
+        Video with transcripts, channel, tags, category and topics loaded.
+    has_corrections : bool
+        Whether any of the video's segments carries a user correction.
+    topic_cache : dict[str, TopicCategory]
+        Topics by ID, for building parent paths.
+    entity_filter_active : bool
+        Whether a required or excluded entity filter is active.
+    required_entity_ids : list[UUID]
+        The required entity set, in the caller's order.
+    raw_matches : list[dict[str, Any]]
+        This video's per-entity evidence from ``get_page_entity_matches``.
+
+    Returns
+    -------
+    dict[str, Any]
+        The list item's fields.
+    """
+    # Entity intersection fields (Feature 062). None when no entity filter
+    # of either kind is active, so existing callers see an unchanged shape;
+    # present-and-empty for an exclusion-only filter, which IS an active
+    # filter (FR-015a).
+    entity_matches: list[dict[str, Any]] | None = None
+    total_mentions: int | None = None
+    if entity_filter_active:
+        # Ordered by the caller's required-set sequence. Without this the
+        # order is whatever the GROUP BY returned, so per-entity badges on
+        # one video can reorder between requests and two pages of one
+        # result set can present the same entities differently. The
+        # co-occurrence query got a tiebreak for exactly this reason; this
+        # path needs the same determinism.
+        by_id = {m["entity_id"]: m for m in raw_matches}
+        entity_matches = [
+            {
+                "entity_id": by_id[eid]["entity_id"],
+                "entity_type": by_id[eid]["entity_type"],
+                "canonical_name": by_id[eid]["canonical_name"],
+                "mention_count": by_id[eid]["mention_count"],
+                "first_timestamp": by_id[eid]["first_timestamp"],
+            }
+            for eid in required_entity_ids
+            if eid in by_id
+        ]
+        total_mentions = sum(m["mention_count"] for m in entity_matches)
+
+    # Extract topics with parent paths
+    topics: list[dict[str, Any]] = []
+    for vt in video.video_topics or []:
+        tc = vt.topic_category
+        if tc:
+            topics.append(
+                {
+                    "topic_id": tc.topic_id,
+                    "name": tc.category_name,
+                    "parent_path": _build_parent_path(tc, topic_cache),
+                }
+            )
+
+    return {
+        "video_id": video.video_id,
+        "title": video.title,
+        "channel_id": video.channel_id,
+        "channel_title": video.channel.title if video.channel else None,
+        "upload_date": video.upload_date,
+        "duration": video.duration,
+        "view_count": video.view_count,
+        "transcript_summary": _transcript_summary_fields(
+            list(video.transcripts), has_corrections=has_corrections
+        ),
+        "tags": [t.tag for t in video.tags] if video.tags else [],
+        "category_id": video.category_id,
+        "category_name": video.category.name if video.category else None,
+        "topics": topics,
+        "availability_status": video.availability_status,
+        "entity_matches": entity_matches,
+        "total_mentions": total_mentions,
+    }
+
+
 async def _validate_tags(
     session: AsyncSession,
     tags: list[str],
@@ -953,11 +1059,12 @@ async def list_videos(
 
             return total, videos, topic_cache, videos_with_corrections
 
-        total, videos, topic_cache, videos_with_corrections = await asyncio.wait_for(
+        total, videos, topic_cache, videos_with_corrections = await run_with_timeout(
             execute_queries(),
-            timeout=QUERY_TIMEOUT_SECONDS,
+            operation="video list",
+            session=session,
         )
-    except TimeoutError:
+    except QueryTimeoutError:
         logger.error(
             "[videos] Query timeout exceeded (%ds) for client %s",
             QUERY_TIMEOUT_SECONDS,
@@ -986,91 +1093,17 @@ async def list_videos(
             evidence_scope=min_evidence,
         )
 
-    items: list[VideoListItem] = []
-    for video in videos:
-        transcript_summary = build_transcript_summary(
-            list(video.transcripts),
+    rows = [
+        _video_list_row(
+            video,
             has_corrections=video.video_id in videos_with_corrections,
+            topic_cache=topic_cache,
+            entity_filter_active=bool(required_entity_ids or excluded_entity_ids),
+            required_entity_ids=required_entity_ids,
+            raw_matches=page_entity_matches.get(video.video_id, []),
         )
-        channel_title = video.channel.title if video.channel else None
-
-        # Entity intersection fields (Feature 062). None when no entity filter
-        # of either kind is active, so existing callers see an unchanged shape;
-        # present-and-empty for an exclusion-only filter, which IS an active
-        # filter (FR-015a).
-        video_entity_matches: list[VideoEntityMatch] | None = None
-        video_total_mentions: int | None = None
-        if required_entity_ids or excluded_entity_ids:
-            raw_matches = page_entity_matches.get(video.video_id, [])
-            # Ordered by the caller's required-set sequence. Without this the
-            # order is whatever the GROUP BY returned, so per-entity badges on
-            # one video can reorder between requests and two pages of one
-            # result set can present the same entities differently. The
-            # co-occurrence query got a tiebreak for exactly this reason; this
-            # path needs the same determinism.
-            by_id = {m["entity_id"]: m for m in raw_matches}
-            raw_matches = [by_id[eid] for eid in required_entity_ids if eid in by_id]
-            video_entity_matches = [
-                VideoEntityMatch(
-                    entity_id=m["entity_id"],
-                    entity_type=m["entity_type"],
-                    canonical_name=m["canonical_name"],
-                    mention_count=m["mention_count"],
-                    first_timestamp=m["first_timestamp"],
-                )
-                for m in raw_matches
-            ]
-            video_total_mentions = sum(m.mention_count for m in video_entity_matches)
-
-        # Extract tags
-        video_tags = [t.tag for t in video.tags] if video.tags else []
-
-        # Extract category info
-        category_id_val = video.category_id
-        category_name = video.category.name if video.category else None
-
-        # Extract topics with parent paths
-        topics_list: list[TopicSummary] = []
-        if video.video_topics:
-            for vt in video.video_topics:
-                tc = vt.topic_category
-                if tc:
-                    parent_path = _build_parent_path(tc, topic_cache)
-                    topics_list.append(
-                        TopicSummary(
-                            topic_id=tc.topic_id,
-                            name=tc.category_name,
-                            parent_path=parent_path,
-                        )
-                    )
-
-        items.append(
-            VideoListItem(
-                video_id=video.video_id,
-                title=video.title,
-                channel_id=video.channel_id,
-                channel_title=channel_title,
-                upload_date=video.upload_date,
-                duration=video.duration,
-                view_count=video.view_count,
-                transcript_summary=transcript_summary,
-                tags=video_tags,
-                category_id=category_id_val,
-                category_name=category_name,
-                topics=topics_list,
-                availability_status=video.availability_status,
-                entity_matches=video_entity_matches,
-                total_mentions=video_total_mentions,
-            )
-        )
-
-    # Build pagination
-    pagination = PaginationMeta(
-        total=total,
-        limit=limit,
-        offset=offset,
-        has_more=(offset + limit) < total,
-    )
+        for video in videos
+    ]
 
     # T100: Performance logging for filter query timing
     query_elapsed_ms = (time.perf_counter() - query_start_time) * 1000
@@ -1083,6 +1116,24 @@ async def list_videos(
         len(valid_topics),
     )
 
+    if settings.api_fast_json:
+        # Fast path: the rows go out as is, with no per-row models and no
+        # response_model re-validation (see chronovista.api.fast_json).
+        payload = fast_page(rows, total=total, limit=limit, offset=offset)
+        if all_warnings:
+            payload["warnings"] = [w.model_dump(mode="json") for w in all_warnings]
+        return FastJSONResponse(payload)
+
+    items = [VideoListItem.model_validate(row) for row in rows]
+
+    # Build pagination
+    pagination = PaginationMeta(
+        total=total,
+        limit=limit,
+        offset=offset,
+        has_more=(offset + limit) < total,
+    )
+
     # Return response with warnings if any filter values were invalid (FR-049, FR-050)
     if all_warnings:
         return VideoListResponseWithWarnings(
@@ -0,0 +1,56 @@
+"""Metrics API schemas.
+
+This module defines the response model for ``GET /api/v1/metrics``. The
+per-route, per-statement and pool figures reuse the serializable snapshot
+models from :mod:`chronovista.db.instrumentation`.
+"""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+from chronovista.db.instrumentation import PoolStatus, QueryMetricsSnapshot
+
+
+class ApiMetrics(BaseModel):
+    """Query instrumentation and heavy-query counters for this process.
+
+    Attributes
+    ----------
+    instrumentation_enabled : bool
+        Whether ``API_INSTRUMENTATION`` is on; when off, ``queries`` stays
+        empty.
+    n_plus_one_threshold : int
+        Repeats per request above which a statement is flagged as N+1.
+    queries : QueryMetricsSnapshot
+        Route latency histograms, top statements, N+1 flags and pool
+        checkout waits.
+    heavy_queries : dict[str, dict[str, int]]
+        Completed/cancelled counts per guarded heavy-query operation.
+    pools : list[PoolStatus]
+        Current occupancy of the interactive and batch connection pools.
+    """
+
+    instrumentation_enabled: bool = Field(
+        ..., description="Whether API_INSTRUMENTATION is enabled"
+    )
+    n_plus_one_threshold: int = Field(
+        ..., description="Per-request repeats above which a statement is flagged"
+    )
+    queries: QueryMetricsSnapshot = Field(
+        ..., description="Per-route and per-statement query metrics"
+    )
+    heavy_queries: dict[str, dict[str, int]] = Field(
+        default_factory=dict,
+        description="Completed/cancelled counts per heavy-query operation",
+    )
+    pools: list[PoolStatus] = Field(
+        default_factory=list,
+        description="Occupancy of each connection pool created so far",
+    )
+
+
+class ApiMetricsResponse(BaseModel):
+    """Response wrapper for the metrics endpoint."""
+
+    data: ApiMetrics
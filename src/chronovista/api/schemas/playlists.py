@@ -306,3 +306,58 @@ class PlaylistVideoListResponse(BaseModel):
     data: list[PlaylistVideoListItem]
     pagination: PaginationMeta
     stats: PlaylistWatchStats
+
+
+class SimilarPlaylistItem(BaseModel):
+    """A playlist ranked by video overlap with a query playlist."""
+
+    model_config = ConfigDict(strict=True)
+
+    playlist_id: str = Field(..., description="Playlist ID")
+    title: str = Field(..., description="Playlist title")
+    shared_videos: int = Field(..., description="Videos in both playlists")
+    jaccard: float = Field(
+        ...,
+        description="Jaccard similarity of the video sets (estimated for minhash)",
+    )
+
+
+class SimilarPlaylistsResponse(BaseModel):
+    """Response wrapper for playlist similarity results."""
+
+    model_config = ConfigDict(strict=True)
+
+    data: list[SimilarPlaylistItem]
+    method: str = Field(..., description="Similarity method used: exact or minhash")
+
+
+class SimilarPlaylistRef(BaseModel):
+    """Minimal playlist reference used in overlap pairs."""
+
+    model_config = ConfigDict(strict=True)
+
+    playlist_id: str = Field(..., description="Playlist ID")
+    title: str = Field(..., description="Playlist title")
+
+
+class PlaylistOverlapPair(BaseModel):
+    """Two playlists and how much their videos overlap."""
+
+    model_config = ConfigDict(strict=True)
+
+    playlist_a: SimilarPlaylistRef
+    playlist_b: SimilarPlaylistRef
+    shared_videos: int = Field(..., description="Videos in both playlists")
+    jaccard: float = Field(
+        ...,
+        description="Jaccard similarity of the video sets (estimated for minhash)",
+    )
+
+
+class PlaylistOverlapResponse(BaseModel):
+    """Response wrapper for library-wide playlist overlap pairs."""
+
+    model_config = ConfigDict(strict=True)
+
+    data: list[PlaylistOverlapPair]
+    method: str = Field(..., description="Similarity method used: exact or minhash")
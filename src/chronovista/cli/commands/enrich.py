@@ -712,6 +712,13 @@ def enrich_videos(
                         summary_lines.append(
                             f"Channels Auto-Resolved: [green]{summary.channels_auto_resolved}[/green]"
                         )
+                    topic_cache = summary.topic_cache
+                    if topic_cache is not None and topic_cache.hit_rate is not None:
+                        summary_lines.append(
+                            f"Topic Cache Hit Rate: [cyan]{topic_cache.hit_rate:.1%}[/cyan] "
+                            f"({topic_cache.lookups} lookups, "
+                            f"{topic_cache.created} new topics)"
+                        )
 
                     # Add playlist stats if playlists were enriched
                     if include_playlists:
@@ -0,0 +1,62 @@
+"""
+CLI commands for watch-history analytics maintenance.
+
+``chronovista history rebuild-rollups`` — backfill or repair the daily and
+hourly watch rollups that statistics read instead of the raw history.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from chronovista.config.database import DatabaseManager
+from chronovista.repositories.user_video_repository import UserVideoRepository
+
+console = Console()
+
+history_app = typer.Typer(
+    name="history",
+    help="🕒 Watch-history analytics maintenance",
+    no_args_is_help=True,
+)
+
+
+@history_app.command("rebuild-rollups")
+def rebuild_rollups(
+    user_id: str | None = typer.Option(
+        None,
+        "--user-id",
+        help="Rebuild only this user's rollups (default: every user).",
+    ),
+) -> None:
+    """Recompute the daily and hourly watch rollups from user_videos.
+
+    Rollups are kept current on every write; run this after upgrading, after
+    restoring a backup, or when a video changed channel. Idempotent.
+    """
+
+    async def rebuild_async() -> dict[str, int]:
+        repo = UserVideoRepository()
+        db_manager = DatabaseManager()
+        written: dict[str, int] = {}
+        try:
+            async with db_manager.session(echo=False) as session:
+                written = await repo.rebuild_watch_rollups(session, user_id)
+        finally:
+            await db_manager.close()
+        return written
+
+    written = asyncio.run(rebuild_async())
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Rollup")
+    table.add_column("Rows", justify="right")
+    for name, rows in written.items():
+        table.add_row(name, f"{rows:,}")
+    scope = f"user [bold]{user_id}[/bold]" if user_id else "all users"
+    console.print(f"[green]✅ Rebuilt watch rollups for {scope}[/green]")
+    console.print(table)
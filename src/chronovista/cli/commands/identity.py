@@ -14,6 +14,7 @@ import sys
 import typer
 from rich.console import Console
 from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from chronovista.config.database import DatabaseManager
@@ -23,6 +24,18 @@ from chronovista.services.identity_service import IdentityError, IdentityService
 
 console = Console()
 
+
+def _merge_progress() -> Progress:
+    """A spinner counting the ``user_videos`` rows the merge has moved."""
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        TextColumn("{task.completed:,} rows"),
+        console=console,
+        transient=True,
+    )
+
+
 identity_app = typer.Typer(
     name="identity",
     help="🪪 Canonical local-user identity: status, repair (dedup), reset",
@@ -98,7 +111,13 @@ def repair(
         try:
             async for session in db_manager.get_session(echo=False):
                 try:
-                    report = await service.repair(session, dry_run=dry_run)
+                    with _merge_progress() as progress:
+                        task = progress.add_task("Merging identities...", total=None)
+                        report = await service.repair(
+                            session,
+                            dry_run=dry_run,
+                            progress_callback=lambda n: progress.advance(task, n),
+                        )
                 except IdentityError as exc:
                     failure = exc
                     continue
@@ -204,11 +223,14 @@ def reset(
 
         async for session in db_manager.get_session(echo=False):
             try:
-                report = await service.reset_identity(
-                    session,
-                    authenticated_channel_id=my_channel.id,
-                    dry_run=dry_run,
-                )
+                with _merge_progress() as progress:
+                    task = progress.add_task("Re-keying identity...", total=None)
+                    report = await service.reset_identity(
+                        session,
+                        authenticated_channel_id=my_channel.id,
+                        dry_run=dry_run,
+                        progress_callback=lambda n: progress.advance(task, n),
+                    )
             except IdentityError as exc:
                 failure = exc
                 continue
@@ -4,6 +4,8 @@ Playlist CLI commands for chronovista.
 This module provides commands for managing playlists:
 - `list`: Display playlists with link status
 - `show`: Show detailed playlist information
+- `similar`: Playlists sharing the most videos with a playlist
+- `overlap`: Most similar playlist pairs across the library
 
 Note: The `link`, `unlink`, and `resolve` commands have been removed.
 Playlists are now identified directly by their YouTube ID (PL prefix) or
@@ -25,6 +27,7 @@ import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from chronovista.cli.constants import (
@@ -38,6 +41,10 @@ from chronovista.config.database import DatabaseManager
 from chronovista.db.models import Playlist as PlaylistDB
 from chronovista.models.enums import PlaylistType, classify_playlist_type
 from chronovista.repositories.playlist_repository import PlaylistRepository
+from chronovista.services.playlist_overlap import (
+    PlaylistSimilarityService,
+    SimilarityMethod,
+)
 
 console = Console()
 
@@ -781,3 +788,159 @@ def reclassify(
             sys.exit(1)
 
     asyncio.run(reclassify_async())
+
+
+async def _playlist_titles(
+    session: AsyncSession, playlist_ids: builtins.list[str]
+) -> dict[str, str]:
+    """Map playlist IDs to titles for display."""
+    if not playlist_ids:
+        return {}
+    result = await session.execute(
+        select(PlaylistDB.playlist_id, PlaylistDB.title).where(
+            PlaylistDB.playlist_id.in_(playlist_ids)
+        )
+    )
+    return {row[0]: row[1] for row in result.all()}
+
+
+@playlist_app.command()
+def similar(
+    playlist_id: str = typer.Argument(
+        ...,
+        help="Internal or YouTube playlist ID",
+    ),
+    limit: int = typer.Option(
+        10, "--limit", "-n", min=1, max=100, help="Number of playlists to show"
+    ),
+    method: SimilarityMethod = typer.Option(
+        SimilarityMethod.EXACT,
+        "--method",
+        "-m",
+        case_sensitive=False,
+        help="exact (shared-video index) or minhash (approximate LSH)",
+    ),
+) -> None:
+    """
+    Show the playlists whose videos overlap most with a playlist.
+
+    Similarity is the Jaccard index of the two playlists' video sets. The
+    exact method scores every playlist sharing at least one video; minhash
+    scores only LSH candidates with an estimated Jaccard, which is faster on
+    very large libraries but may miss weakly similar playlists.
+
+    Examples:
+        chronovista playlist similar PLdU2XMVb99x...
+        chronovista playlist similar PLdU2XMVb99x... --method minhash -n 20
+    """
+
+    async def similar_async() -> None:
+        db_manager = DatabaseManager()
+
+        try:
+            async for session in db_manager.get_session(echo=False):
+                if not await PlaylistRepository().get_by_playlist_id(
+                    session, playlist_id
+                ):
+                    error_msg = format_not_found_error("Playlist", playlist_id)
+                    console.print(f"[red]{error_msg}[/red]")
+                    sys.exit(EXIT_USER_ERROR)
+
+                results = await PlaylistSimilarityService().similar_playlists(
+                    session, playlist_id, limit=limit, method=method
+                )
+                if not results:
+                    console.print(
+                        "[dim]No playlists share videos with this playlist.[/dim]"
+                    )
+                    return
+
+                titles = await _playlist_titles(session, [r.playlist for r in results])
+                table = Table(
+                    title=f"Playlists similar to {playlist_id} ({method.value})",
+                    show_header=True,
+                    header_style="bold",
+                )
+                table.add_column("Playlist ID", style="cyan")
+                table.add_column("Title")
+                table.add_column("Shared", justify="right")
+                table.add_column("Jaccard", justify="right")
+                for result in results:
+                    table.add_row(
+                        _truncate_id(result.playlist),
+                        titles.get(result.playlist, ""),
+                        str(result.shared_videos),
+                        f"{result.jaccard:.2f}",
+                    )
+                console.print(table)
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Operation cancelled by user[/yellow]")
+            sys.exit(EXIT_CANCELLED)
+
+    asyncio.run(similar_async())
+
+
+@playlist_app.command()
+def overlap(
+    limit: int = typer.Option(
+        20, "--limit", "-n", min=1, max=500, help="Number of pairs to show"
+    ),
+    method: SimilarityMethod = typer.Option(
+        SimilarityMethod.EXACT,
+        "--method",
+        "-m",
+        case_sensitive=False,
+        help="exact (shared-video index) or minhash (approximate LSH)",
+    ),
+    min_shared: int = typer.Option(
+        1, "--min-shared", min=1, help="Ignore pairs sharing fewer videos"
+    ),
+) -> None:
+    """
+    Show the most similar playlist pairs across the whole library.
+
+    Examples:
+        chronovista playlist overlap
+        chronovista playlist overlap --method minhash --min-shared 3
+    """
+
+    async def overlap_async() -> None:
+        db_manager = DatabaseManager()
+
+        try:
+            async for session in db_manager.get_session(echo=False):
+                pairs = await PlaylistSimilarityService().top_pairs(
+                    session, limit=limit, method=method, min_shared=min_shared
+                )
+                if not pairs:
+                    console.print("[dim]No overlapping playlists found.[/dim]")
+                    return
+
+                titles = await _playlist_titles(
+                    session,
+                    sorted(
+                        {p.playlist_a for p in pairs} | {p.playlist_b for p in pairs}
+                    ),
+                )
+                table = Table(
+                    title=f"Playlist overlap ({method.value})",
+                    show_header=True,
+                    header_style="bold",
+                )
+                table.add_column("Playlist A", style="cyan")
+                table.add_column("Playlist B", style="green")
+                table.add_column("Shared", justify="right")
+                table.add_column("Jaccard", justify="right")
+                for pair in pairs:
+                    table.add_row(
+                        titles.get(pair.playlist_a) or _truncate_id(pair.playlist_a),
+                        titles.get(pair.playlist_b) or _truncate_id(pair.playlist_b),
+                        str(pair.shared_videos),
+                        f"{pair.jaccard:.2f}",
+                    )
+                console.print(table)
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Operation cancelled by user[/yellow]")
+            sys.exit(EXIT_CANCELLED)
+
+    asyncio.run(overlap_async())
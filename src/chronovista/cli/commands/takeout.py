@@ -11,7 +11,8 @@ Commands:
 - sync: Sync selected data to database
 """
 
-from datetime import UTC
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -28,11 +29,26 @@ from rich.progress import (
 from rich.table import Table
 
 from ...config.database import db_manager
+from ...config.settings import settings
 from ...container import container
 from ...models.takeout.takeout_data import TakeoutData
+from ...parsers.takeout_message_parser import (
+    MessageDigest,
+    MessageFilter,
+    MessageKind,
+    SortOrder,
+    TakeoutMessage,
+    iter_takeout_messages,
+)
+from ...repositories.takeout_message_repository import TakeoutMessageRepository
 from ...services.seeding import ProgressCallback
 from ...services.takeout_seeding_service import TakeoutSeedingService
 from ...services.takeout_service import TakeoutParsingError, TakeoutService
+from ...services.takeout_snapshot import (
+    TakeoutSnapshotStats,
+    TakeoutSnapshotStore,
+    default_snapshot_dir,
+)
 
 # SeedingResult removed - using dict of SeedResult from modular system
 
@@ -45,6 +61,27 @@ takeout_app = typer.Typer(
 )
 
 
+def _snapshot_store() -> TakeoutSnapshotStore | None:
+    """Parsed-Takeout snapshot store, or None when disabled in settings."""
+    if not settings.takeout_snapshot_cache:
+        return None
+    return TakeoutSnapshotStore(default_snapshot_dir(settings.cache_dir))
+
+
+def _print_snapshot_savings(stats: TakeoutSnapshotStats) -> None:
+    """Report parse time saved (or a snapshot written) by the snapshot cache."""
+    if stats.hits:
+        console.print(
+            f"[dim]⚡ Loaded parsed Takeout snapshot in {stats.load_seconds:.2f}s "
+            f"(saved ~{stats.net_seconds_saved:.1f}s of parsing)[/dim]"
+        )
+    elif stats.rebuilt:
+        console.print(
+            "[dim]💾 Saved parsed Takeout snapshot; later runs skip parsing "
+            "until the export changes[/dim]"
+        )
+
+
 async def _build_video_title_lookup(takeout_service: TakeoutService) -> dict[str, str]:
     """
     Build a lookup dictionary of video ID -> video title from watch history.
@@ -95,6 +132,26 @@ def peek_data(
         "--topic",
         help="Filter content by topic ID (requires synced topic associations)",
     ),
+    since: str | None = typer.Option(
+        None,
+        "--since",
+        help="Comments/chats only: posted on or after this date (ISO 8601)",
+    ),
+    until: str | None = typer.Option(
+        None,
+        "--until",
+        help="Comments/chats only: posted on or before this date (ISO 8601)",
+    ),
+    store: bool = typer.Option(
+        False,
+        "--store",
+        help="Comments/chats only: also save every row read to the database",
+    ),
+    stored: bool = typer.Option(
+        False,
+        "--stored",
+        help="Comments/chats only: query rows saved by --store instead of the CSVs",
+    ),
 ) -> None:
     """
     👀 Peek at your Google Takeout data without API calls.
@@ -108,6 +165,8 @@ def peek_data(
         chronovista takeout peek history --recent --limit=10 --topic=25
         chronovista takeout peek channels "Example Channel"
         chronovista takeout peek comments --recent --limit=15
+        chronovista takeout peek comments "python" --since=2023-01-01 --store
+        chronovista takeout peek chats --stored --until=2024-06-30
     """
     import asyncio
 
@@ -123,7 +182,9 @@ def peek_data(
                 )
 
                 # Initialize TakeoutService
-                takeout_service = TakeoutService(takeout_path)
+                takeout_service = TakeoutService(
+                    takeout_path, snapshot_store=_snapshot_store()
+                )
 
                 # Validate topic filter if provided
                 if topic_filter:
@@ -174,6 +235,12 @@ def peek_data(
                     raise typer.Exit(1)
                 sort_order = "recent" if recent else ("oldest" if oldest else "default")
 
+                since_dt = _parse_peek_date(since, "--since")
+                until_dt = _parse_peek_date(until, "--until", end_of_day=True)
+                if store and stored:
+                    console.print("❌ Cannot use both --store and --stored flags")
+                    raise typer.Exit(1)
+
                 if data_type.lower() == "playlists":
                     await _peek_playlists(
                         takeout_service,
@@ -204,6 +271,10 @@ def peek_data(
                         progress,
                         task,
                         filter_name,
+                        since=since_dt,
+                        until=until_dt,
+                        store=store,
+                        stored=stored,
                     )
                 elif data_type.lower() in ["chats", "livechats", "live-chats"]:
                     await _peek_live_chats(
@@ -213,6 +284,10 @@ def peek_data(
                         progress,
                         task,
                         filter_name,
+                        since=since_dt,
+                        until=until_dt,
+                        store=store,
+                        stored=stored,
                     )
                 else:
                     console.print(f"❌ Unknown data type: {data_type}")
@@ -221,6 +296,8 @@ def peek_data(
                     )
                     raise typer.Exit(1)
 
+                _print_snapshot_savings(takeout_service.snapshot_stats)
+
         except TakeoutParsingError as e:
             console.print(f"❌ Error parsing Takeout data: {e}")
             console.print("\n💡 Make sure:")
@@ -776,7 +853,9 @@ def analyze_comprehensive(
                 )
 
                 # Initialize and analyze
-                takeout_service = TakeoutService(takeout_path)
+                takeout_service = TakeoutService(
+                    takeout_path, snapshot_store=_snapshot_store()
+                )
                 analysis = await takeout_service.generate_comprehensive_analysis()
 
                 # Handle topic filtering and grouping
@@ -788,6 +867,7 @@ def analyze_comprehensive(
 
                 # Display summary
                 _display_analysis_summary(analysis)
+                _print_snapshot_savings(takeout_service.snapshot_stats)
 
                 if save_report:
                     # Save detailed report
@@ -958,7 +1038,9 @@ def analyze_relationships(
                 )
 
                 # Initialize TakeoutService
-                takeout_service = TakeoutService(takeout_path)
+                takeout_service = TakeoutService(
+                    takeout_path, snapshot_store=_snapshot_store()
+                )
 
                 if relationship_type == "playlist-overlap":
                     await _analyze_playlist_overlap(takeout_service, progress, task)
@@ -973,6 +1055,8 @@ def analyze_relationships(
                     )
                     raise typer.Exit(1)
 
+                _print_snapshot_savings(takeout_service.snapshot_stats)
+
         except TakeoutParsingError as e:
             console.print(f"❌ Error parsing Takeout data: {e}")
             raise typer.Exit(1) from e
@@ -1322,10 +1406,6 @@ async def _display_generic_json(data: Any, limit: int) -> None:
         console.print(f"📄 JSON Value: {str(data)[:200]}")
 
 
-# Import required for datetime operations
-from datetime import datetime
-
-
 async def _analyze_playlist_overlap(
     takeout_service: TakeoutService, progress: Progress, task_id: Any
 ) -> None:
@@ -1589,483 +1669,199 @@ async def _analyze_temporal_patterns(
     )
 
 
-async def _peek_comments(
+# Per-kind folder and wording for the comments and live-chats peeks.
+_MESSAGE_PEEKS: dict[MessageKind, dict[str, str]] = {
+    "comment": {
+        "folder": "comments",
+        "noun": "comments",
+        "short": "comments",
+        "title": "💬 Your Comments",
+        "column": "Comment",
+        "unavailable": "[Comment text unavailable]",
+        "insights": "💡 Comments Insights:",
+        "per_day": "Average comments per day",
+        "videos": "Videos commented on",
+        "top_video": "Most commented video",
+        "top_unit": "comments",
+    },
+    "live_chat": {
+        "folder": "live chats",
+        "noun": "live chats",
+        "short": "chats",
+        "title": "💬 Your Live Chats",
+        "column": "Chat Message",
+        "unavailable": "[Chat text unavailable]",
+        "insights": "💡 Live Chats Insights:",
+        "per_day": "Average chats per day",
+        "videos": "Videos with live chats",
+        "top_video": "Most active chat video",
+        "top_unit": "messages",
+    },
+}
+
+
+def _parse_peek_date(
+    value: str | None, option: str, *, end_of_day: bool = False
+) -> datetime | None:
+    """Parse a ``--since``/``--until`` value as an aware datetime.
+
+    Naive values are taken as UTC. A bare date given to ``--until`` means the
+    end of that day, so the bound stays inclusive of the day named.
+    """
+    if value is None:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError as err:
+        console.print(f"❌ Invalid {option} date: '{value}'. Use ISO 8601 format.")
+        raise typer.Exit(1) from err
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    if end_of_day and len(value) == 10:
+        parsed += timedelta(days=1, microseconds=-1)
+    return parsed
+
+
+async def _peek_messages(
     takeout_service: TakeoutService,
+    kind: MessageKind,
     limit: int | None,
     sort_order: str,
     progress: Progress,
     task_id: Any,
     filter_name: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    store: bool = False,
+    stored: bool = False,
 ) -> None:
-    """Display comments information."""
-    import csv
-    import json
-    from datetime import datetime
-
-    try:
-        progress.update(task_id, description="📊 Loading comments data...")
-
-        # Find comments files
-        comments_dir = takeout_service.youtube_path / "comments"
-        if not comments_dir.exists():
-            console.print("📭 No comments found in Takeout data")
-            return
-
-        # Parse all comment CSV files
-        comments = []
-        comment_files = list(comments_dir.glob("*.csv"))
-
-        for comment_file in comment_files:
-            with open(comment_file, encoding="utf-8") as f:
-                # Try different CSV parsing approaches
-                f.read()
-                f.seek(0)
-                reader = csv.DictReader(f, quoting=csv.QUOTE_ALL)
-                for row in reader:
-                    # Parse comment data
-                    raw_comment_text = row.get("Comment Text", "")
-
-                    comment_data = {
-                        "comment_id": row.get("Comment ID", ""),
-                        "video_id": row.get("Video ID", ""),
-                        "channel_id": row.get("Channel ID", ""),
-                        "timestamp_str": row.get("Comment Create Timestamp", ""),
-                        "comment_text": raw_comment_text,
-                        "timestamp": None,
-                    }
-
-                    # Parse timestamp
-                    if comment_data["timestamp_str"]:
-                        try:
-                            comment_data["timestamp"] = datetime.fromisoformat(
-                                comment_data["timestamp_str"].replace("Z", "+00:00")
-                            )
-                        except Exception:
-                            pass
-
-                    # Parse comment text (it's in JSON format)
-                    if comment_data["comment_text"]:
-                        clean_text = comment_data["comment_text"]
-
-                        # Try to parse JSON - handle array format like [{"text":"..."},{"text":"..."}]
-                        if clean_text.startswith("[") or clean_text.startswith("{"):
-                            try:
-                                # If it looks like comma-separated JSON objects without brackets, wrap it
-                                if (
-                                    clean_text.startswith('{"text":')
-                                    and '},{"text":' in clean_text
-                                ):
-                                    clean_text = f"[{clean_text}]"
-
-                                # Parse as JSON array or object
-                                text_json = json.loads(clean_text)
-
-                                if isinstance(text_json, list):
-                                    # Array of text objects - concatenate all text fields
-                                    text_parts = []
-                                    for item in text_json:
-                                        if isinstance(item, dict) and "text" in item:
-                                            text_content = item["text"]
-                                            # Don't strip here - preserve spacing and structure
-                                            # Skip only completely empty strings
-                                            if text_content is not None:
-                                                text_parts.append(text_content)
-
-                                    if text_parts:
-                                        # Join directly to preserve YouTube time references like @9:20
-                                        clean_text = "".join(text_parts)
-                                        # Clean up only excessive whitespace, but preserve intentional spacing
-                                        clean_text = " ".join(clean_text.split())
-                                    else:
-                                        # If no text parts, use first available text
-                                        for item in text_json:
-                                            if (
-                                                isinstance(item, dict)
-                                                and "text" in item
-                                            ):
-                                                clean_text = item["text"]
-                                                break
-
-                                elif (
-                                    isinstance(text_json, dict) and "text" in text_json
-                                ):
-                                    # Single text object
-                                    clean_text = text_json["text"]
-
-                            except json.JSONDecodeError:
-                                # JSON parsing failed, keep original
-                                pass
-                            except Exception:
-                                # Any other parsing errors, keep original
-                                pass
-
-                        comment_data["clean_text"] = clean_text.strip()
-                    else:
-                        comment_data["clean_text"] = ""
+    """Display comments or live chats, streamed from the CSVs or the database.
 
-                    comments.append(comment_data)
+    The CSVs are read one row at a time and folded into a bounded
+    :class:`MessageDigest`, so memory follows ``limit`` rather than the size of
+    the export. ``store`` upserts every row read (filtered or not) into
+    ``takeout_messages``; ``stored`` answers from that table instead of the
+    CSVs.
+    """
+    labels = _MESSAGE_PEEKS[kind]
+    noun = labels["noun"]
+    order: SortOrder = (
+        "recent"
+        if sort_order == "recent"
+        else ("oldest" if sort_order == "oldest" else "default")
+    )
+    message_filter = MessageFilter(text=filter_name, since=since, until=until)
+    repository = TakeoutMessageRepository()
 
-        if not comments:
-            console.print("📭 No comments found in CSV files")
-            return
+    try:
+        scanned = 0
 
-        progress.update(task_id, description="📊 Analyzing comments...")
+        def _count_rows(rows: int) -> None:
+            nonlocal scanned
+            scanned += rows
 
-        # Filter by video ID or text content if specified
-        if filter_name:
-            original_count = len(comments)
-            comments = [
-                c
-                for c in comments
-                if (filter_name.lower() in (c["clean_text"] or "").lower())
-                or (c["video_id"] and filter_name.lower() in c["video_id"].lower())
-            ]
-            if not comments:
-                console.print(f"📭 No comments found matching '{filter_name}'")
+        if stored:
+            progress.update(task_id, description=f"🗄️ Querying stored {noun}...")
+            async with db_manager.session() as session:
+                digest = await repository.summarise(
+                    session, kind, message_filter, limit=limit, sort_order=order
+                )
+                if digest.total == 0:
+                    scanned = await repository.count(session, kind)
+            if digest.total == 0 and scanned == 0:
+                console.print(f"📭 No stored {noun} found")
                 console.print(
-                    f"💡 Found {original_count} total comments. Try a different search term."
+                    f"💡 Run 'chronovista takeout peek {labels['short']} --store' first."
                 )
                 return
+        else:
+            directory = takeout_service.youtube_path / labels["folder"]
+            if not directory.exists():
+                console.print(f"📭 No {noun} found in Takeout data")
+                return
 
-        # Sort comments based on sort_order
-        if sort_order == "recent":
-            comments.sort(key=lambda x: x["timestamp"] or datetime.min, reverse=True)
-        elif sort_order == "oldest":
-            comments.sort(key=lambda x: x["timestamp"] or datetime.max, reverse=False)
-
-        # Get video titles from watch history for lookup
-        progress.update(task_id, description="🔍 Loading video titles...")
-        video_titles = await _build_video_title_lookup(takeout_service)
-
-        # Create rich table
-        table = Table(
-            title=f"💬 Your Comments ({len(comments)} total)",
-            show_header=True,
-            header_style="bold blue",
-        )
-        table.add_column("Comment", style="cyan", width=50)
-        table.add_column("Video ID", style="blue", width=15)
-        table.add_column("Video Title", style="green", width=40)
-        table.add_column("Posted", style="yellow", width=15)
-
-        # Apply limit for display
-        display_comments = comments if limit is None else comments[:limit]
-
-        for comment in display_comments:
-            # Clean up comment text for display
-            comment_text = comment["clean_text"]
-
-            # Filter out problematic comments that are just symbols or very short
-            if (
-                not comment_text
-                or comment_text.strip() in ["\\", "@", "", "\n", '""']
-                or len(comment_text.strip()) <= 2
-                and comment_text.strip()
-                in [
-                    "@",
-                    "\\",
-                    "&",
-                    "#",
-                ]
-            ):
-                comment_text = "[Comment text unavailable]"
-
-            # Truncate comment text for display
-            if len(comment_text) > 27:
-                comment_text = comment_text[:27] + "..."
-
-            # Get video ID and title
-            video_id_display = (
-                comment["video_id"][:11] + "..."
-                if comment["video_id"] and len(comment["video_id"]) > 11
-                else (comment["video_id"] or "N/A")
-            )
-
-            video_title_display = "Title not found"
-            if comment["video_id"]:
-                video_title = video_titles.get(comment["video_id"])
-                if video_title:
-                    video_title_display = (
-                        video_title[:22] + "..."
-                        if len(video_title) > 22
-                        else video_title
+            progress.update(task_id, description=f"📊 Loading {noun} data...")
+            digest = MessageDigest(limit=limit, sort_order=order)
+            if store:
+
+                def _fold(
+                    messages: Iterable[TakeoutMessage],
+                ) -> Iterator[TakeoutMessage]:
+                    # Every row is stored; only the matches reach the digest.
+                    for message in messages:
+                        if message_filter.matches(message):
+                            digest.add(message)
+                        yield message
+
+                async with db_manager.session() as session:
+                    written = await repository.store_all(
+                        session,
+                        _fold(
+                            iter_takeout_messages(
+                                directory, kind, progress_callback=_count_rows
+                            )
+                        ),
                     )
-
-            # Format timestamp
-            if comment["timestamp"] and hasattr(comment["timestamp"], "strftime"):
-                posted_time = comment["timestamp"].strftime("%Y-%m-%d %H:%M")
-            else:
-                posted_time = "Unknown"
-
-            table.add_row(
-                comment_text, video_id_display, video_title_display, posted_time
-            )
-
-        console.print(table)
-
-        # Show insights
-        if comments:
-            # Date range
-            dates = [
-                c["timestamp"]
-                for c in comments
-                if c["timestamp"] and hasattr(c["timestamp"], "strftime")
-            ]
-            if dates:
-                date_range = f"{min(dates).strftime('%Y-%m-%d')} to {max(dates).strftime('%Y-%m-%d')}"
-                max_date = max(dates)
-                min_date = min(dates)
-                if isinstance(max_date, datetime) and isinstance(min_date, datetime):
-                    total_days = (max_date - min_date).days or 1
-                else:
-                    total_days = 1
-                avg_per_day = len(comments) / total_days
+                console.print(f"🗄️ Stored {written:,} {noun} in the database")
             else:
-                date_range = "Unknown"
-                avg_per_day = 0
-
-            # Video distribution
-            video_counts: dict[str, int] = {}
-            for comment in comments:
-                if comment["video_id"]:
-                    video_counts[comment["video_id"]] = (
-                        video_counts.get(comment["video_id"], 0) + 1
+                digest.extend(
+                    iter_takeout_messages(
+                        directory,
+                        kind,
+                        message_filter,
+                        progress_callback=_count_rows,
                     )
-
-            most_commented_video = (
-                max(video_counts.items(), key=lambda x: x[1]) if video_counts else None
-            )
-
-            console.print("\n💡 Comments Insights:")
-            console.print(f"   • Date range: {date_range}")
-            console.print(f"   • Average comments per day: {avg_per_day:.1f}")
-            console.print(f"   • Videos commented on: {len(video_counts)}")
-            if most_commented_video:
-                console.print(
-                    f"   • Most commented video: {most_commented_video[0]} ({most_commented_video[1]} comments)"
                 )
 
-            # Show title lookup stats
-            if video_titles:
-                comment_video_ids = {c["video_id"] for c in comments if c["video_id"]}
-                titles_found = len(
-                    comment_video_ids.intersection(set(video_titles.keys()))
-                )
-                if comment_video_ids:
-                    console.print(
-                        f"   • Video titles found: {titles_found}/{len(comment_video_ids)} ({titles_found/len(comment_video_ids)*100:.1f}%)"
-                    )
-
-            if limit is not None and len(comments) > limit:
-                console.print(
-                    f"   • Showing {limit} of {len(comments)} comments (use --all to see all, or --limit N for more)"
-                )
-            elif limit is None:
-                console.print(f"   • Showing all {len(comments)} comments")
+            if scanned == 0:
+                console.print(f"📭 No {noun} found in CSV files")
+                return
 
+        if digest.total == 0:
             if filter_name:
-                console.print("\n🔍 Filter Results:")
-                console.print(
-                    f"   • Found {len(comments)} comments matching '{filter_name}'"
-                )
-
-    except Exception as e:
-        console.print(f"❌ Error analyzing comments: {e}")
-        raise typer.Exit(1) from e
-
-
-async def _peek_live_chats(
-    takeout_service: TakeoutService,
-    limit: int | None,
-    sort_order: str,
-    progress: Progress,
-    task_id: Any,
-    filter_name: str | None = None,
-) -> None:
-    """Display live chats information."""
-    import csv
-    import json
-    from datetime import datetime
-
-    try:
-        progress.update(task_id, description="📊 Loading live chats data...")
-
-        # Find live chats files
-        chats_dir = takeout_service.youtube_path / "live chats"
-        if not chats_dir.exists():
-            console.print("📭 No live chats found in Takeout data")
-            return
-
-        # Parse all live chat CSV files
-        chats = []
-        chat_files = list(chats_dir.glob("*.csv"))
-
-        for chat_file in chat_files:
-            with open(chat_file, encoding="utf-8") as f:
-                reader = csv.DictReader(f, quoting=csv.QUOTE_ALL)
-                for row in reader:
-                    # Parse live chat data
-                    raw_chat_text = row.get("Live Chat Text", "")
-
-                    chat_data = {
-                        "chat_id": row.get("Live Chat ID", ""),
-                        "video_id": row.get("Video ID", ""),
-                        "channel_id": row.get("Channel ID", ""),
-                        "timestamp_str": row.get("Live Chat Create Timestamp", ""),
-                        "chat_text": raw_chat_text,
-                        "timestamp": None,
-                    }
-
-                    # Parse timestamp
-                    if chat_data["timestamp_str"]:
-                        try:
-                            chat_data["timestamp"] = datetime.fromisoformat(
-                                chat_data["timestamp_str"].replace("Z", "+00:00")
-                            )
-                        except Exception:
-                            pass
-
-                    # Parse chat text (it's in JSON format like comments)
-                    if chat_data["chat_text"]:
-                        clean_text = chat_data["chat_text"]
-
-                        # Try to parse JSON - handle array format like [{"text":"..."},{"text":"..."}]
-                        if clean_text.startswith("[") or clean_text.startswith("{"):
-                            try:
-                                # If it looks like comma-separated JSON objects without brackets, wrap it
-                                if (
-                                    clean_text.startswith('{"text":')
-                                    and '},{"text":' in clean_text
-                                ):
-                                    clean_text = f"[{clean_text}]"
-
-                                # Parse as JSON array or object
-                                text_json = json.loads(clean_text)
-
-                                if isinstance(text_json, list):
-                                    # Array of text objects - concatenate all text fields
-                                    text_parts = []
-                                    for item in text_json:
-                                        if isinstance(item, dict) and "text" in item:
-                                            text_content = item["text"]
-                                            # Don't strip here - preserve spacing and structure
-                                            # Skip only completely empty strings
-                                            if text_content is not None:
-                                                text_parts.append(text_content)
-
-                                    if text_parts:
-                                        # Join directly to preserve structure
-                                        clean_text = "".join(text_parts)
-                                        # Clean up only excessive whitespace, but preserve intentional spacing
-                                        clean_text = " ".join(clean_text.split())
-                                    else:
-                                        # If no text parts, use first available text
-                                        for item in text_json:
-                                            if (
-                                                isinstance(item, dict)
-                                                and "text" in item
-                                            ):
-                                                clean_text = item["text"]
-                                                break
-
-                                elif (
-                                    isinstance(text_json, dict) and "text" in text_json
-                                ):
-                                    # Single text object
-                                    clean_text = text_json["text"]
-
-                            except json.JSONDecodeError:
-                                # JSON parsing failed, keep original
-                                pass
-                            except Exception:
-                                # Any other parsing errors, keep original
-                                pass
-
-                        chat_data["clean_text"] = clean_text.strip()
-                    else:
-                        chat_data["clean_text"] = ""
-
-                    chats.append(chat_data)
-
-        if not chats:
-            console.print("📭 No live chats found in CSV files")
+                console.print(f"📭 No {noun} found matching '{filter_name}'")
+                hint = "Try a different search term."
+            else:
+                console.print(f"📭 No {noun} found in that date range")
+                hint = "Try a wider --since/--until range."
+            console.print(f"💡 Found {scanned} total {labels['short']}. {hint}")
             return
 
-        progress.update(task_id, description="📊 Analyzing live chats...")
-
-        # Filter by video ID or text content if specified
-        if filter_name:
-            original_count = len(chats)
-            chats = [
-                c
-                for c in chats
-                if (filter_name.lower() in (c["clean_text"] or "").lower())
-                or (c["video_id"] and filter_name.lower() in c["video_id"].lower())
-            ]
-            if not chats:
-                console.print(f"📭 No live chats found matching '{filter_name}'")
-                console.print(
-                    f"💡 Found {original_count} total chats. Try a different search term."
-                )
-                return
-
-        # Sort chats based on sort_order
-        if sort_order == "recent":
-            chats.sort(key=lambda x: x["timestamp"] or datetime.min, reverse=True)
-        elif sort_order == "oldest":
-            chats.sort(key=lambda x: x["timestamp"] or datetime.max, reverse=False)
-
         # Get video titles from watch history for lookup
         progress.update(task_id, description="🔍 Loading video titles...")
         video_titles = await _build_video_title_lookup(takeout_service)
 
         # Create rich table
         table = Table(
-            title=f"💬 Your Live Chats ({len(chats)} total)",
+            title=f"{labels['title']} ({digest.total} total)",
             show_header=True,
             header_style="bold blue",
         )
-        table.add_column("Chat Message", style="cyan", width=50)
+        table.add_column(labels["column"], style="cyan", width=50)
         table.add_column("Video ID", style="blue", width=15)
         table.add_column("Video Title", style="green", width=40)
         table.add_column("Posted", style="yellow", width=15)
 
-        # Apply limit for display
-        display_chats = chats if limit is None else chats[:limit]
-
-        for chat in display_chats:
-            # Clean up chat text for display
-            chat_text = chat["clean_text"]
-
-            # Filter out problematic chats that are just symbols or very short
-            if (
-                not chat_text
-                or chat_text.strip() in ["\\", "@", "", "\n", '""']
-                or len(chat_text.strip()) <= 2
-                and chat_text.strip()
-                in [
-                    "@",
-                    "\\",
-                    "&",
-                    "#",
-                ]
-            ):
-                chat_text = "[Chat text unavailable]"
+        for message in digest.rows:
+            message_text = message.text
 
-            # Truncate chat text for display
-            if len(chat_text) > 27:
-                chat_text = chat_text[:27] + "..."
+            # Filter out problematic messages that are just symbols
+            if not message_text or message_text in ["\\", "@", '""', "&", "#"]:
+                message_text = labels["unavailable"]
+
+            # Truncate message text for display
+            if len(message_text) > 27:
+                message_text = message_text[:27] + "..."
 
-            # Get video ID and title
             video_id_display = (
-                chat["video_id"][:11] + "..."
-                if chat["video_id"] and len(chat["video_id"]) > 11
-                else (chat["video_id"] or "N/A")
+                message.video_id[:11] + "..."
+                if len(message.video_id) > 11
+                else (message.video_id or "N/A")
             )
 
             video_title_display = "Title not found"
-            if chat["video_id"]:
-                video_title = video_titles.get(chat["video_id"])
+            if message.video_id:
+                video_title = video_titles.get(message.video_id)
                 if video_title:
                     video_title_display = (
                         video_title[:22] + "..."
@@ -2073,85 +1869,126 @@ async def _peek_live_chats(
                         else video_title
                     )
 
-            # Format timestamp
-            if chat["timestamp"] and hasattr(chat["timestamp"], "strftime"):
-                posted_time = chat["timestamp"].strftime("%Y-%m-%d %H:%M")
-            else:
-                posted_time = "Unknown"
+            posted_time = (
+                message.posted_at.strftime("%Y-%m-%d %H:%M")
+                if message.posted_at
+                else "Unknown"
+            )
 
-            table.add_row(chat_text, video_id_display, video_title_display, posted_time)
+            table.add_row(
+                message_text, video_id_display, video_title_display, posted_time
+            )
 
         console.print(table)
 
-        # Show insights if we have timestamps
-        timestamps = [
-            chat["timestamp"]
-            for chat in chats
-            if chat["timestamp"] and hasattr(chat["timestamp"], "strftime")
-        ]
-        if timestamps:
-            first_date = min(timestamps).strftime("%Y-%m-%d")
-            last_date = max(timestamps).strftime("%Y-%m-%d")
-            date_range = f"{first_date} to {last_date}"
-            max_timestamp = max(timestamps)
-            min_timestamp = min(timestamps)
-            if isinstance(max_timestamp, datetime) and isinstance(
-                min_timestamp, datetime
-            ):
-                total_days = (max_timestamp - min_timestamp).days or 1
-            else:
-                total_days = 1
-            avg_per_day = len(chats) / total_days
+        # Show insights
+        if digest.first_posted and digest.last_posted:
+            date_range = (
+                f"{digest.first_posted.strftime('%Y-%m-%d')} to "
+                f"{digest.last_posted.strftime('%Y-%m-%d')}"
+            )
+            total_days = (digest.last_posted - digest.first_posted).days or 1
+            avg_per_day = digest.total / total_days
         else:
             date_range = "Unknown"
             avg_per_day = 0
 
-        # Count unique videos
-        video_counts: dict[str, int] = {}
-        for chat in chats:
-            if chat["video_id"]:
-                video_counts[chat["video_id"]] = (
-                    video_counts.get(chat["video_id"], 0) + 1
-                )
-
-        most_chatted_video = (
+        video_counts = digest.video_counts
+        most_active_video = (
             max(video_counts.items(), key=lambda x: x[1]) if video_counts else None
         )
 
-        console.print("\n💡 Live Chats Insights:")
+        console.print(f"\n{labels['insights']}")
         console.print(f"   • Date range: {date_range}")
-        console.print(f"   • Average chats per day: {avg_per_day:.1f}")
-        console.print(f"   • Videos with live chats: {len(video_counts)}")
-        if most_chatted_video:
+        console.print(f"   • {labels['per_day']}: {avg_per_day:.1f}")
+        console.print(f"   • {labels['videos']}: {len(video_counts)}")
+        if most_active_video:
             console.print(
-                f"   • Most active chat video: {most_chatted_video[0]} ({most_chatted_video[1]} messages)"
+                f"   • {labels['top_video']}: {most_active_video[0]} ({most_active_video[1]} {labels['top_unit']})"
             )
 
         # Show title lookup stats
-        if video_titles:
-            chat_video_ids = {c["video_id"] for c in chats if c["video_id"]}
-            titles_found = len(chat_video_ids.intersection(set(video_titles.keys())))
-            if chat_video_ids:
-                console.print(
-                    f"   • Video titles found: {titles_found}/{len(chat_video_ids)} ({titles_found/len(chat_video_ids)*100:.1f}%)"
-                )
+        if video_titles and video_counts:
+            titles_found = len(video_counts.keys() & video_titles.keys())
+            console.print(
+                f"   • Video titles found: {titles_found}/{len(video_counts)} ({titles_found/len(video_counts)*100:.1f}%)"
+            )
 
-        if limit is not None and len(chats) > limit:
+        if limit is not None and digest.total > limit:
             console.print(
-                f"   • Showing {limit} of {len(chats)} chats (use --all to see all, or --limit N for more)"
+                f"   • Showing {limit} of {digest.total} {labels['short']} (use --all to see all, or --limit N for more)"
             )
         elif limit is None:
-            console.print(f"   • Showing all {len(chats)} chats")
+            console.print(f"   • Showing all {digest.total} {labels['short']}")
 
-        if filter_name:
+        if not message_filter.is_empty:
             console.print("\n🔍 Filter Results:")
-            console.print(f"   • Found {len(chats)} chats matching '{filter_name}'")
+            matching = (
+                f"matching '{filter_name}'" if filter_name else "in the date range"
+            )
+            console.print(f"   • Found {digest.total} {labels['short']} {matching}")
 
     except Exception as e:
-        console.print(f"❌ Error analyzing live chats: {e}")
+        console.print(f"❌ Error analyzing {noun}: {e}")
         raise typer.Exit(1) from e
 
 
+async def _peek_comments(
+    takeout_service: TakeoutService,
+    limit: int | None,
+    sort_order: str,
+    progress: Progress,
+    task_id: Any,
+    filter_name: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    store: bool = False,
+    stored: bool = False,
+) -> None:
+    """Display comments information."""
+    await _peek_messages(
+        takeout_service,
+        "comment",
+        limit,
+        sort_order,
+        progress,
+        task_id,
+        filter_name,
+        since=since,
+        until=until,
+        store=store,
+        stored=stored,
+    )
+
+
+async def _peek_live_chats(
+    takeout_service: TakeoutService,
+    limit: int | None,
+    sort_order: str,
+    progress: Progress,
+    task_id: Any,
+    filter_name: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    store: bool = False,
+    stored: bool = False,
+) -> None:
+    """Display live chats information."""
+    await _peek_messages(
+        takeout_service,
+        "live_chat",
+        limit,
+        sort_order,
+        progress,
+        task_id,
+        filter_name,
+        since=since,
+        until=until,
+        store=store,
+        stored=stored,
+    )
+
+
 @takeout_app.command("seed")
 def seed_database(
     takeout_path: Path = typer.Argument(
@@ -2247,9 +2084,12 @@ def seed_database(
                     raise typer.Exit(1)
 
             # Initialize services first to get progress totals
-            takeout_service = TakeoutService(takeout_path)
+            takeout_service = TakeoutService(
+                takeout_path, snapshot_store=_snapshot_store()
+            )
             console.print("📊 Loading Takeout data...")
             takeout_data = await takeout_service.parse_all()
+            _print_snapshot_savings(takeout_service.snapshot_stats)
 
             if dry_run:
                 with Progress(
@@ -2743,7 +2583,9 @@ def recover_metadata(
                 # Run recovery
                 progress.update(task, description="Running recovery...")
 
-                recovery_service = TakeoutRecoveryService()
+                recovery_service = TakeoutRecoveryService(
+                    snapshot_store=_snapshot_store()
+                )
 
                 async for session in db_manager.get_session(echo=False):
                     result = await recovery_service.recover_from_historical_takeouts(
@@ -2752,6 +2594,7 @@ def recover_metadata(
 
                 # Display results
                 _display_recovery_results(result, verbose)
+                _print_snapshot_savings(recovery_service.snapshot_stats)
 
         except TakeoutParsingError as e:
             console.print(f"[red]Error parsing Takeout data: {e}[/red]")
@@ -54,6 +54,7 @@ from chronovista.services.entity_mention_scan_service import (
     ScanResult,
 )
 from chronovista.services.tag_normalization import TagNormalizationService
+from chronovista.services.wikidata_client import WikidataClient, WikidataUnavailable
 
 logger = logging.getLogger(__name__)
 
@@ -916,6 +917,342 @@ def recount(
     asyncio.run(_run())
 
 
+async def _verify_counters(
+    session: AsyncSession, *, fix: bool
+) -> tuple[list[tuple[uuid.UUID, int, int, int, int]], list[uuid.UUID]]:
+    """Find counter drift and, with ``fix``, recompute only the drifted entities.
+
+    Returns ``find_counter_drift``'s ``(entity_drift, alias_drift_entity_ids)``. Rolls back unless
+    ``fix`` (see ``_recount_counters``).
+    """
+    mention_repo = EntityMentionRepository()
+    entity_drift, alias_drift = await mention_repo.find_counter_drift(session)
+    if fix and (entity_drift or alias_drift):
+        await mention_repo.update_entity_counters(
+            session, [row[0] for row in entity_drift]
+        )
+        await mention_repo.update_alias_counters(
+            session, sorted({row[0] for row in entity_drift} | set(alias_drift))
+        )
+        await session.commit()
+    else:
+        await session.rollback()
+    return entity_drift, alias_drift
+
+
+@entity_app.command("verify-counters")
+def verify_counters(
+    fix: bool = typer.Option(
+        False,
+        "--fix",
+        help="Recompute the counters of drifted entities.",
+    ),
+    show: int = typer.Option(
+        20,
+        "--show",
+        min=0,
+        help="Drifted entities to list.",
+    ),
+) -> None:
+    """Check stored entity/alias counters against the mentions they summarize.
+
+    Scans, corrections and manual associations adjust ``mention_count`` / ``video_count`` /
+    ``occurrence_count`` by deltas as they write, so counters are never recomputed wholesale. This is
+    the periodic reconciliation: one read-only aggregate reports any drift, and ``--fix`` recomputes
+    just the drifted entities. Exits 1 when drift is found and not fixed, so it can run from cron.
+    """
+
+    async def _run() -> int:
+        async for session in db_manager.get_session(echo=False):
+            entity_drift, alias_drift = await _verify_counters(session, fix=fix)
+
+            if entity_drift and show:
+                name_rows = await session.execute(
+                    select(NamedEntityDB.id, NamedEntityDB.canonical_name).where(
+                        NamedEntityDB.id.in_([r[0] for r in entity_drift[:show]])
+                    )
+                )
+                names = {row.id: row.canonical_name for row in name_rows}
+                table = Table(title="Counter drift")
+                table.add_column("Entity")
+                table.add_column("Mentions (stored → actual)", justify="right")
+                table.add_column("Videos (stored → actual)", justify="right")
+                for (
+                    entity_id,
+                    mentions,
+                    videos,
+                    exp_mentions,
+                    exp_videos,
+                ) in entity_drift[:show]:
+                    table.add_row(
+                        names.get(entity_id, str(entity_id)[:8]),
+                        f"{mentions:,} → {exp_mentions:,}",
+                        f"{videos:,} → {exp_videos:,}",
+                    )
+                console.print(table)
+
+            summary = (
+                f"[bold]Entities with drifted counters:[/bold] {len(entity_drift)}\n"
+                f"[bold]Entities with drifted alias counters:[/bold] {len(alias_drift)}"
+            )
+            if not entity_drift and not alias_drift:
+                console.print(
+                    Panel(
+                        summary,
+                        title="[green]Counters Consistent[/green]",
+                        border_style="green",
+                    )
+                )
+                return 0
+            if fix:
+                console.print(
+                    Panel(
+                        summary,
+                        title="[green]Drift Repaired[/green]",
+                        border_style="green",
+                    )
+                )
+                return 0
+            console.print(
+                Panel(
+                    summary + "\n\nRun with [bold]--fix[/bold] to recompute them.",
+                    title="[yellow]Counter Drift Found[/yellow]",
+                    border_style="yellow",
+                )
+            )
+            return 1
+        return 0
+
+    if asyncio.run(_run()):
+        raise typer.Exit(code=1)
+
+
+async def _rebuild_associations(session: AsyncSession, *, dry_run: bool) -> int:
+    """Recompute every stored entity-video association; roll back on dry-run.
+
+    Returns the number of association rows written. Rolls back on dry-run and
+    commits otherwise (see ``_recount_counters``).
+    """
+    written = await EntityMentionRepository().refresh_associations(session)
+    if dry_run:
+        await session.rollback()
+    else:
+        await session.commit()
+    return written
+
+
+@entity_app.command("rebuild-associations")
+def rebuild_associations(
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Compute the associations without writing them.",
+    ),
+) -> None:
+    """Recompute the stored entity-video associations from scratch.
+
+    ``entity_video_associations`` backs the video entity filter, the association
+    counts and the channel entity rankings. Mention, alias and tag writes keep it
+    current as they commit; run this once after the migration that creates it
+    (which cannot backfill alias-matched tags), and to repair it after edits made
+    outside chronovista.
+    """
+
+    async def _run() -> None:
+        async for session in db_manager.get_session(echo=False):
+            written = await _rebuild_associations(session, dry_run=dry_run)
+            summary = f"[bold]Associations:[/bold] {written:,}"
+            if dry_run:
+                console.print(
+                    Panel(
+                        summary,
+                        title="[yellow]Rebuild (dry run — nothing written)[/yellow]",
+                        border_style="yellow",
+                    )
+                )
+            else:
+                console.print(
+                    Panel(
+                        summary,
+                        title="[green]Associations Rebuilt[/green]",
+                        border_style="green",
+                    )
+                )
+
+    asyncio.run(_run())
+
+
+async def _rebuild_cooccurrences(session: AsyncSession, *, dry_run: bool) -> int:
+    """Recount every stored entity co-occurrence; roll back on dry-run.
+
+    Returns the number of co-occurrence rows written, counting both directions
+    of each pair (see ``_rebuild_associations``).
+    """
+    written = await EntityMentionRepository().refresh_cooccurrences(session)
+    if dry_run:
+        await session.rollback()
+    else:
+        await session.commit()
+    return written
+
+
+@entity_app.command("rebuild-cooccurrences")
+def rebuild_cooccurrences(
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Count the co-occurrences without writing them.",
+    ),
+) -> None:
+    """Recount the stored entity co-occurrences from the associations.
+
+    ``entity_cooccurrences`` backs the appears-with panel. Association and video
+    availability changes recount the pairs they touch as they commit, and
+    ``rebuild-associations`` recounts every pair; run this to repair the pairs
+    alone after edits made outside chronovista.
+    """
+
+    async def _run() -> None:
+        async for session in db_manager.get_session(echo=False):
+            written = await _rebuild_cooccurrences(session, dry_run=dry_run)
+            summary = f"[bold]Co-occurrences:[/bold] {written:,}"
+            if dry_run:
+                console.print(
+                    Panel(
+                        summary,
+                        title="[yellow]Rebuild (dry run — nothing written)[/yellow]",
+                        border_style="yellow",
+                    )
+                )
+            else:
+                console.print(
+                    Panel(
+                        summary,
+                        title="[green]Co-occurrences Rebuilt[/green]",
+                        border_style="green",
+                    )
+                )
+
+    asyncio.run(_run())
+
+
+def _grounded_qid(external_ids: dict[str, Any] | None) -> str | None:
+    """The entity's Wikidata QID, in either the legacy or the structured shape."""
+    value = (external_ids or {}).get("wikidata")
+    if isinstance(value, str):
+        return value or None
+    if isinstance(value, dict) and value.get("status") != "absent":
+        qid = value.get("id")
+        return qid if isinstance(qid, str) and qid else None
+    return None
+
+
+async def _fill_missing_properties(
+    session: AsyncSession,
+    client: WikidataClient,
+    *,
+    apply: bool,
+    limit: int | None,
+) -> tuple[int, int, int]:
+    """Fetch properties for grounded entities whose ``properties`` bag is still empty.
+
+    Returns ``(candidates, filled, no_properties)``. All candidates are fetched through
+    ``WikidataClient.fetch_properties_many`` -- 50 items per ``wbgetentities`` call and one
+    shared label round -- instead of two calls per entity. Writes go through
+    ``replace_properties``, which is only safe for an empty bag; that is exactly the set selected
+    here. Rolls back on dry-run and commits on apply (see ``_recount_counters``).
+    """
+    rows = (
+        await session.execute(
+            select(NamedEntityDB.id, NamedEntityDB.external_ids)
+            .where(
+                NamedEntityDB.status == "active",
+                NamedEntityDB.merged_into_id.is_(None),
+                NamedEntityDB.properties == {},
+            )
+            .order_by(NamedEntityDB.canonical_name)
+        )
+    ).all()
+    targets = [
+        (entity_id, qid)
+        for entity_id, external_ids in rows
+        if (qid := _grounded_qid(external_ids)) is not None
+    ]
+    if limit is not None:
+        targets = targets[:limit]
+    if not targets:
+        return 0, 0, 0
+
+    bags = await client.fetch_properties_many([qid for _, qid in targets])
+    repo = NamedEntityRepository()
+    filled = empty = 0
+    for entity_id, qid in targets:
+        properties = bags.get(qid) or {}
+        if not properties:
+            empty += 1
+            continue
+        filled += await repo.replace_properties(
+            session, entity_id, properties=properties
+        )
+
+    if apply:
+        await session.commit()
+    else:
+        await session.rollback()
+    return len(targets), filled, empty
+
+
+@entity_app.command("fill-properties")
+def fill_properties(
+    apply: Annotated[
+        bool,
+        typer.Option(
+            "--apply",
+            help="Write changes. Without this flag the command is a dry run.",
+        ),
+    ] = False,
+    limit: Annotated[
+        int | None,
+        typer.Option("--limit", min=1, help="Fill at most this many entities."),
+    ] = None,
+) -> None:
+    """Fetch Wikidata properties for grounded entities that have none yet.
+
+    Fills the gap the on-approval enrichment leaves when the knowledge base was unreachable,
+    using batched lookups (50 items per call) and the local knowledge-base cache. Only entities
+    with an empty ``properties`` bag are touched. Dry run by default; pass ``--apply`` to write.
+    """
+
+    async def _run() -> None:
+        client = WikidataClient()
+        async for session in db_manager.get_session(echo=False):
+            try:
+                candidates, filled, empty = await _fill_missing_properties(
+                    session, client, apply=apply, limit=limit
+                )
+            except WikidataUnavailable as exc:
+                await session.rollback()
+                console.print(
+                    Panel(
+                        f"[red]Could not reach Wikidata:[/red] {exc}",
+                        title="Knowledge Base Unavailable",
+                        border_style="red",
+                    )
+                )
+                raise typer.Exit(code=1) from exc
+
+        table = Table(title="Fill Properties" + ("" if apply else " (dry run)"))
+        table.add_column("Metric")
+        table.add_column("Value", justify="right")
+        table.add_row("Grounded entities without properties", str(candidates))
+        table.add_row("Filled" if apply else "Would fill", str(filled))
+        table.add_row("No wanted properties on Wikidata", str(empty))
+        table.add_row("Wikidata requests", str(client.request_count))
+        console.print(table)
+
+    asyncio.run(_run())
+
+
 def _merge_scan_results(
     transcript_result: ScanResult | None,
     metadata_result: ScanResult | None,
@@ -1045,6 +1382,16 @@ def scan_entities(
             ),
         ),
     ] = "transcript",
+    changed_since_last_scan: Annotated[
+        bool,
+        typer.Option(
+            "--changed-since-last-scan",
+            help=(
+                "Rescan only transcript segments inserted, corrected or deleted "
+                "since the last run of this mode, replacing their mentions"
+            ),
+        ),
+    ] = False,
 ) -> None:
     """Scan transcript segments for named entity mentions."""
 
@@ -1052,6 +1399,32 @@ def scan_entities(
     if audit and full:
         raise typer.BadParameter("--audit and --full are mutually exclusive")
 
+    # The changed-segments mode rescans the change log against every active
+    # entity; narrowing it would drain changes without scanning them fully.
+    if changed_since_last_scan:
+        conflicting = [
+            flag
+            for flag, given in (
+                ("--full", full),
+                ("--audit", audit),
+                ("--new-entities-only", new_entities_only),
+                ("--entity-type", entity_type is not None),
+                ("--entity-id", entity_id is not None),
+                ("--video-id", bool(video_id)),
+                ("--language", language is not None),
+            )
+            if given
+        ]
+        if conflicting:
+            raise typer.BadParameter(
+                "--changed-since-last-scan cannot be combined with "
+                + ", ".join(conflicting)
+            )
+        if sources.strip() != "transcript":
+            raise typer.BadParameter(
+                "--changed-since-last-scan only applies to --sources transcript"
+            )
+
     # Parse and validate --sources
     valid_sources = {"transcript", "title", "description"}
     parsed_sources: list[str] = [s.strip() for s in sources.split(",") if s.strip()]
@@ -1219,7 +1592,11 @@ def scan_entities(
                 transcript_result: ScanResult | None = None
                 metadata_result: ScanResult | None = None
 
-                if transcript_sources:
+                if changed_since_last_scan:
+                    transcript_result = await service.scan_changed_segments(
+                        batch_size=batch_size, dry_run=True, limit=limit
+                    )
+                elif transcript_sources:
                     transcript_result = await service.scan(
                         entity_type=effective_entity_type,
                         video_ids=video_id,
@@ -1346,7 +1723,14 @@ def scan_entities(
                 transcript_result_live: ScanResult | None = None
                 metadata_result_live: ScanResult | None = None
 
-                if transcript_sources:
+                if changed_since_last_scan:
+                    progress.update(task, description="Scanning changed segments...")
+                    transcript_result_live = await service.scan_changed_segments(
+                        batch_size=batch_size,
+                        dry_run=False,
+                        progress_callback=_progress_callback,
+                    )
+                elif transcript_sources:
                     progress.update(task, description="Scanning segments...")
                     transcript_result_live = await service.scan(
                         entity_type=effective_entity_type,
@@ -1397,6 +1781,11 @@ def scan_entities(
                 f"[bold]Unique videos:[/bold] {result.unique_videos:,}",
                 f"[bold]Duration:[/bold] {result.duration_seconds:.1f}s",
             ]
+            if changed_since_last_scan:
+                summary_lines.insert(
+                    2,
+                    f"[bold]Stale mentions removed:[/bold] {result.mentions_removed:,}",
+                )
             if result.failed_batches > 0:
                 summary_lines.append(
                     f"[bold red]Failed batches:[/bold red] {result.failed_batches:,}"
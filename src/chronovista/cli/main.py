@@ -14,6 +14,7 @@ from chronovista.cli.category_commands import category_app
 from chronovista.cli.commands.api import api_app
 from chronovista.cli.commands.cache import app as cache_app
 from chronovista.cli.commands.enrich import app as enrich_app
+from chronovista.cli.commands.history import history_app
 from chronovista.cli.commands.identity import identity_app
 from chronovista.cli.commands.playlist import playlist_app
 from chronovista.cli.commands.recover import recover_app
@@ -49,6 +50,9 @@ app.add_typer(
     correction_app, name="corrections", help="🔧 Batch transcript correction tools"
 )
 app.add_typer(entity_app, name="entities", help="🧑 Named entity management")
+app.add_typer(
+    history_app, name="history", help="🕒 Watch-history analytics maintenance"
+)
 app.add_typer(
     identity_app,
     name="identity",
@@ -74,7 +78,9 @@ app.add_typer(
 )
 app.add_typer(topic_app, name="topics", help="📂 Topic exploration and analytics")
 app.add_typer(
-    transcript_app, name="transcript", help="📝 Query transcript segments by timestamp"
+    transcript_app,
+    name="transcript",
+    help="📝 Query transcript segments and manage transcript storage",
 )
 
 
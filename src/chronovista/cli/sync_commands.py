@@ -24,6 +24,7 @@ from chronovista.cli.sync.base import (
 )
 from chronovista.cli.sync.transformers import DataTransformers
 from chronovista.config.database import db_manager
+from chronovista.config.settings import settings
 from chronovista.container import container
 from chronovista.db.models import Video as VideoDB
 from chronovista.models.api_responses import (
@@ -47,9 +48,18 @@ from chronovista.services.preference_aware_transcript_filter import (
 from chronovista.services.transcript_service import (
     TranscriptNotFoundError,
 )
+from chronovista.services.transcript_sync_planner import (
+    TranscriptSyncPlan,
+    TranscriptSyncPlanner,
+)
 
 console = Console()
 
+# Transcripts written per commit in ``sync transcripts``. The sync holds one
+# session for the run; committing in chunks bounds what an interrupted run
+# loses while avoiding a commit per transcript.
+_TRANSCRIPT_COMMIT_BATCH_SIZE = 50
+
 
 def display_translation_pairing_info(download_plan: DownloadPlan) -> None:
     """
@@ -656,18 +666,60 @@ def playlists(
     run_sync_operation(sync_playlists_data, "Playlist Sync")
 
 
-async def _show_transcripts_dry_run(
+def _print_preference_plan(available: list[str], download_plan: DownloadPlan) -> None:
+    """
+    Print how a video's available transcripts matched the language preferences.
+
+    Parameters
+    ----------
+    available : List[str]
+        Language codes available for the video
+    download_plan : DownloadPlan
+        The preference plan built from ``available``
+    """
+    console.print(f"   [dim]Available: {', '.join(available)}[/dim]")
+
+    shown: list[str] = []
+    for lang in download_plan.fluent_downloads:
+        shown.append(lang)
+        console.print(f"   [green]\u2713 {lang} (FLUENT)[/green] - downloading")
+
+    for original, translation in download_plan.learning_pairs:
+        if original not in shown:
+            shown.append(original)
+            console.print(
+                f"   [green]\u2713 {original} (LEARNING)[/green] "
+                "- downloading original"
+            )
+        if translation and translation not in shown:
+            shown.append(translation)
+            console.print(
+                f"   [green]\u2713 {original}\u2192{translation} "
+                "(LEARNING)[/green] - downloading translation"
+            )
+
+    for lang in download_plan.skipped_curious:
+        console.print(f"   [dim]\u25cb {lang} (CURIOUS)[/dim] - skipped (on-demand)")
+
+    for lang in download_plan.blocked_excluded:
+        console.print(f"   [red]\u2715 {lang} (EXCLUDE)[/red] - skipped")
+
+
+def _show_transcripts_dry_run(
     videos: list[VideoDB],
+    plan: TranscriptSyncPlan,
     language_codes: list[str],
     force: bool,
 ) -> None:
     """
-    Display preview of transcripts that would be synced without making changes.
+    Display the transcript sync plan without downloading anything.
 
     Parameters
     ----------
     videos : List[VideoDB]
         List of videos to process
+    plan : TranscriptSyncPlan
+        The download plan built for ``videos``
     language_codes : List[str]
         Preferred language codes for transcripts
     force : bool
@@ -679,7 +731,8 @@ async def _show_transcripts_dry_run(
             f"[blue]Sync Preview (Dry Run)[/blue]\n"
             f"Total videos to process: {len(videos)}\n"
             f"Preferred languages: {', '.join(language_codes)}\n"
-            f"Force re-download: {'Yes' if force else 'No'}",
+            f"Force re-download: {'Yes' if force else 'No'}\n"
+            f"Transcripts to download: {plan.download_count}",
             title="Transcript Sync Preview",
             border_style="blue",
         )
@@ -691,8 +744,9 @@ async def _show_transcripts_dry_run(
     table.add_column("Video ID", style="dim", max_width=15)
     table.add_column("Channel", style="green", max_width=20)
     table.add_column("Duration", style="yellow", justify="right")
+    table.add_column("Plan", style="magenta", max_width=30)
 
-    for video in videos[:20]:  # Show first 20
+    for video, entry in zip(videos[:20], plan.videos[:20], strict=True):
         title = video.title or "Unknown"
         duration_minutes = video.duration // 60 if video.duration else 0
         duration_seconds = video.duration % 60 if video.duration else 0
@@ -701,15 +755,23 @@ async def _show_transcripts_dry_run(
         # Use channel_name_hint to avoid lazy-loading after session closes
         channel_title = video.channel_name_hint or "Unknown"
 
+        if entry.error is not None:
+            planned = "[red]Availability check failed[/red]"
+        elif entry.skip_reason is not None:
+            planned = f"[dim]Skip: {entry.skip_reason}[/dim]"
+        else:
+            planned = ", ".join(entry.languages)
+
         table.add_row(
             title[:37] + "..." if len(title) > 40 else title,
             video.video_id[:12] + "..." if len(video.video_id) > 15 else video.video_id,
             channel_title[:17] + "..." if len(channel_title) > 20 else channel_title,
             duration_formatted,
+            planned,
         )
 
     if len(videos) > 20:
-        table.add_row("...", "...", "...", f"+{len(videos) - 20} more")
+        table.add_row("...", "...", "...", f"+{len(videos) - 20} more", "")
 
     console.print(table)
 
@@ -721,17 +783,23 @@ async def _show_transcripts_dry_run(
     console.print()
     console.print("[blue]What would happen:[/blue]")
     console.print(
-        f"   [green]Attempt to download transcripts for {len(videos)} videos[/green]"
-    )
-    console.print(
-        f"   [dim]Languages tried in order: {', '.join(language_codes)}[/dim]"
+        f"   [green]Download {plan.download_count} transcripts for "
+        f"{len(plan.downloads)} videos[/green]"
     )
+    for lang, count in sorted(plan.language_counts().items()):
+        console.print(f"   [dim]{lang}: {count}[/dim]")
+    if plan.skipped:
+        console.print(f"   [dim]Skip {len(plan.skipped)} videos:[/dim]")
+        for reason, count in sorted(plan.skip_reasons().items()):
+            console.print(f"      [dim]{count}: {reason}[/dim]")
+    if plan.errors:
+        console.print(
+            f"   [red]Availability check failed for {len(plan.errors)} videos[/red]"
+        )
     if force:
         console.print(
             "   [yellow]Existing transcripts will be re-downloaded (--force enabled)[/yellow]"
         )
-    else:
-        console.print("   [dim]Videos with existing transcripts will be skipped[/dim]")
     console.print()
     console.print("[yellow]Remove --dry-run to perform actual sync[/yellow]")
 
@@ -883,175 +951,130 @@ def transcripts(
 
         display_success(f"Found {len(videos_to_process)} videos to process")
 
-        # Handle dry-run mode
-        if dry_run:
-            await _show_transcripts_dry_run(videos_to_process, language, force)
-            return result
-
-        # Process videos
-        console.print()
-        console.print(
-            f"[blue]Downloading transcripts for {len(videos_to_process)} videos...[/blue]"
+        # Decide every video's languages, and which are already stored, before
+        # downloading anything: one stored-pair query for the whole list.
+        planner = TranscriptSyncPlanner(
+            video_transcript_repository, transcript_service, transcript_filter
         )
 
-        for idx, video in enumerate(videos_to_process, 1):
-            video_title = video.title or video.video_id
-            short_title = (
-                video_title[:40] + "..." if len(video_title) > 40 else video_title
+        async with db_manager.session() as session:
+            if using_preferences:
+                console.print(
+                    f"[blue]Checking available transcripts for "
+                    f"{len(videos_to_process)} videos...[/blue]"
+                )
+            plan = await planner.plan(
+                session,
+                videos_to_process,
+                languages=language,
+                user_preferences=user_preferences if using_preferences else None,
+                force=force,
             )
 
+            # Handle dry-run mode
+            if dry_run:
+                _show_transcripts_dry_run(videos_to_process, plan, language, force)
+                return result
+
+            # Process videos
+            console.print()
             console.print(
-                f"[dim]({idx}/{len(videos_to_process)}) Processing: {short_title}[/dim]"
+                f"[blue]Downloading transcripts for {len(videos_to_process)} videos...[/blue]"
             )
 
-            try:
-                # Determine languages to download based on preferences or flag
-                languages_to_download: list[str] = []
-                download_plan: DownloadPlan | None = None
-
-                if using_preferences and user_preferences:
-                    # Get available transcript languages for this video
-                    available_languages = (
-                        await transcript_service.get_available_languages(video.video_id)
-                    )
-                    available_codes = [
-                        lang["language_code"] for lang in available_languages
-                    ]
-
-                    if available_codes:
-                        # Create download plan based on preferences
-                        download_plan = transcript_filter.create_download_plan(
-                            available_codes, user_preferences
-                        )
-
-                        # Display matching status
-                        console.print(
-                            f"   [dim]Available: {', '.join(available_codes)}[/dim]"
-                        )
+            # Writes share this session; each runs in a savepoint so a failed
+            # write loses only itself, and the session commits every
+            # _TRANSCRIPT_COMMIT_BATCH_SIZE writes.
+            uncommitted = 0
+            for idx, entry in enumerate(plan.videos, 1):
+                short_title = (
+                    entry.title[:40] + "..." if len(entry.title) > 40 else entry.title
+                )
 
-                        # Build list of languages to download
-                        for lang in download_plan.fluent_downloads:
-                            languages_to_download.append(lang)
-                            console.print(
-                                f"   [green]\u2713 {lang} (FLUENT)[/green] - downloading"
-                            )
+                console.print(
+                    f"[dim]({idx}/{len(plan.videos)}) Processing: {short_title}[/dim]"
+                )
 
-                        for original, translation in download_plan.learning_pairs:
-                            if original not in languages_to_download:
-                                languages_to_download.append(original)
-                                console.print(
-                                    f"   [green]\u2713 {original} (LEARNING)[/green] "
-                                    "- downloading original"
-                                )
-                            if translation and translation not in languages_to_download:
-                                languages_to_download.append(translation)
-                                console.print(
-                                    f"   [green]\u2713 {original}\u2192{translation} "
-                                    "(LEARNING)[/green] - downloading translation"
-                                )
-
-                        for lang in download_plan.skipped_curious:
-                            console.print(
-                                f"   [dim]\u25cb {lang} (CURIOUS)[/dim] - "
-                                "skipped (on-demand)"
-                            )
+                if entry.error is not None:
+                    result.add_error(f"{entry.video_id}: {entry.error}")
+                    console.print(f"   [red]Error: {entry.error}[/red]")
+                    continue
 
-                        for lang in download_plan.blocked_excluded:
-                            console.print(
-                                f"   [red]\u2715 {lang} (EXCLUDE)[/red] - skipped"
-                            )
+                if entry.preference_plan is not None and entry.available:
+                    _print_preference_plan(entry.available, entry.preference_plan)
 
-                        if not languages_to_download:
-                            console.print(
-                                "   [yellow]No transcripts matched preferences[/yellow]"
-                            )
-                            result.skipped += 1
-                            continue
+                if entry.skip_reason is not None:
+                    if entry.existing_language is not None:
+                        console.print(
+                            f"   [dim]Skipping (transcript exists for "
+                            f"{entry.existing_language})[/dim]"
+                        )
                     else:
-                        console.print("   [yellow]No transcripts available[/yellow]")
-                        result.skipped += 1
-                        continue
-                else:
-                    # Use --language flag or default
-                    languages_to_download = list(language)
-
-                # Check if transcript already exists (skip if not forcing)
-                if not force:
-                    skip_video = False
-                    async for session in db_manager.get_session():
-                        for lang in languages_to_download:
-                            existing = (
-                                await video_transcript_repository.get_by_composite_key(
-                                    session, video.video_id, lang
-                                )
-                            )
-                            if existing:
-                                console.print(
-                                    f"   [dim]Skipping (transcript exists for {lang})[/dim]"
-                                )
-                                result.skipped += 1
-                                skip_video = True
-                                break
-                    if skip_video:
-                        continue
-
-                # Download transcripts for each language in the download list
-                for lang_code in languages_to_download:
+                        console.print(f"   [yellow]{entry.skip_reason}[/yellow]")
+                    result.skipped += 1
+                    continue
+
+                # Download transcripts for each language in the plan
+                for lang_code in entry.languages:
                     try:
                         # Download transcript using TranscriptService
                         transcript = await transcript_service.get_transcript(
-                            video_id=video.video_id,
+                            video_id=entry.video_id,
                             language_codes=[lang_code],
                             download_reason=DownloadReason.USER_REQUEST,
                         )
 
-                        # Store transcript in database
-                        async for session in db_manager.get_session():
-                            # Check if updating or creating
-                            existing = (
-                                await video_transcript_repository.get_by_composite_key(
-                                    session, video.video_id, transcript.language_code
-                                )
-                            )
+                        # Create VideoTranscriptCreate object
+                        # Resolve language code to proper LanguageCode enum
+                        # (handles lowercase codes from youtube-transcript-api)
+                        resolved_lang_code = resolve_language_code(
+                            transcript.language_code
+                        )
+                        transcript_create = VideoTranscriptCreate(
+                            video_id=entry.video_id,
+                            language_code=resolved_lang_code,
+                            transcript_text=transcript.transcript_text,
+                            transcript_type=transcript.transcript_type,
+                            download_reason=transcript.download_reason,
+                            confidence_score=transcript.confidence_score,
+                            is_cc=transcript.is_cc,
+                            is_auto_synced=transcript.is_auto_synced,
+                            track_kind=transcript.track_kind,
+                            caption_name=transcript.caption_name,
+                        )
 
-                            # Create VideoTranscriptCreate object
-                            # Resolve language code to proper LanguageCode enum
-                            # (handles lowercase codes from youtube-transcript-api)
-                            resolved_lang_code = resolve_language_code(
-                                transcript.language_code
-                            )
-                            transcript_create = VideoTranscriptCreate(
-                                video_id=video.video_id,
-                                language_code=resolved_lang_code,
-                                transcript_text=transcript.transcript_text,
-                                transcript_type=transcript.transcript_type,
-                                download_reason=transcript.download_reason,
-                                confidence_score=transcript.confidence_score,
-                                is_cc=transcript.is_cc,
-                                is_auto_synced=transcript.is_auto_synced,
-                                track_kind=transcript.track_kind,
-                                caption_name=transcript.caption_name,
-                            )
+                        # Updating or creating, from the prefetched pairs
+                        existing = plan.is_stored(
+                            entry.video_id, transcript.language_code
+                        )
 
-                            # Save with raw transcript data to preserve timestamps
+                        # Save with raw transcript data to preserve timestamps
+                        async with session.begin_nested():
                             await video_transcript_repository.create_or_update(
                                 session,
                                 transcript_create,
                                 raw_transcript_data=transcript.raw_transcript_data,
+                                compact=settings.transcript_compact_storage,
                             )
+                        plan.mark_stored(entry.video_id, transcript.language_code)
 
-                            if existing:
-                                result.updated += 1
-                                console.print(
-                                    f"   [green]Updated transcript "
-                                    f"({transcript.language_code})[/green]"
-                                )
-                            else:
-                                result.created += 1
-                                console.print(
-                                    f"   [green]Downloaded transcript "
-                                    f"({transcript.language_code})[/green]"
-                                )
+                        uncommitted += 1
+                        if uncommitted >= _TRANSCRIPT_COMMIT_BATCH_SIZE:
+                            await session.commit()
+                            uncommitted = 0
+
+                        if existing:
+                            result.updated += 1
+                            console.print(
+                                f"   [green]Updated transcript "
+                                f"({transcript.language_code})[/green]"
+                            )
+                        else:
+                            result.created += 1
+                            console.print(
+                                f"   [green]Downloaded transcript "
+                                f"({transcript.language_code})[/green]"
+                            )
 
                     except TranscriptNotFoundError:
                         console.print(
@@ -1059,17 +1082,9 @@ def transcripts(
                         )
 
                     except Exception as e:
-                        result.add_error(f"{video.video_id} ({lang_code}): {str(e)}")
+                        result.add_error(f"{entry.video_id} ({lang_code}): {str(e)}")
                         console.print(f"   [red]Error ({lang_code}): {str(e)}[/red]")
 
-            except TranscriptNotFoundError:
-                result.skipped += 1
-                console.print("   [yellow]No transcript available[/yellow]")
-
-            except Exception as e:
-                result.add_error(f"{video.video_id}: {str(e)}")
-                console.print(f"   [red]Error: {str(e)}[/red]")
-
         # Display results
         console.print()
 
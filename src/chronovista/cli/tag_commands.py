@@ -13,6 +13,7 @@ import uuid
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from chronovista.services.tag_backfill import TagBackfillService
     from chronovista.services.tag_management import TagManagementService
 
 import typer
@@ -449,6 +450,28 @@ def tags_by_video(
     asyncio.run(run_by_video())
 
 
+def _create_backfill_service() -> TagBackfillService:
+    """Build a ``TagBackfillService`` whose normalization memo persists.
+
+    The memo lives under ``settings.cache_dir`` so repeated ``normalize``
+    and ``analyze`` runs only push never-seen tags through the pipeline.
+    """
+    from chronovista.config.settings import settings
+    from chronovista.services.tag_backfill import TagBackfillService
+    from chronovista.services.tag_normalization import TagNormalizationService
+    from chronovista.services.tag_normalization_engine import (
+        TagNormalizationEngine,
+        default_memo_path,
+    )
+
+    normalization_service = TagNormalizationService()
+    engine = TagNormalizationEngine(
+        normalization_service,
+        memo_path=default_memo_path(settings.cache_dir),
+    )
+    return TagBackfillService(normalization_service, normalization_engine=engine)
+
+
 @tag_app.command("normalize")
 def normalize_tags(
     batch_size: int = typer.Option(
@@ -486,11 +509,7 @@ def normalize_tags(
     """
 
     async def _run() -> None:
-        from chronovista.services.tag_backfill import TagBackfillService
-        from chronovista.services.tag_normalization import TagNormalizationService
-
-        normalization_service = TagNormalizationService()
-        backfill_service = TagBackfillService(normalization_service)
+        backfill_service = _create_backfill_service()
 
         async with db_manager.session(echo=False) as session:
             if incremental:
@@ -615,6 +634,7 @@ def _render_live_output(metrics: dict[str, Any]) -> None:
     canonical_tags_reused: int = metrics.get("canonical_tags_reused", 0)
     skipped: int = metrics.get("skipped", 0)
     duration: float = metrics.get("duration", 0.0)
+    tags_per_second: float = metrics.get("tags_per_second", 0.0)
 
     minutes, seconds = divmod(int(duration), 60)
     elapsed_str = f"{minutes}m {seconds:02d}s" if minutes > 0 else f"{seconds}s"
@@ -626,6 +646,7 @@ def _render_live_output(metrics: dict[str, Any]) -> None:
         f"[bold]Canonical tags reused:[/bold]   {canonical_tags_reused:>7,}",
         f"[bold]Tags skipped:[/bold]            {skipped:>7,}",
         f"[bold]Duration:[/bold]                {elapsed_str:>7}",
+        f"[bold]Normalization:[/bold]           {tags_per_second:>7,.0f} tags/s",
     ]
     display_panel(
         "\n".join(summary_lines),
@@ -651,11 +672,7 @@ def analyze_tags(
     """Analyze tag normalization without modifying the database."""
 
     async def _run() -> None:
-        from chronovista.services.tag_backfill import TagBackfillService
-        from chronovista.services.tag_normalization import TagNormalizationService
-
-        normalization_service = TagNormalizationService()
-        backfill_service = TagBackfillService(normalization_service)
+        backfill_service = _create_backfill_service()
 
         async with db_manager.session(echo=False) as session:
             await backfill_service.run_analysis(
@@ -5,6 +5,10 @@ Provides commands for navigating video transcripts by timestamp:
 - transcript segment: Get segment at specific timestamp
 - transcript context: Get segments within time window
 - transcript range: Get segments within time range
+
+And for transcript storage:
+- transcript compact: Move existing transcripts to compact storage in batches
+- transcript storage-report: Show transcript storage footprint and bytes saved
 """
 
 from __future__ import annotations
@@ -13,13 +17,12 @@ from typing import Annotated
 
 import typer
 from rich.console import Console
+from rich.table import Table
 
 from chronovista.cli.sync.base import run_sync_operation
 from chronovista.config.database import db_manager
+from chronovista.models.video_transcript import TranscriptCompactionResult
 from chronovista.models.youtube_types import VideoId
-from chronovista.repositories.transcript_segment_repository import (
-    TranscriptSegmentRepository,
-)
 from chronovista.repositories.video_transcript_repository import (
     VideoTranscriptRepository,
 )
@@ -33,11 +36,12 @@ from chronovista.services.segment_service import (
     format_segments_srt,
     parse_timestamp,
 )
+from chronovista.services.segment_timeline_cache import segment_timeline_cache
 
 # Initialize CLI app and console
 transcript_app = typer.Typer(
     name="transcript",
-    help="Query transcript segments by timestamp.",
+    help="Query transcript segments and manage transcript storage.",
     no_args_is_help=True,
 )
 console = Console()
@@ -54,6 +58,7 @@ EXIT_INVALID_RANGE = 4
 DEFAULT_WINDOW = 30.0
 MAX_WINDOW = 3600.0
 DEFAULT_LANGUAGE = "en"
+DEFAULT_COMPACT_BATCH_SIZE = 200
 LARGE_SEGMENT_WARNING_THRESHOLD = 5000  # NFR-PERF-04
 
 
@@ -114,10 +119,9 @@ def segment_command(
                     "Consider using specific timestamp or range queries for better performance."
                 )
 
-            # Query segment
-            segment_repo = TranscriptSegmentRepository()
-            segment = await segment_repo.get_segment_at_time(
-                session, VideoId(video_id), language, time_seconds
+            # Query segment (from the transcript's cached timeline)
+            segment = await segment_timeline_cache.get_segment_at_time(
+                session, video_id, language, time_seconds
             )
 
             if not segment:
@@ -127,18 +131,12 @@ def segment_command(
                 return EXIT_NO_SEGMENT
 
             # Format output
-            from chronovista.models.transcript_segment import (
-                TranscriptSegment as TSPydantic,
-            )
-
-            pydantic_segment = TSPydantic.model_validate(segment)
-
             if format == OutputFormat.HUMAN:
-                console.print(format_segment_human(pydantic_segment))
+                console.print(format_segment_human(segment))
             elif format == OutputFormat.JSON:
-                console.print(format_segment_json(pydantic_segment))
+                console.print(format_segment_json(segment))
             elif format == OutputFormat.SRT:
-                console.print(format_segment_srt(pydantic_segment, sequence=1))
+                console.print(format_segment_srt(segment, sequence=1))
 
             return EXIT_SUCCESS
 
@@ -216,10 +214,9 @@ def context_command(
                     "Query results may take longer for large transcripts."
                 )
 
-            # Query segments
-            segment_repo = TranscriptSegmentRepository()
-            segments = await segment_repo.get_context_window(
-                session, VideoId(video_id), language, time_seconds, actual_window
+            # Query segments (from the transcript's cached timeline)
+            segments = await segment_timeline_cache.get_context_window(
+                session, video_id, language, time_seconds, actual_window
             )
 
             if not segments:
@@ -228,25 +225,18 @@ def context_command(
                 )
                 return EXIT_SUCCESS  # Not an error, just empty result
 
-            # Convert to Pydantic
-            from chronovista.models.transcript_segment import (
-                TranscriptSegment as TSPydantic,
-            )
-
-            pydantic_segments = [TSPydantic.model_validate(s) for s in segments]
-
             # Format output
             title = f"Context around {timestamp} (±{int(actual_window)}s)"
             if format == OutputFormat.HUMAN:
-                console.print(format_segments_human(pydantic_segments, title=title))
+                console.print(format_segments_human(segments, title=title))
             elif format == OutputFormat.JSON:
                 console.print(
                     format_segments_json(
-                        pydantic_segments, video_id=video_id, language_code=language
+                        segments, video_id=video_id, language_code=language
                     )
                 )
             elif format == OutputFormat.SRT:
-                console.print(format_segments_srt(pydantic_segments))
+                console.print(format_segments_srt(segments))
 
             return EXIT_SUCCESS
 
@@ -326,10 +316,9 @@ def range_command(
                     "Large range queries may take longer to complete."
                 )
 
-            # Query segments
-            segment_repo = TranscriptSegmentRepository()
-            segments = await segment_repo.get_segments_in_range(
-                session, VideoId(video_id), language, start_seconds, end_seconds
+            # Query segments (from the transcript's cached timeline)
+            segments = await segment_timeline_cache.get_segments_in_range(
+                session, video_id, language, start_seconds, end_seconds
             )
 
             if not segments:
@@ -338,26 +327,19 @@ def range_command(
                 )
                 return EXIT_SUCCESS
 
-            # Convert to Pydantic
-            from chronovista.models.transcript_segment import (
-                TranscriptSegment as TSPydantic,
-            )
-
-            pydantic_segments = [TSPydantic.model_validate(s) for s in segments]
-
             # Format output
             duration = end_seconds - start_seconds
             title = f"Segments from {start} to {end} ({duration:.1f}s)"
             if format == OutputFormat.HUMAN:
-                console.print(format_segments_human(pydantic_segments, title=title))
+                console.print(format_segments_human(segments, title=title))
             elif format == OutputFormat.JSON:
                 console.print(
                     format_segments_json(
-                        pydantic_segments, video_id=video_id, language_code=language
+                        segments, video_id=video_id, language_code=language
                     )
                 )
             elif format == OutputFormat.SRT:
-                console.print(format_segments_srt(pydantic_segments))
+                console.print(format_segments_srt(segments))
 
             return EXIT_SUCCESS
 
@@ -369,5 +351,132 @@ def range_command(
         raise typer.Exit(exit_code)
 
 
+def _format_bytes(size_bytes: int) -> str:
+    """Format a byte count as a human-readable string (e.g., "23.4 MB")."""
+    size = float(size_bytes)
+    for unit in ("B", "KB", "MB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+@transcript_app.command("compact")
+def compact_command(
+    batch_size: Annotated[
+        int,
+        typer.Option(
+            "--batch-size", "-b", min=1, help="Transcripts per batch (one commit each)"
+        ),
+    ] = DEFAULT_COMPACT_BATCH_SIZE,
+    limit: Annotated[
+        int | None,
+        typer.Option("--limit", min=1, help="Stop after examining this many"),
+    ] = None,
+    dry_run: Annotated[
+        bool, typer.Option("--dry-run", help="Measure without writing")
+    ] = False,
+) -> None:
+    """Move existing transcripts to compact storage.
+
+    Compact transcripts keep their segments as the source of truth: the full
+    text is derived on read and the raw API payload is archived compressed.
+    Transcripts whose stored text differs from their segments are skipped
+    (run ``chronovista corrections rebuild-text`` first for corrected ones).
+    Each batch commits on its own, so the command can be interrupted and
+    re-run.
+
+    Examples:
+        chronovista transcript compact --dry-run
+        chronovista transcript compact --batch-size 500
+    """
+
+    async def _compact() -> int:
+        """Compact transcripts batch by batch."""
+        transcript_repo = VideoTranscriptRepository()
+        totals = TranscriptCompactionResult()
+        examined = 0
+        after: tuple[str, str] | None = None
+
+        async for session in db_manager.get_session():
+            while limit is None or examined < limit:
+                size = (
+                    batch_size if limit is None else min(batch_size, limit - examined)
+                )
+                batch = await transcript_repo.compact_batch(
+                    session, batch_size=size, after=after, dry_run=dry_run
+                )
+                if batch.last_key is None:
+                    break
+                if not dry_run:
+                    await session.commit()
+
+                examined += batch.compacted + batch.skipped_mismatch
+                after = batch.last_key
+                totals.compacted += batch.compacted
+                totals.skipped_mismatch += batch.skipped_mismatch
+                totals.bytes_released += batch.bytes_released
+                totals.bytes_archived += batch.bytes_archived
+                console.print(
+                    f"  {'Would compact' if dry_run else 'Compacted'} "
+                    f"{totals.compacted:,} transcript(s) "
+                    f"({examined:,} examined)"
+                )
+
+        verb = "Would compact" if dry_run else "Compacted"
+        console.print(
+            f"[green]{verb} {totals.compacted:,} transcript(s):[/green] "
+            f"released {_format_bytes(totals.bytes_released)}, "
+            f"archived {_format_bytes(totals.bytes_archived)}, "
+            f"net saving "
+            f"{_format_bytes(totals.bytes_released - totals.bytes_archived)}"
+        )
+        if totals.skipped_mismatch:
+            console.print(
+                f"[yellow]Skipped {totals.skipped_mismatch:,} transcript(s) whose "
+                "stored text differs from their segments.[/yellow]"
+            )
+        return EXIT_SUCCESS
+
+    exit_code = run_sync_operation(_compact, "Transcript Compaction")
+    if exit_code is not None:
+        raise typer.Exit(exit_code)
+
+
+@transcript_app.command("storage-report")
+def storage_report_command() -> None:
+    """Show how transcripts are stored and the bytes compaction saved.
+
+    Examples:
+        chronovista transcript storage-report
+    """
+
+    async def _report() -> int:
+        """Query and print the storage report."""
+        async for session in db_manager.get_session():
+            report = await VideoTranscriptRepository().get_storage_report(session)
+
+            table = Table(title="Transcript Storage")
+            table.add_column("Metric")
+            table.add_column("Value", justify="right")
+            table.add_row("Full transcripts", f"{report.full_transcripts:,}")
+            table.add_row(
+                "  of which compactable", f"{report.compactable_transcripts:,}"
+            )
+            table.add_row("Compact transcripts", f"{report.compact_transcripts:,}")
+            table.add_row("Inline text", _format_bytes(report.inline_text_bytes))
+            table.add_row("Inline raw data", _format_bytes(report.inline_raw_bytes))
+            table.add_row("Released text", _format_bytes(report.released_text_bytes))
+            table.add_row("Released raw data", _format_bytes(report.released_raw_bytes))
+            table.add_row("Archived (compressed)", _format_bytes(report.archived_bytes))
+            table.add_row("[bold]Bytes saved[/bold]", _format_bytes(report.bytes_saved))
+            console.print(table)
+        return EXIT_SUCCESS
+
+    exit_code = run_sync_operation(_report, "Transcript Storage Report")
+    if exit_code is not None:
+        raise typer.Exit(exit_code)
+
+
 # Export app for registration
 __all__ = ["transcript_app"]
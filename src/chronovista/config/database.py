@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from collections.abc import AsyncGenerator, AsyncIterator
 from contextlib import asynccontextmanager
+from typing import Any
 
 from sqlalchemy import Engine, create_engine
 from sqlalchemy.ext.asyncio import (
@@ -16,6 +17,12 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from chronovista.config.settings import settings
+from chronovista.db.instrumentation import (
+    InstrumentedAsyncQueuePool,
+    PoolStatus,
+    describe_pool,
+    install_query_instrumentation,
+)
 from chronovista.db.models import Base
 
 # Metadata for migrations
@@ -23,40 +30,83 @@ metadata = Base.metadata
 
 
 class DatabaseManager:
-    """Manages database connections and sessions."""
+    """Manages database connections and sessions.
+
+    Two engines share one database but not one pool. The *interactive* engine
+    serves API requests and CLI commands; the *batch* engine serves background
+    jobs started through the API (onboarding steps, entity scans). A long scan
+    can exhaust the batch pool without making ordinary API reads wait.
+    """
 
     def __init__(self) -> None:
         self._engine: AsyncEngine | None = None
         self._session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._batch_engine: AsyncEngine | None = None
+        self._batch_session_factory: async_sessionmaker[AsyncSession] | None = None
 
     @staticmethod
-    def _pool_kwargs() -> dict[str, int]:
-        """Return connection pool settings based on environment.
+    def _pool_kwargs() -> dict[str, int | float]:
+        """Return interactive pool settings based on environment.
 
         Development uses a small pool with no overflow for fast failure.
-        Production uses a larger pool to handle concurrent status polling
-        alongside long-running background tasks that hold sessions open.
+        Production uses a larger pool to handle concurrent status polling.
+        ``DB_POOL_SIZE``, ``DB_MAX_OVERFLOW`` and ``DB_POOL_TIMEOUT`` override
+        either default.
         """
         if settings.is_development_database:
-            return {"pool_size": 5, "max_overflow": 0, "pool_timeout": 10}
-        return {"pool_size": 10, "max_overflow": 20, "pool_timeout": 30}
+            kwargs: dict[str, int | float] = {
+                "pool_size": 5,
+                "max_overflow": 0,
+                "pool_timeout": 10,
+            }
+        else:
+            kwargs = {"pool_size": 10, "max_overflow": 20, "pool_timeout": 30}
+        if settings.db_pool_size is not None:
+            kwargs["pool_size"] = settings.db_pool_size
+        if settings.db_max_overflow is not None:
+            kwargs["max_overflow"] = settings.db_max_overflow
+        if settings.db_pool_timeout is not None:
+            kwargs["pool_timeout"] = settings.db_pool_timeout
+        return kwargs
 
-    def get_engine(self) -> AsyncEngine:
-        """Get or create async database engine."""
-        if self._engine is None:
-            database_url = settings.effective_database_url
+    @staticmethod
+    def _batch_pool_kwargs() -> dict[str, int | float]:
+        """Return batch pool settings.
 
-            engine_kwargs = {
-                "echo": settings.db_log_queries,
-                "future": True,
-                "pool_pre_ping": True,
-                "pool_recycle": 3600,
-                # Prevent runaway queries from holding connections indefinitely
-                "connect_args": {"server_settings": {"statement_timeout": "60000"}},
-                **self._pool_kwargs(),
-            }
+        Background jobs check connections out per chunk, so a few connections
+        go a long way; the generous timeout lets a job wait its turn rather
+        than fail while another job holds the pool.
+        """
+        return {
+            "pool_size": settings.db_batch_pool_size,
+            "max_overflow": settings.db_batch_max_overflow,
+            "pool_timeout": settings.db_batch_pool_timeout,
+        }
+
+    @staticmethod
+    def _create_engine(pool_kwargs: dict[str, int | float]) -> AsyncEngine:
+        """Create an async engine with the shared connection settings."""
+        engine_kwargs: dict[str, Any] = {
+            "echo": settings.db_log_queries,
+            "future": True,
+            "pool_pre_ping": True,
+            "pool_recycle": 3600,
+            # Prevent runaway queries from holding connections indefinitely
+            "connect_args": {"server_settings": {"statement_timeout": "60000"}},
+            **pool_kwargs,
+        }
+        if settings.api_instrumentation:
+            engine_kwargs["poolclass"] = InstrumentedAsyncQueuePool
+
+        engine = create_async_engine(settings.effective_database_url, **engine_kwargs)
+        if settings.api_instrumentation:
+            install_query_instrumentation(engine)
+        return engine
 
-            self._engine = create_async_engine(database_url, **engine_kwargs)
+    def get_engine(self) -> AsyncEngine:
+        """Get or create the interactive async database engine."""
+        if self._engine is None:
+            self._engine = self._create_engine(self._pool_kwargs())
         return self._engine
 
     def get_session_factory(self) -> async_sessionmaker[AsyncSession]:
@@ -70,6 +120,41 @@ class DatabaseManager:
             )
         return self._session_factory
 
+    def get_batch_engine(self) -> AsyncEngine:
+        """Get or create the engine backing the batch pool."""
+        if self._batch_engine is None:
+            self._batch_engine = self._create_engine(self._batch_pool_kwargs())
+        return self._batch_engine
+
+    def get_batch_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Get or create the session factory for background jobs.
+
+        Jobs should open a session (or commit) per chunk of work rather than
+        hold one transaction for the whole run: an ``AsyncSession`` returns
+        its connection to the pool at every commit or rollback.
+        """
+        if self._batch_session_factory is None:
+            self._batch_session_factory = async_sessionmaker(
+                bind=self.get_batch_engine(),
+                class_=AsyncSession,
+                expire_on_commit=False,
+            )
+        return self._batch_session_factory
+
+    def pool_stats(self) -> list[PoolStatus]:
+        """Occupancy of each pool created so far, interactive first."""
+        stats: list[PoolStatus] = []
+        for name, engine in (
+            ("interactive", self._engine),
+            ("batch", self._batch_engine),
+        ):
+            if engine is None:
+                continue
+            status = describe_pool(name, engine.pool)
+            if status is not None:
+                stats.append(status)
+        return stats
+
     @asynccontextmanager
     async def session(self, echo: bool | None = None) -> AsyncIterator[AsyncSession]:
         """Session scope that commits on success and rolls back on failure.
@@ -148,6 +233,10 @@ class DatabaseManager:
             await self._engine.dispose()
             self._engine = None
         self._session_factory = None
+        if self._batch_engine is not None:
+            await self._batch_engine.dispose()
+            self._batch_engine = None
+        self._batch_session_factory = None
 
     async def create_tables(self) -> None:
         """Create database tables."""
@@ -71,6 +71,10 @@ class Settings(BaseSettings):
     cache_dir: Path = Field(default=Path("./cache"))
     logs_dir: Path = Field(default=Path("./logs"))
     cdx_cache_ttl_hours: int = Field(default=24, description="CDX cache TTL in hours")
+    takeout_snapshot_cache: bool = Field(
+        default=True,
+        description="Reuse parsed Takeout snapshots while the export is unchanged",
+    )
 
     # NLP
     nlp_model: str = Field(default="en_core_web_sm")
@@ -93,6 +97,56 @@ class Settings(BaseSettings):
     request_timeout: int = Field(default=30)
     retry_attempts: int = Field(default=3)
     retry_backoff: int = Field(default=2)
+    segment_timeline_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=0,
+        description="Memory budget for cached transcript timelines (0 disables)",
+    )
+    segment_timeline_cache_ttl_seconds: int = Field(
+        default=300,
+        ge=0,
+        description="Max age of a cached transcript timeline, in seconds",
+    )
+    api_compression: bool = Field(
+        default=True,
+        description="Compress large API responses with brotli or gzip",
+    )
+    api_compression_min_bytes: int = Field(
+        default=1024,
+        ge=0,
+        description="Smallest response body worth compressing, in bytes",
+    )
+    api_fast_json: bool = Field(
+        default=False,
+        description="Serve hot list endpoints as pre-shaped rows, skipping model validation",
+    )
+    aggregate_cache_ttl_seconds: int = Field(
+        default=300,
+        ge=0,
+        description="Max age of cached overview/sidebar aggregates (0 disables)",
+    )
+    aggregate_cache_stale_while_revalidate: bool = Field(
+        default=True,
+        description="Serve an expired aggregate while recomputing it in the background",
+    )
+    enrichment_set_based_writes: bool = Field(
+        default=True,
+        description="Write each enrichment page with set-based statements (PostgreSQL)",
+    )
+    knowledge_base_cache_ttl_hours: int = Field(
+        default=168,
+        ge=0,
+        description="Max age of cached Wikidata/DBpedia responses (0 disables the cache)",
+    )
+    knowledge_base_search_cache_ttl_hours: int = Field(
+        default=24,
+        ge=0,
+        description="Max age of cached Wikidata search results",
+    )
+    transcript_compact_storage: bool = Field(
+        default=False,
+        description="Store new transcripts compactly (text derived from segments)",
+    )
 
     # Development
     pytest_timeout: int = Field(default=30)
@@ -104,8 +158,28 @@ class Settings(BaseSettings):
     db_create_all: bool = Field(default=False)  # Use create_all() instead of migrations
     db_reset_on_start: bool = Field(default=False)  # Reset schema on startup
     db_log_queries: bool = Field(default=False)  # Log all SQL queries
+    api_instrumentation: bool = Field(
+        default=False,
+        description="Attribute SQL statements, rows and DB time to API requests",
+    )
+    api_n_plus_one_threshold: int = Field(
+        default=10,
+        ge=1,
+        description="Flag statements repeated more than this many times per request",
+    )
     db_validate_schema: bool = Field(default=True)  # Validate schema matches models
 
+    # Connection pools. The interactive pool serves API requests and CLI
+    # commands; unset fields fall back to the environment defaults in
+    # DatabaseManager. Background jobs (onboarding, entity scans) draw from a
+    # separate, smaller batch pool so a long scan cannot starve API reads.
+    db_pool_size: int | None = Field(default=None, ge=1)
+    db_max_overflow: int | None = Field(default=None, ge=0)
+    db_pool_timeout: float | None = Field(default=None, gt=0)
+    db_batch_pool_size: int = Field(default=3, ge=1)
+    db_batch_max_overflow: int = Field(default=2, ge=0)
+    db_batch_pool_timeout: float = Field(default=60.0, gt=0)
+
     @field_validator("oauth_scopes", mode="before")
     @classmethod
     def parse_oauth_scopes(cls, v: str | list[str]) -> list[str]:
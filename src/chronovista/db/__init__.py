@@ -7,6 +7,24 @@ management for local PostgreSQL/MySQL storage.
 
 from __future__ import annotations
 
+# And for the aggregate cache: every process that writes (CLI included) must
+# bump its generation so the API stops serving stale overview/sidebar figures.
+from chronovista.db import aggregate_cache as _aggregate_cache  # noqa: F401
+
+# Likewise for the materialised entity-video associations read by the entity
+# filters, counts and rankings.
+from chronovista.db import entity_associations as _entity_associations  # noqa: F401
+
+# Likewise for the segment change log that incremental entity scans drain.
+from chronovista.db import segment_changes as _segment_changes  # noqa: F401
+
+# Imported for its side effect: registers the ORM hook that keeps
+# transcript_segment_seams current on every segment write.
+from chronovista.db import segment_seams as _segment_seams  # noqa: F401
+
+# Likewise for the watch-history rollups kept current from user_videos writes.
+from chronovista.db import watch_rollups as _watch_rollups  # noqa: F401
+
 __all__: list[str] = ["get_db_status"]
 
 
@@ -0,0 +1,390 @@
+"""
+Two-level cache of library-wide aggregate responses.
+
+The overview dashboard and the sidebar category counts aggregate the whole
+library on every page load, yet their inputs — videos, categories, playlists,
+memberships and watch history — only change during a seed, sync, enrichment
+or curation run.  This module serves those responses from memory and
+recomputes them only after such a write.
+
+Levels
+------
+1. **Memory** — one entry per aggregate key in the API process, holding the
+   JSON payload and its ``ETag``.
+2. **Disk** — the same entry as a JSON file under
+   ``<CACHE_DIR>/aggregates/``, so a restarted API (or a second worker) starts
+   warm instead of recomputing.
+
+Both levels are tagged with the current *generation*, the nanosecond
+timestamp written to ``<CACHE_DIR>/aggregates/generation`` by the last
+invalidation.  The token is the file's contents rather than its modification
+time, whose granularity on some filesystems would let two quick
+invalidations share a generation.  An entry from another generation is
+never served.
+
+Invalidation
+------------
+Every session flush or DML statement that writes one of
+:data:`AGGREGATE_SOURCE_TABLES` marks the session; when it commits, the
+generation file is rewritten.  Because the marker is a file, a write made by
+the CLI (``seed``, ``sync``, ``enrich``, entity curation) invalidates the
+running API's entries too, at the cost of one small file read per lookup.  Writes
+made outside SQLAlchemy (``psql``) are picked up once an entry's TTL expires;
+with stale-while-revalidate enabled the expired entry is still served while a
+background task recomputes it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+
+from chronovista.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Tables the cached aggregates are computed from.
+AGGREGATE_SOURCE_TABLES = frozenset(
+    {
+        "videos",
+        "video_categories",
+        "user_videos",
+        "playlists",
+        "playlist_memberships",
+    }
+)
+
+# ``Session.info`` key set when the session wrote a source table.
+_PENDING_INFO_KEY = "aggregate_cache_invalidate"
+
+_GENERATION_FILE = "generation"
+
+Compute = Callable[[AsyncSession], Awaitable[Any]]
+SessionScope = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+@dataclass(frozen=True, slots=True)
+class CachedAggregate:
+    """One cached aggregate response.
+
+    ``payload`` is the JSON-ready response body; ``etag`` is a strong
+    validator derived from it.  ``computed_at`` is wall-clock time so it stays
+    meaningful across processes and restarts.
+    """
+
+    payload: Any
+    etag: str
+    generation: str
+    computed_at: float
+
+
+class AggregateCacheStats(BaseModel):
+    """Counters for :class:`AggregateCache`."""
+
+    entries: int = Field(default=0, description="Aggregates held in memory")
+    hits: int = Field(default=0, description="Lookups served from memory")
+    disk_hits: int = Field(default=0, description="Lookups served from disk")
+    stale_hits: int = Field(
+        default=0, description="Expired entries served while revalidating"
+    )
+    misses: int = Field(default=0, description="Lookups computed from Postgres")
+    refreshes: int = Field(default=0, description="Background recomputations")
+    invalidations: int = Field(default=0, description="Generation bumps")
+
+
+def compute_etag(payload: Any) -> str:
+    """Return a strong ``ETag`` for a JSON-ready payload.
+
+    Parameters
+    ----------
+    payload : Any
+        The response body before encoding.
+
+    Returns
+    -------
+    str
+        A quoted hash of the canonical JSON encoding.
+    """
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    return f'"{hashlib.sha256(encoded).hexdigest()[:32]}"'
+
+
+class AggregateCache:
+    """Memory-and-disk cache of aggregate responses, keyed by name.
+
+    Parameters
+    ----------
+    directory : Path or None
+        Where the disk level and the generation file live.  ``None`` keeps the
+        cache in memory only, and invalidation is then process-local.
+    ttl_seconds : float
+        Maximum age of an entry before it is recomputed.  ``0`` disables
+        caching: every lookup computes.
+    stale_while_revalidate : bool
+        Serve an expired entry once while recomputing it in the background,
+        rather than making the request wait.
+    """
+
+    def __init__(
+        self,
+        directory: Path | None,
+        ttl_seconds: float,
+        stale_while_revalidate: bool,
+    ) -> None:
+        self._directory = directory
+        self._ttl_seconds = ttl_seconds
+        self._stale_while_revalidate = stale_while_revalidate
+        self._entries: dict[str, CachedAggregate] = {}
+        # Only used without a directory, where the generation is in-process.
+        self._local_generation = 0
+        self._refreshing: dict[str, asyncio.Task[None]] = {}
+        self._stats = AggregateCacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether lookups are cached at all."""
+        return self._ttl_seconds > 0
+
+    def stats(self) -> AggregateCacheStats:
+        """Return current statistics."""
+        return self._stats.model_copy(update={"entries": len(self._entries)})
+
+    def generation(self) -> str:
+        """The current generation token (changes on every invalidation)."""
+        if self._directory is None:
+            return str(self._local_generation)
+        try:
+            token = (self._directory / _GENERATION_FILE).read_text(encoding="utf-8")
+        except OSError:
+            return "0"
+        # invalidate() replaces the file atomically, so it is never partial.
+        return token.strip() or "0"
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Compute,
+        session: AsyncSession,
+        refresh_session: SessionScope | None = None,
+    ) -> CachedAggregate:
+        """Return the aggregate for *key*, computing it on a miss.
+
+        Parameters
+        ----------
+        key : str
+            Aggregate name, including any parameters that change the result.
+        compute : Callable[[AsyncSession], Awaitable[Any]]
+            Produces the JSON-ready payload.
+        session : AsyncSession
+            Used only when the payload must be computed in the request.
+        refresh_session : Callable, optional
+            Opens a fresh session scope for background revalidation.  Without
+            it an expired entry is recomputed in the request.
+
+        Returns
+        -------
+        CachedAggregate
+            The payload with its ``ETag``.
+        """
+        if not self.enabled:
+            self._stats.misses += 1
+            return self._build(await compute(session), self.generation())
+
+        generation = self.generation()
+        entry = self._entries.get(key)
+        if entry is None or entry.generation != generation:
+            entry = self._read_disk(key, generation)
+            if entry is not None:
+                self._entries[key] = entry
+                self._stats.disk_hits += 1
+                if not self._expired(entry):
+                    return entry
+        elif not self._expired(entry):
+            self._stats.hits += 1
+            return entry
+
+        if (
+            entry is not None
+            and self._stale_while_revalidate
+            and refresh_session is not None
+        ):
+            self._stats.stale_hits += 1
+            self._schedule_refresh(key, compute, refresh_session)
+            return entry
+
+        self._stats.misses += 1
+        payload = await compute(session)
+        return self._store(key, payload, generation)
+
+    def invalidate(self) -> None:
+        """Start a new generation: every cached aggregate is recomputed.
+
+        Visible to other processes sharing the cache directory.
+        """
+        self._entries.clear()
+        self._local_generation += 1
+        self._stats.invalidations += 1
+        if self._directory is None:
+            return
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            marker = self._directory / _GENERATION_FILE
+            tmp = marker.with_suffix(".tmp")
+            tmp.write_text(str(time.time_ns()), encoding="utf-8")
+            os.replace(tmp, marker)
+        except OSError as exc:
+            # Entries in other processes then live until their TTL expires.
+            logger.warning("Could not bump aggregate cache generation: %s", exc)
+
+    def invalidate_on_commit(self, session: Session | AsyncSession) -> None:
+        """Invalidate once *session* commits (and not if it rolls back)."""
+        sync_session = (
+            session.sync_session if isinstance(session, AsyncSession) else session
+        )
+        sync_session.info[_PENDING_INFO_KEY] = True
+
+    def clear(self) -> None:
+        """Drop every in-memory entry (statistics and disk are kept)."""
+        self._entries.clear()
+
+    def _expired(self, entry: CachedAggregate) -> bool:
+        return time.time() - entry.computed_at >= self._ttl_seconds
+
+    def _build(self, payload: Any, generation: str) -> CachedAggregate:
+        return CachedAggregate(
+            payload=payload,
+            etag=compute_etag(payload),
+            generation=generation,
+            computed_at=time.time(),
+        )
+
+    def _store(self, key: str, payload: Any, generation: str) -> CachedAggregate:
+        entry = self._build(payload, generation)
+        # A write committed while computing started a newer generation; the
+        # result may predate it, so serve it once but do not keep it.
+        if self.generation() != generation:
+            return entry
+        self._entries[key] = entry
+        self._write_disk(key, entry)
+        return entry
+
+    def _schedule_refresh(
+        self, key: str, compute: Compute, refresh_session: SessionScope
+    ) -> None:
+        running = self._refreshing.get(key)
+        if running is not None and not running.done():
+            return
+
+        async def refresh() -> None:
+            generation = self.generation()
+            try:
+                async with refresh_session() as session:
+                    payload = await compute(session)
+                self._store(key, payload, generation)
+                self._stats.refreshes += 1
+            except Exception:
+                # The stale entry stays; the next lookup tries again.
+                logger.exception("Background refresh of aggregate %r failed", key)
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.get_running_loop().create_task(refresh())
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self._directory is None:
+            return None
+        safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in key)
+        return self._directory / f"{safe}.json"
+
+    def _read_disk(self, key: str, generation: str) -> CachedAggregate | None:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if raw.get("generation") != generation:
+            return None
+        return CachedAggregate(
+            payload=raw["payload"],
+            etag=raw["etag"],
+            generation=generation,
+            computed_at=float(raw["computed_at"]),
+        )
+
+    def _write_disk(self, key: str, entry: CachedAggregate) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        document = {
+            "generation": entry.generation,
+            "etag": entry.etag,
+            "computed_at": entry.computed_at,
+            "payload": entry.payload,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(document), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.debug("Could not persist aggregate %r: %s", key, exc)
+
+
+aggregate_cache = AggregateCache(
+    directory=settings.cache_dir / "aggregates",
+    ttl_seconds=settings.aggregate_cache_ttl_seconds,
+    stale_while_revalidate=settings.aggregate_cache_stale_while_revalidate,
+)
+
+
+def _writes_source_table(table: Any) -> bool:
+    return getattr(table, "name", None) in AGGREGATE_SOURCE_TABLES
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed_writes(session: Session, flush_context: UOWTransaction) -> None:
+    """Mark the session when the flush wrote an aggregate source table."""
+    if _PENDING_INFO_KEY in session.info:
+        return
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if _writes_source_table(getattr(obj, "__table__", None)):
+            session.info[_PENDING_INFO_KEY] = True
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_writes(state: ORMExecuteState) -> None:
+    """Mark the session for bulk ``insert``/``update``/``delete`` statements."""
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    if _writes_source_table(getattr(state.statement, "table", None)):
+        state.session.info[_PENDING_INFO_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    """Start a new generation once a marked session commits."""
+    if session.info.pop(_PENDING_INFO_KEY, None):
+        aggregate_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_on_rollback(session: Session) -> None:
+    """Forget the mark; nothing was written."""
+    session.info.pop(_PENDING_INFO_KEY, None)
@@ -0,0 +1,111 @@
+"""
+Commit-time refresh queues for derived tables.
+
+Derived tables (the watch-history rollups, the materialised entity-video
+associations) are kept current by queueing the keys a transaction touches in
+``session.info`` and recomputing them once, inside the committing transaction.
+This module owns that lifecycle so each table only supplies its queue and its
+refresh:
+
+- :meth:`CommitRefreshQueue.pending` returns the transaction's queue, creating
+  it on first use.
+- The ``before_commit`` hook flushes, then pops every registered queue and
+  runs its refresh on PostgreSQL (other dialects, used by unit tests, only
+  observe the queue).
+- The ``after_transaction_end`` hook drops every queue when the outermost
+  transaction ends without committing, so a rollback forgets its work.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+PendingT = TypeVar("PendingT")
+
+
+@dataclass(frozen=True)
+class CommitRefreshQueue(Generic[PendingT]):
+    """A per-transaction queue refreshed in ``before_commit``.
+
+    Create instances with :func:`register_commit_refresh`.
+
+    Attributes
+    ----------
+    info_key : str
+        ``session.info`` key holding the transaction's queue.
+    factory : Callable[[], PendingT]
+        Builds an empty queue; an empty queue must be falsy.
+    refresh : Callable[[Session, PendingT], None]
+        Recomputes the queued keys on the committing session.
+    """
+
+    info_key: str
+    factory: Callable[[], PendingT]
+    refresh: Callable[[Session, PendingT], None]
+
+    def pending(self, session: Session | AsyncSession) -> PendingT:
+        """Return the current transaction's queue, creating it if needed."""
+        # AsyncSession.info is its sync session's info, where the hooks look.
+        pending: PendingT = session.info.setdefault(self.info_key, self.factory())
+        return pending
+
+
+# Refreshed in registration order, which is the import order of chronovista.db.
+_QUEUES: list[CommitRefreshQueue[Any]] = []
+
+
+def register_commit_refresh(
+    info_key: str,
+    factory: Callable[[], PendingT],
+    refresh: Callable[[Session, PendingT], None],
+) -> CommitRefreshQueue[PendingT]:
+    """Register a derived table's refresh queue with the commit hooks.
+
+    Parameters
+    ----------
+    info_key : str
+        ``session.info`` key for the queue; unique per table.
+    factory : Callable[[], PendingT]
+        Builds an empty (falsy) queue.
+    refresh : Callable[[Session, PendingT], None]
+        Recomputes a non-empty queue inside the committing transaction.
+
+    Returns
+    -------
+    CommitRefreshQueue[PendingT]
+        The registered queue.
+    """
+    queue = CommitRefreshQueue(info_key=info_key, factory=factory, refresh=refresh)
+    _QUEUES.append(queue)
+    return queue
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_before_commit(session: Session) -> None:
+    """Refresh every queued table inside the committing transaction."""
+    # before_commit runs ahead of commit's own flush; flush now so rows still
+    # pending are queued (and visible to the refresh).
+    session.flush()
+    for queue in _QUEUES:
+        pending = session.info.pop(queue.info_key, None)
+        if not pending:
+            continue
+        if session.connection().dialect.name != "postgresql":
+            continue
+        queue.refresh(session, pending)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_after_transaction_end(
+    session: Session, transaction: SessionTransaction
+) -> None:
+    """Drop the queues when the outermost transaction ends without committing."""
+    if transaction.parent is None:
+        for queue in _QUEUES:
+            session.info.pop(queue.info_key, None)
@@ -0,0 +1,234 @@
+"""
+Maintenance of the materialised entity-video associations.
+
+``entity_video_associations`` holds one row per ``(entity, video)`` pair that
+the Feature 066 definition calls associated: a mention whose text is one of
+the entity's visible names (canonical name or non-ASR alias, #89) or a manual
+mention, a canonical-tag link, or an alias-matched tag. ``evidence`` is a
+bitmask of the sources (:data:`EVIDENCE_BITS`), ``mention_count`` the number
+of qualifying mentions and ``transcript_mention_count`` those of them inside
+the ``TRANSCRIPT`` evidence scope. The video entity filter, the association
+counts and the channel entity rankings read it with indexed lookups instead of
+rebuilding the union of association arms on every request.
+
+Rows are derived data and are refreshed, never incremented: a refresh deletes
+and recomputes every pair of the queued entities and videos
+(``EntityMentionRepository.materialize_associations``), so it is idempotent
+and cannot drift. Two paths queue work:
+
+- The ``after_flush`` hook below records the keys touched by ORM writes to
+  mentions (manual associations), entity names and aliases, canonical-tag
+  links, tag aliases and video tags, and the videos whose availability
+  changed.
+- Core writers that bypass the ORM (mention scans and batch corrections,
+  transcript segment replacement, tag merges and splits, bulk tag writes)
+  call :func:`queue_association_refresh`.
+
+Each refresh also recounts the entity pairs in ``entity_cooccurrences`` that
+share a video whose associations changed
+(``EntityMentionRepository.materialize_cooccurrences``); a change of a video's
+availability recounts every pair on it, since co-occurrence counts only
+available videos.
+
+Queued keys are refreshed once, in ``before_commit``
+(:mod:`chronovista.db.commit_refresh`), so a scan committing every batch
+refreshes that batch's videos. A rolled-back transaction drops its
+queue. ``chronovista entities rebuild-associations`` recomputes the whole
+table, and ``rebuild-cooccurrences`` the pairs; they are also the repair path
+for changes the hooks cannot see, such as tag aliases removed by a canonical
+tag's cascading delete.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import String, Uuid, any_, bindparam, event, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, UOWTransaction
+from sqlalchemy.orm.attributes import get_history
+
+from chronovista.db.commit_refresh import register_commit_refresh
+from chronovista.db.models import (
+    CanonicalTag,
+    EntityAlias,
+    EntityMention,
+    NamedEntity,
+    TagAlias,
+    Video,
+    VideoTag,
+)
+
+# Bit per association source in ``entity_video_associations.evidence``, keyed
+# by the provenance labels the association counts report.
+EVIDENCE_BITS: dict[str, int] = {
+    "manual": 1,
+    "transcript": 2,
+    "title": 4,
+    "description": 8,
+    "tag": 16,
+}
+
+# session.info key holding the _PendingRefresh of the current transaction.
+_PENDING_KEY = "chronovista_entity_associations_pending"
+
+# Per association source written through the ORM: the attributes whose change
+# can move a row in or out of an association, the attribute holding the key to
+# refresh, and the kind of key it is (a _PendingRefresh field).
+_ORM_SOURCES: tuple[tuple[type[Any], tuple[str, ...], str, str], ...] = (
+    (
+        EntityMention,
+        ("entity_id", "video_id", "mention_text", "mention_source", "detection_method"),
+        "video_id",
+        "video_ids",
+    ),
+    (VideoTag, ("video_id", "tag"), "video_id", "video_ids"),
+    (EntityAlias, ("entity_id", "alias_name", "alias_type"), "entity_id", "entity_ids"),
+    (CanonicalTag, ("entity_id",), "entity_id", "entity_ids"),
+    (NamedEntity, ("canonical_name",), "id", "entity_ids"),
+    (TagAlias, ("raw_form", "normalized_form", "canonical_tag_id"), "raw_form", "tags"),
+    (Video, ("availability_status",), "video_id", "availability_video_ids"),
+)
+
+
+@dataclass
+class _PendingRefresh:
+    """Keys whose associations must be recomputed before commit."""
+
+    everything: bool = False
+    entity_ids: set[uuid.UUID] = field(default_factory=set)
+    video_ids: set[str] = field(default_factory=set)
+    tags: set[str] = field(default_factory=set)
+    tag_alias_ids: set[uuid.UUID] = field(default_factory=set)
+    availability_video_ids: set[str] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.everything
+            or self.entity_ids
+            or self.video_ids
+            or self.tags
+            or self.tag_alias_ids
+            or self.availability_video_ids
+        )
+
+
+def queue_association_refresh(
+    session: Session | AsyncSession,
+    *,
+    entity_ids: Iterable[uuid.UUID] = (),
+    video_ids: Iterable[str] = (),
+    tags: Iterable[str] = (),
+    tag_alias_ids: Iterable[uuid.UUID] = (),
+    availability_video_ids: Iterable[str] = (),
+    everything: bool = False,
+) -> None:
+    """Recompute associations touched by a Core write when the transaction commits.
+
+    For writes that bypass the ORM hooks. Call it in the same transaction as
+    the write.
+
+    Parameters
+    ----------
+    session : Session or AsyncSession
+        The session the write ran in.
+    entity_ids : Iterable[uuid.UUID]
+        Entities whose every association must be recomputed.
+    video_ids : Iterable[str]
+        Videos whose every association must be recomputed.
+    tags : Iterable[str]
+        Raw tag strings; the videos carrying them are recomputed. The tags
+        must still be on those videos at commit time.
+    tag_alias_ids : Iterable[uuid.UUID]
+        Tag aliases; the videos carrying their raw form are recomputed.
+    availability_video_ids : Iterable[str]
+        Videos that became available or unavailable; the co-occurrences of
+        their entities are recounted.
+    everything : bool
+        Recompute the whole table.
+    """
+    pending = _QUEUE.pending(session)
+    pending.everything = pending.everything or everything
+    pending.entity_ids.update(entity_ids)
+    pending.video_ids.update(video_ids)
+    pending.tags.update(tags)
+    pending.tag_alias_ids.update(tag_alias_ids)
+    pending.availability_video_ids.update(availability_video_ids)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_after_flush(session: Session, flush_context: UOWTransaction) -> None:
+    """Queue the keys touched by association sources written in this flush."""
+    touched: list[tuple[Any, str, str]] = []
+    for obj in [*session.new, *session.deleted, *session.dirty]:
+        for model, attrs, key_attr, kind in _ORM_SOURCES:
+            if not isinstance(obj, model):
+                continue
+            if obj in session.dirty and not any(
+                get_history(obj, attr).has_changes() for attr in attrs
+            ):
+                continue
+            touched.append((obj, key_attr, kind))
+    if not touched:
+        return
+    pending = _QUEUE.pending(session)
+    for obj, key_attr, kind in touched:
+        keys: set[Any] = getattr(pending, kind)
+        keys.add(getattr(obj, key_attr))
+        keys.update(get_history(obj, key_attr).deleted)
+        keys.discard(None)
+
+
+def _tagged_video_ids(
+    session: Session, tags: set[str], tag_alias_ids: set[uuid.UUID]
+) -> set[str]:
+    """Videos carrying any of *tags* or the raw form of any of *tag_alias_ids*."""
+    alias_forms = select(TagAlias.raw_form).where(
+        TagAlias.id == any_(bindparam("tag_alias_ids", type_=ARRAY(Uuid)))
+    )
+    stmt = (
+        select(VideoTag.video_id)
+        .where(
+            or_(
+                VideoTag.tag == any_(bindparam("tags", type_=ARRAY(String))),
+                VideoTag.tag.in_(alias_forms),
+            )
+        )
+        .distinct()
+    )
+    result = session.execute(
+        stmt, {"tags": sorted(tags), "tag_alias_ids": sorted(tag_alias_ids)}
+    )
+    return set(result.scalars())
+
+
+def _refresh(session: Session, pending: _PendingRefresh) -> None:
+    """Recompute the queued associations and co-occurrences."""
+    # Imported here: the repository imports chronovista.db, which imports this
+    # module.
+    from chronovista.repositories.entity_mention_repository import (
+        EntityMentionRepository,
+    )
+
+    repo = EntityMentionRepository()
+    if pending.everything:
+        repo.materialize_associations(session)
+        return
+    video_ids = set(pending.video_ids)
+    if pending.tags or pending.tag_alias_ids:
+        video_ids |= _tagged_video_ids(session, pending.tags, pending.tag_alias_ids)
+    if pending.entity_ids or video_ids:
+        repo.materialize_associations(
+            session, entity_ids=pending.entity_ids, video_ids=video_ids
+        )
+    if pending.availability_video_ids:
+        repo.materialize_cooccurrences(
+            session, video_ids=pending.availability_video_ids
+        )
+
+
+_QUEUE = register_commit_refresh(_PENDING_KEY, _PendingRefresh, _refresh)
@@ -0,0 +1,500 @@
+"""
+Opt-in query instrumentation for the async engine.
+
+When ``API_INSTRUMENTATION`` is enabled, :func:`install_query_instrumentation`
+hooks ``before_cursor_execute``/``after_cursor_execute`` on the engine and
+:class:`InstrumentedAsyncQueuePool` times every pool checkout.  Each statement
+is attributed to the :class:`RequestQueryStats` bound to the current context
+by the API middleware (``chronovista.api.middleware.instrumentation``); the
+middleware folds finished requests into the process-wide
+:data:`query_metrics` registry that backs ``/api/v1/metrics``.
+
+SQLAlchemy runs the sync event hooks inside a greenlet that shares the
+awaiting task's ``contextvars`` context, so a plain ``ContextVar`` carries the
+request's stats object into the hooks.  Statements executed outside a request
+(CLI commands, background tasks) are counted globally but attributed to no
+route.
+
+Statements are grouped by a normalized form of their SQL: bound parameters
+are already placeholders, and expanded ``IN`` lists are collapsed so the same
+query with a different number of ids is one statement.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import BaseModel, Field
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.pool.base import ConnectionPoolEntry
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+)
+"""Upper bounds (ms) of the latency histogram buckets; a final bucket is +Inf."""
+
+MAX_TRACKED_STATEMENTS = 500
+"""Distinct statements kept in the registry; later ones are pooled as ``<other>``."""
+
+_OTHER_STATEMENT = "<other>"
+_STATEMENT_KEY_LENGTH = 500
+
+_PLACEHOLDER_LIST = re.compile(
+    r"\$\d+(?:\s*::\s*[\w\[\]]+)?(?:\s*,\s*\$\d+(?:\s*::\s*[\w\[\]]+)?)*"
+)
+_WHITESPACE = re.compile(r"\s+")
+
+_START_KEY = "chronovista_query_start"
+
+
+def normalize_statement(statement: str) -> str:
+    """Group key for a SQL statement.
+
+    Collapses whitespace and replaces each run of positional placeholders
+    (``$1, $2, ...``) with ``?`` so expanding ``IN`` lists of any length share
+    one key.
+    """
+    collapsed = _WHITESPACE.sub(" ", statement).strip()
+    return _PLACEHOLDER_LIST.sub("?", collapsed)[:_STATEMENT_KEY_LENGTH]
+
+
+@dataclass
+class RequestQueryStats:
+    """Queries executed while serving one request."""
+
+    request_id: str = ""
+    route: str = ""
+    statements: int = 0
+    rows: int = 0
+    db_seconds: float = 0.0
+    pool_wait_seconds: float = 0.0
+    per_statement: Counter[str] = field(default_factory=Counter)
+
+    def repeated_statements(self, threshold: int) -> dict[str, int]:
+        """Statements executed more than *threshold* times (likely N+1)."""
+        return {
+            statement: count
+            for statement, count in self.per_statement.items()
+            if count > threshold
+        }
+
+
+current_request_stats: contextvars.ContextVar[RequestQueryStats | None] = (
+    contextvars.ContextVar("current_request_stats", default=None)
+)
+"""Stats of the request being served in this context, if any."""
+
+
+class LatencyHistogram:
+    """Cumulative-style latency histogram over :data:`LATENCY_BUCKETS_MS`."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, milliseconds: float) -> None:
+        """Record one observation."""
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, milliseconds)] += 1
+        self.total_ms += milliseconds
+        self.max_ms = max(self.max_ms, milliseconds)
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return sum(self.counts)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Upper bucket bound containing the given fraction of observations."""
+        total = self.count
+        if not total:
+            return None
+        rank = fraction * total
+        seen = 0
+        for bound, bucket_count in zip(
+            (*LATENCY_BUCKETS_MS, self.max_ms), self.counts, strict=True
+        ):
+            seen += bucket_count
+            if seen >= rank:
+                return float(bound)
+        return self.max_ms
+
+    def to_model(self) -> HistogramSnapshot:
+        """Serializable copy."""
+        count = self.count
+        return HistogramSnapshot(
+            count=count,
+            total_ms=round(self.total_ms, 3),
+            mean_ms=round(self.total_ms / count, 3) if count else None,
+            max_ms=round(self.max_ms, 3),
+            p50_ms=self.percentile(0.5),
+            p95_ms=self.percentile(0.95),
+            p99_ms=self.percentile(0.99),
+            buckets={
+                **{
+                    f"le_{int(bound)}": bucket_count
+                    for bound, bucket_count in zip(
+                        LATENCY_BUCKETS_MS, self.counts, strict=False
+                    )
+                },
+                "le_inf": self.counts[-1],
+            },
+        )
+
+
+class HistogramSnapshot(BaseModel):
+    """Latency histogram summary (percentiles are bucket upper bounds)."""
+
+    count: int = Field(..., description="Number of observations")
+    total_ms: float = Field(..., description="Sum of observations in ms")
+    mean_ms: float | None = Field(None, description="Mean in ms")
+    max_ms: float = Field(..., description="Largest observation in ms")
+    p50_ms: float | None = Field(None, description="Median bucket bound in ms")
+    p95_ms: float | None = Field(None, description="95th percentile bucket bound")
+    p99_ms: float | None = Field(None, description="99th percentile bucket bound")
+    buckets: dict[str, int] = Field(
+        default_factory=dict, description="Per-bucket (non-cumulative) counts"
+    )
+
+
+class RouteMetrics(BaseModel):
+    """Aggregated request and query figures for one route."""
+
+    route: str
+    requests: int
+    statements: int
+    rows: int
+    db_ms: float
+    latency: HistogramSnapshot
+    db_latency: HistogramSnapshot
+
+
+class StatementMetrics(BaseModel):
+    """Aggregated figures for one normalized SQL statement."""
+
+    statement: str
+    calls: int
+    rows: int
+    total_ms: float
+    max_ms: float
+
+
+class NPlusOneFlag(BaseModel):
+    """A statement repeated more than the threshold within single requests."""
+
+    route: str
+    statement: str
+    requests_flagged: int = Field(..., description="Requests that repeated it")
+    max_repeats: int = Field(..., description="Most executions in one request")
+    last_request_id: str
+
+
+class QueryMetricsSnapshot(BaseModel):
+    """Everything the instrumentation registry has collected."""
+
+    routes: list[RouteMetrics]
+    statements: list[StatementMetrics]
+    n_plus_one: list[NPlusOneFlag]
+    pool_checkout_wait: HistogramSnapshot
+    unattributed_statements: int = Field(
+        ..., description="Statements executed outside any API request"
+    )
+
+
+class PoolStatus(BaseModel):
+    """Point-in-time occupancy of one connection pool."""
+
+    name: str = Field(..., description="Pool role, e.g. 'interactive' or 'batch'")
+    size: int = Field(..., description="Configured persistent connections")
+    max_overflow: int = Field(..., description="Extra connections allowed")
+    checked_out: int = Field(..., description="Connections currently in use")
+    checked_in: int = Field(..., description="Idle connections held by the pool")
+    overflow: int = Field(
+        ..., description="Current overflow (negative while below pool size)"
+    )
+    timeout_seconds: float = Field(..., description="Checkout wait limit")
+
+
+def describe_pool(name: str, pool: Any) -> PoolStatus | None:
+    """Snapshot a queue pool's occupancy.
+
+    Returns ``None`` for pools without fixed sizing (``NullPool``,
+    ``StaticPool``), which have nothing to report.
+    """
+    if not isinstance(pool, QueuePool):
+        return None
+    return PoolStatus(
+        name=name,
+        size=pool.size(),
+        max_overflow=pool._max_overflow,
+        checked_out=pool.checkedout(),
+        checked_in=pool.checkedin(),
+        overflow=pool.overflow(),
+        timeout_seconds=float(pool.timeout()),
+    )
+
+
+@dataclass
+class _RouteAggregate:
+    requests: int = 0
+    statements: int = 0
+    rows: int = 0
+    db_seconds: float = 0.0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    db_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+@dataclass
+class _StatementAggregate:
+    calls: int = 0
+    rows: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+@dataclass
+class _NPlusOneAggregate:
+    requests_flagged: int = 0
+    max_repeats: int = 0
+    last_request_id: str = ""
+
+
+class QueryMetricsRegistry:
+    """Process-wide aggregates of instrumented requests and statements."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop everything collected so far."""
+        with self._lock:
+            self._routes: dict[str, _RouteAggregate] = {}
+            self._statements: dict[str, _StatementAggregate] = {}
+            self._n_plus_one: dict[tuple[str, str], _NPlusOneAggregate] = {}
+            self._pool_wait = LatencyHistogram()
+            self._unattributed = 0
+
+    def record_statement(
+        self, statement: str, seconds: float, rows: int, attributed: bool
+    ) -> None:
+        """Fold one executed statement into the per-statement aggregates."""
+        with self._lock:
+            aggregate = self._statements.get(statement)
+            if aggregate is None:
+                if len(self._statements) >= MAX_TRACKED_STATEMENTS:
+                    statement = _OTHER_STATEMENT
+                aggregate = self._statements.setdefault(
+                    statement, _StatementAggregate()
+                )
+            aggregate.calls += 1
+            aggregate.rows += rows
+            aggregate.total_seconds += seconds
+            aggregate.max_seconds = max(aggregate.max_seconds, seconds)
+            if not attributed:
+                self._unattributed += 1
+
+    def record_pool_wait(self, seconds: float) -> None:
+        """Record how long one pool checkout waited."""
+        with self._lock:
+            self._pool_wait.observe(seconds * 1000)
+
+    def record_request(
+        self,
+        stats: RequestQueryStats,
+        elapsed_seconds: float,
+        n_plus_one_threshold: int,
+    ) -> dict[str, int]:
+        """Fold a finished request into the route aggregates.
+
+        Returns
+        -------
+        dict[str, int]
+            Statements the request repeated more than *n_plus_one_threshold*
+            times, with their counts.
+        """
+        repeated = stats.repeated_statements(n_plus_one_threshold)
+        with self._lock:
+            route = self._routes.setdefault(stats.route, _RouteAggregate())
+            route.requests += 1
+            route.statements += stats.statements
+            route.rows += stats.rows
+            route.db_seconds += stats.db_seconds
+            route.latency.observe(elapsed_seconds * 1000)
+            route.db_latency.observe(stats.db_seconds * 1000)
+            for statement, count in repeated.items():
+                flag = self._n_plus_one.setdefault(
+                    (stats.route, statement), _NPlusOneAggregate()
+                )
+                flag.requests_flagged += 1
+                flag.max_repeats = max(flag.max_repeats, count)
+                flag.last_request_id = stats.request_id
+        return repeated
+
+    def snapshot(self, top_statements: int = 50) -> QueryMetricsSnapshot:
+        """Serializable view, slowest routes and statements first."""
+        with self._lock:
+            routes = [
+                RouteMetrics(
+                    route=name,
+                    requests=agg.requests,
+                    statements=agg.statements,
+                    rows=agg.rows,
+                    db_ms=round(agg.db_seconds * 1000, 3),
+                    latency=agg.latency.to_model(),
+                    db_latency=agg.db_latency.to_model(),
+                )
+                for name, agg in self._routes.items()
+            ]
+            statements = [
+                StatementMetrics(
+                    statement=sql,
+                    calls=agg.calls,
+                    rows=agg.rows,
+                    total_ms=round(agg.total_seconds * 1000, 3),
+                    max_ms=round(agg.max_seconds * 1000, 3),
+                )
+                for sql, agg in self._statements.items()
+            ]
+            flags = [
+                NPlusOneFlag(
+                    route=route,
+                    statement=sql,
+                    requests_flagged=agg.requests_flagged,
+                    max_repeats=agg.max_repeats,
+                    last_request_id=agg.last_request_id,
+                )
+                for (route, sql), agg in self._n_plus_one.items()
+            ]
+            pool_wait = self._pool_wait.to_model()
+            unattributed = self._unattributed
+
+        routes.sort(key=lambda r: r.latency.total_ms, reverse=True)
+        statements.sort(key=lambda s: s.total_ms, reverse=True)
+        flags.sort(key=lambda f: (f.requests_flagged, f.max_repeats), reverse=True)
+        return QueryMetricsSnapshot(
+            routes=routes,
+            statements=statements[:top_statements],
+            n_plus_one=flags,
+            pool_checkout_wait=pool_wait,
+            unattributed_statements=unattributed,
+        )
+
+
+query_metrics = QueryMetricsRegistry()
+"""Process-wide registry fed by the hooks below and the API middleware."""
+
+
+def _row_count(cursor: Any) -> int:
+    """Rows affected or fetched by the statement that just ran.
+
+    DML reports ``rowcount``; for SELECTs the asyncpg adapter reports ``-1``
+    but has already buffered the result, so the buffer length is used.
+    """
+    rowcount = getattr(cursor, "rowcount", -1)
+    if isinstance(rowcount, int) and rowcount >= 0:
+        return rowcount
+    buffered = getattr(cursor, "_rows", None)
+    try:
+        return len(buffered) if buffered is not None else 0
+    except TypeError:
+        return 0
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    starts = conn.info.get(_START_KEY)
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    key = normalize_statement(statement)
+    rows = _row_count(cursor)
+
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.rows += rows
+        stats.db_seconds += elapsed
+        stats.per_statement[key] += 1
+    query_metrics.record_statement(key, elapsed, rows, attributed=stats is not None)
+
+
+def _handle_error(exception_context: Any) -> None:
+    # A failed statement never reaches after_cursor_execute; drop its start.
+    conn = exception_context.connection
+    if conn is not None:
+        starts = conn.info.get(_START_KEY)
+        if starts:
+            starts.pop()
+
+
+def install_query_instrumentation(engine: AsyncEngine | Engine) -> None:
+    """Attach the cursor-execute hooks to *engine* (idempotent)."""
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+    logger.info("Query instrumentation enabled")
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long each checkout waited.
+
+    Used by ``DatabaseManager`` only when instrumentation is enabled. The
+    wait is attributed to the current request as well as the global
+    checkout-wait histogram.
+    """
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - started
+            query_metrics.record_pool_wait(waited)
+            stats = current_request_stats.get()
+            if stats is not None:
+                stats.pool_wait_seconds += waited
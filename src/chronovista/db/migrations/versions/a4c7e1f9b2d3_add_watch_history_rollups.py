@@ -0,0 +1,113 @@
+"""add watch history rollups
+
+Watch statistics (most active day, streak, per-day counts) aggregated the raw
+``user_videos`` history on every call; the streak walked every distinct watch
+date in Python.
+
+``user_watch_daily`` and ``user_watch_hourly`` hold per-user watch counts,
+distinct channels and rewatch totals per day and per hour, so those readers
+touch O(days) rows. The application refreshes affected buckets on every
+``user_videos`` commit (``chronovista.db.watch_rollups``) and
+``chronovista history rebuild-rollups`` recomputes them; this migration
+backfills both tables in one set-based statement each.
+
+``ix_user_videos_user_watched_at`` serves the per-user, per-day range reads
+the incremental refresh issues.
+
+Revision ID: a4c7e1f9b2d3
+Revises: d8f3b6a1c9e4
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a4c7e1f9b2d3"
+down_revision = "d8f3b6a1c9e4"
+branch_labels = None
+depends_on = None
+
+# Mirrors ``chronovista.db.watch_rollups`` (kept inline: migrations must not
+# change behaviour when application code does).
+_BACKFILL_SQL = """
+    INSERT INTO {table} (
+        user_id, {column}, watch_count, distinct_channels, rewatch_count
+    )
+    SELECT uv.user_id, {bucket},
+           count(*),
+           count(DISTINCT v.channel_id),
+           COALESCE(sum(uv.rewatch_count), 0)
+    FROM user_videos uv
+    JOIN videos v ON v.video_id = uv.video_id
+    WHERE uv.watched_at IS NOT NULL
+    GROUP BY uv.user_id, {bucket}
+"""
+
+
+def upgrade() -> None:
+    """Create the rollup tables, backfill them, and index user_videos."""
+    op.create_table(
+        "user_watch_daily",
+        sa.Column("user_id", sa.String(length=50), nullable=False),
+        sa.Column("watch_date", sa.Date(), nullable=False),
+        sa.Column(
+            "watch_count",
+            sa.Integer(),
+            nullable=False,
+            comment="Videos last watched on this day",
+        ),
+        sa.Column(
+            "distinct_channels",
+            sa.Integer(),
+            nullable=False,
+            comment="Distinct channels among those videos",
+        ),
+        sa.Column(
+            "rewatch_count",
+            sa.Integer(),
+            nullable=False,
+            comment="Sum of rewatch_count of those videos",
+        ),
+        sa.PrimaryKeyConstraint("user_id", "watch_date"),
+    )
+    op.create_table(
+        "user_watch_hourly",
+        sa.Column("user_id", sa.String(length=50), nullable=False),
+        sa.Column("watch_hour", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("watch_count", sa.Integer(), nullable=False),
+        sa.Column("distinct_channels", sa.Integer(), nullable=False),
+        sa.Column("rewatch_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "watch_hour"),
+    )
+
+    op.execute(
+        _BACKFILL_SQL.format(
+            table="user_watch_daily",
+            column="watch_date",
+            bucket="date(uv.watched_at)",
+        )
+    )
+    op.execute(
+        _BACKFILL_SQL.format(
+            table="user_watch_hourly",
+            column="watch_hour",
+            bucket="date_trunc('hour', uv.watched_at)",
+        )
+    )
+
+    op.create_index(
+        "ix_user_videos_user_watched_at",
+        "user_videos",
+        ["user_id", "watched_at"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the rollup tables (derived data only) and the index."""
+    op.drop_index("ix_user_videos_user_watched_at", "user_videos")
+    op.drop_table("user_watch_hourly")
+    op.drop_table("user_watch_daily")
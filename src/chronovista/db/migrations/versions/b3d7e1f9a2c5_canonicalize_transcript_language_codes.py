@@ -0,0 +1,150 @@
+"""canonicalize transcript language codes
+
+Read paths used to match transcript languages case-insensitively with
+``lower(language_code) = lower(:code)``. Wrapping the column in a function
+hides it from the planner: ``idx_transcript_segments_lookup`` and
+``idx_transcript_segments_time_range`` on ``(video_id, language_code, ...)``
+could only use ``video_id`` as an index condition and re-checked every row of
+the transcript with a ``lower()`` filter, and the search endpoint's language
+filter could not use them at all.
+
+Language codes are now canonicalized at write time
+(``canonical_language_code``: lowercase language, uppercase two-part region,
+lowercase otherwise — e.g. ``en-US``, ``es-419``, ``fil``), and read paths
+compare the column directly. This one-off data migration rewrites existing
+rows to the same spelling across every table that carries a transcript's
+``(video_id, language_code)``:
+
+* ``video_transcripts`` (primary key)
+* ``transcript_segments`` (FK, ON DELETE CASCADE)
+* ``transcript_corrections`` (FK, ON DELETE RESTRICT)
+* ``entity_mentions`` (denormalized, no FK)
+
+The two foreign keys have no ``ON UPDATE CASCADE``, so they are dropped for
+the duration of the rewrite and recreated unchanged. A transcript whose
+canonical spelling already exists for the same video (a historical duplicate
+such as ``en-us`` next to ``en-US``) is left untouched and reported; merging
+duplicates is a curation decision, not something a migration should guess.
+
+Downgrade is a no-op: the original spellings are not recorded and carry no
+information beyond case.
+
+Revision ID: b3d7e1f9a2c5
+Revises: 17815dad2977
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import logging
+
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision = "b3d7e1f9a2c5"
+down_revision = "17815dad2977"
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# SQL mirror of ``canonical_language_code`` for a column expression.
+_CANONICAL_SQL = """
+    CASE
+        WHEN array_length(string_to_array({col}, '-'), 1) = 2
+        THEN lower(split_part({col}, '-', 1)) || '-' || upper(split_part({col}, '-', 2))
+        ELSE lower({col})
+    END
+"""
+
+
+def upgrade() -> None:
+    """Rewrite transcript language codes to their canonical spelling."""
+    canonical = _CANONICAL_SQL.format(col="t.language_code")
+    bind = op.get_bind()
+
+    bind.execute(text(f"""
+            CREATE TEMP TABLE _language_code_canon ON COMMIT DROP AS
+            SELECT DISTINCT ON (t.video_id, {canonical})
+                t.video_id,
+                t.language_code AS old_code,
+                {canonical} AS new_code
+            FROM video_transcripts t
+            WHERE t.language_code <> {canonical}
+              AND NOT EXISTS (
+                  SELECT 1 FROM video_transcripts c
+                  WHERE c.video_id = t.video_id
+                    AND c.language_code = {canonical}
+              )
+            ORDER BY t.video_id, {canonical}, t.language_code
+        """))
+
+    skipped = bind.execute(text(f"""
+            SELECT count(*) FROM video_transcripts t
+            WHERE t.language_code <> {canonical}
+              AND NOT EXISTS (
+                  SELECT 1 FROM _language_code_canon m
+                  WHERE m.video_id = t.video_id AND m.old_code = t.language_code
+              )
+        """)).scalar_one()
+    if skipped:
+        logger.warning(
+            "Left %d transcript(s) with non-canonical language codes: the "
+            "canonical spelling already exists for the same video",
+            skipped,
+        )
+
+    rewritten = bind.execute(
+        text("SELECT count(*) FROM _language_code_canon")
+    ).scalar_one()
+    logger.info("Canonicalizing language codes on %d transcript(s)", rewritten)
+    if not rewritten:
+        return
+
+    op.drop_constraint(
+        "fk_transcript_segments_video_transcript",
+        "transcript_segments",
+        type_="foreignkey",
+    )
+    op.drop_constraint(
+        "fk_transcript_corrections_transcript",
+        "transcript_corrections",
+        type_="foreignkey",
+    )
+
+    for table in (
+        "video_transcripts",
+        "transcript_segments",
+        "transcript_corrections",
+        "entity_mentions",
+    ):
+        bind.execute(text(f"""
+                UPDATE {table} AS x
+                SET language_code = m.new_code
+                FROM _language_code_canon m
+                WHERE x.video_id = m.video_id
+                  AND x.language_code = m.old_code
+            """))
+
+    op.create_foreign_key(
+        "fk_transcript_segments_video_transcript",
+        "transcript_segments",
+        "video_transcripts",
+        ["video_id", "language_code"],
+        ["video_id", "language_code"],
+        ondelete="CASCADE",
+    )
+    op.create_foreign_key(
+        "fk_transcript_corrections_transcript",
+        "transcript_corrections",
+        "video_transcripts",
+        ["video_id", "language_code"],
+        ["video_id", "language_code"],
+        ondelete="RESTRICT",
+    )
+
+
+def downgrade() -> None:
+    """No-op: original code casing is not recoverable and carries no meaning."""
@@ -0,0 +1,53 @@
+"""add transcript segment change log
+
+Entity mention scans could only be incremental per (segment, entity) pair or
+a full rescan, and both walked every transcript segment. After correcting a
+few hundred segments or ingesting a few transcripts, picking up mentions in
+the changed text meant rescanning the whole corpus.
+
+``transcript_segment_changes`` logs each segment inserted, text-edited or
+deleted (``chronovista.db.segment_changes``), and
+``entities scan --changed-since-last-scan`` processes and drains it. The log
+starts empty: mentions are assumed current as of the last scan before this
+migration.
+
+Revision ID: b8d2f4a6c1e3
+Revises: a4c7e1f9b2d3
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b8d2f4a6c1e3"
+down_revision = "a4c7e1f9b2d3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the change log table."""
+    op.create_table(
+        "transcript_segment_changes",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("segment_id", sa.Integer(), nullable=False),
+        sa.Column("video_id", sa.String(length=20), nullable=False),
+        sa.Column("language_code", sa.String(length=10), nullable=False),
+        sa.Column("deleted", sa.Boolean(), nullable=False),
+        sa.Column(
+            "changed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the change log."""
+    op.drop_table("transcript_segment_changes")
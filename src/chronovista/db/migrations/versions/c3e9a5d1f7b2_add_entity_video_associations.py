@@ -0,0 +1,133 @@
+"""add entity video associations
+
+The video entity filter, the entity association counts and the channel entity
+rankings each rebuilt the Feature 066 association union (visible-name and
+manual mentions, canonical-tag links, alias-matched tags) per request, the
+alias arm re-normalising every alias in Python first.
+
+``entity_video_associations`` stores that union once per ``(entity, video)``
+pair: a bitmask of the sources, the qualifying mention count and the count of
+those inside the TRANSCRIPT evidence scope. The application refreshes the
+touched entities and videos on commit (``chronovista.db.entity_associations``).
+
+This migration backfills all three arms in SQL, so the table is complete as
+soon as it exists. The application matches aliases to tags with the Python tag
+normaliser, which a migration must not import; the backfill instead joins each
+alias's stored ``alias_name_normalized`` (that normaliser's output, written
+with the alias) to ``tag_aliases.normalized_form``. ``chronovista entities
+rebuild-associations`` recomputes the table with the normaliser itself.
+
+Revision ID: c3e9a5d1f7b2
+Revises: b8d2f4a6c1e3
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "c3e9a5d1f7b2"
+down_revision = "b8d2f4a6c1e3"
+branch_labels = None
+depends_on = None
+
+# Mirrors EntityMentionRepository.materialize_associations and
+# chronovista.db.entity_associations.EVIDENCE_BITS (kept inline: migrations
+# must not change behaviour when application code does).
+_BACKFILL_SQL = """
+    WITH visible_names AS (
+        SELECT id AS entity_id, lower(unaccent(canonical_name)) AS name_lower
+        FROM named_entities
+        UNION
+        SELECT entity_id, lower(unaccent(alias_name))
+        FROM entity_aliases
+        WHERE alias_type != 'asr_error'
+    ),
+    arms AS (
+        SELECT m.entity_id, m.video_id,
+               CASE WHEN m.detection_method = 'manual' THEN 1
+                    ELSE CASE m.mention_source
+                        WHEN 'manual' THEN 1
+                        WHEN 'transcript' THEN 2
+                        WHEN 'title' THEN 4
+                        WHEN 'description' THEN 8
+                        ELSE 0
+                    END
+               END AS evidence,
+               1 AS mentions,
+               CASE WHEN m.mention_source IN ('transcript', 'manual')
+                    THEN 1 ELSE 0 END AS transcript_mentions
+        FROM entity_mentions m
+        LEFT JOIN visible_names vn
+          ON vn.entity_id = m.entity_id
+         AND vn.name_lower = lower(unaccent(m.mention_text))
+        WHERE vn.name_lower IS NOT NULL OR m.detection_method = 'manual'
+        UNION ALL
+        SELECT ct.entity_id, vt.video_id, 16, 0, 0
+        FROM canonical_tags ct
+        JOIN tag_aliases ta ON ta.canonical_tag_id = ct.id
+        JOIN video_tags vt ON vt.tag = ta.raw_form
+        WHERE ct.entity_id IS NOT NULL
+        UNION ALL
+        SELECT ea.entity_id, vt.video_id, 16, 0, 0
+        FROM entity_aliases ea
+        JOIN tag_aliases ta ON ta.normalized_form = ea.alias_name_normalized
+        JOIN video_tags vt ON vt.tag = ta.raw_form
+        WHERE ea.alias_type != 'asr_error'
+    )
+    INSERT INTO entity_video_associations (
+        entity_id, video_id, evidence, mention_count, transcript_mention_count
+    )
+    SELECT entity_id, video_id, bit_or(evidence), sum(mentions),
+           sum(transcript_mentions)
+    FROM arms
+    GROUP BY entity_id, video_id
+"""
+
+
+def upgrade() -> None:
+    """Create entity_video_associations and backfill it."""
+    op.create_table(
+        "entity_video_associations",
+        sa.Column("entity_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("video_id", sa.String(length=20), nullable=False),
+        sa.Column(
+            "evidence",
+            sa.Integer(),
+            nullable=False,
+            comment="Bitmask of association sources (entity_associations.EVIDENCE_BITS)",
+        ),
+        sa.Column(
+            "mention_count",
+            sa.Integer(),
+            nullable=False,
+            comment="Visible-name and manual mentions",
+        ),
+        sa.Column(
+            "transcript_mention_count",
+            sa.Integer(),
+            nullable=False,
+            comment="Of those, mentions inside the TRANSCRIPT evidence scope",
+        ),
+        sa.ForeignKeyConstraint(
+            ["entity_id"], ["named_entities.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("entity_id", "video_id"),
+    )
+    op.create_index(
+        "ix_entity_video_associations_video_id",
+        "entity_video_associations",
+        ["video_id", "entity_id"],
+    )
+
+    op.execute(_BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    """Drop entity_video_associations (derived data only)."""
+    op.drop_index("ix_entity_video_associations_video_id", "entity_video_associations")
+    op.drop_table("entity_video_associations")
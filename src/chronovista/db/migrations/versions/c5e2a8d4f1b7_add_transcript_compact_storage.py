@@ -0,0 +1,134 @@
+"""add transcript compact storage
+
+Every transcript is stored three times: the segment rows in
+``transcript_segments``, the concatenated ``video_transcripts.transcript_text``,
+and the complete API response in ``video_transcripts.raw_transcript_data``
+(JSONB, which repeats every snippet's text alongside its timing).
+
+This migration adds the schema for an opt-in compact mode:
+
+* ``video_transcripts.storage_mode`` (``'full'`` | ``'compact'``, default
+  ``'full'``). A compact row keeps ``transcript_text = ''`` and
+  ``raw_transcript_data = NULL``; the text is derived from its segments on
+  read.
+* ``video_transcript_raw_archive``, a cold side table holding the raw payload
+  as zlib-compressed JSON plus the on-disk sizes released at compaction time,
+  which feed ``chronovista transcript storage-report``.
+
+No rows are compacted here. Existing transcripts stay ``'full'`` until
+``chronovista transcript compact`` is run, which works in batches and can be
+interrupted and resumed.
+
+Downgrade restores any compacted rows to full storage before dropping the
+archive, so no data is lost in either direction.
+
+Revision ID: c5e2a8d4f1b7
+Revises: b3d7e1f9a2c5
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import zlib
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c5e2a8d4f1b7"
+down_revision = "b3d7e1f9a2c5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add storage_mode and the raw payload archive table."""
+    op.add_column(
+        "video_transcripts",
+        sa.Column(
+            "storage_mode",
+            sa.String(length=10),
+            nullable=False,
+            server_default=sa.text("'full'"),
+            comment="full: text and raw data inline; compact: derived from segments",
+        ),
+    )
+    op.create_check_constraint(
+        "chk_video_transcripts_storage_mode",
+        "video_transcripts",
+        "storage_mode IN ('full', 'compact')",
+    )
+
+    op.create_table(
+        "video_transcript_raw_archive",
+        sa.Column("video_id", sa.String(length=20), nullable=False),
+        sa.Column("language_code", sa.String(length=10), nullable=False),
+        sa.Column("raw_payload", sa.LargeBinary(), nullable=True),
+        sa.Column("raw_bytes", sa.Integer(), nullable=False),
+        sa.Column("text_bytes", sa.Integer(), nullable=False),
+        sa.Column("compressed_bytes", sa.Integer(), nullable=False),
+        sa.Column(
+            "compacted_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["video_id", "language_code"],
+            ["video_transcripts.video_id", "video_transcripts.language_code"],
+            name="fk_video_transcript_raw_archive_transcript",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("video_id", "language_code"),
+    )
+
+
+def downgrade() -> None:
+    """Re-inline compacted transcripts, then drop the archive and column."""
+    bind = op.get_bind()
+
+    # zlib payloads cannot be inflated in SQL; decompress client-side.
+    rows = bind.execute(sa.text("""
+            SELECT video_id, language_code, raw_payload
+            FROM video_transcript_raw_archive
+        """)).fetchall()
+    for video_id, language_code, payload in rows:
+        if payload is None:
+            continue
+        bind.execute(
+            sa.text("""
+                UPDATE video_transcripts
+                SET raw_transcript_data = CAST(:raw AS JSONB)
+                WHERE video_id = :video_id AND language_code = :language_code
+            """),
+            {
+                "raw": zlib.decompress(payload).decode("utf-8"),
+                "video_id": video_id,
+                "language_code": language_code,
+            },
+        )
+
+    bind.execute(sa.text("""
+            UPDATE video_transcripts t
+            SET transcript_text = COALESCE((
+                    SELECT string_agg(
+                        COALESCE(
+                            CASE WHEN s.has_correction THEN s.corrected_text
+                                 ELSE s.text END,
+                            ''
+                        ),
+                        ' ' ORDER BY s.start_time, s.sequence_number
+                    )
+                    FROM transcript_segments s
+                    WHERE s.video_id = t.video_id
+                      AND s.language_code = t.language_code
+                ), '')
+            WHERE t.storage_mode = 'compact'
+        """))
+
+    op.drop_table("video_transcript_raw_archive")
+    op.drop_constraint(
+        "chk_video_transcripts_storage_mode", "video_transcripts", type_="check"
+    )
+    op.drop_column("video_transcripts", "storage_mode")
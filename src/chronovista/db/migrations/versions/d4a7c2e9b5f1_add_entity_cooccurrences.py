@@ -0,0 +1,99 @@
+"""add entity cooccurrences
+
+The appears-with panel self-joined every video of the subject entity against
+every mention on those videos per request, so its cost grew with the subject's
+popularity however few partners the panel showed.
+
+``entity_cooccurrences`` stores, for each ordered pair of entities associated
+with a common available video, the number of such videos and the number where
+both associations are inside the TRANSCRIPT evidence scope. One index per
+scope keeps each entity's partners in panel order, so the top k are an index
+range. The application recounts the pairs touched by association and video
+availability changes on commit (``chronovista.db.entity_associations``).
+
+This migration backfills the table from ``entity_video_associations``, which
+c3e9a5d1f7b2 backfilled in full.
+
+Revision ID: d4a7c2e9b5f1
+Revises: c3e9a5d1f7b2
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "d4a7c2e9b5f1"
+down_revision = "c3e9a5d1f7b2"
+branch_labels = None
+depends_on = None
+
+# Mirrors EntityMentionRepository.materialize_cooccurrences (kept inline:
+# migrations must not change behaviour when application code does).
+_BACKFILL_SQL = """
+    INSERT INTO entity_cooccurrences (
+        entity_id, partner_id, shared_video_count, transcript_shared_video_count
+    )
+    SELECT x.entity_id, y.entity_id, count(*),
+           count(*) FILTER (
+               WHERE x.transcript_mention_count > 0
+                 AND y.transcript_mention_count > 0
+           )
+    FROM entity_video_associations x
+    JOIN entity_video_associations y
+      ON y.video_id = x.video_id AND y.entity_id != x.entity_id
+    JOIN videos v ON v.video_id = x.video_id
+    WHERE v.availability_status = 'available'
+    GROUP BY x.entity_id, y.entity_id
+"""
+
+
+def upgrade() -> None:
+    """Create entity_cooccurrences and backfill it from the associations."""
+    op.create_table(
+        "entity_cooccurrences",
+        sa.Column("entity_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("partner_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "shared_video_count",
+            sa.Integer(),
+            nullable=False,
+            comment="Shared videos at evidence scope ANY",
+        ),
+        sa.Column(
+            "transcript_shared_video_count",
+            sa.Integer(),
+            nullable=False,
+            comment="Shared videos at evidence scope TRANSCRIPT",
+        ),
+        sa.ForeignKeyConstraint(
+            ["entity_id"], ["named_entities.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["partner_id"], ["named_entities.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("entity_id", "partner_id"),
+    )
+    op.create_index(
+        "ix_entity_cooccurrences_top",
+        "entity_cooccurrences",
+        ["entity_id", sa.text("shared_video_count DESC"), "partner_id"],
+    )
+    op.create_index(
+        "ix_entity_cooccurrences_top_transcript",
+        "entity_cooccurrences",
+        ["entity_id", sa.text("transcript_shared_video_count DESC"), "partner_id"],
+    )
+
+    op.execute(_BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    """Drop entity_cooccurrences (derived data only)."""
+    op.drop_index("ix_entity_cooccurrences_top_transcript", "entity_cooccurrences")
+    op.drop_index("ix_entity_cooccurrences_top", "entity_cooccurrences")
+    op.drop_table("entity_cooccurrences")
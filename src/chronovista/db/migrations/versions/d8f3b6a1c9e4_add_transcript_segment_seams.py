@@ -0,0 +1,130 @@
+"""add transcript segment seams
+
+Cross-segment discovery and batch correction matched boundary fragments with a
+self-join of ``transcript_segments`` on ``sequence_number + 1`` filtered by
+OR-ed ``ILIKE '%prefix'`` / ``ILIKE 'suffix%'`` pairs. When trigram pruning
+fails on a short fragment that is a ~20s parallel sequential scan of the
+whole table.
+
+``transcript_segment_seams`` holds one row per adjacent segment pair: the last
+five normalized words of segment N (character-reversed, so "ends with" is a
+prefix match) and the first five of segment N+1, both indexed with
+``text_pattern_ops`` for exact and left-anchored ``LIKE`` lookups. The
+application keeps rows current from segment writes
+(``chronovista.db.segment_seams``); this migration backfills existing pairs
+in one set-based statement.
+
+Revision ID: d8f3b6a1c9e4
+Revises: c5e2a8d4f1b7
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d8f3b6a1c9e4"
+down_revision = "c5e2a8d4f1b7"
+branch_labels = None
+depends_on = None
+
+# Mirrors ``chronovista.db.segment_seams`` (kept inline: migrations must not
+# change behaviour when application code does).
+_WORDS_SQL = """
+    string_to_array(
+        lower(btrim(regexp_replace(
+            COALESCE(CASE WHEN {s}.has_correction THEN {s}.corrected_text
+                          ELSE {s}.text END, ''),
+            '[ \\t\\n\\r\\f\\v]+', ' ', 'g'
+        ))),
+        ' '
+    )
+"""
+
+
+def upgrade() -> None:
+    """Create the seam table and backfill it from existing segments."""
+    op.create_table(
+        "transcript_segment_seams",
+        sa.Column("segment_n_id", sa.Integer(), nullable=False),
+        sa.Column("segment_n1_id", sa.Integer(), nullable=False),
+        sa.Column("video_id", sa.String(length=20), nullable=False),
+        sa.Column("language_code", sa.String(length=10), nullable=False),
+        sa.Column(
+            "tail_reversed",
+            sa.Text(),
+            nullable=False,
+            comment="Last words of segment N, character-reversed",
+        ),
+        sa.Column(
+            "head_text",
+            sa.Text(),
+            nullable=False,
+            comment="First words of segment N+1",
+        ),
+        sa.ForeignKeyConstraint(
+            ["segment_n_id"], ["transcript_segments.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["segment_n1_id"], ["transcript_segments.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("segment_n_id"),
+    )
+
+    op.execute(f"""
+        INSERT INTO transcript_segment_seams (
+            segment_n_id, segment_n1_id, video_id, language_code,
+            tail_reversed, head_text
+        )
+        SELECT n_id, n1_id, video_id, language_code,
+               reverse(COALESCE(array_to_string(
+                   tail_words[greatest(cardinality(tail_words) - 4, 1):],
+                   ' '), '')),
+               COALESCE(array_to_string(head_words[1:5], ' '), '')
+        FROM (
+            SELECT n.id AS n_id, n1.id AS n1_id, n.video_id, n.language_code,
+                   {_WORDS_SQL.format(s="n")} AS tail_words,
+                   {_WORDS_SQL.format(s="n1")} AS head_words
+            FROM transcript_segments n
+            JOIN transcript_segments n1
+              ON n1.video_id = n.video_id
+             AND n1.language_code = n.language_code
+             AND n1.sequence_number = n.sequence_number + 1
+        ) pairs
+        """)
+
+    # Indexes after the bulk load: one sort each instead of per-row upkeep.
+    op.create_index(
+        "idx_segment_seams_tail",
+        "transcript_segment_seams",
+        ["tail_reversed"],
+        postgresql_ops={"tail_reversed": "text_pattern_ops"},
+    )
+    op.create_index(
+        "idx_segment_seams_head",
+        "transcript_segment_seams",
+        ["head_text"],
+        postgresql_ops={"head_text": "text_pattern_ops"},
+    )
+    op.create_index(
+        "idx_segment_seams_segment_n1",
+        "transcript_segment_seams",
+        ["segment_n1_id"],
+    )
+    op.create_index(
+        "idx_segment_seams_transcript",
+        "transcript_segment_seams",
+        ["video_id", "language_code"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the seam table (derived data only)."""
+    op.drop_index("idx_segment_seams_transcript", "transcript_segment_seams")
+    op.drop_index("idx_segment_seams_segment_n1", "transcript_segment_seams")
+    op.drop_index("idx_segment_seams_head", "transcript_segment_seams")
+    op.drop_index("idx_segment_seams_tail", "transcript_segment_seams")
+    op.drop_table("transcript_segment_seams")
@@ -0,0 +1,92 @@
+"""add takeout messages
+
+``takeout peek comments`` and ``takeout peek chats`` re-read every CSV in the
+Takeout comments and live-chat folders on each run, which for a heavy
+commenter is hundreds of thousands of rows per query.
+
+``takeout_messages`` holds those rows once they have been stored with
+``--store``, so ``--stored`` peeks filter by date through an index range and by
+text through trigram indexes on the message text and the video ID (a text
+filter matches either, and an OR is only index-driven when both arms are). Nothing is backfilled: the table fills from the
+CSVs on demand.
+
+Revision ID: e5b8d3f1a6c2
+Revises: d4a7c2e9b5f1
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e5b8d3f1a6c2"
+down_revision = "d4a7c2e9b5f1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create takeout_messages and its indexes."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_table(
+        "takeout_messages",
+        sa.Column(
+            "kind",
+            sa.String(length=10),
+            nullable=False,
+            comment="'comment' or 'live_chat'",
+        ),
+        sa.Column("message_id", sa.Text(), nullable=False),
+        sa.Column("video_id", sa.Text(), nullable=False),
+        sa.Column("channel_id", sa.Text(), nullable=False),
+        sa.Column("posted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "message_text",
+            sa.Text(),
+            nullable=False,
+            comment="Text with Takeout's JSON runs flattened",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.CheckConstraint(
+            "kind IN ('comment', 'live_chat')", name="chk_takeout_messages_kind"
+        ),
+        sa.PrimaryKeyConstraint("kind", "message_id"),
+    )
+    op.create_index(
+        "ix_takeout_messages_kind_posted_at",
+        "takeout_messages",
+        ["kind", "posted_at"],
+    )
+    op.create_index(
+        "ix_takeout_messages_kind_video_id",
+        "takeout_messages",
+        ["kind", "video_id"],
+    )
+    op.execute(
+        "CREATE INDEX ix_takeout_messages_text_trgm "
+        "ON takeout_messages USING gin (message_text gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_takeout_messages_video_id_trgm "
+        "ON takeout_messages USING gin (video_id gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Drop takeout_messages (a cache of the CSVs).
+
+    The ``pg_trgm`` extension is left in place; other indexes use it.
+    """
+    op.execute("DROP INDEX IF EXISTS ix_takeout_messages_video_id_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_takeout_messages_text_trgm")
+    op.drop_index("ix_takeout_messages_kind_video_id", "takeout_messages")
+    op.drop_index("ix_takeout_messages_kind_posted_at", "takeout_messages")
+    op.drop_table("takeout_messages")
@@ -0,0 +1,43 @@
+"""add transcript_segments end_time lookup index
+
+``get_segment_at_time`` falls back, in a gap between segments, to the segment
+that ended most recently before the timestamp. That probe orders by
+``end_time``, which none of the existing ``transcript_segments`` indexes lead
+with after ``(video_id, language_code)``, so it had to sort every earlier
+segment of the transcript. ``(video_id, language_code, end_time)`` lets it
+read a single index entry instead.
+
+Plain ``CREATE INDEX`` rather than ``CONCURRENTLY``: Alembic runs migrations
+inside a transaction, which ``CONCURRENTLY`` cannot join.
+
+Revision ID: f2c6a9d4e8b3
+Revises: e5b8d3f1a6c2
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f2c6a9d4e8b3"
+down_revision = "e5b8d3f1a6c2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the ``(video_id, language_code, end_time)`` index."""
+    op.create_index(
+        "idx_transcript_segments_end_lookup",
+        "transcript_segments",
+        ["video_id", "language_code", "end_time"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the ``(video_id, language_code, end_time)`` index."""
+    op.drop_index(
+        "idx_transcript_segments_end_lookup", table_name="transcript_segments"
+    )
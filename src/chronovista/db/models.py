@@ -15,12 +15,14 @@ from sqlalchemy import (
     BigInteger,
     Boolean,
     CheckConstraint,
+    Date,
     DateTime,
     Float,
     ForeignKey,
     ForeignKeyConstraint,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
@@ -401,6 +403,17 @@ class VideoTranscript(Base):
         comment="Count of active (non-reverted) corrections",
     )
 
+    # Compact storage: segments are the source of truth, transcript_text is
+    # derived on read and raw_transcript_data lives compressed in
+    # video_transcript_raw_archive.
+    storage_mode: Mapped[str] = mapped_column(
+        String(10),
+        default="full",
+        nullable=False,
+        server_default=text("'full'"),
+        comment="full: text and raw data inline; compact: derived from segments",
+    )
+
     # Relationships
     video: Mapped[Video] = relationship("Video", back_populates="transcripts")
     segments: Mapped[list[TranscriptSegment]] = relationship(
@@ -425,6 +438,41 @@ class VideoTranscript(Base):
         Index("ix_video_transcripts_segment_count", "segment_count"),
         Index("ix_video_transcripts_source", "source"),
         Index("ix_video_transcripts_total_duration", "total_duration"),
+        CheckConstraint(
+            "storage_mode IN ('full', 'compact')",
+            name="chk_video_transcripts_storage_mode",
+        ),
+    )
+
+
+class VideoTranscriptRawArchive(Base):
+    """Cold storage for the raw API payload of a compacted transcript."""
+
+    __tablename__ = "video_transcript_raw_archive"
+
+    video_id: Mapped[str] = mapped_column(String(20), primary_key=True)
+    language_code: Mapped[str] = mapped_column(String(10), primary_key=True)
+
+    # zlib-compressed compact JSON of the former raw_transcript_data (NULL when
+    # the transcript had no raw payload).
+    raw_payload: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+
+    # On-disk sizes (pg_column_size) of the inline columns that were released,
+    # and the size of what replaced them, for the storage report.
+    raw_bytes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    text_bytes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    compressed_bytes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    compacted_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["video_id", "language_code"],
+            ["video_transcripts.video_id", "video_transcripts.language_code"],
+            ondelete="CASCADE",
+            name="fk_video_transcript_raw_archive_transcript",
+        ),
     )
 
 
@@ -487,6 +535,12 @@ class TranscriptSegment(Base):
             "language_code",
             "has_correction",
         ),
+        Index(
+            "idx_transcript_segments_end_lookup",
+            "video_id",
+            "language_code",
+            "end_time",
+        ),
         Index(
             "idx_transcript_segments_lookup", "video_id", "language_code", "start_time"
         ),
@@ -508,6 +562,75 @@ class TranscriptSegment(Base):
     )
 
 
+class TranscriptSegmentSeam(Base):
+    """Boundary between two consecutive segments, for cross-segment lookups.
+
+    One row per ``(N, N+1)`` pair holding the last few normalized words of
+    segment N (stored reversed, so "ends with" is a prefix match) and the
+    first few of segment N+1. Maintained from segment writes by
+    ``chronovista.db.segment_seams``.
+    """
+
+    __tablename__ = "transcript_segment_seams"
+
+    segment_n_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("transcript_segments.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    segment_n1_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("transcript_segments.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    video_id: Mapped[str] = mapped_column(String(20), nullable=False)
+    language_code: Mapped[str] = mapped_column(String(10), nullable=False)
+
+    # Normalized (lowercased, whitespace-collapsed) effective text.
+    tail_reversed: Mapped[str] = mapped_column(
+        Text, nullable=False, comment="Last words of segment N, character-reversed"
+    )
+    head_text: Mapped[str] = mapped_column(
+        Text, nullable=False, comment="First words of segment N+1"
+    )
+
+    __table_args__ = (
+        Index(
+            "idx_segment_seams_tail",
+            "tail_reversed",
+            postgresql_ops={"tail_reversed": "text_pattern_ops"},
+        ),
+        Index(
+            "idx_segment_seams_head",
+            "head_text",
+            postgresql_ops={"head_text": "text_pattern_ops"},
+        ),
+        Index("idx_segment_seams_segment_n1", "segment_n1_id"),
+        Index("idx_segment_seams_transcript", "video_id", "language_code"),
+    )
+
+
+class TranscriptSegmentChange(Base):
+    """Pending change to a segment's effective text, for incremental mention scans.
+
+    Written on every segment insert, text/correction edit and delete by
+    ``chronovista.db.segment_changes``; drained by
+    ``entities scan --changed-since-last-scan`` once the segment's mentions
+    are refreshed. No foreign key: a deletion must outlive its segment.
+    """
+
+    __tablename__ = "transcript_segment_changes"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    segment_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    video_id: Mapped[str] = mapped_column(String(20), nullable=False)
+    language_code: Mapped[str] = mapped_column(String(10), nullable=False)
+    deleted: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    changed_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+
 class VideoTag(Base):
     """Video-level tags for content analysis."""
 
@@ -781,9 +904,10 @@ class UserVideo(Base):
         String(20), ForeignKey("videos.video_id"), primary_key=True
     )
 
-    # Interaction metadata
+    # Interaction metadata. active_history: the watch rollups must refresh the
+    # old bucket too, so load the previous value even when it was expired.
     watched_at: Mapped[datetime.datetime | None] = mapped_column(
-        DateTime(timezone=True)
+        DateTime(timezone=True), active_history=True
     )
     rewatch_count: Mapped[int] = mapped_column(Integer, default=0)
 
@@ -813,6 +937,99 @@ class UserVideo(Base):
         # identity, so `user_id` now has cardinality 1 and the primary key
         # discriminates nothing at all.
         Index("ix_user_videos_video_id", "video_id"),
+        # Rollup refreshes (chronovista.db.watch_rollups) recompute one user's
+        # affected days with a watched_at range over this index.
+        Index("ix_user_videos_user_watched_at", "user_id", "watched_at"),
+    )
+
+
+class UserWatchDaily(Base):
+    """Per-user, per-day watch-history rollup.
+
+    Derived from ``user_videos``: each row aggregates the interactions whose
+    ``watched_at`` falls on ``watch_date``. Maintained from ORM writes by
+    ``chronovista.db.watch_rollups`` and rebuilt by
+    ``chronovista history rebuild-rollups``.
+    """
+
+    __tablename__ = "user_watch_daily"
+
+    user_id: Mapped[str] = mapped_column(String(50), primary_key=True)
+    watch_date: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+    watch_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, comment="Videos last watched on this day"
+    )
+    distinct_channels: Mapped[int] = mapped_column(
+        Integer, nullable=False, comment="Distinct channels among those videos"
+    )
+    rewatch_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, comment="Sum of rewatch_count of those videos"
+    )
+
+
+class UserWatchHourly(Base):
+    """Per-user, per-hour watch-history rollup (see :class:`UserWatchDaily`)."""
+
+    __tablename__ = "user_watch_hourly"
+
+    user_id: Mapped[str] = mapped_column(String(50), primary_key=True)
+    watch_hour: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True
+    )
+    watch_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    distinct_channels: Mapped[int] = mapped_column(Integer, nullable=False)
+    rewatch_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class TakeoutMessage(Base):
+    """A comment or live-chat message stored from the Takeout CSVs.
+
+    Written by ``chronovista takeout peek comments|chats --store`` so later
+    peeks can run with ``--stored`` against these indexes instead of
+    re-reading every CSV. IDs and video IDs are kept as exported: nothing here
+    references the synced tables.
+    """
+
+    __tablename__ = "takeout_messages"
+
+    kind: Mapped[str] = mapped_column(
+        String(10), primary_key=True, comment="'comment' or 'live_chat'"
+    )
+    message_id: Mapped[str] = mapped_column(Text, primary_key=True)
+    video_id: Mapped[str] = mapped_column(Text, nullable=False)
+    channel_id: Mapped[str] = mapped_column(Text, nullable=False)
+    posted_at: Mapped[datetime.datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    message_text: Mapped[str] = mapped_column(
+        Text, nullable=False, comment="Text with Takeout's JSON runs flattened"
+    )
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    __table_args__ = (
+        CheckConstraint(
+            "kind IN ('comment', 'live_chat')", name="chk_takeout_messages_kind"
+        ),
+        # Date bounds and the recent/oldest orders are a range of this index.
+        Index("ix_takeout_messages_kind_posted_at", "kind", "posted_at"),
+        Index("ix_takeout_messages_kind_video_id", "kind", "video_id"),
+        # Peek filters are substring matches (ILIKE '%q%') on the text or the
+        # video ID; each arm of the OR needs its own trigram index for the
+        # planner to combine them with a BitmapOr.
+        Index(
+            "ix_takeout_messages_text_trgm",
+            "message_text",
+            postgresql_using="gin",
+            postgresql_ops={"message_text": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_takeout_messages_video_id_trgm",
+            "video_id",
+            postgresql_using="gin",
+            postgresql_ops={"video_id": "gin_trgm_ops"},
+        ),
     )
 
 
@@ -1624,6 +1841,93 @@ class EntityMention(Base):
     )
 
 
+class EntityVideoAssociation(Base):
+    """Materialised entity-video association (the Feature 066 definition).
+
+    One row per ``(entity, video)`` pair associated through a visible-name or
+    manual mention, a canonical-tag link or an alias-matched tag. Derived from
+    ``entity_mentions``, the entity's names and the tag tables; maintained by
+    ``chronovista.db.entity_associations`` and rebuilt by
+    ``chronovista entities rebuild-associations``. No foreign key on
+    ``video_id``, matching ``entity_mentions``.
+    """
+
+    __tablename__ = "entity_video_associations"
+
+    entity_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("named_entities.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    video_id: Mapped[str] = mapped_column(String(20), primary_key=True)
+    evidence: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Bitmask of association sources (entity_associations.EVIDENCE_BITS)",
+    )
+    mention_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, comment="Visible-name and manual mentions"
+    )
+    transcript_mention_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Of those, mentions inside the TRANSCRIPT evidence scope",
+    )
+
+    __table_args__ = (
+        # Video-side lookups: refresh by video, channel rankings, exclusions.
+        Index("ix_entity_video_associations_video_id", "video_id", "entity_id"),
+    )
+
+
+class EntityCooccurrence(Base):
+    """Videos two entities share, per evidence scope (the appears-with graph).
+
+    Derived from ``entity_video_associations`` over available videos, so a
+    count equals the ``pagination.total`` of the videos list filtered to the
+    pair under the same scope (FR-024b). Stored in both directions; pairs
+    sharing nothing have no row. Maintained by
+    ``chronovista.db.entity_associations`` and rebuilt by
+    ``chronovista entities rebuild-cooccurrences``.
+    """
+
+    __tablename__ = "entity_cooccurrences"
+
+    entity_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("named_entities.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    partner_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("named_entities.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    shared_video_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, comment="Shared videos at evidence scope ANY"
+    )
+    transcript_shared_video_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, comment="Shared videos at evidence scope TRANSCRIPT"
+    )
+
+    __table_args__ = (
+        # Each entity's partners in appears-with order, one index per scope, so
+        # the top k are the first k entries of an index range.
+        Index(
+            "ix_entity_cooccurrences_top",
+            "entity_id",
+            text("shared_video_count DESC"),
+            "partner_id",
+        ),
+        Index(
+            "ix_entity_cooccurrences_top_transcript",
+            "entity_id",
+            text("transcript_shared_video_count DESC"),
+            "partner_id",
+        ),
+    )
+
+
 class VideoRecoverySource(Base):
     """One recovery source that contributed to a video's metadata — ADR-011.
 
@@ -0,0 +1,116 @@
+"""
+Change log of transcript segment text, for incremental mention scans.
+
+Entity mention scanning used to be either "skip pairs already matched" or a
+full rescan, and both walked the whole ``transcript_segments`` id range. After
+a few hundred corrections or a handful of new transcripts, picking up the
+changed text meant rescanning millions of rows.
+
+``transcript_segment_changes`` records every segment whose effective text may
+have changed since the last ``entities scan --changed-since-last-scan``:
+
+- inserts and edits of ``text`` / ``corrected_text`` / ``has_correction``
+  made through the ORM (ingest, ``TranscriptCorrectionService``, batch
+  corrections and reverts) are logged by the ``after_flush`` hook below;
+- bulk deletes of a transcript's segments go through
+  :func:`logged_segment_delete`, which deletes and logs in one statement.
+
+The scanner drains the log: the rows it consumes are deleted in the same
+transaction that replaces those segments' mentions, so the log holds exactly
+the changes not yet reflected in ``entity_mentions``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+from sqlalchemy import Table, delete, event, insert, select, true
+from sqlalchemy.orm import Session, UOWTransaction
+from sqlalchemy.orm.attributes import get_history
+from sqlalchemy.sql.dml import Insert
+from sqlalchemy.sql.elements import ColumnElement
+
+from chronovista.db.models import TranscriptSegment, TranscriptSegmentChange
+
+# Segment columns whose change alters the effective (scanned) text.
+_TEXT_SOURCE_ATTRS = ("text", "corrected_text", "has_correction")
+
+_changes = cast(Table, TranscriptSegmentChange.__table__)
+
+
+def logged_segment_delete(*criteria: ColumnElement[bool]) -> Insert:
+    """
+    Delete segments matching *criteria* and log each deletion.
+
+    A single ``WITH gone AS (DELETE ... RETURNING ...) INSERT ...``
+    statement, so the log cannot miss a delete. Its ``rowcount`` is the
+    number of segments deleted, as for a plain ``DELETE``.
+
+    Parameters
+    ----------
+    *criteria : ColumnElement[bool]
+        WHERE conditions on ``TranscriptSegment``.
+
+    Returns
+    -------
+    Insert
+        The statement to execute.
+    """
+    gone = (
+        delete(TranscriptSegment)
+        .where(*criteria)
+        .returning(
+            TranscriptSegment.id,
+            TranscriptSegment.video_id,
+            TranscriptSegment.language_code,
+        )
+        .cte("gone")
+    )
+    return insert(_changes).from_select(
+        ["segment_id", "video_id", "language_code", "deleted"],
+        select(gone.c.id, gone.c.video_id, gone.c.language_code, true()),
+    )
+
+
+def _text_changed(segment: TranscriptSegment) -> bool:
+    """True if a flushed update changed a column the effective text derives from."""
+    return any(get_history(segment, attr).has_changes() for attr in _TEXT_SOURCE_ATTRS)
+
+
+def _change_row(segment: TranscriptSegment, deleted: bool) -> dict[str, Any]:
+    return {
+        "segment_id": segment.id,
+        "video_id": segment.video_id,
+        "language_code": segment.language_code,
+        "deleted": deleted,
+    }
+
+
+@event.listens_for(Session, "after_flush")
+def _log_segment_changes_after_flush(
+    session: Session, flush_context: UOWTransaction
+) -> None:
+    """Log segments inserted, text-edited or deleted in this flush."""
+    rows = [
+        _change_row(obj, deleted=False)
+        for obj in session.new
+        if isinstance(obj, TranscriptSegment) and obj.id is not None
+    ]
+    rows.extend(
+        _change_row(obj, deleted=False)
+        for obj in session.dirty
+        if isinstance(obj, TranscriptSegment)
+        and obj.id is not None
+        and _text_changed(obj)
+    )
+    rows.extend(
+        _change_row(obj, deleted=True)
+        for obj in session.deleted
+        if isinstance(obj, TranscriptSegment) and obj.id is not None
+    )
+    if not rows:
+        return
+    connection = session.connection()
+    if connection.dialect.name != "postgresql":
+        return
+    connection.execute(insert(_changes), rows)
@@ -0,0 +1,199 @@
+"""
+Segment-boundary ("seam") index maintenance and lookup conditions.
+
+Cross-segment discovery and batch correction look for text that is split
+across two consecutive segments: segment N ends with some fragment and
+segment N+1 starts with another. Answering that with a self-join of
+``transcript_segments`` on ``sequence_number + 1`` filtered by
+``ILIKE '%prefix'`` / ``ILIKE 'suffix%'`` cannot use a B-tree index, and
+degrades to a parallel sequential scan of the whole table whenever trigram
+pruning fails on a short fragment.
+
+``transcript_segment_seams`` stores one row per adjacent pair with the last
+``SEAM_WORDS`` normalized words of N (character-reversed, so "ends with"
+becomes a prefix match) and the first ``SEAM_WORDS`` of N+1, both indexed with
+``text_pattern_ops``. A boundary lookup is then two left-anchored ``LIKE``
+range scans.
+
+Seams are a candidate filter, never the final word: fragments longer than
+``SEAM_WORDS`` words are truncated to it and normalization folds case, so a
+seam hit is a superset of the real matches and callers re-check the effective
+segment text. The converse holds too — every real match is a seam hit — as
+long as the seam rows are current, which the ``after_flush`` hook below keeps
+them for every ORM write to a segment (ingest, corrections, reverts). The
+seam migration backfills existing pairs.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from sqlalchemy import Integer, and_, bindparam, event, literal, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session, UOWTransaction
+from sqlalchemy.orm.attributes import get_history
+from sqlalchemy.sql.elements import ColumnElement, TextClause
+
+from chronovista.db.models import TranscriptSegment, TranscriptSegmentSeam
+
+# Words of context kept on each side of a boundary.
+SEAM_WORDS = 5
+
+# Segment columns whose change alters a seam (effective text or adjacency).
+_SEAM_SOURCE_ATTRS = ("text", "corrected_text", "has_correction", "sequence_number")
+
+# Same whitespace class on both sides of the normalization (Python and SQL).
+_WHITESPACE_RE = re.compile(r"[ \t\n\r\f\v]+")
+
+_LIKE_ESCAPE = "\\"
+
+
+def normalize_seam_text(value: str) -> str:
+    """Lowercase and collapse whitespace, as the seam columns are stored."""
+    return _WHITESPACE_RE.sub(" ", value).strip().lower()
+
+
+def seam_tail_key(fragment: str) -> str:
+    """Reversed, normalized last ``SEAM_WORDS`` words of *fragment*."""
+    words = normalize_seam_text(fragment).split(" ")
+    return " ".join(words[-SEAM_WORDS:])[::-1]
+
+
+def seam_head_key(fragment: str) -> str:
+    """Normalized first ``SEAM_WORDS`` words of *fragment*."""
+    words = normalize_seam_text(fragment).split(" ")
+    return " ".join(words[:SEAM_WORDS])
+
+
+def _starts_with(column: Any, prefix: str) -> ColumnElement[bool]:
+    """Left-anchored LIKE rendered with a literal pattern.
+
+    The pattern is inlined at execution time (``literal_execute``) so the
+    planner always sees a constant prefix and can turn it into a
+    ``text_pattern_ops`` range scan, including under generic plans.
+    """
+    escaped = (
+        prefix.replace(_LIKE_ESCAPE, _LIKE_ESCAPE * 2)
+        .replace("%", _LIKE_ESCAPE + "%")
+        .replace("_", _LIKE_ESCAPE + "_")
+    )
+    pattern = literal(escaped + "%", literal_execute=True)
+    return column.like(pattern, escape=_LIKE_ESCAPE)  # type: ignore[no-any-return]
+
+
+def seam_boundary_condition(
+    tail: str | None, head: str | None, seam: Any = TranscriptSegmentSeam
+) -> ColumnElement[bool] | None:
+    """
+    Condition matching seams where N ends with *tail* and N+1 starts with *head*.
+
+    Parameters
+    ----------
+    tail : str or None
+        Text segment N must end with; None or blank leaves N unconstrained.
+    head : str or None
+        Text segment N+1 must start with; None or blank leaves N+1
+        unconstrained.
+    seam : Any
+        The seam entity or an alias of it.
+
+    Returns
+    -------
+    ColumnElement[bool] or None
+        The condition, or None when neither side constrains anything (such a
+        boundary matches every seam and should not be looked up).
+    """
+    conditions: list[ColumnElement[bool]] = []
+    if tail is not None and normalize_seam_text(tail):
+        conditions.append(_starts_with(seam.tail_reversed, seam_tail_key(tail)))
+    if head is not None and normalize_seam_text(head):
+        conditions.append(_starts_with(seam.head_text, seam_head_key(head)))
+    if not conditions:
+        return None
+    return and_(*conditions)
+
+
+# SQL mirror of ``normalize_seam_text`` applied to a segment's effective text.
+_NORMALIZED_WORDS_SQL = """
+    string_to_array(
+        lower(btrim(regexp_replace(
+            COALESCE(CASE WHEN {s}.has_correction THEN {s}.corrected_text
+                          ELSE {s}.text END, ''),
+            '[ \\t\\n\\r\\f\\v]+', ' ', 'g'
+        ))),
+        ' '
+    )
+"""
+
+_PAIR_SELECT_SQL = f"""
+    SELECT n.id AS n_id, n1.id AS n1_id, n.video_id, n.language_code,
+           {_NORMALIZED_WORDS_SQL.format(s="n")} AS tail_words,
+           {_NORMALIZED_WORDS_SQL.format(s="n1")} AS head_words
+    FROM transcript_segments n
+    JOIN transcript_segments n1
+      ON n1.video_id = n.video_id
+     AND n1.language_code = n.language_code
+     AND n1.sequence_number = n.sequence_number + 1
+"""
+
+_REFRESH_SEAMS_SQL = text(f"""
+    WITH pairs AS (
+        {_PAIR_SELECT_SQL} WHERE n.id = ANY(:segment_ids)
+        UNION
+        {_PAIR_SELECT_SQL} WHERE n1.id = ANY(:segment_ids)
+    )
+    INSERT INTO transcript_segment_seams (
+        segment_n_id, segment_n1_id, video_id, language_code,
+        tail_reversed, head_text
+    )
+    SELECT n_id, n1_id, video_id, language_code,
+           reverse(COALESCE(array_to_string(
+               tail_words[greatest(cardinality(tail_words) - {SEAM_WORDS - 1}, 1):],
+               ' '), '')),
+           COALESCE(array_to_string(head_words[1\\:{SEAM_WORDS}], ' '), '')
+    FROM pairs
+    ON CONFLICT (segment_n_id) DO UPDATE SET
+        segment_n1_id = EXCLUDED.segment_n1_id,
+        tail_reversed = EXCLUDED.tail_reversed,
+        head_text = EXCLUDED.head_text
+    """)
+
+
+def refresh_seams_statement(segment_ids: list[int]) -> TextClause:
+    """Statement upserting every seam that touches one of *segment_ids*."""
+    return _REFRESH_SEAMS_SQL.bindparams(
+        bindparam("segment_ids", value=segment_ids, type_=ARRAY(Integer))
+    )
+
+
+def _seam_relevant_change(segment: TranscriptSegment) -> bool:
+    """True if a flushed update changed a column a seam is derived from."""
+    return any(get_history(segment, attr).has_changes() for attr in _SEAM_SOURCE_ATTRS)
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_seams_after_flush(session: Session, flush_context: UOWTransaction) -> None:
+    """Refresh seams for segments inserted or edited in this flush.
+
+    Deleted segments need nothing: their seams go with them via
+    ``ON DELETE CASCADE``.
+    """
+    segment_ids = [
+        obj.id
+        for obj in session.new
+        if isinstance(obj, TranscriptSegment) and obj.id is not None
+    ]
+    segment_ids.extend(
+        obj.id
+        for obj in session.dirty
+        if isinstance(obj, TranscriptSegment)
+        and obj.id is not None
+        and _seam_relevant_change(obj)
+    )
+    if not segment_ids:
+        return
+    connection = session.connection()
+    if connection.dialect.name != "postgresql":
+        return
+    connection.execute(refresh_seams_statement(segment_ids))
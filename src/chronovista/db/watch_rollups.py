@@ -0,0 +1,239 @@
+"""
+Watch-history rollup maintenance.
+
+``user_watch_daily`` and ``user_watch_hourly`` hold, per user and per day or
+hour, the number of ``user_videos`` rows whose ``watched_at`` falls in the
+bucket, the distinct channels among them and the sum of their
+``rewatch_count``. Statistics and dashboards read O(days) rollup rows instead
+of aggregating the full history on every request.
+
+Rollups are derived data and are refreshed, never incremented: a refresh
+recomputes the affected buckets from ``user_videos``, so it is idempotent and
+cannot drift. Two paths queue buckets for refresh:
+
+- The ``after_flush`` hook below records, for every ORM write to a
+  ``UserVideo`` (seeders, Takeout import, ``record_watch``), the user and the
+  old and new ``watched_at`` values.
+- Bulk Core writers that bypass the ORM (identity merge, interaction delete)
+  call :func:`queue_full_refresh` for the users they touch.
+
+Queued buckets are refreshed once, in ``before_commit``
+(:mod:`chronovista.db.commit_refresh`), so a seeder that commits every
+thousand rows refreshes at most a thousand rows' worth of days per commit
+rather than one day per flush. A rolled-back transaction drops its queue.
+``chronovista history rebuild-rollups`` recomputes everything; it is also the
+repair path for changes the hooks cannot see, such as a video moving to
+another channel.
+
+Buckets use PostgreSQL's ``date()`` / ``date_trunc('hour', ...)`` in the
+session time zone, matching the on-demand queries they replace.
+"""
+
+from __future__ import annotations
+
+import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, bindparam, event, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, UOWTransaction
+from sqlalchemy.orm.attributes import get_history
+from sqlalchemy.sql.elements import TextClause
+
+from chronovista.db.commit_refresh import register_commit_refresh
+from chronovista.db.models import UserVideo
+
+# session.info key: {user_id: set of watched_at values, or None for "all"}.
+_PENDING_KEY = "chronovista_watch_rollups_pending"
+
+_ROLLUP_SOURCE_ATTRS = ("watched_at", "rewatch_count", "user_id")
+
+_AGGREGATES = """
+    count(*),
+    count(DISTINCT v.channel_id),
+    COALESCE(sum(uv.rewatch_count), 0)
+"""
+
+# Days touched by the queued timestamps, and the timestamptz range covering
+# them, so the user_videos read is an index range scan on
+# (user_id, watched_at) rather than a per-row date() comparison.
+_DAYS = "SELECT date(t) FROM unnest(:stamps) AS t"
+_RANGE = f"""
+    uv.watched_at >= CAST((SELECT min(d) FROM ({_DAYS}) AS days(d)) AS timestamptz)
+    AND uv.watched_at
+        < CAST((SELECT max(d) + 1 FROM ({_DAYS}) AS days(d)) AS timestamptz)
+    AND date(uv.watched_at) IN ({_DAYS})
+"""
+_ROLLUP_RANGE = f"""
+    {{col}} >= CAST((SELECT min(d) FROM ({_DAYS}) AS days(d)) AS timestamptz)
+    AND {{col}} < CAST((SELECT max(d) + 1 FROM ({_DAYS}) AS days(d)) AS timestamptz)
+    AND date({{col}}) IN ({_DAYS})
+"""
+
+_DELETE_DAILY_DAYS = text(f"""
+    DELETE FROM user_watch_daily
+    WHERE user_id = :user_id AND watch_date IN ({_DAYS})
+    """)
+_INSERT_DAILY_DAYS = text(f"""
+    INSERT INTO user_watch_daily (
+        user_id, watch_date, watch_count, distinct_channels, rewatch_count
+    )
+    SELECT uv.user_id, date(uv.watched_at), {_AGGREGATES}
+    FROM user_videos uv
+    JOIN videos v ON v.video_id = uv.video_id
+    WHERE uv.user_id = :user_id AND {_RANGE}
+    GROUP BY uv.user_id, date(uv.watched_at)
+    """)
+_DELETE_HOURLY_DAYS = text(f"""
+    DELETE FROM user_watch_hourly
+    WHERE user_id = :user_id AND {_ROLLUP_RANGE.format(col="watch_hour")}
+    """)
+_INSERT_HOURLY_DAYS = text(f"""
+    INSERT INTO user_watch_hourly (
+        user_id, watch_hour, watch_count, distinct_channels, rewatch_count
+    )
+    SELECT uv.user_id, date_trunc('hour', uv.watched_at), {_AGGREGATES}
+    FROM user_videos uv
+    JOIN videos v ON v.video_id = uv.video_id
+    WHERE uv.user_id = :user_id AND {_RANGE}
+    GROUP BY uv.user_id, date_trunc('hour', uv.watched_at)
+    """)
+
+_REBUILD_SQL = {
+    "user_watch_daily": ("date(uv.watched_at)", "watch_date"),
+    "user_watch_hourly": ("date_trunc('hour', uv.watched_at)", "watch_hour"),
+}
+
+
+def _stamps_param(stamps: list[datetime.datetime]) -> Any:
+    return bindparam("stamps", value=stamps, type_=ARRAY(DateTime(timezone=True)))
+
+
+def refresh_statements(
+    user_id: str, stamps: list[datetime.datetime]
+) -> list[TextClause]:
+    """Statements recomputing every daily and hourly bucket on the days of *stamps*.
+
+    Parameters
+    ----------
+    user_id : str
+        The user whose rollups to refresh.
+    stamps : list[datetime.datetime]
+        Watch timestamps (old and new values); every day they fall on is
+        recomputed in full.
+
+    Returns
+    -------
+    list[TextClause]
+        Delete/insert pairs for the daily then hourly table, to run in order.
+    """
+    normalized = [
+        stamp if stamp.tzinfo is not None else stamp.replace(tzinfo=datetime.UTC)
+        for stamp in stamps
+    ]
+    return [
+        statement.bindparams(_stamps_param(normalized), user_id=user_id)
+        for statement in (
+            _DELETE_DAILY_DAYS,
+            _INSERT_DAILY_DAYS,
+            _DELETE_HOURLY_DAYS,
+            _INSERT_HOURLY_DAYS,
+        )
+    ]
+
+
+def rebuild_statements(user_id: str | None = None) -> list[TextClause]:
+    """Statements rebuilding both rollup tables from ``user_videos``.
+
+    Parameters
+    ----------
+    user_id : str or None
+        Restrict the rebuild to one user; ``None`` rebuilds every user.
+
+    Returns
+    -------
+    list[TextClause]
+        Delete/insert pairs for the daily then hourly table, to run in order.
+    """
+    user_filter = "user_id = :user_id" if user_id is not None else "TRUE"
+    source_filter = "uv.user_id = :user_id" if user_id is not None else "TRUE"
+    statements: list[TextClause] = []
+    for table, (bucket, column) in _REBUILD_SQL.items():
+        statements.append(text(f"DELETE FROM {table} WHERE {user_filter}"))
+        statements.append(text(f"""
+            INSERT INTO {table} (
+                user_id, {column}, watch_count, distinct_channels, rewatch_count
+            )
+            SELECT uv.user_id, {bucket}, {_AGGREGATES}
+            FROM user_videos uv
+            JOIN videos v ON v.video_id = uv.video_id
+            WHERE uv.watched_at IS NOT NULL AND {source_filter}
+            GROUP BY uv.user_id, {bucket}
+            """))
+    if user_id is not None:
+        statements = [s.bindparams(user_id=user_id) for s in statements]
+    return statements
+
+
+def _refresh(
+    session: Session, pending: dict[str, set[datetime.datetime] | None]
+) -> None:
+    """Refresh the queued buckets of each user."""
+    connection = session.connection()
+    for user_id, stamps in pending.items():
+        if stamps is None:
+            statements = rebuild_statements(user_id)
+        elif stamps:
+            statements = refresh_statements(user_id, sorted(stamps))
+        else:
+            continue
+        for statement in statements:
+            connection.execute(statement)
+
+
+_QUEUE = register_commit_refresh(_PENDING_KEY, dict, _refresh)
+
+
+def _queue(session: Session, user_id: str, stamp: datetime.datetime | None) -> None:
+    if stamp is None:
+        return
+    stamps = _QUEUE.pending(session).setdefault(user_id, set())
+    if stamps is not None:  # None: a full rebuild is already queued
+        stamps.add(stamp)
+
+
+def queue_full_refresh(session: Session | AsyncSession, user_id: str) -> None:
+    """Rebuild *user_id*'s rollups when the current transaction commits.
+
+    For Core writes that bypass the ORM hooks. Call it in the same transaction
+    as the write.
+    """
+    sync_session = (
+        session.sync_session if isinstance(session, AsyncSession) else session
+    )
+    _QUEUE.pending(sync_session)[user_id] = None
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_after_flush(session: Session, flush_context: UOWTransaction) -> None:
+    """Queue the buckets touched by ``UserVideo`` rows in this flush."""
+    for obj in session.new:
+        if isinstance(obj, UserVideo):
+            _queue(session, obj.user_id, obj.watched_at)
+    for obj in session.deleted:
+        if isinstance(obj, UserVideo):
+            _queue(session, obj.user_id, obj.watched_at)
+    for obj in session.dirty:
+        if not isinstance(obj, UserVideo):
+            continue
+        if not any(get_history(obj, a).has_changes() for a in _ROLLUP_SOURCE_ATTRS):
+            continue
+        watched = get_history(obj, "watched_at")
+        owner = get_history(obj, "user_id")
+        old_user = owner.deleted[0] if owner.deleted else obj.user_id
+        _queue(session, obj.user_id, obj.watched_at)
+        for old_stamp in watched.deleted:
+            _queue(session, old_user, old_stamp)
+        if owner.deleted:
+            _queue(session, old_user, obj.watched_at)
@@ -88,6 +88,7 @@ from .enrichment_report import (
     EnrichmentDetail,
     EnrichmentReport,
     EnrichmentSummary,
+    TopicCacheStats,
 )
 from .entity_alias import (
     EntityAlias,
@@ -373,6 +374,7 @@ __all__ = [
     "EnrichmentReport",
     "EnrichmentSummary",
     "EnrichmentDetail",
+    "TopicCacheStats",
     # Canonical Tags (Feature 028 - Tag Normalization)
     "CanonicalTag",
     "CanonicalTagCreate",
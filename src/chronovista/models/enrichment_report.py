@@ -10,7 +10,36 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+
+
+class TopicCacheStats(BaseModel):
+    """How topic URLs were resolved by the in-memory topic resolver."""
+
+    lookups: int = Field(default=0, ge=0, description="Topic URLs resolved")
+    url_hits: int = Field(
+        default=0, ge=0, description="Resolved by wikipedia_url (or a URL seen earlier)"
+    )
+    name_hits: int = Field(default=0, ge=0, description="Resolved by normalized_name")
+    alias_hits: int = Field(default=0, ge=0, description="Resolved by topic alias")
+    created: int = Field(
+        default=0, ge=0, description="Unknown URLs that created a dynamic topic"
+    )
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def hit_rate(self) -> float | None:
+        """
+        Share of lookups answered from memory, without touching the database.
+
+        Returns
+        -------
+        float | None
+            Between 0.0 and 1.0, or None when nothing was looked up.
+        """
+        if self.lookups == 0:
+            return None
+        return (self.url_hits + self.name_hits + self.alias_hits) / self.lookups
 
 
 class EnrichmentSummary(BaseModel):
@@ -40,6 +69,9 @@ class EnrichmentSummary(BaseModel):
     )
     errors: int = Field(..., ge=0, description="Number of errors encountered")
     quota_used: int = Field(..., ge=0, description="YouTube API quota units consumed")
+    topic_cache: TopicCacheStats | None = Field(
+        default=None, description="Topic resolver cache statistics, if topics ran"
+    )
     # Playlist enrichment statistics
     playlists_processed: int = Field(
         default=0, ge=0, description="Total number of playlists processed"
@@ -45,6 +45,13 @@ class TrackKind(str, Enum):
     FORCED = "forced"
 
 
+class TranscriptStorageMode(str, Enum):
+    """How a transcript's text and raw API payload are stored."""
+
+    FULL = "full"  # transcript_text and raw_transcript_data stored inline
+    COMPACT = "compact"  # segments are the source of truth, raw data archived
+
+
 class PrivacyStatus(str, Enum):
     """Playlist privacy settings."""
 
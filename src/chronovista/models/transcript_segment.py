@@ -8,7 +8,7 @@ following the Base/Create/Full model hierarchy per the project Constitution.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Protocol
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 
@@ -184,6 +184,29 @@ class TranscriptSegment(TranscriptSegmentBase):
     )
 
 
+class DisplaySegment(Protocol):
+    """What the segment formatters read from a segment.
+
+    Satisfied by :class:`TranscriptSegment` and by the cached timeline
+    segments the ``transcript`` CLI commands print.
+    """
+
+    @property
+    def id(self) -> int: ...
+
+    @property
+    def start_time(self) -> float: ...
+
+    @property
+    def end_time(self) -> float: ...
+
+    @property
+    def duration(self) -> float: ...
+
+    @property
+    def display_text(self) -> str: ...
+
+
 class TranscriptSegmentResponse(BaseModel):
     """Response model for CLI/API output.
 
@@ -202,13 +225,13 @@ class TranscriptSegmentResponse(BaseModel):
     end_formatted: str = Field(..., description="Formatted end time (e.g., '0:01:32')")
 
     @classmethod
-    def from_segment(cls, segment: TranscriptSegment) -> TranscriptSegmentResponse:
+    def from_segment(cls, segment: DisplaySegment) -> TranscriptSegmentResponse:
         """Create response from segment model.
 
         Parameters
         ----------
-        segment : TranscriptSegment
-            The full segment model to convert.
+        segment : DisplaySegment
+            The segment to convert.
 
         Returns
         -------
@@ -233,6 +256,7 @@ class TranscriptSegmentResponse(BaseModel):
 
 
 __all__ = [
+    "DisplaySegment",
     "TranscriptSegmentBase",
     "TranscriptSegmentCreate",
     "TranscriptSegment",
@@ -84,6 +84,39 @@ def resolve_language_code(language_code_str: str) -> LanguageCode | str:
     return language_code_str.lower()
 
 
+def canonical_language_code(language_code: LanguageCode | str) -> str:
+    """
+    Return the single stored spelling of a BCP-47 language code.
+
+    Transcript rows are written with this spelling so read paths can compare
+    ``language_code`` columns directly (``column = :code``) and use the
+    ``(video_id, language_code, ...)`` composite indexes, instead of wrapping
+    the column in ``lower()``.
+
+    Parameters
+    ----------
+    language_code : LanguageCode | str
+        Language code in any casing (e.g., 'EN-us', 'en-US', LanguageCode.ENGLISH).
+
+    Returns
+    -------
+    str
+        Canonical code: lowercase language, uppercase two-part region
+        (e.g., 'en-US', 'es-419'), lowercase for everything else.
+
+    Examples
+    --------
+    >>> canonical_language_code("EN-us")
+    'en-US'
+    >>> canonical_language_code("FIL")
+    'fil'
+    """
+    if isinstance(language_code, LanguageCode):
+        return language_code.value
+    resolved = resolve_language_code(language_code)
+    return resolved.value if isinstance(resolved, LanguageCode) else resolved
+
+
 class TranscriptSource(str, Enum):
     """Sources for transcript data."""
 
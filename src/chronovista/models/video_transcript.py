@@ -397,3 +397,58 @@ class TranscriptSourceComparison(BaseModel):
         validate_assignment=True,
         use_enum_values=True,
     )
+
+
+class TranscriptCompactionResult(BaseModel):
+    """Outcome of one batch of transcript compaction."""
+
+    compacted: int = Field(default=0, ge=0, description="Transcripts compacted")
+    skipped_mismatch: int = Field(
+        default=0,
+        ge=0,
+        description="Transcripts whose stored text differs from their segments",
+    )
+    bytes_released: int = Field(
+        default=0, ge=0, description="Inline text + raw bytes released"
+    )
+    bytes_archived: int = Field(
+        default=0, ge=0, description="Compressed raw payload bytes written"
+    )
+    last_key: tuple[str, str] | None = Field(
+        default=None,
+        description="(video_id, language_code) to resume the next batch after",
+    )
+
+
+class TranscriptStorageReport(BaseModel):
+    """On-disk footprint of transcript text and raw payloads by storage mode."""
+
+    full_transcripts: int = Field(default=0, ge=0)
+    compact_transcripts: int = Field(default=0, ge=0)
+    compactable_transcripts: int = Field(
+        default=0,
+        ge=0,
+        description="Full transcripts that have segments and could be compacted",
+    )
+    inline_text_bytes: int = Field(
+        default=0, ge=0, description="transcript_text bytes still stored inline"
+    )
+    inline_raw_bytes: int = Field(
+        default=0, ge=0, description="raw_transcript_data bytes still stored inline"
+    )
+    released_text_bytes: int = Field(
+        default=0, ge=0, description="transcript_text bytes released by compaction"
+    )
+    released_raw_bytes: int = Field(
+        default=0,
+        ge=0,
+        description="raw_transcript_data bytes released by compaction",
+    )
+    archived_bytes: int = Field(
+        default=0, ge=0, description="Compressed raw payload bytes in the archive"
+    )
+
+    @property
+    def bytes_saved(self) -> int:
+        """Net bytes saved by compaction (released minus archived)."""
+        return self.released_text_bytes + self.released_raw_bytes - self.archived_bytes
@@ -0,0 +1,288 @@
+"""
+Streaming parser for Google Takeout comment and live-chat CSVs.
+
+A heavy commenter's export runs to hundreds of thousands of rows spread over
+many files, so rows are read one at a time, filtered as they are read, and
+folded into a :class:`MessageDigest` that keeps only what the peek display
+needs: the totals, the date range, per-video counts and a bounded top N.
+"""
+
+from __future__ import annotations
+
+import csv
+import heapq
+import json
+import math
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Literal
+
+MessageKind = Literal["comment", "live_chat"]
+SortOrder = Literal["default", "recent", "oldest"]
+
+# CSV headers per kind: (id, create timestamp, text).
+_COLUMNS: dict[MessageKind, tuple[str, str, str]] = {
+    "comment": ("Comment ID", "Comment Create Timestamp", "Comment Text"),
+    "live_chat": ("Live Chat ID", "Live Chat Create Timestamp", "Live Chat Text"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class TakeoutMessage:
+    """One comment or live-chat message from a Takeout CSV."""
+
+    kind: MessageKind
+    message_id: str
+    video_id: str
+    channel_id: str
+    posted_at: datetime | None
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class MessageFilter:
+    """Which messages a peek shows.
+
+    ``text`` matches case-insensitively against the cleaned text or the video
+    ID. ``since`` and ``until`` are inclusive; a message without a timestamp
+    never matches a date bound.
+    """
+
+    text: str | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        """True when every message matches."""
+        return not self.text and self.since is None and self.until is None
+
+    def matches_date(self, posted_at: datetime | None) -> bool:
+        """Check the date bounds alone (cheap, so applied before text cleaning)."""
+        if self.since is None and self.until is None:
+            return True
+        if posted_at is None:
+            return False
+        if self.since is not None and posted_at < self.since:
+            return False
+        return self.until is None or posted_at <= self.until
+
+    def matches(self, message: TakeoutMessage) -> bool:
+        """Check every bound against a parsed message."""
+        if not self.matches_date(message.posted_at):
+            return False
+        if not self.text:
+            return True
+        needle = self.text.lower()
+        return needle in message.text.lower() or needle in message.video_id.lower()
+
+
+def clean_message_text(raw: str) -> str:
+    """Flatten Takeout's JSON text runs into plain text.
+
+    Takeout stores message text as ``{"text": ...}`` objects, several of which
+    may appear comma-separated without enclosing brackets. Runs are joined
+    directly so time references such as ``@9:20`` survive, then excess
+    whitespace is collapsed. Text that is not JSON is returned stripped.
+
+    Parameters
+    ----------
+    raw : str
+        The raw CSV cell.
+
+    Returns
+    -------
+    str
+        The display text.
+    """
+    clean_text = raw
+    if clean_text.startswith("[") or clean_text.startswith("{"):
+        try:
+            if clean_text.startswith('{"text":') and '},{"text":' in clean_text:
+                clean_text = f"[{clean_text}]"
+            text_json = json.loads(clean_text)
+
+            if isinstance(text_json, list):
+                text_parts = [
+                    item["text"]
+                    for item in text_json
+                    if isinstance(item, dict)
+                    and "text" in item
+                    and item["text"] is not None
+                ]
+                if text_parts:
+                    clean_text = " ".join("".join(text_parts).split())
+            elif isinstance(text_json, dict) and "text" in text_json:
+                clean_text = text_json["text"]
+        except Exception:
+            # Not JSON after all: keep the cell as written.
+            clean_text = raw
+    return str(clean_text).strip()
+
+
+def parse_message_timestamp(value: str) -> datetime | None:
+    """Parse a Takeout create timestamp, or None if it is missing or malformed."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def iter_takeout_messages(
+    directory: Path,
+    kind: MessageKind,
+    message_filter: MessageFilter | None = None,
+    progress_callback: Callable[[int], None] | None = None,
+) -> Iterator[TakeoutMessage]:
+    """Stream the messages of every CSV in *directory*, filtering as they are read.
+
+    Files are read in name order, one row at a time; nothing is buffered
+    beyond the CSV reader's current line. The date bounds are checked before
+    the text is cleaned, so rows outside them cost only a timestamp parse.
+
+    Parameters
+    ----------
+    directory : Path
+        The Takeout ``comments`` or ``live chats`` folder.
+    kind : MessageKind
+        Which CSV layout the folder holds.
+    message_filter : MessageFilter | None
+        Bounds to apply; every message is yielded when omitted.
+    progress_callback : Callable[[int], None] | None
+        Called after each file with the number of rows it held, matching or
+        not.
+
+    Yields
+    ------
+    TakeoutMessage
+        The matching messages, in file then row order.
+    """
+    id_column, timestamp_column, text_column = _COLUMNS[kind]
+    flt = message_filter if message_filter and not message_filter.is_empty else None
+
+    for csv_path in sorted(directory.glob("*.csv")):
+        read = 0
+        with open(csv_path, encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f, quoting=csv.QUOTE_ALL):
+                read += 1
+                posted_at = parse_message_timestamp(row.get(timestamp_column) or "")
+                if flt is not None and not flt.matches_date(posted_at):
+                    continue
+                message = TakeoutMessage(
+                    kind=kind,
+                    message_id=row.get(id_column) or "",
+                    video_id=row.get("Video ID") or "",
+                    channel_id=row.get("Channel ID") or "",
+                    posted_at=posted_at,
+                    text=clean_message_text(row.get(text_column) or ""),
+                )
+                if flt is None or flt.matches(message):
+                    yield message
+        if progress_callback is not None:
+            progress_callback(read)
+
+
+@dataclass
+class MessageDigest:
+    """Everything a peek displays about a set of messages.
+
+    Fed one message at a time through :meth:`add`. Only the ``limit`` messages
+    that sort first are kept (a bounded heap), so memory is independent of the
+    number of rows read; ``limit=None`` keeps them all.
+
+    Attributes
+    ----------
+    total : int
+        Messages added.
+    first_posted, last_posted : datetime | None
+        The timestamp range of the messages that had one.
+    video_counts : Counter[str]
+        Messages per non-empty video ID.
+    """
+
+    limit: int | None
+    sort_order: SortOrder = "default"
+    total: int = 0
+    first_posted: datetime | None = None
+    last_posted: datetime | None = None
+    video_counts: Counter[str] = field(default_factory=Counter)
+    _kept: list[tuple[float, int, TakeoutMessage]] = field(
+        default_factory=list, repr=False
+    )
+
+    @classmethod
+    def from_totals(
+        cls,
+        rows: Iterable[TakeoutMessage],
+        *,
+        limit: int | None,
+        sort_order: SortOrder,
+        total: int,
+        first_posted: datetime | None,
+        last_posted: datetime | None,
+        video_counts: dict[str, int],
+    ) -> MessageDigest:
+        """Build a digest from totals computed elsewhere (a stored query).
+
+        *rows* must already be in display order and within *limit*.
+        """
+        digest = cls(
+            limit=limit,
+            sort_order=sort_order,
+            total=total,
+            first_posted=first_posted,
+            last_posted=last_posted,
+            video_counts=Counter(video_counts),
+        )
+        digest._kept = [
+            (digest._rank(message), -position, message)
+            for position, message in enumerate(rows, start=1)
+        ]
+        heapq.heapify(digest._kept)
+        return digest
+
+    def _rank(self, message: TakeoutMessage) -> float:
+        """Higher ranks display first; missing timestamps sort last."""
+        if self.sort_order == "default":
+            return 0.0
+        if message.posted_at is None:
+            return -math.inf
+        seconds = message.posted_at.timestamp()
+        return seconds if self.sort_order == "recent" else -seconds
+
+    def add(self, message: TakeoutMessage) -> None:
+        """Fold one message into the totals and the top N."""
+        self.total += 1
+        if message.video_id:
+            self.video_counts[message.video_id] += 1
+        if message.posted_at is not None:
+            if self.first_posted is None or message.posted_at < self.first_posted:
+                self.first_posted = message.posted_at
+            if self.last_posted is None or message.posted_at > self.last_posted:
+                self.last_posted = message.posted_at
+
+        if self.limit == 0:
+            return
+        # The negated arrival number breaks rank ties in read order, matching
+        # a stable sort, and keeps tuples from ever comparing the messages.
+        entry = (self._rank(message), -self.total, message)
+        if self.limit is None or len(self._kept) < self.limit:
+            heapq.heappush(self._kept, entry)
+        elif entry > self._kept[0]:
+            heapq.heapreplace(self._kept, entry)
+
+    def extend(self, messages: Iterable[TakeoutMessage]) -> MessageDigest:
+        """Add every message and return ``self``."""
+        for message in messages:
+            self.add(message)
+        return self
+
+    @property
+    def rows(self) -> list[TakeoutMessage]:
+        """The kept messages in display order."""
+        return [entry[2] for entry in sorted(self._kept, reverse=True)]
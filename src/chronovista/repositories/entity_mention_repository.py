@@ -8,7 +8,7 @@ for the entity_mentions table.
 from __future__ import annotations
 
 import uuid
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 from typing import Any
 
 from sqlalchemy import (
@@ -21,6 +21,7 @@ from sqlalchemy import (
     Subquery,
     Uuid,
     and_,
+    any_,
     bindparam,
     case,
     cast,
@@ -32,6 +33,7 @@ from sqlalchemy import (
     or_,
     select,
     text,
+    tuple_,
     type_coerce,
     union,
     union_all,
@@ -39,8 +41,11 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.sql.dml import Delete
 from uuid_utils import uuid7
 
+from chronovista.db.entity_associations import EVIDENCE_BITS, queue_association_refresh
 from chronovista.db.models import (
     CanonicalTag as CanonicalTagDB,
 )
@@ -50,9 +55,15 @@ from chronovista.db.models import (
 from chronovista.db.models import (
     EntityAlias as EntityAliasDB,
 )
+from chronovista.db.models import (
+    EntityCooccurrence as EntityCooccurrenceDB,
+)
 from chronovista.db.models import (
     EntityMention as EntityMentionDB,
 )
+from chronovista.db.models import (
+    EntityVideoAssociation as EntityVideoAssociationDB,
+)
 from chronovista.db.models import (
     NamedEntity as NamedEntityDB,
 )
@@ -96,6 +107,10 @@ _TRANSCRIPT_SCOPE_SOURCES = (
 )
 
 
+# (entity_id, video_id, mention_text) of one mention, as counters see it.
+MentionCounterKey = tuple[uuid.UUID, str, str]
+
+
 def _folded(col: ColumnExpressionArgument[str]) -> ColumnElement[str]:
     """Fold a name column to its case- and accent-insensitive form for visible-name matching.
 
@@ -174,6 +189,8 @@ class EntityMentionRepository(
         self,
         session: AsyncSession,
         mentions: list[EntityMentionCreate],
+        *,
+        adjust_counters: bool = False,
     ) -> int:
         """Bulk insert entity mentions, skipping duplicates on conflict.
 
@@ -189,6 +206,10 @@ class EntityMentionRepository(
             The database session.
         mentions : list[EntityMentionCreate]
             List of entity mentions to insert.
+        adjust_counters : bool
+            If ``True``, apply the inserted rows to the stored entity and
+            alias counters in the same transaction
+            (:meth:`apply_counter_deltas`).
 
         Returns
         -------
@@ -207,6 +228,24 @@ class EntityMentionRepository(
                 v["mention_source"] = v["mention_source"].value
 
         stmt = insert(EntityMentionDB).values(values).on_conflict_do_nothing()
+        queue_association_refresh(session, video_ids={m.video_id for m in mentions})
+        if adjust_counters:
+            # RETURNING yields only the rows actually inserted, not the
+            # skipped duplicates.
+            inserted = (
+                await session.execute(
+                    stmt.returning(
+                        EntityMentionDB.entity_id,
+                        EntityMentionDB.video_id,
+                        EntityMentionDB.mention_text,
+                    )
+                )
+            ).all()
+            await self.apply_counter_deltas(
+                session,
+                added=[(r.entity_id, r.video_id, r.mention_text) for r in inserted],
+            )
+            return len(inserted)
         result = await session.execute(stmt)
         return int(result.rowcount)
 
@@ -262,6 +301,14 @@ class EntityMentionRepository(
         if mention_source is not None:
             stmt = stmt.where(EntityMentionDB.mention_source == mention_source)
 
+        # Refresh the stored associations at the narrowest key the scope names.
+        if video_ids is not None:
+            queue_association_refresh(session, video_ids=video_ids)
+        elif entity_ids is not None:
+            queue_association_refresh(session, entity_ids=entity_ids)
+        else:
+            queue_association_refresh(session, everything=True)
+
         result = await session.execute(stmt)
         return int(result.rowcount)
 
@@ -269,6 +316,8 @@ class EntityMentionRepository(
         self,
         session: AsyncSession,
         correction_ids: list[uuid.UUID],
+        *,
+        adjust_counters: bool = False,
     ) -> int:
         """Delete mentions linked to specific correction IDs.
 
@@ -281,6 +330,10 @@ class EntityMentionRepository(
             The database session.
         correction_ids : list[uuid.UUID]
             Correction IDs whose linked mentions should be deleted.
+        adjust_counters : bool
+            If ``True``, subtract the deleted rows from the stored entity and
+            alias counters in the same transaction
+            (:meth:`apply_counter_deltas`).
 
         Returns
         -------
@@ -293,8 +346,68 @@ class EntityMentionRepository(
         stmt = delete(EntityMentionDB).where(
             EntityMentionDB.correction_id.in_(correction_ids)
         )
-        result = await session.execute(stmt)
-        return int(result.rowcount)
+        if adjust_counters:
+            return await self._delete_adjusting_counters(session, stmt)
+        video_ids = (
+            (await session.execute(stmt.returning(EntityMentionDB.video_id)))
+            .scalars()
+            .all()
+        )
+        queue_association_refresh(session, video_ids=video_ids)
+        return len(video_ids)
+
+    async def delete_rule_matches_for_segments(
+        self,
+        session: AsyncSession,
+        segment_ids: list[int],
+    ) -> int:
+        """Delete the rule-matched transcript mentions on specific segments.
+
+        Used by the changed-segments scan to drop mentions of text that has
+        since changed, before re-detecting. User-correction mentions are
+        left alone. The stored counters are adjusted in the same transaction.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            The database session.
+        segment_ids : list[int]
+            Segments whose ``rule_match`` mentions should be deleted.
+
+        Returns
+        -------
+        int
+            Count of deleted rows.
+        """
+        if not segment_ids:
+            return 0
+
+        stmt = delete(EntityMentionDB).where(
+            EntityMentionDB.segment_id.in_(segment_ids),
+            EntityMentionDB.detection_method == "rule_match",
+            EntityMentionDB.mention_source == "transcript",
+        )
+        return await self._delete_adjusting_counters(session, stmt)
+
+    async def _delete_adjusting_counters(
+        self, session: AsyncSession, stmt: Delete
+    ) -> int:
+        """Run a mention DELETE and subtract what it removed from the counters."""
+        removed = (
+            await session.execute(
+                stmt.returning(
+                    EntityMentionDB.entity_id,
+                    EntityMentionDB.video_id,
+                    EntityMentionDB.mention_text,
+                )
+            )
+        ).all()
+        queue_association_refresh(session, video_ids={r.video_id for r in removed})
+        await self.apply_counter_deltas(
+            session,
+            removed=[(r.entity_id, r.video_id, r.mention_text) for r in removed],
+        )
+        return len(removed)
 
     async def get_entity_ids_by_correction_ids(
         self,
@@ -362,6 +475,69 @@ class EntityMentionRepository(
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
+    @staticmethod
+    def _visible_names(entity_ids: list[uuid.UUID] | None) -> Subquery:
+        """Folded canonical names plus non-ASR-error aliases, per entity.
+
+        Only mentions whose ``mention_text`` matches one of these names count
+        toward ``mention_count`` / ``video_count``, so that ASR-error alias
+        mentions are excluded. ``None`` covers every entity.
+        """
+        canonical_names = select(
+            NamedEntityDB.id.label("entity_id"),
+            _folded(NamedEntityDB.canonical_name).label("name_lower"),
+        )
+        non_asr_aliases = select(
+            EntityAliasDB.entity_id,
+            _folded(EntityAliasDB.alias_name).label("name_lower"),
+        ).where(EntityAliasDB.alias_type != EntityAliasType.ASR_ERROR)
+        if entity_ids is not None:
+            canonical_names = canonical_names.where(NamedEntityDB.id.in_(entity_ids))
+            non_asr_aliases = non_asr_aliases.where(
+                EntityAliasDB.entity_id.in_(entity_ids)
+            )
+        return union(canonical_names, non_asr_aliases).subquery()
+
+    def _entity_counter_aggregate(self, entity_ids: list[uuid.UUID] | None) -> Subquery:
+        """``(entity_id, mention_count, video_count)`` recomputed from mentions.
+
+        Entities without visible mentions have no row. ``None`` covers every
+        entity.
+        """
+        visible_names = self._visible_names(entity_ids)
+        stmt = select(
+            EntityMentionDB.entity_id,
+            func.count(distinct(EntityMentionDB.id)).label("mention_count"),
+            func.count(distinct(EntityMentionDB.video_id)).label("video_count"),
+        ).join(
+            visible_names,
+            and_(
+                EntityMentionDB.entity_id == visible_names.c.entity_id,
+                _folded(EntityMentionDB.mention_text) == visible_names.c.name_lower,
+            ),
+        )
+        if entity_ids is not None:
+            stmt = stmt.where(EntityMentionDB.entity_id.in_(entity_ids))
+        return stmt.group_by(EntityMentionDB.entity_id).subquery()
+
+    @staticmethod
+    def _alias_mention_counts(entity_ids: list[uuid.UUID] | None) -> Subquery:
+        """Mention counts per ``(entity_id, folded mention_text)``.
+
+        ``None`` covers every entity.
+        """
+        stmt = select(
+            EntityMentionDB.entity_id,
+            _folded(EntityMentionDB.mention_text).label("mention_lower"),
+            func.count().label("cnt"),
+        )
+        if entity_ids is not None:
+            stmt = stmt.where(EntityMentionDB.entity_id.in_(entity_ids))
+        return stmt.group_by(
+            EntityMentionDB.entity_id,
+            _folded(EntityMentionDB.mention_text),
+        ).subquery()
+
     async def update_entity_counters(
         self,
         session: AsyncSession,
@@ -370,7 +546,10 @@ class EntityMentionRepository(
         """Update mention_count and video_count on named_entities.
 
         Computes aggregate counts from entity_mentions and applies them to
-        the named_entities table for the specified entity IDs.
+        the named_entities table for the specified entity IDs. Writers that
+        know exactly which mentions they added or removed use
+        :meth:`apply_counter_deltas` instead; this full recompute is for
+        bulk rewrites (``--full`` rescans) and drift repair.
 
         Parameters
         ----------
@@ -382,42 +561,7 @@ class EntityMentionRepository(
         if not entity_ids:
             return
 
-        # Build a subquery of "visible names" per entity: canonical names
-        # plus non-ASR-error aliases.  Only mentions matching these names
-        # should be counted, so that ASR-error alias mentions are excluded.
-        canonical_names = select(
-            NamedEntityDB.id.label("entity_id"),
-            _folded(NamedEntityDB.canonical_name).label("name_lower"),
-        ).where(NamedEntityDB.id.in_(entity_ids))
-
-        non_asr_aliases = select(
-            EntityAliasDB.entity_id,
-            _folded(EntityAliasDB.alias_name).label("name_lower"),
-        ).where(
-            EntityAliasDB.entity_id.in_(entity_ids),
-            EntityAliasDB.alias_type != EntityAliasType.ASR_ERROR,
-        )
-
-        visible_names = union(canonical_names, non_asr_aliases).subquery()
-
-        # Count only mentions whose mention_text matches a visible name
-        agg_subq = (
-            select(
-                EntityMentionDB.entity_id,
-                func.count(distinct(EntityMentionDB.id)).label("mention_count"),
-                func.count(distinct(EntityMentionDB.video_id)).label("video_count"),
-            )
-            .join(
-                visible_names,
-                and_(
-                    EntityMentionDB.entity_id == visible_names.c.entity_id,
-                    _folded(EntityMentionDB.mention_text) == visible_names.c.name_lower,
-                ),
-            )
-            .where(EntityMentionDB.entity_id.in_(entity_ids))
-            .group_by(EntityMentionDB.entity_id)
-            .subquery()
-        )
+        agg_subq = self._entity_counter_aggregate(entity_ids)
 
         # Update entities that have visible mentions
         stmt = (
@@ -464,20 +608,7 @@ class EntityMentionRepository(
         if not entity_ids:
             return
 
-        # Aggregate mention_text counts per (entity_id, lower(mention_text))
-        mention_counts_subq = (
-            select(
-                EntityMentionDB.entity_id,
-                _folded(EntityMentionDB.mention_text).label("mention_lower"),
-                func.count().label("cnt"),
-            )
-            .where(EntityMentionDB.entity_id.in_(entity_ids))
-            .group_by(
-                EntityMentionDB.entity_id,
-                _folded(EntityMentionDB.mention_text),
-            )
-            .subquery()
-        )
+        mention_counts_subq = self._alias_mention_counts(entity_ids)
 
         # Join aliases to mention counts on (entity_id, lower(alias_name))
         # and update occurrence_count
@@ -515,6 +646,278 @@ class EntityMentionRepository(
         )
         await session.execute(zero_stmt)
 
+    async def apply_counter_deltas(
+        self,
+        session: AsyncSession,
+        *,
+        added: Sequence[MentionCounterKey] = (),
+        removed: Sequence[MentionCounterKey] = (),
+    ) -> None:
+        """Adjust stored counters for mentions just inserted or deleted.
+
+        The incremental counterpart of :meth:`update_entity_counters` and
+        :meth:`update_alias_counters`: instead of re-aggregating every
+        mention of the touched entities, it adds the net change. Call it in
+        the same transaction as, and after, the mention writes it describes.
+
+        - ``occurrence_count`` of each alias moves by the net number of
+          mentions whose folded text matches it.
+        - ``mention_count`` moves by the net number of *visible* mentions
+          (canonical name or non-ASR-error alias).
+        - ``video_count`` moves by one for each ``(entity, video)`` pair
+          whose visible mention count crossed zero. That needs the pair's
+          current count, which one indexed query over the touched pairs
+          provides.
+
+        Concurrent writers on the same ``(entity, video)`` pair can leave
+        ``video_count`` off by one; :meth:`find_counter_drift` reports such
+        drift and :meth:`update_entity_counters` repairs it.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            The database session.
+        added : Sequence[MentionCounterKey]
+            ``(entity_id, video_id, mention_text)`` of each inserted mention.
+        removed : Sequence[MentionCounterKey]
+            ``(entity_id, video_id, mention_text)`` of each deleted mention.
+        """
+        net: dict[MentionCounterKey, int] = {}
+        for key in added:
+            net[key] = net.get(key, 0) + 1
+        for key in removed:
+            net[key] = net.get(key, 0) - 1
+        keys = [key for key, n in net.items() if n]
+        if not keys:
+            return
+
+        # Four array binds + unnest, NOT a row-per-mention VALUES: a scan batch
+        # can carry thousands of mentions (mirrors get_association_counts).
+        deltas = (
+            text(
+                "SELECT e AS entity_id, v AS video_id, m AS mention_text, n "
+                "FROM unnest(:delta_entity_ids, :delta_video_ids, "
+                ":delta_mention_texts, :delta_counts) AS d(e, v, m, n)"
+            )
+            .bindparams(
+                bindparam(
+                    "delta_entity_ids",
+                    value=[k[0] for k in keys],
+                    type_=ARRAY(Uuid),
+                ),
+                bindparam(
+                    "delta_video_ids",
+                    value=[k[1] for k in keys],
+                    type_=ARRAY(String),
+                ),
+                bindparam(
+                    "delta_mention_texts",
+                    value=[k[2] for k in keys],
+                    type_=ARRAY(String),
+                ),
+                bindparam(
+                    "delta_counts",
+                    value=[net[k] for k in keys],
+                    type_=ARRAY(Integer),
+                ),
+            )
+            .columns(entity_id=Uuid, video_id=String, mention_text=String, n=Integer)
+            .cte("counter_deltas")
+        )
+
+        # 1. Alias occurrence counts: every mention counts, visible or not.
+        alias_deltas = (
+            select(
+                deltas.c.entity_id,
+                _folded(deltas.c.mention_text).label("mention_lower"),
+                func.sum(deltas.c.n).label("n"),
+            )
+            .group_by(deltas.c.entity_id, _folded(deltas.c.mention_text))
+            .subquery()
+        )
+        await session.execute(
+            update(EntityAliasDB)
+            .where(
+                EntityAliasDB.entity_id == alias_deltas.c.entity_id,
+                _folded(EntityAliasDB.alias_name) == alias_deltas.c.mention_lower,
+            )
+            .values(occurrence_count=EntityAliasDB.occurrence_count + alias_deltas.c.n)
+        )
+
+        # 2. Net visible-mention change per (entity, video), with the pair's
+        #    visible count as it stands after the writes.
+        visible_names = self._visible_names(sorted({k[0] for k in keys}))
+        pair_deltas = (
+            select(
+                deltas.c.entity_id,
+                deltas.c.video_id,
+                func.sum(deltas.c.n).label("delta"),
+            )
+            .join(
+                visible_names,
+                and_(
+                    deltas.c.entity_id == visible_names.c.entity_id,
+                    _folded(deltas.c.mention_text) == visible_names.c.name_lower,
+                ),
+            )
+            .group_by(deltas.c.entity_id, deltas.c.video_id)
+            .cte("pair_deltas")
+        )
+        visible_now = (
+            select(
+                EntityMentionDB.entity_id,
+                EntityMentionDB.video_id,
+                func.count().label("visible"),
+            )
+            .join(
+                pair_deltas,
+                and_(
+                    EntityMentionDB.entity_id == pair_deltas.c.entity_id,
+                    EntityMentionDB.video_id == pair_deltas.c.video_id,
+                ),
+            )
+            .join(
+                visible_names,
+                and_(
+                    EntityMentionDB.entity_id == visible_names.c.entity_id,
+                    _folded(EntityMentionDB.mention_text) == visible_names.c.name_lower,
+                ),
+            )
+            .group_by(EntityMentionDB.entity_id, EntityMentionDB.video_id)
+            .subquery()
+        )
+        pair_rows = (
+            await session.execute(
+                select(
+                    pair_deltas.c.entity_id,
+                    pair_deltas.c.delta,
+                    func.coalesce(visible_now.c.visible, 0),
+                ).outerjoin(
+                    visible_now,
+                    and_(
+                        visible_now.c.entity_id == pair_deltas.c.entity_id,
+                        visible_now.c.video_id == pair_deltas.c.video_id,
+                    ),
+                )
+            )
+        ).all()
+
+        mention_deltas: dict[uuid.UUID, int] = {}
+        video_deltas: dict[uuid.UUID, int] = {}
+        for entity_id, delta, visible in pair_rows:
+            delta, visible = int(delta), int(visible)
+            mention_deltas[entity_id] = mention_deltas.get(entity_id, 0) + delta
+            crossed = int(visible > 0) - int(visible - delta > 0)
+            video_deltas[entity_id] = video_deltas.get(entity_id, 0) + crossed
+        changed = [
+            entity_id
+            for entity_id in mention_deltas
+            if mention_deltas[entity_id] or video_deltas[entity_id]
+        ]
+        if not changed:
+            return
+
+        # 3. Entity counters.
+        entity_deltas = (
+            text(
+                "SELECT e AS entity_id, dm, dv "
+                "FROM unnest(:counter_entity_ids, :mention_deltas, :video_deltas) "
+                "AS c(e, dm, dv)"
+            )
+            .bindparams(
+                bindparam("counter_entity_ids", value=changed, type_=ARRAY(Uuid)),
+                bindparam(
+                    "mention_deltas",
+                    value=[mention_deltas[e] for e in changed],
+                    type_=ARRAY(Integer),
+                ),
+                bindparam(
+                    "video_deltas",
+                    value=[video_deltas[e] for e in changed],
+                    type_=ARRAY(Integer),
+                ),
+            )
+            .columns(entity_id=Uuid, dm=Integer, dv=Integer)
+            .subquery("entity_deltas")
+        )
+        await session.execute(
+            update(NamedEntityDB)
+            .where(NamedEntityDB.id == entity_deltas.c.entity_id)
+            .values(
+                mention_count=NamedEntityDB.mention_count + entity_deltas.c.dm,
+                video_count=NamedEntityDB.video_count + entity_deltas.c.dv,
+            )
+        )
+
+    async def find_counter_drift(
+        self,
+        session: AsyncSession,
+    ) -> tuple[list[tuple[uuid.UUID, int, int, int, int]], list[uuid.UUID]]:
+        """Find stored counters that disagree with a recompute from mentions.
+
+        Counters are maintained incrementally (:meth:`apply_counter_deltas`);
+        this is the periodic check that they have not drifted. It runs the
+        full aggregate once, read-only.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            The database session.
+
+        Returns
+        -------
+        tuple[list[tuple[uuid.UUID, int, int, int, int]], list[uuid.UUID]]
+            ``(entity_drift, alias_drift_entity_ids)``. ``entity_drift`` holds
+            ``(entity_id, stored_mention_count, stored_video_count,
+            expected_mention_count, expected_video_count)`` for each entity
+            whose counters differ; ``alias_drift_entity_ids`` holds the
+            entities owning at least one alias whose ``occurrence_count``
+            differs.
+        """
+        agg = self._entity_counter_aggregate(None)
+        expected_mentions = func.coalesce(agg.c.mention_count, 0)
+        expected_videos = func.coalesce(agg.c.video_count, 0)
+        entity_rows = (
+            await session.execute(
+                select(
+                    NamedEntityDB.id,
+                    NamedEntityDB.mention_count,
+                    NamedEntityDB.video_count,
+                    expected_mentions,
+                    expected_videos,
+                )
+                .outerjoin(agg, agg.c.entity_id == NamedEntityDB.id)
+                .where(
+                    or_(
+                        NamedEntityDB.mention_count != expected_mentions,
+                        NamedEntityDB.video_count != expected_videos,
+                    )
+                )
+                .order_by(NamedEntityDB.id)
+            )
+        ).all()
+
+        counts = self._alias_mention_counts(None)
+        alias_rows = await session.execute(
+            select(distinct(EntityAliasDB.entity_id))
+            .outerjoin(
+                counts,
+                and_(
+                    EntityAliasDB.entity_id == counts.c.entity_id,
+                    _folded(EntityAliasDB.alias_name) == counts.c.mention_lower,
+                ),
+            )
+            .where(EntityAliasDB.occurrence_count != func.coalesce(counts.c.cnt, 0))
+        )
+
+        return (
+            [
+                (row[0], int(row[1]), int(row[2]), int(row[3]), int(row[4]))
+                for row in entity_rows
+            ],
+            list(alias_rows.scalars().all()),
+        )
+
     # Category mapping for detection methods → source categories.
     #
     # Retained only for callers that genuinely classify by *detection method*.
@@ -1083,37 +1486,26 @@ class EntityMentionRepository(
 
         return paginated, filtered_total if wanted is not None else total_count
 
-    async def _tag_inclusive_association_arms(
-        self,
-        session: AsyncSession,
+    @staticmethod
+    def _stored_associations(
         entity_ids: list[uuid.UUID],
         evidence_scope: EvidenceScope,
     ) -> Subquery:
-        """UNION ALL of the association arms for ``entity_ids``.
-
-        Exposes ``(entity_id, video_id, mention_weight)`` -- the **single**
-        association definition shared with :meth:`get_association_counts`
-        (Feature 066), so the entity filter and the counts cannot drift
-        (FR-005). One row per association event:
-
-        - **mention arm** -- :meth:`_mention_assoc_stmt` (the visible-name /
-          manual rule, #89), ``mention_weight = 1``. This is the count's own
-          mention builder, adopted here so the filter's mention side matches the
-          count by construction (research R6); it replaces the older
-          ``entity_id IN (…)`` any-mention rule.
-        - **canonical-tag arm** and **alias-tag arm** -- ``mention_weight = 0``,
-          included **only at** ``EvidenceScope.ANY`` (FR-007). A tag is not
-          transcript-strength evidence, so stricter scopes stay mention-only.
-
-        ``mention_weight`` lets the qualification sum mention volume while tags
-        contribute 0 (FR-006), with no second query.
-
-        The alias-tag pairs are Python-normalised (:meth:`_alias_tag_pairs`; the
-        #207 duplicate-normaliser trap keeps them out of SQL) and injected via
-        **two** ``unnest`` **array binds** -- never a row-per-pair ``VALUES`` --
-        so a heavy page's tens of thousands of pairs stay two binds and never
-        approach asyncpg's 32,767 bind-parameter ceiling (mirrors
-        :meth:`get_association_counts`).
+        """The stored associations of ``entity_ids``, weighted by mention volume.
+
+        Exposes ``(entity_id, video_id, mention_weight)`` from
+        ``entity_video_associations`` -- the **single** association definition
+        (Feature 066) that :meth:`get_association_counts` also reads, so the
+        entity filter and the counts cannot drift (FR-005). One row per
+        associated ``(entity, video)`` pair:
+
+        - at ``EvidenceScope.ANY`` every pair qualifies -- a visible-name or
+          manual mention (#89), a canonical-tag link or an alias-matched tag --
+          and ``mention_weight`` is the pair's qualifying mention count, 0 for a
+          tag-only pair (FR-006);
+        - at ``EvidenceScope.TRANSCRIPT`` only pairs with a mention from
+          ``_TRANSCRIPT_SCOPE_SOURCES`` qualify and the weight counts just those
+          mentions. A tag is not transcript-strength evidence (FR-007).
 
         Because both the qualification (required-AND, in
         :meth:`build_entity_qualification_subquery`) and the exclusion
@@ -1123,14 +1515,11 @@ class EntityMentionRepository(
 
         Parameters
         ----------
-        session : AsyncSession
-            Session used to fetch the alias-tag pairs (Python normalisation).
         entity_ids : list[uuid.UUID]
-            The entities whose associations to assemble. Assumed already
+            The entities whose associations to read. Assumed already
             deduplicated by the caller.
         evidence_scope : EvidenceScope
-            ``ANY`` includes the tag arms; ``TRANSCRIPT`` restricts the mention
-            arm to ``_TRANSCRIPT_SCOPE_SOURCES`` and omits the tag arms.
+            ``ANY`` or ``TRANSCRIPT``, as above.
 
         Returns
         -------
@@ -1138,59 +1527,19 @@ class EntityMentionRepository(
             ``assoc`` exposing ``entity_id``, ``video_id`` and
             ``mention_weight``.
         """
-        mention_stmt = self._mention_assoc_stmt(entity_ids)
+        assoc = EntityVideoAssociationDB
         if evidence_scope is EvidenceScope.TRANSCRIPT:
-            mention_stmt = mention_stmt.where(
-                EntityMentionDB.mention_source.in_(_TRANSCRIPT_SCOPE_SOURCES)
-            )
-        mention_sub = mention_stmt.subquery()
-        arms: list[Any] = [
-            select(
-                mention_sub.c.entity_id.label("entity_id"),
-                mention_sub.c.video_id.label("video_id"),
-                literal(1).label("mention_weight"),
-            )
-        ]
-
-        # Tag associations qualify only at the default ANY scope (FR-007); a tag
-        # is not transcript-strength evidence.
-        if evidence_scope is EvidenceScope.ANY:
-            canonical_sub = self._canonical_tag_assoc_stmt(entity_ids).subquery()
-            arms.append(
-                select(
-                    canonical_sub.c.entity_id.label("entity_id"),
-                    canonical_sub.c.video_id.label("video_id"),
-                    literal(0).label("mention_weight"),
-                )
-            )
-            alias_pairs = await self._alias_tag_pairs(session, entity_ids)
-            if alias_pairs:
-                # Two array binds + unnest, NOT a row-per-pair VALUES: two binds
-                # regardless of pair count keeps a heavy page under asyncpg's
-                # 32,767 bind-parameter cap (mirrors get_association_counts).
-                arms.append(
-                    text(
-                        "SELECT e AS entity_id, v AS video_id, "
-                        "0 AS mention_weight "
-                        "FROM unnest(:alias_entity_ids, :alias_video_ids) "
-                        "AS t(e, v)"
-                    )
-                    .bindparams(
-                        bindparam(
-                            "alias_entity_ids",
-                            value=[eid for eid, _ in alias_pairs],
-                            type_=ARRAY(Uuid),
-                        ),
-                        bindparam(
-                            "alias_video_ids",
-                            value=[vid for _, vid in alias_pairs],
-                            type_=ARRAY(String),
-                        ),
-                    )
-                    .columns(entity_id=Uuid, video_id=String, mention_weight=Integer)
-                )
-
-        return union_all(*arms).subquery("assoc")
+            weight = assoc.transcript_mention_count
+        else:
+            weight = assoc.mention_count
+        stmt = select(
+            assoc.entity_id.label("entity_id"),
+            assoc.video_id.label("video_id"),
+            weight.label("mention_weight"),
+        ).where(assoc.entity_id.in_(entity_ids))
+        if evidence_scope is EvidenceScope.TRANSCRIPT:
+            stmt = stmt.where(assoc.transcript_mention_count > 0)
+        return stmt.subquery("assoc")
 
     async def build_entity_qualification_subquery(
         self,
@@ -1208,9 +1557,10 @@ class EntityMentionRepository(
         at ``TRANSCRIPT`` (FR-001/FR-007). This is what makes the filter and
         :meth:`get_association_counts` agree for every entity (FR-002).
 
-        The association set comes from :meth:`_tag_inclusive_association_arms`,
-        the one selectable that also feeds the counts, so there is no parallel
-        definition of "associated" to drift (FR-005).
+        The association set comes from :meth:`_stored_associations`, the
+        materialised table that also feeds the counts, so there is no parallel
+        definition of "associated" to drift (FR-005), and the filter is one
+        indexed read rather than a union of association arms per request.
 
         The ``count == filter`` parity (FR-002) assumes referential integrity
         between ``entity_mentions`` / ``video_tags`` and ``videos``:
@@ -1221,15 +1571,13 @@ class EntityMentionRepository(
         breaking the equality. FK constraints on those tables keep that from
         happening.
 
-        ``total_mentions`` is ``SUM(mention_weight)`` -- mention-arm rows only,
-        since tag arms carry weight 0 -- so a tag-only video scores 0 and the
-        RELEVANCE sort ranks by mention volume alone (FR-006).
+        ``total_mentions`` is ``SUM(mention_weight)`` -- each pair's qualifying
+        mention count, 0 for a tag-only pair -- so a tag-only video scores 0 and
+        the RELEVANCE sort ranks by mention volume alone (FR-006).
 
-        Duplicate-safe by construction. The association arms hold multiple rows
-        per ``(entity_id, video_id)`` by design -- across sources, and within a
-        source. Qualification counts *distinct* entity ids, so row multiplicity
-        can neither make a video qualify for an entity it is not associated with
-        nor raise the bar for one it is (FR-003, FR-004).
+        The bar counts *distinct* entity ids, so requesting the same entity
+        twice can neither make a video qualify for an entity it is not
+        associated with nor raise the bar for one it is (FR-003, FR-004).
 
         ``transcript_segments`` is deliberately NOT joined here. Joining it
         before pagination returns byte-identical results at roughly eight times
@@ -1239,7 +1587,8 @@ class EntityMentionRepository(
         Parameters
         ----------
         session : AsyncSession
-            Session used to fetch the Python-normalised alias-tag pairs.
+            The database session. Unused since the associations are stored;
+            kept so callers and the exclusion builder share one signature.
         entity_ids : Sequence[uuid.UUID]
             Required entities. Deduplicated internally, so requesting the same
             entity twice is idempotent and does not raise the bar.
@@ -1254,16 +1603,13 @@ class EntityMentionRepository(
             Joinable subquery exposing ``video_id`` and ``total_mentions``.
         """
         distinct_ids = list(dict.fromkeys(entity_ids))
-        assoc = await self._tag_inclusive_association_arms(
-            session, distinct_ids, evidence_scope
-        )
+        assoc = self._stored_associations(distinct_ids, evidence_scope)
         return (
             select(
                 assoc.c.video_id.label("video_id"),
-                # SUM of the per-row weight = mention-arm row count (mention
-                # VOLUME); tag rows weigh 0. Deliberately NOT a distinct count:
-                # each mention row is a distinct event, and relevance ranks by
-                # volume (FR-006, research R3).
+                # SUM of the per-pair weight = mention VOLUME; tag-only pairs
+                # weigh 0. Deliberately mentions, not videos: relevance ranks
+                # by volume (FR-006, research R3).
                 func.sum(assoc.c.mention_weight).label("total_mentions"),
             )
             .group_by(assoc.c.video_id)
@@ -1287,7 +1633,7 @@ class EntityMentionRepository(
 
         "Associated" is the **same** tag-inclusive definition qualification
         uses: the excluded-video set is the distinct ``video_id``\\ s in
-        :meth:`_tag_inclusive_association_arms` for the excluded entities —
+        :meth:`_stored_associations` for the excluded entities —
         a mention **or** a tag (canonical-tag or alias-tag) at the default
         ``ANY`` scope, mentions only at ``TRANSCRIPT`` (FR-003/FR-007). Both
         sides consuming that one selectable is what keeps them symmetric by
@@ -1305,8 +1651,7 @@ class EntityMentionRepository(
         Parameters
         ----------
         session : AsyncSession
-            Session used to fetch the Python-normalised alias-tag pairs (via the
-            shared association helper).
+            The database session. Unused since the associations are stored.
         entity_ids : Sequence[uuid.UUID]
             Excluded entities. Deduplicated internally.
         evidence_scope : EvidenceScope
@@ -1319,9 +1664,7 @@ class EntityMentionRepository(
             Scalar subquery of ``video_id`` suitable for ``notin_()``.
         """
         distinct_ids = list(dict.fromkeys(entity_ids))
-        assoc = await self._tag_inclusive_association_arms(
-            session, distinct_ids, evidence_scope
-        )
+        assoc = self._stored_associations(distinct_ids, evidence_scope)
         return select(assoc.c.video_id).distinct().scalar_subquery()
 
     def build_cooccurrence_query(
@@ -1338,13 +1681,19 @@ class EntityMentionRepository(
         bounded list deterministic, so two partners with equal counts cannot
         swap between requests and make the panel look unstable (R5).
 
+        Reads the stored ``entity_cooccurrences`` rows
+        (:meth:`materialize_cooccurrences`), whose per-scope index is in this
+        order, so the first ``limit`` partners are an index range rather than a
+        self-join over every video the entity shares.
+
         **Availability is not incidental here.** The count this returns is
         promised to equal the videos list's ``pagination.total`` for the same
         pair (FR-024b), and that list excludes unavailable videos by default.
-        Counting every shared video would inflate this figure -- measured
-        against production, one popular pair differs by nine -- and the user
-        would be shown one number and land on another. The join to ``videos``
-        below is what keeps the promise.
+        The stored counts are taken over available videos only, from the same
+        associations the list's entity filter reads; counting every shared
+        video would inflate the figure -- measured against production, one
+        popular pair differs by nine -- and the user would be shown one number
+        and land on another.
 
         Parameters
         ----------
@@ -1353,8 +1702,8 @@ class EntityMentionRepository(
         limit : int
             Maximum partners to return.
         evidence_scope : EvidenceScope
-            Which mentions count as co-occurrence. Must match the scope the
-            surrounding view is using, or the panel and the intersection it
+            Which associations count as co-occurrence. Must match the scope
+            the surrounding view is using, or the panel and the intersection it
             opens will disagree (FR-024a).
 
         Returns
@@ -1362,53 +1711,25 @@ class EntityMentionRepository(
         Select[Any]
             The unexecuted statement, so callers and tests can inspect it.
         """
-        # The scope narrows the SUBJECT's videos before the partner select is
-        # built, so both sides of the co-occurrence are computed under one
-        # definition. Chained rather than rebuilt: two copies of this column
-        # list would let the scoped and unscoped forms drift apart silently.
-        subject_videos = select(EntityMentionDB.video_id).where(
-            EntityMentionDB.entity_id == entity_id
-        )
+        cooc = EntityCooccurrenceDB
         if evidence_scope is EvidenceScope.TRANSCRIPT:
-            subject_videos = subject_videos.where(
-                EntityMentionDB.mention_source.in_(_TRANSCRIPT_SCOPE_SOURCES)
-            )
-
-        partner = select(
-            EntityMentionDB.entity_id.label("partner_id"),
-            func.count(distinct(EntityMentionDB.video_id)).label("shared"),
-        ).where(
-            EntityMentionDB.entity_id != entity_id,
-            EntityMentionDB.video_id.in_(subject_videos),
-        )
-        if evidence_scope is EvidenceScope.TRANSCRIPT:
-            partner = partner.where(
-                EntityMentionDB.mention_source.in_(_TRANSCRIPT_SCOPE_SOURCES)
-            )
+            shared = cooc.transcript_shared_video_count
+        else:
+            shared = cooc.shared_video_count
 
-        # Restrict to the same video population the videos list uses, so the
-        # count shown equals the count landed on (FR-024b).
-        available = select(VideoDB.video_id).where(
-            VideoDB.availability_status == AvailabilityStatus.AVAILABLE
-        )
-        partner = partner.where(EntityMentionDB.video_id.in_(available))
-
-        grouped = partner.group_by(EntityMentionDB.entity_id).subquery()
-
-        stmt = (
+        return (
             select(
-                grouped.c.partner_id,
-                grouped.c.shared,
+                cooc.partner_id,
+                shared.label("shared"),
                 NamedEntityDB.canonical_name,
                 NamedEntityDB.entity_type,
             )
-            .join(NamedEntityDB, NamedEntityDB.id == grouped.c.partner_id)
-            .order_by(grouped.c.shared.desc(), grouped.c.partner_id.asc())
+            .join(NamedEntityDB, NamedEntityDB.id == cooc.partner_id)
+            .where(cooc.entity_id == entity_id, shared > 0)
+            .order_by(shared.desc(), cooc.partner_id.asc())
             .limit(limit)
         )
 
-        return stmt
-
     async def get_cooccurring_entities(
         self,
         session: AsyncSession,
@@ -1554,7 +1875,7 @@ class EntityMentionRepository(
     # `tag` is a derived label, never a stored mention_source (data-model I4).
     _PROVENANCE_SOURCES = ("manual", "transcript", "title", "description", "tag")
 
-    def _mention_assoc_stmt(self, ids: list[uuid.UUID]) -> Select[Any]:
+    def _mention_assoc_stmt(self, ids: list[uuid.UUID] | None) -> Select[Any]:
         """``(entity_id, video_id, source)`` for the mention associations.
 
         A non-manual mention counts only where its text matches one of the
@@ -1563,28 +1884,17 @@ class EntityMentionRepository(
         stored source. One non-correlated relation, no per-row work.
 
         Shared by ``association_triples`` (which materialises rows) and
-        ``get_association_counts`` (which aggregates in SQL), so the mention
-        rule has a single definition rather than drifting copies.
+        :meth:`materialize_associations` (which stores them), so the mention
+        rule has a single definition rather than drifting copies. ``None``
+        covers every entity.
         """
-        visible_names = union(
-            select(
-                NamedEntityDB.id.label("entity_id"),
-                _folded(NamedEntityDB.canonical_name).label("name_lower"),
-            ).where(NamedEntityDB.id.in_(ids)),
-            select(
-                EntityAliasDB.entity_id.label("entity_id"),
-                _folded(EntityAliasDB.alias_name).label("name_lower"),
-            ).where(
-                EntityAliasDB.entity_id.in_(ids),
-                EntityAliasDB.alias_type != EntityAliasType.ASR_ERROR,
-            ),
-        ).subquery()
+        visible_names = self._visible_names(ids)
 
         source_label = case(
             (EntityMentionDB.detection_method == "manual", literal("manual")),
             else_=EntityMentionDB.mention_source,
         )
-        return (
+        stmt = (
             select(
                 EntityMentionDB.entity_id.label("entity_id"),
                 EntityMentionDB.video_id.label("video_id"),
@@ -1598,22 +1908,25 @@ class EntityMentionRepository(
                 ),
             )
             .where(
-                EntityMentionDB.entity_id.in_(ids),
                 or_(
                     visible_names.c.name_lower.is_not(None),
                     EntityMentionDB.detection_method == "manual",
                 ),
             )
         )
+        if ids is not None:
+            stmt = stmt.where(EntityMentionDB.entity_id.in_(ids))
+        return stmt
 
-    def _canonical_tag_assoc_stmt(self, ids: list[uuid.UUID]) -> Select[Any]:
+    def _canonical_tag_assoc_stmt(self, ids: list[uuid.UUID] | None) -> Select[Any]:
         """``(entity_id, video_id, 'tag')`` for canonical-tag associations.
 
         entity → canonical_tag → tag_alias.raw_form → video_tags, all
-        non-correlated joins. Shared with the count aggregator (single
-        definition of the canonical-tag rule).
+        non-correlated joins. Shared with the triple builder and the
+        materialiser (single definition of the canonical-tag rule). ``None``
+        covers every linked canonical tag.
         """
-        return (
+        stmt = (
             select(
                 CanonicalTagDB.entity_id.label("entity_id"),
                 VideoTagDB.video_id.label("video_id"),
@@ -1621,48 +1934,568 @@ class EntityMentionRepository(
             )
             .join(TagAliasDB, TagAliasDB.canonical_tag_id == CanonicalTagDB.id)
             .join(VideoTagDB, VideoTagDB.tag == TagAliasDB.raw_form)
-            .where(CanonicalTagDB.entity_id.in_(ids))
         )
+        if ids is None:
+            return stmt.where(CanonicalTagDB.entity_id.is_not(None))
+        return stmt.where(CanonicalTagDB.entity_id.in_(ids))
 
-    async def _alias_tag_pairs(
-        self, session: AsyncSession, ids: list[uuid.UUID]
-    ) -> list[tuple[uuid.UUID, str]]:
-        """``(entity_id, video_id)`` for alias-matched-tag associations.
+    @staticmethod
+    def _alias_forms_stmt(
+        ids: list[uuid.UUID] | None, tag_forms: Select[Any] | None = None
+    ) -> Select[Any]:
+        """Non-ASR aliases to normalise for the alias-matched-tag rule.
 
-        Normalisation runs in Python (``TagNormalizationService``) — it cannot
-        move into SQL without reimplementing the normalizer, the #207
-        duplicate-definition trap. Non-correlated: one alias fetch, one tag
-        lookup, mapped back in Python. A normalised form may belong to more
-        than one entity. Shared by the triple builder and the count aggregator.
+        ``None`` covers every entity. *tag_forms*, a select of tag
+        ``normalized_form`` values, adds the aliases whose stored
+        ``alias_name_normalized`` is one of them (an indexed lookup), so a
+        video-scoped refresh loads only aliases that can match those tags
+        instead of every alias.
         """
-        alias_rows = (
-            await session.execute(
-                select(EntityAliasDB.entity_id, EntityAliasDB.alias_name).where(
-                    EntityAliasDB.entity_id.in_(ids),
-                    EntityAliasDB.alias_type != EntityAliasType.ASR_ERROR,
+        stmt = select(EntityAliasDB.entity_id, EntityAliasDB.alias_name).where(
+            EntityAliasDB.alias_type != EntityAliasType.ASR_ERROR
+        )
+        if tag_forms is not None:
+            stmt = stmt.where(
+                or_(
+                    EntityAliasDB.entity_id.in_(ids or []),
+                    EntityAliasDB.alias_name_normalized.in_(tag_forms),
                 )
             )
-        ).all()
+        elif ids is not None:
+            stmt = stmt.where(EntityAliasDB.entity_id.in_(ids))
+        return stmt
+
+    @staticmethod
+    def _form_to_entities(
+        alias_rows: Sequence[Any],
+    ) -> dict[str, set[uuid.UUID]]:
+        """Map each tag-normalised alias form to the entities that own it."""
         normalizer = TagNormalizationService()
         form_to_entities: dict[str, set[uuid.UUID]] = {}
         for entity_id, alias_name in alias_rows:
             normalized = normalizer.normalize(alias_name)
             if normalized is not None:
                 form_to_entities.setdefault(normalized, set()).add(entity_id)
-        if not form_to_entities:
-            return []
-        pairs: list[tuple[uuid.UUID, str]] = []
-        alias_tag_stmt = (
+        return form_to_entities
+
+    @staticmethod
+    def _form_videos_stmt(forms: list[str]) -> Select[Any]:
+        """``(normalized_form, video_id)`` for the videos tagged with *forms*."""
+        return (
             select(TagAliasDB.normalized_form, VideoTagDB.video_id)
             .join(VideoTagDB, VideoTagDB.tag == TagAliasDB.raw_form)
-            .where(TagAliasDB.normalized_form.in_(list(form_to_entities)))
+            .where(TagAliasDB.normalized_form.in_(forms))
             .distinct()
         )
+
+    async def _alias_tag_pairs(
+        self, session: AsyncSession, ids: list[uuid.UUID]
+    ) -> list[tuple[uuid.UUID, str]]:
+        """``(entity_id, video_id)`` for alias-matched-tag associations.
+
+        Normalisation runs in Python (``TagNormalizationService``) — it cannot
+        move into SQL without reimplementing the normalizer, the #207
+        duplicate-definition trap. Non-correlated: one alias fetch, one tag
+        lookup, mapped back in Python. A normalised form may belong to more
+        than one entity. The materialiser runs the same three steps.
+        """
+        alias_rows = (await session.execute(self._alias_forms_stmt(ids))).all()
+        form_to_entities = self._form_to_entities(alias_rows)
+        if not form_to_entities:
+            return []
+        pairs: list[tuple[uuid.UUID, str]] = []
+        alias_tag_stmt = self._form_videos_stmt(list(form_to_entities))
         for norm, video_id in (await session.execute(alias_tag_stmt)).all():
             for entity_id in form_to_entities.get(norm, set()):
                 pairs.append((entity_id, video_id))
         return pairs
 
+    def materialize_associations(
+        self,
+        session: Session,
+        *,
+        entity_ids: Collection[uuid.UUID] | None = None,
+        video_ids: Collection[str] | None = None,
+    ) -> int:
+        """Recompute the stored associations of some entities and videos.
+
+        Deletes every ``entity_video_associations`` row whose entity is in
+        *entity_ids* or whose video is in *video_ids*, then inserts those pairs
+        afresh from the three association arms: the visible-name / manual
+        mention rule, the canonical-tag rule and the alias-matched-tag rule.
+        A pair's ``evidence`` ORs the bit of every source that reaches it.
+
+        Synchronous so the commit hook in ``chronovista.db.entity_associations``
+        can run it; async callers use :meth:`refresh_associations`. Scopes are
+        bound as arrays and unnested, so a scan touching tens of thousands of
+        videos stays a handful of binds.
+
+        Parameters
+        ----------
+        session : Session
+            A synchronous session, inside the writing transaction.
+        entity_ids : Collection[uuid.UUID] or None
+            Entities to recompute.
+        video_ids : Collection[str] or None
+            Videos to recompute. When both are ``None`` the whole table is
+            rebuilt.
+
+        Returns
+        -------
+        int
+            Number of association rows written.
+        """
+        everything = entity_ids is None and video_ids is None
+        scope_entities = sorted(set(entity_ids or ()))
+        scope_videos = sorted(set(video_ids or ()))
+        if not everything and not scope_entities and not scope_videos:
+            return 0
+
+        def in_array(col: Any, name: str, values: list[Any], type_: Any) -> Any:
+            return col.in_(
+                select(
+                    func.unnest(
+                        bindparam(name, value=values, type_=ARRAY(type_), unique=True)
+                    )
+                )
+            )
+
+        def in_scope(entity_col: Any, video_col: Any) -> ColumnElement[bool]:
+            return or_(
+                in_array(entity_col, "scope_entity_ids", scope_entities, Uuid),
+                in_array(video_col, "scope_video_ids", scope_videos, String),
+            )
+
+        # Alias-matched tags. A video in scope can match any entity's alias
+        # whose form is one of the video's tag forms; the stored
+        # alias_name_normalized narrows the load to those, and the Python
+        # normalisation below stays the definition of a match.
+        video_tag_forms: Select[Any] | None = None
+        if scope_videos:
+            video_tag_forms = (
+                select(TagAliasDB.normalized_form)
+                .join(VideoTagDB, VideoTagDB.tag == TagAliasDB.raw_form)
+                .where(
+                    in_array(
+                        VideoTagDB.video_id, "scope_video_ids", scope_videos, String
+                    )
+                )
+            )
+        alias_rows = session.execute(
+            self._alias_forms_stmt(
+                None if everything else scope_entities,
+                None if everything else video_tag_forms,
+            )
+        ).all()
+        form_to_entities = self._form_to_entities(alias_rows)
+        alias_pairs: set[tuple[uuid.UUID, str]] = set()
+        if form_to_entities:
+            wanted_entities, wanted_videos = set(scope_entities), set(scope_videos)
+            form_stmt = self._form_videos_stmt(list(form_to_entities))
+            if not everything:
+                entity_forms = [
+                    form
+                    for form, owners in form_to_entities.items()
+                    if owners & wanted_entities
+                ]
+                form_stmt = form_stmt.where(
+                    or_(
+                        TagAliasDB.normalized_form.in_(entity_forms),
+                        in_array(
+                            VideoTagDB.video_id, "scope_video_ids", scope_videos, String
+                        ),
+                    )
+                )
+            for form, video_id in session.execute(form_stmt).all():
+                alias_pairs.update(
+                    (entity_id, video_id)
+                    for entity_id in form_to_entities[form]
+                    if everything
+                    or entity_id in wanted_entities
+                    or video_id in wanted_videos
+                )
+
+        mention_stmt = self._mention_assoc_stmt(None).add_columns(
+            case(
+                (EntityMentionDB.mention_source.in_(_TRANSCRIPT_SCOPE_SOURCES), 1),
+                else_=0,
+            ).label("in_transcript_scope")
+        )
+        canonical_stmt = self._canonical_tag_assoc_stmt(None)
+        if not everything:
+            mention_stmt = mention_stmt.where(
+                in_scope(EntityMentionDB.entity_id, EntityMentionDB.video_id)
+            )
+            canonical_stmt = canonical_stmt.where(
+                in_scope(CanonicalTagDB.entity_id, VideoTagDB.video_id)
+            )
+        mentions = mention_stmt.subquery()
+        canonical = canonical_stmt.subquery()
+        tag_bit = EVIDENCE_BITS["tag"]
+        arms: list[Any] = [
+            select(
+                mentions.c.entity_id,
+                mentions.c.video_id,
+                case(EVIDENCE_BITS, value=mentions.c.source, else_=0).label("evidence"),
+                literal(1).label("mentions"),
+                mentions.c.in_transcript_scope.label("transcript_mentions"),
+            ),
+            select(
+                canonical.c.entity_id,
+                canonical.c.video_id,
+                literal(tag_bit).label("evidence"),
+                literal(0).label("mentions"),
+                literal(0).label("transcript_mentions"),
+            ),
+        ]
+        if alias_pairs:
+            # Two array binds + unnest, NOT a row-per-pair VALUES (asyncpg's
+            # 32,767 bind-parameter cap; mirrors get_association_counts).
+            arms.append(
+                text(
+                    "SELECT e AS entity_id, v AS video_id, "
+                    f"{tag_bit} AS evidence, 0 AS mentions, "
+                    "0 AS transcript_mentions "
+                    "FROM unnest(:alias_entity_ids, :alias_video_ids) AS t(e, v)"
+                )
+                .bindparams(
+                    bindparam(
+                        "alias_entity_ids",
+                        value=[eid for eid, _ in alias_pairs],
+                        type_=ARRAY(Uuid),
+                    ),
+                    bindparam(
+                        "alias_video_ids",
+                        value=[vid for _, vid in alias_pairs],
+                        type_=ARRAY(String),
+                    ),
+                )
+                .columns(
+                    entity_id=Uuid,
+                    video_id=String,
+                    evidence=Integer,
+                    mentions=Integer,
+                    transcript_mentions=Integer,
+                )
+            )
+        assoc = union_all(*arms).subquery("assoc")
+        rows = select(
+            assoc.c.entity_id,
+            assoc.c.video_id,
+            func.bit_or(assoc.c.evidence),
+            func.sum(assoc.c.mentions),
+            func.sum(assoc.c.transcript_mentions),
+        ).group_by(assoc.c.entity_id, assoc.c.video_id)
+
+        clear = delete(EntityVideoAssociationDB)
+        if not everything:
+            clear = clear.where(
+                in_scope(
+                    EntityVideoAssociationDB.entity_id,
+                    EntityVideoAssociationDB.video_id,
+                )
+            )
+        # ON CONFLICT: a concurrent refresh of an overlapping scope may have
+        # inserted the pair since the delete; the later computation wins.
+        write = insert(EntityVideoAssociationDB).from_select(
+            [
+                "entity_id",
+                "video_id",
+                "evidence",
+                "mention_count",
+                "transcript_mention_count",
+            ],
+            rows,
+        )
+        write = write.on_conflict_do_update(
+            index_elements=["entity_id", "video_id"],
+            set_={
+                "evidence": write.excluded.evidence,
+                "mention_count": write.excluded.mention_count,
+                "transcript_mention_count": write.excluded.transcript_mention_count,
+            },
+        )
+        if everything:
+            session.execute(clear)
+            written = int(session.execute(write).rowcount)
+            self.materialize_cooccurrences(session)
+            return written
+
+        # A pair's co-occurrences move only when it appears, disappears or
+        # enters or leaves the TRANSCRIPT scope; diff the rows to find those.
+        eva = EntityVideoAssociationDB
+        key = (
+            eva.entity_id,
+            eva.video_id,
+            (eva.transcript_mention_count > 0).label("in_transcript"),
+        )
+        before = {
+            (row.entity_id, row.video_id): row.in_transcript
+            for row in session.execute(clear.returning(*key))
+        }
+        after = {
+            (row.entity_id, row.video_id): row.in_transcript
+            for row in session.execute(write.returning(*key))
+        }
+        changed = {
+            pair
+            for pair in before.keys() | after.keys()
+            if before.get(pair) != after.get(pair)
+        }
+        if changed:
+            self.materialize_cooccurrences(session, changed=changed)
+        return len(after)
+
+    def materialize_cooccurrences(
+        self,
+        session: Session,
+        *,
+        changed: Collection[tuple[uuid.UUID, str]] | None = None,
+        video_ids: Collection[str] | None = None,
+    ) -> int:
+        """
+        Recount the stored entity co-occurrences.
+
+        ``entity_cooccurrences`` holds, for every ordered pair of entities
+        associated with at least one common available video, the number of
+        such videos and the number where both associations are inside the
+        ``TRANSCRIPT`` evidence scope. Counts come from
+        ``entity_video_associations``, so they equal the videos list's total
+        for the pair (FR-024b).
+
+        A scoped call recounts every pair that includes an entity of a
+        ``changed`` association, paired with the other entities on that video,
+        plus every pair on a video in ``video_ids`` (whose availability
+        changed). Each pair is recounted from its smaller side's associations,
+        so a popular partner costs an index probe per shared candidate rather
+        than a scan of its videos.
+
+        Parameters
+        ----------
+        session : Session
+            A synchronous session, inside the writing transaction.
+        changed : Collection[tuple[uuid.UUID, str]] or None
+            ``(entity_id, video_id)`` associations that appeared, disappeared
+            or changed TRANSCRIPT scope.
+        video_ids : Collection[str] or None
+            Videos whose availability changed. When both are ``None`` the
+            whole table is rebuilt.
+
+        Returns
+        -------
+        int
+            Number of co-occurrence rows written (both directions).
+        """
+        cooc = EntityCooccurrenceDB
+        eva = EntityVideoAssociationDB
+        columns = [
+            "entity_id",
+            "partner_id",
+            "shared_video_count",
+            "transcript_shared_video_count",
+        ]
+        x, y = aliased(eva), aliased(eva)
+        both_in_transcript = and_(
+            x.transcript_mention_count > 0, y.transcript_mention_count > 0
+        )
+        available = VideoDB.availability_status == AvailabilityStatus.AVAILABLE
+
+        if changed is None and video_ids is None:
+            counts = (
+                select(
+                    x.entity_id,
+                    y.entity_id,
+                    func.count(),
+                    func.count().filter(both_in_transcript),
+                )
+                .join(y, and_(y.video_id == x.video_id, y.entity_id != x.entity_id))
+                .join(VideoDB, VideoDB.video_id == x.video_id)
+                .where(available)
+                .group_by(x.entity_id, y.entity_id)
+            )
+            session.execute(delete(cooc))
+            return int(
+                session.execute(insert(cooc).from_select(columns, counts)).rowcount
+            )
+
+        pairs = self._cooccurrence_pairs(session, changed or (), video_ids or ())
+        if not pairs:
+            return 0
+        # Orient each pair so its smaller side drives the join.
+        size_rows = session.execute(
+            select(eva.entity_id, func.count())
+            .where(
+                eva.entity_id
+                == any_(
+                    bindparam(
+                        "entity_ids",
+                        value=sorted({e for pair in pairs for e in pair}),
+                        type_=ARRAY(Uuid),
+                    )
+                )
+            )
+            .group_by(eva.entity_id)
+        )
+        sizes: dict[uuid.UUID, int] = {row[0]: row[1] for row in size_rows}
+        oriented = [
+            (a, b) if sizes.get(a, 0) <= sizes.get(b, 0) else (b, a)
+            for a, b in sorted(pairs)
+        ]
+        # Two array binds + unnest (asyncpg's 32,767 bind-parameter cap).
+        pair_rows = (
+            text("SELECT a, b FROM unnest(:pair_a, :pair_b) AS t(a, b)")
+            .bindparams(
+                bindparam("pair_a", value=[a for a, _ in oriented], type_=ARRAY(Uuid)),
+                bindparam("pair_b", value=[b for _, b in oriented], type_=ARRAY(Uuid)),
+            )
+            .columns(a=Uuid, b=Uuid)
+            .subquery("pairs")
+        )
+        session.execute(
+            delete(cooc).where(
+                tuple_(cooc.entity_id, cooc.partner_id).in_(
+                    union_all(
+                        select(pair_rows.c.a, pair_rows.c.b),
+                        select(pair_rows.c.b, pair_rows.c.a),
+                    )
+                )
+            )
+        )
+        counted = (
+            select(
+                pair_rows.c.a,
+                pair_rows.c.b,
+                func.count().label("shared"),
+                func.count().filter(both_in_transcript).label("transcript_shared"),
+            )
+            .select_from(pair_rows)
+            .join(x, x.entity_id == pair_rows.c.a)
+            .join(y, and_(y.entity_id == pair_rows.c.b, y.video_id == x.video_id))
+            .join(VideoDB, VideoDB.video_id == x.video_id)
+            .where(available)
+            .group_by(pair_rows.c.a, pair_rows.c.b)
+            .cte("counted")
+        )
+        write = insert(cooc).from_select(
+            columns,
+            union_all(
+                select(
+                    counted.c.a,
+                    counted.c.b,
+                    counted.c.shared,
+                    counted.c.transcript_shared,
+                ),
+                select(
+                    counted.c.b,
+                    counted.c.a,
+                    counted.c.shared,
+                    counted.c.transcript_shared,
+                ),
+            ),
+        )
+        # Same race as materialize_associations: the later recount wins.
+        write = write.on_conflict_do_update(
+            index_elements=["entity_id", "partner_id"],
+            set_={
+                "shared_video_count": write.excluded.shared_video_count,
+                "transcript_shared_video_count": (
+                    write.excluded.transcript_shared_video_count
+                ),
+            },
+        )
+        return int(session.execute(write).rowcount)
+
+    @staticmethod
+    def _cooccurrence_pairs(
+        session: Session,
+        changed: Collection[tuple[uuid.UUID, str]],
+        video_ids: Collection[str],
+    ) -> set[tuple[uuid.UUID, uuid.UUID]]:
+        """Unordered entity pairs whose co-occurrence counts may have moved.
+
+        A changed association pairs its entity with every other entity
+        associated with the video now, and with the other changed entities
+        there (which may just have left it). A video whose availability
+        changed pairs all of its entities.
+        """
+        touched: dict[str, set[uuid.UUID]] = {}
+        for entity_id, video_id in changed:
+            touched.setdefault(video_id, set()).add(entity_id)
+        scope_videos = sorted(set(touched) | set(video_ids))
+        if not scope_videos:
+            return set()
+        eva = EntityVideoAssociationDB
+        members: dict[str, set[uuid.UUID]] = {}
+        rows = session.execute(
+            select(eva.entity_id, eva.video_id).where(
+                eva.video_id
+                == any_(bindparam("video_ids", value=scope_videos, type_=ARRAY(String)))
+            )
+        )
+        for entity_id, video_id in rows:
+            members.setdefault(video_id, set()).add(entity_id)
+
+        availability = set(video_ids)
+        pairs: set[tuple[uuid.UUID, uuid.UUID]] = set()
+        for video_id in scope_videos:
+            present = members.get(video_id, set())
+            on_video = present | touched.get(video_id, set())
+            drivers = present if video_id in availability else set()
+            for entity_id in drivers | touched.get(video_id, set()):
+                for other in on_video:
+                    if other != entity_id:
+                        pairs.add(
+                            (entity_id, other)
+                            if entity_id < other
+                            else (other, entity_id)
+                        )
+        return pairs
+
+    async def refresh_cooccurrences(self, session: AsyncSession) -> int:
+        """Rebuild every stored co-occurrence (``entities rebuild-cooccurrences``).
+
+        Parameters
+        ----------
+        session : AsyncSession
+            The database session.
+
+        Returns
+        -------
+        int
+            Number of co-occurrence rows written (both directions).
+        """
+        return await session.run_sync(self.materialize_cooccurrences)
+
+    async def refresh_associations(
+        self,
+        session: AsyncSession,
+        *,
+        entity_ids: Collection[uuid.UUID] | None = None,
+        video_ids: Collection[str] | None = None,
+    ) -> int:
+        """Async form of :meth:`materialize_associations`.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            The database session.
+        entity_ids : Collection[uuid.UUID] or None
+            Entities to recompute.
+        video_ids : Collection[str] or None
+            Videos to recompute. When both are ``None`` the whole table is
+            rebuilt (``entities rebuild-associations``).
+
+        Returns
+        -------
+        int
+            Number of association rows written.
+        """
+        return await session.run_sync(
+            self.materialize_associations,
+            entity_ids=entity_ids,
+            video_ids=video_ids,
+        )
+
     async def association_triples(
         self,
         session: AsyncSession,
@@ -1731,7 +2564,8 @@ class EntityMentionRepository(
         sources — repetition of a name within one field never inflates it
         (FR-003) — and the per-source parts need not sum to ``total`` because a
         video reached through two sources counts once in ``total`` and in each
-        contributing source.
+        contributing source. Read from ``entity_video_associations``, where the
+        definition is materialised, in one aggregate query.
 
         Every requested entity is present in the result, all-zero when it has no
         associations, so a caller iterating a page never hits a missing key.
@@ -1762,59 +2596,26 @@ class EntityMentionRepository(
         if not ids:
             return counts
 
-        # The distinct-video counting happens in Postgres, not Python: the two
-        # SQL paths and the Python-derived alias pairs are UNION ALLed and the
-        # totals computed with COUNT(DISTINCT video_id) — so a heavy entity's
-        # thousands of association rows never cross into Python (only the one
-        # aggregated row per entity does). `total` is the union across all
-        # sources; each `by_source` part is that source's distinct videos, so
-        # the parts need not sum to `total` (a video reached two ways counts
-        # once in each and once in the total).
-        arms: list[Any] = [
-            self._mention_assoc_stmt(ids),
-            self._canonical_tag_assoc_stmt(ids),
-        ]
-        alias_pairs = await self._alias_tag_pairs(session, ids)
-        if alias_pairs:
-            # Inject the Python-derived alias pairs via two array binds and
-            # ``unnest``, NOT a row-per-pair VALUES literal: a heavy page yields
-            # tens of thousands of pairs, and three binds each would blow past
-            # asyncpg's 32,767 bind-parameter ceiling. Two arrays is two binds
-            # regardless of pair count. Expressed as text() because SQLAlchemy's
-            # table_valued() does not render the column-alias list for a
-            # multi-argument unnest (unnest(a, b) AS t(col1, col2)).
-            alias_arm = (
-                text(
-                    "SELECT e AS entity_id, v AS video_id, 'tag' AS source "
-                    "FROM unnest(:alias_entity_ids, :alias_video_ids) AS t(e, v)"
-                )
-                .bindparams(
-                    bindparam(
-                        "alias_entity_ids",
-                        value=[eid for eid, _ in alias_pairs],
-                        type_=ARRAY(Uuid),
-                    ),
-                    bindparam(
-                        "alias_video_ids",
-                        value=[vid for _, vid in alias_pairs],
-                        type_=ARRAY(String),
-                    ),
-                )
-                .columns(entity_id=Uuid, video_id=String, source=String)
+        # One indexed read of the stored associations: a pair's row exists once
+        # per (entity, video), so COUNT(*) is the distinct-video total and each
+        # source's part counts the pairs whose evidence carries its bit. The
+        # parts need not sum to `total` (a video reached two ways counts once in
+        # each and once in the total).
+        assoc = EntityVideoAssociationDB
+        count_stmt = (
+            select(
+                assoc.entity_id,
+                func.count().label("total"),
+                *[
+                    func.count()
+                    .filter(assoc.evidence.op("&")(EVIDENCE_BITS[src]) != 0)
+                    .label(src)
+                    for src in self._PROVENANCE_SOURCES
+                ],
             )
-            arms.append(alias_arm)
-
-        assoc = union_all(*arms).subquery("assoc")
-        count_stmt = select(
-            assoc.c.entity_id,
-            func.count(distinct(assoc.c.video_id)).label("total"),
-            *[
-                func.count(distinct(assoc.c.video_id))
-                .filter(assoc.c.source == src)
-                .label(src)
-                for src in self._PROVENANCE_SOURCES
-            ],
-        ).group_by(assoc.c.entity_id)
+            .where(assoc.entity_id.in_(ids))
+            .group_by(assoc.entity_id)
+        )
 
         for row in (await session.execute(count_stmt)).all():
             counts[row.entity_id] = AssociationCount(
@@ -1845,26 +2646,20 @@ class EntityMentionRepository(
 
         "Associated" is the **single** Feature 066 definition: a mention (the
         visible-name / manual rule, #89) or a tag (canonical-tag or alias-tag) at
-        ``ANY`` scope. Both the channel count and the corpus denominator are
-        derived from that one definition — the shared association arms
-        (:meth:`_tag_inclusive_association_arms`) — so the corpus denominator
-        equals ``get_association_counts(...).total`` by construction and the panel
+        ``ANY`` scope. Both the channel count and the corpus denominator are read
+        from ``entity_video_associations``, where that definition is
+        materialised, so the corpus denominator equals
+        ``get_association_counts(...).total`` by construction and the panel
         cannot drift from the pinned ``/videos?channel_id=&entity_id=`` filter
-        (which reuses the same arms since #260) (FR-004/FR-007).
-
-        Query shape (research R2): channel video ids are resolved once; a superset
-        of candidate entity ids is discovered through the three association paths
-        (over-inclusion is safe — an entity that does not actually appear on the
-        channel gets ``channel_video_count == 0`` and is dropped). The channel
-        count and the corpus denominator are then computed in **one** set-based
-        pass over the arms via a conditional aggregate
-        (``COUNT(DISTINCT video_id) FILTER (WHERE <on this channel>)`` for the
-        channel count, plain ``COUNT(DISTINCT video_id)`` for the corpus) — no
-        second corpus-wide counts query, no correlated subquery, no
-        join-before-paginate. The small per-entity result set is scored and
-        sorted in Python. (The separate ``get_association_counts`` call this
-        previously made dominated latency on entity-dense channels; folding it
-        into the same aggregate is the SC-007 optimization — see research R4.)
+        (which reads the same table) (FR-004/FR-007).
+
+        Query shape (research R2): one aggregate over the stored associations of
+        the entities that have a pair on the channel -- ``COUNT(*) FILTER (WHERE
+        <on this channel>)`` for the channel count, plain ``COUNT(*)`` for the
+        corpus (a pair is one row, so both are distinct-video counts) -- then one
+        display-name lookup. No association arms are rebuilt, no correlated
+        subquery, no join-before-paginate. The small per-entity result set is
+        scored and sorted in Python (the SC-007 single-pass shape, research R4).
 
         Parameters
         ----------
@@ -1879,144 +2674,42 @@ class EntityMentionRepository(
             Ranked rows; empty when the channel has no videos or no associated
             entities. The caller (endpoint) handles the unknown-channel 404.
         """
-        # 1. Resolve the channel's video ids (all-videos basis — no availability
-        #    filter; FR-003).
-        channel_video_ids = list(
-            (
-                await session.execute(
-                    select(VideoDB.video_id).where(VideoDB.channel_id == channel_id)
-                )
-            ).scalars()
+        # 1. The channel's videos (all-videos basis — no availability filter;
+        #    FR-003), and the entities with at least one pair among them.
+        channel_videos = select(VideoDB.video_id).where(
+            VideoDB.channel_id == channel_id
         )
-        if not channel_video_ids:
-            return []
-
-        # Bind the channel's video-id list as a single Postgres array + ``unnest``
-        # rather than one bind per id. Mirrors the arms' own workaround
-        # (:meth:`_tag_inclusive_association_arms`) so even a very large channel
-        # stays a single bind and never approaches asyncpg's 32,767
-        # bind-parameter ceiling. Used at all four channel-video filter sites.
-        # ``col`` is a video-id column expression (an ORM attribute or a subquery
-        # column); typed ``Any`` to accept both, matching this file's convention
-        # for SQLAlchemy expression internals.
-        def _in_channel_videos(col: Any) -> Any:
-            return col.in_(
-                select(
-                    func.unnest(
-                        bindparam(
-                            "channel_video_ids",
-                            value=channel_video_ids,
-                            type_=ARRAY(String),
-                            unique=True,
-                        )
-                    )
-                )
-            )
-
-        # 2. Discover a SUPERSET of the entity ids associated with those videos,
-        #    via the same three association paths the resolver uses. Over-inclusion
-        #    is safe: step 3 recomputes the exact channel count through the shared
-        #    arms and drops anything that does not actually qualify.
-        candidate_ids: set[uuid.UUID] = set()
-
-        # 2a. mention-path candidates. The visible-name rule (#89) is applied for
-        #     real in step 3; this any-mention scan is deliberately a superset.
-        candidate_ids.update(
-            (
-                await session.execute(
-                    select(distinct(EntityMentionDB.entity_id)).where(
-                        _in_channel_videos(EntityMentionDB.video_id)
-                    )
-                )
-            ).scalars()
+        assoc = EntityVideoAssociationDB
+        on_channel = aliased(EntityVideoAssociationDB, name="on_channel")
+        candidates = select(on_channel.entity_id).where(
+            on_channel.video_id.in_(channel_videos)
         )
 
-        # 2b. canonical-tag-path candidates. ``CanonicalTag.entity_id`` is nullable
-        #     (unlinked tags), so drop NULLs even though the WHERE excludes them.
-        candidate_ids.update(
-            eid
-            for eid in (
-                await session.execute(
-                    select(distinct(CanonicalTagDB.entity_id))
-                    .join(TagAliasDB, TagAliasDB.canonical_tag_id == CanonicalTagDB.id)
-                    .join(VideoTagDB, VideoTagDB.tag == TagAliasDB.raw_form)
-                    .where(
-                        _in_channel_videos(VideoTagDB.video_id),
-                        CanonicalTagDB.entity_id.is_not(None),
-                    )
-                )
-            ).scalars()
-            if eid is not None
-        )
-
-        # 2c. alias-tag-path candidates. Normalisation is Python-side (the #207
-        #     duplicate-normaliser trap — the stored ``alias_name_normalized`` is
-        #     the ENTITY normaliser's output, not the TAG normaliser's, so it must
-        #     not be relied on here). Collect the channel's tag normalized_forms,
-        #     then keep entities whose non-ASR alias normalises into that set.
-        #     Note: the channel_forms query IS channel-scoped, but the alias fetch
-        #     below scans the whole (non-ASR) entity_aliases table — its cost is
-        #     O(total aliases), not O(channel size). Cheap at current corpus size
-        #     (~1.7k rows); revisit if the alias table grows large (perf T019).
-        channel_forms = set(
-            (
-                await session.execute(
-                    select(distinct(TagAliasDB.normalized_form))
-                    .join(VideoTagDB, VideoTagDB.tag == TagAliasDB.raw_form)
-                    .where(_in_channel_videos(VideoTagDB.video_id))
-                )
-            ).scalars()
+        # 2. Channel count and corpus denominator in ONE pass over the
+        #    candidates' stored associations; the corpus count equals
+        #    ``get_association_counts(...).total`` by construction (same table,
+        #    same COUNT), so FR-004 and ``corpus >= channel`` hold.
+        counts_stmt = (
+            select(
+                assoc.entity_id,
+                func.count()
+                .filter(assoc.video_id.in_(channel_videos))
+                .label("channel_video_count"),
+                func.count().label("corpus_video_count"),
+            )
+            .where(assoc.entity_id.in_(candidates))
+            .group_by(assoc.entity_id)
         )
-        if channel_forms:
-            normalizer = TagNormalizationService()
-            alias_rows = (
-                await session.execute(
-                    select(EntityAliasDB.entity_id, EntityAliasDB.alias_name).where(
-                        EntityAliasDB.alias_type != EntityAliasType.ASR_ERROR
-                    )
-                )
-            ).all()
-            for entity_id, alias_name in alias_rows:
-                normalized = normalizer.normalize(alias_name)
-                if normalized is not None and normalized in channel_forms:
-                    candidate_ids.add(entity_id)
-
-        if not candidate_ids:
-            return []
-
-        # 3. Compute BOTH the channel count and the corpus denominator in ONE pass
-        #    over the shared association arms. The arms hold every candidate's
-        #    associations corpus-wide (they are filtered by entity_id, NOT by
-        #    channel), so a conditional aggregate yields the channel count (rows
-        #    restricted to the channel's videos) and the corpus count (all rows) at
-        #    once — the corpus count equals ``get_association_counts(...).total`` by
-        #    construction (same arms, same COUNT(DISTINCT video_id)), so FR-004 and
-        #    the ``corpus >= channel`` invariant hold, and the separate, corpus-wide
-        #    counts query is avoided (it dominated the latency on large channels).
-        assoc = await self._tag_inclusive_association_arms(
-            session, list(candidate_ids), EvidenceScope.ANY
-        )
-        channel_pred = _in_channel_videos(assoc.c.video_id)
-        counts_stmt = select(
-            assoc.c.entity_id.label("entity_id"),
-            func.count(distinct(assoc.c.video_id))
-            .filter(channel_pred)
-            .label("channel_video_count"),
-            func.count(distinct(assoc.c.video_id)).label("corpus_video_count"),
-        ).group_by(assoc.c.entity_id)
-        # (entity_id -> (channel_count, corpus_count)); keep only entities that
-        # actually appear on the channel (discovery over-includes by design).
         counts: dict[uuid.UUID, tuple[int, int]] = {
             row.entity_id: (row.channel_video_count, row.corpus_video_count)
             for row in (await session.execute(counts_stmt)).all()
-            if row.channel_video_count > 0
         }
         if not counts:
             return []
 
         surviving_ids = list(counts)
 
-        # 4. Display fields for the surviving entities.
+        # 3. Display fields for the surviving entities.
         display: dict[uuid.UUID, tuple[str, str]] = {
             row.id: (row.canonical_name, row.entity_type)
             for row in (
@@ -2030,7 +2723,7 @@ class EntityMentionRepository(
             ).all()
         }
 
-        # 5. Build rows + share; floor + tie-break in Python over the small set.
+        # 4. Build rows + share; floor + tie-break in Python over the small set.
         rows: list[ChannelEntityRankingRow] = []
         for eid, (ch_count, corpus_total) in counts.items():
             name, etype = display[eid]
@@ -2277,7 +2970,8 @@ class EntityMentionRepository(
 
         This is a lightweight alternative to ``get_entity_video_list()``
         for use cases that only need the count (e.g., entity detail header
-        video_count field per FR-007 / T030).
+        video_count field per FR-007 / T030).  It counts the entity's rows in
+        ``entity_video_associations``, the materialised association set.
 
         Parameters
         ----------
@@ -2291,52 +2985,11 @@ class EntityMentionRepository(
         int
             The deduplicated count of distinct video IDs from all sources.
         """
-        # Step 1: Fetch transcript-mention video IDs (no language filter —
-        # the header count should reflect all languages).
-        canonical_names = select(
-            _folded(NamedEntityDB.canonical_name).label("name_lower"),
-        ).where(NamedEntityDB.id == entity_id)
-
-        non_asr_aliases = select(
-            _folded(EntityAliasDB.alias_name).label("name_lower"),
-        ).where(
-            EntityAliasDB.entity_id == entity_id,
-            EntityAliasDB.alias_type != EntityAliasType.ASR_ERROR,
-        )
-
-        visible_names = union(canonical_names, non_asr_aliases).subquery()
-
-        mention_filter = and_(
-            EntityMentionDB.entity_id == entity_id,
-            or_(
-                _folded(EntityMentionDB.mention_text) == visible_names.c.name_lower,
-                EntityMentionDB.detection_method == "manual",
-            ),
-        )
-
-        transcript_vid_stmt = (
-            select(distinct(EntityMentionDB.video_id))
-            .outerjoin(
-                visible_names,
-                _folded(EntityMentionDB.mention_text) == visible_names.c.name_lower,
-            )
-            .where(mention_filter)
-        )
-        transcript_vid_result = await session.execute(transcript_vid_stmt)
-        transcript_video_ids: set[str] = set(transcript_vid_result.scalars().all())
-
-        # Step 2: Fetch tag-associated video IDs
-        canonical_tag_video_ids = await self._get_tag_associated_video_ids(
-            session, entity_id
-        )
-        alias_tag_video_ids = await self._get_alias_matched_tag_video_ids(
-            session, entity_id
+        # All languages: the header count is the entity's stored pair count.
+        result = await session.execute(
+            select(func.count()).where(EntityVideoAssociationDB.entity_id == entity_id)
         )
-        tag_video_ids = canonical_tag_video_ids | alias_tag_video_ids
-
-        # Deduplicated union
-        all_video_ids = transcript_video_ids | tag_video_ids
-        return len(all_video_ids)
+        return int(result.scalar_one())
 
     async def get_statistics(
         self,
@@ -2764,8 +3417,10 @@ class EntityMentionRepository(
         session.add(mention)
         await session.flush()
 
-        # 6. Update entity counters
-        await self.update_entity_counters(session, [entity_id])
+        # 6. Update entity and alias counters
+        await self.apply_counter_deltas(
+            session, added=[(entity_id, video_id, mention.mention_text)]
+        )
 
         return mention
 
@@ -2809,10 +3464,11 @@ class EntityMentionRepository(
                 identifier=f"entity={entity_id}, video={video_id}",
             )
 
+        removed = (mention.entity_id, mention.video_id, mention.mention_text)
         await session.delete(mention)
         await session.flush()
 
-        await self.update_entity_counters(session, [entity_id])
+        await self.apply_counter_deltas(session, removed=[removed])
 
     async def _get_tag_associated_video_ids(
         self, session: AsyncSession, entity_id: uuid.UUID
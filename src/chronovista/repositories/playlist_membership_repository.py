@@ -6,10 +6,11 @@ Handles CRUD operations and specialized queries for playlist-video relationships
 
 from __future__ import annotations
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from ..db.models import Playlist as DBPlaylist
 from ..db.models import PlaylistMembership as DBPlaylistMembership
 from ..models.playlist_membership import (
     PlaylistMembershipCreate,
@@ -74,6 +75,60 @@ class PlaylistMembershipRepository(
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_membership_pairs(
+        self, session: AsyncSession, include_deleted: bool = False
+    ) -> list[tuple[str, str]]:
+        """
+        Get every (playlist_id, video_id) membership pair.
+
+        Only the two key columns are selected, so this is cheap enough to
+        build an in-memory playlist overlap index over the whole library.
+
+        Args:
+            session: Database session
+            include_deleted: Include playlists hidden by ``deleted_flag``
+
+        Returns:
+            List of (playlist_id, video_id) tuples
+        """
+        stmt = select(self.model.playlist_id, self.model.video_id)
+        if not include_deleted:
+            stmt = stmt.join(
+                DBPlaylist, DBPlaylist.playlist_id == self.model.playlist_id
+            ).where(DBPlaylist.deleted_flag.is_(False))
+        result = await session.execute(stmt)
+        return [(row[0], row[1]) for row in result.all()]
+
+    async def get_membership_version(
+        self, session: AsyncSession
+    ) -> tuple[int, str | None, int]:
+        """
+        Get a cheap change marker for the membership pairs.
+
+        Args:
+            session: Database session
+
+        Returns:
+            Tuple of (membership count, latest membership created_at as ISO
+            string or None, hidden playlist count); it changes whenever
+            memberships are added or removed or a playlist is hidden/restored
+        """
+        hidden = (
+            select(func.count())
+            .select_from(DBPlaylist)
+            .where(DBPlaylist.deleted_flag.is_(True))
+            .scalar_subquery()
+        )
+        result = await session.execute(
+            select(func.count(), func.max(self.model.created_at), hidden)
+        )
+        count, latest, hidden_count = result.one()
+        return (
+            int(count),
+            latest.isoformat() if latest is not None else None,
+            int(hidden_count),
+        )
+
     async def clear_playlist_videos(
         self, session: AsyncSession, playlist_id: str
     ) -> int:
@@ -934,23 +934,96 @@ class PlaylistRepository(
     async def find_similar_playlists(
         self, session: AsyncSession, playlist_id: str, limit: int = 10
     ) -> list[tuple[PlaylistDB, float]]:
-        """Find playlists similar to the given playlist based on title and description."""
+        """Find playlists similar to the given playlist.
+
+        Similarity is the Jaccard index of the two playlists' video sets.
+        Candidates come from ``playlist_memberships`` through its
+        ``video_id`` index, so only playlists sharing at least one video with
+        the target are ever scored — the whole library is covered without
+        comparing unrelated playlists. When the target has no memberships
+        (for example a playlist that was never synced), title-word Jaccard
+        over all visible playlists is used instead.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Database session.
+        playlist_id : str
+            Playlist to compare against.
+        limit : int
+            Maximum number of results.
+
+        Returns
+        -------
+        list[tuple[PlaylistDB, float]]
+            ``(playlist, similarity)`` pairs, most similar first.
+        """
         target_playlist = await self.get_by_playlist_id(session, playlist_id)
         if not target_playlist:
             return []
 
-        # Simple similarity based on title words
-        # In a real implementation, you'd use more sophisticated text similarity
+        target_size = (
+            await session.execute(
+                select(func.count()).where(
+                    PlaylistMembershipDB.playlist_id == playlist_id
+                )
+            )
+        ).scalar_one()
+        if not target_size:
+            return await self._find_similar_by_title(session, target_playlist, limit)
+
+        target_videos = select(PlaylistMembershipDB.video_id).where(
+            PlaylistMembershipDB.playlist_id == playlist_id
+        )
+        shared = (
+            select(
+                PlaylistMembershipDB.playlist_id,
+                func.count().label("shared"),
+            )
+            .where(
+                PlaylistMembershipDB.video_id.in_(target_videos),
+                PlaylistMembershipDB.playlist_id != playlist_id,
+            )
+            .group_by(PlaylistMembershipDB.playlist_id)
+            .subquery()
+        )
+        sizes = (
+            select(
+                PlaylistMembershipDB.playlist_id,
+                func.count().label("size"),
+            )
+            .where(PlaylistMembershipDB.playlist_id.in_(select(shared.c.playlist_id)))
+            .group_by(PlaylistMembershipDB.playlist_id)
+            .subquery()
+        )
+        rows = await session.execute(
+            select(PlaylistDB, shared.c.shared, sizes.c.size)
+            .join(shared, shared.c.playlist_id == PlaylistDB.playlist_id)
+            .join(sizes, sizes.c.playlist_id == PlaylistDB.playlist_id)
+            .where(PlaylistDB.deleted_flag.is_(False))
+        )
+
+        similar_playlists = [
+            (playlist, shared_count / (target_size + size - shared_count))
+            for playlist, shared_count, size in rows.all()
+        ]
+        similar_playlists.sort(key=lambda x: x[1], reverse=True)
+        return similar_playlists[:limit]
+
+    async def _find_similar_by_title(
+        self, session: AsyncSession, target_playlist: PlaylistDB, limit: int
+    ) -> list[tuple[PlaylistDB, float]]:
+        """Title-word Jaccard fallback for playlists without memberships."""
         title_words = set(target_playlist.title.lower().split())
 
         if len(title_words) == 0:
             return []
 
-        # Find playlists with similar titles
         all_playlists = await session.execute(
-            select(PlaylistDB)
-            .where(PlaylistDB.playlist_id != playlist_id)
-            .limit(100)  # Limit search space for performance
+            select(PlaylistDB).where(
+                PlaylistDB.playlist_id != target_playlist.playlist_id,
+                PlaylistDB.deleted_flag.is_(False),
+            )
         )
 
         similar_playlists = []
@@ -0,0 +1,260 @@
+"""
+Takeout message repository.
+
+Stores comment and live-chat rows read from the Takeout CSVs and answers peek
+queries from them. Not a ``BaseSQLAlchemyRepository``: the table is a cache of
+files rather than an entity with create and update models, so it has a bulk
+upsert and one summary query instead of CRUD.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from sqlalchemy import DateTime, String, Text, bindparam, func, or_, select, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from chronovista.db.models import TakeoutMessage as TakeoutMessageDB
+from chronovista.parsers.takeout_message_parser import (
+    MessageDigest,
+    MessageFilter,
+    MessageKind,
+    SortOrder,
+    TakeoutMessage,
+)
+from chronovista.repositories.transcript_segment_repository import (
+    _escape_like_pattern,
+)
+
+#: Rows per upsert statement. Bound as six arrays, so asyncpg's bind-parameter
+#: cap does not apply; the size only bounds one statement's memory.
+STORE_BATCH_SIZE = 5_000
+
+
+class TakeoutMessageRepository:
+    """Bulk storage and peek queries for ``takeout_messages``."""
+
+    async def store(
+        self, session: AsyncSession, messages: Sequence[TakeoutMessage]
+    ) -> int:
+        """Upsert one batch of messages.
+
+        A message already stored under the same ``(kind, message_id)`` takes
+        the new values, so storing a newer export refreshes edited text. IDs
+        repeated within the batch keep their last occurrence.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Session to write through; the caller commits.
+        messages : Sequence[TakeoutMessage]
+            The batch; callers chunk by :data:`STORE_BATCH_SIZE`.
+
+        Returns
+        -------
+        int
+            Distinct messages written.
+        """
+        latest = {(m.kind, m.message_id): m for m in messages if m.message_id}
+        if not latest:
+            return 0
+        rows = list(latest.values())
+
+        # Six array binds + unnest, NOT a row-per-message VALUES (asyncpg's
+        # 32,767 bind-parameter cap).
+        source = (
+            text(
+                "SELECT * FROM unnest(:kinds, :message_ids, :video_ids, "
+                ":channel_ids, :posted_ats, :message_texts) "
+                "AS t(kind, message_id, video_id, channel_id, posted_at, "
+                "message_text)"
+            )
+            .bindparams(
+                bindparam("kinds", [m.kind for m in rows], type_=ARRAY(String)),
+                bindparam(
+                    "message_ids", [m.message_id for m in rows], type_=ARRAY(Text)
+                ),
+                bindparam("video_ids", [m.video_id for m in rows], type_=ARRAY(Text)),
+                bindparam(
+                    "channel_ids", [m.channel_id for m in rows], type_=ARRAY(Text)
+                ),
+                bindparam(
+                    "posted_ats",
+                    [m.posted_at for m in rows],
+                    type_=ARRAY(DateTime(timezone=True)),
+                ),
+                bindparam("message_texts", [m.text for m in rows], type_=ARRAY(Text)),
+            )
+            .columns(
+                TakeoutMessageDB.kind,
+                TakeoutMessageDB.message_id,
+                TakeoutMessageDB.video_id,
+                TakeoutMessageDB.channel_id,
+                TakeoutMessageDB.posted_at,
+                TakeoutMessageDB.message_text,
+            )
+            .subquery("t")
+        )
+        columns = [
+            "kind",
+            "message_id",
+            "video_id",
+            "channel_id",
+            "posted_at",
+            "message_text",
+        ]
+        stmt = pg_insert(TakeoutMessageDB).from_select(
+            columns, select(*(source.c[name] for name in columns))
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["kind", "message_id"],
+            set_={
+                name: stmt.excluded[name]
+                for name in ("video_id", "channel_id", "posted_at", "message_text")
+            },
+        )
+        await session.execute(stmt)
+        return len(rows)
+
+    async def store_all(
+        self,
+        session: AsyncSession,
+        messages: Iterable[TakeoutMessage],
+        *,
+        batch_size: int = STORE_BATCH_SIZE,
+    ) -> int:
+        """Upsert a stream of messages in batches of *batch_size*."""
+        written = 0
+        batch: list[TakeoutMessage] = []
+        for message in messages:
+            batch.append(message)
+            if len(batch) >= batch_size:
+                written += await self.store(session, batch)
+                batch = []
+        if batch:
+            written += await self.store(session, batch)
+        return written
+
+    async def count(self, session: AsyncSession, kind: MessageKind) -> int:
+        """Count the stored messages of one kind."""
+        result = await session.execute(
+            select(func.count()).where(TakeoutMessageDB.kind == kind)
+        )
+        return int(result.scalar_one())
+
+    async def summarise(
+        self,
+        session: AsyncSession,
+        kind: MessageKind,
+        message_filter: MessageFilter,
+        *,
+        limit: int | None,
+        sort_order: SortOrder = "default",
+    ) -> MessageDigest:
+        """Answer a peek from the stored messages.
+
+        Returns the same digest a CSV pass builds: the totals and date range
+        in one aggregate, the per-video counts grouped on
+        ``ix_takeout_messages_kind_video_id``, and the top *limit* rows in
+        *sort_order*. Stored rows have no export order, so ``default`` lists
+        them oldest first.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Database session.
+        kind : MessageKind
+            Comments or live chats.
+        message_filter : MessageFilter
+            Text and date bounds, applied as in :func:`iter_takeout_messages`.
+        limit : int | None
+            Rows to return; None returns every match.
+        sort_order : SortOrder
+            ``recent``, ``oldest`` or ``default``.
+
+        Returns
+        -------
+        MessageDigest
+            The digest of the matching messages.
+        """
+        conditions = self._conditions(kind, message_filter)
+
+        totals = (
+            await session.execute(
+                select(
+                    func.count(),
+                    func.min(TakeoutMessageDB.posted_at),
+                    func.max(TakeoutMessageDB.posted_at),
+                ).where(*conditions)
+            )
+        ).one()
+        video_counts = (
+            await session.execute(
+                select(TakeoutMessageDB.video_id, func.count())
+                .where(*conditions, TakeoutMessageDB.video_id != "")
+                .group_by(TakeoutMessageDB.video_id)
+            )
+        ).all()
+
+        if sort_order == "recent":
+            order: tuple[Any, ...] = (
+                TakeoutMessageDB.posted_at.desc().nulls_last(),
+                TakeoutMessageDB.message_id,
+            )
+        else:
+            order = (
+                TakeoutMessageDB.posted_at.asc().nulls_last(),
+                TakeoutMessageDB.message_id,
+            )
+        query = select(TakeoutMessageDB).where(*conditions).order_by(*order)
+        if limit is not None:
+            query = query.limit(limit)
+        stored = (await session.execute(query)).scalars().all()
+
+        return MessageDigest.from_totals(
+            (
+                TakeoutMessage(
+                    kind=kind,
+                    message_id=row.message_id,
+                    video_id=row.video_id,
+                    channel_id=row.channel_id,
+                    posted_at=row.posted_at,
+                    text=row.message_text,
+                )
+                for row in stored
+            ),
+            limit=limit,
+            sort_order=sort_order,
+            total=int(totals[0]),
+            first_posted=totals[1],
+            last_posted=totals[2],
+            video_counts={video_id: int(n) for video_id, n in video_counts},
+        )
+
+    @staticmethod
+    def _conditions(
+        kind: MessageKind, message_filter: MessageFilter
+    ) -> list[ColumnElement[bool]]:
+        """WHERE clauses matching :meth:`MessageFilter.matches`.
+
+        The text filter is a substring match on either column; both carry a
+        trigram index, so the OR is a BitmapOr of two index scans.
+        """
+        conditions: list[ColumnElement[bool]] = [TakeoutMessageDB.kind == kind]
+        if message_filter.since is not None:
+            conditions.append(TakeoutMessageDB.posted_at >= message_filter.since)
+        if message_filter.until is not None:
+            conditions.append(TakeoutMessageDB.posted_at <= message_filter.until)
+        if message_filter.text:
+            pattern = f"%{_escape_like_pattern(message_filter.text)}%"
+            conditions.append(
+                or_(
+                    TakeoutMessageDB.message_text.ilike(pattern),
+                    TakeoutMessageDB.video_id.ilike(pattern),
+                )
+            )
+        return conditions
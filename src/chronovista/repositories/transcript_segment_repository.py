@@ -12,13 +12,35 @@ from __future__ import annotations
 
 import re
 from collections.abc import Sequence
-
-from sqlalchemy import ColumnElement, and_, case, delete, distinct, func, or_, select
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Select,
+    and_,
+    bindparam,
+    case,
+    distinct,
+    func,
+    literal,
+    or_,
+    select,
+    true,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from chronovista.db.entity_associations import queue_association_refresh
 from chronovista.db.models import TranscriptSegment as TranscriptSegmentDB
+from chronovista.db.models import TranscriptSegmentSeam as TranscriptSegmentSeamDB
 from chronovista.db.models import Video as VideoDB
+from chronovista.db.segment_changes import logged_segment_delete
+from chronovista.db.segment_seams import seam_boundary_condition
 from chronovista.models.transcript_segment import TranscriptSegmentCreate
+from chronovista.models.transcript_source import canonical_language_code
 from chronovista.models.youtube_types import VideoId
 from chronovista.repositories.base import BaseSQLAlchemyRepository
 
@@ -107,6 +129,73 @@ def _escape_like_pattern(text: str) -> str:
     return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
+def _at_time_probe(
+    video_id: str, language_code: str, timestamp: Any
+) -> Select[tuple[TranscriptSegmentDB]]:
+    """Build the ``LIMIT 1`` select that picks the segment at *timestamp*.
+
+    The first row is:
+
+    1. the latest-starting segment whose half-open interval
+       ``[start_time, end_time)`` contains the timestamp; otherwise
+    2. the segment that ended most recently at or before the timestamp
+       (gap handling).
+
+    Each case is its own ``LIMIT 1`` probe read in index order, combined with
+    ``UNION ALL``:
+
+    - the containing probe walks ``idx_transcript_segments_time_range``
+      backwards from the timestamp and stops at the first entry whose
+      ``end_time`` is past it, which is normally the first entry read; in a
+      gap it walks back over index entries only, never the heap;
+    - the gap probe reads one entry of ``idx_transcript_segments_end_lookup``.
+
+    The outer ``ORDER BY`` only ranks the (at most two) probe rows.
+
+    Parameters
+    ----------
+    video_id : str
+        YouTube video ID.
+    language_code : str
+        Canonical language code.
+    timestamp : Any
+        A float or a column expression (for the lateral batch lookup).
+
+    Returns
+    -------
+    Select[tuple[TranscriptSegmentDB]]
+        The probe, selecting at most one segment.
+    """
+    scope = (
+        TranscriptSegmentDB.video_id == video_id,
+        TranscriptSegmentDB.language_code == language_code,
+    )
+    containing = (
+        select(TranscriptSegmentDB, literal(0).label("probe_rank"))
+        .where(
+            *scope,
+            TranscriptSegmentDB.start_time <= timestamp,
+            TranscriptSegmentDB.end_time > timestamp,
+        )
+        .order_by(TranscriptSegmentDB.start_time.desc())
+        .limit(1)
+        .correlate_except(TranscriptSegmentDB)
+    )
+    preceding = (
+        select(TranscriptSegmentDB, literal(1).label("probe_rank"))
+        .where(*scope, TranscriptSegmentDB.end_time <= timestamp)
+        .order_by(TranscriptSegmentDB.end_time.desc())
+        .limit(1)
+        .correlate_except(TranscriptSegmentDB)
+    )
+    probes = union_all(containing, preceding).subquery("probes")
+    return (
+        select(aliased(TranscriptSegmentDB, probes))
+        .order_by(probes.c.probe_rank)
+        .limit(1)
+    )
+
+
 class TranscriptSegmentRepository(
     BaseSQLAlchemyRepository[
         TranscriptSegmentDB,
@@ -219,43 +308,88 @@ class TranscriptSegmentRepository(
 
         Gap handling: if timestamp falls between two segments (gap),
         returns the previous segment that ended before the timestamp.
+
+        Both cases are resolved in a single round-trip of two index-ordered
+        ``LIMIT 1`` probes; see :func:`_at_time_probe`.
         """
-        # First, try exact match with half-open interval [start, end)
-        stmt = (
-            select(TranscriptSegmentDB)
-            .where(
-                and_(
-                    TranscriptSegmentDB.video_id == str(video_id),
-                    TranscriptSegmentDB.language_code == language_code,
-                    TranscriptSegmentDB.start_time <= timestamp,
-                    TranscriptSegmentDB.end_time > timestamp,
-                )
-            )
-            .order_by(TranscriptSegmentDB.start_time.desc())
-            .limit(1)
+        stmt = _at_time_probe(
+            str(video_id), canonical_language_code(language_code), timestamp
         )
         result = await session.execute(stmt)
-        segment = result.scalar_one_or_none()
+        return result.scalar_one_or_none()
 
-        if segment:
-            return segment
+    async def get_segments_at_times(
+        self,
+        session: AsyncSession,
+        video_id: VideoId,
+        language_code: str,
+        timestamps: Sequence[float],
+    ) -> dict[float, TranscriptSegmentDB | None]:
+        """
+        Resolve many timestamps in one video to their segments in one query.
 
-        # If no exact match, timestamp might be in a gap - return previous segment
-        # Find the segment that ends at or before the timestamp
-        stmt = (
-            select(TranscriptSegmentDB)
-            .where(
-                and_(
-                    TranscriptSegmentDB.video_id == str(video_id),
-                    TranscriptSegmentDB.language_code == language_code,
-                    TranscriptSegmentDB.end_time <= timestamp,
+        Each timestamp is resolved with exactly the semantics of
+        :meth:`get_segment_at_time`. Intended for scrubbing and for mapping
+        many positions (e.g. entity mentions) to segments without a
+        round-trip per timestamp.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Database session.
+        video_id : VideoId
+            YouTube video ID.
+        language_code : str
+            BCP-47 language code.
+        timestamps : Sequence[float]
+            Times in seconds. Duplicates are resolved once.
+
+        Returns
+        -------
+        dict[float, TranscriptSegmentDB | None]
+            Mapping of every requested timestamp to its segment, or None when
+            the timestamp precedes the first segment.
+
+        Notes
+        -----
+        The timestamps are bound as a single ``float8[]`` and expanded with
+        ``unnest``; a ``LEFT JOIN LATERAL`` runs the single-timestamp lookup
+        once per element, so each element costs the two index-ordered probes
+        of :func:`_at_time_probe` and the bind count stays constant regardless
+        of how many timestamps are requested.
+        """
+        requested = list(dict.fromkeys(float(t) for t in timestamps))
+        if not requested:
+            return {}
+
+        language_code = canonical_language_code(language_code)
+        requested_times = (
+            func.unnest(
+                bindparam(
+                    "requested_timestamps",
+                    value=requested,
+                    type_=ARRAY(Float),
+                    unique=True,
                 )
             )
-            .order_by(TranscriptSegmentDB.end_time.desc())
-            .limit(1)
+            .table_valued("ts")
+            .render_derived(name="requested")
+        )
+        at_time = _at_time_probe(
+            str(video_id), language_code, requested_times.c.ts
+        ).lateral("segment_at_time")
+        segment = aliased(TranscriptSegmentDB, at_time)
+        stmt = (
+            select(requested_times.c.ts, segment)
+            .select_from(requested_times)
+            .outerjoin(at_time, true())
         )
         result = await session.execute(stmt)
-        return result.scalar_one_or_none()
+
+        resolved: dict[float, TranscriptSegmentDB | None] = dict.fromkeys(requested)
+        for ts, matched in result.all():
+            resolved[float(ts)] = matched
+        return resolved
 
     async def get_segments_in_range(
         self,
@@ -298,6 +432,7 @@ class TranscriptSegmentRepository(
         Zero-duration segments at the boundary may or may not be included
         depending on the exact boundary conditions.
         """
+        language_code = canonical_language_code(language_code)
         stmt = (
             select(TranscriptSegmentDB)
             .where(
@@ -383,12 +518,14 @@ class TranscriptSegmentRepository(
         Notes
         -----
         Uses session.add_all() for efficient bulk insertion.
+        Language codes are canonicalized on write so that lookups can
+        compare ``language_code`` directly against the composite indexes.
         The caller is responsible for committing the transaction.
         """
         db_segments = [
             TranscriptSegmentDB(
                 video_id=str(seg.video_id),
-                language_code=seg.language_code,
+                language_code=canonical_language_code(seg.language_code),
                 text=seg.text,
                 start_time=seg.start_time,
                 duration=seg.duration,
@@ -433,13 +570,15 @@ class TranscriptSegmentRepository(
         returns 0 without error. The caller is responsible for committing
         the transaction.
         """
-        stmt = delete(TranscriptSegmentDB).where(
-            and_(
-                TranscriptSegmentDB.video_id == str(video_id),
-                TranscriptSegmentDB.language_code == language_code,
-            )
+        language_code = canonical_language_code(language_code)
+        stmt = logged_segment_delete(
+            TranscriptSegmentDB.video_id == str(video_id),
+            TranscriptSegmentDB.language_code == language_code,
         )
         result = await session.execute(stmt)
+        if result.rowcount:
+            # The delete cascades to the segments' transcript mentions.
+            queue_association_refresh(session, video_ids=[str(video_id)])
         return result.rowcount
 
     async def get_segments_for_transcript(
@@ -829,5 +968,84 @@ class TranscriptSegmentRepository(
         result = await session.execute(stmt)
         return result.scalars().all()
 
+    async def find_segments_at_seams(
+        self,
+        session: AsyncSession,
+        *,
+        boundaries: Sequence[tuple[str | None, str | None]],
+        language: str | None = None,
+        channel: str | None = None,
+        video_ids: list[str] | None = None,
+    ) -> Sequence[TranscriptSegmentDB]:
+        """
+        Return both segments of every adjacent pair whose seam matches a boundary.
+
+        Each boundary is a ``(tail, head)`` split: segment N must end with
+        *tail* and segment N+1 must start with *head* (either side may be None
+        to leave it unconstrained). The lookup runs against the
+        ``transcript_segment_seams`` index, so it is a candidate filter —
+        case-folded and truncated to a few words — and callers must re-check
+        the effective text. It never omits a pair whose effective text
+        satisfies a boundary.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Database session.
+        boundaries : Sequence[tuple[str | None, str | None]]
+            ``(tail, head)`` splits to look up. Splits constraining neither
+            side are ignored; if none remain the result is empty.
+        language : str, optional
+            Filter by language_code column.
+        channel : str, optional
+            Filter by channel_id via join to videos table.
+        video_ids : list of str, optional
+            Filter by video_id column (list of video IDs).
+
+        Returns
+        -------
+        Sequence[TranscriptSegmentDB]
+            Matching segments ordered by
+            ``(video_id, language_code, sequence_number)``, the same order as
+            ``find_segments_in_scope()`` so the cross-segment pairing logic
+            can consume either.
+        """
+        seam_conditions = [
+            condition
+            for tail, head in boundaries
+            if (condition := seam_boundary_condition(tail, head)) is not None
+        ]
+        if not seam_conditions:
+            return []
+
+        seam_match = or_(*seam_conditions)
+        seam_segment_ids = (
+            select(TranscriptSegmentSeamDB.segment_n_id)
+            .where(seam_match)
+            .union(select(TranscriptSegmentSeamDB.segment_n1_id).where(seam_match))
+        )
+
+        conditions: list[ColumnElement[bool]] = [
+            TranscriptSegmentDB.id.in_(seam_segment_ids)
+        ]
+        if language is not None:
+            conditions.append(TranscriptSegmentDB.language_code == language)
+        if video_ids is not None:
+            conditions.append(TranscriptSegmentDB.video_id.in_(video_ids))
+
+        stmt = select(TranscriptSegmentDB)
+        if channel is not None:
+            stmt = stmt.join(
+                VideoDB, TranscriptSegmentDB.video_id == VideoDB.video_id
+            ).where(VideoDB.channel_id == channel)
+        stmt = stmt.where(and_(*conditions)).order_by(
+            TranscriptSegmentDB.video_id,
+            TranscriptSegmentDB.language_code,
+            TranscriptSegmentDB.sequence_number,
+        )
+
+        result = await session.execute(stmt)
+        return result.scalars().all()
+
 
 __all__ = ["TranscriptSegmentRepository"]
@@ -8,15 +8,34 @@ integration, watch history tracking, and specialized analytics queries.
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
-from typing import Any
-
-from sqlalchemy import and_, delete, desc, func, or_, select, update
+from io import BufferedIOBase
+from typing import Any, cast
+
+from sqlalchemy import (
+    ColumnElement,
+    CursorResult,
+    DateTime,
+    and_,
+    case,
+    delete,
+    desc,
+    func,
+    literal,
+    or_,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
 from ..db.models import PlaylistMembership as PlaylistMembershipDB
 from ..db.models import UserVideo as UserVideoDB
+from ..db.models import UserWatchDaily, UserWatchHourly
+from ..db.watch_rollups import queue_full_refresh, rebuild_statements
 from ..models.app_identity import IdentityInvariants, MergeStats
 from ..models.user_video import (
     GoogleTakeoutWatchHistoryItem,
@@ -28,6 +47,24 @@ from ..models.user_video import (
 from ..models.youtube_types import UserId, VideoId
 from .base import BaseSQLAlchemyRepository
 
+# Placeholder rows moved per statement by merge_user_identity.
+MERGE_CHUNK_SIZE = 5_000
+
+# Both sides of an identity merge (see copy_merge_pre_image). $1 is the
+# placeholder ids, $2 the survivor.
+_PRE_IMAGE_QUERY = """
+    SELECT user_id, video_id, watched_at, rewatch_count, liked, saved_to_playlist
+    FROM user_videos
+    WHERE user_id = ANY($1::text[])
+       OR (
+           user_id = $2
+           AND video_id IN (
+               SELECT video_id FROM user_videos WHERE user_id = ANY($1::text[])
+           )
+       )
+    ORDER BY user_id, video_id
+"""
+
 
 def watched_video_ids() -> Any:
     """Return a subquery of every distinct video id that has been watched.
@@ -399,19 +436,11 @@ class UserVideoRepository(
                 unique_videos=0,
             )
 
-        # Get most active date
+        # Get most active date (from the daily rollup: one row per active day)
         most_watched_result = await session.execute(
-            select(
-                func.date(UserVideoDB.watched_at).label("watch_date"),
-                func.count().label("count"),
-            )
-            .where(
-                and_(
-                    UserVideoDB.user_id == user_id, UserVideoDB.watched_at.is_not(None)
-                )
-            )
-            .group_by(func.date(UserVideoDB.watched_at))
-            .order_by(desc("count"))
+            select(UserWatchDaily.watch_date, UserWatchDaily.watch_count)
+            .where(UserWatchDaily.user_id == user_id)
+            .order_by(desc(UserWatchDaily.watch_count))
             .limit(1)
         )
 
@@ -449,16 +478,11 @@ class UserVideoRepository(
         int
             Number of consecutive days with watch activity
         """
-        # Get distinct watch dates for the user, ordered by most recent
+        # Active days for the user from the daily rollup, most recent first
         result = await session.execute(
-            select(func.date(UserVideoDB.watched_at).label("watch_date"))
-            .where(
-                and_(
-                    UserVideoDB.user_id == user_id, UserVideoDB.watched_at.is_not(None)
-                )
-            )
-            .distinct()
-            .order_by(desc("watch_date"))
+            select(UserWatchDaily.watch_date.label("watch_date"))
+            .where(UserWatchDaily.user_id == user_id)
+            .order_by(desc(UserWatchDaily.watch_date))
             .limit(365)  # Look at last year max
         )
 
@@ -711,6 +735,7 @@ class UserVideoRepository(
         result = await session.execute(
             delete(UserVideoDB).where(UserVideoDB.user_id == user_id)
         )
+        queue_full_refresh(session, user_id)
         return result.rowcount
 
     async def get_watch_count_by_date_range(
@@ -739,24 +764,88 @@ class UserVideoRepository(
         Dict[str, int]
             Video watch count by date (YYYY-MM-DD format)
         """
+        # Hours wholly inside [start_date, end_date] are summed from the
+        # hourly rollup; watches in the partial hours at either end are
+        # counted from user_videos. Hours are truncated in SQL so they line
+        # up with the rollup buckets (session time zone).
+        start = literal(start_date, DateTime(timezone=True))
+        end = literal(end_date, DateTime(timezone=True))
+        start_hour = func.date_trunc("hour", start, type_=DateTime(timezone=True))
+        first_full_hour = case(
+            (start_hour < start, start_hour + timedelta(hours=1)), else_=start_hour
+        )
+        last_hour = func.date_trunc("hour", end, type_=DateTime(timezone=True))
+
+        full_hours = select(
+            func.date(UserWatchHourly.watch_hour).label("watch_date"),
+            UserWatchHourly.watch_count.label("watch_count"),
+        ).where(
+            UserWatchHourly.user_id == user_id,
+            UserWatchHourly.watch_hour >= first_full_hour,
+            UserWatchHourly.watch_hour < last_hour,
+        )
+        # Two index ranges on (user_id, watched_at); the second starts no
+        # earlier than the first ends, so a range inside one hour is counted
+        # once.
+        edge_watches = select(
+            func.date(UserVideoDB.watched_at).label("watch_date"),
+            literal(1).label("watch_count"),
+        ).where(
+            UserVideoDB.user_id == user_id,
+            UserVideoDB.watched_at >= start,
+            UserVideoDB.watched_at <= end,
+            or_(
+                UserVideoDB.watched_at < first_full_hour,
+                UserVideoDB.watched_at >= func.greatest(last_hour, first_full_hour),
+            ),
+        )
+        counted = union_all(full_hours, edge_watches).subquery("counted")
         result = await session.execute(
             select(
-                func.date(UserVideoDB.watched_at).label("watch_date"),
-                func.count(UserVideoDB.video_id).label("video_count"),
-            )
-            .where(
-                and_(
-                    UserVideoDB.user_id == user_id,
-                    UserVideoDB.watched_at >= start_date,
-                    UserVideoDB.watched_at <= end_date,
-                )
+                counted.c.watch_date,
+                func.sum(counted.c.watch_count).label("video_count"),
             )
-            .group_by(func.date(UserVideoDB.watched_at))
-            .order_by("watch_date")
+            .group_by(counted.c.watch_date)
+            .order_by(counted.c.watch_date)
         )
 
         return {str(row.watch_date): int(row.video_count or 0) for row in result}
 
+    async def rebuild_watch_rollups(
+        self, session: AsyncSession, user_id: UserId | None = None
+    ) -> dict[str, int]:
+        """
+        Recompute the daily and hourly watch rollups from ``user_videos``.
+
+        Writes are normally rolled up incrementally at commit time (see
+        ``chronovista.db.watch_rollups``); this is the backfill and repair path.
+        Does not commit.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Database session
+        user_id : Optional[UserId]
+            Rebuild only this user; ``None`` rebuilds every user
+
+        Returns
+        -------
+        Dict[str, int]
+            Rollup rows written, keyed by table name
+        """
+        written: dict[str, int] = {}
+        delete_daily, insert_daily, delete_hourly, insert_hourly = rebuild_statements(
+            user_id
+        )
+        for table, delete_stmt, insert_stmt in (
+            ("user_watch_daily", delete_daily, insert_daily),
+            ("user_watch_hourly", delete_hourly, insert_hourly),
+        ):
+            await session.execute(delete_stmt)
+            result = cast(CursorResult[Any], await session.execute(insert_stmt))
+            written[table] = int(result.rowcount or 0)
+        return written
+
     async def sync_saved_to_playlist_flags(self, session: AsyncSession) -> int:
         """
         Sync saved_to_playlist flags based on playlist_memberships table.
@@ -848,19 +937,20 @@ class UserVideoRepository(
             rewatch_sum=int(rewatch or 0),
         )
 
-    async def dump_merge_pre_image(
+    async def copy_merge_pre_image(
         self,
         session: AsyncSession,
         *,
         survivor_user_id: str,
         placeholder_user_ids: list[str],
-    ) -> list[dict[str, Any]]:
-        """Return every ``user_videos`` row the merge will change, as plain dicts.
+        output: BufferedIOBase,
+    ) -> int:
+        """Stream every ``user_videos`` row the merge will change into *output*.
 
         This is **both sides of the merge**, not only the rows that disappear:
 
         - every row under ``placeholder_user_ids`` (deleted or re-keyed), and
-        - the ``survivor_user_id`` rows that overlap them, because step 1 of
+        - the ``survivor_user_id`` rows that overlap them, because
           :meth:`merge_user_identity` overwrites those in place via
           ``GREATEST``/``OR``.
 
@@ -869,42 +959,44 @@ class UserVideoRepository(
         loses to a newer placeholder timestamp has its original value written
         over, and that value then exists nowhere else.
 
-        ``watched_at`` is ISO-formatted for JSON safety; rows are ordered by
+        Written with ``COPY ... TO STDOUT`` as CSV with a header row, in the
+        session's transaction, chunk by chunk as the server sends it, so memory
+        does not grow with the history. Rows are ordered by
         ``(user_id, video_id)`` so successive pre-images are diffable.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Database session (asyncpg).
+        survivor_user_id : str
+            The identity the placeholders merge into.
+        placeholder_user_ids : list[str]
+            The identities being merged away.
+        output : BufferedIOBase
+            Binary file object the CSV is written to (e.g. a ``gzip`` file).
+
+        Returns
+        -------
+        int
+            Number of rows written.
         """
         if not placeholder_user_ids:
-            return []
-        placeholder_videos = select(UserVideoDB.video_id).where(
-            UserVideoDB.user_id.in_(placeholder_user_ids)
-        )
-        result = await session.execute(
-            select(UserVideoDB)
-            .where(
-                or_(
-                    UserVideoDB.user_id.in_(placeholder_user_ids),
-                    and_(
-                        UserVideoDB.user_id == survivor_user_id,
-                        UserVideoDB.video_id.in_(placeholder_videos),
-                    ),
-                )
-            )
-            .order_by(UserVideoDB.user_id, UserVideoDB.video_id)
+            return 0
+        connection = await session.connection()
+        raw = await connection.get_raw_connection()
+        # The asyncpg connection, already inside the session's transaction.
+        driver = raw.driver_connection
+        assert driver is not None
+        status = await driver.copy_from_query(
+            _PRE_IMAGE_QUERY,
+            placeholder_user_ids,
+            survivor_user_id,
+            output=output,
+            format="csv",
+            header=True,
         )
-        rows: list[dict[str, Any]] = []
-        for uv in result.scalars().all():
-            rows.append(
-                {
-                    "user_id": uv.user_id,
-                    "video_id": uv.video_id,
-                    "watched_at": (
-                        uv.watched_at.isoformat() if uv.watched_at else None
-                    ),
-                    "rewatch_count": uv.rewatch_count,
-                    "liked": uv.liked,
-                    "saved_to_playlist": uv.saved_to_playlist,
-                }
-            )
-        return rows
+        # asyncpg returns the command tag, e.g. "COPY 42".
+        return int(str(status).rsplit(" ", 1)[-1])
 
     async def merge_user_identity(
         self,
@@ -912,80 +1004,134 @@ class UserVideoRepository(
         *,
         from_user_id: str,
         to_user_id: str,
+        chunk_size: int = MERGE_CHUNK_SIZE,
+        progress_callback: Callable[[int], None] | None = None,
     ) -> MergeStats:
         """Merge all ``from_user_id`` rows into ``to_user_id`` (survivor).
 
-        Set-based, three steps (research R2), never skip-on-conflict:
-        1. Merge overlapping rows into the survivor — per shared video, keep the
-           latest ``watched_at`` (``GREATEST`` ignores NULL in PostgreSQL),
-           logical-OR of ``liked``/``saved_to_playlist``, and the greatest
+        Set-based and never skip-on-conflict (research R2), run over the
+        placeholder's rows in ``video_id`` order, ``chunk_size`` at a time, so
+        each statement's work and result are bounded however long the history
+        is. Per chunk:
+
+        1. Upsert the placeholder rows under the survivor with
+           ``INSERT ... SELECT ... ON CONFLICT DO UPDATE``. A new key is a
+           re-key; a conflicting one merges per shared video -- the latest
+           ``watched_at`` (``GREATEST`` ignores NULL in PostgreSQL), logical-OR
+           of ``liked``/``saved_to_playlist`` and the greatest
            ``rewatch_count``.
-        2. Delete the now-merged (overlapping) placeholder rows.
-        3. Re-key the remaining (non-overlapping) placeholder rows to the
+        2. Delete the chunk's placeholder rows, all of which now live under the
            survivor.
 
         Does not commit — the caller wraps this in a transaction with
         before/after invariant checks and a pre-image (see IdentityService).
-        """
-        placeholder = aliased(UserVideoDB)
 
-        def _from_col(col: Any) -> Any:
-            return (
-                select(col)
-                .where(
-                    placeholder.user_id == from_user_id,
-                    placeholder.video_id == UserVideoDB.video_id,
-                )
-                .scalar_subquery()
-            )
-
-        overlap_exists = (
-            select(placeholder.video_id)
-            .where(
-                placeholder.user_id == from_user_id,
-                placeholder.video_id == UserVideoDB.video_id,
-            )
-            .exists()
-        )
+        Parameters
+        ----------
+        session : AsyncSession
+            Database session.
+        from_user_id : str
+            The placeholder identity merged away.
+        to_user_id : str
+            The surviving identity.
+        chunk_size : int
+            Placeholder rows per chunk.
+        progress_callback : Callable[[int], None] or None, optional
+            Called after each chunk with the number of placeholder rows it
+            moved.
 
-        # Step 1: merge overlaps into the survivor.
-        merge_result = await session.execute(
-            update(UserVideoDB)
-            .where(UserVideoDB.user_id == to_user_id, overlap_exists)
-            .values(
-                watched_at=func.greatest(
-                    UserVideoDB.watched_at, _from_col(placeholder.watched_at)
-                ),
-                liked=or_(UserVideoDB.liked, _from_col(placeholder.liked)),
-                saved_to_playlist=or_(
+        Returns
+        -------
+        MergeStats
+            ``merged``/``deleted`` count the overlapping rows (merged into the
+            survivor, then deleted), ``rekeyed`` the rows moved as they were.
+        """
+        survivor = aliased(UserVideoDB)
+        merged = rekeyed = 0
+        lower: str | None = None
+        while True:
+            in_chunk: list[ColumnElement[bool]] = [UserVideoDB.user_id == from_user_id]
+            if lower is not None:
+                in_chunk.append(UserVideoDB.video_id > lower)
+            # The chunk's last key: an index range over the primary key.
+            upper = (
+                await session.execute(
+                    select(UserVideoDB.video_id)
+                    .where(*in_chunk)
+                    .order_by(UserVideoDB.video_id)
+                    .offset(chunk_size - 1)
+                    .limit(1)
+                )
+            ).scalar_one_or_none()
+            if upper is not None:
+                in_chunk.append(UserVideoDB.video_id <= upper)
+
+            overlap = (
+                await session.execute(
+                    select(func.count())
+                    .select_from(UserVideoDB)
+                    .where(
+                        *in_chunk,
+                        select(survivor.video_id)
+                        .where(
+                            survivor.user_id == to_user_id,
+                            survivor.video_id == UserVideoDB.video_id,
+                        )
+                        .exists(),
+                    )
+                )
+            ).scalar_one()
+
+            upsert = pg_insert(UserVideoDB).from_select(
+                [
+                    "user_id",
+                    "video_id",
+                    "watched_at",
+                    "rewatch_count",
+                    "liked",
+                    "saved_to_playlist",
+                    "created_at",
+                ],
+                select(
+                    literal(to_user_id),
+                    UserVideoDB.video_id,
+                    UserVideoDB.watched_at,
+                    UserVideoDB.rewatch_count,
+                    UserVideoDB.liked,
                     UserVideoDB.saved_to_playlist,
-                    _from_col(placeholder.saved_to_playlist),
-                ),
-                rewatch_count=func.greatest(
-                    UserVideoDB.rewatch_count, _from_col(placeholder.rewatch_count)
-                ),
+                    UserVideoDB.created_at,
+                ).where(*in_chunk),
             )
-        )
-        merged = merge_result.rowcount
-
-        # Step 2: delete the overlapping placeholder rows (already merged in).
-        survivor_video_ids = select(UserVideoDB.video_id).where(
-            UserVideoDB.user_id == to_user_id
-        )
-        delete_result = await session.execute(
-            delete(UserVideoDB).where(
-                UserVideoDB.user_id == from_user_id,
-                UserVideoDB.video_id.in_(survivor_video_ids),
+            upsert = upsert.on_conflict_do_update(
+                index_elements=["user_id", "video_id"],
+                set_={
+                    "watched_at": func.greatest(
+                        UserVideoDB.watched_at, upsert.excluded.watched_at
+                    ),
+                    "liked": or_(UserVideoDB.liked, upsert.excluded.liked),
+                    "saved_to_playlist": or_(
+                        UserVideoDB.saved_to_playlist,
+                        upsert.excluded.saved_to_playlist,
+                    ),
+                    "rewatch_count": func.greatest(
+                        UserVideoDB.rewatch_count, upsert.excluded.rewatch_count
+                    ),
+                    "updated_at": func.now(),
+                },
             )
-        )
-        deleted = delete_result.rowcount
+            moved = (await session.execute(upsert)).rowcount
+            await session.execute(delete(UserVideoDB).where(*in_chunk))
+
+            merged += overlap
+            rekeyed += moved - overlap
+            if progress_callback is not None and moved:
+                progress_callback(moved)
+            if upper is None:
+                break
+            lower = upper
 
-        # Step 3: re-key the remaining (non-overlapping) placeholder rows.
-        rekey_result = await session.execute(
-            update(UserVideoDB)
-            .where(UserVideoDB.user_id == from_user_id)
-            .values(user_id=to_user_id)
-        )
-        rekeyed = rekey_result.rowcount
+        # Core writes bypass the rollup hooks; rebuild both users at commit.
+        queue_full_refresh(session, from_user_id)
+        queue_full_refresh(session, to_user_id)
 
-        return MergeStats(merged=merged, deleted=deleted, rekeyed=rekeyed)
+        return MergeStats(merged=merged, deleted=merged, rekeyed=rekeyed)
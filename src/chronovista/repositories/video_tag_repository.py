@@ -12,6 +12,7 @@ from typing import Any
 from sqlalchemy import and_, delete, desc, func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from chronovista.db.entity_associations import queue_association_refresh
 from chronovista.db.models import TagAlias as TagAliasDB
 from chronovista.db.models import VideoTag as VideoTagDB
 from chronovista.models.video_tag import (
@@ -139,6 +140,7 @@ class VideoTagRepository(
         """Replace all tags for a video with new ones."""
         # Delete existing tags for this video
         await session.execute(delete(VideoTagDB).where(VideoTagDB.video_id == video_id))
+        queue_association_refresh(session, video_ids=[video_id])
 
         # Create new tags
         return await self.bulk_create_video_tags(session, video_id, tags, tag_orders)
@@ -153,6 +155,7 @@ class VideoTagRepository(
         count = result.scalar() or 0
 
         await session.execute(delete(VideoTagDB).where(VideoTagDB.video_id == video_id))
+        queue_association_refresh(session, video_ids=[video_id])
         await session.flush()
 
         return count
@@ -164,7 +167,12 @@ class VideoTagRepository(
         )
         count = result.scalar() or 0
 
-        await session.execute(delete(VideoTagDB).where(VideoTagDB.tag == tag))
+        deleted = await session.execute(
+            delete(VideoTagDB)
+            .where(VideoTagDB.tag == tag)
+            .returning(VideoTagDB.video_id)
+        )
+        queue_association_refresh(session, video_ids=deleted.scalars().all())
         await session.flush()
 
         return count
@@ -7,20 +7,51 @@ quality indicators, and specialized queries for transcript management.
 
 from __future__ import annotations
 
+import json
 import logging
+import zlib
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     pass
 
-from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy import (
+    String,
+    and_,
+    any_,
+    bindparam,
+    case,
+    delete,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.selectable import ScalarSelect
 
+from ..db.entity_associations import queue_association_refresh
 from ..db.models import TranscriptSegment as TranscriptSegmentDB
 from ..db.models import VideoTranscript as VideoTranscriptDB
-from ..models.enums import DownloadReason, LanguageCode, TrackKind, TranscriptType
+from ..db.models import VideoTranscriptRawArchive as RawArchiveDB
+from ..db.segment_changes import logged_segment_delete
+from ..models.enums import (
+    DownloadReason,
+    LanguageCode,
+    TrackKind,
+    TranscriptStorageMode,
+    TranscriptType,
+)
+from ..models.transcript_source import canonical_language_code
 from ..models.video_transcript import (
+    TranscriptCompactionResult,
     TranscriptSearchFilters,
+    TranscriptStorageReport,
     VideoTranscriptCreate,
     VideoTranscriptUpdate,
     VideoTranscriptWithQuality,
@@ -30,6 +61,59 @@ from .base import BaseSQLAlchemyRepository
 
 logger = logging.getLogger(__name__)
 
+_COMPACT = TranscriptStorageMode.COMPACT.value
+_FULL = TranscriptStorageMode.FULL.value
+
+
+def _compress_raw_payload(raw_data: dict[str, Any]) -> bytes:
+    """Serialize raw transcript data to compact JSON and zlib-compress it."""
+    encoded = json.dumps(raw_data, separators=(",", ":"), ensure_ascii=False)
+    return zlib.compress(encoded.encode("utf-8"), 9)
+
+
+def _decompress_raw_payload(payload: bytes) -> dict[str, Any]:
+    """Inverse of ``_compress_raw_payload``."""
+    decoded: dict[str, Any] = json.loads(zlib.decompress(payload).decode("utf-8"))
+    return decoded
+
+
+def _derived_text_subquery(video_id: Any, language_code: Any) -> ScalarSelect[Any]:
+    """
+    Scalar subquery rebuilding a transcript's text from its segments.
+
+    Mirrors ``BatchCorrectionService.rebuild_text``: the effective text of each
+    segment (corrected when a correction is active) joined with single spaces
+    in ``start_time`` order, which for an uncorrected transcript is exactly the
+    ``plain_text`` stored at download time.
+    """
+    effective = func.coalesce(
+        case(
+            (TranscriptSegmentDB.has_correction, TranscriptSegmentDB.corrected_text),
+            else_=TranscriptSegmentDB.text,
+        ),
+        "",
+    )
+    return (
+        select(
+            func.coalesce(
+                func.string_agg(
+                    effective,
+                    aggregate_order_by(
+                        literal(" "),
+                        TranscriptSegmentDB.start_time,
+                        TranscriptSegmentDB.sequence_number,
+                    ),
+                ),
+                "",
+            )
+        )
+        .where(
+            TranscriptSegmentDB.video_id == video_id,
+            TranscriptSegmentDB.language_code == language_code,
+        )
+        .scalar_subquery()
+    )
+
 
 class VideoTranscriptRepository(
     BaseSQLAlchemyRepository[
@@ -68,7 +152,8 @@ class VideoTranscriptRepository(
             select(VideoTranscriptDB).where(
                 and_(
                     VideoTranscriptDB.video_id == video_id,
-                    VideoTranscriptDB.language_code == language_code.lower(),
+                    VideoTranscriptDB.language_code
+                    == canonical_language_code(language_code),
                 )
             )
         )
@@ -103,7 +188,7 @@ class VideoTranscriptRepository(
         language_code: str,
     ) -> VideoTranscriptDB | None:
         """
-        Get a single transcript for a video by language code (case-insensitive).
+        Get a single transcript for a video by language code (any casing).
 
         Parameters
         ----------
@@ -112,7 +197,9 @@ class VideoTranscriptRepository(
         video_id : str
             YouTube video identifier.
         language_code : str
-            BCP-47 language code (matched case-insensitively).
+            BCP-47 language code in any casing.  It is canonicalized before
+            the comparison, so the lookup stays an index probe on the
+            primary key rather than a ``lower()`` scan.
 
         Returns
         -------
@@ -123,8 +210,8 @@ class VideoTranscriptRepository(
             select(VideoTranscriptDB).where(
                 and_(
                     VideoTranscriptDB.video_id == video_id,
-                    func.lower(VideoTranscriptDB.language_code)
-                    == language_code.lower(),
+                    VideoTranscriptDB.language_code
+                    == canonical_language_code(language_code),
                 )
             )
         )
@@ -151,7 +238,8 @@ class VideoTranscriptRepository(
             select(VideoTranscriptDB.video_id).where(
                 and_(
                     VideoTranscriptDB.video_id == video_id,
-                    VideoTranscriptDB.language_code == language_code.lower(),
+                    VideoTranscriptDB.language_code
+                    == canonical_language_code(language_code),
                 )
             )
         )
@@ -179,6 +267,46 @@ class VideoTranscriptRepository(
         """
         return await self.exists(session, (video_id, language_code))
 
+    async def get_stored_language_keys(
+        self, session: AsyncSession, video_ids: list[str]
+    ) -> set[tuple[str, str]]:
+        """
+        Get the stored (video_id, language_code) pairs for many videos at once.
+
+        One query for the whole list, so callers that would otherwise call
+        :meth:`exists` per (video, language) pay a single round trip. The
+        video IDs travel as one array parameter, so the list is not bounded
+        by the driver's bind-parameter limit.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Database session
+        video_ids : List[str]
+            YouTube video identifiers
+
+        Returns
+        -------
+        Set[Tuple[str, str]]
+            Stored pairs, with language codes as stored (see
+            ``canonical_language_code``)
+        """
+        if not video_ids:
+            return set()
+        result = await session.execute(
+            select(VideoTranscriptDB.video_id, VideoTranscriptDB.language_code).where(
+                VideoTranscriptDB.video_id
+                == any_(
+                    bindparam(
+                        "video_ids",
+                        value=list(dict.fromkeys(video_ids)),
+                        type_=ARRAY(String),
+                    )
+                )
+            )
+        )
+        return {(video_id, language_code) for video_id, language_code in result}
+
     async def get_video_transcripts(
         self, session: AsyncSession, video_id: VideoId
     ) -> list[VideoTranscriptDB]:
@@ -230,7 +358,10 @@ class VideoTranscriptRepository(
         """
         query = (
             select(VideoTranscriptDB)
-            .where(VideoTranscriptDB.language_code == language_code.lower())
+            .where(
+                VideoTranscriptDB.language_code
+                == canonical_language_code(language_code)
+            )
             .order_by(VideoTranscriptDB.downloaded_at.desc())
         )
 
@@ -305,7 +436,9 @@ class VideoTranscriptRepository(
 
         # Language filters
         if filters.language_codes:
-            normalized_langs = [lang.lower() for lang in filters.language_codes]
+            normalized_langs = [
+                canonical_language_code(lang) for lang in filters.language_codes
+            ]
             conditions.append(VideoTranscriptDB.language_code.in_(normalized_langs))
 
         # Type filters
@@ -519,7 +652,8 @@ class VideoTranscriptRepository(
             delete(VideoTranscriptDB).where(
                 and_(
                     VideoTranscriptDB.video_id == video_id,
-                    VideoTranscriptDB.language_code == language_code.lower(),
+                    VideoTranscriptDB.language_code
+                    == canonical_language_code(language_code),
                 )
             )
         )
@@ -604,7 +738,7 @@ class VideoTranscriptRepository(
             quality_transcript = VideoTranscriptWithQuality(
                 video_id=transcript.video_id,
                 language_code=self._convert_language_code(transcript.language_code),
-                transcript_text=transcript.transcript_text,
+                transcript_text=await self.get_transcript_text(session, transcript),
                 transcript_type=TranscriptType(transcript.transcript_type),
                 download_reason=DownloadReason(transcript.download_reason),
                 confidence_score=transcript.confidence_score,
@@ -754,6 +888,7 @@ class VideoTranscriptRepository(
         obj_in: VideoTranscriptCreate,
         *,
         raw_transcript_data: dict[str, Any] | None = None,
+        compact: bool = False,
     ) -> VideoTranscriptDB:
         """
         Create or update a transcript with optional raw data.
@@ -768,6 +903,10 @@ class VideoTranscriptRepository(
             Complete raw transcript response including timestamps.
             When provided, derives: has_timestamps, segment_count,
             total_duration, source.
+        compact : bool
+            Store the transcript in compact mode once its segments exist
+            (see ``compact_transcript``). A re-download of a compact
+            transcript is always written in full first.
 
         Returns
         -------
@@ -775,7 +914,7 @@ class VideoTranscriptRepository(
             The created or updated transcript record.
         """
         video_id = obj_in.video_id
-        language_code = obj_in.language_code
+        language_code = canonical_language_code(obj_in.language_code)
 
         # Check for existing transcript
         existing = await self.get_by_composite_key(session, video_id, language_code)
@@ -785,6 +924,8 @@ class VideoTranscriptRepository(
             obj_data = obj_in.model_dump()
         else:
             obj_data = obj_in.dict()
+        obj_data["language_code"] = language_code
+        obj_data["storage_mode"] = _FULL
 
         # Process raw_transcript_data if provided
         if raw_transcript_data is not None:
@@ -847,6 +988,14 @@ class VideoTranscriptRepository(
                 if k not in ("video_id", "language_code")
             }
 
+            if existing.storage_mode == _COMPACT:
+                await session.execute(
+                    delete(RawArchiveDB).where(
+                        RawArchiveDB.video_id == video_id,
+                        RawArchiveDB.language_code == language_code,
+                    )
+                )
+
             db_obj = await self.update(session, db_obj=existing, obj_in=update_fields)
         else:
             # Create new transcript
@@ -865,9 +1014,15 @@ class VideoTranscriptRepository(
 
         # Create segments from raw_transcript_data if provided
         if raw_transcript_data is not None:
-            await self._create_segments_from_raw_data(
+            created = await self._create_segments_from_raw_data(
                 session, video_id, language_code, raw_transcript_data
             )
+            if (
+                compact
+                and created
+                and await self.compact_transcript(session, video_id, language_code)
+            ):
+                await session.refresh(db_obj)
 
         return db_obj
 
@@ -906,6 +1061,7 @@ class VideoTranscriptRepository(
         This follows the same error handling as the backfill migration
         (FR-MIG-15-19).
         """
+        language_code = canonical_language_code(language_code)
         snippets = raw_data.get("snippets", [])
 
         # Skip if snippets is not a list or is empty
@@ -925,26 +1081,25 @@ class VideoTranscriptRepository(
             )
             # Delete any existing segments (idempotent)
             await session.execute(
-                delete(TranscriptSegmentDB).where(
-                    and_(
-                        TranscriptSegmentDB.video_id == video_id,
-                        TranscriptSegmentDB.language_code == language_code,
-                    )
+                logged_segment_delete(
+                    TranscriptSegmentDB.video_id == video_id,
+                    TranscriptSegmentDB.language_code == language_code,
                 )
             )
+            # The delete cascades to the segments' transcript mentions.
+            queue_association_refresh(session, video_ids=[video_id])
             return 0
 
         # Delete existing segments for idempotent operation
         delete_result = await session.execute(
-            delete(TranscriptSegmentDB).where(
-                and_(
-                    TranscriptSegmentDB.video_id == video_id,
-                    TranscriptSegmentDB.language_code == language_code,
-                )
+            logged_segment_delete(
+                TranscriptSegmentDB.video_id == video_id,
+                TranscriptSegmentDB.language_code == language_code,
             )
         )
         deleted_count = delete_result.rowcount
         if deleted_count > 0:
+            queue_association_refresh(session, video_ids=[video_id])
             logger.debug(
                 "Deleted %d existing segments for %s/%s before recreating",
                 deleted_count,
@@ -1160,3 +1315,323 @@ class VideoTranscriptRepository(
             return None
 
         return transcript
+
+    async def derive_transcript_text(
+        self, session: AsyncSession, video_id: str, language_code: str
+    ) -> str:
+        """
+        Rebuild a transcript's full text from its segments.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Database session.
+        video_id : str
+            YouTube video identifier.
+        language_code : str
+            BCP-47 language code.
+
+        Returns
+        -------
+        str
+            Effective segment texts joined by single spaces in time order
+            (empty when the transcript has no segments).
+        """
+        result = await session.execute(
+            select(
+                _derived_text_subquery(video_id, canonical_language_code(language_code))
+            )
+        )
+        return str(result.scalar_one() or "")
+
+    async def get_transcript_text(
+        self, session: AsyncSession, transcript: VideoTranscriptDB
+    ) -> str:
+        """
+        Return a transcript's full text regardless of its storage mode.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Database session.
+        transcript : VideoTranscriptDB
+            The transcript row.
+
+        Returns
+        -------
+        str
+            ``transcript_text`` for full rows, derived from segments for
+            compact rows.
+        """
+        if transcript.storage_mode != _COMPACT:
+            return transcript.transcript_text
+        return await self.derive_transcript_text(
+            session, transcript.video_id, transcript.language_code
+        )
+
+    async def get_raw_transcript_data(
+        self, session: AsyncSession, transcript: VideoTranscriptDB
+    ) -> dict[str, Any] | None:
+        """
+        Return a transcript's raw API payload regardless of its storage mode.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Database session.
+        transcript : VideoTranscriptDB
+            The transcript row.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            ``raw_transcript_data`` for full rows, the decompressed archive
+            payload for compact rows, or None when none was stored.
+        """
+        if transcript.storage_mode != _COMPACT:
+            return transcript.raw_transcript_data
+        result = await session.execute(
+            select(RawArchiveDB.raw_payload).where(
+                RawArchiveDB.video_id == transcript.video_id,
+                RawArchiveDB.language_code == transcript.language_code,
+            )
+        )
+        payload = result.scalar_one_or_none()
+        return _decompress_raw_payload(payload) if payload is not None else None
+
+    async def compact_batch(
+        self,
+        session: AsyncSession,
+        *,
+        batch_size: int = 100,
+        after: tuple[str, str] | None = None,
+        dry_run: bool = False,
+    ) -> TranscriptCompactionResult:
+        """
+        Compact the next batch of full-storage transcripts.
+
+        A transcript is compacted only when it has segments and its stored
+        ``transcript_text`` equals the text derived from them, so compaction
+        never changes what readers see. Rows that differ (for example,
+        corrected transcripts whose text has not been rebuilt yet) are
+        counted as ``skipped_mismatch`` and left untouched.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Database session. The caller commits.
+        batch_size : int
+            Maximum transcripts examined in this batch (default 100).
+        after : Optional[Tuple[str, str]]
+            Resume after this ``(video_id, language_code)`` key; pass the
+            previous result's ``last_key`` to walk the table.
+        dry_run : bool
+            Measure without writing (default False).
+
+        Returns
+        -------
+        TranscriptCompactionResult
+            Counts and byte totals for the batch; ``last_key`` is None when
+            no candidates remained.
+        """
+        conditions: list[Any] = []
+        if after is not None:
+            conditions.append(
+                tuple_(VideoTranscriptDB.video_id, VideoTranscriptDB.language_code)
+                > tuple_(literal(after[0]), literal(after[1]))
+            )
+        return await self._compact_rows(
+            session, conditions, limit=batch_size, dry_run=dry_run
+        )
+
+    async def compact_transcript(
+        self, session: AsyncSession, video_id: str, language_code: str
+    ) -> bool:
+        """
+        Compact a single transcript.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Database session. The caller commits.
+        video_id : str
+            YouTube video identifier.
+        language_code : str
+            BCP-47 language code.
+
+        Returns
+        -------
+        bool
+            True if the transcript was compacted.
+        """
+        result = await self._compact_rows(
+            session,
+            [
+                VideoTranscriptDB.video_id == video_id,
+                VideoTranscriptDB.language_code
+                == canonical_language_code(language_code),
+            ],
+            limit=1,
+        )
+        return result.compacted == 1
+
+    async def _compact_rows(
+        self,
+        session: AsyncSession,
+        conditions: list[Any],
+        *,
+        limit: int,
+        dry_run: bool = False,
+    ) -> TranscriptCompactionResult:
+        """Archive raw data and release inline text for matching full rows."""
+        has_segments = exists().where(
+            TranscriptSegmentDB.video_id == VideoTranscriptDB.video_id,
+            TranscriptSegmentDB.language_code == VideoTranscriptDB.language_code,
+        )
+        stmt = (
+            select(
+                VideoTranscriptDB.video_id,
+                VideoTranscriptDB.language_code,
+                VideoTranscriptDB.transcript_text,
+                VideoTranscriptDB.raw_transcript_data,
+                func.coalesce(
+                    func.pg_column_size(VideoTranscriptDB.transcript_text), 0
+                ),
+                func.coalesce(
+                    func.pg_column_size(VideoTranscriptDB.raw_transcript_data), 0
+                ),
+                _derived_text_subquery(
+                    VideoTranscriptDB.video_id, VideoTranscriptDB.language_code
+                ),
+            )
+            .where(VideoTranscriptDB.storage_mode == _FULL, has_segments, *conditions)
+            .order_by(VideoTranscriptDB.video_id, VideoTranscriptDB.language_code)
+            .limit(limit)
+        )
+        if not dry_run:
+            stmt = stmt.with_for_update(of=VideoTranscriptDB, skip_locked=True)
+        rows = (await session.execute(stmt)).all()
+
+        result = TranscriptCompactionResult()
+        archive_rows: list[dict[str, Any]] = []
+        for video_id, language_code, text, raw, text_bytes, raw_bytes, derived in rows:
+            result.last_key = (video_id, language_code)
+            if text != derived:
+                result.skipped_mismatch += 1
+                continue
+            payload = _compress_raw_payload(raw) if raw is not None else None
+            compressed_bytes = len(payload) if payload is not None else 0
+            archive_rows.append(
+                {
+                    "video_id": video_id,
+                    "language_code": language_code,
+                    "raw_payload": payload,
+                    "raw_bytes": raw_bytes,
+                    "text_bytes": text_bytes,
+                    "compressed_bytes": compressed_bytes,
+                }
+            )
+            result.compacted += 1
+            result.bytes_released += text_bytes + raw_bytes
+            result.bytes_archived += compressed_bytes
+
+        if dry_run or not archive_rows:
+            return result
+
+        insert_stmt = pg_insert(RawArchiveDB)
+        await session.execute(
+            insert_stmt.on_conflict_do_update(
+                index_elements=[RawArchiveDB.video_id, RawArchiveDB.language_code],
+                set_={
+                    "raw_payload": insert_stmt.excluded.raw_payload,
+                    "raw_bytes": insert_stmt.excluded.raw_bytes,
+                    "text_bytes": insert_stmt.excluded.text_bytes,
+                    "compressed_bytes": insert_stmt.excluded.compressed_bytes,
+                    "compacted_at": func.now(),
+                },
+            ),
+            archive_rows,
+        )
+        await session.execute(
+            update(VideoTranscriptDB)
+            .where(
+                tuple_(VideoTranscriptDB.video_id, VideoTranscriptDB.language_code).in_(
+                    [(r["video_id"], r["language_code"]) for r in archive_rows]
+                )
+            )
+            .values(transcript_text="", raw_transcript_data=None, storage_mode=_COMPACT)
+            .execution_options(synchronize_session="fetch")
+        )
+        logger.info(
+            "Compacted %d transcript(s): released %d bytes, archived %d bytes",
+            result.compacted,
+            result.bytes_released,
+            result.bytes_archived,
+        )
+        return result
+
+    async def get_storage_report(
+        self, session: AsyncSession
+    ) -> TranscriptStorageReport:
+        """
+        Summarize transcript storage by mode and the bytes compaction saved.
+
+        Inline sizes use ``pg_column_size`` (the stored, possibly
+        TOAST-compressed size); released sizes were measured the same way at
+        compaction time.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Database session.
+
+        Returns
+        -------
+        TranscriptStorageReport
+            Counts and byte totals.
+        """
+        is_full = VideoTranscriptDB.storage_mode == _FULL
+        has_segments = exists().where(
+            TranscriptSegmentDB.video_id == VideoTranscriptDB.video_id,
+            TranscriptSegmentDB.language_code == VideoTranscriptDB.language_code,
+        )
+        inline = (
+            await session.execute(
+                select(
+                    func.count().filter(is_full),
+                    func.count().filter(VideoTranscriptDB.storage_mode == _COMPACT),
+                    func.count().filter(and_(is_full, has_segments)),
+                    func.coalesce(
+                        func.sum(
+                            func.pg_column_size(VideoTranscriptDB.transcript_text)
+                        ).filter(is_full),
+                        0,
+                    ),
+                    func.coalesce(
+                        func.sum(
+                            func.pg_column_size(VideoTranscriptDB.raw_transcript_data)
+                        ).filter(is_full),
+                        0,
+                    ),
+                )
+            )
+        ).one()
+        archived = (
+            await session.execute(
+                select(
+                    func.coalesce(func.sum(RawArchiveDB.text_bytes), 0),
+                    func.coalesce(func.sum(RawArchiveDB.raw_bytes), 0),
+                    func.coalesce(func.sum(RawArchiveDB.compressed_bytes), 0),
+                )
+            )
+        ).one()
+        return TranscriptStorageReport(
+            full_transcripts=inline[0],
+            compact_transcripts=inline[1],
+            compactable_transcripts=inline[2],
+            inline_text_bytes=int(inline[3]),
+            inline_raw_bytes=int(inline[4]),
+            released_text_bytes=int(archived[0]),
+            released_raw_bytes=int(archived[1]),
+            archived_bytes=int(archived[2]),
+        )
@@ -51,7 +51,11 @@ from chronovista.models.batch_correction_models import (
 )
 from chronovista.models.correction_actors import ACTOR_CLI_BATCH
 from chronovista.models.entity_mention import EntityMentionCreate
-from chronovista.models.enums import CorrectionType, DetectionMethod
+from chronovista.models.enums import (
+    CorrectionType,
+    DetectionMethod,
+    TranscriptStorageMode,
+)
 from chronovista.repositories.entity_mention_repository import (
     EntityMentionRepository,
 )
@@ -761,12 +765,8 @@ class BatchCorrectionService:
                     total_applied=count,
                 )
 
-        # Step 5 (T031): Update entity counters after all mentions created
-        if entity is not None and total_applied > 0:
-            mention_repo = EntityMentionRepository()
-            await mention_repo.update_entity_counters(session, [entity.id])
-            await mention_repo.update_alias_counters(session, [entity.id])
-            await session.flush()
+        # Step 5 (T031): entity counters were adjusted as each segment's
+        # mentions were created (see _create_entity_mentions_for_segment).
 
         # Step 6: Auto-rebuild
         rebuild_triggered = False
@@ -1176,7 +1176,12 @@ class BatchCorrectionService:
         )
 
         # Query transcripts with has_corrections = True
-        conditions: list[Any] = [VideoTranscriptDB.has_corrections.is_(True)]
+        # Compact transcripts have no stored text to rebuild: it is derived
+        # from the (corrected) segments on every read.
+        conditions: list[Any] = [
+            VideoTranscriptDB.has_corrections.is_(True),
+            VideoTranscriptDB.storage_mode != TranscriptStorageMode.COMPACT.value,
+        ]
         if video_ids is not None:
             conditions.append(VideoTranscriptDB.video_id.in_(video_ids))
         if language is not None:
@@ -1640,17 +1645,11 @@ class BatchCorrectionService:
             # Entity mention cascade
             correction_ids_for_cascade = [c.id for c in corrections]
             mention_repo = EntityMentionRepository()
-            affected_entity_ids_batch: list[UUID] = []
             mentions_deleted_batch = 0
 
             if correction_ids_for_cascade:
-                affected_entity_ids_batch = (
-                    await mention_repo.get_entity_ids_by_correction_ids(
-                        session, correction_ids_for_cascade
-                    )
-                )
                 mentions_deleted_batch = await mention_repo.delete_by_correction_ids(
-                    session, correction_ids_for_cascade
+                    session, correction_ids_for_cascade, adjust_counters=True
                 )
                 if mentions_deleted_batch > 0:
                     await session.flush()
@@ -1680,16 +1679,6 @@ class BatchCorrectionService:
                 )
             )
 
-            # Recalculate entity counters
-            if affected_entity_ids_batch:
-                await mention_repo.update_entity_counters(
-                    session, affected_entity_ids_batch
-                )
-                await mention_repo.update_alias_counters(
-                    session, affected_entity_ids_batch
-                )
-                await session.flush()
-
             _elapsed = time.monotonic() - _start_time
             logger.info(
                 "batch_revert completed (batch_id): batch_id=%s, matched=%d, "
@@ -1872,7 +1861,7 @@ class BatchCorrectionService:
                 session, correction_ids_to_cascade
             )
             mentions_deleted = await mention_repo.delete_by_correction_ids(
-                session, correction_ids_to_cascade
+                session, correction_ids_to_cascade, adjust_counters=True
             )
             if mentions_deleted > 0:
                 logger.info(
@@ -1913,15 +1902,8 @@ class BatchCorrectionService:
             )
         )
 
-        # T033: Recalculate entity counters after revert completes
-        if affected_entity_ids:
-            await mention_repo.update_entity_counters(session, affected_entity_ids)
-            await mention_repo.update_alias_counters(session, affected_entity_ids)
-            await session.flush()
-            logger.info(
-                "batch_revert: recalculated counters for %d entities",
-                len(affected_entity_ids),
-            )
+        # T033: entity counters were adjusted when the linked mentions were
+        # deleted above, in this same transaction.
 
         _elapsed = time.monotonic() - _start_time
         logger.info(
@@ -2294,6 +2276,114 @@ class BatchCorrectionService:
             case_insensitive=case_insensitive,
         )
 
+    @staticmethod
+    def _pattern_seam_boundaries(pattern: str) -> list[tuple[str, str]] | None:
+        """
+        Split a substring pattern into the segment boundaries it could span.
+
+        Consecutive segments are compared as ``text_a + " " + text_b``, so a
+        boundary-spanning match places one of the pattern's spaces on the
+        joining space: segment A must end with the text before it and segment
+        B must start with the text after it.
+
+        Parameters
+        ----------
+        pattern : str
+            The plain substring pattern.
+
+        Returns
+        -------
+        list of tuple[str, str] or None
+            One ``(tail, head)`` split per space in the pattern (empty when the
+            pattern has no space and so cannot span a boundary), or None when
+            some split constrains neither side and the seam index cannot
+            narrow the search.
+        """
+        boundaries: list[tuple[str, str]] = []
+        for index, char in enumerate(pattern):
+            if char != " ":
+                continue
+            tail, head = pattern[:index], pattern[index + 1 :]
+            if not tail.strip() and not head.strip():
+                return None
+            boundaries.append((tail, head))
+        return boundaries
+
+    async def _find_segments_for_token_scope(
+        self,
+        session: AsyncSession,
+        *,
+        pattern: str,
+        regex: bool,
+        case_insensitive: bool,
+        language: str | None,
+        channel: str | None,
+        video_ids: list[str] | None,
+    ) -> Sequence[Any]:
+        """
+        Load in-scope segments for patterns the seam index cannot narrow.
+
+        When no video_ids filter is provided by the caller we perform a
+        lightweight pre-filter query that returns only the video_ids whose
+        segments contain at least one token from the pattern. This avoids
+        loading every segment in the database for broad searches (e.g. no
+        video_id / no channel / no language filter).
+
+        The pre-filter is intentionally a superset — it may return video_ids
+        that ultimately produce zero cross-segment matches, but it will never
+        omit a video that could produce one.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Database session.
+        pattern : str
+            The search pattern.
+        regex : bool
+            Whether the pattern is a regular expression.
+        case_insensitive : bool
+            Whether matching should be case-insensitive.
+        language : str or None
+            Language filter.
+        channel : str or None
+            Channel filter.
+        video_ids : list[str] or None
+            Video ID filter.
+
+        Returns
+        -------
+        Sequence[Any]
+            Segments ordered by ``(video_id, language_code, sequence_number)``.
+        """
+        scoped_video_ids = video_ids
+        if video_ids is None:
+            candidate_ids = await self._get_candidate_video_ids(
+                session,
+                pattern=pattern,
+                regex=regex,
+                case_insensitive=case_insensitive,
+                language=language,
+                channel=channel,
+            )
+            if not candidate_ids:
+                logger.info(
+                    "Cross-segment pre-filter returned 0 candidate videos — "
+                    "no cross-segment matches possible"
+                )
+                return []
+            scoped_video_ids = candidate_ids
+            logger.debug(
+                "Cross-segment pre-filter narrowed scope to %d candidate video(s)",
+                len(scoped_video_ids),
+            )
+
+        return await self._segment_repo.find_segments_in_scope(
+            session,
+            language=language,
+            channel=channel,
+            video_ids=scoped_video_ids,
+        )
+
     async def _find_cross_segment_matches(
         self,
         session: AsyncSession,
@@ -2311,8 +2401,9 @@ class BatchCorrectionService:
         """
         Find cross-segment pattern matches (T020-T022).
 
-        Fetches all segments in scope, groups by (video_id, language_code),
-        pairs strictly consecutive segments, and matches the pattern against
+        Fetches candidate segments (via the seam index for substring
+        patterns, the token pre-filter for regex), groups by
+        (video_id, language_code), pairs strictly consecutive segments, and matches the pattern against
         the combined text of each pair. Only matches that span the boundary
         between the two segments are considered cross-segment matches.
 
@@ -2348,43 +2439,33 @@ class BatchCorrectionService:
         """
         # T020: Fetch segments in scope.
         #
-        # Optimization: when no video_ids filter is provided by the caller we
-        # perform a lightweight pre-filter query that returns only the
-        # video_ids whose segments contain at least one token from the
-        # pattern.  This avoids loading every segment in the database for
-        # broad searches (e.g. no video_id / no channel / no language filter).
-        #
-        # The pre-filter is intentionally a superset — it may return video_ids
-        # that ultimately produce zero cross-segment matches, but it will never
-        # omit a video that could produce one.
-        scoped_video_ids = video_ids
-        if video_ids is None:
-            candidate_ids = await self._get_candidate_video_ids(
+        # A substring match can only span a boundary at one of the pattern's
+        # spaces (the pair is joined with a single space), so each space splits
+        # the pattern into a (tail, head) boundary that the seam index answers
+        # directly — only segments on matching seams are loaded. Regex patterns
+        # (and all-whitespace ones, which constrain no seam) fall back to the
+        # token pre-filter below.
+        seam_boundaries = None if regex else self._pattern_seam_boundaries(pattern)
+        if seam_boundaries is not None:
+            if not seam_boundaries:
+                return []
+            all_segments = await self._segment_repo.find_segments_at_seams(
+                session,
+                boundaries=seam_boundaries,
+                language=language,
+                channel=channel,
+                video_ids=video_ids,
+            )
+        else:
+            all_segments = await self._find_segments_for_token_scope(
                 session,
                 pattern=pattern,
                 regex=regex,
                 case_insensitive=case_insensitive,
                 language=language,
                 channel=channel,
+                video_ids=video_ids,
             )
-            if not candidate_ids:
-                logger.info(
-                    "Cross-segment pre-filter returned 0 candidate videos — "
-                    "no cross-segment matches possible"
-                )
-                return []
-            scoped_video_ids = candidate_ids
-            logger.debug(
-                "Cross-segment pre-filter narrowed scope to %d candidate video(s)",
-                len(scoped_video_ids),
-            )
-
-        all_segments = await self._segment_repo.find_segments_in_scope(
-            session,
-            language=language,
-            channel=channel,
-            video_ids=scoped_video_ids,
-        )
 
         # Group by (video_id, language_code)
         from collections import defaultdict
@@ -2943,7 +3024,7 @@ class BatchCorrectionService:
             async with session.begin_nested():
                 mention_repo = EntityMentionRepository()
                 await mention_repo.bulk_create_with_conflict_skip(
-                    session, mentions_to_create
+                    session, mentions_to_create, adjust_counters=True
                 )
 
         except Exception:
@@ -23,13 +23,16 @@ from types import SimpleNamespace
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from chronovista.db.models import EntityAlias as EntityAliasDB
 from chronovista.db.models import NamedEntity as NamedEntityDB
 from chronovista.db.models import TranscriptCorrection as TranscriptCorrectionDB
 from chronovista.db.models import TranscriptSegment as TranscriptSegmentDB
+from chronovista.db.models import TranscriptSegmentSeam as TranscriptSegmentSeamDB
+from chronovista.db.segment_seams import seam_boundary_condition
 from chronovista.models.batch_correction_models import CorrectionPattern
 from chronovista.services.batch_correction_service import BatchCorrectionService
 from chronovista.utils.text import strip_boundary_punctuation
@@ -257,21 +260,26 @@ def _is_stopword_split(prefix: str, suffix: str) -> bool:
 
 # A boundary split is only worth querying when it has a selective anchor.
 # The batched adjacency query is dominated by splits where BOTH sides are
-# short: a 1-2 char fragment (e.g. "M" / "lo") has almost no trigram
-# selectivity and matches hundreds of thousands of segments. We therefore
+# short: a 1-2 char fragment (e.g. "M" / "lo") is a wide prefix range on the
+# seam index and matches hundreds of thousands of boundaries. We therefore
 # require neither side to be a single character AND at least one side to be a
-# substantial (>= 4 char) anchor that lets PostgreSQL drive the self-join from
-# a small row set. This keeps precise splits like "Lovelase"/"is" or
-# "El"/"Dijkstra" while dropping noise like "M"/"lo" — cutting the batched query
-# from ~12s to ~1s on a ~1.5M-row segment table.
+# substantial (>= 4 char) anchor that keeps the seam range scan small. This
+# keeps precise splits like "Lovelase"/"is" or "El"/"Dijkstra" while dropping
+# noise like "M"/"lo".
 _MIN_BOUNDARY_FRAGMENT_LEN = 2
 _MIN_BOUNDARY_ANCHOR_LEN = 4
 
+# Confirmed pairs returned per split by ``_find_adjacent_pairs``. Seams are a
+# super-set filter, so seam rows are read in pages until this many pairs pass
+# the effective-text re-check or the matching seams run out.
+_ADJACENT_PAIR_LIMIT = 100
+_SEAM_PAGE_SIZE = 500
+
 
 def _is_too_short_split(prefix: str, suffix: str) -> bool:
     """Return True if a boundary split lacks a selective anchor.
 
-    Splits where both sides are short produce low-selectivity trigram scans
+    Splits where both sides are short produce low-selectivity seam scans
     (huge candidate sets) and are poor ASR boundary-error indicators, so they
     are skipped for both quality and performance.
     """
@@ -470,7 +478,7 @@ class CrossSegmentDiscovery:
 
         # Prioritize aliases: 2-word aliases first (more precise), then
         # shorter names.  Limit to 30 to keep query cost reasonable on
-        # large segment tables (~1M rows → sequential ILIKE scan).
+        # large segment tables (one seam range scan per split).
         aliases.sort(key=lambda a: (len(a[0].split()), len(a[0])))
         max_aliases = 30
         if len(aliases) > max_aliases:
@@ -643,29 +651,23 @@ class CrossSegmentDiscovery:
 
         seg_n = TranscriptSegmentDB.__table__.alias("seg_n")
         seg_n1 = TranscriptSegmentDB.__table__.alias("seg_n1")
-
-        # Candidate pre-filter on the RAW ``text``/``corrected_text`` columns so
-        # PostgreSQL can use the pg_trgm GIN indexes (``idx_segments_text_trgm`` /
-        # ``idx_segments_corrected_text_trgm``). A ``CASE(has_correction,
-        # corrected_text, text)`` expression is opaque to those indexes and forces a
-        # full parallel seq-scan of the ~1.5M-row self-join (~20s for the whole
-        # request). Matching either the original or the corrected text yields a
-        # strict super-set of the effective-text match; the ``_effective_text``
-        # re-check in the callers then enforces exact correctness, so this query is
-        # purely a fast candidate filter.
+        seam = TranscriptSegmentSeamDB.__table__.alias("seam")
+
+        # Candidate pre-filter on the seam table: each split becomes two
+        # left-anchored ``text_pattern_ops`` range scans (the tail is stored
+        # reversed) instead of ``ILIKE '%prefix'`` over the segment self-join,
+        # which degrades to a full parallel seq-scan whenever trigram pruning
+        # fails on a short fragment. Seams are case-folded and truncated to a
+        # few words, so this is a super-set of the effective-text match; the
+        # ``_effective_text`` re-check in the callers enforces exactness.
         or_conditions = [
-            and_(
-                or_(
-                    seg_n.c.text.ilike(f"%{prefix}"),
-                    seg_n.c.corrected_text.ilike(f"%{prefix}"),
-                ),
-                or_(
-                    seg_n1.c.text.ilike(f"{suffix}%"),
-                    seg_n1.c.corrected_text.ilike(f"{suffix}%"),
-                ),
-            )
+            condition
             for prefix, suffix in prefix_suffix_pairs
+            if (condition := seam_boundary_condition(prefix, suffix, seam.c))
+            is not None
         ]
+        if not or_conditions:
+            return []
 
         stmt = (
             select(
@@ -679,14 +681,10 @@ class CrossSegmentDiscovery:
                 seg_n1.c.corrected_text.label("n1_corrected_text"),
                 seg_n1.c.has_correction.label("n1_has_correction"),
             )
-            .where(
-                and_(
-                    seg_n.c.video_id == seg_n1.c.video_id,
-                    seg_n.c.language_code == seg_n1.c.language_code,
-                    seg_n1.c.sequence_number == seg_n.c.sequence_number + 1,
-                    or_(*or_conditions),
-                )
-            )
+            .select_from(seam)
+            .join(seg_n, seg_n.c.id == seam.c.segment_n_id)
+            .join(seg_n1, seg_n1.c.id == seam.c.segment_n1_id)
+            .where(or_(*or_conditions))
             .limit(limit)
         )
 
@@ -1002,60 +1000,50 @@ class CrossSegmentDiscovery:
         Returns
         -------
         list[tuple[Any, Any]]
-            List of (segment_n, segment_n1) pairs.
+            Up to ``_ADJACENT_PAIR_LIMIT`` (segment_n, segment_n1) pairs, in
+            ``segment_n_id`` order.
         """
-        # Alias tables for self-join
-        seg_n = TranscriptSegmentDB.__table__.alias("seg_n")
-        seg_n1 = TranscriptSegmentDB.__table__.alias("seg_n1")
-
-        # Build effective text expressions for both segments
-        eff_text_n = case(
-            (seg_n.c.has_correction, seg_n.c.corrected_text),
-            else_=seg_n.c.text,
-        )
-        eff_text_n1 = case(
-            (seg_n1.c.has_correction, seg_n1.c.corrected_text),
-            else_=seg_n1.c.text,
-        )
-
-        # Use LIKE patterns for suffix/prefix matching
-        prefix_like = f"%{prefix}"
-        suffix_like = f"{suffix}%"
+        condition = seam_boundary_condition(prefix, suffix)
+        if condition is None:
+            return []
 
-        stmt = (
+        seg_n = aliased(TranscriptSegmentDB, name="seg_n")
+        seg_n1 = aliased(TranscriptSegmentDB, name="seg_n1")
+        base = (
             select(seg_n, seg_n1)
-            .where(
-                and_(
-                    # Same video and language
-                    seg_n.c.video_id == seg_n1.c.video_id,
-                    seg_n.c.language_code == seg_n1.c.language_code,
-                    # Adjacent segments
-                    seg_n1.c.sequence_number == seg_n.c.sequence_number + 1,
-                    # Segment N ends with prefix
-                    eff_text_n.ilike(prefix_like),
-                    # Segment N+1 starts with suffix
-                    eff_text_n1.ilike(suffix_like),
-                )
-            )
-            .limit(100)
+            .select_from(TranscriptSegmentSeamDB)
+            .join(seg_n, seg_n.id == TranscriptSegmentSeamDB.segment_n_id)
+            .join(seg_n1, seg_n1.id == TranscriptSegmentSeamDB.segment_n1_id)
+            .where(condition)
+            .order_by(TranscriptSegmentSeamDB.segment_n_id)
+            .limit(_SEAM_PAGE_SIZE)
         )
 
-        result = await session.execute(stmt)
-        rows = result.fetchall()
-
-        # Convert raw rows to segment-like objects
+        # Seams are a case-folded, word-truncated candidate filter; confirm
+        # the boundary against each segment's effective text. The limit
+        # applies to confirmed pairs, so keep paging (keyset on the seam's
+        # primary key) while rejected candidates leave it unfilled.
+        prefix_lower = prefix.lower().rstrip()
+        suffix_lower = suffix.lower().lstrip()
         pairs: list[tuple[Any, Any]] = []
-        n_cols = len(seg_n.c)
-        for row in rows:
-            # Row is a flat tuple: [seg_n columns...][seg_n1 columns...]
-            # First column of each alias is the primary key (id)
-            seg_n_obj = await session.get(TranscriptSegmentDB, row[0])
-            seg_n1_obj = await session.get(TranscriptSegmentDB, row[n_cols])
-
-            if seg_n_obj is not None and seg_n1_obj is not None:
-                pairs.append((seg_n_obj, seg_n1_obj))
-
-        return pairs
+        after_id: int | None = None
+        while True:
+            stmt = base
+            if after_id is not None:
+                stmt = stmt.where(TranscriptSegmentSeamDB.segment_n_id > after_id)
+            rows = (await session.execute(stmt)).tuples().all()
+            for seg_n_obj, seg_n1_obj in rows:
+                if _effective_text(seg_n_obj).lower().rstrip().endswith(
+                    prefix_lower
+                ) and _effective_text(seg_n1_obj).lower().lstrip().startswith(
+                    suffix_lower
+                ):
+                    pairs.append((seg_n_obj, seg_n1_obj))
+                    if len(pairs) == _ADJACENT_PAIR_LIMIT:
+                        return pairs
+            if len(rows) < _SEAM_PAGE_SIZE:
+                return pairs
+            after_id = rows[-1][0].id
 
     def _score_candidate(
         self,
@@ -31,9 +31,14 @@ from typing import Any
 
 import httpx
 
+from chronovista.services.knowledge_base_cache import (
+    KnowledgeBaseCache,
+    default_cache,
+    shared_http_client,
+)
+
 DBPEDIA_SPARQL = "https://dbpedia.org/sparql"
 WIKIDATA_API = "https://www.wikidata.org/w/api.php"
-USER_AGENT = "chronovista/1.0 (local personal library tooling)"
 _DEFAULT_TIMEOUT = 8.0
 
 # Provenance labels stored in the identifier's link_provenance (backend-only; not rendered).
@@ -42,49 +47,67 @@ PROV_SITELINK = "enwiki sitelink"
 
 
 class DbpediaResolver:
-    """Resolve a Wikidata QID to its DBpedia resource IRI (identifier only)."""
+    """Resolve a Wikidata QID to its DBpedia resource IRI (identifier only).
+
+    Without an injected ``http`` client it uses the shared pooled client and the local
+    knowledge-base cache, which remembers definitive answers (including "no DBpedia resource").
+    """
 
     def __init__(
         self,
         http: httpx.AsyncClient | None = None,
         *,
         timeout: float = _DEFAULT_TIMEOUT,
+        cache: KnowledgeBaseCache | None = None,
     ) -> None:
         self._http = http
         self._timeout = timeout
-
-    def _new_client(self) -> httpx.AsyncClient:
-        return httpx.AsyncClient(
-            headers={"User-Agent": USER_AGENT}, timeout=self._timeout
+        self._cache = (
+            cache if cache is not None or http is not None else default_cache()
         )
 
+    def _timeout_for(self, http: httpx.AsyncClient) -> float | httpx.Timeout:
+        # The shared pool takes the per-call timeout; an injected client keeps its own.
+        return self._timeout if self._http is None else http.timeout
+
     async def resolve(self, qid: str) -> tuple[str, str] | None:
         """Return ``(dbpedia_iri, link_provenance)`` for ``qid``, or ``None`` if none resolves.
 
         Never raises: an unreachable/flaky DBpedia endpoint or an item with no English Wikipedia
         article both yield ``None`` (the entity keeps no DBpedia link; the pipeline may fill it).
+        Only answers reached without a failed step are cached, so a flaky endpoint is retried on
+        the next call rather than remembered as "no link".
         """
-        http = self._http or self._new_client()
-        owns = self._http is None
+        key = {"qid": qid}
+        if self._cache is not None:
+            cached, value = self._cache.get("dbpedia", key)
+            if cached:
+                return (value[0], value[1]) if value else None
+
+        http = self._http or shared_http_client()
+        failed = False
+        result: tuple[str, str] | None = None
+        # Each step degrades independently: DBpedia's SPARQL is the flaky part, so a SPARQL
+        # failure must not skip the (more reliable) enwiki-sitelink fallback.
         try:
-            # Each step degrades independently: DBpedia's SPARQL is the flaky part, so a SPARQL
-            # failure must not skip the (more reliable) enwiki-sitelink fallback.
-            try:
-                iri = await self._owl_sameas(http, qid)
-            except Exception:  # noqa: BLE001
-                iri = None
-            if iri:
-                return iri, PROV_SAMEAS
+            iri = await self._owl_sameas(http, qid)
+        except Exception:  # noqa: BLE001
+            iri = None
+            failed = True
+        if iri:
+            result = (iri, PROV_SAMEAS)
+        else:
             try:
                 title = await self._enwiki_title(http, qid)
             except Exception:  # noqa: BLE001
                 title = None
+                failed = True
             if title:
-                return self._resource_iri(title), PROV_SITELINK
-            return None
-        finally:
-            if owns:
-                await http.aclose()
+                result = (self._resource_iri(title), PROV_SITELINK)
+
+        if self._cache is not None and (result is not None or not failed):
+            self._cache.put("dbpedia", key, list(result) if result else None)
+        return result
 
     async def _owl_sameas(self, http: httpx.AsyncClient, qid: str) -> str | None:
         """The DBpedia resource whose ``owl:sameAs`` is this Wikidata item, if any."""
@@ -99,6 +122,7 @@ class DbpediaResolver:
             DBPEDIA_SPARQL,
             data={"query": query, "format": "application/sparql-results+json"},
             headers={"Accept": "application/sparql-results+json"},
+            timeout=self._timeout_for(http),
         )
         resp.raise_for_status()
         bindings = resp.json().get("results", {}).get("bindings", [])
@@ -116,7 +140,9 @@ class DbpediaResolver:
             "sitefilter": "enwiki",
             "format": "json",
         }
-        resp = await http.get(WIKIDATA_API, params=params)
+        resp = await http.get(
+            WIKIDATA_API, params=params, timeout=self._timeout_for(http)
+        )
         resp.raise_for_status()
         entity = (resp.json().get("entities") or {}).get(qid) or {}
         title = entity.get("sitelinks", {}).get("enwiki", {}).get("title")
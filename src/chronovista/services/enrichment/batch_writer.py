@@ -0,0 +1,519 @@
+"""
+Set-based writer for one page of video enrichment.
+
+``EnrichmentService.enrich_videos`` fetches metadata 50 videos at a time. The
+original per-video path then spends roughly ten statements on each video
+(lookup, channel check, tag delete and re-insert one tag at a time, topic
+replace, category lookup) before the batch commit. This writer applies the
+same page with a handful of set-based statements instead:
+
+- one ``SELECT`` of the page's current video state,
+- one ``SELECT`` each for known channels and known categories,
+- one multi-row ``INSERT ... ON CONFLICT DO NOTHING`` for new channels and one
+  ``UPDATE ... FROM (VALUES ...)`` for placeholder channel names,
+- one ``UPDATE videos ... FROM (VALUES ...)`` per distinct set of updated
+  columns (normally one or two per page),
+- ``DELETE ... WHERE video_id = ANY(...)`` plus one multi-row ``INSERT`` each
+  for tags and topics.
+
+Rare per-video events keep going through the service's existing code paths:
+unavailability marking for videos the API did not return, provenance records
+for restored videos, and topic URL resolution (once per distinct URL in the
+page, not once per video).
+
+The statements use PostgreSQL syntax. The service uses the per-video path
+on any other database, and replays a page per video if the set-based write
+fails, so one bad row still only costs itself.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from sqlalchemy import (
+    String,
+    Table,
+    any_,
+    column,
+    delete,
+    literal,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from chronovista.db.entity_associations import queue_association_refresh
+from chronovista.db.models import Channel as ChannelDB
+from chronovista.db.models import Video as VideoDB
+from chronovista.db.models import VideoCategory as VideoCategoryDB
+from chronovista.db.models import VideoTag as VideoTagDB
+from chronovista.db.models import VideoTopic as VideoTopicDB
+from chronovista.models.api_responses import YouTubeVideoResponse
+from chronovista.models.channel import ChannelCreate
+from chronovista.models.enrichment_report import EnrichmentDetail
+from chronovista.models.enums import AvailabilityStatus
+from chronovista.models.recovery_provenance import RecoverySourceRecord
+from chronovista.models.video_tag import VideoTagCreate
+from chronovista.models.video_topic import VideoTopicCreate
+from chronovista.services.enrichment.enrichment_service import (
+    _SYNC_SOURCE,
+    EnrichmentService,
+    is_placeholder_channel_name,
+    truncate_tag,
+)
+from chronovista.services.enrichment.topic_resolver import TopicResolver
+
+logger = logging.getLogger(__name__)
+
+_VIDEOS = cast(Table, VideoDB.__table__)
+_CHANNELS = cast(Table, ChannelDB.__table__)
+
+
+@dataclass
+class PageResult:
+    """Counters and per-video details produced by writing one page."""
+
+    details: list[EnrichmentDetail] = field(default_factory=list)
+    videos_updated: int = 0
+    videos_deleted: int = 0
+    channels_created: int = 0
+    channels_auto_resolved: int = 0
+    tags_created: int = 0
+    topics_created: int = 0
+    categories_assigned: int = 0
+    errors: int = 0
+
+
+@dataclass
+class _VideoPlan:
+    """What the page write will do to one video."""
+
+    video_id: str
+    assignments: dict[str, Any]
+    detail: EnrichmentDetail
+    restored: bool = False
+    tags: list[VideoTagCreate] | None = None
+    topic_urls: list[str] = field(default_factory=list)
+
+
+def _any(col: Any, items: list[str]) -> Any:
+    """``col = ANY(:array)``: one bind parameter however long the list."""
+    return col == any_(literal(items, ARRAY(String)))
+
+
+def _values_table(
+    name: str, table: Any, keys: list[str], rows: list[tuple[Any, ...]]
+) -> Any:
+    """A typed ``(VALUES ...) AS name(keys)`` for ``UPDATE ... FROM``."""
+    return values(*(column(key, table.c[key].type) for key in keys), name=name).data(
+        rows
+    )
+
+
+class EnrichmentBatchWriter:
+    """
+    Apply one page of YouTube API results with set-based statements.
+
+    Parameters
+    ----------
+    service : EnrichmentService
+        The owning service, whose helpers handle field extraction, topic
+        matching, unavailability marking and provenance.
+    topic_resolver : TopicResolver | None, optional
+        The run's in-memory topic maps, passed through to topic matching.
+    """
+
+    def __init__(
+        self, service: EnrichmentService, topic_resolver: TopicResolver | None = None
+    ) -> None:
+        self._service = service
+        self._topic_resolver = topic_resolver
+
+    async def write_page(
+        self,
+        session: AsyncSession,
+        video_ids: list[str],
+        api_data_map: dict[str, YouTubeVideoResponse],
+        not_found_ids: set[str],
+        video_cache: dict[str, dict[str, Any]],
+    ) -> PageResult:
+        """
+        Write one page of enrichment results.
+
+        Nothing is committed; the caller owns the transaction, exactly as for
+        the per-video path.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Database session.
+        video_ids : list[str]
+            The page's video IDs, in processing order.
+        api_data_map : dict[str, YouTubeVideoResponse]
+            API responses by video ID.
+        not_found_ids : set[str]
+            IDs the API did not return.
+        video_cache : dict[str, dict[str, Any]]
+            Title and channel ID captured before the API call.
+
+        Returns
+        -------
+        PageResult
+            Counters and details, in the same shape the per-video path reports.
+        """
+        result = PageResult()
+        details: dict[str, EnrichmentDetail] = {}
+
+        present: list[str] = []
+        for video_id in video_ids:
+            if video_id in not_found_ids:
+                # FR-024/FR-026 multi-cycle confirmation stays per video.
+                confirmed = await self._service._mark_video_deleted_by_id(
+                    session, video_id, dry_run=False
+                )
+                if confirmed:
+                    result.videos_deleted += 1
+                details[video_id] = EnrichmentDetail(
+                    video_id=video_id,
+                    status="deleted" if confirmed else "pending_confirmation",
+                    old_title=video_cache[video_id]["title"],
+                )
+            elif video_id not in api_data_map:
+                logger.warning(f"No API data for video {video_id}")
+                result.errors += 1
+                details[video_id] = EnrichmentDetail(
+                    video_id=video_id, status="error", error="No API data returned"
+                )
+            else:
+                present.append(video_id)
+
+        state = await self._load_video_state(session, present)
+        plans: list[_VideoPlan] = []
+        channels: dict[str, str] = {}
+        for video_id in present:
+            if video_id not in state:
+                logger.warning(f"Video {video_id} not found in database")
+                result.errors += 1
+                details[video_id] = EnrichmentDetail(
+                    video_id=video_id,
+                    status="error",
+                    error="Video not found in database",
+                )
+                continue
+            plan = self._plan_video(
+                video_id,
+                api_data_map[video_id],
+                state[video_id],
+                video_cache[video_id],
+                channels,
+                result,
+            )
+            plans.append(plan)
+            details[video_id] = plan.detail
+
+        if plans:
+            await self._write_channels(session, channels, result)
+            await self._count_categories(session, plans, result)
+            await self._update_videos(session, plans)
+            restored = [plan.video_id for plan in plans if plan.restored]
+            if restored:
+                # Restored videos re-enter the entity co-occurrence counts.
+                queue_association_refresh(session, availability_video_ids=restored)
+            for plan in plans:
+                if plan.restored:
+                    # Provenance must go through the repository (ADR-011).
+                    await self._service._provenance_repo.record_video(
+                        session,
+                        plan.video_id,
+                        RecoverySourceRecord(
+                            source=_SYNC_SOURCE,
+                            fields_written=["availability_status"],
+                        ),
+                    )
+            await self._replace_tags(session, plans, result)
+            await self._replace_topics(session, plans, result)
+            result.videos_updated += len(plans)
+
+        result.details = [details[v] for v in video_ids]
+        return result
+
+    async def _load_video_state(
+        self, session: AsyncSession, video_ids: list[str]
+    ) -> dict[str, Any]:
+        if not video_ids:
+            return {}
+        rows = await session.execute(
+            select(
+                VideoDB.video_id,
+                VideoDB.channel_id,
+                VideoDB.channel_name_hint,
+                VideoDB.availability_status,
+                VideoDB.unavailability_first_detected,
+            ).where(_any(VideoDB.video_id, video_ids))
+        )
+        return {row.video_id: row for row in rows}
+
+    def _plan_video(
+        self,
+        video_id: str,
+        api_data: YouTubeVideoResponse,
+        state: Any,
+        cached: dict[str, Any],
+        channels: dict[str, str],
+        result: PageResult,
+    ) -> _VideoPlan:
+        """Work out one video's column writes, tags and topics in memory."""
+        update_data = self._service._extract_video_update_from_dict(
+            api_data.model_dump(by_alias=True, exclude_none=False, mode="json")
+        )
+        assignments = dict(update_data)
+        restored = False
+
+        # FR-024: a flagged video the API returns again was a transient error.
+        if state.unavailability_first_detected is not None:
+            logger.info(
+                f"Video {video_id} returned from API after pending "
+                f"unavailability — clearing transient flag"
+            )
+            assignments["unavailability_first_detected"] = None
+
+        # FR-018/FR-023: restore a previously unavailable video.
+        if state.availability_status != AvailabilityStatus.AVAILABLE:
+            assignments["availability_status"] = AvailabilityStatus.AVAILABLE.value
+            assignments["unavailability_first_detected"] = None
+            restored = True
+            logger.info(
+                f"Restored video {video_id} from '{state.availability_status}' "
+                f"to available (recovery_source=sync)"
+            )
+
+        channel_id: str | None = None
+        tags: list[VideoTagCreate] | None = None
+        if api_data.snippet:
+            channel_id = api_data.snippet.channel_id
+            channel_title = api_data.snippet.channel_title
+            if channel_id and channel_title:
+                # The first video naming a channel decides its title, as the
+                # per-video path's create-then-skip order does.
+                channels.setdefault(channel_id, channel_title)
+                # T045-T049: link orphan videos to the real channel.
+                if state.channel_id is None:
+                    assignments["channel_id"] = channel_id
+                    if state.channel_name_hint:
+                        assignments["channel_name_hint"] = None
+                        logger.info(
+                            f"Auto-resolved channel for video {video_id}: "
+                            f"'{state.channel_name_hint}' -> channel {channel_id} "
+                            f"({channel_title})"
+                        )
+                    else:
+                        logger.info(
+                            f"Linked orphan video {video_id} to channel "
+                            f"{channel_id} ({channel_title})"
+                        )
+                    result.channels_auto_resolved += 1
+
+            # T068-T073: tags replace the old set; an empty list is a no-op.
+            api_tags = api_data.snippet.tags or []
+            if api_tags:
+                tags = [
+                    VideoTagCreate(
+                        video_id=video_id, tag=truncate_tag(tag), tag_order=i
+                    )
+                    for i, tag in enumerate(api_tags)
+                ]
+
+        topic_urls: list[str] = []
+        if api_data.topic_details:
+            topic_urls = api_data.topic_details.topic_categories or []
+
+        old_title = cached["title"]
+        return _VideoPlan(
+            video_id=video_id,
+            assignments=assignments,
+            restored=restored,
+            tags=tags,
+            topic_urls=topic_urls,
+            detail=EnrichmentDetail(
+                video_id=video_id,
+                status="updated",
+                old_title=old_title,
+                new_title=update_data.get("title", old_title),
+                old_channel=cached["channel_id"],
+                new_channel=channel_id,
+                category_id=update_data.get("category_id"),
+                tags_count=len(tags) if tags else 0,
+                topics_count=0,
+            ),
+        )
+
+    async def _write_channels(
+        self, session: AsyncSession, channels: dict[str, str], result: PageResult
+    ) -> None:
+        """Create missing channels and replace placeholder names, in bulk."""
+        if not channels:
+            return
+
+        existing = dict(
+            (
+                await session.execute(
+                    select(ChannelDB.channel_id, ChannelDB.title).where(
+                        _any(ChannelDB.channel_id, list(channels))
+                    )
+                )
+            ).tuples()
+        )
+
+        new_rows: list[dict[str, Any]] = []
+        renames: list[tuple[str, str]] = []
+        for channel_id, title in channels.items():
+            if channel_id not in existing:
+                try:
+                    channel = ChannelCreate(channel_id=channel_id, title=title)
+                except Exception as e:
+                    logger.error(f"Failed to create channel {channel_id}: {e}")
+                    continue
+                new_rows.append(channel.model_dump())
+            elif is_placeholder_channel_name(existing[channel_id]):
+                renames.append((channel_id, title))
+                logger.info(f"Updated channel name: {title} ({channel_id})")
+
+        if new_rows:
+            inserted = await session.execute(
+                pg_insert(ChannelDB)
+                .values(new_rows)
+                .on_conflict_do_nothing(index_elements=["channel_id"])
+                .returning(ChannelDB.channel_id)
+            )
+            created = inserted.scalars().all()
+            result.channels_created += len(created)
+            for channel_id in created:
+                logger.info(f"Created channel: {channels[channel_id]} ({channel_id})")
+
+        if renames:
+            v = _values_table("v", _CHANNELS, ["channel_id", "title"], renames)
+            await session.execute(
+                update(_CHANNELS)
+                .where(_CHANNELS.c.channel_id == v.c.channel_id)
+                .values(title=v.c.title)
+            )
+
+    async def _count_categories(
+        self, session: AsyncSession, plans: list[_VideoPlan], result: PageResult
+    ) -> None:
+        """Check category assignments against the seeded categories (FR-046)."""
+        wanted = {
+            p.assignments["category_id"]
+            for p in plans
+            if "category_id" in p.assignments
+        }
+        if not wanted:
+            return
+        known = set(
+            (
+                await session.execute(
+                    select(VideoCategoryDB.category_id).where(
+                        _any(VideoCategoryDB.category_id, sorted(wanted))
+                    )
+                )
+            ).scalars()
+        )
+        for plan in plans:
+            category_id = plan.assignments.get("category_id")
+            if category_id is None:
+                continue
+            if category_id in known:
+                result.categories_assigned += 1
+            else:
+                # FR-047: reported, as by enrich_categories, and not written:
+                # an unseeded ID would violate the foreign key and fail the
+                # whole page.
+                del plan.assignments["category_id"]
+                logger.warning(
+                    f"Unrecognized category ID '{category_id}' for video "
+                    f"{plan.video_id}, category_id will remain null"
+                )
+
+    async def _update_videos(
+        self, session: AsyncSession, plans: list[_VideoPlan]
+    ) -> None:
+        """One ``UPDATE ... FROM (VALUES ...)`` per distinct column set.
+
+        Grouping by the set of columns present keeps "absent means leave it"
+        exact: a ``COALESCE`` over a single wide ``VALUES`` list could not
+        tell an absent field from one deliberately set to ``NULL``.
+        """
+        groups: dict[tuple[str, ...], list[_VideoPlan]] = defaultdict(list)
+        for plan in plans:
+            if plan.assignments:
+                groups[tuple(sorted(plan.assignments))].append(plan)
+        for keys, members in groups.items():
+            v = _values_table(
+                "v",
+                _VIDEOS,
+                ["video_id", *keys],
+                [(p.video_id, *(p.assignments[k] for k in keys)) for p in members],
+            )
+            await session.execute(
+                update(_VIDEOS)
+                .where(_VIDEOS.c.video_id == v.c.video_id)
+                .values({key: v.c[key] for key in keys})
+            )
+
+    async def _replace_tags(
+        self, session: AsyncSession, plans: list[_VideoPlan], result: PageResult
+    ) -> None:
+        tagged = [p for p in plans if p.tags]
+        if not tagged:
+            return
+        rows: dict[tuple[str, str], dict[str, Any]] = {}
+        for plan in tagged:
+            assert plan.tags is not None
+            for tag in plan.tags:
+                # First occurrence wins, as with the per-video existence check.
+                rows.setdefault((tag.video_id, tag.tag), tag.model_dump())
+            result.tags_created += len(plan.tags)
+        await session.execute(
+            delete(VideoTagDB).where(
+                _any(VideoTagDB.video_id, [p.video_id for p in tagged])
+            )
+        )
+        await session.execute(pg_insert(VideoTagDB).values(list(rows.values())))
+        queue_association_refresh(session, video_ids=[p.video_id for p in tagged])
+
+    async def _replace_topics(
+        self, session: AsyncSession, plans: list[_VideoPlan], result: PageResult
+    ) -> None:
+        # Resolve each distinct URL once for the whole page.
+        resolved: dict[str, str | None] = {}
+        for url in dict.fromkeys(u for p in plans for u in p.topic_urls):
+            resolved[url] = await self._service._match_topic_from_url(
+                session, url, self._topic_resolver
+            )
+
+        rows: dict[tuple[str, str], dict[str, Any]] = {}
+        replaced: list[str] = []
+        for plan in plans:
+            matched = [t for u in plan.topic_urls if (t := resolved[u]) is not None]
+            if not matched:
+                continue
+            replaced.append(plan.video_id)
+            for topic_id in matched:
+                topic = VideoTopicCreate(
+                    video_id=plan.video_id, topic_id=topic_id, relevance_type="primary"
+                )
+                rows.setdefault((plan.video_id, topic_id), topic.model_dump())
+            plan.detail.topics_count = len(matched)
+            result.topics_created += len(matched)
+        if not replaced:
+            return
+        await session.execute(
+            delete(VideoTopicDB).where(_any(VideoTopicDB.video_id, replaced))
+        )
+        await session.execute(pg_insert(VideoTopicDB).values(list(rows.values())))
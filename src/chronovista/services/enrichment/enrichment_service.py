@@ -18,7 +18,7 @@ import re
 from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import unquote
 
 from pydantic import BaseModel, Field
@@ -62,9 +62,13 @@ from chronovista.repositories.video_repository import VideoRepository
 from chronovista.repositories.video_tag_repository import VideoTagRepository
 from chronovista.repositories.video_topic_repository import VideoTopicRepository
 from chronovista.services.enrichment.shutdown_handler import get_shutdown_handler
+from chronovista.services.enrichment.topic_resolver import TopicResolver
 from chronovista.services.image_cache import ImageCacheConfig, ImageCacheService
 from chronovista.services.youtube_service import YouTubeService
 
+if TYPE_CHECKING:
+    from chronovista.services.enrichment.batch_writer import EnrichmentBatchWriter
+
 logger = logging.getLogger(__name__)
 
 
@@ -1023,6 +1027,29 @@ class EnrichmentService:
             f"Prerequisites verified: {topic_count} topics, {category_count} categories"
         )
 
+    def _batch_writer(
+        self, session: AsyncSession, topic_resolver: TopicResolver | None = None
+    ) -> EnrichmentBatchWriter | None:
+        """Return a set-based page writer, or None to write video by video.
+
+        The set-based writer relies on PostgreSQL (``= ANY``, ``UPDATE ...
+        FROM (VALUES ...)``, ``ON CONFLICT``), so it is only used on a
+        PostgreSQL session with ``ENRICHMENT_SET_BASED_WRITES`` enabled.
+        """
+        from chronovista.config.settings import settings
+
+        if not settings.enrichment_set_based_writes:
+            return None
+        dialect = getattr(session.bind, "dialect", None)
+        if getattr(dialect, "name", None) != "postgresql":
+            return None
+
+        from chronovista.services.enrichment.batch_writer import (
+            EnrichmentBatchWriter,
+        )
+
+        return EnrichmentBatchWriter(self, topic_resolver)
+
     async def enrich_videos(
         self,
         session: AsyncSession,
@@ -1102,6 +1129,7 @@ class EnrichmentService:
         categories_assigned = 0  # T089: Track category assignments during enrichment
         errors = 0
         quota_used = 0
+        topic_resolver: TopicResolver | None = None
 
         # T093: Get shutdown handler for graceful shutdown support
         shutdown = get_shutdown_handler()
@@ -1127,6 +1155,9 @@ class EnrichmentService:
                     categories_assigned=categories_assigned,
                     errors=errors,
                     quota_used=quota_used,
+                    topic_cache=(
+                        topic_resolver.stats if topic_resolver is not None else None
+                    ),
                 ),
                 details=details,
             )
@@ -1224,237 +1255,300 @@ class EnrichmentService:
         # Create a map of video_id -> API data for quick lookup
         api_data_map: dict[str, YouTubeVideoResponse] = {v.id: v for v in api_videos}
 
-        # Process each video using cached IDs (not ORM objects which may have stale connections)
-        for video_id in video_ids:
-            cached = video_cache[video_id]
-            videos_processed += 1
+        # Resolve topic URLs from memory: most videos repeat the same few dozen
+        if any(
+            v.topic_details and v.topic_details.topic_categories for v in api_videos
+        ):
+            topic_resolver = await TopicResolver.load(session)
+
+        # Process each API page using cached IDs (not ORM objects which may have
+        # stale connections). On PostgreSQL a page is written with a handful of
+        # set-based statements; elsewhere, or if that write fails, the page is
+        # written video by video.
+        # A rolled-back transaction takes its dynamic topics with it; the
+        # resolver must forget them too, or later videos would reference them.
+        async def commit() -> None:
+            await session.commit()
+            if topic_resolver is not None:
+                topic_resolver.commit()
 
-            # T093: Check for shutdown between videos
-            try:
-                shutdown.check_shutdown()
-            except GracefulShutdownException:
-                # Commit current batch before shutdown
-                logger.info("Shutdown requested - committing current batch")
+        async def rollback() -> None:
+            await session.rollback()
+            if topic_resolver is not None:
+                topic_resolver.rollback()
+
+        batch_writer = self._batch_writer(session, topic_resolver)
+        for page_start in range(0, len(video_ids), BATCH_SIZE):
+            page = video_ids[page_start : page_start + BATCH_SIZE]
+
+            page_result = None
+            if batch_writer is not None:
+                # T093: Check for shutdown between pages
                 try:
-                    await session.commit()
+                    shutdown.check_shutdown()
+                except GracefulShutdownException:
+                    logger.info("Shutdown requested - committing current batch")
+                    try:
+                        await commit()
+                    except Exception as e:
+                        logger.error(f"Error committing on shutdown: {e}")
+                        await rollback()
+                    raise
+                try:
+                    page_result = await batch_writer.write_page(
+                        session, page, api_data_map, not_found_ids, video_cache
+                    )
                 except Exception as e:
-                    logger.error(f"Error committing on shutdown: {e}")
-                    await session.rollback()
-                raise
-
-            try:
-                if video_id in not_found_ids:
-                    # Video not found — apply multi-cycle confirmation (FR-024/FR-026)
-                    confirmed = await self._mark_video_deleted_by_id(
-                        session, video_id, dry_run
+                    logger.warning(
+                        f"Set-based write failed for batch "
+                        f"{page_start // BATCH_SIZE + 1} ({e}); retrying per video"
                     )
-                    if confirmed:
-                        videos_deleted += 1
-                        details.append(
-                            EnrichmentDetail(
-                                video_id=video_id,
-                                status="deleted",
-                                old_title=cached["title"],
+                    await rollback()
+
+            if page_result is not None:
+                videos_processed += len(page)
+                videos_updated += page_result.videos_updated
+                videos_deleted += page_result.videos_deleted
+                channels_created += page_result.channels_created
+                channels_auto_resolved += page_result.channels_auto_resolved
+                tags_created += page_result.tags_created
+                topics_created += page_result.topics_created
+                categories_assigned += page_result.categories_assigned
+                errors += page_result.errors
+                details.extend(page_result.details)
+            else:
+                for video_id in page:
+                    cached = video_cache[video_id]
+                    videos_processed += 1
+
+                    # T093: Check for shutdown between videos
+                    try:
+                        shutdown.check_shutdown()
+                    except GracefulShutdownException:
+                        # Commit current batch before shutdown
+                        logger.info("Shutdown requested - committing current batch")
+                        try:
+                            await commit()
+                        except Exception as e:
+                            logger.error(f"Error committing on shutdown: {e}")
+                            await rollback()
+                        raise
+
+                    try:
+                        if video_id in not_found_ids:
+                            # Video not found — apply multi-cycle confirmation (FR-024/FR-026)
+                            confirmed = await self._mark_video_deleted_by_id(
+                                session, video_id, dry_run
                             )
-                        )
-                    else:
-                        details.append(
-                            EnrichmentDetail(
-                                video_id=video_id,
-                                status="pending_confirmation",
-                                old_title=cached["title"],
+                            if confirmed:
+                                videos_deleted += 1
+                                details.append(
+                                    EnrichmentDetail(
+                                        video_id=video_id,
+                                        status="deleted",
+                                        old_title=cached["title"],
+                                    )
+                                )
+                            else:
+                                details.append(
+                                    EnrichmentDetail(
+                                        video_id=video_id,
+                                        status="pending_confirmation",
+                                        old_title=cached["title"],
+                                    )
+                                )
+                            continue
+
+                        api_data = api_data_map.get(video_id)
+                        if not api_data:
+                            # Shouldn't happen, but handle gracefully
+                            logger.warning(f"No API data for video {video_id}")
+                            errors += 1
+                            details.append(
+                                EnrichmentDetail(
+                                    video_id=video_id,
+                                    status="error",
+                                    error="No API data returned",
+                                )
                             )
-                        )
-                    continue
+                            continue
 
-                api_data = api_data_map.get(video_id)
-                if not api_data:
-                    # Shouldn't happen, but handle gracefully
-                    logger.warning(f"No API data for video {video_id}")
-                    errors += 1
-                    details.append(
-                        EnrichmentDetail(
-                            video_id=video_id,
-                            status="error",
-                            error="No API data returned",
+                        # Extract video metadata from cached values (avoiding stale ORM objects)
+                        old_title = cached["title"]
+                        old_channel_id = cached["channel_id"]
+                        # Convert Pydantic model to dict for _extract_video_update
+                        # Use mode='json' to serialize datetime objects to ISO strings
+                        api_data_dict = api_data.model_dump(
+                            by_alias=True, exclude_none=False, mode="json"
                         )
-                    )
-                    continue
-
-                # Extract video metadata from cached values (avoiding stale ORM objects)
-                old_title = cached["title"]
-                old_channel_id = cached["channel_id"]
-                # Convert Pydantic model to dict for _extract_video_update
-                # Use mode='json' to serialize datetime objects to ISO strings
-                api_data_dict = api_data.model_dump(
-                    by_alias=True, exclude_none=False, mode="json"
-                )
-                update_data = self._extract_video_update_from_dict(api_data_dict)
-
-                # Fetch fresh video object from database for update
-                video = await self.video_repository.get(session, video_id)
-                if video is None:
-                    logger.warning(f"Video {video_id} not found in database")
-                    errors += 1
-                    details.append(
-                        EnrichmentDetail(
-                            video_id=video_id,
-                            status="error",
-                            error="Video not found in database",
+                        update_data = self._extract_video_update_from_dict(
+                            api_data_dict
                         )
-                    )
-                    continue
-
-                # FR-024: Clear pending unavailability flag on successful API response.
-                # If the video was flagged in a previous cycle but the API now
-                # returns data, it was a transient error — clear the flag.
-                if video.unavailability_first_detected is not None:
-                    logger.info(
-                        f"Video {video_id} returned from API after pending "
-                        f"unavailability — clearing transient flag"
-                    )
-                    video.unavailability_first_detected = None
-
-                # FR-018/FR-023: Restoration — if a previously unavailable video
-                # is now accessible via the API, restore it to available status.
-                if video.availability_status != AvailabilityStatus.AVAILABLE:
-                    old_status = video.availability_status
-                    video.availability_status = AvailabilityStatus.AVAILABLE
-                    video.unavailability_first_detected = None
-                    # Provenance goes through the repository, which appends to
-                    # video_recovery_sources and refreshes the denormalised
-                    # columns. This pass does not think of itself as a recovery
-                    # implementation, which is exactly why it has to be routed:
-                    # a bulk pass writing the column directly is what destroyed
-                    # 92 rows' attribution (ADR-011).
-                    await self._provenance_repo.record_video(
-                        session,
-                        video_id,
-                        RecoverySourceRecord(
-                            source=_SYNC_SOURCE,
-                            fields_written=["availability_status"],
-                        ),
-                    )
-                    logger.info(
-                        f"Restored video {video_id} from '{old_status}' to available "
-                        f"(recovery_source=sync)"
-                    )
 
-                # Update the video
-                for key, value in update_data.items():
-                    setattr(video, key, value)
-
-                # Handle channel creation/update
-                if api_data.snippet:
-                    channel_id = api_data.snippet.channel_id
-                    channel_title = api_data.snippet.channel_title
+                        # Fetch fresh video object from database for update
+                        video = await self.video_repository.get(session, video_id)
+                        if video is None:
+                            logger.warning(f"Video {video_id} not found in database")
+                            errors += 1
+                            details.append(
+                                EnrichmentDetail(
+                                    video_id=video_id,
+                                    status="error",
+                                    error="Video not found in database",
+                                )
+                            )
+                            continue
 
-                    if channel_id and channel_title:
-                        channel_created = await self._ensure_channel_exists(
-                            session, channel_id, channel_title
-                        )
-                        if channel_created:
-                            channels_created += 1
-
-                        # T045-T049: Auto-resolve channel reference for orphan videos
-                        # T045: Detect NULL channel_id with channel_name_hint
-                        if video.channel_id is None and video.channel_name_hint:
-                            # T046: Channel now exists (created or looked up above)
-                            # T047: Update video.channel_id and clear channel_name_hint
-                            old_hint = video.channel_name_hint
-                            video.channel_id = channel_id
-                            video.channel_name_hint = None
-                            channels_auto_resolved += 1
-                            # T048: Log channel auto-resolution event
+                        # FR-024: Clear pending unavailability flag on successful API response.
+                        # If the video was flagged in a previous cycle but the API now
+                        # returns data, it was a transient error — clear the flag.
+                        if video.unavailability_first_detected is not None:
                             logger.info(
-                                f"Auto-resolved channel for video {video_id}: "
-                                f"'{old_hint}' -> channel {channel_id} ({channel_title})"
+                                f"Video {video_id} returned from API after pending "
+                                f"unavailability — clearing transient flag"
+                            )
+                            video.unavailability_first_detected = None
+
+                        # FR-018/FR-023: Restoration — if a previously unavailable video
+                        # is now accessible via the API, restore it to available status.
+                        if video.availability_status != AvailabilityStatus.AVAILABLE:
+                            old_status = video.availability_status
+                            video.availability_status = AvailabilityStatus.AVAILABLE
+                            video.unavailability_first_detected = None
+                            # Provenance goes through the repository, which appends to
+                            # video_recovery_sources and refreshes the denormalised
+                            # columns. This pass does not think of itself as a recovery
+                            # implementation, which is exactly why it has to be routed:
+                            # a bulk pass writing the column directly is what destroyed
+                            # 92 rows' attribution (ADR-011).
+                            await self._provenance_repo.record_video(
+                                session,
+                                video_id,
+                                RecoverySourceRecord(
+                                    source=_SYNC_SOURCE,
+                                    fields_written=["availability_status"],
+                                ),
                             )
-                            # T049: "Last Writer Wins" - if seeder updates concurrently,
-                            # the last commit wins. Since both set valid data, this is acceptable.
-                        elif video.channel_id is None:
-                            # Video has NULL channel_id but no hint - still link it
-                            video.channel_id = channel_id
-                            channels_auto_resolved += 1
                             logger.info(
-                                f"Linked orphan video {video_id} to channel {channel_id} ({channel_title})"
+                                f"Restored video {video_id} from '{old_status}' to available "
+                                f"(recovery_source=sync)"
                             )
 
-                    # T068-T073: Enrich tags from snippet.tags array
-                    # T069: Extract tags from snippet.tags (already a list of strings)
-                    # T073: Tags are preserved exactly as returned (Unicode/special chars)
-                    api_tags = api_data.snippet.tags or []
-                    video_tags_count = await self.enrich_tags(
-                        session, video_id, api_tags
-                    )
-                    tags_created += video_tags_count
+                        # Update the video
+                        for key, value in update_data.items():
+                            setattr(video, key, value)
 
-                    # T085-T088: Enrich category from snippet.categoryId
-                    # T086: Extract category ID from API response
-                    # T087: Match against pre-seeded video_categories table (FR-046)
-                    # T088: Log warning for unrecognized IDs (FR-047)
-                    api_category_id = api_data.snippet.category_id
-                else:
-                    api_tags = []
-                    api_category_id = None
-
-                # T076-T082: Enrich topics from topicDetails.topicCategories
-                # T077: Parse Wikipedia URLs and extract topic names
-                # T078: Match against pre-seeded topic_categories table
-                if api_data.topic_details:
-                    topic_urls = api_data.topic_details.topic_categories or []
-                    video_topics_count = await self.enrich_topics(
-                        session, video_id, topic_urls
-                    )
-                    topics_created += video_topics_count
-                else:
-                    video_topics_count = 0
-                category_was_assigned = await self.enrich_categories(
-                    session, video_id, api_category_id
-                )
-                if category_was_assigned:
-                    categories_assigned += 1
+                        # Handle channel creation/update
+                        if api_data.snippet:
+                            channel_id = api_data.snippet.channel_id
+                            channel_title = api_data.snippet.channel_title
 
-                videos_updated += 1
-                details.append(
-                    EnrichmentDetail(
-                        video_id=video_id,
-                        status="updated",
-                        old_title=old_title,
-                        new_title=update_data.get("title", old_title),
-                        old_channel=old_channel_id,
-                        new_channel=channel_id,
-                        category_id=update_data.get("category_id"),
-                        tags_count=video_tags_count,  # T074: Report tags per video
-                        topics_count=video_topics_count,  # T083: Report topics per video
-                    )
-                )
+                            if channel_id and channel_title:
+                                channel_created = await self._ensure_channel_exists(
+                                    session, channel_id, channel_title
+                                )
+                                if channel_created:
+                                    channels_created += 1
+
+                                # T045-T049: Auto-resolve channel reference for orphan videos
+                                # T045: Detect NULL channel_id with channel_name_hint
+                                if video.channel_id is None and video.channel_name_hint:
+                                    # T046: Channel now exists (created or looked up above)
+                                    # T047: Update video.channel_id and clear channel_name_hint
+                                    old_hint = video.channel_name_hint
+                                    video.channel_id = channel_id
+                                    video.channel_name_hint = None
+                                    channels_auto_resolved += 1
+                                    # T048: Log channel auto-resolution event
+                                    logger.info(
+                                        f"Auto-resolved channel for video {video_id}: "
+                                        f"'{old_hint}' -> channel {channel_id} ({channel_title})"
+                                    )
+                                    # T049: "Last Writer Wins" - if seeder updates concurrently,
+                                    # the last commit wins. Since both set valid data, this is acceptable.
+                                elif video.channel_id is None:
+                                    # Video has NULL channel_id but no hint - still link it
+                                    video.channel_id = channel_id
+                                    channels_auto_resolved += 1
+                                    logger.info(
+                                        f"Linked orphan video {video_id} to channel {channel_id} ({channel_title})"
+                                    )
 
-            except Exception as e:
-                logger.error(f"Error enriching video {video_id}: {e}")
-                errors += 1
-                details.append(
-                    EnrichmentDetail(
-                        video_id=video_id,
-                        status="error",
-                        error=str(e),
-                    )
-                )
-                # Database errors put the session in DEACTIVE state.
-                # Try to rollback to recover, but if that fails (e.g., greenlet
-                # context lost), break out of the loop and return partial results.
-                try:
-                    await session.rollback()
-                    logger.info(
-                        f"Rolled back after error on video {video_id}, continuing"
-                    )
-                except Exception as rollback_error:
-                    logger.error(
-                        f"Rollback failed ({rollback_error}), stopping enrichment. "
-                        f"Processed {videos_processed} videos before error."
-                    )
-                    # Return partial results - can't continue safely
-                    return create_report()
+                            # T068-T073: Enrich tags from snippet.tags array
+                            # T069: Extract tags from snippet.tags (already a list of strings)
+                            # T073: Tags are preserved exactly as returned (Unicode/special chars)
+                            api_tags = api_data.snippet.tags or []
+                            video_tags_count = await self.enrich_tags(
+                                session, video_id, api_tags
+                            )
+                            tags_created += video_tags_count
+
+                            # T085-T088: Enrich category from snippet.categoryId
+                            # T086: Extract category ID from API response
+                            # T087: Match against pre-seeded video_categories table (FR-046)
+                            # T088: Log warning for unrecognized IDs (FR-047)
+                            api_category_id = api_data.snippet.category_id
+                        else:
+                            api_tags = []
+                            api_category_id = None
+
+                        # T076-T082: Enrich topics from topicDetails.topicCategories
+                        # T077: Parse Wikipedia URLs and extract topic names
+                        # T078: Match against pre-seeded topic_categories table
+                        if api_data.topic_details:
+                            topic_urls = api_data.topic_details.topic_categories or []
+                            video_topics_count = await self.enrich_topics(
+                                session, video_id, topic_urls, topic_resolver
+                            )
+                            topics_created += video_topics_count
+                        else:
+                            video_topics_count = 0
+                        category_was_assigned = await self.enrich_categories(
+                            session, video_id, api_category_id
+                        )
+                        if category_was_assigned:
+                            categories_assigned += 1
+
+                        videos_updated += 1
+                        details.append(
+                            EnrichmentDetail(
+                                video_id=video_id,
+                                status="updated",
+                                old_title=old_title,
+                                new_title=update_data.get("title", old_title),
+                                old_channel=old_channel_id,
+                                new_channel=channel_id,
+                                category_id=update_data.get("category_id"),
+                                tags_count=video_tags_count,  # T074: Report tags per video
+                                topics_count=video_topics_count,  # T083: Report topics per video
+                            )
+                        )
+
+                    except Exception as e:
+                        logger.error(f"Error enriching video {video_id}: {e}")
+                        errors += 1
+                        details.append(
+                            EnrichmentDetail(
+                                video_id=video_id,
+                                status="error",
+                                error=str(e),
+                            )
+                        )
+                        # Database errors put the session in DEACTIVE state.
+                        # Try to rollback to recover, but if that fails (e.g., greenlet
+                        # context lost), break out of the loop and return partial results.
+                        try:
+                            await rollback()
+                            logger.info(
+                                f"Rolled back after error on video {video_id}, continuing"
+                            )
+                        except Exception as rollback_error:
+                            logger.error(
+                                f"Rollback failed ({rollback_error}), stopping enrichment. "
+                                f"Processed {videos_processed} videos before error."
+                            )
+                            # Return partial results - can't continue safely
+                            return create_report()
 
             # Commit after each batch
             if videos_processed % BATCH_SIZE == 0:
@@ -1464,32 +1558,32 @@ class EnrichmentService:
                 except GracefulShutdownException:
                     logger.info("Shutdown requested at batch boundary")
                     try:
-                        await session.commit()
+                        await commit()
                         logger.info(
                             f"Committed batch {videos_processed // BATCH_SIZE} "
                             f"before shutdown"
                         )
                     except Exception as e:
                         logger.error(f"Error committing on shutdown: {e}")
-                        await session.rollback()
+                        await rollback()
                     raise
 
                 try:
-                    await session.commit()
+                    await commit()
                     logger.info(f"Committed batch {videos_processed // BATCH_SIZE}")
                 except Exception as e:
                     logger.error(f"Error committing batch: {e}")
-                    await session.rollback()
+                    await rollback()
 
                 if progress_cb is not None:
                     progress_cb(videos_processed / len(video_ids))
 
         # Final commit for remaining videos
         try:
-            await session.commit()
+            await commit()
         except Exception as e:
             logger.error(f"Error in final commit: {e}")
-            await session.rollback()
+            await rollback()
 
         if progress_cb is not None:
             progress_cb(1.0)
@@ -2367,7 +2461,11 @@ class EnrichmentService:
         return len(created_tags)
 
     async def enrich_topics(
-        self, session: AsyncSession, video_id: str, topic_urls: list[str] | None
+        self,
+        session: AsyncSession,
+        video_id: str,
+        topic_urls: list[str] | None,
+        topic_resolver: TopicResolver | None = None,
     ) -> int:
         """
         Enrich topics for a specific video.
@@ -2394,6 +2492,9 @@ class EnrichmentService:
         topic_urls : list[str] | None
             List of Wikipedia topic URLs from YouTube API's
             topicDetails.topicCategories field.
+        topic_resolver : TopicResolver | None, optional
+            In-memory topic maps for the current run; without one, each URL
+            is resolved with database queries.
 
         Returns
         -------
@@ -2408,7 +2509,7 @@ class EnrichmentService:
         matched_topic_ids: list[str] = []
 
         for url in topic_urls:
-            topic_id = await self._match_topic_from_url(session, url)
+            topic_id = await self._match_topic_from_url(session, url, topic_resolver)
             if topic_id:
                 matched_topic_ids.append(topic_id)
 
@@ -2423,7 +2524,10 @@ class EnrichmentService:
         return 0
 
     async def _match_topic_from_url(
-        self, session: AsyncSession, url: str
+        self,
+        session: AsyncSession,
+        url: str,
+        topic_resolver: TopicResolver | None = None,
     ) -> str | None:
         """
         Match a Wikipedia URL to a topic category using 4-stage resolution.
@@ -2446,6 +2550,9 @@ class EnrichmentService:
             Database session for operations.
         url : str
             Wikipedia URL from YouTube API (e.g., https://en.wikipedia.org/wiki/Music)
+        topic_resolver : TopicResolver | None, optional
+            When given, stages 1-3 are answered from its in-memory maps and a
+            dynamically created topic is added to them.
 
         Returns
         -------
@@ -2469,6 +2576,16 @@ class EnrichmentService:
 
         # URL-decode the topic name (handles %20, %26, etc.)
         decoded_topic_name = unquote(raw_topic_name)
+        normalized_name = decoded_topic_name.lower().replace("_", " ").strip()
+
+        if topic_resolver is not None:
+            # Stages 1-3 from the run's in-memory maps
+            resolved = topic_resolver.lookup(url, normalized_name, decoded_topic_name)
+            if resolved is not None:
+                return resolved
+            return await self._create_dynamic_topic(
+                session, url, decoded_topic_name, topic_resolver
+            )
 
         # ==================================================================
         # Stage 1: Match by wikipedia_url (exact match - fastest)
@@ -2490,7 +2607,6 @@ class EnrichmentService:
         # ==================================================================
         # Stage 2: Match by normalized_name (lowercase, no underscores)
         # ==================================================================
-        normalized_name = decoded_topic_name.lower().replace("_", " ").strip()
         query = (
             select(TopicCategoryDB.topic_id)
             .where(TopicCategoryDB.normalized_name == normalized_name)
@@ -2566,7 +2682,11 @@ class EnrichmentService:
         return (language, topic_name)
 
     async def _create_dynamic_topic(
-        self, session: AsyncSession, url: str, topic_name: str
+        self,
+        session: AsyncSession,
+        url: str,
+        topic_name: str,
+        topic_resolver: TopicResolver | None = None,
     ) -> str | None:
         """
         Dynamically create a new topic from an unrecognized Wikipedia URL.
@@ -2589,6 +2709,9 @@ class EnrichmentService:
             Full Wikipedia URL (e.g., https://en.wikipedia.org/wiki/Politics)
         topic_name : str
             Decoded topic name from URL (e.g., "Politics", "Humour")
+        topic_resolver : TopicResolver | None, optional
+            The run's in-memory topic maps: consulted instead of the existence
+            query, and given the new topic.
 
         Returns
         -------
@@ -2603,13 +2726,21 @@ class EnrichmentService:
         topic_id = f"wiki_{topic_name}"
 
         # Check if this dynamic topic already exists (race condition protection)
-        existing = await session.execute(
-            select(TopicCategoryDB.topic_id).where(TopicCategoryDB.topic_id == topic_id)
-        )
-        if existing.first():
+        if topic_resolver is not None:
+            exists = topic_resolver.has_topic(topic_id)
+        else:
+            existing = await session.execute(
+                select(TopicCategoryDB.topic_id).where(
+                    TopicCategoryDB.topic_id == topic_id
+                )
+            )
+            exists = existing.first() is not None
+        if exists:
             logger.debug(
                 f"Stage 4: Found existing dynamic topic '{topic_id}' for URL '{url}'"
             )
+            if topic_resolver is not None:
+                topic_resolver.add(topic_id, url, None)
             return topic_id
 
         try:
@@ -2629,6 +2760,9 @@ class EnrichmentService:
             )
             session.add(dynamic_topic)
             await session.flush()
+            if topic_resolver is not None:
+                topic_resolver.add(topic_id, url, normalized_name, pending=True)
+                topic_resolver.stats.created += 1
 
             logger.info(f"Stage 4: Created dynamic topic '{topic_id}' for URL '{url}'")
             return topic_id
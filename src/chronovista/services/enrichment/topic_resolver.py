@@ -0,0 +1,186 @@
+"""
+In-memory topic URL resolution for an enrichment run.
+
+``EnrichmentService._match_topic_from_url`` resolves a Wikipedia topic URL in
+up to three sequential queries (``wikipedia_url``, then ``normalized_name``,
+then ``topic_aliases``) before creating a dynamic topic. An enrichment run
+sees the same couple of dozen URLs on almost every video, so
+:class:`TopicResolver` loads ``topic_categories`` and ``topic_aliases`` once
+into hash maps and answers the same three stages from memory. Dynamic topics
+created during the run are added to the maps, and every URL resolved by name
+or alias is remembered by URL so it is a single lookup the next time.
+
+The maps are a snapshot taken at the start of the run: topics seeded by
+another process mid-run are picked up by the next run, exactly as the
+per-URL queries would have found them one video later.
+
+A dynamic topic exists only once its transaction commits. Entries added for
+it stay pending until :meth:`TopicResolver.commit`; :meth:`TopicResolver.rollback`
+drops them, so a rolled-back page cannot leave the resolver handing out a
+``wiki_*`` ID that would fail the ``video_topics`` foreign key.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from chronovista.db.models import TopicAlias as TopicAliasDB
+from chronovista.db.models import TopicCategory as TopicCategoryDB
+from chronovista.models.enrichment_report import TopicCacheStats
+
+
+class TopicResolver:
+    """
+    Hash maps of topic IDs keyed by URL, normalized name and alias.
+
+    Use :meth:`load` to build one from the database.
+
+    Examples
+    --------
+    >>> resolver = TopicResolver()
+    >>> resolver.add("/m/04rlf", "https://en.wikipedia.org/wiki/Music", "music")
+    >>> resolver.lookup("https://en.wikipedia.org/wiki/Music", "music", "Music")
+    '/m/04rlf'
+    >>> resolver.stats.hit_rate
+    1.0
+    """
+
+    def __init__(self) -> None:
+        self._by_url: dict[str, str] = {}
+        self._by_name: dict[str, str] = {}
+        self._by_alias: dict[str, str] = {}
+        self._topic_ids: set[str] = set()
+        # Topics added, and map entries made for them, since the last commit.
+        self._pending_ids: set[str] = set()
+        self._pending_keys: list[tuple[dict[str, str], str]] = []
+        self.stats = TopicCacheStats()
+
+    @classmethod
+    async def load(cls, session: AsyncSession) -> TopicResolver:
+        """
+        Load every topic and alias in two queries.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Database session.
+
+        Returns
+        -------
+        TopicResolver
+            A resolver holding the current topics and aliases.
+        """
+        resolver = cls()
+        topics = await session.execute(
+            select(
+                TopicCategoryDB.topic_id,
+                TopicCategoryDB.wikipedia_url,
+                TopicCategoryDB.normalized_name,
+            ).order_by(TopicCategoryDB.topic_id)
+        )
+        for topic_id, url, normalized_name in topics:
+            resolver.add(topic_id, url, normalized_name)
+        aliases = await session.execute(
+            select(TopicAliasDB.alias, TopicAliasDB.topic_id)
+        )
+        for alias, topic_id in aliases:
+            resolver._by_alias[alias] = topic_id
+        return resolver
+
+    def add(
+        self,
+        topic_id: str,
+        url: str | None,
+        normalized_name: str | None,
+        *,
+        pending: bool = False,
+    ) -> None:
+        """
+        Register a topic, e.g. one created dynamically during the run.
+
+        Earlier registrations win, matching the queries' preference for the
+        lowest ``topic_id`` (Freebase ``/m/...`` IDs sort first).
+
+        Parameters
+        ----------
+        topic_id : str
+            The topic's ID.
+        url : str | None
+            Its ``wikipedia_url``.
+        normalized_name : str | None
+            Its ``normalized_name``.
+        pending : bool
+            The topic was created in the open transaction. Its entries are
+            kept until :meth:`commit` and dropped by :meth:`rollback`. Entries
+            for a topic that is already pending are pending too.
+        """
+        pending = pending or topic_id in self._pending_ids
+        if topic_id not in self._topic_ids:
+            self._topic_ids.add(topic_id)
+            if pending:
+                self._pending_ids.add(topic_id)
+        if url:
+            self._set(self._by_url, url, topic_id, pending)
+        if normalized_name:
+            self._set(self._by_name, normalized_name, topic_id, pending)
+
+    def commit(self) -> None:
+        """Keep the pending entries: their transaction committed."""
+        self._pending_ids.clear()
+        self._pending_keys.clear()
+
+    def rollback(self) -> None:
+        """Drop the pending entries: their transaction rolled back."""
+        for mapping, key in reversed(self._pending_keys):
+            mapping.pop(key, None)
+        self._topic_ids -= self._pending_ids
+        self.commit()
+
+    def _set(
+        self, mapping: dict[str, str], key: str, topic_id: str, pending: bool
+    ) -> None:
+        if key in mapping:
+            return
+        mapping[key] = topic_id
+        if pending:
+            self._pending_keys.append((mapping, key))
+
+    def has_topic(self, topic_id: str) -> bool:
+        """Whether a topic with this ID exists (loaded or added)."""
+        return topic_id in self._topic_ids
+
+    def lookup(self, url: str, normalized_name: str, decoded_name: str) -> str | None:
+        """
+        Resolve a URL by the same three stages as the database queries.
+
+        Parameters
+        ----------
+        url : str
+            Wikipedia URL as returned by the API.
+        normalized_name : str
+            Lowercased topic name with underscores replaced by spaces.
+        decoded_name : str
+            URL-decoded topic name, tried as an alias.
+
+        Returns
+        -------
+        str | None
+            The topic ID, or None if the caller should create a dynamic topic
+            (and then :meth:`add` it).
+        """
+        self.stats.lookups += 1
+        topic_id = self._by_url.get(url)
+        if topic_id is not None:
+            self.stats.url_hits += 1
+            return topic_id
+        topic_id = self._by_name.get(normalized_name)
+        if topic_id is not None:
+            self.stats.name_hits += 1
+        else:
+            topic_id = self._by_alias.get(decoded_name)
+            if topic_id is None:
+                return None
+            self.stats.alias_hits += 1
+        self._set(self._by_url, url, topic_id, topic_id in self._pending_ids)
+        return topic_id
@@ -19,13 +19,25 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
-from sqlalchemy import Select, func, literal_column, select, text
+from sqlalchemy import (
+    BigInteger,
+    Select,
+    any_,
+    bindparam,
+    delete,
+    func,
+    literal_column,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from chronovista.db.models import EntityAlias as EntityAliasDB
 from chronovista.db.models import EntityMention as EntityMentionDB
 from chronovista.db.models import NamedEntity as NamedEntityDB
 from chronovista.db.models import TranscriptSegment as TranscriptSegmentDB
+from chronovista.db.models import TranscriptSegmentChange as TranscriptSegmentChangeDB
 from chronovista.db.models import Video as VideoDB
 from chronovista.models.entity_mention import EntityMentionCreate
 from chronovista.models.enums import DetectionMethod, MentionSource
@@ -114,6 +126,9 @@ class ScanResult:
         Number of matches suppressed by longest-match-wins disambiguation.
     skipped_exclusion_pattern : int
         Number of matches suppressed by exclusion pattern overlap.
+    mentions_removed : int
+        Stale mentions deleted from changed segments
+        (``--changed-since-last-scan``).
     """
 
     segments_scanned: int = 0
@@ -127,6 +142,7 @@ class ScanResult:
     dry_run_matches: list[dict[str, Any]] | None = None
     skipped_longest_match: int = 0
     skipped_exclusion_pattern: int = 0
+    mentions_removed: int = 0
 
 
 @dataclass
@@ -169,6 +185,13 @@ class EntityMentionScanService:
     scanning (skip segments already matched for a given entity) and full
     rescan (delete + re-detect).
 
+    Each batch ends its own transaction — committed in live mode, rolled back
+    in dry-run mode — so a scan holds a pooled connection only while a batch
+    is in flight rather than for the whole run. A scan that dies part-way
+    keeps the batches already committed; re-running it is safe because
+    inserts skip existing mentions and counters are recomputed from the
+    table.
+
     Parameters
     ----------
     session_factory : async_sessionmaker[AsyncSession]
@@ -179,6 +202,14 @@ class EntityMentionScanService:
         self._session_factory = session_factory
         self._mention_repo = EntityMentionRepository()
 
+    @staticmethod
+    async def _end_chunk(session: AsyncSession, dry_run: bool) -> None:
+        """Finish the current batch's transaction, releasing its connection."""
+        if dry_run:
+            await session.rollback()
+        else:
+            await session.commit()
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -274,6 +305,7 @@ class EntityMentionScanService:
                     "Full rescan: deleted %d existing transcript mentions", deleted
                 )
                 await session.flush()
+            await self._end_chunk(session, dry_run)
 
             # 3. Process segments in batches
             result = ScanResult(dry_run=dry_run)
@@ -305,6 +337,7 @@ class EntityMentionScanService:
                         last_id,
                         exc_info=True,
                     )
+                    await session.rollback()
                     result.failed_batches += 1
                     fetch_failures_at_cursor += 1
                     if fetch_failures_at_cursor >= _MAX_FETCH_RETRIES:
@@ -350,6 +383,7 @@ class EntityMentionScanService:
                         last_id,
                         exc_info=True,
                     )
+                    await session.rollback()
                     result.failed_batches += 1
                     # The rows are in hand, so the batch can still be skipped
                     # exactly as before: advance past the ones just fetched.
@@ -366,12 +400,14 @@ class EntityMentionScanService:
                     matched_video_ids.add(m.video_id)
 
                 if not dry_run and batch_mentions:
+                    # Incremental scans only add mentions, so the batch's
+                    # inserts are applied to the counters as it commits; a
+                    # full rescan recomputes them once at the end instead.
                     inserted = await self._mention_repo.bulk_create_with_conflict_skip(
-                        session, batch_mentions
+                        session, batch_mentions, adjust_counters=not full_rescan
                     )
                     result.mentions_found += inserted
                     result.mentions_skipped += len(batch_mentions) - inserted
-                    await session.flush()
                 elif dry_run:
                     result.mentions_found += len(batch_mentions)
                     if result.dry_run_matches is not None and batch_previews:
@@ -380,6 +416,7 @@ class EntityMentionScanService:
                 result.mentions_skipped += batch_skipped
                 result.skipped_longest_match += batch_lmw_skips
                 result.skipped_exclusion_pattern += batch_ep_skips
+                await self._end_chunk(session, dry_run)
 
                 if progress_callback:
                     progress_callback(result.segments_scanned, result.mentions_found)
@@ -400,14 +437,14 @@ class EntityMentionScanService:
             result.unique_entities = len(matched_entity_ids)
             result.unique_videos = len(matched_video_ids)
 
-            # 4. Update entity and alias counters (live mode only)
-            # On full_rescan we must refresh ALL scanned entities (some may
-            # have had their mentions deleted with nothing new to replace
-            # them, so their counters need to be zeroed).
+            # 4. Recompute entity and alias counters after a full rescan (live
+            # mode only). It must cover ALL scanned entities: some may have had
+            # their mentions deleted with nothing new to replace them, so
+            # their counters need to be zeroed. Incremental scans already
+            # applied their inserts batch by batch.
             counter_entity_ids: set[uuid.UUID] = set()
             if full_rescan:
-                counter_entity_ids = set(scoped_entity_ids)
-            counter_entity_ids |= matched_entity_ids
+                counter_entity_ids = set(scoped_entity_ids) | matched_entity_ids
 
             if not dry_run and counter_entity_ids:
                 await self._mention_repo.update_entity_counters(
@@ -418,7 +455,7 @@ class EntityMentionScanService:
                 )
                 await session.flush()
 
-            # 5. Commit all work
+            # 5. Commit the counter refresh
             if not dry_run:
                 await session.commit()
 
@@ -443,6 +480,207 @@ class EntityMentionScanService:
 
             return result
 
+    async def scan_changed_segments(
+        self,
+        batch_size: int = 500,
+        dry_run: bool = False,
+        limit: int | None = None,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> ScanResult:
+        """Rescan only the segments changed since the last changed-segments scan.
+
+        Reads ``transcript_segment_changes`` in id order, ``batch_size`` log
+        rows at a time. For each batch, in one transaction: the changed
+        segments' ``rule_match`` transcript mentions are deleted, the
+        segments are re-detected against every active entity, the new
+        mentions are inserted, both are applied to the stored counters and
+        the consumed log rows are deleted. A batch
+        either lands completely or not at all, so a failed batch stays in the
+        log for the next run.
+
+        Parameters
+        ----------
+        batch_size : int
+            Change-log rows processed per batch (default 500).
+        dry_run : bool
+            If ``True``, collect preview data; nothing is written and the
+            log is left as it is.
+        limit : int | None
+            Cap the number of dry-run preview rows collected.
+        progress_callback : Callable[[int, int], None] | None
+            Called after each batch with ``(segments_scanned, mentions_found)``.
+
+        Returns
+        -------
+        ScanResult
+            Aggregate statistics; ``mentions_removed`` counts the stale
+            mentions dropped.
+        """
+        t0 = time.monotonic()
+        changes = TranscriptSegmentChangeDB
+
+        async with self._session_factory() as session:
+            patterns = await self._load_entity_patterns(
+                session, entity_type=None, new_entities_only=False, entity_ids=None
+            )
+            await self._end_chunk(session, dry_run)
+
+            result = ScanResult(dry_run=dry_run)
+            if dry_run:
+                result.dry_run_matches = []
+            matched_entity_ids: set[uuid.UUID] = set()
+            matched_video_ids: set[str] = set()
+            saw_deletions = False
+
+            last_change_id = 0
+            while True:
+                change_rows = (
+                    await session.execute(
+                        select(changes.id, changes.segment_id, changes.deleted)
+                        .where(changes.id > last_change_id)
+                        .order_by(changes.id)
+                        .limit(batch_size)
+                    )
+                ).all()
+                if not change_rows:
+                    break
+                max_change_id = change_rows[-1].id
+                segment_ids = sorted(
+                    {r.segment_id for r in change_rows if not r.deleted}
+                )
+                batch_deleted = any(r.deleted for r in change_rows)
+
+                try:
+                    dropped = (
+                        0
+                        if dry_run
+                        else await self._mention_repo.delete_rule_matches_for_segments(
+                            session, segment_ids
+                        )
+                    )
+                    batch_rows = (
+                        await self._fetch_segment_batch(
+                            session,
+                            video_ids=None,
+                            language_code=None,
+                            batch_size=len(segment_ids),
+                            after_id=0,
+                            segment_ids=segment_ids,
+                        )
+                        if segment_ids and patterns
+                        else []
+                    )
+                    (
+                        batch_mentions,
+                        _,
+                        batch_previews,
+                        batch_lmw_skips,
+                        batch_ep_skips,
+                    ) = await self._scan_batch(
+                        session,
+                        batch_rows=batch_rows,
+                        patterns=patterns,
+                        full_rescan=True,
+                        dry_run=dry_run,
+                        limit=limit,
+                        current_preview_count=(
+                            len(result.dry_run_matches)
+                            if result.dry_run_matches is not None
+                            else 0
+                        ),
+                    )
+                    if not dry_run:
+                        if batch_mentions:
+                            result.mentions_found += (
+                                await self._mention_repo.bulk_create_with_conflict_skip(
+                                    session, batch_mentions, adjust_counters=True
+                                )
+                            )
+                        # Exactly the rows this batch read: an id range would
+                        # also take a failed batch's rows still queued below,
+                        # and rows committed late under a lower id.
+                        await session.execute(
+                            delete(changes).where(
+                                changes.id
+                                == any_(
+                                    bindparam(
+                                        "change_ids",
+                                        value=[r.id for r in change_rows],
+                                        type_=ARRAY(BigInteger),
+                                    )
+                                )
+                            )
+                        )
+                except Exception:
+                    logger.warning(
+                        "Failed to rescan changed segments up to change id=%d",
+                        max_change_id,
+                        exc_info=True,
+                    )
+                    await session.rollback()
+                    result.failed_batches += 1
+                    last_change_id = max_change_id
+                    continue
+                await self._end_chunk(session, dry_run)
+
+                result.segments_scanned += len(batch_rows)
+                result.mentions_removed += dropped
+                result.skipped_longest_match += batch_lmw_skips
+                result.skipped_exclusion_pattern += batch_ep_skips
+                saw_deletions = saw_deletions or batch_deleted
+                for m in batch_mentions:
+                    matched_entity_ids.add(m.entity_id)
+                    matched_video_ids.add(m.video_id)
+                if dry_run:
+                    result.mentions_found += len(batch_mentions)
+                    if result.dry_run_matches is not None:
+                        result.dry_run_matches.extend(batch_previews)
+                last_change_id = max_change_id
+
+                if progress_callback:
+                    progress_callback(result.segments_scanned, result.mentions_found)
+                if (
+                    dry_run
+                    and limit is not None
+                    and result.dry_run_matches is not None
+                    and len(result.dry_run_matches) >= limit
+                ):
+                    result.dry_run_matches = result.dry_run_matches[:limit]
+                    break
+
+            result.unique_entities = len(matched_entity_ids)
+            result.unique_videos = len(matched_video_ids)
+
+            # Stale and new mentions were applied to the counters batch by
+            # batch. Deleted segments, though, took their mentions with them
+            # (ON DELETE CASCADE), so the entities they counted for are
+            # unknown: recompute every scanned entity, as a full rescan does.
+            counter_entity_ids: set[uuid.UUID] = set()
+            if saw_deletions:
+                counter_entity_ids = {p.entity_id for p in patterns}
+            if not dry_run and counter_entity_ids:
+                await self._mention_repo.update_entity_counters(
+                    session, list(counter_entity_ids)
+                )
+                await self._mention_repo.update_alias_counters(
+                    session, list(counter_entity_ids)
+                )
+                await session.commit()
+
+            result.duration_seconds = time.monotonic() - t0
+            logger.info(
+                "Changed-segment scan complete: segments_scanned=%d, "
+                "mentions_found=%d, mentions_removed=%d, duration=%.2fs, "
+                "dry_run=%s, failed_batches=%d",
+                result.segments_scanned,
+                result.mentions_found,
+                result.mentions_removed,
+                result.duration_seconds,
+                result.dry_run,
+                result.failed_batches,
+            )
+            return result
+
     async def audit_unregistered_mentions(
         self,
     ) -> list[tuple[str, uuid.UUID, str, int]]:
@@ -602,6 +840,7 @@ class EntityMentionScanService:
                         source,
                     )
                 await session.flush()
+            await self._end_chunk(session, dry_run)
 
             # 3. Pre-compile Python regexes
             compiled_patterns: list[tuple[_EntityPattern, re.Pattern[str]]] = []
@@ -644,6 +883,7 @@ class EntityMentionScanService:
                         last_video_id,
                         exc_info=True,
                     )
+                    await session.rollback()
                     result.failed_batches += 1
                     fetch_failures_at_cursor += 1
                     if fetch_failures_at_cursor >= _MAX_FETCH_RETRIES:
@@ -691,16 +931,19 @@ class EntityMentionScanService:
                     matched_video_ids.add(m.video_id)
 
                 if not dry_run and batch_mentions:
+                    # Incremental scans only add mentions, so the batch's
+                    # inserts are applied to the counters as it commits; a
+                    # full rescan recomputes them once at the end instead.
                     inserted = await self._mention_repo.bulk_create_with_conflict_skip(
-                        session, batch_mentions
+                        session, batch_mentions, adjust_counters=not full_rescan
                     )
                     result.mentions_found += inserted
                     result.mentions_skipped += len(batch_mentions) - inserted
-                    await session.flush()
                 elif dry_run:
                     result.mentions_found += len(batch_mentions)
                     if result.dry_run_matches is not None and batch_previews:
                         result.dry_run_matches.extend(batch_previews)
+                await self._end_chunk(session, dry_run)
 
                 if progress_callback:
                     progress_callback(result.segments_scanned, result.mentions_found)
@@ -710,11 +953,11 @@ class EntityMentionScanService:
             result.unique_entities = len(matched_entity_ids)
             result.unique_videos = len(matched_video_ids)
 
-            # 5. Update entity and alias counters (live mode only)
+            # 5. Recompute entity and alias counters after a full rescan (live
+            # mode only); incremental scans applied their inserts per batch.
             counter_entity_ids: set[uuid.UUID] = set()
             if full_rescan:
-                counter_entity_ids = set(scoped_entity_ids)
-            counter_entity_ids |= matched_entity_ids
+                counter_entity_ids = set(scoped_entity_ids) | matched_entity_ids
 
             if not dry_run and counter_entity_ids:
                 await self._mention_repo.update_entity_counters(
@@ -725,7 +968,7 @@ class EntityMentionScanService:
                 )
                 await session.flush()
 
-            # 6. Commit
+            # 6. Commit the counter refresh
             if not dry_run:
                 await session.commit()
 
@@ -1183,6 +1426,7 @@ class EntityMentionScanService:
         language_code: str | None,
         batch_size: int,
         after_id: int,
+        segment_ids: list[int] | None = None,
     ) -> list[Any]:
         """Fetch a batch of transcript segments with effective text.
 
@@ -1207,6 +1451,8 @@ class EntityMentionScanService:
             Exclusive lower bound on segment id; pass 0 to start. Ids are a
             monotonic sequence, so ordering by id and seeking past the last id
             of the previous batch visits every row exactly once.
+        segment_ids : list[int] | None
+            Optional segment ID filter (the changed-segments scan).
 
         Returns
         -------
@@ -1237,6 +1483,8 @@ class EntityMentionScanService:
             stmt = stmt.where(TranscriptSegmentDB.video_id.in_(video_ids))
         if language_code is not None:
             stmt = stmt.where(TranscriptSegmentDB.language_code == language_code)
+        if segment_ids is not None:
+            stmt = stmt.where(TranscriptSegmentDB.id.in_(segment_ids))
 
         stmt = stmt.where(TranscriptSegmentDB.id > after_id)
         stmt = stmt.order_by(TranscriptSegmentDB.id.asc())
@@ -17,8 +17,9 @@ Design notes:
 
 from __future__ import annotations
 
-import json
+import gzip
 import logging
+from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -51,6 +52,10 @@ _RECOGNIZED_PLACEHOLDERS: frozenset[str] = frozenset(
     {"takeout_user", "default_user", LOCAL_USER_ID}
 )
 
+# Pre-image file suffixes before and after the repair commits.
+_PROVISIONAL_SUFFIX = ".provisional.csv.gz"
+_COMMITTED_SUFFIX = ".committed.csv.gz"
+
 
 class IdentityError(Exception):
     """Base class for canonical-identity errors."""
@@ -225,29 +230,44 @@ class IdentityService:
             )
         return existing.user_id
 
-    def _write_pre_image(self, rows: list[dict[str, object]], placeholder: str) -> str:
-        """Write a JSON pre-image of the rows about to change; return its path.
-
-        Persistent location under ``settings.data_dir/backups`` (already
-        gitignored via ``data/``). Refuses (raises PreImageError) if the
-        directory is not writable — the merge must never run without a
+    async def _write_pre_image(
+        self,
+        session: AsyncSession,
+        *,
+        survivor_user_id: str,
+        placeholder_user_ids: list[str],
+    ) -> str:
+        """Stream a pre-image of the rows about to change to disk; return its path.
+
+        A gzip-compressed CSV (``UserVideoRepository.copy_merge_pre_image``),
+        written as PostgreSQL sends it, so memory stays flat however long the
+        history is. Persistent location under ``settings.data_dir/backups``
+        (already gitignored via ``data/``). Refuses (raises PreImageError) if
+        the file cannot be written — the merge must never run without a
         recoverable snapshot (FR-006).
 
-        The file is written with a ``.provisional.json`` suffix because it is
+        The file is written with a ``.provisional.csv.gz`` suffix because it is
         created *before* the invariant re-check and commit. On a successful
-        commit it is renamed to ``.committed.json`` (see ``_finalize_pre_image``);
-        if the repair aborts and rolls back, the file stays marked provisional so
-        an operator cannot mistake it for evidence that a repair completed.
+        commit it is renamed to ``.committed.csv.gz`` (see
+        ``_finalize_pre_image``); if the repair aborts and rolls back, the file
+        stays marked provisional so an operator cannot mistake it for evidence
+        that a repair completed.
         """
         stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
-        safe = placeholder.replace("/", "_")
+        safe = "+".join(placeholder_user_ids).replace("/", "_")
         backups_dir = Path(settings.data_dir) / "backups"
+        path = backups_dir / (
+            f"identity-merge-preimage-{safe}-{stamp}{_PROVISIONAL_SUFFIX}"
+        )
         try:
             backups_dir.mkdir(parents=True, exist_ok=True)
-            path = (
-                backups_dir / f"identity-merge-preimage-{safe}-{stamp}.provisional.json"
-            )
-            path.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+            with gzip.open(path, "wb") as output:
+                rows = await self.user_video_repo.copy_merge_pre_image(
+                    session,
+                    survivor_user_id=survivor_user_id,
+                    placeholder_user_ids=placeholder_user_ids,
+                    output=output,
+                )
         except OSError as exc:
             raise PreImageError(
                 f"Cannot write pre-image under {backups_dir} (verify it is a "
@@ -256,10 +276,11 @@ class IdentityService:
         # Verify the pre-image actually landed on a persistent path.
         if not path.exists():
             raise PreImageError(f"Pre-image was not written to {path}.")
+        logger.info("Pre-image of %d user_videos rows written to %s", rows, path)
         return str(path)
 
     def _finalize_pre_image(self, path: str) -> str:
-        """Rename a provisional pre-image to ``.committed.json`` after commit.
+        """Rename a provisional pre-image to ``.committed.csv.gz`` after commit.
 
         Best-effort: the merge has already committed, so a rename failure must
         never turn a successful repair into an error — it only leaves the file
@@ -268,12 +289,12 @@ class IdentityService:
         """
         provisional = Path(path)
         if (
-            not provisional.name.endswith(".provisional.json")
+            not provisional.name.endswith(_PROVISIONAL_SUFFIX)
             or not provisional.exists()
         ):
             return path
         final = provisional.with_name(
-            provisional.name.replace(".provisional.json", ".committed.json")
+            provisional.name.replace(_PROVISIONAL_SUFFIX, _COMMITTED_SUFFIX)
         )
         try:
             provisional.replace(final)
@@ -334,13 +355,16 @@ class IdentityService:
         *,
         dry_run: bool,
         authenticated_channel_id: str | None = None,
+        progress_callback: Callable[[int], None] | None = None,
     ) -> RepairReport:
         """Collapse placeholder ``user_videos`` identities into the survivor.
 
         One transaction: select+persist the survivor → snapshot invariants →
-        write a pre-image (real runs) → merge each placeholder → re-check
-        invariants and abort on any regression → commit (or roll back on
-        dry-run). Idempotent; refuses on an unrecognized identity configuration.
+        stream a pre-image (real runs) → merge each placeholder in chunks →
+        re-check invariants and abort on any regression → commit (or roll back
+        on dry-run). Idempotent; refuses on an unrecognized identity
+        configuration. ``progress_callback`` receives the number of
+        ``user_videos`` rows each merge chunk moved.
         """
         uv_distinct = await self.user_video_repo.list_distinct_user_ids(session)
         canonical, source = await self._select_survivor(
@@ -389,18 +413,20 @@ class IdentityService:
         # Pre-image (real runs only — dry-run writes nothing).
         pre_image_path: str | None = None
         if not dry_run and uv_placeholders:
-            rows = await self.user_video_repo.dump_merge_pre_image(
+            pre_image_path = await self._write_pre_image(
                 session,
                 survivor_user_id=canonical,
                 placeholder_user_ids=uv_placeholders,
             )
-            pre_image_path = self._write_pre_image(rows, "+".join(uv_placeholders))
 
         # Merge each user_videos placeholder into the survivor.
         merged = deleted = rekeyed = 0
         for placeholder in uv_placeholders:
             stats = await self.user_video_repo.merge_user_identity(
-                session, from_user_id=placeholder, to_user_id=canonical
+                session,
+                from_user_id=placeholder,
+                to_user_id=canonical,
+                progress_callback=progress_callback,
             )
             merged += stats.merged
             deleted += stats.deleted
@@ -458,6 +484,7 @@ class IdentityService:
         *,
         authenticated_channel_id: str,
         dry_run: bool = False,
+        progress_callback: Callable[[int], None] | None = None,
     ) -> RepairReport:
         """Fold a persisted *offline* identity into a newly available channel.
 
@@ -487,13 +514,15 @@ class IdentityService:
 
         pre_image_path: str | None = None
         if not dry_run:
-            rows = await self.user_video_repo.dump_merge_pre_image(
+            pre_image_path = await self._write_pre_image(
                 session, survivor_user_id=new_id, placeholder_user_ids=[old_id]
             )
-            pre_image_path = self._write_pre_image(rows, old_id)
 
         stats = await self.user_video_repo.merge_user_identity(
-            session, from_user_id=old_id, to_user_id=new_id
+            session,
+            from_user_id=old_id,
+            to_user_id=new_id,
+            progress_callback=progress_callback,
         )
 
         # Re-key language preferences onto the channel too, so no prefs are left
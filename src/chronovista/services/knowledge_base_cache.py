@@ -0,0 +1,303 @@
+"""
+Local response cache and shared HTTP client for Wikidata/DBpedia lookups.
+
+``WikidataClient`` and ``DbpediaResolver`` used to open a fresh
+``httpx.AsyncClient`` per call and go to the network every time, so the
+create-time candidate search and on-approval enrichment re-fetched the same
+QIDs over and over. This module gives them two shared resources:
+
+- :class:`KnowledgeBaseCache` -- a small SQLite file under ``cache_dir``
+  holding JSON responses keyed by a namespace and the request parameters,
+  each namespace with its own TTL. Entity data is cached **per QID** (not per
+  ``wbgetentities`` request), so a single lookup and a 50-ID bulk lookup share
+  entries. Failures are never cached: only definitive answers are stored,
+  including definitive negatives ("no DBpedia resource").
+- :func:`shared_http_client` -- one pooled ``httpx.AsyncClient`` per event
+  loop, so consecutive calls reuse TCP/TLS connections.
+
+The cache is best-effort in the same sense as the clients it serves: a
+missing, locked or corrupt database file degrades to "no cache" with a
+warning, never an error. ``KNOWLEDGE_BASE_CACHE_TTL_HOURS=0`` disables it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "chronovista/1.0 (local personal library tooling)"
+CACHE_FILENAME = "knowledge_base.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kb_cache (
+    key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    body TEXT NOT NULL
+)
+"""
+
+
+def _cache_key(namespace: str, params: Mapping[str, Any]) -> str:
+    canonical = json.dumps(params, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{namespace}\0{canonical}".encode()).hexdigest()
+
+
+class KnowledgeBaseCache:
+    """
+    TTL'd JSON response cache in a SQLite file.
+
+    Parameters
+    ----------
+    path : Path
+        SQLite database file; created (with its directory) on first use.
+    ttl_seconds : float
+        Default time-to-live for an entry.
+    namespace_ttls : Mapping[str, float] | None, optional
+        Per-namespace TTL overrides, e.g. a shorter one for search results.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> cache = KnowledgeBaseCache(Path(tempfile.mkdtemp()) / "kb.sqlite3", ttl_seconds=60)
+    >>> cache.put("wbgetentities", {"id": "Q42"}, {"labels": {}})
+    >>> cache.get("wbgetentities", {"id": "Q42"})
+    (True, {'labels': {}})
+    >>> cache.get("wbgetentities", {"id": "Q1"})
+    (False, None)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        ttl_seconds: float,
+        namespace_ttls: Mapping[str, float] | None = None,
+    ) -> None:
+        self.path = path
+        self._ttl = ttl_seconds
+        self._namespace_ttls = dict(namespace_ttls or {})
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._broken = False
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._conn is not None or self._broken:
+            return self._conn
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("Knowledge-base cache disabled (%s): %s", self.path, exc)
+            self._broken = True
+            return None
+        self._conn = conn
+        return conn
+
+    def _ttl_for(self, namespace: str) -> float:
+        return self._namespace_ttls.get(namespace, self._ttl)
+
+    def get(self, namespace: str, params: Mapping[str, Any]) -> tuple[bool, Any]:
+        """
+        Look up one fresh entry.
+
+        Returns
+        -------
+        tuple[bool, Any]
+            ``(True, value)`` on a hit -- ``value`` may itself be ``None`` for
+            a cached negative -- or ``(False, None)`` on a miss.
+        """
+        found = self.get_many(namespace, {"": params})
+        if "" in found:
+            return True, found[""]
+        return False, None
+
+    def get_many(
+        self, namespace: str, params_by_name: Mapping[str, Mapping[str, Any]]
+    ) -> dict[str, Any]:
+        """
+        Look up several entries in one query.
+
+        Parameters
+        ----------
+        namespace : str
+            Request family, e.g. ``"wbgetentities"``.
+        params_by_name : Mapping[str, Mapping[str, Any]]
+            Caller's name for each lookup (typically the QID) -> its params.
+
+        Returns
+        -------
+        dict[str, Any]
+            The fresh hits, keyed by the caller's names.
+        """
+        if not params_by_name:
+            return {}
+        keys = {_cache_key(namespace, p): name for name, p in params_by_name.items()}
+        cutoff = time.time() - self._ttl_for(namespace)
+        found: dict[str, Any] = {}
+        with self._lock:
+            conn = self._connect()
+            if conn is not None:
+                try:
+                    key_list = list(keys)
+                    for i in range(0, len(key_list), 500):
+                        chunk = key_list[i : i + 500]
+                        marks = ",".join("?" * len(chunk))
+                        rows = conn.execute(
+                            f"SELECT key, body FROM kb_cache "
+                            f"WHERE key IN ({marks}) AND fetched_at >= ?",
+                            (*chunk, cutoff),
+                        )
+                        for key, body in rows:
+                            found[keys[key]] = json.loads(body)
+                except (sqlite3.Error, ValueError) as exc:
+                    logger.warning("Knowledge-base cache read failed: %s", exc)
+                    found = {}
+        self.hits += len(found)
+        self.misses += len(params_by_name) - len(found)
+        return found
+
+    def put(self, namespace: str, params: Mapping[str, Any], value: Any) -> None:
+        """Store one entry (``value`` must be JSON-serializable)."""
+        self.put_many(namespace, [(params, value)])
+
+    def put_many(
+        self, namespace: str, entries: list[tuple[Mapping[str, Any], Any]]
+    ) -> None:
+        """Store several ``(params, value)`` entries in one transaction."""
+        if not entries:
+            return
+        now = time.time()
+        rows = [
+            (_cache_key(namespace, params), namespace, now, json.dumps(value))
+            for params, value in entries
+        ]
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO kb_cache (key, namespace, fetched_at, body) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                conn.commit()
+            except sqlite3.Error as exc:
+                logger.warning("Knowledge-base cache write failed: %s", exc)
+
+    def purge_expired(self) -> int:
+        """Delete entries past their namespace's TTL; return how many."""
+        now = time.time()
+        removed = 0
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return 0
+            namespaces = [
+                row[0]
+                for row in conn.execute("SELECT DISTINCT namespace FROM kb_cache")
+            ]
+            for namespace in namespaces:
+                cur = conn.execute(
+                    "DELETE FROM kb_cache WHERE namespace = ? AND fetched_at < ?",
+                    (namespace, now - self._ttl_for(namespace)),
+                )
+                removed += cur.rowcount
+            conn.commit()
+        return removed
+
+    def clear(self) -> int:
+        """Delete every entry; return how many."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return 0
+            cur = conn.execute("DELETE FROM kb_cache")
+            conn.commit()
+            return cur.rowcount
+
+    def close(self) -> None:
+        """Close the SQLite connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_default_cache: KnowledgeBaseCache | None = None
+
+
+def default_cache() -> KnowledgeBaseCache | None:
+    """
+    The process-wide cache at ``{cache_dir}/knowledge_base.sqlite3``.
+
+    Returns
+    -------
+    KnowledgeBaseCache | None
+        None when ``KNOWLEDGE_BASE_CACHE_TTL_HOURS`` is 0.
+    """
+    global _default_cache
+    from chronovista.config.settings import settings
+
+    if settings.knowledge_base_cache_ttl_hours == 0:
+        return None
+    if _default_cache is None:
+        _default_cache = KnowledgeBaseCache(
+            settings.cache_dir / CACHE_FILENAME,
+            ttl_seconds=settings.knowledge_base_cache_ttl_hours * 3600,
+            namespace_ttls={
+                "wbsearchentities": settings.knowledge_base_search_cache_ttl_hours
+                * 3600
+            },
+        )
+    return _default_cache
+
+
+_shared_client: httpx.AsyncClient | None = None
+_shared_loop: asyncio.AbstractEventLoop | None = None
+
+
+def shared_http_client() -> httpx.AsyncClient:
+    """
+    A pooled client for the running event loop, created on first use.
+
+    A client is bound to the loop that first used it, so a new one is made
+    when called from a different loop (each ``asyncio.run`` in the CLI).
+    Per-call timeouts are passed by the callers.
+    """
+    global _shared_client, _shared_loop
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_loop is not loop:
+        _shared_client = httpx.AsyncClient(
+            headers={"User-Agent": USER_AGENT},
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+        )
+        _shared_loop = loop
+    return _shared_client
+
+
+async def close_shared_http_client() -> None:
+    """Close the pooled client if the current loop owns it (app shutdown)."""
+    global _shared_client, _shared_loop
+    if _shared_client is not None and _shared_loop is asyncio.get_running_loop():
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_loop = None
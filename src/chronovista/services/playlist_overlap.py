@@ -0,0 +1,461 @@
+"""
+Playlist overlap and similarity engine.
+
+Comparing every pair of playlists with set intersections costs O(P²·V) even
+though most pairs share nothing.  :class:`PlaylistOverlapIndex` instead builds
+a video → playlists inverted index and only ever touches pairs that co-occur
+in at least one video's posting list, so the work is proportional to
+``Σ k²`` over the number of playlists ``k`` each video appears in.
+
+For approximate top-k similarity across a large library the index can also
+build a MinHash/LSH structure (:class:`MinHashLSH`): each playlist is reduced
+to a fixed-size MinHash signature, signatures are banded into hash buckets,
+and only playlists sharing a bucket are scored.  Signatures estimate Jaccard
+similarity of the playlists' video sets.
+
+The index is keyed by an opaque playlist key — playlist IDs when built from
+``playlist_memberships``, playlist names when built from a Takeout export.
+:class:`PlaylistSimilarityService` keeps one database-backed index per
+process and rebuilds it only when the membership table changes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import random
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Mapping
+from enum import Enum
+
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from chronovista.repositories.playlist_membership_repository import (
+    PlaylistMembershipRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# Mersenne prime used for the universal hash family h(x) = (a·x + b) mod p.
+_MERSENNE_PRIME = (1 << 61) - 1
+
+DEFAULT_NUM_PERM = 128
+DEFAULT_BANDS = 32
+
+
+class SimilarityMethod(str, Enum):
+    """How playlist similarity is computed."""
+
+    EXACT = "exact"
+    MINHASH = "minhash"
+
+
+class PlaylistSimilarity(BaseModel):
+    """Similarity of one playlist to a query playlist."""
+
+    playlist: str = Field(..., description="Key of the similar playlist")
+    shared_videos: int = Field(
+        ..., ge=0, description="Videos in both playlists (exact count)"
+    )
+    jaccard: float = Field(
+        ...,
+        ge=0.0,
+        le=1.0,
+        description="Jaccard similarity (estimated when using MinHash)",
+    )
+
+
+class PlaylistPairOverlap(BaseModel):
+    """Overlap between two playlists."""
+
+    playlist_a: str = Field(..., description="Key of the first playlist")
+    playlist_b: str = Field(..., description="Key of the second playlist")
+    shared_videos: int = Field(..., ge=0, description="Videos in both playlists")
+    jaccard: float = Field(
+        ...,
+        ge=0.0,
+        le=1.0,
+        description="Jaccard similarity (estimated when using MinHash)",
+    )
+
+
+def _video_hash(video_id: str) -> int:
+    """Stable 64-bit hash of a video ID (``hash()`` is salted per process)."""
+    digest = hashlib.blake2b(video_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class MinHashLSH:
+    """
+    MinHash signatures with banded locality-sensitive hashing.
+
+    Parameters
+    ----------
+    num_perm : int
+        Number of hash permutations per signature.
+    bands : int
+        Number of LSH bands; must divide ``num_perm``.  More bands (fewer rows
+        per band) lower the similarity threshold at which pairs become
+        candidates, roughly ``(1 / bands) ** (1 / rows)``.
+    seed : int
+        Seed for the hash family, so signatures are reproducible.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        seed: int = 1,
+    ) -> None:
+        if num_perm <= 0 or bands <= 0 or num_perm % bands:
+            raise ValueError(
+                f"bands ({bands}) must be a positive divisor of num_perm "
+                f"({num_perm})"
+            )
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        # Seeded hash-family coefficients, not secrets: reproducibility is the point.
+        rng = random.Random(seed)  # noqa: S311
+        self._params = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        self._video_hashes: dict[str, list[int]] = {}
+        self._signatures: dict[str, tuple[int, ...]] = {}
+        self._buckets: dict[tuple[int, tuple[int, ...]], list[str]] = defaultdict(list)
+
+    def _hashes(self, video_id: str) -> list[int]:
+        cached = self._video_hashes.get(video_id)
+        if cached is None:
+            x = _video_hash(video_id)
+            cached = [(a * x + b) % _MERSENNE_PRIME for a, b in self._params]
+            self._video_hashes[video_id] = cached
+        return cached
+
+    def signature(self, videos: Iterable[str]) -> tuple[int, ...]:
+        """Compute the MinHash signature of a set of video IDs.
+
+        Each video's permutation hashes are computed once and shared by every
+        playlist containing it, so the signature is an element-wise minimum.
+        """
+        vectors = [self._hashes(video_id) for video_id in videos]
+        if not vectors:
+            return ()
+        return tuple(map(min, zip(*vectors, strict=True)))
+
+    def insert(self, key: str, videos: Iterable[str]) -> None:
+        """Add a playlist to the LSH buckets (empty playlists are skipped)."""
+        signature = self.signature(videos)
+        if not signature:
+            return
+        self._signatures[key] = signature
+        for band in range(self.bands):
+            start = band * self.rows
+            self._buckets[(band, signature[start : start + self.rows])].append(key)
+
+    def candidates(self, key: str) -> set[str]:
+        """Playlists sharing at least one LSH bucket with *key*."""
+        signature = self._signatures.get(key)
+        if signature is None:
+            return set()
+        found: set[str] = set()
+        for band in range(self.bands):
+            start = band * self.rows
+            found.update(self._buckets[(band, signature[start : start + self.rows])])
+        found.discard(key)
+        return found
+
+    def candidate_pairs(self) -> set[tuple[str, str]]:
+        """All unordered playlist pairs sharing at least one bucket."""
+        pairs: set[tuple[str, str]] = set()
+        for keys in self._buckets.values():
+            if len(keys) < 2:
+                continue
+            ordered = sorted(keys)
+            for i, first in enumerate(ordered):
+                for second in ordered[i + 1 :]:
+                    pairs.add((first, second))
+        return pairs
+
+    def estimate_jaccard(self, first: str, second: str) -> float:
+        """Fraction of signature positions on which two playlists agree."""
+        sig_a = self._signatures.get(first)
+        sig_b = self._signatures.get(second)
+        if not sig_a or not sig_b:
+            return 0.0
+        agree = sum(1 for a, b in zip(sig_a, sig_b, strict=True) if a == b)
+        return agree / self.num_perm
+
+
+class PlaylistOverlapIndex:
+    """
+    Video → playlists inverted index over a playlist library.
+
+    Parameters
+    ----------
+    memberships : Mapping[str, Iterable[str]]
+        Video IDs of each playlist, keyed by playlist key.  Duplicate and
+        empty video IDs are ignored.
+    """
+
+    def __init__(self, memberships: Mapping[str, Iterable[str]]) -> None:
+        self.playlists: dict[str, frozenset[str]] = {
+            key: frozenset(video_id for video_id in videos if video_id)
+            for key, videos in memberships.items()
+        }
+        postings: dict[str, list[str]] = defaultdict(list)
+        for key, videos in self.playlists.items():
+            for video_id in videos:
+                postings[video_id].append(key)
+        self.postings: dict[str, list[str]] = dict(postings)
+        self._lsh: MinHashLSH | None = None
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[tuple[str, str]]) -> PlaylistOverlapIndex:
+        """Build an index from ``(playlist_key, video_id)`` rows."""
+        memberships: dict[str, set[str]] = defaultdict(set)
+        for playlist_key, video_id in pairs:
+            memberships[playlist_key].add(video_id)
+        return cls(memberships)
+
+    def _jaccard(self, first: str, second: str, shared: int) -> float:
+        union = len(self.playlists[first]) + len(self.playlists[second]) - shared
+        return shared / union if union else 0.0
+
+    def overlap_counts(self) -> dict[str, dict[str, int]]:
+        """Shared-video counts for every pair of playlists that overlap.
+
+        Returns
+        -------
+        dict[str, dict[str, int]]
+            Symmetric matrix with an entry for every playlist (possibly empty)
+            and only non-zero overlaps, the shape returned by
+            ``TakeoutService.analyze_playlist_overlap``.
+        """
+        matrix: dict[str, dict[str, int]] = {key: {} for key in self.playlists}
+        for keys in self.postings.values():
+            if len(keys) < 2:
+                continue
+            for i, first in enumerate(keys):
+                row = matrix[first]
+                for second in keys[i + 1 :]:
+                    row[second] = row.get(second, 0) + 1
+                    matrix[second][first] = matrix[second].get(first, 0) + 1
+        return matrix
+
+    def similar_to(
+        self,
+        key: str,
+        limit: int = 10,
+        method: SimilarityMethod = SimilarityMethod.EXACT,
+    ) -> list[PlaylistSimilarity]:
+        """Top playlists most similar to *key* by Jaccard over video sets.
+
+        Parameters
+        ----------
+        key : str
+            Query playlist key; unknown keys return an empty list.
+        limit : int
+            Maximum number of results.
+        method : SimilarityMethod
+            ``EXACT`` scores every playlist sharing a video via the inverted
+            index; ``MINHASH`` scores only LSH candidates using estimated
+            Jaccard, which may miss weakly similar playlists.
+
+        Returns
+        -------
+        list[PlaylistSimilarity]
+            Results ordered by Jaccard, then shared videos, descending.
+        """
+        videos = self.playlists.get(key)
+        if not videos:
+            return []
+
+        if method is SimilarityMethod.MINHASH:
+            # Only the LSH candidates are intersected; walking every posting
+            # of the playlist would cost as much as the exact path.
+            lsh = self.lsh()
+            results = [
+                PlaylistSimilarity(
+                    playlist=other,
+                    shared_videos=len(videos & self.playlists[other]),
+                    jaccard=lsh.estimate_jaccard(key, other),
+                )
+                for other in lsh.candidates(key)
+            ]
+        else:
+            shared: Counter[str] = Counter()
+            for video_id in videos:
+                shared.update(self.postings[video_id])
+            del shared[key]
+            results = [
+                PlaylistSimilarity(
+                    playlist=other,
+                    shared_videos=count,
+                    jaccard=self._jaccard(key, other, count),
+                )
+                for other, count in shared.items()
+            ]
+
+        results.sort(key=lambda r: (-r.jaccard, -r.shared_videos, r.playlist))
+        return results[:limit]
+
+    def top_pairs(
+        self,
+        limit: int = 20,
+        method: SimilarityMethod = SimilarityMethod.EXACT,
+        min_shared: int = 1,
+    ) -> list[PlaylistPairOverlap]:
+        """Most similar playlist pairs across the whole library.
+
+        Parameters
+        ----------
+        limit : int
+            Maximum number of pairs.
+        method : SimilarityMethod
+            ``EXACT`` enumerates pairs from the inverted index; ``MINHASH``
+            enumerates LSH candidate pairs and ranks them by estimated
+            Jaccard.
+        min_shared : int
+            Drop pairs sharing fewer videos than this.
+
+        Returns
+        -------
+        list[PlaylistPairOverlap]
+            Pairs ordered by Jaccard, then shared videos, descending.
+        """
+        if method is SimilarityMethod.MINHASH:
+            lsh = self.lsh()
+            pairs = []
+            for first, second in lsh.candidate_pairs():
+                count = len(self.playlists[first] & self.playlists[second])
+                if count < min_shared:
+                    continue
+                pairs.append(
+                    PlaylistPairOverlap(
+                        playlist_a=first,
+                        playlist_b=second,
+                        shared_videos=count,
+                        jaccard=lsh.estimate_jaccard(first, second),
+                    )
+                )
+        else:
+            counts: Counter[tuple[str, str]] = Counter()
+            for keys in self.postings.values():
+                if len(keys) < 2:
+                    continue
+                ordered = sorted(keys)
+                for i, first in enumerate(ordered):
+                    for second in ordered[i + 1 :]:
+                        counts[(first, second)] += 1
+            pairs = [
+                PlaylistPairOverlap(
+                    playlist_a=first,
+                    playlist_b=second,
+                    shared_videos=count,
+                    jaccard=self._jaccard(first, second, count),
+                )
+                for (first, second), count in counts.items()
+                if count >= min_shared
+            ]
+
+        pairs.sort(
+            key=lambda p: (-p.jaccard, -p.shared_videos, p.playlist_a, p.playlist_b)
+        )
+        return pairs[:limit]
+
+    def lsh(
+        self, num_perm: int = DEFAULT_NUM_PERM, bands: int = DEFAULT_BANDS
+    ) -> MinHashLSH:
+        """The MinHash/LSH structure for this index, built on first use."""
+        if (
+            self._lsh is None
+            or self._lsh.num_perm != num_perm
+            or self._lsh.bands != bands
+        ):
+            lsh = MinHashLSH(num_perm=num_perm, bands=bands)
+            for key, videos in self.playlists.items():
+                lsh.insert(key, videos)
+            self._lsh = lsh
+            logger.debug(
+                "Built MinHash/LSH over %d playlists (%d perms, %d bands)",
+                len(self.playlists),
+                num_perm,
+                bands,
+            )
+        return self._lsh
+
+
+class PlaylistSimilarityService:
+    """
+    Playlist overlap queries over ``playlist_memberships``.
+
+    The overlap index (and its MinHash/LSH structure, once requested) is
+    cached in-process and reused until
+    ``PlaylistMembershipRepository.get_membership_version`` changes, so
+    repeated API requests cost one cheap aggregate query instead of a full
+    membership scan. Hidden playlists are excluded.
+
+    Parameters
+    ----------
+    membership_repository : PlaylistMembershipRepository | None
+        Repository used to read memberships; a default instance if omitted.
+    """
+
+    def __init__(
+        self, membership_repository: PlaylistMembershipRepository | None = None
+    ) -> None:
+        self.membership_repository = (
+            membership_repository or PlaylistMembershipRepository()
+        )
+        self._index: PlaylistOverlapIndex | None = None
+        self._version: tuple[int, str | None, int] | None = None
+        self._lock = asyncio.Lock()
+
+    async def get_index(self, session: AsyncSession) -> PlaylistOverlapIndex:
+        """Return the overlap index, rebuilding it if memberships changed."""
+        async with self._lock:
+            version = await self.membership_repository.get_membership_version(session)
+            if self._index is None or version != self._version:
+                pairs = await self.membership_repository.get_membership_pairs(session)
+                self._index = PlaylistOverlapIndex.from_pairs(pairs)
+                self._version = version
+                logger.info(
+                    "Built playlist overlap index: %d playlists, %d videos",
+                    len(self._index.playlists),
+                    len(self._index.postings),
+                )
+            return self._index
+
+    def invalidate(self) -> None:
+        """Drop the cached index so the next query rebuilds it."""
+        self._index = None
+        self._version = None
+
+    async def similar_playlists(
+        self,
+        session: AsyncSession,
+        playlist_id: str,
+        limit: int = 10,
+        method: SimilarityMethod = SimilarityMethod.EXACT,
+    ) -> list[PlaylistSimilarity]:
+        """Playlists most similar to *playlist_id* (see ``similar_to``)."""
+        index = await self.get_index(session)
+        return index.similar_to(playlist_id, limit=limit, method=method)
+
+    async def top_pairs(
+        self,
+        session: AsyncSession,
+        limit: int = 20,
+        method: SimilarityMethod = SimilarityMethod.EXACT,
+        min_shared: int = 1,
+    ) -> list[PlaylistPairOverlap]:
+        """Most similar playlist pairs library-wide (see ``top_pairs``)."""
+        index = await self.get_index(session)
+        return index.top_pairs(limit=limit, method=method, min_shared=min_shared)
+
+
+playlist_similarity_service = PlaylistSimilarityService()
@@ -13,7 +13,7 @@ import re
 from collections.abc import Sequence
 from enum import Enum
 
-from chronovista.models.transcript_segment import TranscriptSegment
+from chronovista.models.transcript_segment import DisplaySegment
 
 
 class OutputFormat(str, Enum):
@@ -178,7 +178,7 @@ def format_timestamp_srt(seconds: float) -> str:
 
 
 def format_segment_human(
-    segment: TranscriptSegment,
+    segment: DisplaySegment,
     max_text_length: int = 80,
 ) -> str:
     """Format a single segment for human-readable display.
@@ -189,7 +189,7 @@ def format_segment_human(
 
     Parameters
     ----------
-    segment : TranscriptSegment
+    segment : DisplaySegment
         The segment to format.
     max_text_length : int
         Maximum text length before truncation (default 80).
@@ -223,14 +223,14 @@ def format_segment_human(
     return f"#{segment.id} [{start}-{end}] {text}"
 
 
-def format_segment_json(segment: TranscriptSegment) -> str:
+def format_segment_json(segment: DisplaySegment) -> str:
     """Format a single segment as JSON.
 
     Newlines are preserved as \\n escape sequences per FR-EDGE-16.
 
     Parameters
     ----------
-    segment : TranscriptSegment
+    segment : DisplaySegment
         The segment to format.
 
     Returns
@@ -249,7 +249,7 @@ def format_segment_json(segment: TranscriptSegment) -> str:
     return response.model_dump_json(indent=2)
 
 
-def format_segment_srt(segment: TranscriptSegment, sequence: int) -> str:
+def format_segment_srt(segment: DisplaySegment, sequence: int) -> str:
     """Format a single segment as SRT subtitle.
 
     Newlines are preserved literally for multi-line subtitles per FR-EDGE-17.
@@ -261,7 +261,7 @@ def format_segment_srt(segment: TranscriptSegment, sequence: int) -> str:
 
     Parameters
     ----------
-    segment : TranscriptSegment
+    segment : DisplaySegment
         The segment to format.
     sequence : int
         SRT sequence number (1-indexed).
@@ -284,14 +284,14 @@ def format_segment_srt(segment: TranscriptSegment, sequence: int) -> str:
 
 
 def format_segments_human(
-    segments: Sequence[TranscriptSegment],
+    segments: Sequence[DisplaySegment],
     title: str | None = None,
 ) -> str:
     """Format multiple segments for human-readable display.
 
     Parameters
     ----------
-    segments : Sequence[TranscriptSegment]
+    segments : Sequence[DisplaySegment]
         Segments to format.
     title : Optional[str]
         Optional title/header for the output.
@@ -325,7 +325,7 @@ def format_segments_human(
 
 
 def format_segments_json(
-    segments: Sequence[TranscriptSegment],
+    segments: Sequence[DisplaySegment],
     video_id: str | None = None,
     language_code: str | None = None,
 ) -> str:
@@ -333,7 +333,7 @@ def format_segments_json(
 
     Parameters
     ----------
-    segments : Sequence[TranscriptSegment]
+    segments : Sequence[DisplaySegment]
         Segments to format.
     video_id : Optional[str]
         Video ID for metadata.
@@ -367,12 +367,12 @@ def format_segments_json(
     return json.dumps(output, indent=2)
 
 
-def format_segments_srt(segments: Sequence[TranscriptSegment]) -> str:
+def format_segments_srt(segments: Sequence[DisplaySegment]) -> str:
     """Format multiple segments as SRT subtitles.
 
     Parameters
     ----------
-    segments : Sequence[TranscriptSegment]
+    segments : Sequence[DisplaySegment]
         Segments to format.
 
     Returns
@@ -0,0 +1,652 @@
+"""
+In-process cache of per-transcript segment timelines.
+
+Watching a video in the web UI issues a stream of small, overlapping segment
+range requests against ``transcript_segments``, yet a transcript's segments
+only change when it is re-downloaded or corrected.  This module keeps a
+byte-bounded LRU of compact per-``(video_id, language_code)`` timelines so
+those range and time-point lookups are answered without a database
+round-trip.  :meth:`SegmentTimelineCache.get_segment_at_time`,
+:meth:`~SegmentTimelineCache.get_segments_in_range` and
+:meth:`~SegmentTimelineCache.get_context_window` are cached counterparts of
+the ``TranscriptSegmentRepository`` methods of the same names.
+
+A timeline stores one transcript as parallel ``array`` columns (segment ids,
+start/end/duration, correction metadata) plus the effective text of every
+segment concatenated into a single string addressed by offsets.  Lookups are
+binary searches over ``start_time`` with a prefix maximum of ``end_time`` to
+bound overlapping auto-caption segments.
+
+Invalidation
+------------
+``TranscriptCorrectionService`` (every single and batch correction or
+revert) and the transcript download endpoints call
+:meth:`SegmentTimelineCache.invalidate_on_commit`.  The entry is dropped
+immediately *and* again after the owning session commits, so a concurrent
+request cannot re-populate it from the pre-commit state.  Writes made by
+another process (for example a CLI batch correction or ``sync transcripts``
+while the API is running) are picked up once the entry's TTL expires.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sys
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from pydantic import BaseModel, Field
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from chronovista.config.settings import settings
+from chronovista.db.models import TranscriptCorrection as TranscriptCorrectionDB
+from chronovista.db.models import TranscriptSegment as TranscriptSegmentDB
+from chronovista.models.transcript_source import canonical_language_code
+
+logger = logging.getLogger(__name__)
+
+TimelineKey = tuple[str, str]
+
+# ``Session.info`` key holding timeline keys to drop again after commit.
+_PENDING_INFO_KEY = "segment_timeline_invalidations"
+
+# ``corrected_at`` is packed as integer microseconds since the epoch; this
+# marks segments that were never corrected.
+_NO_CORRECTION = -1
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+# Rough per-entry bookkeeping (OrderedDict slot, key tuple, timeline object).
+_ENTRY_OVERHEAD_BYTES = 512
+
+
+@dataclass(frozen=True, slots=True)
+class TimelineSegment:
+    """One segment materialized from a :class:`SegmentTimeline`.
+
+    ``text`` is the effective text: the correction when one is active,
+    otherwise the original ASR/caption text.
+    """
+
+    id: int
+    text: str
+    start_time: float
+    end_time: float
+    duration: float
+    has_correction: bool
+    corrected_at: datetime | None
+    correction_count: int
+
+    @property
+    def display_text(self) -> str:
+        """The effective text, named as on ``TranscriptSegment``."""
+        return self.text
+
+
+class SegmentTimeline:
+    """Compact, immutable timeline of one transcript's segments.
+
+    Segments are held in ``start_time`` order as parallel arrays.  Build
+    instances with :meth:`from_rows`.
+
+    ``version`` is a digest of the packed contents.  It depends only on the
+    stored segments and corrections, so every worker and every reload of an
+    unchanged transcript agree on it; ``loaded_at`` is a process-local
+    ``time.monotonic()`` stamp used for the TTL.
+    """
+
+    __slots__ = (
+        "_ids",
+        "_starts",
+        "_ends",
+        "_durations",
+        "_corrected",
+        "_correction_counts",
+        "_corrected_at",
+        "_text",
+        "_text_offsets",
+        "_max_end_index",
+        "_max_ends",
+        "loaded_at",
+        "version",
+    )
+
+    def __init__(
+        self,
+        ids: array[int],
+        starts: array[float],
+        ends: array[float],
+        durations: array[float],
+        corrected: bytes,
+        correction_counts: array[int],
+        corrected_at: array[int],
+        text: str,
+        text_offsets: array[int],
+        loaded_at: float,
+    ) -> None:
+        self._ids = ids
+        self._starts = starts
+        self._ends = ends
+        self._durations = durations
+        self._corrected = corrected
+        self._correction_counts = correction_counts
+        self._corrected_at = corrected_at
+        self._text = text
+        self._text_offsets = text_offsets
+        self.loaded_at = loaded_at
+
+        digest = hashlib.blake2b(digest_size=16)
+        for column in (ids, starts, ends, durations, correction_counts, corrected_at):
+            digest.update(column.tobytes())
+        digest.update(corrected)
+        digest.update(text.encode())
+        self.version = digest.hexdigest()
+
+        # Prefix maximum of end_time (and where it occurs).  end_time is not
+        # monotonic when auto-caption segments overlap, so this is what lets
+        # gap and overlap lookups stay logarithmic.
+        max_end_index: array[int] = array("q")
+        max_ends: array[float] = array("d")
+        best = -1
+        for i, end in enumerate(ends):
+            if best < 0 or end >= ends[best]:
+                best = i
+            max_end_index.append(best)
+            max_ends.append(ends[best])
+        self._max_end_index = max_end_index
+        self._max_ends = max_ends
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Sequence[Any]],
+        correction_meta: dict[int, tuple[datetime | None, int]],
+    ) -> SegmentTimeline:
+        """Build a timeline from segment rows ordered by ``start_time``.
+
+        Parameters
+        ----------
+        rows : Iterable[Sequence[Any]]
+            ``(id, start_time, end_time, duration, has_correction, text,
+            corrected_text)`` tuples in ``start_time`` order.
+        correction_meta : dict[int, tuple[datetime | None, int]]
+            ``segment_id -> (latest corrected_at, correction count)``.
+
+        Returns
+        -------
+        SegmentTimeline
+            The packed timeline.
+        """
+        ids: array[int] = array("q")
+        starts: array[float] = array("d")
+        ends: array[float] = array("d")
+        durations: array[float] = array("d")
+        corrected = bytearray()
+        correction_counts: array[int] = array("l")
+        corrected_at: array[int] = array("q")
+        text_offsets: array[int] = array("q", [0])
+        texts: list[str] = []
+        offset = 0
+
+        for seg_id, start, end, duration, has_correction, text, corrected_text in rows:
+            effective = corrected_text if has_correction and corrected_text else text
+            ids.append(seg_id)
+            starts.append(start)
+            ends.append(end)
+            durations.append(duration)
+            corrected.append(1 if has_correction else 0)
+            latest, count = correction_meta.get(seg_id, (None, 0))
+            correction_counts.append(count)
+            corrected_at.append(
+                (latest - _EPOCH) // timedelta(microseconds=1)
+                if latest
+                else _NO_CORRECTION
+            )
+            texts.append(effective)
+            offset += len(effective)
+            text_offsets.append(offset)
+
+        return cls(
+            ids=ids,
+            starts=starts,
+            ends=ends,
+            durations=durations,
+            corrected=bytes(corrected),
+            correction_counts=correction_counts,
+            corrected_at=corrected_at,
+            text="".join(texts),
+            text_offsets=text_offsets,
+            loaded_at=time.monotonic(),
+        )
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by this timeline, in bytes."""
+        arrays: tuple[array[Any], ...] = (
+            self._ids,
+            self._starts,
+            self._ends,
+            self._durations,
+            self._correction_counts,
+            self._corrected_at,
+            self._text_offsets,
+            self._max_end_index,
+            self._max_ends,
+        )
+        return (
+            sum(a.itemsize * len(a) for a in arrays)
+            + len(self._corrected)
+            + sys.getsizeof(self._text)
+            + _ENTRY_OVERHEAD_BYTES
+        )
+
+    def segment(self, index: int) -> TimelineSegment:
+        """Materialize the segment at position *index*."""
+        corrected_at = self._corrected_at[index]
+        return TimelineSegment(
+            id=self._ids[index],
+            text=self._text[self._text_offsets[index] : self._text_offsets[index + 1]],
+            start_time=self._starts[index],
+            end_time=self._ends[index],
+            duration=self._durations[index],
+            has_correction=bool(self._corrected[index]),
+            corrected_at=(
+                None
+                if corrected_at == _NO_CORRECTION
+                else _EPOCH + timedelta(microseconds=corrected_at)
+            ),
+            correction_count=self._correction_counts[index],
+        )
+
+    def index_at(self, timestamp: float) -> int | None:
+        """Position of the segment at *timestamp*.
+
+        Same semantics as ``TranscriptSegmentRepository.get_segment_at_time``:
+        the latest-starting segment whose half-open ``[start, end)`` contains
+        the timestamp, otherwise the segment that ended most recently before
+        it (gap), otherwise ``None``.
+        """
+        last = bisect_right(self._starts, timestamp) - 1
+        if last < 0:
+            return None
+        if self._max_ends[last] <= timestamp:
+            return self._max_end_index[last]
+        # Some segment at or before ``last`` contains the timestamp; the
+        # nearest one going backwards is the latest-starting one.
+        for i in range(last, -1, -1):
+            if self._ends[i] > timestamp:
+                return i
+        return None  # pragma: no cover - unreachable given _max_ends
+
+    def overlapping(self, start: float, end: float) -> list[int]:
+        """Positions of segments overlapping ``(start, end)``.
+
+        Same predicate as ``get_segments_in_range``:
+        ``start_time < end AND end_time > start``, in ``start_time`` order.
+        """
+        first = bisect_right(self._max_ends, start)
+        stop = bisect_left(self._starts, end)
+        ends = self._ends
+        return [i for i in range(first, stop) if ends[i] > start]
+
+    def contained(self, start_time: float | None, end_time: float | None) -> list[int]:
+        """Positions of segments with ``start_time >= start`` and ``end_time <= end``.
+
+        Mirrors the filters of ``GET /videos/{id}/transcript/segments``; either
+        bound may be ``None``.  Results are in ``start_time`` order.
+        """
+        first = 0 if start_time is None else bisect_left(self._starts, start_time)
+        if end_time is None:
+            return list(range(first, len(self._ids)))
+        # A segment starting after end_time cannot end at or before it.
+        stop = bisect_right(self._starts, end_time)
+        ends = self._ends
+        return [i for i in range(first, stop) if ends[i] <= end_time]
+
+
+class TimelineCacheStats(BaseModel):
+    """Point-in-time statistics for a :class:`SegmentTimelineCache`."""
+
+    entries: int = Field(default=0, description="Cached transcripts")
+    bytes_used: int = Field(default=0, description="Approximate bytes held")
+    max_bytes: int = Field(default=0, description="Configured byte budget")
+    hits: int = Field(default=0, description="Lookups served from the cache")
+    misses: int = Field(default=0, description="Lookups that loaded from Postgres")
+    evictions: int = Field(default=0, description="Entries evicted for space")
+    invalidations: int = Field(default=0, description="Entries dropped by writes")
+
+
+class SegmentTimelineCache:
+    """Byte-bounded LRU of :class:`SegmentTimeline` keyed by transcript.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Memory budget across all entries.  ``0`` disables caching: every
+        lookup loads from the database.
+    ttl_seconds : float
+        Maximum age of an entry, bounding staleness from writes made by
+        other processes.
+    """
+
+    def __init__(self, max_bytes: int, ttl_seconds: float) -> None:
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[TimelineKey, SegmentTimeline] = OrderedDict()
+        self._bytes_used = 0
+        # Loads in flight per key, and a generation bumped when such a key is
+        # invalidated; a load that started under an older generation is not
+        # stored.  Both only hold keys that are being loaded.
+        self._loading: dict[TimelineKey, int] = {}
+        self._generations: dict[TimelineKey, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def key(video_id: str, language_code: str) -> TimelineKey:
+        """Cache key for a transcript."""
+        return (str(video_id), canonical_language_code(language_code))
+
+    def stats(self) -> TimelineCacheStats:
+        """Return current statistics."""
+        return TimelineCacheStats(
+            entries=len(self._entries),
+            bytes_used=self._bytes_used,
+            max_bytes=self._max_bytes,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+        )
+
+    async def get_timeline(
+        self, session: AsyncSession, video_id: str, language_code: str
+    ) -> SegmentTimeline:
+        """Return the timeline for a transcript, loading it on a miss.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Session used only when the entry must be (re)loaded.
+        video_id : str
+            YouTube video ID.
+        language_code : str
+            BCP-47 language code in any casing.
+
+        Returns
+        -------
+        SegmentTimeline
+            The transcript's timeline (empty if it has no segments).
+        """
+        key = self.key(video_id, language_code)
+        cached = self._entries.get(key)
+        if cached is not None:
+            if time.monotonic() - cached.loaded_at < self._ttl_seconds:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cached
+            self._discard(key)
+
+        self._misses += 1
+        generation = self._generations.get(key, 0)
+        self._loading[key] = self._loading.get(key, 0) + 1
+        try:
+            timeline = await load_timeline(session, key[0], key[1])
+            if self._generations.get(key, 0) == generation:
+                self._store(key, timeline)
+        finally:
+            self._finish_load(key)
+        return timeline
+
+    async def get_segment_at_time(
+        self,
+        session: AsyncSession,
+        video_id: str,
+        language_code: str,
+        timestamp: float,
+    ) -> TimelineSegment | None:
+        """Cached ``TranscriptSegmentRepository.get_segment_at_time``.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Session used only when the timeline must be (re)loaded.
+        video_id : str
+            YouTube video ID.
+        language_code : str
+            BCP-47 language code in any casing.
+        timestamp : float
+            Time in seconds.
+
+        Returns
+        -------
+        TimelineSegment | None
+            The segment at that time, or None if before the first segment.
+        """
+        timeline = await self.get_timeline(session, video_id, language_code)
+        index = timeline.index_at(timestamp)
+        return None if index is None else timeline.segment(index)
+
+    async def get_segments_in_range(
+        self,
+        session: AsyncSession,
+        video_id: str,
+        language_code: str,
+        start: float,
+        end: float,
+    ) -> list[TimelineSegment]:
+        """Cached ``TranscriptSegmentRepository.get_segments_in_range``.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Session used only when the timeline must be (re)loaded.
+        video_id : str
+            YouTube video ID.
+        language_code : str
+            BCP-47 language code in any casing.
+        start : float
+            Range start time in seconds.
+        end : float
+            Range end time in seconds.
+
+        Returns
+        -------
+        list[TimelineSegment]
+            Segments overlapping the range, ordered by start_time.
+        """
+        timeline = await self.get_timeline(session, video_id, language_code)
+        return [timeline.segment(i) for i in timeline.overlapping(start, end)]
+
+    async def get_context_window(
+        self,
+        session: AsyncSession,
+        video_id: str,
+        language_code: str,
+        timestamp: float,
+        window_seconds: float,
+    ) -> list[TimelineSegment]:
+        """Cached ``TranscriptSegmentRepository.get_context_window``.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Session used only when the timeline must be (re)loaded.
+        video_id : str
+            YouTube video ID.
+        language_code : str
+            BCP-47 language code in any casing.
+        timestamp : float
+            Center timestamp in seconds.
+        window_seconds : float
+            Window size in seconds (applied both before and after).
+
+        Returns
+        -------
+        list[TimelineSegment]
+            Segments overlapping the window (start clamped to 0.0), ordered
+            by start_time.
+        """
+        return await self.get_segments_in_range(
+            session,
+            video_id,
+            language_code,
+            max(0.0, timestamp - window_seconds),
+            timestamp + window_seconds,
+        )
+
+    def invalidate(self, video_id: str, language_code: str) -> None:
+        """Drop a transcript's timeline now."""
+        key = self.key(video_id, language_code)
+        if key in self._loading:
+            self._generations[key] = self._generations.get(key, 0) + 1
+        if self._discard(key):
+            self._invalidations += 1
+
+    def invalidate_on_commit(
+        self, session: AsyncSession, video_id: str, language_code: str
+    ) -> None:
+        """Drop a transcript's timeline now and again after *session* commits.
+
+        Call this from any code path that changes segment text, timing or
+        correction state within a caller-owned transaction.
+        """
+        self.invalidate(video_id, language_code)
+        info = session.info
+        if isinstance(info, dict):
+            # Objects standing in for a session (test doubles) have no info
+            # dict; they get the immediate invalidation only.
+            info.setdefault(_PENDING_INFO_KEY, set()).add(
+                self.key(video_id, language_code)
+            )
+
+    def clear(self) -> None:
+        """Drop every entry (statistics are kept)."""
+        for key in self._loading:
+            self._generations[key] = self._generations.get(key, 0) + 1
+        self._entries.clear()
+        self._bytes_used = 0
+
+    def _store(self, key: TimelineKey, timeline: SegmentTimeline) -> None:
+        """Insert *timeline* and evict least-recently-used entries to fit."""
+        size = timeline.nbytes
+        if len(timeline) == 0 or size > self._max_bytes:
+            # Empty timelines are not worth an entry (a later download must be
+            # visible at once); oversized ones would evict everything else.
+            return
+        self._discard(key)
+        self._entries[key] = timeline
+        self._bytes_used += size
+        while self._bytes_used > self._max_bytes:
+            oldest, evicted = self._entries.popitem(last=False)
+            self._bytes_used -= evicted.nbytes
+            self._evictions += 1
+            logger.debug("Evicted segment timeline %s", oldest)
+
+    def _finish_load(self, key: TimelineKey) -> None:
+        """Forget *key*'s generation once its last in-flight load ends."""
+        remaining = self._loading.pop(key) - 1
+        if remaining:
+            self._loading[key] = remaining
+        else:
+            self._generations.pop(key, None)
+
+    def _discard(self, key: TimelineKey) -> bool:
+        """Remove *key* if present; return whether it was cached."""
+        timeline = self._entries.pop(key, None)
+        if timeline is None:
+            return False
+        self._bytes_used -= timeline.nbytes
+        return True
+
+
+async def load_timeline(
+    session: AsyncSession, video_id: str, language_code: str
+) -> SegmentTimeline:
+    """Load one transcript's timeline from Postgres (two queries).
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Database session.
+    video_id : str
+        YouTube video ID.
+    language_code : str
+        Canonical BCP-47 language code.
+
+    Returns
+    -------
+    SegmentTimeline
+        The packed timeline.
+    """
+    segment_rows = await session.execute(
+        select(
+            TranscriptSegmentDB.id,
+            TranscriptSegmentDB.start_time,
+            TranscriptSegmentDB.end_time,
+            TranscriptSegmentDB.duration,
+            TranscriptSegmentDB.has_correction,
+            TranscriptSegmentDB.text,
+            TranscriptSegmentDB.corrected_text,
+        )
+        .where(
+            TranscriptSegmentDB.video_id == video_id,
+            TranscriptSegmentDB.language_code == language_code,
+        )
+        .order_by(TranscriptSegmentDB.start_time, TranscriptSegmentDB.id)
+    )
+    rows = segment_rows.all()
+
+    correction_meta: dict[int, tuple[datetime | None, int]] = {}
+    if rows:
+        meta_rows = await session.execute(
+            select(
+                TranscriptCorrectionDB.segment_id,
+                func.max(TranscriptCorrectionDB.corrected_at),
+                func.count(),
+            )
+            .where(
+                TranscriptCorrectionDB.video_id == video_id,
+                TranscriptCorrectionDB.language_code == language_code,
+            )
+            .group_by(TranscriptCorrectionDB.segment_id)
+        )
+        for segment_id, latest, count in meta_rows.all():
+            correction_meta[segment_id] = (latest, count)
+
+    return SegmentTimeline.from_rows(rows, correction_meta)
+
+
+segment_timeline_cache = SegmentTimelineCache(
+    max_bytes=settings.segment_timeline_cache_max_bytes,
+    ttl_seconds=settings.segment_timeline_cache_ttl_seconds,
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    """Re-drop timelines written in the committed transaction."""
+    pending: set[TimelineKey] | None = session.info.pop(_PENDING_INFO_KEY, None)
+    if pending:
+        for video_id, language_code in pending:
+            segment_timeline_cache.invalidate(video_id, language_code)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_on_rollback(session: Session) -> None:
+    """Forget pending invalidations; nothing was written."""
+    session.info.pop(_PENDING_INFO_KEY, None)
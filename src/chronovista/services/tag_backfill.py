@@ -33,11 +33,19 @@ from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid_utils import uuid7
 
+from chronovista.db.entity_associations import queue_association_refresh
 from chronovista.db.models import CanonicalTag as CanonicalTagDB
 from chronovista.db.models import TagAlias as TagAliasDB
 from chronovista.db.models import VideoTag as VideoTagDB
 from chronovista.repositories.video_tag_repository import VideoTagRepository
-from chronovista.services.tag_normalization import TagNormalizationService
+from chronovista.services.tag_normalization import (
+    NORMALIZATION_VERSION,
+    TagNormalizationService,
+)
+from chronovista.services.tag_normalization_engine import (
+    NormalizationStats,
+    TagNormalizationEngine,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -65,10 +73,26 @@ class TagBackfillService:
     normalization_service : TagNormalizationService
         The service that provides the 9-step normalization pipeline and
         canonical form selection logic.
+    normalization_engine : TagNormalizationEngine | None, optional
+        Memoized batch front-end used to normalize distinct tags.  When
+        ``None``, an in-memory engine wrapping *normalization_service* is
+        created (no persistence).
     """
 
-    def __init__(self, normalization_service: TagNormalizationService) -> None:
+    def __init__(
+        self,
+        normalization_service: TagNormalizationService,
+        normalization_engine: TagNormalizationEngine | None = None,
+    ) -> None:
         self._normalization_service = normalization_service
+        self._normalization_engine = normalization_engine or TagNormalizationEngine(
+            normalization_service
+        )
+
+    @property
+    def last_normalization_stats(self) -> NormalizationStats:
+        """Throughput statistics from the most recent normalization pass."""
+        return self._normalization_engine.last_stats
 
     async def _check_tables_exist(self, session: AsyncSession) -> None:
         """Check that ``canonical_tags`` and ``tag_aliases`` tables exist.
@@ -125,6 +149,9 @@ class TagBackfillService:
         and ``run_analysis`` (Phase 3).  It performs normalization and grouping
         but does **not** generate UUIDs or batch records.
 
+        Normalization goes through the engine, so tags seen on an earlier
+        pass are served from its memo and only new ones hit the pipeline.
+
         Parameters
         ----------
         distinct_tags : dict[str, int]
@@ -141,8 +168,9 @@ class TagBackfillService:
         groups: dict[str, list[tuple[str, int]]] = defaultdict(list)
         skip_list: list[tuple[str, int]] = []
 
+        normalized_forms = self._normalization_engine.normalize_many(distinct_tags)
         for raw_tag, count in distinct_tags.items():
-            normalized = self._normalization_service.normalize(raw_tag)
+            normalized = normalized_forms[raw_tag]
             if normalized is None:
                 skip_list.append((raw_tag, count))
                 logger.debug("Skipping tag (normalizes to empty): %r", raw_tag)
@@ -233,7 +261,7 @@ class TagBackfillService:
                         "normalized_form": normalized_form,
                         "canonical_tag_id": ct_id,
                         "creation_method": "backfill",
-                        "normalization_version": 1,
+                        "normalization_version": NORMALIZATION_VERSION,
                         "occurrence_count": occ_count,
                         "first_seen_at": execution_timestamp,
                         "last_seen_at": execution_timestamp,
@@ -323,6 +351,7 @@ class TagBackfillService:
             batch = records[i : i + batch_size]
             stmt = pg_insert(TagAliasDB).values(batch).on_conflict_do_nothing()
             result = await session.execute(stmt)
+            queue_association_refresh(session, tags=[r["raw_form"] for r in batch])
             await session.commit()
             batch_inserted = result.rowcount
             inserted += batch_inserted
@@ -433,6 +462,8 @@ class TagBackfillService:
         ct_records, ta_records, skip_list = await self._normalize_and_group(
             session, distinct_tags, execution_timestamp
         )
+        self._normalization_engine.save()
+        norm_stats = self.last_normalization_stats
 
         # Step 4: Batch insert with Rich progress bar
         with Progress(console=_console) as progress:
@@ -473,6 +504,10 @@ class TagBackfillService:
         _console.print(ta_line)
 
         _console.print(f"Tags skipped:             {len(skip_list):>7,}")
+        _console.print(
+            f"Normalization:            {norm_stats.tags_per_second:>7,.0f} tags/s"
+            f"  ({norm_stats.memo_hits:,} memoized, {norm_stats.computed:,} computed)"
+        )
 
         minutes, seconds = divmod(int(elapsed), 60)
         if minutes > 0:
@@ -529,7 +564,9 @@ class TagBackfillService:
         dict[str, Any]
             Metrics dict with keys: ``tags_processed``,
             ``aliases_created``, ``canonical_tags_created``,
-            ``canonical_tags_reused``, ``skipped``, ``duration``.
+            ``canonical_tags_reused``, ``skipped``, ``duration`` and
+            ``tags_per_second`` (normalization throughput; absent when
+            there was nothing to process).
         """
         if batch_size < 1:
             raise SystemExit(2)
@@ -565,6 +602,8 @@ class TagBackfillService:
         ct_records, ta_records, skip_list = await self._normalize_and_group(
             session, distinct_tags, execution_timestamp
         )
+        self._normalization_engine.save()
+        tags_per_second = self.last_normalization_stats.tags_per_second
 
         # Step 4: Override creation_method to 'auto_normalize' (FR-004a)
         for record in ta_records:
@@ -583,6 +622,7 @@ class TagBackfillService:
                 - len(skip_list),
                 "skipped": len(skip_list),
                 "duration": elapsed,
+                "tags_per_second": tags_per_second,
                 "dry_run": True,
                 "ct_records": ct_records,
                 "ta_records": ta_records,
@@ -639,6 +679,7 @@ class TagBackfillService:
             "canonical_tags_reused": ct_skipped,
             "skipped": len(skip_list),
             "duration": elapsed,
+            "tags_per_second": tags_per_second,
         }
 
     # ------------------------------------------------------------------
@@ -764,6 +805,8 @@ class TagBackfillService:
 
         # Step 3: Normalize and group
         groups, skip_list = self._normalize_and_group_core(distinct_tags)
+        self._normalization_engine.save()
+        norm_stats = self.last_normalization_stats
 
         # Step 4: Compute summary stats
         total_distinct_tags = len(distinct_tags)
@@ -813,7 +856,10 @@ class TagBackfillService:
         summary_text = (
             f"[bold]Total distinct tags:[/bold]      {total_distinct_tags:>10,}\n"
             f"[bold]Estimated canonical tags:[/bold]  {estimated_canonical_tags:>10,}\n"
-            f"[bold]Tags skipped:[/bold]              {skip_count:>10,}"
+            f"[bold]Tags skipped:[/bold]              {skip_count:>10,}\n"
+            f"[bold]Normalization:[/bold]             "
+            f"{norm_stats.tags_per_second:>10,.0f} tags/s "
+            f"({norm_stats.hit_rate:.0%} memoized)"
         )
         _console.print(
             Panel(summary_text, title="Analysis Summary", border_style="blue")
@@ -18,6 +18,7 @@ from typing import Any
 from sqlalchemy import distinct, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from chronovista.db.entity_associations import queue_association_refresh
 from chronovista.db.models import CanonicalTag as CanonicalTagDB
 from chronovista.db.models import EntityAlias as EntityAliasDB
 from chronovista.db.models import NamedEntity as NamedEntityDB
@@ -564,6 +565,7 @@ class TagManagementService:
                         normalized_form=target.normalized_form,
                     )
                 )
+                queue_association_refresh(session, tag_alias_ids=alias_ids)
                 all_moved_alias_ids.extend(alias_ids)
                 total_aliases_moved += len(alias_ids)
 
@@ -755,6 +757,7 @@ class TagManagementService:
             .where(TagAliasDB.id.in_(moved_alias_ids))
             .values(canonical_tag_id=new_tag.id)
         )
+        queue_association_refresh(session, tag_alias_ids=moved_alias_ids)
 
         # Build rollback data
         rollback_data = {
@@ -916,6 +919,9 @@ class TagManagementService:
                         normalized_form=r.to_normalized_form,
                     )
                 )
+            queue_association_refresh(
+                session, tag_alias_ids=[r.alias_id for r in repairs]
+            )
 
             # The orphans exist because something skipped the operation log.
             # Repairing them without one would repeat that mistake, and there
@@ -1743,6 +1749,7 @@ class TagManagementService:
                     .where(TagAliasDB.id.in_(alias_ids))
                     .values(canonical_tag_id=source_id)
                 )
+            queue_association_refresh(session, tag_alias_ids=alias_ids)
 
             # Restore source tag to active
             if source_tag is not None:
@@ -1838,6 +1845,7 @@ class TagManagementService:
                 .where(TagAliasDB.id.in_(moved_alias_ids))
                 .values(canonical_tag_id=original_id)
             )
+        queue_association_refresh(session, tag_alias_ids=moved_alias_ids)
 
         # Delete the created canonical tag
         created_tag = await self._canonical_tag_repo.get(session, created_id)
@@ -2003,6 +2011,9 @@ class TagManagementService:
                 )
             )
             restored += 1
+        queue_association_refresh(
+            session, tag_alias_ids=[uuid.UUID(e["alias_id"]) for e in entries]
+        )
 
         return f"Restored {restored} alias(es) to their previous canonical tag"
 
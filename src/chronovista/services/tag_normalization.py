@@ -25,6 +25,11 @@ import unicodedata
 
 logger = logging.getLogger(__name__)
 
+# Version of the normalization pipeline below.  Stored on every
+# ``tag_aliases`` row and used to key memoized results; bump it whenever a
+# pipeline change can alter the output for an existing input.
+NORMALIZATION_VERSION: int = 1
+
 # ---------------------------------------------------------------------------
 # Tier 1 — SAFE_TO_STRIP combining marks (8 total)
 # These are common Latin diacritics whose removal does *not* change the
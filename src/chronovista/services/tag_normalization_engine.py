@@ -0,0 +1,307 @@
+"""
+Memoized, parallel tag normalization engine.
+
+``TagNormalizationService.normalize`` is a pure 9-step pipeline with two
+Unicode normalizations and several per-character passes.  The backfill
+(``run_backfill`` / ``run_incremental_backfill``) and the read-only
+``run_analysis`` run it over every distinct raw tag, so re-analysis redoes
+the same work for strings that have not changed since the last run.
+
+This module wraps the pipeline in an engine that:
+
+- keeps a memo of ``raw_form -> normalized_form`` keyed by
+  ``NORMALIZATION_VERSION`` (a pipeline change bumps the version and
+  invalidates the memo wholesale);
+- optionally persists that memo as JSON under the cache directory so it
+  survives between CLI runs;
+- runs only never-seen tags through the pipeline, fanning large cold
+  batches out across a process pool in fixed-size chunks.
+
+The pipeline is pure, so memoized and freshly computed results are
+interchangeable; ``normalize(normalize(x)) == normalize(x)`` still holds.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from chronovista.services.tag_normalization import (
+    NORMALIZATION_VERSION,
+    TagNormalizationService,
+)
+
+logger = logging.getLogger(__name__)
+
+# Cold batches smaller than this are normalized in-process; spinning up a
+# process pool costs more than it saves for a few thousand strings.
+DEFAULT_PARALLEL_THRESHOLD = 20_000
+
+# Number of raw tags shipped to a worker per task.
+DEFAULT_CHUNK_SIZE = 5_000
+
+
+def _normalize_chunk(raw_tags: list[str]) -> list[str | None]:
+    """Normalize a chunk of raw tags in a worker process.
+
+    Module-level so it can be pickled by ``ProcessPoolExecutor``.
+
+    Parameters
+    ----------
+    raw_tags : list[str]
+        Raw tag strings to normalize.
+
+    Returns
+    -------
+    list[str | None]
+        Normalized forms in the same order as *raw_tags*.
+    """
+    service = TagNormalizationService()
+    return [service.normalize(tag) for tag in raw_tags]
+
+
+def default_memo_path(cache_dir: Path) -> Path:
+    """Return the memo file location for the current normalization version.
+
+    Parameters
+    ----------
+    cache_dir : Path
+        Application cache directory (``settings.cache_dir``).
+
+    Returns
+    -------
+    Path
+        ``{cache_dir}/tag_normalization/memo_v{NORMALIZATION_VERSION}.json``.
+    """
+    return cache_dir / "tag_normalization" / f"memo_v{NORMALIZATION_VERSION}.json"
+
+
+class NormalizationStats(BaseModel):
+    """Throughput statistics for one ``normalize_many`` call."""
+
+    total: int = Field(default=0, description="Distinct raw tags requested")
+    memo_hits: int = Field(default=0, description="Tags served from the memo")
+    computed: int = Field(default=0, description="Tags run through the pipeline")
+    workers: int = Field(
+        default=1, description="Worker processes used (1 means in-process)"
+    )
+    elapsed_seconds: float = Field(default=0.0, description="Wall-clock time")
+
+    @property
+    def tags_per_second(self) -> float:
+        """Distinct tags resolved per second (memo hits included)."""
+        if self.elapsed_seconds <= 0:
+            return float(self.total)
+        return self.total / self.elapsed_seconds
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of requested tags served from the memo (0.0 to 1.0)."""
+        if self.total == 0:
+            return 0.0
+        return self.memo_hits / self.total
+
+
+class TagNormalizationEngine:
+    """Batch front-end for ``TagNormalizationService`` with memo and pool.
+
+    Parameters
+    ----------
+    normalization_service : TagNormalizationService
+        The pipeline used for in-process normalization.
+    memo_path : Path | None, optional
+        JSON file that persists the memo between runs.  ``None`` (default)
+        keeps the memo in memory only.
+    max_workers : int | None, optional
+        Process pool size for cold batches.  ``None`` uses
+        ``os.cpu_count()``; ``1`` disables the pool entirely.
+    parallel_threshold : int, optional
+        Minimum number of memo misses before the pool is used.
+    chunk_size : int, optional
+        Raw tags per worker task.
+    """
+
+    def __init__(
+        self,
+        normalization_service: TagNormalizationService,
+        memo_path: Path | None = None,
+        max_workers: int | None = None,
+        parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        self._normalization_service = normalization_service
+        self._memo_path = memo_path
+        self._max_workers = max_workers
+        self._parallel_threshold = parallel_threshold
+        self._chunk_size = chunk_size
+        self._memo: dict[str, str | None] = {}
+        self._memo_loaded = False
+        self._dirty = False
+        self.last_stats = NormalizationStats()
+
+    @property
+    def memo_size(self) -> int:
+        """Number of raw forms currently memoized."""
+        return len(self._memo)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def load(self) -> None:
+        """Load the persisted memo, ignoring missing or stale files.
+
+        A file written by a different ``NORMALIZATION_VERSION`` or one that
+        fails to parse is discarded (and a corrupt file deleted), so the
+        next ``save()`` rebuilds it from scratch.
+        """
+        self._memo_loaded = True
+        if self._memo_path is None or not self._memo_path.exists():
+            return
+
+        try:
+            payload = json.loads(self._memo_path.read_text(encoding="utf-8"))
+            version = payload["normalization_version"]
+            entries = payload["entries"]
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.warning(
+                "Corrupted tag normalization memo, deleting: %s", self._memo_path
+            )
+            with contextlib.suppress(OSError):
+                self._memo_path.unlink()
+            return
+
+        if version != NORMALIZATION_VERSION or not isinstance(entries, dict):
+            logger.info(
+                "Ignoring tag normalization memo for version %s (current: %d)",
+                version,
+                NORMALIZATION_VERSION,
+            )
+            return
+
+        entries.update(self._memo)
+        self._memo = entries
+        logger.info("Loaded %d memoized tag normalizations", len(self._memo))
+
+    def save(self) -> None:
+        """Persist the memo if it has new entries and a path is configured.
+
+        Writes to a temporary sibling file and renames it into place so a
+        crash mid-write never leaves a truncated memo behind.
+        """
+        if self._memo_path is None or not self._dirty:
+            return
+
+        self._memo_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._memo_path.with_suffix(".json.tmp")
+        payload = {
+            "normalization_version": NORMALIZATION_VERSION,
+            "entries": self._memo,
+        }
+        tmp_path.write_text(
+            json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self._memo_path)
+        self._dirty = False
+        logger.info(
+            "Saved %d memoized tag normalizations to %s",
+            len(self._memo),
+            self._memo_path,
+        )
+
+    # ------------------------------------------------------------------
+    # Normalization
+    # ------------------------------------------------------------------
+
+    def normalize_many(self, raw_tags: Iterable[str]) -> dict[str, str | None]:
+        """Normalize many raw tags, computing only memo misses.
+
+        Parameters
+        ----------
+        raw_tags : Iterable[str]
+            Raw tag strings.  Duplicates are resolved once.
+
+        Returns
+        -------
+        dict[str, str | None]
+            Mapping of each raw tag to its normalized form (``None`` when
+            the tag normalizes to empty).  Statistics for the call are
+            available afterwards on ``last_stats``.
+        """
+        start = time.perf_counter()
+        if not self._memo_loaded:
+            self.load()
+
+        requested = list(dict.fromkeys(raw_tags))
+        misses = [tag for tag in requested if tag not in self._memo]
+
+        workers = self._resolve_workers(len(misses))
+        if misses:
+            if workers > 1:
+                computed = self._normalize_parallel(misses, workers)
+            else:
+                normalize = self._normalization_service.normalize
+                computed = [normalize(tag) for tag in misses]
+            self._memo.update(zip(misses, computed, strict=True))
+            self._dirty = True
+
+        memo = self._memo
+        result = {tag: memo[tag] for tag in requested}
+
+        self.last_stats = NormalizationStats(
+            total=len(requested),
+            memo_hits=len(requested) - len(misses),
+            computed=len(misses),
+            workers=workers,
+            elapsed_seconds=time.perf_counter() - start,
+        )
+        logger.info(
+            "Normalized %d tags (%d memo hits, %d computed, %d worker(s)) "
+            "at %.0f tags/s",
+            self.last_stats.total,
+            self.last_stats.memo_hits,
+            self.last_stats.computed,
+            workers,
+            self.last_stats.tags_per_second,
+        )
+        return result
+
+    def _resolve_workers(self, miss_count: int) -> int:
+        """Return the number of worker processes to use for *miss_count* tags."""
+        if miss_count < self._parallel_threshold:
+            return 1
+        max_workers = self._max_workers or os.cpu_count() or 1
+        chunks = -(-miss_count // self._chunk_size)
+        return max(1, min(max_workers, chunks))
+
+    def _normalize_parallel(self, misses: list[str], workers: int) -> list[str | None]:
+        """Normalize *misses* in chunks across a process pool.
+
+        Falls back to in-process normalization if the pool cannot be
+        started (e.g. in restricted sandboxes without ``fork``/``spawn``).
+        """
+        chunks = [
+            misses[i : i + self._chunk_size]
+            for i in range(0, len(misses), self._chunk_size)
+        ]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results: list[str | None] = []
+                for chunk_result in pool.map(_normalize_chunk, chunks):
+                    results.extend(chunk_result)
+                return results
+        except (OSError, RuntimeError) as exc:
+            logger.warning("Process pool unavailable (%s); normalizing in-process", exc)
+            normalize = self._normalization_service.normalize
+            return [normalize(tag) for tag in misses]
@@ -27,6 +27,7 @@ from ..repositories.channel_repository import ChannelRepository
 from ..repositories.video_repository import VideoRepository
 from .recovery.merge_policy import is_placeholder_title
 from .takeout_service import TakeoutService
+from .takeout_snapshot import TakeoutSnapshotStats, TakeoutSnapshotStore
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +45,7 @@ class TakeoutRecoveryService:
         self,
         video_repository: VideoRepository | None = None,
         channel_repository: ChannelRepository | None = None,
+        snapshot_store: TakeoutSnapshotStore | None = None,
     ) -> None:
         """
         Initialize the recovery service.
@@ -54,9 +56,14 @@ class TakeoutRecoveryService:
             Repository for video operations (default: creates new instance)
         channel_repository : Optional[ChannelRepository]
             Repository for channel operations (default: creates new instance)
+        snapshot_store : Optional[TakeoutSnapshotStore]
+            Parsed-Takeout snapshot cache for the historical watch histories
+            (default: always parse)
         """
         self.video_repository = video_repository or VideoRepository()
         self.channel_repository = channel_repository or ChannelRepository()
+        self.snapshot_store = snapshot_store
+        self.snapshot_stats = TakeoutSnapshotStats()
 
     async def recover_from_historical_takeouts(
         self,
@@ -120,12 +127,16 @@ class TakeoutRecoveryService:
             first_takeout_parent = historical_takeouts[0].path.parent.parent
 
         try:
-            takeout_service = TakeoutService(first_takeout_parent)
+            takeout_service = TakeoutService(
+                first_takeout_parent, snapshot_store=self.snapshot_store
+            )
         except Exception:
             # Create a minimal instance for historical parsing
             takeout_service = object.__new__(TakeoutService)
             takeout_service.takeout_path = first_takeout_parent
             takeout_service.youtube_path = historical_takeouts[0].path
+            takeout_service.init_snapshot_cache(self.snapshot_store)
+        self.snapshot_stats = takeout_service.snapshot_stats
 
         video_metadata, channel_metadata = (
             await takeout_service.build_recovery_metadata_map(
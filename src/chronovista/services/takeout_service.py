@@ -16,6 +16,7 @@ import json
 import logging
 import os
 import re
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, TypedDict
@@ -37,10 +38,15 @@ from ..models.takeout import (
     ViewingPatterns,
 )
 from ..services.interfaces import TakeoutServiceInterface
+from ..services.playlist_overlap import PlaylistOverlapIndex
+from ..services.takeout_snapshot import TakeoutSnapshotStats, TakeoutSnapshotStore
 from ..services.title_normalizer import normalize_for_comparison
 
 logger = logging.getLogger(__name__)
 
+# Snapshot kind for a historical takeout's watch history alone.
+_HISTORY_SNAPSHOT_KIND = "watch_history"
+
 
 class PlaylistMetadata(TypedDict):
     """
@@ -71,7 +77,17 @@ class TakeoutService(TakeoutServiceInterface):
     Implements TakeoutServiceInterface for dependency injection and testability.
     """
 
-    def __init__(self, takeout_path: Path) -> None:
+    # Class-level defaults keep instances built without ``__init__`` (see
+    # TakeoutRecoveryService) snapshot-free until ``init_snapshot_cache``.
+    snapshot_store: TakeoutSnapshotStore | None = None
+    _snapshot: TakeoutData | None = None
+    _snapshot_fingerprint: str | None = None
+
+    def __init__(
+        self,
+        takeout_path: Path,
+        snapshot_store: TakeoutSnapshotStore | None = None,
+    ) -> None:
         """
         Initialize TakeoutService with path to extracted Takeout data.
 
@@ -79,6 +95,11 @@ class TakeoutService(TakeoutServiceInterface):
         ----------
         takeout_path : Path
             Path to the extracted "YouTube and YouTube Music" folder from Google Takeout
+        snapshot_store : Optional[TakeoutSnapshotStore]
+            Parsed-data snapshot cache. When set, ``parse_all`` loads a
+            snapshot instead of re-parsing an unchanged export (and writes one
+            after a fresh parse); the individual ``parse_*`` methods are served
+            from an existing snapshot. ``None`` (default) always parses.
         """
         self.takeout_path = Path(takeout_path)
         self.youtube_path = self.takeout_path / "YouTube and YouTube Music"
@@ -89,16 +110,66 @@ class TakeoutService(TakeoutServiceInterface):
                 f"Please ensure you've extracted the Takeout archive correctly."
             )
 
+        self.init_snapshot_cache(snapshot_store)
+
+    def init_snapshot_cache(self, snapshot_store: TakeoutSnapshotStore | None) -> None:
+        """
+        Attach (or detach) a snapshot store and reset snapshot statistics.
+
+        Parameters
+        ----------
+        snapshot_store : Optional[TakeoutSnapshotStore]
+            The store to use, or ``None`` to always parse.
+        """
+        self.snapshot_store = snapshot_store
+        self.snapshot_stats = TakeoutSnapshotStats()
+        self._snapshot = None
+        self._snapshot_fingerprint = None
+
+    def _load_snapshot(self) -> TakeoutData | None:
+        """Return the export's snapshot if one matches it (checked once)."""
+        if self.snapshot_store is None:
+            return None
+        if self._snapshot_fingerprint is None:
+            started = time.perf_counter()
+            self._snapshot_fingerprint = self.snapshot_store.fingerprint(
+                self.youtube_path
+            )
+            loaded = self.snapshot_store.load(
+                self.youtube_path, self._snapshot_fingerprint
+            )
+            if loaded is None:
+                self.snapshot_stats.misses += 1
+            else:
+                self._snapshot, parse_seconds = loaded
+                self.snapshot_stats.hits += 1
+                self.snapshot_stats.load_seconds += time.perf_counter() - started
+                self.snapshot_stats.parse_seconds_saved += parse_seconds
+        return self._snapshot
+
     async def parse_all(self) -> TakeoutData:
         """
         Parse all available Takeout data.
 
+        With a snapshot store attached, an unchanged export is loaded from its
+        snapshot instead of being re-parsed, and a fresh parse writes a new
+        snapshot (see ``snapshot_stats``).
+
         Returns
         -------
         TakeoutData
             Parsed and structured Takeout data
         """
+        snapshot = self._load_snapshot()
+        if snapshot is not None:
+            logger.info(
+                f"⚡ Loaded parsed Takeout snapshot for {self.takeout_path} "
+                f"in {self.snapshot_stats.load_seconds:.2f}s"
+            )
+            return snapshot
+
         logger.info(f"🔍 Parsing Takeout data from {self.takeout_path}")
+        started = time.perf_counter()
 
         # Parse each data source
         watch_history = await self.parse_watch_history()
@@ -122,6 +193,15 @@ class TakeoutService(TakeoutServiceInterface):
             f"{takeout_data.total_playlists} playlists, {takeout_data.total_subscriptions} subscriptions"
         )
 
+        if self.snapshot_store is not None and self._snapshot_fingerprint is not None:
+            if self.snapshot_store.save(
+                self.youtube_path,
+                self._snapshot_fingerprint,
+                takeout_data,
+                parse_seconds=time.perf_counter() - started,
+            ):
+                self.snapshot_stats.rebuilt += 1
+
         return takeout_data
 
     async def parse_watch_history(self) -> list[TakeoutWatchEntry]:
@@ -135,6 +215,10 @@ class TakeoutService(TakeoutServiceInterface):
         List[TakeoutWatchEntry]
             Parsed watch history entries
         """
+        snapshot = self._load_snapshot()
+        if snapshot is not None:
+            return list(snapshot.watch_history)
+
         history_file = self.youtube_path / "history" / "watch-history.json"
 
         if not history_file.exists():
@@ -374,6 +458,10 @@ class TakeoutService(TakeoutServiceInterface):
         List[TakeoutPlaylist]
             Parsed playlists with their videos, youtube_ids, and metadata (when available)
         """
+        snapshot = self._load_snapshot()
+        if snapshot is not None:
+            return list(snapshot.playlists)
+
         playlists_dir = self.youtube_path / "playlists"
 
         if not playlists_dir.exists():
@@ -495,6 +583,10 @@ class TakeoutService(TakeoutServiceInterface):
         List[TakeoutSubscription]
             Parsed channel subscriptions
         """
+        snapshot = self._load_snapshot()
+        if snapshot is not None:
+            return list(snapshot.subscriptions)
+
         subscriptions_file = self.youtube_path / "subscriptions" / "subscriptions.csv"
 
         if not subscriptions_file.exists():
@@ -970,24 +1062,14 @@ class TakeoutService(TakeoutServiceInterface):
         if not takeout_data.playlists:
             return {}
 
-        # Build video mappings for each playlist
-        playlist_videos: dict[str, set[str]] = {}
-        for playlist in takeout_data.playlists:
-            video_ids = {video.video_id for video in playlist.videos if video.video_id}
-            playlist_videos[playlist.name] = video_ids
-
-        # Calculate overlap matrix
-        overlap_matrix: dict[str, dict[str, int]] = {}
-        for playlist1_name, videos1 in playlist_videos.items():
-            overlap_matrix[playlist1_name] = {}
-
-            for playlist2_name, videos2 in playlist_videos.items():
-                if playlist1_name != playlist2_name:
-                    overlap_count = len(videos1.intersection(videos2))
-                    if overlap_count > 0:  # Only include non-zero overlaps
-                        overlap_matrix[playlist1_name][playlist2_name] = overlap_count
-
-        return overlap_matrix
+        # Count only pairs that share a video, via a video -> playlists index
+        index = PlaylistOverlapIndex(
+            {
+                playlist.name: (video.video_id for video in playlist.videos)
+                for playlist in takeout_data.playlists
+            }
+        )
+        return index.overlap_counts()
 
     async def analyze_channel_clusters(
         self, takeout_data: TakeoutData | None = None
@@ -1370,9 +1452,25 @@ class TakeoutService(TakeoutServiceInterface):
             logger.warning(f"Watch history file not found at {history_file}")
             return []
 
+        fingerprint: str | None = None
+        if self.snapshot_store is not None:
+            started = time.perf_counter()
+            fingerprint = self.snapshot_store.fingerprint(takeout.path, [history_file])
+            loaded = self.snapshot_store.load(
+                takeout.path, fingerprint, kind=_HISTORY_SNAPSHOT_KIND
+            )
+            if loaded is not None:
+                snapshot, parse_seconds = loaded
+                self.snapshot_stats.hits += 1
+                self.snapshot_stats.load_seconds += time.perf_counter() - started
+                self.snapshot_stats.parse_seconds_saved += parse_seconds
+                return list(snapshot.watch_history)
+            self.snapshot_stats.misses += 1
+
         logger.info(
             f"Parsing historical watch history from {takeout.export_date.date()}"
         )
+        started = time.perf_counter()
 
         try:
             with open(history_file, encoding="utf-8") as f:
@@ -1439,6 +1537,16 @@ class TakeoutService(TakeoutServiceInterface):
             if skipped_no_video_id > 0:
                 logger.debug(f"Skipped {skipped_no_video_id} entries without video IDs")
 
+            if self.snapshot_store is not None and fingerprint is not None:
+                if self.snapshot_store.save(
+                    takeout.path,
+                    fingerprint,
+                    TakeoutData(takeout_path=takeout.path, watch_history=watch_entries),
+                    parse_seconds=time.perf_counter() - started,
+                    kind=_HISTORY_SNAPSHOT_KIND,
+                ):
+                    self.snapshot_stats.rebuilt += 1
+
             return watch_entries
 
         except json.JSONDecodeError as e:
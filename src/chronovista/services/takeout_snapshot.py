@@ -0,0 +1,391 @@
+"""
+Parsed-Takeout snapshot cache.
+
+Parsing a Takeout export re-reads and re-validates every JSON and CSV file:
+tens of thousands of watch-history entries, each built through Pydantic
+validators. Analysis commands (``takeout analyze``, ``relationships``,
+``peek``, ``recover``) do that on every run even when the export has not
+changed.
+
+``TakeoutSnapshotStore`` keeps a binary snapshot of the parsed
+``TakeoutData`` under ``{cache_dir}/takeout_snapshots/``. The snapshot is
+columnar (one list per model field) and serialized with ``marshal``, which
+decodes plain lists of strings and numbers far faster than JSON. It is read
+through ``mmap`` so the OS page cache backs repeated loads, and models are
+rebuilt with ``model_construct`` because the data was validated when the
+snapshot was written.
+
+A snapshot is keyed by a fingerprint of the export: the relative path,
+size and ``mtime_ns`` of every file under the source directory, plus the
+snapshot format version and the interpreter's bytecode tag (``marshal``
+output is interpreter-specific). Any change to the export — or to this
+format — yields a different fingerprint and the snapshot is rebuilt on the
+next full parse.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import marshal
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from ..models.takeout import (
+    TakeoutData,
+    TakeoutPlaylist,
+    TakeoutPlaylistItem,
+    TakeoutSubscription,
+    TakeoutWatchEntry,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the column layout or the parsers' output changes.
+SNAPSHOT_FORMAT_VERSION = 1
+
+_MAGIC = b"CVTKSNAP"
+# magic, format version, JSON header length
+_PREAMBLE = struct.Struct("<8sHI")
+
+_WATCH_COLUMNS = (
+    "title",
+    "title_url",
+    "video_id",
+    "channel_name",
+    "channel_url",
+    "channel_id",
+    "watched_at",
+    "raw_time",
+)
+_PLAYLIST_COLUMNS = (
+    "name",
+    "file_path",
+    "video_count",
+    "youtube_id",
+    "created_at",
+    "updated_at",
+    "visibility",
+)
+_PLAYLIST_ITEM_COLUMNS = ("video_id", "creation_timestamp", "raw_timestamp")
+_SUBSCRIPTION_COLUMNS = ("channel_id", "channel_title", "channel_url")
+_DATETIME_COLUMNS = frozenset(
+    {"watched_at", "created_at", "updated_at", "creation_timestamp"}
+)
+
+
+def default_snapshot_dir(cache_dir: Path) -> Path:
+    """Return the snapshot directory under the application cache.
+
+    Parameters
+    ----------
+    cache_dir : Path
+        Application cache directory (``settings.cache_dir``).
+
+    Returns
+    -------
+    Path
+        ``{cache_dir}/takeout_snapshots``.
+    """
+    return cache_dir / "takeout_snapshots"
+
+
+class TakeoutSnapshotStats(BaseModel):
+    """Snapshot activity for one ``TakeoutService`` instance."""
+
+    hits: int = Field(default=0, description="Parses served from a snapshot")
+    misses: int = Field(default=0, description="Parses with no usable snapshot")
+    rebuilt: int = Field(default=0, description="Snapshots written")
+    load_seconds: float = Field(default=0.0, description="Time spent loading snapshots")
+    parse_seconds_saved: float = Field(
+        default=0.0,
+        description="Recorded parse time of the snapshots that were loaded",
+    )
+
+    @property
+    def net_seconds_saved(self) -> float:
+        """Parse time avoided minus the time spent loading snapshots."""
+        return max(self.parse_seconds_saved - self.load_seconds, 0.0)
+
+
+def _encode_column(name: str, values: list[Any]) -> list[Any]:
+    if name in _DATETIME_COLUMNS:
+        return [None if v is None else v.isoformat() for v in values]
+    if name == "file_path":
+        return [str(v) for v in values]
+    return values
+
+
+def _decode_column(name: str, values: list[Any]) -> list[Any]:
+    if name in _DATETIME_COLUMNS:
+        return [None if v is None else datetime.fromisoformat(v) for v in values]
+    if name == "file_path":
+        return [Path(v) for v in values]
+    return values
+
+
+def _to_columns(models: list[Any], columns: tuple[str, ...]) -> dict[str, list[Any]]:
+    return {
+        name: _encode_column(name, [getattr(m, name) for m in models])
+        for name in columns
+    }
+
+
+def _from_columns(
+    model_cls: type[BaseModel], data: dict[str, list[Any]], columns: tuple[str, ...]
+) -> list[Any]:
+    decoded = [_decode_column(name, data[name]) for name in columns]
+    return [
+        model_cls.model_construct(**dict(zip(columns, row, strict=True)))
+        for row in zip(*decoded, strict=True)
+    ]
+
+
+def _encode(data: TakeoutData) -> dict[str, Any]:
+    """Flatten ``TakeoutData`` into marshal-friendly column lists."""
+    items = [item for playlist in data.playlists for item in playlist.videos]
+    offsets = [0]
+    for playlist in data.playlists:
+        offsets.append(offsets[-1] + len(playlist.videos))
+    return {
+        "takeout_path": str(data.takeout_path),
+        "parsed_at": data.parsed_at.isoformat(),
+        "total_videos_watched": data.total_videos_watched,
+        "total_playlists": data.total_playlists,
+        "total_subscriptions": data.total_subscriptions,
+        "date_range": (
+            None
+            if data.date_range is None
+            else [d.isoformat() for d in data.date_range]
+        ),
+        "watch_history": _to_columns(data.watch_history, _WATCH_COLUMNS),
+        "playlists": _to_columns(data.playlists, _PLAYLIST_COLUMNS),
+        "playlist_item_offsets": offsets,
+        "playlist_items": _to_columns(items, _PLAYLIST_ITEM_COLUMNS),
+        "subscriptions": _to_columns(data.subscriptions, _SUBSCRIPTION_COLUMNS),
+    }
+
+
+def _decode(payload: dict[str, Any]) -> TakeoutData:
+    """Rebuild ``TakeoutData`` from columns without re-running validators."""
+    items = _from_columns(
+        TakeoutPlaylistItem, payload["playlist_items"], _PLAYLIST_ITEM_COLUMNS
+    )
+    offsets = payload["playlist_item_offsets"]
+    playlist_columns = [
+        _decode_column(name, payload["playlists"][name]) for name in _PLAYLIST_COLUMNS
+    ]
+    playlists = [
+        TakeoutPlaylist.model_construct(
+            videos=items[offsets[i] : offsets[i + 1]],
+            **dict(zip(_PLAYLIST_COLUMNS, row, strict=True)),
+        )
+        for i, row in enumerate(zip(*playlist_columns, strict=True))
+    ]
+    date_range = payload["date_range"]
+    return TakeoutData.model_construct(
+        takeout_path=Path(payload["takeout_path"]),
+        watch_history=_from_columns(
+            TakeoutWatchEntry, payload["watch_history"], _WATCH_COLUMNS
+        ),
+        playlists=playlists,
+        subscriptions=_from_columns(
+            TakeoutSubscription, payload["subscriptions"], _SUBSCRIPTION_COLUMNS
+        ),
+        parsed_at=datetime.fromisoformat(payload["parsed_at"]),
+        total_videos_watched=payload["total_videos_watched"],
+        total_playlists=payload["total_playlists"],
+        total_subscriptions=payload["total_subscriptions"],
+        date_range=(
+            None
+            if date_range is None
+            else (
+                datetime.fromisoformat(date_range[0]),
+                datetime.fromisoformat(date_range[1]),
+            )
+        ),
+    )
+
+
+class TakeoutSnapshotStore:
+    """Read and write parsed-Takeout snapshots in a cache directory.
+
+    Parameters
+    ----------
+    directory : Path
+        Where snapshot files live (see ``default_snapshot_dir``). Created on
+        first write.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+
+    @staticmethod
+    def fingerprint(source_dir: Path, files: Iterable[Path] | None = None) -> str:
+        """Fingerprint the files a parse reads.
+
+        Parameters
+        ----------
+        source_dir : Path
+            Root of the export. Paths are recorded relative to it.
+        files : Iterable[Path] | None, optional
+            The files to cover; ``None`` (default) walks every file under
+            *source_dir*.
+
+        Returns
+        -------
+        str
+            Hex digest over each file's relative path, size and ``mtime_ns``,
+            the snapshot format version and the interpreter tag.
+        """
+        if files is None:
+            files = (
+                Path(root) / name
+                for root, _dirs, names in os.walk(source_dir)
+                for name in names
+            )
+        digest = hashlib.sha256(
+            f"{SNAPSHOT_FORMAT_VERSION}:{sys.implementation.cache_tag}".encode()
+        )
+        entries = []
+        for path in files:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append(
+                f"{path.relative_to(source_dir).as_posix()}"
+                f"\0{stat.st_size}\0{stat.st_mtime_ns}"
+            )
+        for entry in sorted(entries):
+            digest.update(entry.encode("utf-8", "surrogateescape"))
+            digest.update(b"\n")
+        return digest.hexdigest()
+
+    def path_for(self, source_dir: Path, kind: str = "full") -> Path:
+        """Snapshot file for an export directory and snapshot kind."""
+        key = hashlib.sha1(
+            str(Path(source_dir).resolve()).encode("utf-8", "surrogateescape"),
+            usedforsecurity=False,
+        ).hexdigest()[:16]
+        return self.directory / f"{key}-{kind}.snap"
+
+    def load(
+        self, source_dir: Path, fingerprint: str, kind: str = "full"
+    ) -> tuple[TakeoutData, float] | None:
+        """Load the snapshot for *source_dir* if it matches *fingerprint*.
+
+        Parameters
+        ----------
+        source_dir : Path
+            Export directory the snapshot was built from.
+        fingerprint : str
+            Current fingerprint of the export (see ``fingerprint``).
+        kind : str, optional
+            ``"full"`` (default) for a complete parse, or a narrower label
+            such as ``"watch_history"`` for partial snapshots of the same
+            directory.
+
+        Returns
+        -------
+        tuple[TakeoutData, float] | None
+            The parsed data and the parse time recorded when the snapshot was
+            built, or ``None`` when there is no snapshot or it is stale. An
+            unreadable snapshot is deleted.
+        """
+        path = self.path_for(source_dir, kind)
+        try:
+            with (
+                open(path, "rb") as fh,
+                mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            ):
+                view = memoryview(mapped)
+                try:
+                    magic, version, header_len = _PREAMBLE.unpack_from(view)
+                    if magic != _MAGIC:
+                        raise ValueError("not a Takeout snapshot")
+                    if version != SNAPSHOT_FORMAT_VERSION:
+                        return None
+                    start = _PREAMBLE.size
+                    header = json.loads(bytes(view[start : start + header_len]))
+                    if header.get("fingerprint") != fingerprint:
+                        return None
+                    # Our own cache file, written by ``save`` below.
+                    payload = marshal.loads(view[start + header_len :])  # noqa: S302
+                finally:
+                    view.release()
+            return _decode(payload), float(header.get("parse_seconds", 0.0))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, EOFError, TypeError, KeyError, struct.error):
+            logger.warning("Corrupted Takeout snapshot, deleting: %s", path)
+            with contextlib.suppress(OSError):
+                path.unlink()
+            return None
+
+    def save(
+        self,
+        source_dir: Path,
+        fingerprint: str,
+        data: TakeoutData,
+        parse_seconds: float,
+        kind: str = "full",
+    ) -> Path | None:
+        """Write a snapshot, replacing any previous one for *source_dir*.
+
+        Writes to a temporary sibling file and renames it into place so a
+        crash mid-write never leaves a truncated snapshot behind. Failures
+        are logged and ignored — the snapshot is only an accelerator.
+
+        Parameters
+        ----------
+        source_dir : Path
+            Export directory *data* was parsed from.
+        fingerprint : str
+            Fingerprint of the export at parse time.
+        data : TakeoutData
+            The parsed data.
+        parse_seconds : float
+            How long the parse took; reported as time saved on later loads.
+        kind : str, optional
+            Snapshot kind, as for ``load``.
+
+        Returns
+        -------
+        Path | None
+            The snapshot path, or ``None`` if it could not be written.
+        """
+        path = self.path_for(source_dir, kind)
+        header = json.dumps(
+            {
+                "fingerprint": fingerprint,
+                "parse_seconds": round(parse_seconds, 4),
+                "source": str(source_dir),
+            }
+        ).encode("utf-8", "surrogateescape")
+        tmp_path = path.with_suffix(".snap.tmp")
+        try:
+            body = marshal.dumps(_encode(data))
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as fh:
+                fh.write(_PREAMBLE.pack(_MAGIC, SNAPSHOT_FORMAT_VERSION, len(header)))
+                fh.write(header)
+                fh.write(body)
+            os.replace(tmp_path, path)
+        except (OSError, ValueError) as e:
+            logger.warning("Could not write Takeout snapshot %s: %s", path, e)
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+            return None
+        logger.debug("Wrote Takeout snapshot %s (%d bytes)", path, len(body))
+        return path
@@ -5,7 +5,8 @@ Orchestrates the apply_correction workflow: validates the segment, creates
 an append-only audit record, updates the segment's corrected text, and
 updates transcript-level correction metadata.  All mutations use
 ``session.flush()`` only — the caller owns the transaction lifecycle
-(same flush-only pattern as ``TagManagementService``).
+(same flush-only pattern as ``TagManagementService``).  Cached segment
+timelines of the corrected transcript are invalidated on commit.
 
 Feature 033 — Transcript Corrections Audit
 """
@@ -32,6 +33,7 @@ from chronovista.repositories.transcript_segment_repository import (
 from chronovista.repositories.video_transcript_repository import (
     VideoTranscriptRepository,
 )
+from chronovista.services.segment_timeline_cache import segment_timeline_cache
 
 logger = logging.getLogger(__name__)
 
@@ -165,6 +167,7 @@ class TranscriptCorrectionService:
         segment.corrected_text = corrected_text
         segment.has_correction = True
         await session.flush()
+        segment_timeline_cache.invalidate_on_commit(session, video_id, language_code)
 
         # Step 8-9: Update transcript metadata
         transcript = await self._transcript_repo.get(session, (video_id, language_code))
@@ -307,6 +310,9 @@ class TranscriptCorrectionService:
             # has_correction remains True (the segment is still corrected)
 
         await session.flush()
+        segment_timeline_cache.invalidate_on_commit(
+            session, segment.video_id, segment.language_code
+        )
 
         # Step 6: Update transcript metadata
         transcript = await self._transcript_repo.get(
@@ -0,0 +1,262 @@
+"""
+Up-front download planning for ``chronovista sync transcripts``.
+
+The sync used to decide per video, just before downloading, which languages
+to fetch and whether each was already stored — opening a session per language
+for the check and another around each write. With thousands of candidates that
+was a round trip per (video, language) before the first download started.
+
+The planner decides for the whole candidate list first: one availability
+lookup per video where language preferences need it (a transcript API call,
+not a database one), then a single query for the ``(video_id, language_code)``
+pairs already stored. The resulting :class:`TranscriptSyncPlan` drives both the
+dry-run summary and the download loop, which also uses its stored-pair set to
+tell creates from updates without querying again.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.models import Video as VideoDB
+from ..models.transcript_source import canonical_language_code
+from ..models.user_language_preference import UserLanguagePreference
+from ..repositories.video_transcript_repository import VideoTranscriptRepository
+from .preference_aware_transcript_filter import (
+    DownloadPlan,
+    PreferenceAwareTranscriptFilter,
+)
+from .transcript_service import TranscriptService
+
+logger = logging.getLogger(__name__)
+
+NO_TRANSCRIPTS = "No transcripts available"
+NO_PREFERENCE_MATCH = "No transcripts matched preferences"
+ALREADY_STORED = "Transcript already exists"
+
+
+@dataclass
+class VideoTranscriptPlan:
+    """What the sync will do for one video.
+
+    Attributes
+    ----------
+    video_id : str
+        The video.
+    title : str
+        Display title (the video ID when the title is missing).
+    languages : list[str]
+        Languages to download, in download order.
+    available : list[str] | None
+        Languages the availability lookup reported; None when the
+        ``--language`` list was used instead of preferences.
+    preference_plan : DownloadPlan | None
+        The preference breakdown behind ``languages``, when preferences
+        were used.
+    skip_reason : str | None
+        Why nothing will be downloaded, if so.
+    existing_language : str | None
+        The stored language behind an ``ALREADY_STORED`` skip.
+    error : str | None
+        The availability lookup's error, if it failed.
+    """
+
+    video_id: str
+    title: str
+    languages: list[str] = field(default_factory=list)
+    available: list[str] | None = None
+    preference_plan: DownloadPlan | None = None
+    skip_reason: str | None = None
+    existing_language: str | None = None
+    error: str | None = None
+
+    @property
+    def will_download(self) -> bool:
+        """True when the video has languages to download."""
+        return self.skip_reason is None and self.error is None and bool(self.languages)
+
+
+@dataclass
+class TranscriptSyncPlan:
+    """The download plan for a whole candidate list.
+
+    Attributes
+    ----------
+    videos : list[VideoTranscriptPlan]
+        One entry per candidate, in candidate order.
+    stored : set[tuple[str, str]]
+        ``(video_id, canonical language_code)`` pairs stored when the plan was
+        made; the download loop adds the pairs it writes.
+    """
+
+    videos: list[VideoTranscriptPlan]
+    stored: set[tuple[str, str]] = field(default_factory=set)
+
+    @property
+    def downloads(self) -> list[VideoTranscriptPlan]:
+        """Videos with languages to download."""
+        return [v for v in self.videos if v.will_download]
+
+    @property
+    def skipped(self) -> list[VideoTranscriptPlan]:
+        """Videos skipped by the plan (no languages, or already stored)."""
+        return [v for v in self.videos if v.skip_reason is not None]
+
+    @property
+    def errors(self) -> list[VideoTranscriptPlan]:
+        """Videos whose availability lookup failed."""
+        return [v for v in self.videos if v.error is not None]
+
+    @property
+    def download_count(self) -> int:
+        """Transcripts the plan will request."""
+        return sum(len(v.languages) for v in self.downloads)
+
+    def language_counts(self) -> Counter[str]:
+        """Planned downloads per language."""
+        return Counter(lang for v in self.downloads for lang in v.languages)
+
+    def skip_reasons(self) -> Counter[str]:
+        """Skipped videos per skip reason."""
+        return Counter(v.skip_reason for v in self.videos if v.skip_reason is not None)
+
+    def is_stored(self, video_id: str, language_code: str) -> bool:
+        """Whether a transcript for the pair is stored (or written this run)."""
+        return (video_id, canonical_language_code(language_code)) in self.stored
+
+    def mark_stored(self, video_id: str, language_code: str) -> None:
+        """Record a pair written by the download loop."""
+        self.stored.add((video_id, canonical_language_code(language_code)))
+
+
+def languages_from_download_plan(plan: DownloadPlan) -> list[str]:
+    """Flatten a preference plan into download order.
+
+    FLUENT languages first, then each LEARNING original followed by its
+    translation target, without repeats.
+    """
+    languages: list[str] = list(dict.fromkeys(plan.fluent_downloads))
+    for original, translation in plan.learning_pairs:
+        if original not in languages:
+            languages.append(original)
+        if translation and translation not in languages:
+            languages.append(translation)
+    return languages
+
+
+class TranscriptSyncPlanner:
+    """Builds a :class:`TranscriptSyncPlan` for a list of candidate videos."""
+
+    def __init__(
+        self,
+        transcript_repository: VideoTranscriptRepository,
+        transcript_service: TranscriptService,
+        transcript_filter: PreferenceAwareTranscriptFilter | None = None,
+    ) -> None:
+        self.transcript_repository = transcript_repository
+        self.transcript_service = transcript_service
+        self.transcript_filter = transcript_filter or PreferenceAwareTranscriptFilter()
+
+    async def plan(
+        self,
+        session: AsyncSession,
+        videos: Sequence[VideoDB],
+        *,
+        languages: Sequence[str],
+        user_preferences: Sequence[UserLanguagePreference] | None = None,
+        force: bool = False,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> TranscriptSyncPlan:
+        """Plan the downloads for *videos*.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Session for the one stored-pair query.
+        videos : Sequence[VideoDB]
+            Candidate videos, in processing order.
+        languages : Sequence[str]
+            Languages to request when no preferences apply.
+        user_preferences : Sequence[UserLanguagePreference] | None
+            When given and non-empty, each video's languages come from its
+            available transcripts filtered through these preferences, which
+            costs one availability lookup per video.
+        force : bool
+            Plan downloads even where a requested language is stored.
+            Otherwise a video with any requested language stored is skipped.
+        progress_callback : Callable[[int], None] | None
+            Called with 1 after each video's languages are decided.
+
+        Returns
+        -------
+        TranscriptSyncPlan
+            The plan, with the stored pairs of every candidate.
+        """
+        entries: list[VideoTranscriptPlan] = []
+        for video in videos:
+            entry = VideoTranscriptPlan(
+                video_id=video.video_id, title=video.title or video.video_id
+            )
+            if user_preferences:
+                await self._plan_from_preferences(entry, list(user_preferences))
+            else:
+                entry.languages = list(languages)
+            entries.append(entry)
+            if progress_callback is not None:
+                progress_callback(1)
+
+        # One query for every candidate, instead of one per (video, language).
+        stored = await self.transcript_repository.get_stored_language_keys(
+            session, [entry.video_id for entry in entries]
+        )
+        plan = TranscriptSyncPlan(videos=entries, stored=stored)
+
+        if not force:
+            for entry in plan.downloads:
+                existing = next(
+                    (
+                        lang
+                        for lang in entry.languages
+                        if plan.is_stored(entry.video_id, lang)
+                    ),
+                    None,
+                )
+                if existing is not None:
+                    entry.skip_reason = ALREADY_STORED
+                    entry.existing_language = existing
+
+        return plan
+
+    async def _plan_from_preferences(
+        self,
+        entry: VideoTranscriptPlan,
+        user_preferences: list[UserLanguagePreference],
+    ) -> None:
+        """Fill *entry* from the video's available languages and preferences."""
+        try:
+            available = await self.transcript_service.get_available_languages(
+                entry.video_id
+            )
+        except Exception as e:
+            logger.warning(
+                "Availability lookup failed for video_id=%s: %s", entry.video_id, e
+            )
+            entry.error = str(e)
+            return
+
+        entry.available = [lang["language_code"] for lang in available]
+        if not entry.available:
+            entry.skip_reason = NO_TRANSCRIPTS
+            return
+
+        entry.preference_plan = self.transcript_filter.create_download_plan(
+            entry.available, user_preferences
+        )
+        entry.languages = languages_from_download_plan(entry.preference_plan)
+        if not entry.languages:
+            entry.skip_reason = NO_PREFERENCE_MATCH
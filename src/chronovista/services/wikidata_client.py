@@ -22,9 +22,13 @@ import httpx
 
 from chronovista.models.wikidata_candidate import WikidataCandidate
 from chronovista.services import wikidata_properties as wp
+from chronovista.services.knowledge_base_cache import (
+    KnowledgeBaseCache,
+    default_cache,
+    shared_http_client,
+)
 
 API = "https://www.wikidata.org/w/api.php"
-USER_AGENT = "chronovista/1.0 (local personal library tooling)"
 
 # Instance_of (P31) values that corroborate a hand-assigned type. Mirrors the pipeline's
 # deliberately-narrow map (sweep_absent_wikidata.EXPECTED): a wrong "matches" is costlier than
@@ -51,6 +55,7 @@ _STUB_MAX_STATEMENTS = 10
 _LABEL_LANGS = "en|mul|en-gb"  # BCP-47 fallback order for FR-016
 _DEFAULT_TIMEOUT = 8.0
 _MAX_RATE_LIMIT_RETRIES = 2
+WBGETENTITIES_MAX_IDS = 50  # API cap for anonymous clients
 
 
 class WikidataUnavailable(Exception):
@@ -62,28 +67,45 @@ class WikidataUnavailable(Exception):
 
 
 class WikidataClient:
-    """Async Wikidata search client for create-time grounding."""
+    """Async Wikidata search client for create-time grounding.
+
+    Without an injected ``http`` client, calls share the pooled client from
+    :func:`~chronovista.services.knowledge_base_cache.shared_http_client` and
+    answer repeat lookups from the local knowledge-base cache. An injected
+    client (as in tests) gets no cache unless one is passed explicitly.
+    ``request_count`` counts the HTTP calls this instance made.
+    """
 
     def __init__(
         self,
         http: httpx.AsyncClient | None = None,
         *,
         timeout: float = _DEFAULT_TIMEOUT,
+        cache: KnowledgeBaseCache | None = None,
     ) -> None:
         self._http = http
         self._timeout = timeout
-
-    def _new_client(self) -> httpx.AsyncClient:
-        return httpx.AsyncClient(
-            headers={"User-Agent": USER_AGENT}, timeout=self._timeout
+        self._cache = (
+            cache if cache is not None or http is not None else default_cache()
         )
+        self.request_count = 0
+
+    def _client(self) -> httpx.AsyncClient:
+        return self._http or shared_http_client()
 
     async def _get(self, http: httpx.AsyncClient, **params: Any) -> dict[str, Any]:
         """One API call, retrying a rate limit within a bounded number of attempts."""
         params.setdefault("format", "json")
         for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+            self.request_count += 1
             try:
-                resp = await http.get(API, params=params)
+                resp = await http.get(
+                    API,
+                    params=params,
+                    # The shared pool takes the per-call timeout; an injected client
+                    # keeps its own.
+                    timeout=self._timeout if self._http is None else http.timeout,
+                )
             except httpx.HTTPError as exc:
                 raise WikidataUnavailable(str(exc)) from exc
             if resp.status_code == 429 and attempt < _MAX_RATE_LIMIT_RETRIES:
@@ -110,26 +132,26 @@ class WikidataClient:
         knowledge base was reached but has no match.
         """
         limit = max(1, limit)
-        http = self._http or self._new_client()
-        owns = self._http is None
-        try:
-            search = await self._get(
-                http,
-                action="wbsearchentities",
-                search=name,
-                language="en",
-                uselang="en",
-                type="item",
-                limit=limit,
-            )
-            hits = [h for h in search.get("search", []) if h.get("id")][:limit]
-            if not hits:
-                return []
-            qids = [str(h["id"]) for h in hits]
-            details = await self._item_details(http, qids)
-        finally:
-            if owns:
-                await http.aclose()
+        http = self._client()
+        search_params: dict[str, Any] = {
+            "search": name,
+            "language": "en",
+            "uselang": "en",
+            "type": "item",
+            "limit": limit,
+        }
+        search: dict[str, Any] | None = None
+        if self._cache is not None:
+            _, search = self._cache.get("wbsearchentities", search_params)
+        if search is None:
+            search = await self._get(http, action="wbsearchentities", **search_params)
+            if self._cache is not None:
+                self._cache.put("wbsearchentities", search_params, search)
+        hits = [h for h in search.get("search", []) if h.get("id")][:limit]
+        if not hits:
+            return []
+        qids = [str(h["id"]) for h in hits]
+        details = await self._item_details(http, qids)
 
         expected = EXPECTED_INSTANCE_OF.get(entity_type, set())
         candidates: list[WikidataCandidate] = []
@@ -178,38 +200,93 @@ class WikidataClient:
             On transport error or rate-limit exhaustion — the caller degrades to "grounded, no
             properties; the next batch run fills them" (FR-006).
         """
-        http = self._http or self._new_client()
-        owns = self._http is None
-        try:
-            claims_data = await self._get(
-                http, action="wbgetentities", ids=qid, props="claims"
-            )
-            entity = (claims_data.get("entities") or {}).get(qid) or {}
-            extracted = wp.extract_claims(entity.get("claims") or {})
-            if not extracted:
-                return {}
-
-            labels: dict[str, str] = {}
-            pending = wp.value_qids(extracted)
-            for i in range(0, len(pending), 50):
-                chunk = pending[i : i + 50]
-                label_data = await self._get(
-                    http,
-                    action="wbgetentities",
-                    ids="|".join(chunk),
-                    props="labels",
-                    languages=wp.LABEL_LANGS,
-                )
-                for vqid, ent in (label_data.get("entities") or {}).items():
-                    text = wp.pick_label(ent.get("labels") or {})
-                    if text:
-                        labels[vqid] = text
-        finally:
-            if owns:
-                await http.aclose()
+        return (await self.fetch_properties_many([qid]))[qid]
+
+    async def fetch_properties_many(self, qids: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch the property bags for many entities in shared batched rounds.
+
+        The claims round requests up to ``WBGETENTITIES_MAX_IDS`` items per call, and the
+        value-QIDs of every entity are labelled in one shared label round, so N entities cost
+        about ``2 * ceil(N / 50)`` calls instead of ``2 * N``. Cached items cost none.
+
+        Parameters
+        ----------
+        qids : list[str]
+            Wikidata QIDs; duplicates are fetched once.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            QID -> property bag (``{}`` when the item asserts none of the wanted properties).
+
+        Raises
+        ------
+        WikidataUnavailable
+            On transport error or rate-limit exhaustion; nothing partial is returned.
+        """
+        http = self._client()
+        entities = await self._get_entities(http, qids, props="claims")
+        extracted = {
+            qid: wp.extract_claims((entities.get(qid) or {}).get("claims") or {})
+            for qid in qids
+        }
+        pending: dict[str, None] = {}
+        for fields in extracted.values():
+            pending.update(dict.fromkeys(wp.value_qids(fields)))
+
+        labels: dict[str, str] = {}
+        # No value-QIDs → no label round (a real `ids=` empty call 400s).
+        label_entities = await self._get_entities(
+            http, list(pending), props="labels", languages=wp.LABEL_LANGS
+        )
+        for vqid, ent in label_entities.items():
+            text = wp.pick_label(ent.get("labels") or {})
+            if text:
+                labels[vqid] = text
 
         set_at = datetime.now(UTC).isoformat()
-        return wp.assemble_properties(extracted, labels, set_at)
+        return {
+            qid: wp.assemble_properties(fields, labels, set_at) if fields else {}
+            for qid, fields in extracted.items()
+        }
+
+    async def _get_entities(
+        self,
+        http: httpx.AsyncClient,
+        qids: list[str],
+        *,
+        props: str,
+        languages: str | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """``wbgetentities`` for many QIDs: cached items first, the rest in 50-ID chunks.
+
+        Entities are cached one per QID (keyed with ``props``/``languages``), so a bulk call and a
+        later single lookup share entries. A failed chunk raises before anything is cached.
+        """
+        extra: dict[str, Any] = {"props": props}
+        if languages:
+            extra["languages"] = languages
+        keyed = {qid: {**extra, "id": qid} for qid in dict.fromkeys(qids)}
+        found: dict[str, dict[str, Any]] = (
+            self._cache.get_many("wbgetentities", keyed)
+            if self._cache is not None
+            else {}
+        )
+        missing = [qid for qid in keyed if qid not in found]
+        for i in range(0, len(missing), WBGETENTITIES_MAX_IDS):
+            chunk = missing[i : i + WBGETENTITIES_MAX_IDS]
+            data = await self._get(
+                http, action="wbgetentities", ids="|".join(chunk), **extra
+            )
+            entities = data.get("entities") or {}
+            fetched = {qid: entities[qid] for qid in chunk if qid in entities}
+            found.update(fetched)
+            if self._cache is not None:
+                self._cache.put_many(
+                    "wbgetentities",
+                    [(keyed[qid], ent) for qid, ent in fetched.items()],
+                )
+        return found
 
     @staticmethod
     def _resolve_label(hit: dict[str, Any], labels: dict[str, Any]) -> str:
@@ -233,35 +310,29 @@ class WikidataClient:
         create path makes one ``wbgetentities`` round-trip per 50 items instead of two.
         """
         out: dict[str, dict[str, Any]] = {}
-        for i in range(0, len(qids), 50):
-            chunk = qids[i : i + 50]
-            data = await self._get(
-                http,
-                action="wbgetentities",
-                ids="|".join(chunk),
-                props="claims|sitelinks|labels",
-                languages=_LABEL_LANGS,
-            )
-            for qid, ent in (data.get("entities") or {}).items():
-                claims = ent.get("claims") or {}
-                vals: list[str] = []
-                for claim in claims.get("P31", []):
-                    dv = claim.get("mainsnak", {}).get("datavalue")
-                    if dv and isinstance(dv.get("value"), dict):
-                        cid = dv["value"].get("id")
-                        if cid:
-                            vals.append(str(cid))
-                statements = sum(len(v) for v in claims.values())
-                sitelinks = len(ent.get("sitelinks") or {})
-                out[qid] = {
-                    "instance_of": vals,
-                    "sitelinks": sitelinks,
-                    "statements": statements,
-                    "labels": ent.get("labels") or {},
-                    "looks_like_author_stub": (
-                        "P496" in claims
-                        and statements <= _STUB_MAX_STATEMENTS
-                        and sitelinks == 0
-                    ),
-                }
+        entities = await self._get_entities(
+            http, qids, props="claims|sitelinks|labels", languages=_LABEL_LANGS
+        )
+        for qid, ent in entities.items():
+            claims = ent.get("claims") or {}
+            vals: list[str] = []
+            for claim in claims.get("P31", []):
+                dv = claim.get("mainsnak", {}).get("datavalue")
+                if dv and isinstance(dv.get("value"), dict):
+                    cid = dv["value"].get("id")
+                    if cid:
+                        vals.append(str(cid))
+            statements = sum(len(v) for v in claims.values())
+            sitelinks = len(ent.get("sitelinks") or {})
+            out[qid] = {
+                "instance_of": vals,
+                "sitelinks": sitelinks,
+                "statements": statements,
+                "labels": ent.get("labels") or {},
+                "looks_like_author_stub": (
+                    "P496" in claims
+                    and statements <= _STUB_MAX_STATEMENTS
+                    and sitelinks == 0
+                ),
+            }
         return out
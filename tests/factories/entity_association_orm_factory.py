@@ -278,7 +278,7 @@ async def seed_alias_tag_association(
     The owning ``CanonicalTag`` is created with ``entity_id = NULL`` on purpose:
     it makes the video reachable **only** via the alias-tag arm, so a test that
     seeds this path alone proves that arm executes (drop the arm from
-    ``_tag_inclusive_association_arms`` and the video disappears).
+    ``materialize_associations`` and the video disappears).
 
     Persists in FK-safe order (entity → canonical_tag → alias/tag_alias →
     video_tags). The videos must already exist.
@@ -29,6 +29,7 @@ from chronovista.api.routers.videos import (
 )
 from chronovista.auth.oauth_service import YouTubeOAuthService
 from chronovista.config.settings import get_settings
+from chronovista.db.aggregate_cache import aggregate_cache
 from chronovista.db.models import Base
 from chronovista.repositories.channel_repository import ChannelRepository
 from chronovista.repositories.user_language_preference_repository import (
@@ -39,6 +40,7 @@ from chronovista.repositories.video_repository import VideoRepository
 from chronovista.repositories.video_transcript_repository import (
     VideoTranscriptRepository,
 )
+from chronovista.services.segment_timeline_cache import segment_timeline_cache
 from chronovista.services.youtube_service import YouTubeService
 
 
@@ -126,6 +128,28 @@ def reset_api_rate_limit_counters() -> None:
     _canonical_tags_request_counts.clear()
 
 
+@pytest.fixture(autouse=True)
+def reset_segment_timeline_cache() -> None:
+    """Drop cached transcript timelines before each test.
+
+    Tests seed and clean up segments with plain ORM writes that bypass the
+    invalidation hooks, often reusing the same video id across files. A
+    timeline cached by one test would otherwise be served to the next.
+    """
+    segment_timeline_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_aggregate_cache() -> None:
+    """Start each test with a fresh aggregate-cache generation.
+
+    Fixtures that roll back instead of committing never bump the generation,
+    so an overview or sidebar payload computed from one test's rows would
+    otherwise be served to the next.
+    """
+    aggregate_cache.invalidate()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def integration_db_schema_setup(integration_test_db_url):
     """
@@ -2309,8 +2309,8 @@ class TestCreateManualAssociationEndpoint:
         """POST manual association updates mention_count/video_count on named_entities.
 
         After a successful manual association, the named_entity row's
-        mention_count and video_count should be refreshed by the repository's
-        update_entity_counters() call. This test verifies the counter update
+        mention_count and video_count should be adjusted by the repository's
+        apply_counter_deltas() call. This test verifies the counter update
         is triggered by checking that the named_entity row is mutated.
 
         Note: Because manual mentions have mention_text=canonical_name and
@@ -2669,7 +2669,7 @@ class TestDeleteManualAssociation:
     - Only rows with detection_method='manual' are removed; transcript-derived
       mentions for the same entity+video remain intact.
     - named_entities.mention_count and video_count are updated in the same
-      transaction via update_entity_counters.
+      transaction via apply_counter_deltas.
 
     Auth is patched via ``unittest.mock.patch`` so that tests do not require
     real OAuth credentials (same pattern as TestCreateManualAssociationEndpoint).
@@ -2775,7 +2775,7 @@ class TestDeleteManualAssociation:
         seed_delete_data: dict[str, Any],
         integration_session_factory: async_sessionmaker[AsyncSession],
     ) -> None:
-        """DELETE manual association triggers update_entity_counters.
+        """DELETE manual association triggers apply_counter_deltas.
 
         After a successful deletion, the named_entity row's mention_count and
         video_count should reflect the removal.  This test seeds a manual
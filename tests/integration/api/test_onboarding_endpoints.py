@@ -21,7 +21,7 @@ and wires the shared ``TaskManager`` from the onboarding router module into
 the tasks router.
 
 The ``OnboardingService`` singleton inside the onboarding router calls
-``db_manager.get_session_factory()``, which would connect to the app
+``db_manager.get_batch_session_factory()``, which would connect to the app
 database.  For the GET /onboarding/status tests we mock
 ``OnboardingService.get_status`` so no real DB queries are made.
 
@@ -72,8 +72,8 @@ def wire_task_router() -> Iterator[None]:
     that task endpoint tests can run without a RuntimeError.
 
     The ``_get_onboarding_service()`` call inside ``onboarding_router``
-    reaches ``db_manager.get_session_factory()``, which would open a DB
-    connection.  We mock ``db_manager.get_session_factory`` for the duration
+    reaches ``db_manager.get_batch_session_factory()``, which would open a DB
+    connection.  We mock ``db_manager.get_batch_session_factory`` for the duration
     of this module to prevent any real DB calls from that path.
     """
     # Build a fake session factory that satisfies the OnboardingService
@@ -82,7 +82,7 @@ def wire_task_router() -> Iterator[None]:
     fake_session_factory = MagicMock()
 
     with patch("chronovista.api.routers.onboarding.db_manager") as mock_db_manager:
-        mock_db_manager.get_session_factory.return_value = fake_session_factory
+        mock_db_manager.get_batch_session_factory.return_value = fake_session_factory
         # Reset any cached singleton so it picks up our mocked factory
         onboarding_router._onboarding_service = None
         service = onboarding_router._get_onboarding_service()
@@ -0,0 +1,202 @@
+"""Playlist similarity and library-wide overlap endpoints.
+
+Both endpoints read ``playlist_memberships`` through an in-process overlap
+index that is rebuilt when the membership table changes, so these go through
+the real database: what matters is that the index sees freshly committed
+memberships and never reports hidden playlists.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+pytestmark = pytest.mark.asyncio
+
+_CHANNEL_ID = "UCsimilar0000000001"
+
+# Three playlists: A and B share three videos, B and C share one, and the
+# hidden playlist H shares everything with A.
+_PLAYLISTS: dict[str, tuple[str, bool, list[str]]] = {
+    "PLsimilarAAAAAAAAAAAAAAAAAAAAAAA": (
+        "Alpha",
+        False,
+        ["simvid00001", "simvid00002", "simvid00003", "simvid00004"],
+    ),
+    "PLsimilarBBBBBBBBBBBBBBBBBBBBBBB": (
+        "Beta",
+        False,
+        ["simvid00001", "simvid00002", "simvid00003", "simvid00005"],
+    ),
+    "PLsimilarCCCCCCCCCCCCCCCCCCCCCCC": (
+        "Gamma",
+        False,
+        ["simvid00005", "simvid00006"],
+    ),
+    "PLsimilarHHHHHHHHHHHHHHHHHHHHHHH": (
+        "Hidden",
+        True,
+        ["simvid00001", "simvid00002", "simvid00003", "simvid00004"],
+    ),
+}
+_A, _B, _C, _H = _PLAYLISTS
+
+
+@pytest.fixture
+async def test_data_session(
+    integration_session_factory: Any,
+) -> AsyncGenerator[AsyncSession, None]:
+    """A session for seeding, from the API conftest's factory."""
+    async with integration_session_factory() as session:
+        yield session
+
+
+@pytest.fixture(autouse=True)
+async def seeded(
+    test_data_session: AsyncSession,
+) -> AsyncGenerator[None, None]:
+    """Seed the playlists above and remove them after each test."""
+    session = test_data_session
+    await session.execute(
+        text("""
+            INSERT INTO channels (channel_id, title, is_subscribed,
+                                  availability_status)
+            VALUES (:cid, 'Similarity Test Channel', false, 'available')
+            ON CONFLICT (channel_id) DO NOTHING
+            """),
+        {"cid": _CHANNEL_ID},
+    )
+    video_ids = sorted({v for _, _, videos in _PLAYLISTS.values() for v in videos})
+    for video_id in video_ids:
+        await session.execute(
+            text("""
+                INSERT INTO videos (video_id, channel_id, title, upload_date,
+                                    duration, made_for_kids,
+                                    self_declared_made_for_kids,
+                                    availability_status)
+                VALUES (:v, :c, 'Similarity Test Video', now(), 60, false, false,
+                        'available')
+                ON CONFLICT (video_id) DO NOTHING
+                """),
+            {"v": video_id, "c": _CHANNEL_ID},
+        )
+    for playlist_id, (title, hidden, videos) in _PLAYLISTS.items():
+        await session.execute(
+            text("""
+                INSERT INTO playlists (playlist_id, title, privacy_status,
+                                       channel_id, video_count, deleted_flag,
+                                       playlist_type)
+                VALUES (:pid, :title, 'private', :cid, :n, :hidden, 'regular')
+                ON CONFLICT (playlist_id) DO NOTHING
+                """),
+            {
+                "pid": playlist_id,
+                "title": title,
+                "cid": _CHANNEL_ID,
+                "n": len(videos),
+                "hidden": hidden,
+            },
+        )
+        for position, video_id in enumerate(videos):
+            await session.execute(
+                text("""
+                    INSERT INTO playlist_memberships (playlist_id, video_id,
+                                                      position)
+                    VALUES (:pid, :vid, :pos)
+                    ON CONFLICT DO NOTHING
+                    """),
+                {"pid": playlist_id, "vid": video_id, "pos": position},
+            )
+    await session.commit()
+
+    yield
+
+    await session.execute(
+        text("DELETE FROM playlists WHERE channel_id = :cid"),  # memberships cascade
+        {"cid": _CHANNEL_ID},
+    )
+    await session.execute(
+        text("DELETE FROM videos WHERE channel_id = :cid"), {"cid": _CHANNEL_ID}
+    )
+    await session.execute(
+        text("DELETE FROM channels WHERE channel_id = :cid"), {"cid": _CHANNEL_ID}
+    )
+    await session.commit()
+
+
+class TestSimilarPlaylists:
+    @pytest.mark.parametrize("method", ["exact", "minhash"])
+    async def test_most_overlapping_playlist_ranks_first(
+        self, async_client: AsyncClient, method: str
+    ) -> None:
+        response = await async_client.get(
+            f"/api/v1/playlists/{_A}/similar", params={"method": method}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["method"] == method
+        first = body["data"][0]
+        assert first["playlist_id"] == _B
+        assert first["title"] == "Beta"
+        assert first["shared_videos"] == 3
+
+    async def test_exact_jaccard_and_hidden_playlists_excluded(
+        self, async_client: AsyncClient
+    ) -> None:
+        body = (await async_client.get(f"/api/v1/playlists/{_A}/similar")).json()
+
+        ids = [item["playlist_id"] for item in body["data"]]
+        assert _H not in ids
+        assert _C not in ids  # shares nothing with A
+        assert body["data"][0]["jaccard"] == pytest.approx(3 / 5)
+
+    async def test_unknown_playlist_is_404(self, async_client: AsyncClient) -> None:
+        response = await async_client.get(
+            "/api/v1/playlists/PLdoesnotexist000000000000000000/similar"
+        )
+
+        assert response.status_code == 404
+
+
+class TestPlaylistOverlap:
+    async def test_overlap_is_not_swallowed_by_the_detail_route(
+        self, async_client: AsyncClient
+    ) -> None:
+        response = await async_client.get("/api/v1/playlists/overlap")
+
+        assert response.status_code == 200
+        assert "data" in response.json()
+
+    async def test_seeded_pairs_are_listed_with_counts(
+        self, async_client: AsyncClient
+    ) -> None:
+        body = (
+            await async_client.get("/api/v1/playlists/overlap", params={"limit": 500})
+        ).json()
+
+        pairs = {
+            frozenset(
+                (p["playlist_a"]["playlist_id"], p["playlist_b"]["playlist_id"])
+            ): p
+            for p in body["data"]
+        }
+        assert pairs[frozenset((_A, _B))]["shared_videos"] == 3
+        assert pairs[frozenset((_B, _C))]["shared_videos"] == 1
+        assert not any(_H in key for key in pairs)
+
+    async def test_min_shared_filters_weak_pairs(
+        self, async_client: AsyncClient
+    ) -> None:
+        body = (
+            await async_client.get(
+                "/api/v1/playlists/overlap", params={"limit": 500, "min_shared": 2}
+            )
+        ).json()
+
+        assert all(p["shared_videos"] >= 2 for p in body["data"])
@@ -244,7 +244,7 @@ class TestExclusionSymmetryAndAndNarrowing:
 
     ``exclude_entity_id=G`` now removes videos associated with G via a **tag**
     (not just a mention), because the exclusion consumes the same
-    ``_tag_inclusive_association_arms`` helper qualification does (FR-003). And a
+    ``_stored_associations`` helper qualification does (FR-003). And a
     second required ``entity_id`` only ever narrows the set (SC-004) — it can
     never broaden it.
     """
@@ -451,12 +451,12 @@ class TestExclusionOnlyRequests:
 
 
 class TestAliasTagArmExecutes:
-    """The **alias-tag** arm of ``_tag_inclusive_association_arms`` runs against a
-    real Postgres — not just mock-compiled.
+    """The **alias-tag** arm of ``materialize_associations`` runs against a real
+    Postgres — not just mock-compiled.
 
-    The alias-tag arm is the ``text()`` ``unnest(:a, :b)`` selectable with
-    ``.columns(entity_id=Uuid, video_id=String, mention_weight=Integer)``, injected
-    as the third arm of the 3-way ``UNION ALL``. It fires when an entity's non-ASR
+    The alias-tag arm is the ``text()`` ``unnest(:a, :b)`` selectable with typed
+    ``.columns()``, injected as the third arm of the ``UNION ALL`` the seed
+    helpers' commits materialise. It fires when an entity's non-ASR
     ``EntityAlias`` normalises to a ``TagAlias.normalized_form`` whose ``raw_form``
     is a ``VideoTag`` on the video — a path DISTINCT from the canonical-tag arm
     (``CanonicalTag.entity_id``), which the existing ``seed_tag_only_association``
@@ -465,7 +465,7 @@ class TestAliasTagArmExecutes:
     In this fixture V is reachable **only** through the alias-tag path: E has no
     ``EntityMention`` (mention arm empty) and the owning ``CanonicalTag`` has
     ``entity_id = NULL`` (canonical-tag arm empty). So if the alias-tag arm were
-    dropped from ``_tag_inclusive_association_arms``, V would not appear and every
+    dropped from ``materialize_associations``, V would not appear and every
     assertion below would fail — that is what makes this a real-DB execution test
     of that specific arm (and proves its ``.columns()`` typing / ``UNION ALL``
     alignment work at runtime, not only under compilation).
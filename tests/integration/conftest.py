@@ -7,15 +7,33 @@ Provides database session fixtures for migration and integration testing.
 from __future__ import annotations
 
 import os
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from chronovista.db.aggregate_cache import aggregate_cache
 from chronovista.db.models import Base
 
 
+@pytest.fixture(scope="session", autouse=True)
+def isolated_aggregate_cache_dir(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[None, None, None]:
+    """Keep the aggregate cache's disk level out of the real cache directory.
+
+    Committed test writes bump the cache generation and API tests persist
+    payloads; against ``settings.cache_dir`` that would invalidate (and
+    overwrite) a developer's running API cache.
+    """
+    with patch.object(
+        aggregate_cache, "_directory", tmp_path_factory.mktemp("aggregates")
+    ):
+        yield
+
+
 @pytest.fixture(scope="function")
 async def db_session() -> AsyncGenerator[AsyncSession, None]:
     """
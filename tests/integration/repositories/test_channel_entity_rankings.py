@@ -1,9 +1,9 @@
 """Real-DB ranking math for ``get_channel_entity_rankings`` (Feature 070 / #171, T004).
 
-A mock cannot exercise this method — its channel count comes from the shared
-``_tag_inclusive_association_arms`` (a ``UNION ALL`` + ``unnest``) and its
-denominator from ``get_association_counts``, both of which only mean anything
-against real rows. So this lives in the integration suite on an isolated
+A mock cannot exercise this method — its channel and corpus counts come from
+the materialised ``entity_video_associations`` rows, which the seed helpers'
+commits derive from mentions and tags, so they only mean anything against real
+rows. So this lives in the integration suite on an isolated
 ``db_session`` (create_all + drop_all per test), not among the mock SQL-shape
 guards in ``tests/unit``.
 
@@ -96,8 +96,8 @@ async def _seed(session: AsyncSession) -> None:
         entity_name="R070 TieB",  # channel=3, corpus=9, share=1/3
     )
     # ALIAS: reached ONLY through the alias-tag path (canonical_tag.entity_id
-    # NULL) -> exercises discovery step 2c AND the alias arm in
-    # _tag_inclusive_association_arms (the path that regressed #260). channel=2
+    # NULL) -> exercises the alias arm of materialize_associations (the path
+    # that regressed #260). channel=2
     # (cv1,cv2) + 2 other -> corpus=4, share=0.5 (ties Freq on share, loses the
     # tie on channel count: Freq ch=3 precedes Alias ch=2).
     await seed_alias_tag_association(
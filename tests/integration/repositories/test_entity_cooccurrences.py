@@ -0,0 +1,152 @@
+"""Integration tests for the stored entity co-occurrences.
+
+``entity_cooccurrences`` is recounted on commit for the pairs that share a
+video whose associations or availability changed
+(``chronovista.db.entity_associations``), and rebuilt wholesale by
+``entities rebuild-cooccurrences``. These tests change associations and
+availability through the committing paths and check the appears-with panel
+and the stored rows against a full rebuild.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from chronovista.db.models import EntityCooccurrence as CooccurrenceDB
+from chronovista.db.models import Video as VideoDB
+from chronovista.models.enums import AvailabilityStatus, EvidenceScope
+from chronovista.repositories.entity_mention_repository import EntityMentionRepository
+from tests.factories.entity_association_orm_factory import (
+    seed_channel_with_videos,
+    seed_mention_association,
+    seed_tag_only_association,
+)
+
+pytestmark = pytest.mark.asyncio
+
+_repo = EntityMentionRepository()
+_CH = "UCevaCoocChannel0000000"[:24]
+_VIDEOS = [f"evaCooc{i:03d}" for i in range(1, 4)]
+_GONE = "evaCooc900"
+
+
+async def _partners(
+    session: AsyncSession,
+    entity_id: uuid.UUID,
+    scope: EvidenceScope = EvidenceScope.ANY,
+) -> dict[uuid.UUID, int]:
+    rows = await _repo.get_cooccurring_entities(
+        session, entity_id=entity_id, limit=50, evidence_scope=scope
+    )
+    return {row["entity_id"]: row["shared_video_count"] for row in rows}
+
+
+async def _rows(
+    session: AsyncSession, entity_ids: list[uuid.UUID]
+) -> set[tuple[object, ...]]:
+    rows = await session.execute(
+        select(
+            CooccurrenceDB.entity_id,
+            CooccurrenceDB.partner_id,
+            CooccurrenceDB.shared_video_count,
+            CooccurrenceDB.transcript_shared_video_count,
+        ).where(
+            or_(
+                CooccurrenceDB.entity_id.in_(entity_ids),
+                CooccurrenceDB.partner_id.in_(entity_ids),
+            )
+        )
+    )
+    return {tuple(r) for r in rows.all()}
+
+
+class TestEntityCooccurrences:
+    """Committed changes keep the stored pairs equal to a rebuild."""
+
+    async def test_panel_counts_available_shared_videos_per_scope(
+        self, db_session: AsyncSession
+    ) -> None:
+        await seed_channel_with_videos(
+            db_session, channel_id=_CH, available=_VIDEOS, unavailable=[_GONE]
+        )
+        hub = await seed_mention_association(
+            db_session, video_ids=[*_VIDEOS, _GONE], entity_name="Eva Cooc Hub"
+        )
+        titled = await seed_mention_association(
+            db_session,
+            video_ids=[_VIDEOS[0], _VIDEOS[1], _GONE],
+            entity_name="Eva Cooc Titled",
+            mention_source="title",
+        )
+        spoken = await seed_mention_association(
+            db_session, video_ids=_VIDEOS[2:], entity_name="Eva Cooc Spoken"
+        )
+        tagged = await seed_tag_only_association(
+            db_session, video_ids=_VIDEOS[2:], entity_name="Eva Cooc Tagged"
+        )
+
+        # The unavailable video is not counted (FR-024b).
+        assert await _partners(db_session, hub.id) == {
+            titled.id: 2,
+            spoken.id: 1,
+            tagged.id: 1,
+        }
+        assert await _partners(db_session, hub.id, EvidenceScope.TRANSCRIPT) == {
+            spoken.id: 1
+        }
+        # Stored in both directions.
+        assert await _partners(db_session, titled.id) == {hub.id: 2}
+
+    async def test_changes_recount_on_commit(self, db_session: AsyncSession) -> None:
+        await seed_channel_with_videos(db_session, channel_id=_CH, available=_VIDEOS)
+        hub = await seed_mention_association(
+            db_session, video_ids=_VIDEOS, entity_name="Eva Cooc Moving"
+        )
+        partner = await seed_mention_association(
+            db_session, video_ids=_VIDEOS[:2], entity_name="Eva Cooc Partner"
+        )
+
+        # A mention delete (Core path) drops one shared video...
+        await _repo.delete_by_scope(
+            db_session, entity_ids=[partner.id], video_ids=[_VIDEOS[0]]
+        )
+        await db_session.commit()
+        assert await _partners(db_session, hub.id) == {partner.id: 1}
+
+        # ...and the last one going unavailable (ORM path) drops the pair.
+        video = await db_session.get(VideoDB, _VIDEOS[1])
+        assert video is not None
+        video.availability_status = AvailabilityStatus.UNAVAILABLE
+        await db_session.commit()
+        assert await _partners(db_session, hub.id) == {}
+
+        video.availability_status = AvailabilityStatus.AVAILABLE
+        await db_session.commit()
+        assert await _partners(db_session, hub.id) == {partner.id: 1}
+
+    async def test_incremental_state_matches_a_full_rebuild(
+        self, db_session: AsyncSession
+    ) -> None:
+        await seed_channel_with_videos(db_session, channel_id=_CH, available=_VIDEOS)
+        first = await seed_mention_association(
+            db_session, video_ids=_VIDEOS, entity_name="Eva Cooc First"
+        )
+        second = await seed_mention_association(
+            db_session, video_ids=_VIDEOS[1:], entity_name="Eva Cooc Second"
+        )
+        third = await seed_tag_only_association(
+            db_session, video_ids=_VIDEOS[:2], entity_name="Eva Cooc Third"
+        )
+        await _repo.delete_by_scope(db_session, video_ids=[_VIDEOS[2]])
+        await db_session.commit()
+        ids = [first.id, second.id, third.id]
+        incremental = await _rows(db_session, ids)
+
+        await _repo.refresh_cooccurrences(db_session)
+        await db_session.commit()
+
+        assert await _rows(db_session, ids) == incremental
@@ -0,0 +1,200 @@
+"""Integration tests for incremental entity/alias counter maintenance.
+
+``apply_counter_deltas`` adjusts ``mention_count`` / ``video_count`` /
+``occurrence_count`` from the mentions a writer just inserted or deleted,
+instead of re-aggregating. Its visibility and zero-crossing logic only runs
+in the database, so these tests write mentions through the adjusting paths
+and check that ``find_counter_drift`` (the full recompute) agrees.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from chronovista.db.models import EntityAlias as EntityAliasDB
+from chronovista.db.models import NamedEntity as NamedEntityDB
+from chronovista.db.models import TranscriptSegment as SegmentDB
+from chronovista.db.models import Video as VideoDB
+from chronovista.db.models import VideoTranscript as TranscriptDB
+from chronovista.models.entity_mention import EntityMentionCreate
+from chronovista.models.enums import DetectionMethod
+from chronovista.repositories.entity_mention_repository import EntityMentionRepository
+
+pytestmark = pytest.mark.asyncio
+
+_repo = EntityMentionRepository()
+_VIDEOS = ("cntDelta001", "cntDelta002")
+
+
+async def _seed(session: AsyncSession) -> tuple[uuid.UUID, list[SegmentDB]]:
+    for video_id in _VIDEOS:
+        session.add(
+            VideoDB(
+                video_id=video_id,
+                title="Counter fixture",
+                upload_date=datetime(2024, 6, 1, tzinfo=UTC),
+                duration=60,
+            )
+        )
+        session.add(
+            TranscriptDB(
+                video_id=video_id,
+                language_code="en",
+                transcript_text="fixture",
+                transcript_type="auto",
+                download_reason="user_request",
+                is_cc=False,
+                is_auto_synced=True,
+                track_kind="asr",
+            )
+        )
+    entity = NamedEntityDB(
+        canonical_name="Rene",
+        canonical_name_normalized="rene",
+        entity_type="person",
+        status="active",
+    )
+    session.add(entity)
+    await session.flush()
+    session.add_all(
+        [
+            EntityAliasDB(
+                entity_id=entity.id,
+                alias_name="Rene",
+                alias_name_normalized="rene",
+                alias_type="name_variant",
+            ),
+            EntityAliasDB(
+                entity_id=entity.id,
+                alias_name="Renny",
+                alias_name_normalized="renny",
+                alias_type="asr_error",
+            ),
+        ]
+    )
+    segments = [
+        SegmentDB(
+            video_id=video_id,
+            language_code="en",
+            text=f"segment {i}",
+            start_time=float(i),
+            duration=1.0,
+            end_time=float(i + 1),
+            sequence_number=i,
+        )
+        for i, video_id in enumerate([_VIDEOS[0], _VIDEOS[0], _VIDEOS[0], _VIDEOS[1]])
+    ]
+    session.add_all(segments)
+    await session.flush()
+    return uuid.UUID(str(entity.id)), segments
+
+
+def _mention(
+    entity_id: uuid.UUID, segment: SegmentDB, text: str
+) -> EntityMentionCreate:
+    return EntityMentionCreate(
+        entity_id=entity_id,
+        segment_id=segment.id,
+        video_id=segment.video_id,
+        language_code="en",
+        mention_text=text,
+        detection_method=DetectionMethod.RULE_MATCH,
+        confidence=1.0,
+    )
+
+
+async def _counters(session: AsyncSession, entity_id: uuid.UUID) -> tuple[int, int]:
+    row = (
+        await session.execute(
+            select(NamedEntityDB.mention_count, NamedEntityDB.video_count).where(
+                NamedEntityDB.id == entity_id
+            )
+        )
+    ).one()
+    return int(row.mention_count), int(row.video_count)
+
+
+async def _alias_counts(session: AsyncSession, entity_id: uuid.UUID) -> dict[str, int]:
+    rows = await session.execute(
+        select(EntityAliasDB.alias_name, EntityAliasDB.occurrence_count).where(
+            EntityAliasDB.entity_id == entity_id
+        )
+    )
+    return {name: int(count) for name, count in rows.all()}
+
+
+async def _drifted(session: AsyncSession, entity_id: uuid.UUID) -> bool:
+    entity_drift, alias_drift = await _repo.find_counter_drift(session)
+    return entity_id in {row[0] for row in entity_drift} | set(alias_drift)
+
+
+class TestCounterDeltas:
+    """Deltas agree with the full recompute."""
+
+    async def test_inserts_and_deletes_match_recompute(
+        self, db_session: AsyncSession
+    ) -> None:
+        entity_id, segments = await _seed(db_session)
+        mentions = [
+            _mention(entity_id, segments[0], "René"),
+            _mention(entity_id, segments[1], "Rene"),
+            _mention(entity_id, segments[2], "Renny"),  # ASR-error: not visible
+            _mention(entity_id, segments[3], "Rene"),
+        ]
+
+        inserted = await _repo.bulk_create_with_conflict_skip(
+            db_session, mentions, adjust_counters=True
+        )
+        # Re-inserting conflicts and must not count twice.
+        again = await _repo.bulk_create_with_conflict_skip(
+            db_session, mentions, adjust_counters=True
+        )
+
+        assert (inserted, again) == (4, 0)
+        assert await _counters(db_session, entity_id) == (3, 2)
+        assert await _alias_counts(db_session, entity_id) == {"Rene": 3, "Renny": 1}
+        assert not await _drifted(db_session, entity_id)
+
+        removed = await _repo.delete_rule_matches_for_segments(
+            db_session, [segments[3].id]
+        )
+
+        assert removed == 1
+        assert await _counters(db_session, entity_id) == (2, 1)
+        assert not await _drifted(db_session, entity_id)
+
+    async def test_manual_association_round_trip(
+        self, db_session: AsyncSession
+    ) -> None:
+        entity_id, _ = await _seed(db_session)
+
+        await _repo.create_manual_association(
+            db_session, video_id=_VIDEOS[1], entity_id=entity_id
+        )
+        assert await _counters(db_session, entity_id) == (1, 1)
+
+        await _repo.delete_manual_association(
+            db_session, video_id=_VIDEOS[1], entity_id=entity_id
+        )
+        assert await _counters(db_session, entity_id) == (0, 0)
+        assert not await _drifted(db_session, entity_id)
+
+    async def test_drift_is_reported_and_repaired(
+        self, db_session: AsyncSession
+    ) -> None:
+        entity_id, segments = await _seed(db_session)
+        await _repo.bulk_create_with_conflict_skip(
+            db_session, [_mention(entity_id, segments[0], "Rene")]
+        )  # no adjustment: counters now lag by one
+
+        assert await _drifted(db_session, entity_id)
+
+        await _repo.update_entity_counters(db_session, [entity_id])
+        await _repo.update_alias_counters(db_session, [entity_id])
+
+        assert not await _drifted(db_session, entity_id)
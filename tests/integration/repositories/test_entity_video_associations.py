@@ -0,0 +1,149 @@
+"""Integration tests for the materialised entity-video associations.
+
+``entity_video_associations`` is refreshed on commit from the keys the ORM
+hook and the Core writers queue (``chronovista.db.entity_associations``), and
+rebuilt wholesale by ``entities rebuild-associations``. These tests commit
+association sources through both paths and check that the stored rows match a
+full rebuild.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from chronovista.db.entity_associations import EVIDENCE_BITS
+from chronovista.db.models import EntityMention as EntityMentionDB
+from chronovista.db.models import EntityVideoAssociation as AssociationDB
+from chronovista.repositories.entity_mention_repository import EntityMentionRepository
+from chronovista.repositories.video_tag_repository import VideoTagRepository
+from tests.factories.entity_association_orm_factory import (
+    seed_alias_tag_association,
+    seed_channel_with_videos,
+    seed_mention_association,
+    seed_tag_only_association,
+)
+
+pytestmark = pytest.mark.asyncio
+
+_repo = EntityMentionRepository()
+_CH = "UCevaAssocChannel000000"[:24]
+_VIDEOS = [f"evaAssoc{i:03d}" for i in range(1, 5)]
+
+
+async def _stored(
+    session: AsyncSession, entity_id: uuid.UUID
+) -> dict[str, tuple[int, int, int]]:
+    rows = await session.execute(
+        select(
+            AssociationDB.video_id,
+            AssociationDB.evidence,
+            AssociationDB.mention_count,
+            AssociationDB.transcript_mention_count,
+        ).where(AssociationDB.entity_id == entity_id)
+    )
+    return {
+        r.video_id: (r.evidence, r.mention_count, r.transcript_mention_count)
+        for r in rows
+    }
+
+
+async def _all_rows(session: AsyncSession) -> set[tuple[object, ...]]:
+    rows = await session.execute(
+        select(
+            AssociationDB.entity_id,
+            AssociationDB.video_id,
+            AssociationDB.evidence,
+            AssociationDB.mention_count,
+            AssociationDB.transcript_mention_count,
+        )
+    )
+    return {tuple(r) for r in rows.all()}
+
+
+class TestEntityVideoAssociations:
+    """Committed writes keep the stored associations equal to a rebuild."""
+
+    async def test_each_source_sets_its_bit(self, db_session: AsyncSession) -> None:
+        await seed_channel_with_videos(db_session, channel_id=_CH, available=_VIDEOS)
+        entity = await seed_mention_association(
+            db_session, video_ids=_VIDEOS[:2], entity_name="Eva Assoc"
+        )
+        await seed_mention_association(
+            db_session, video_ids=_VIDEOS[1:2], entity=entity, mention_source="title"
+        )
+        await seed_tag_only_association(
+            db_session, video_ids=_VIDEOS[2:3], entity=entity
+        )
+        await seed_alias_tag_association(
+            db_session, video_ids=_VIDEOS[3:4], entity=entity
+        )
+
+        stored = await _stored(db_session, entity.id)
+
+        transcript, title, tag = (
+            EVIDENCE_BITS["transcript"],
+            EVIDENCE_BITS["title"],
+            EVIDENCE_BITS["tag"],
+        )
+        assert stored == {
+            _VIDEOS[0]: (transcript, 1, 1),
+            _VIDEOS[1]: (transcript | title, 2, 1),
+            _VIDEOS[2]: (tag, 0, 0),
+            _VIDEOS[3]: (tag, 0, 0),
+        }
+
+    async def test_deletes_refresh_on_commit(self, db_session: AsyncSession) -> None:
+        await seed_channel_with_videos(db_session, channel_id=_CH, available=_VIDEOS)
+        entity = await seed_mention_association(
+            db_session, video_ids=_VIDEOS[:2], entity_name="Eva Delete"
+        )
+        tagged = await seed_tag_only_association(
+            db_session, video_ids=_VIDEOS[2:3], entity_name="Eva Tagged"
+        )
+
+        # Core paths: a mention delete and a tag delete queue their videos.
+        await _repo.delete_by_scope(db_session, video_ids=[_VIDEOS[0]])
+        await VideoTagRepository().delete_by_video_id(db_session, _VIDEOS[2])
+        await db_session.commit()
+
+        assert set(await _stored(db_session, entity.id)) == {_VIDEOS[1]}
+        assert await _stored(db_session, tagged.id) == {}
+
+    async def test_rolled_back_writes_leave_rows_alone(
+        self, db_session: AsyncSession
+    ) -> None:
+        await seed_channel_with_videos(db_session, channel_id=_CH, available=_VIDEOS)
+        entity = await seed_mention_association(
+            db_session, video_ids=_VIDEOS[:1], entity_name="Eva Rollback"
+        )
+
+        await db_session.execute(
+            delete(EntityMentionDB).where(EntityMentionDB.entity_id == entity.id)
+        )
+        await db_session.rollback()
+
+        assert set(await _stored(db_session, entity.id)) == {_VIDEOS[0]}
+
+    async def test_incremental_state_matches_a_full_rebuild(
+        self, db_session: AsyncSession
+    ) -> None:
+        await seed_channel_with_videos(db_session, channel_id=_CH, available=_VIDEOS)
+        entity = await seed_mention_association(
+            db_session, video_ids=_VIDEOS[:3], entity_name="Eva Rebuild"
+        )
+        await seed_alias_tag_association(
+            db_session, video_ids=_VIDEOS[2:], entity=entity
+        )
+        await _repo.delete_by_scope(db_session, video_ids=[_VIDEOS[1]])
+        await db_session.commit()
+        incremental = await _all_rows(db_session)
+
+        written = await _repo.refresh_associations(db_session)
+        await db_session.commit()
+
+        assert written == len(incremental)
+        assert await _all_rows(db_session) == incremental
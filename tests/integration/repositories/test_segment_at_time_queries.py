@@ -0,0 +1,129 @@
+"""Integration tests for single-query timestamp lookups.
+
+``get_segment_at_time`` used to run an exact-match query followed by a
+gap-fallback query; it now folds both into one ordered ``LIMIT 1`` query, and
+``get_segments_at_times`` resolves many timestamps through a lateral join.
+Both are checked against a brute-force reference of the original two-step
+semantics on a fixture with gaps, shared boundaries and overlapping
+auto-caption style segments -- the ordering expression is only interesting
+when run by the database.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from chronovista.db.models import TranscriptSegment as SegmentDB
+from chronovista.db.models import Video as VideoDB
+from chronovista.db.models import VideoTranscript as TranscriptDB
+from chronovista.models.youtube_types import VideoId
+from chronovista.repositories.transcript_segment_repository import (
+    TranscriptSegmentRepository,
+)
+
+pytestmark = pytest.mark.asyncio
+
+_VIDEO_ID = "segAtTime01"
+
+# (start, end): a shared boundary at 2.5, a gap 5.0-7.0, a long segment
+# overlapped by a short one, and a zero-duration segment.
+_INTERVALS = [
+    (0.0, 2.5),
+    (2.5, 5.0),
+    (7.0, 20.0),
+    (8.0, 9.0),
+    (21.0, 21.0),
+    (22.0, 24.0),
+]
+
+_PROBES = [-1.0, 0.0, 1.0, 2.5, 4.99, 5.0, 6.0, 7.0, 8.5, 9.0, 15.0, 20.5, 21.0, 30.0]
+
+
+def _reference(
+    segments: list[SegmentDB], timestamp: float
+) -> tuple[float, float] | None:
+    """The original two-query semantics, evaluated in Python."""
+    containing = [s for s in segments if s.start_time <= timestamp < s.end_time]
+    if containing:
+        best = max(containing, key=lambda s: s.start_time)
+        return (best.start_time, best.end_time)
+    ended = [s for s in segments if s.end_time <= timestamp]
+    if ended:
+        best = max(ended, key=lambda s: s.end_time)
+        return (best.start_time, best.end_time)
+    return None
+
+
+async def _seed(session: AsyncSession) -> list[SegmentDB]:
+    session.add(
+        VideoDB(
+            video_id=_VIDEO_ID,
+            title="Segment-at-time fixture",
+            description="integration fixture",
+            upload_date=datetime(2024, 6, 1, tzinfo=UTC),
+            duration=30,
+        )
+    )
+    session.add(
+        TranscriptDB(
+            video_id=_VIDEO_ID,
+            language_code="en",
+            transcript_text="fixture",
+            transcript_type="auto",
+            download_reason="user_request",
+            is_cc=False,
+            is_auto_synced=True,
+            track_kind="asr",
+        )
+    )
+    await session.flush()
+    segments = [
+        SegmentDB(
+            video_id=_VIDEO_ID,
+            language_code="en",
+            text=f"segment {i}",
+            start_time=start,
+            duration=end - start,
+            end_time=end,
+            sequence_number=i,
+        )
+        for i, (start, end) in enumerate(_INTERVALS)
+    ]
+    session.add_all(segments)
+    await session.flush()
+    return segments
+
+
+class TestSegmentAtTime:
+    """Single and batch lookups agree with the two-step reference."""
+
+    async def test_single_lookup_matches_reference(
+        self, db_session: AsyncSession
+    ) -> None:
+        segments = await _seed(db_session)
+        repo = TranscriptSegmentRepository()
+
+        for probe in _PROBES:
+            found = await repo.get_segment_at_time(
+                db_session, VideoId(_VIDEO_ID), "en", probe
+            )
+            actual = None if found is None else (found.start_time, found.end_time)
+            assert actual == _reference(segments, probe), f"t={probe}"
+
+    async def test_batch_lookup_matches_reference(
+        self, db_session: AsyncSession
+    ) -> None:
+        segments = await _seed(db_session)
+        repo = TranscriptSegmentRepository()
+
+        resolved = await repo.get_segments_at_times(
+            db_session, VideoId(_VIDEO_ID), "EN", _PROBES
+        )
+
+        assert list(resolved) == _PROBES
+        for probe, found in resolved.items():
+            actual = None if found is None else (found.start_time, found.end_time)
+            assert actual == _reference(segments, probe), f"t={probe}"
@@ -0,0 +1,110 @@
+"""Integration tests for the transcript segment change log.
+
+``transcript_segment_changes`` is written by an ``after_flush`` hook for ORM
+inserts, text edits and deletes, and by :func:`logged_segment_delete` for bulk
+deletes. These tests check each path records exactly the segments it touched.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from chronovista.db.models import TranscriptSegment as SegmentDB
+from chronovista.db.models import TranscriptSegmentChange as ChangeDB
+from chronovista.db.models import Video as VideoDB
+from chronovista.db.models import VideoTranscript as TranscriptDB
+from chronovista.repositories.transcript_segment_repository import (
+    TranscriptSegmentRepository,
+)
+
+pytestmark = pytest.mark.asyncio
+
+_VIDEO_ID = "segChanges1"
+
+
+async def _seed(session: AsyncSession) -> list[SegmentDB]:
+    session.add(
+        VideoDB(
+            video_id=_VIDEO_ID,
+            title="Change log fixture",
+            description="integration fixture",
+            upload_date=datetime(2024, 6, 1, tzinfo=UTC),
+            duration=60,
+        )
+    )
+    session.add(
+        TranscriptDB(
+            video_id=_VIDEO_ID,
+            language_code="en",
+            transcript_text="fixture",
+            transcript_type="auto",
+            download_reason="user_request",
+            is_cc=False,
+            is_auto_synced=True,
+            track_kind="asr",
+        )
+    )
+    await session.flush()
+    segments = [
+        SegmentDB(
+            video_id=_VIDEO_ID,
+            language_code="en",
+            text=text,
+            start_time=float(i * 5),
+            duration=5.0,
+            end_time=float(i * 5 + 5),
+            sequence_number=i,
+        )
+        for i, text in enumerate(["one", "two", "three"])
+    ]
+    session.add_all(segments)
+    await session.flush()
+    return segments
+
+
+async def _logged(session: AsyncSession) -> list[tuple[int, bool]]:
+    result = await session.execute(
+        select(ChangeDB.segment_id, ChangeDB.deleted)
+        .where(ChangeDB.video_id == _VIDEO_ID)
+        .order_by(ChangeDB.id)
+    )
+    return [(row.segment_id, row.deleted) for row in result.all()]
+
+
+class TestSegmentChangeLog:
+    """Each write path logs the segments it changed."""
+
+    async def test_inserts_are_logged(self, db_session: AsyncSession) -> None:
+        segments = await _seed(db_session)
+
+        assert await _logged(db_session) == [(s.id, False) for s in segments]
+
+    async def test_only_text_edits_are_logged(self, db_session: AsyncSession) -> None:
+        segments = await _seed(db_session)
+        before = len(await _logged(db_session))
+
+        segments[0].corrected_text = "uno"
+        segments[0].has_correction = True
+        segments[1].duration = 4.0
+        await db_session.flush()
+
+        assert (await _logged(db_session))[before:] == [(segments[0].id, False)]
+
+    async def test_bulk_delete_logs_every_segment(
+        self, db_session: AsyncSession
+    ) -> None:
+        segments = await _seed(db_session)
+        before = len(await _logged(db_session))
+
+        deleted = await TranscriptSegmentRepository().delete_segments_for_transcript(
+            db_session, _VIDEO_ID, "en"
+        )
+
+        assert deleted == len(segments)
+        assert sorted((await _logged(db_session))[before:]) == [
+            (s.id, True) for s in segments
+        ]
@@ -0,0 +1,200 @@
+"""Integration tests for the transcript segment seam index.
+
+``transcript_segment_seams`` is maintained by an ``after_flush`` hook and
+queried with reversed-tail / head prefix matches. The SQL normalization and
+word slicing only run in the database, so these tests check the stored keys
+against the Python helpers after inserts and corrections, and check
+``find_segments_at_seams`` against a brute-force boundary scan.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from chronovista.db.models import TranscriptSegment as SegmentDB
+from chronovista.db.models import TranscriptSegmentSeam as SeamDB
+from chronovista.db.models import Video as VideoDB
+from chronovista.db.models import VideoTranscript as TranscriptDB
+from chronovista.db.segment_seams import seam_head_key, seam_tail_key
+from chronovista.repositories.transcript_segment_repository import (
+    TranscriptSegmentRepository,
+)
+
+pytestmark = pytest.mark.asyncio
+
+_VIDEO_ID = "segSeams001"
+
+_TEXTS = [
+    "welcome back to the show",
+    "today we talk about Ada",
+    "Lovelace and the  analytical\tengine",
+    "which was designed by Charles",
+    "Babbage in eighteen thirty seven",
+    "100% of the_time",
+]
+
+_BOUNDARIES: list[tuple[str | None, str | None]] = [
+    ("about Ada", "Lovelace"),
+    ("ada", "lovelace and"),
+    ("Charles", None),
+    (None, "babbage in eighteen"),
+    ("seven", "100%"),
+    ("show", "today"),
+    ("x", "nothing"),
+]
+
+
+def _effective(segment: SegmentDB) -> str:
+    if segment.has_correction and segment.corrected_text is not None:
+        return segment.corrected_text
+    return segment.text
+
+
+def _brute_force(
+    segments: list[SegmentDB], boundaries: list[tuple[str | None, str | None]]
+) -> set[int]:
+    """Ids of both segments of every pair matching a boundary, case-folded."""
+    matched: set[int] = set()
+    for seg_n, seg_n1 in zip(segments, segments[1:], strict=False):
+        tail_text = " ".join(_effective(seg_n).split()).lower()
+        head_text = " ".join(_effective(seg_n1).split()).lower()
+        for tail, head in boundaries:
+            if tail is not None and not tail_text.endswith(tail.lower()):
+                continue
+            if head is not None and not head_text.startswith(head.lower()):
+                continue
+            matched.update({seg_n.id, seg_n1.id})
+    return matched
+
+
+async def _seed(session: AsyncSession) -> list[SegmentDB]:
+    session.add(
+        VideoDB(
+            video_id=_VIDEO_ID,
+            title="Seam fixture",
+            description="integration fixture",
+            upload_date=datetime(2024, 6, 1, tzinfo=UTC),
+            duration=60,
+        )
+    )
+    session.add(
+        TranscriptDB(
+            video_id=_VIDEO_ID,
+            language_code="en",
+            transcript_text="fixture",
+            transcript_type="auto",
+            download_reason="user_request",
+            is_cc=False,
+            is_auto_synced=True,
+            track_kind="asr",
+        )
+    )
+    await session.flush()
+    segments = [
+        SegmentDB(
+            video_id=_VIDEO_ID,
+            language_code="en",
+            text=text,
+            start_time=float(i * 5),
+            duration=5.0,
+            end_time=float(i * 5 + 5),
+            sequence_number=i,
+        )
+        for i, text in enumerate(_TEXTS)
+    ]
+    session.add_all(segments)
+    await session.flush()
+    return segments
+
+
+async def _seams(session: AsyncSession) -> dict[int, SeamDB]:
+    result = await session.execute(select(SeamDB).where(SeamDB.video_id == _VIDEO_ID))
+    return {seam.segment_n_id: seam for seam in result.scalars().all()}
+
+
+class TestSeamMaintenance:
+    """The flush hook keeps one current seam row per adjacent pair."""
+
+    async def test_insert_creates_seams_matching_python_keys(
+        self, db_session: AsyncSession
+    ) -> None:
+        segments = await _seed(db_session)
+
+        seams = await _seams(db_session)
+
+        assert len(seams) == len(segments) - 1
+        for seg_n, seg_n1 in zip(segments, segments[1:], strict=False):
+            seam = seams[seg_n.id]
+            assert seam.segment_n1_id == seg_n1.id
+            assert seam.tail_reversed == seam_tail_key(seg_n.text)
+            assert seam.head_text == seam_head_key(seg_n1.text)
+
+    async def test_correction_refreshes_both_adjacent_seams(
+        self, db_session: AsyncSession
+    ) -> None:
+        segments = await _seed(db_session)
+        target = segments[2]
+
+        target.corrected_text = "Lovelace built the Engine"
+        target.has_correction = True
+        await db_session.flush()
+        db_session.expire_all()
+
+        seams = await _seams(db_session)
+        assert seams[segments[1].id].head_text == "lovelace built the engine"
+        assert seams[target.id].tail_reversed == seam_tail_key(
+            "Lovelace built the Engine"
+        )
+
+
+class TestFindSegmentsAtSeams:
+    """Seam lookups never miss a pair the brute-force scan finds."""
+
+    async def test_matches_brute_force_reference(
+        self, db_session: AsyncSession
+    ) -> None:
+        segments = await _seed(db_session)
+        repo = TranscriptSegmentRepository()
+
+        found = await repo.find_segments_at_seams(
+            db_session, boundaries=_BOUNDARIES, video_ids=[_VIDEO_ID]
+        )
+
+        assert {s.id for s in found} == _brute_force(segments, _BOUNDARIES)
+        assert [s.sequence_number for s in found] == sorted(
+            s.sequence_number for s in found
+        )
+
+    async def test_fragments_beyond_seam_width_are_a_superset(
+        self, db_session: AsyncSession
+    ) -> None:
+        segments = await _seed(db_session)
+        repo = TranscriptSegmentRepository()
+
+        # Only the first five words are indexed, so the trailing "and more"
+        # cannot be checked here; callers re-check the effective text.
+        found = await repo.find_segments_at_seams(
+            db_session,
+            boundaries=[(None, "Babbage in eighteen thirty seven and more")],
+            video_ids=[_VIDEO_ID],
+        )
+
+        assert {s.id for s in found} == {segments[3].id, segments[4].id}
+
+    async def test_like_wildcards_in_fragments_are_literal(
+        self, db_session: AsyncSession
+    ) -> None:
+        await _seed(db_session)
+        repo = TranscriptSegmentRepository()
+
+        found = await repo.find_segments_at_seams(
+            db_session,
+            boundaries=[(None, "10_%")],
+            video_ids=[_VIDEO_ID],
+        )
+
+        assert found == []
@@ -0,0 +1,108 @@
+"""Integration tests for stored Takeout comments and live chats.
+
+``takeout peek comments|chats --store`` upserts the CSV rows into
+``takeout_messages`` and ``--stored`` answers from it. These tests check that a
+stored query returns the digest a CSV pass over the same rows builds.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from chronovista.parsers.takeout_message_parser import (
+    MessageDigest,
+    MessageFilter,
+    TakeoutMessage,
+)
+from chronovista.repositories.takeout_message_repository import (
+    TakeoutMessageRepository,
+)
+
+pytestmark = pytest.mark.asyncio
+
+_repo = TakeoutMessageRepository()
+
+
+def _messages() -> list[TakeoutMessage]:
+    texts = ["python tips", "more Python", "unrelated", "python, undated"]
+    return [
+        TakeoutMessage(
+            kind="comment",
+            message_id=f"tmsg{i}",
+            video_id=f"tmVideo{i % 2}",
+            channel_id="UCtakeoutMessages",
+            posted_at=datetime(2023, 1, i + 1, tzinfo=UTC) if i < 3 else None,
+            text=text,
+        )
+        for i, text in enumerate(texts)
+    ]
+
+
+class TestTakeoutMessages:
+    """Stored peeks agree with a pass over the CSV rows."""
+
+    @pytest.mark.parametrize("sort_order", ["recent", "oldest"])
+    async def test_stored_digest_matches_the_stream(
+        self, db_session: AsyncSession, sort_order: str
+    ) -> None:
+        messages = _messages()
+        await _repo.store_all(db_session, messages)
+        await db_session.commit()
+        message_filter = MessageFilter(text="python")
+
+        stored = await _repo.summarise(
+            db_session,
+            "comment",
+            message_filter,
+            limit=2,
+            sort_order=sort_order,  # type: ignore[arg-type]
+        )
+        streamed = MessageDigest(limit=2, sort_order=sort_order).extend(  # type: ignore[arg-type]
+            m for m in messages if message_filter.matches(m)
+        )
+
+        assert stored.rows == streamed.rows
+        assert stored.total == streamed.total == 3
+        assert stored.video_counts == streamed.video_counts
+        assert (stored.first_posted, stored.last_posted) == (
+            streamed.first_posted,
+            streamed.last_posted,
+        )
+
+    async def test_restoring_refreshes_edited_text(
+        self, db_session: AsyncSession
+    ) -> None:
+        first = _messages()[0]
+        await _repo.store(db_session, [first])
+        await _repo.store(db_session, [replace(first, text="edited")])
+        await db_session.commit()
+
+        digest = await _repo.summarise(
+            db_session, "comment", MessageFilter(), limit=None
+        )
+
+        assert [m.text for m in digest.rows] == ["edited"]
+        assert await _repo.count(db_session, "comment") == 1
+        assert await _repo.count(db_session, "live_chat") == 0
+
+    async def test_date_bounds_exclude_undated_rows(
+        self, db_session: AsyncSession
+    ) -> None:
+        await _repo.store_all(db_session, _messages())
+        await db_session.commit()
+
+        digest = await _repo.summarise(
+            db_session,
+            "comment",
+            MessageFilter(
+                since=datetime(2023, 1, 2, tzinfo=UTC),
+                until=datetime(2023, 1, 3, tzinfo=UTC),
+            ),
+            limit=None,
+        )
+
+        assert [m.message_id for m in digest.rows] == ["tmsg1", "tmsg2"]
@@ -0,0 +1,104 @@
+"""Integration tests for rollup-backed watch counts by date.
+
+``get_watch_count_by_date_range`` sums whole hours from ``user_watch_hourly``
+and counts the partial hours at either bound from ``user_videos``. Bounds
+that are not on the hour must count exactly the watches in
+``[start_date, end_date]``, as the original per-row query did.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from chronovista.db.models import UserVideo as UserVideoDB
+from chronovista.db.models import Video as VideoDB
+from chronovista.repositories.user_video_repository import UserVideoRepository
+
+pytestmark = pytest.mark.asyncio
+
+_USER_ID = "watch_count_user"
+
+# Watches either side of each bound's minute, on the hour, and in full hours.
+_WATCHES = [
+    datetime(2025, 1, 1, 9, 10, tzinfo=UTC),  # before start, same hour
+    datetime(2025, 1, 1, 9, 30, tzinfo=UTC),  # exactly start
+    datetime(2025, 1, 1, 9, 45, tzinfo=UTC),  # partial first hour
+    datetime(2025, 1, 1, 10, 0, tzinfo=UTC),  # first full hour
+    datetime(2025, 1, 1, 23, 59, tzinfo=UTC),
+    datetime(2025, 1, 2, 3, 5, tzinfo=UTC),
+    datetime(2025, 1, 2, 17, 0, tzinfo=UTC),  # partial last hour
+    datetime(2025, 1, 2, 17, 15, tzinfo=UTC),  # exactly end
+    datetime(2025, 1, 2, 17, 40, tzinfo=UTC),  # after end, same hour
+]
+
+
+def _reference(start: datetime, end: datetime) -> dict[str, int]:
+    counts = Counter(str(w.date()) for w in _WATCHES if start <= w <= end)
+    return dict(sorted(counts.items()))
+
+
+async def _seed(session: AsyncSession) -> None:
+    await session.execute(text("SET LOCAL TIME ZONE 'UTC'"))
+    for i, watched_at in enumerate(_WATCHES):
+        video_id = f"wcount{i:05d}"
+        session.add(
+            VideoDB(
+                video_id=video_id,
+                title=f"Watch count fixture {i}",
+                description="integration fixture",
+                upload_date=datetime(2024, 6, 1, tzinfo=UTC),
+                duration=60,
+            )
+        )
+        await session.flush()
+        session.add(
+            UserVideoDB(
+                user_id=_USER_ID,
+                video_id=video_id,
+                watched_at=watched_at,
+                rewatch_count=0,
+            )
+        )
+    await session.flush()
+    # The rollups are normally refreshed at commit; the fixture never commits.
+    await UserVideoRepository().rebuild_watch_rollups(session, _USER_ID)
+
+
+class TestWatchCountByDateRange:
+    """Rollup-backed counts match a per-watch reference."""
+
+    @pytest.mark.parametrize(
+        ("start", "end"),
+        [
+            # Neither bound on the hour.
+            (
+                datetime(2025, 1, 1, 9, 30, tzinfo=UTC),
+                datetime(2025, 1, 2, 17, 15, tzinfo=UTC),
+            ),
+            # Both bounds inside one hour.
+            (
+                datetime(2025, 1, 1, 9, 20, tzinfo=UTC),
+                datetime(2025, 1, 1, 9, 50, tzinfo=UTC),
+            ),
+            # Both bounds on the hour.
+            (
+                datetime(2025, 1, 1, 10, 0, tzinfo=UTC),
+                datetime(2025, 1, 2, 17, 0, tzinfo=UTC),
+            ),
+        ],
+    )
+    async def test_counts_only_watches_inside_the_bounds(
+        self, db_session: AsyncSession, start: datetime, end: datetime
+    ) -> None:
+        await _seed(db_session)
+
+        counts = await UserVideoRepository().get_watch_count_by_date_range(
+            db_session, _USER_ID, start, end
+        )
+
+        assert counts == _reference(start, end)
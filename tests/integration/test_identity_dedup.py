@@ -8,9 +8,9 @@ mutation-impact re-query.
 
 from __future__ import annotations
 
-import json
+import csv
+import gzip
 from datetime import UTC, datetime
-from pathlib import Path
 
 import pytest
 from sqlalchemy import func, select
@@ -22,7 +22,8 @@ from chronovista.db.models import (
     UserVideo,
     Video,
 )
-from chronovista.models.app_identity import IdentityInvariants
+from chronovista.models.app_identity import IdentityInvariants, MergeStats
+from chronovista.repositories.user_video_repository import UserVideoRepository
 from chronovista.services.identity_service import (
     IdentityService,
     LanguagePrefRekeyError,
@@ -193,7 +194,9 @@ async def test_repair_is_lossless_idempotent_and_preserves_watched_set(
     # so T2 exists nowhere else afterwards. A placeholder-only pre-image would
     # silently lose it.
     assert report.pre_image_path is not None
-    dumped = json.loads(Path(report.pre_image_path).read_text(encoding="utf-8"))
+    assert report.pre_image_path.endswith(".committed.csv.gz")
+    with gzip.open(report.pre_image_path, "rt", encoding="utf-8", newline="") as fh:
+        dumped = list(csv.DictReader(fh))
     by_key = {(r["user_id"], r["video_id"]): r for r in dumped}
 
     # Placeholder side: overlapping (a, b) and non-overlapping (d).
@@ -209,9 +212,10 @@ async def test_repair_is_lossless_idempotent_and_preserves_watched_set(
     ) not in by_key, "survivor-only rows are untouched by the merge; don't dump them"
 
     # The overwritten value is recoverable from the file.
-    assert by_key[(CHANNEL, "vid_bbbbbbb")]["watched_at"] == T2.isoformat()
-    assert by_key[(CHANNEL, "vid_aaaaaaa")]["rewatch_count"] == 2  # pre-GREATEST
-    assert by_key[(CHANNEL, "vid_aaaaaaa")]["saved_to_playlist"] is True
+    watched_at = by_key[(CHANNEL, "vid_bbbbbbb")]["watched_at"]
+    assert datetime.fromisoformat(watched_at) == T2
+    assert by_key[(CHANNEL, "vid_aaaaaaa")]["rewatch_count"] == "2"  # pre-GREATEST
+    assert by_key[(CHANNEL, "vid_aaaaaaa")]["saved_to_playlist"] == "t"
 
     # Idempotent: re-running is a no-op.
     report2 = await service.repair(db_session, dry_run=False)
@@ -235,7 +239,7 @@ async def test_dry_run_writes_nothing(
     # Rolled back — both identities still present, no pre-image file.
     assert sorted(await _distinct_user_ids(db_session)) == before
     assert report.pre_image_path is None
-    assert not list(tmp_path.glob("backups/*.json"))
+    assert not list(tmp_path.glob("backups/*.csv.gz"))
 
 
 async def test_lang_pref_collision_aborts_and_rolls_back_everything(
@@ -282,9 +286,9 @@ async def test_lang_pref_collision_aborts_and_rolls_back_everything(
 
     # The pre-image left on disk is clearly marked provisional — no committed
     # repair happened, so an operator can't mistake it for a completed run.
-    leftover = list((tmp_path / "backups").glob("*.json"))
+    leftover = list((tmp_path / "backups").glob("*.csv.gz"))
     assert leftover, "a provisional pre-image should have been written pre-merge"
-    assert all(f.name.endswith(".provisional.json") for f in leftover)
+    assert all(f.name.endswith(".provisional.csv.gz") for f in leftover)
 
 
 async def test_freshly_adopted_identity_survives_commit(
@@ -349,3 +353,32 @@ async def test_freshly_adopted_identity_survives_commit(
             assert row.source == "channel"
     finally:
         await engine.dispose()
+
+
+async def test_merge_one_row_per_chunk_is_still_lossless(
+    db_session: AsyncSession,
+) -> None:
+    """Chunk boundaries must not drop or double a row (every key range covered)."""
+    await _seed(db_session)
+    progress: list[int] = []
+
+    stats = await UserVideoRepository().merge_user_identity(
+        db_session,
+        from_user_id=PLACEHOLDER,
+        to_user_id=CHANNEL,
+        chunk_size=1,
+        progress_callback=progress.append,
+    )
+
+    assert stats == MergeStats(merged=2, deleted=2, rekeyed=1)
+    assert progress == [1, 1, 1]
+    assert await _distinct_user_ids(db_session) == [CHANNEL]
+    assert await _watched_video_ids(db_session) == {
+        "vid_aaaaaaa",
+        "vid_bbbbbbb",
+        "vid_ccccccc",
+        "vid_ddddddd",
+    }
+    b_row = await db_session.get(UserVideo, (CHANNEL, "vid_bbbbbbb"))
+    assert b_row is not None and b_row.watched_at == T2_NEWER
+    await db_session.rollback()
@@ -0,0 +1,233 @@
+"""
+Statement counts for video enrichment: set-based page writes vs per video.
+
+Enriches the same 1,000 placeholder videos twice -- once with
+``ENRICHMENT_SET_BASED_WRITES`` on, once off -- against the integration
+database with the YouTube API stubbed out, and counts the statements that
+reach the driver via a ``before_cursor_execute`` listener. The per-video path
+costs roughly ten statements per video; the set-based path a fixed handful
+per 50-video page.
+
+Run with: pytest tests/performance/test_enrichment_statement_count.py -v -s -m performance
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import delete, event, func, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from chronovista.db.models import Channel as ChannelDB
+from chronovista.db.models import Video as VideoDB
+from chronovista.db.models import VideoCategory as VideoCategoryDB
+from chronovista.db.models import VideoTag as VideoTagDB
+from chronovista.repositories.channel_repository import ChannelRepository
+from chronovista.repositories.topic_category_repository import (
+    TopicCategoryRepository,
+)
+from chronovista.repositories.video_category_repository import (
+    VideoCategoryRepository,
+)
+from chronovista.repositories.video_repository import VideoRepository
+from chronovista.repositories.video_tag_repository import VideoTagRepository
+from chronovista.repositories.video_topic_repository import VideoTopicRepository
+from chronovista.services.enrichment.enrichment_service import EnrichmentService
+from tests.unit.services.enrichment.conftest import make_video_response
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.performance]
+
+_VIDEO_COUNT = 1000
+_PREFIX = "enrStmt"
+_CHANNEL_ID = "UCenrStmtPerf0000000000a"
+
+
+def _video_id(i: int) -> str:
+    return f"{_PREFIX}{i:04d}"
+
+
+@pytest.fixture
+async def placeholder_videos(
+    integration_session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[list[str], None]:
+    """Seed 1,000 placeholder videos and the category they will be given."""
+    ids = [_video_id(i) for i in range(_VIDEO_COUNT)]
+    async with integration_session_factory() as session:
+        await _cleanup(session)
+        if await session.get(VideoCategoryDB, "10") is None:
+            session.add(VideoCategoryDB(category_id="10", name="Music"))
+        session.add_all(
+            VideoDB(
+                video_id=video_id,
+                title=f"[Placeholder] Video {video_id}",
+                upload_date=datetime(2024, 6, 1, tzinfo=UTC),
+                duration=0,
+            )
+            for video_id in ids
+        )
+        await session.commit()
+
+    yield ids
+
+    async with integration_session_factory() as session:
+        await _cleanup(session)
+
+
+async def _cleanup(session: AsyncSession) -> None:
+    await session.execute(
+        delete(VideoTagDB).where(VideoTagDB.video_id.like(f"{_PREFIX}%"))
+    )
+    await session.execute(delete(VideoDB).where(VideoDB.video_id.like(f"{_PREFIX}%")))
+    await session.execute(delete(ChannelDB).where(ChannelDB.channel_id == _CHANNEL_ID))
+    await session.commit()
+
+
+async def _reset(session: AsyncSession) -> None:
+    """Put the seeded videos back into the placeholder state."""
+    await session.execute(
+        delete(VideoTagDB).where(VideoTagDB.video_id.like(f"{_PREFIX}%"))
+    )
+    await session.execute(
+        update(VideoDB)
+        .where(VideoDB.video_id.like(f"{_PREFIX}%"))
+        .values(title=func.concat("[Placeholder] Video ", VideoDB.video_id))
+    )
+    await session.execute(delete(ChannelDB).where(ChannelDB.channel_id == _CHANNEL_ID))
+    await session.commit()
+
+
+def _service(video_ids: list[str]) -> EnrichmentService:
+    youtube = AsyncMock()
+    youtube.fetch_videos_batched = AsyncMock(
+        return_value=(
+            [
+                make_video_response(
+                    video_id,
+                    title=f"Enriched {video_id}",
+                    channel_id=_CHANNEL_ID,
+                    channel_title="Statement Count Channel",
+                    tags=[f"tag{j}" for j in range(5)],
+                )
+                for video_id in video_ids
+            ],
+            set(),
+        )
+    )
+    return EnrichmentService(
+        video_repository=VideoRepository(),
+        channel_repository=ChannelRepository(),
+        video_tag_repository=VideoTagRepository(),
+        video_topic_repository=VideoTopicRepository(),
+        video_category_repository=VideoCategoryRepository(),
+        topic_category_repository=TopicCategoryRepository(),
+        youtube_service=youtube,
+    )
+
+
+async def _enrich_counting(
+    engine: AsyncEngine,
+    session_factory: async_sessionmaker[AsyncSession],
+    video_ids: list[str],
+    set_based: bool,
+) -> tuple[int, float, Any]:
+    """Run one enrichment pass; return (statements, seconds, report)."""
+    async with session_factory() as session:
+        await _reset(session)
+
+    count = 0
+
+    def listener(*args: Any) -> None:
+        nonlocal count
+        count += 1
+
+    service = _service(video_ids)
+    targets = [
+        MagicMock(video_id=v, title="[Placeholder]", channel_id=None) for v in video_ids
+    ]
+    event.listen(engine.sync_engine, "before_cursor_execute", listener)
+    try:
+        with (
+            patch(
+                "chronovista.config.settings.settings.enrichment_set_based_writes",
+                set_based,
+            ),
+            patch.object(
+                service,
+                "_get_videos_for_enrichment",
+                AsyncMock(return_value=targets),
+            ),
+        ):
+            async with session_factory() as session:
+                started = time.perf_counter()
+                report = await service.enrich_videos(
+                    session, check_prerequisites=False, skip_normalize=True
+                )
+                elapsed = time.perf_counter() - started
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", listener)
+    return count, elapsed, report
+
+
+class TestEnrichmentStatementCount:
+    """Set-based page writes issue far fewer statements than per-video writes."""
+
+    async def test_statements_per_thousand_videos(
+        self,
+        integration_db_engine: AsyncEngine,
+        integration_session_factory: async_sessionmaker[AsyncSession],
+        placeholder_videos: list[str],
+    ) -> None:
+        per_video, per_video_s, per_video_report = await _enrich_counting(
+            integration_db_engine,
+            integration_session_factory,
+            placeholder_videos,
+            set_based=False,
+        )
+        set_based, set_based_s, set_based_report = await _enrich_counting(
+            integration_db_engine,
+            integration_session_factory,
+            placeholder_videos,
+            set_based=True,
+        )
+
+        print(
+            f"\nenrich {_VIDEO_COUNT} videos: per-video {per_video} statements "
+            f"/ {per_video_s:.2f}s, set-based {set_based} statements "
+            f"/ {set_based_s:.2f}s"
+        )
+
+        # Same outcome either way.
+        for report in (per_video_report, set_based_report):
+            assert report.summary.videos_updated == _VIDEO_COUNT
+            assert report.summary.tags_created == _VIDEO_COUNT * 5
+            assert report.summary.categories_assigned == _VIDEO_COUNT
+            assert report.summary.errors == 0
+        async with integration_session_factory() as session:
+            tag_rows = await session.scalar(
+                select(func.count())
+                .select_from(VideoTagDB)
+                .where(VideoTagDB.video_id.like(f"{_PREFIX}%"))
+            )
+            enriched = await session.scalar(
+                select(func.count())
+                .select_from(VideoDB)
+                .where(
+                    VideoDB.video_id.like(f"{_PREFIX}%"),
+                    VideoDB.title.like("Enriched %"),
+                    VideoDB.channel_id == _CHANNEL_ID,
+                )
+            )
+        assert tag_rows == _VIDEO_COUNT * 5
+        assert enriched == _VIDEO_COUNT
+
+        # 20 pages x ~8 statements plus commits, vs ~10 per video.
+        assert set_based <= 20 * 12
+        assert set_based * 10 < per_video
@@ -247,11 +247,12 @@ class TestCooccurrencePanelLatency:
     async def test_raising_the_limit_does_not_change_the_cost_class(
         self, async_client: AsyncClient, perf_seed: dict[str, Any]
     ) -> None:
-        """The bound caps the RESULT, not the work.
+        """The bound caps the RESULT, and the work with it.
 
-        Grouping and counting scans the same rows either way, so a much larger
-        limit should not multiply the time. If it does, the bound is being
-        applied after materialising something it should not have.
+        Partners are read from the stored co-occurrence counts as an index
+        range, so a much larger limit reads a few more entries and should not
+        multiply the time. If it does, the panel is counting shared videos
+        per request again.
         """
         hub = perf_seed["entity_ids"][0]
 
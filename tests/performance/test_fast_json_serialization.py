@@ -0,0 +1,297 @@
+"""
+Micro-benchmarks for the fast JSON response path (``API_FAST_JSON``).
+
+For each hot list endpoint, a full page of synthetic rows is rendered two
+ways and compared on median latency and peak allocation:
+
+- **model path** (the default): build the response models, then do what
+  FastAPI does with ``response_model`` -- ``serialize_response`` (dump,
+  re-validate, encode) followed by ``JSONResponse`` rendering;
+- **fast path**: shape plain dicts and render a ``FastJSONResponse``.
+
+No database is needed: the inputs are the shapes the routers receive from
+SQLAlchemy (timeline segments, loaded ``Video`` rows, repository dicts), so
+the numbers isolate serialization cost.
+
+Run with: pytest tests/performance/test_fast_json_serialization.py -v -s -m performance
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from chronovista.api.fast_json import ORJSON_AVAILABLE, FastJSONResponse, fast_page
+from chronovista.api.routers.videos import _video_list_row
+from chronovista.api.schemas.entity_mentions import (
+    EntityVideoResponse,
+    EntityVideoResult,
+    MentionPreview,
+)
+from chronovista.api.schemas.responses import PaginationMeta
+from chronovista.api.schemas.transcripts import SegmentListResponse, TranscriptSegment
+from chronovista.api.schemas.videos import VideoListItem, VideoListResponse
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.performance]
+
+ROUNDS = 50
+T0 = datetime(2024, 6, 1, tzinfo=UTC)
+
+
+@dataclass
+class PathTiming:
+    """Median latency and peak allocation of one rendering path."""
+
+    p50_ms: float
+    peak_kib: float
+    body: bytes
+
+
+async def _measure(render: Callable[[], Any]) -> PathTiming:
+    body = await render()
+    for _ in range(5):  # warm caches and pydantic-core validators
+        await render()
+    samples = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        await render()
+        samples.append((time.perf_counter() - started) * 1000)
+    tracemalloc.start()
+    await render()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return PathTiming(statistics.median(samples), peak / 1024, body)
+
+
+async def _fastapi_render(response_type: type[Any], model: Any) -> bytes:
+    """Render *model* the way FastAPI does for ``response_model=response_type``."""
+    field = create_response_field(name="Response", type_=response_type)
+    content = await serialize_response(field=field, response_content=model)
+    return bytes(JSONResponse(content).body)
+
+
+def _report(name: str, model: PathTiming, fast: PathTiming) -> None:
+    print(
+        f"\n{name}: model p50 {model.p50_ms:.2f}ms / {model.peak_kib:.0f}KiB, "
+        f"fast p50 {fast.p50_ms:.2f}ms / {fast.peak_kib:.0f}KiB "
+        f"({model.p50_ms / fast.p50_ms:.1f}x, orjson={ORJSON_AVAILABLE})"
+    )
+
+
+def _pagination(total: int, limit: int) -> PaginationMeta:
+    return PaginationMeta(total=total, limit=limit, offset=0, has_more=limit < total)
+
+
+class TestFastJsonSerialization:
+    """Fast path vs model path for a full page of each hot endpoint."""
+
+    async def test_transcript_segments_page(self) -> None:
+        """GET /videos/{id}/transcript/segments at limit=200."""
+        segments = [
+            SimpleNamespace(
+                id=i,
+                text=f"segment {i} says something moderately long about music",
+                start_time=i * 2.5,
+                end_time=i * 2.5 + 2.5,
+                duration=2.5,
+                has_correction=i % 10 == 0,
+                corrected_at=T0 + timedelta(minutes=i) if i % 10 == 0 else None,
+                correction_count=1 if i % 10 == 0 else 0,
+            )
+            for i in range(200)
+        ]
+
+        async def model_path() -> bytes:
+            items = [
+                TranscriptSegment(
+                    id=s.id,
+                    text=s.text,
+                    start_time=s.start_time,
+                    end_time=s.end_time,
+                    duration=s.duration,
+                    has_correction=s.has_correction,
+                    corrected_at=s.corrected_at,
+                    correction_count=s.correction_count,
+                )
+                for s in segments
+            ]
+            model = SegmentListResponse(data=items, pagination=_pagination(900, 200))
+            return await _fastapi_render(SegmentListResponse, model)
+
+        async def fast_path() -> bytes:
+            rows = [
+                {
+                    "id": s.id,
+                    "text": s.text,
+                    "start_time": s.start_time,
+                    "end_time": s.end_time,
+                    "duration": s.duration,
+                    "has_correction": s.has_correction,
+                    "corrected_at": s.corrected_at,
+                    "correction_count": s.correction_count,
+                }
+                for s in segments
+            ]
+            page = fast_page(rows, total=900, limit=200, offset=0)
+            return bytes(FastJSONResponse(page).body)
+
+        model, fast = await _measure(model_path), await _measure(fast_path)
+        _report("segments x200", model, fast)
+
+        assert fast.body == model.body
+        assert fast.p50_ms < model.p50_ms
+
+    async def test_video_list_page(self) -> None:
+        """GET /videos at limit=100 with tags, topics and transcript summaries."""
+        parent = SimpleNamespace(
+            topic_id="/m/04rlf", category_name="Music", parent_topic_id=None
+        )
+        child = SimpleNamespace(
+            topic_id="/m/064t9", category_name="Pop music", parent_topic_id="/m/04rlf"
+        )
+        topic_cache: Any = {parent.topic_id: parent, child.topic_id: child}
+        videos = [
+            SimpleNamespace(
+                video_id=f"vid{i:08d}",
+                title=f"Video number {i}",
+                channel_id="UCuAXFkgsw1L7xaCfnd5JJOw",
+                channel=SimpleNamespace(title="Some Channel"),
+                upload_date=T0 - timedelta(days=i),
+                duration=180 + i,
+                view_count=1000 * i,
+                transcripts=[
+                    SimpleNamespace(
+                        language_code="en", is_cc=True, transcript_type="MANUAL"
+                    ),
+                    SimpleNamespace(
+                        language_code="es", is_cc=False, transcript_type="AUTO"
+                    ),
+                ],
+                tags=[SimpleNamespace(tag=f"tag{j}") for j in range(8)],
+                category_id="10",
+                category=SimpleNamespace(name="Music"),
+                video_topics=[
+                    SimpleNamespace(topic_id="/m/064t9", topic_category=child),
+                    SimpleNamespace(topic_id="/m/04rlf", topic_category=parent),
+                ],
+                availability_status="available",
+            )
+            for i in range(100)
+        ]
+
+        def rows() -> list[dict[str, Any]]:
+            return [
+                _video_list_row(
+                    video,  # type: ignore[arg-type]
+                    has_corrections=False,
+                    topic_cache=topic_cache,
+                    entity_filter_active=False,
+                    required_entity_ids=[],
+                    raw_matches=[],
+                )
+                for video in videos
+            ]
+
+        async def model_path() -> bytes:
+            items = [VideoListItem.model_validate(row) for row in rows()]
+            model = VideoListResponse(data=items, pagination=_pagination(5000, 100))
+            return await _fastapi_render(VideoListResponse, model)
+
+        async def fast_path() -> bytes:
+            page = fast_page(rows(), total=5000, limit=100, offset=0)
+            return bytes(FastJSONResponse(page).body)
+
+        model, fast = await _measure(model_path), await _measure(fast_path)
+        _report("videos x100", model, fast)
+
+        assert fast.body == model.body
+        assert fast.p50_ms < model.p50_ms
+
+    async def test_entity_video_list_page(self) -> None:
+        """GET /entities/{id}/videos at limit=100 with mention previews."""
+        results = [
+            {
+                "video_id": f"vid{i:08d}",
+                "video_title": f"Video number {i}",
+                "channel_name": "Some Channel",
+                "mention_count": 12,
+                "mentions": [
+                    {
+                        "segment_id": i * 100 + j,
+                        "start_time": j * 30.0,
+                        "mention_text": "Entity",
+                    }
+                    for j in range(5)
+                ],
+                "sources": ["transcript", "title"],
+                "has_manual": False,
+                "first_mention_time": 0.0,
+                "upload_date": (T0 - timedelta(days=i)).isoformat(),
+                "description_context": None,
+                "entity_id": uuid.uuid4(),
+            }
+            for i in range(100)
+        ]
+
+        async def model_path() -> bytes:
+            data = [
+                EntityVideoResult(
+                    video_id=r["video_id"],
+                    video_title=r["video_title"],
+                    channel_name=r["channel_name"],
+                    mention_count=r["mention_count"],
+                    mentions=[MentionPreview(**m) for m in r["mentions"]],
+                    sources=r["sources"],
+                    has_manual=r["has_manual"],
+                    first_mention_time=r["first_mention_time"],
+                    upload_date=r["upload_date"],
+                    description_context=r.get("description_context"),
+                )
+                for r in results
+            ]
+            model = EntityVideoResponse(data=data, pagination=_pagination(800, 100))
+            return await _fastapi_render(EntityVideoResponse, model)
+
+        async def fast_path() -> bytes:
+            rows = [
+                {
+                    "video_id": r["video_id"],
+                    "video_title": r["video_title"],
+                    "channel_name": r["channel_name"],
+                    "mention_count": r["mention_count"],
+                    "mentions": [
+                        {
+                            "segment_id": m["segment_id"],
+                            "start_time": m["start_time"],
+                            "mention_text": m["mention_text"],
+                        }
+                        for m in r["mentions"]
+                    ],
+                    "sources": r["sources"],
+                    "has_manual": r["has_manual"],
+                    "first_mention_time": r["first_mention_time"],
+                    "upload_date": r["upload_date"],
+                    "description_context": r.get("description_context"),
+                }
+                for r in results
+            ]
+            page = fast_page(rows, total=800, limit=100, offset=0)
+            return bytes(FastJSONResponse(page).body)
+
+        model, fast = await _measure(model_path), await _measure(fast_path)
+        _report("entity videos x100", model, fast)
+
+        assert fast.body == model.body
+        assert fast.p50_ms < model.p50_ms
@@ -0,0 +1,261 @@
+"""
+EXPLAIN-based checks that transcript language filters stay index-friendly.
+
+Language codes are canonicalized at write time, so the segment, context and
+search read paths compare ``transcript_segments.language_code`` directly. The
+regression this file guards against is someone reintroducing
+``lower(language_code) = lower(:code)``: results stay identical, and on a small
+fixture the timing barely moves, but the planner can no longer use
+``language_code`` as an index condition on the
+``(video_id, language_code, start_time[, end_time])`` composite indexes.
+
+Statements are captured from the real endpoint / repository call via a
+``before_cursor_execute`` listener and re-run under ``EXPLAIN (FORMAT JSON)``
+with sequential scans disabled, so the plan shows which predicates the index
+can absorb rather than what is cheapest on a few hundred rows.
+
+Run with: pytest tests/performance/ -v -m performance
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncGenerator, Iterator
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete, event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from chronovista.db.models import TranscriptSegment as SegmentDB
+from chronovista.db.models import Video as VideoDB
+from chronovista.db.models import VideoTranscript as TranscriptDB
+from chronovista.models.youtube_types import VideoId
+from chronovista.repositories.transcript_segment_repository import (
+    TranscriptSegmentRepository,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.performance]
+
+_VIDEO_ID = "lcidxPerf01"
+_LANGUAGE = "en-US"
+_SEGMENT_COUNT = 400
+
+
+@pytest.fixture
+async def language_seed(
+    integration_session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[None, None]:
+    """Seed one transcript with enough segments for a meaningful plan."""
+    async with integration_session_factory() as session:
+        await _cleanup(session)
+        session.add(
+            VideoDB(
+                video_id=_VIDEO_ID,
+                title="Language index perf fixture",
+                description="performance fixture",
+                upload_date=datetime(2024, 6, 1, tzinfo=UTC),
+                duration=_SEGMENT_COUNT * 2,
+            )
+        )
+        session.add(
+            TranscriptDB(
+                video_id=_VIDEO_ID,
+                language_code=_LANGUAGE,
+                transcript_text="fixture",
+                transcript_type="auto",
+                download_reason="user_request",
+                is_cc=False,
+                is_auto_synced=True,
+                track_kind="standard",
+            )
+        )
+        await session.flush()
+        session.add_all(
+            SegmentDB(
+                video_id=_VIDEO_ID,
+                language_code=_LANGUAGE,
+                text=f"fixture phrase number {i}",
+                start_time=i * 2.0,
+                duration=2.0,
+                end_time=i * 2.0 + 2.0,
+                sequence_number=i,
+            )
+            for i in range(_SEGMENT_COUNT)
+        )
+        await session.commit()
+
+    yield
+
+    async with integration_session_factory() as session:
+        await _cleanup(session)
+
+
+async def _cleanup(session: AsyncSession) -> None:
+    """Remove this module's rows."""
+    await session.execute(delete(SegmentDB).where(SegmentDB.video_id == _VIDEO_ID))
+    await session.execute(
+        delete(TranscriptDB).where(TranscriptDB.video_id == _VIDEO_ID)
+    )
+    await session.execute(delete(VideoDB).where(VideoDB.video_id == _VIDEO_ID))
+    await session.commit()
+
+
+class _StatementCapture:
+    """Collect driver-level statements that filter segments by language."""
+
+    def __init__(self) -> None:
+        self.statements: list[tuple[str, Any]] = []
+
+    def __call__(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        lowered = statement.lower()
+        if (
+            statement.lstrip().upper().startswith("SELECT")
+            and "transcript_segments" in lowered
+            and "transcript_segments.language_code" in lowered
+        ):
+            self.statements.append((statement, parameters))
+
+
+@pytest.fixture
+def capture(integration_db_engine: AsyncEngine) -> Iterator[_StatementCapture]:
+    """Listen to every statement issued through the integration engine."""
+    listener = _StatementCapture()
+    event.listen(integration_db_engine.sync_engine, "before_cursor_execute", listener)
+    try:
+        yield listener
+    finally:
+        event.remove(
+            integration_db_engine.sync_engine, "before_cursor_execute", listener
+        )
+
+
+def _plan_nodes(node: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yield every node of an EXPLAIN (FORMAT JSON) plan tree."""
+    yield node
+    for child in node.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+async def _explain(
+    engine: AsyncEngine, statement: str, parameters: Any
+) -> list[dict[str, Any]]:
+    """EXPLAIN a captured statement with sequential scans disabled."""
+    async with engine.connect() as conn:
+        async with conn.begin():
+            await conn.execute(text("SET LOCAL enable_seqscan = off"))
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {statement}", parameters
+            )
+            raw = result.scalar_one()
+    plan = json.loads(raw) if isinstance(raw, str) else raw
+    return list(_plan_nodes(plan[0]["Plan"]))
+
+
+def _assert_no_lower_on_language(nodes: list[dict[str, Any]]) -> None:
+    """No plan predicate may wrap ``language_code`` in ``lower()``."""
+    for node in nodes:
+        for key in ("Index Cond", "Filter", "Recheck Cond"):
+            predicate = node.get(key, "")
+            assert "lower((language_code" not in predicate.replace(" ", ""), (
+                f"{node['Node Type']} evaluates lower(language_code) in {key}: "
+                f"{predicate}"
+            )
+
+
+def _assert_language_in_index_cond(nodes: list[dict[str, Any]]) -> None:
+    """``language_code`` must be absorbed by a transcript_segments index."""
+    segment_index_conds = [
+        node.get("Index Cond", "")
+        for node in nodes
+        if node.get("Relation Name") == "transcript_segments"
+        and str(node.get("Index Name", "")).startswith("idx_transcript_segments")
+    ]
+    assert any("language_code" in cond for cond in segment_index_conds), (
+        "language_code is not an index condition on any "
+        f"idx_transcript_segments_* scan: {segment_index_conds}"
+    )
+
+
+class TestLanguageFilterIndexUse:
+    """Segment, context and search language predicates hit the indexes."""
+
+    async def test_segments_endpoint(
+        self,
+        async_client: AsyncClient,
+        integration_db_engine: AsyncEngine,
+        language_seed: None,
+        capture: _StatementCapture,
+    ) -> None:
+        """A differently-cased ``language`` still drives the composite index."""
+        response = await async_client.get(
+            f"/api/v1/videos/{_VIDEO_ID}/transcript/segments"
+            "?language=EN-us&start_time=100&limit=50"
+        )
+        assert response.status_code == 200
+        assert response.json()["data"], "canonicalized lookup must match rows"
+
+        assert capture.statements
+        for statement, parameters in capture.statements:
+            nodes = await _explain(integration_db_engine, statement, parameters)
+            _assert_no_lower_on_language(nodes)
+            _assert_language_in_index_cond(nodes)
+
+    async def test_context_window(
+        self,
+        integration_session_factory: async_sessionmaker[AsyncSession],
+        integration_db_engine: AsyncEngine,
+        language_seed: None,
+        capture: _StatementCapture,
+    ) -> None:
+        """The CLI context window lookup is an index range scan."""
+        repo = TranscriptSegmentRepository()
+        async with integration_session_factory() as session:
+            segments = await repo.get_context_window(
+                session, VideoId(_VIDEO_ID), "en-us", 300.0, 10.0
+            )
+        assert segments
+
+        assert capture.statements
+        for statement, parameters in capture.statements:
+            nodes = await _explain(integration_db_engine, statement, parameters)
+            _assert_no_lower_on_language(nodes)
+            _assert_language_in_index_cond(nodes)
+
+    async def test_search_endpoint(
+        self,
+        async_client: AsyncClient,
+        integration_db_engine: AsyncEngine,
+        language_seed: None,
+        capture: _StatementCapture,
+    ) -> None:
+        """The search language filter never re-evaluates lower() per row.
+
+        Search is driven by the trigram index on ``text``, so ``language_code``
+        need not be an index condition here -- but it must stay a plain
+        column comparison the planner can push into a composite index when a
+        ``video_id`` is supplied.
+        """
+        response = await async_client.get(
+            "/api/v1/search/segments"
+            f"?q=fixture+phrase&language=EN-US&video_id={_VIDEO_ID}"
+        )
+        assert response.status_code == 200
+
+        assert capture.statements
+        for statement, parameters in capture.statements:
+            nodes = await _explain(integration_db_engine, statement, parameters)
+            _assert_no_lower_on_language(nodes)
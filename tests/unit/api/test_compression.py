@@ -0,0 +1,114 @@
+"""Tests for negotiated response compression."""
+
+from __future__ import annotations
+
+import gzip
+from collections.abc import AsyncGenerator
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from starlette.responses import JSONResponse, Response, StreamingResponse
+
+from chronovista.api.middleware.compression import (
+    CompressionMiddleware,
+    choose_encoding,
+    parse_accept_encoding,
+)
+
+BIG = {"data": [{"text": "the same words again and again"} for _ in range(200)]}
+
+
+@pytest.fixture
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/big")
+    def big() -> JSONResponse:
+        return JSONResponse(BIG, headers={"ETag": '"abc"'})
+
+    @app.get("/small")
+    def small() -> dict[str, int]:
+        return {"n": 1}
+
+    @app.get("/png")
+    def png() -> Response:
+        return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+    @app.get("/stream")
+    def stream() -> StreamingResponse:
+        return StreamingResponse(
+            iter([b"x" * 1000, b"y" * 1000]), media_type="text/plain"
+        )
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+async def _get(
+    client: AsyncClient, path: str, accept: str = "gzip"
+) -> tuple[httpx.Response, bytes]:
+    """The response and its body as sent (httpx would decode it otherwise)."""
+    async with client.stream("GET", path, headers={"Accept-Encoding": accept}) as resp:
+        raw = b"".join([chunk async for chunk in resp.aiter_raw()])
+    return resp, raw
+
+
+class TestNegotiation:
+    def test_parses_q_values(self) -> None:
+        assert parse_accept_encoding("gzip;q=0.5, br, identity;q=x") == {
+            "gzip": 0.5,
+            "br": 1.0,
+            "identity": 0.0,
+        }
+
+    @pytest.mark.parametrize(
+        ("header", "brotli_available", "expected"),
+        [
+            ("gzip, deflate, br", True, "br"),
+            ("gzip, deflate, br", False, "gzip"),
+            ("br;q=0.1, gzip", True, "gzip"),
+            ("*", False, "gzip"),
+            ("gzip;q=0", False, None),
+            (None, True, None),
+        ],
+    )
+    def test_chooses_the_best_supported_coding(
+        self, header: str | None, brotli_available: bool, expected: str | None
+    ) -> None:
+        assert choose_encoding(header, brotli_available) == expected
+
+
+@pytest.mark.asyncio
+class TestCompressionMiddleware:
+    async def test_large_json_is_gzipped(self, client: AsyncClient) -> None:
+        resp, raw = await _get(client, "/big")
+
+        assert resp.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in resp.headers["vary"]
+        assert int(resp.headers["content-length"]) == len(raw)
+        assert gzip.decompress(raw).startswith(b'{"data":[{"text"')
+
+    async def test_strong_etag_is_weakened_when_compressed(
+        self, client: AsyncClient
+    ) -> None:
+        resp, _ = await _get(client, "/big")
+
+        assert resp.headers["etag"] == 'W/"abc"'
+
+    async def test_identity_when_the_client_declines(self, client: AsyncClient) -> None:
+        resp, _ = await _get(client, "/big", accept="identity")
+
+        assert "content-encoding" not in resp.headers
+        assert resp.headers["etag"] == '"abc"'
+
+    @pytest.mark.parametrize("path", ["/small", "/png", "/stream"])
+    async def test_small_binary_and_streamed_bodies_pass_through(
+        self, client: AsyncClient, path: str
+    ) -> None:
+        resp, _ = await _get(client, path)
+
+        assert "content-encoding" not in resp.headers
@@ -0,0 +1,89 @@
+"""Tests for ETag revalidation of cached aggregate responses."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from starlette.requests import Request
+from starlette.responses import Response
+
+from chronovista.api.conditional import (
+    REVALIDATE_CACHE_CONTROL,
+    cached_json_response,
+    etag_matches,
+    not_modified,
+    weak_etag,
+)
+from chronovista.db.aggregate_cache import CachedAggregate, compute_etag
+
+PAYLOAD = {"data": {"watched_videos": 3}}
+ENTRY = CachedAggregate(
+    payload=PAYLOAD, etag=compute_etag(PAYLOAD), generation="1", computed_at=0.0
+)
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+class TestEtagMatches:
+    @pytest.mark.parametrize(
+        "header",
+        [ENTRY.etag, f"W/{ENTRY.etag}", f'"stale", {ENTRY.etag}', "*"],
+    )
+    def test_matches(self, header: str) -> None:
+        assert etag_matches(header, ENTRY.etag)
+
+    @pytest.mark.parametrize("header", [None, "", '"stale"'])
+    def test_does_not_match(self, header: str | None) -> None:
+        assert not etag_matches(header, ENTRY.etag)
+
+
+class TestCachedJsonResponse:
+    def test_first_request_gets_the_body_and_validators(self) -> None:
+        response = cached_json_response(_request(), ENTRY)
+
+        assert response.status_code == 200
+        assert json.loads(response.body) == PAYLOAD
+        assert response.headers["etag"] == ENTRY.etag
+        assert response.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+
+    def test_revalidation_with_a_current_copy_is_not_modified(self) -> None:
+        response = cached_json_response(_request(ENTRY.etag), ENTRY)
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == ENTRY.etag
+
+
+class TestWeakEtag:
+    def test_is_weak_and_stable(self) -> None:
+        etag = weak_etag("transcript", "dQw4w9WgXcQ", "en", None)
+
+        assert etag.startswith('W/"')
+        assert etag == weak_etag("transcript", "dQw4w9WgXcQ", "en", None)
+
+    def test_changes_with_any_marker(self) -> None:
+        assert weak_etag("t", None) != weak_etag("t", 0)
+        assert weak_etag("t", "2025-01-01") != weak_etag("t", "2025-01-02")
+
+
+class TestNotModified:
+    def test_sets_validators_when_the_body_must_be_built(self) -> None:
+        response = Response()
+        etag = weak_etag("x")
+
+        assert not_modified(_request('"other"'), response, etag) is None
+        assert response.headers["etag"] == etag
+        assert response.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+
+    def test_short_circuits_a_current_client(self) -> None:
+        etag = weak_etag("x")
+
+        # Browsers echo the tag they were given, W/ prefix included.
+        unchanged = not_modified(_request(etag), Response(), etag)
+
+        assert unchanged is not None
+        assert unchanged.status_code == 304
@@ -0,0 +1,211 @@
+"""Tests for the fast JSON path: it must emit what the model path emits."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+import chronovista.api.fast_json as fast_json_module
+from chronovista.api.fast_json import FastJSONResponse, dumps, fast_page
+from chronovista.api.routers.videos import _video_list_row
+from chronovista.api.schemas.entity_mentions import EntityVideoResponse
+from chronovista.api.schemas.transcripts import SegmentListResponse
+from chronovista.api.schemas.videos import VideoListResponse
+
+ENTITY_A = uuid.UUID("00000000-0000-0000-0000-00000000000a")
+ENTITY_B = uuid.UUID("00000000-0000-0000-0000-00000000000b")
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run each parity test with orjson and with the json.dumps fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(fast_json_module, "ORJSON_AVAILABLE", False)
+    elif not fast_json_module.ORJSON_AVAILABLE:
+        pytest.skip("orjson is not installed")
+    return str(request.param)
+
+
+def _segment_rows() -> list[dict[str, Any]]:
+    return [
+        {
+            "id": 1,
+            "text": "café au lait",
+            "start_time": 0.0,
+            "end_time": 1.25,
+            "duration": 1.25,
+            "has_correction": True,
+            "corrected_at": datetime(2025, 3, 1, 12, 0, 0, 123456, tzinfo=UTC),
+            "correction_count": 2,
+        },
+        {
+            "id": 2,
+            "text": "plain",
+            "start_time": 1.25,
+            "end_time": 3.0,
+            "duration": 1.75,
+            "has_correction": False,
+            "corrected_at": None,
+            "correction_count": 0,
+        },
+    ]
+
+
+def _video(**overrides: Any) -> SimpleNamespace:
+    parent = SimpleNamespace(
+        topic_id="/m/04rlf", category_name="Music", parent_topic_id=None
+    )
+    child = SimpleNamespace(
+        topic_id="/m/064t9", category_name="Pop music", parent_topic_id="/m/04rlf"
+    )
+    fields: dict[str, Any] = {
+        "video_id": "dQw4w9WgXcQ",
+        "title": "Never Gonna Give You Up",
+        "channel_id": "UCuAXFkgsw1L7xaCfnd5JJOw",
+        "channel": SimpleNamespace(title="Rick Astley"),
+        "upload_date": datetime(2009, 10, 25, 6, 57, 33, tzinfo=UTC),
+        "duration": 213,
+        "view_count": None,
+        "transcripts": [
+            SimpleNamespace(language_code="es", is_cc=False, transcript_type="AUTO"),
+            SimpleNamespace(language_code="en", is_cc=True, transcript_type="AUTO"),
+        ],
+        "tags": [SimpleNamespace(tag="rick"), SimpleNamespace(tag="80s")],
+        "category_id": "10",
+        "category": SimpleNamespace(name="Music"),
+        "video_topics": [
+            SimpleNamespace(topic_id=child.topic_id, topic_category=child),
+            SimpleNamespace(topic_id="/m/gone", topic_category=None),
+        ],
+        "availability_status": "available",
+        "_topics": {parent.topic_id: parent, child.topic_id: child},
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _video_row(video: SimpleNamespace, entity_filter: bool = False) -> dict[str, Any]:
+    matches = [
+        {
+            "entity_id": ENTITY_B,
+            "entity_type": "person",
+            "canonical_name": "Rick Astley",
+            "mention_count": 3,
+            "first_timestamp": None,
+        },
+        {
+            "entity_id": ENTITY_A,
+            "entity_type": "place",
+            "canonical_name": "London",
+            "mention_count": 1,
+            "first_timestamp": 12.5,
+        },
+    ]
+    return _video_list_row(
+        video,  # type: ignore[arg-type]
+        has_corrections=True,
+        topic_cache=video._topics,
+        entity_filter_active=entity_filter,
+        required_entity_ids=[ENTITY_A, ENTITY_B] if entity_filter else [],
+        raw_matches=matches if entity_filter else [],
+    )
+
+
+class TestPayloadParity:
+    def test_segment_page(self, encoder: str) -> None:
+        payload = fast_page(_segment_rows(), total=10, limit=2, offset=0)
+
+        model = SegmentListResponse.model_validate(payload)
+
+        assert dumps(payload) == model.model_dump_json().encode()
+
+    @pytest.mark.parametrize("entity_filter", [False, True])
+    def test_video_page(self, encoder: str, entity_filter: bool) -> None:
+        rows = [
+            _video_row(_video(), entity_filter),
+            _video_row(
+                _video(channel=None, category=None, tags=[], transcripts=[]),
+                entity_filter,
+            ),
+        ]
+        payload = fast_page(rows, total=2, limit=20, offset=0)
+
+        model = VideoListResponse.model_validate(payload)
+
+        assert dumps(payload) == model.model_dump_json().encode()
+
+    def test_entity_video_page(self, encoder: str) -> None:
+        rows = [
+            {
+                "video_id": "dQw4w9WgXcQ",
+                "video_title": "Never Gonna Give You Up",
+                "channel_name": "Rick Astley",
+                "mention_count": 2,
+                "mentions": [
+                    {"segment_id": 7, "start_time": 3.5, "mention_text": "Rick"}
+                ],
+                "sources": ["transcript", "title"],
+                "has_manual": False,
+                "first_mention_time": 3.5,
+                "upload_date": "2009-10-25T06:57:33+00:00",
+                "description_context": None,
+            }
+        ]
+        payload = fast_page(rows, total=41, limit=20, offset=20)
+
+        model = EntityVideoResponse.model_validate(payload)
+
+        assert dumps(payload) == model.model_dump_json().encode()
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            datetime(2025, 1, 1, tzinfo=UTC),
+            datetime(2025, 1, 1, tzinfo=timezone(timedelta(hours=-5))),
+            datetime(2025, 1, 1, 8, 30),
+        ],
+    )
+    def test_datetimes_render_like_pydantic(
+        self, encoder: str, value: datetime
+    ) -> None:
+        row = {**_segment_rows()[0], "corrected_at": value}
+        payload = fast_page([row], total=1, limit=1, offset=0)
+
+        model = SegmentListResponse.model_validate(payload)
+
+        assert dumps(payload) == model.model_dump_json().encode()
+
+
+class TestVideoListRow:
+    def test_orders_entity_matches_by_the_required_set(self) -> None:
+        row = _video_row(_video(), entity_filter=True)
+
+        assert [m["entity_id"] for m in row["entity_matches"]] == [ENTITY_A, ENTITY_B]
+        assert row["total_mentions"] == 4
+
+    def test_entity_fields_are_null_without_an_entity_filter(self) -> None:
+        row = _video_row(_video())
+
+        assert row["entity_matches"] is None
+        assert row["total_mentions"] is None
+
+    def test_topics_carry_parent_paths_and_skip_missing_categories(self) -> None:
+        row = _video_row(_video())
+
+        assert row["topics"] == [
+            {"topic_id": "/m/064t9", "name": "Pop music", "parent_path": "Music"}
+        ]
+        assert row["transcript_summary"]["languages"] == ["en", "es"]
+
+
+class TestFastJSONResponse:
+    def test_renders_compact_json(self) -> None:
+        response = FastJSONResponse({"data": [{"id": 1}]}, headers={"ETag": 'W/"x"'})
+
+        assert response.body == b'{"data":[{"id":1}]}'
+        assert response.media_type == "application/json"
+        assert response.headers["etag"] == 'W/"x"'
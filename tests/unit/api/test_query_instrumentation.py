@@ -0,0 +1,135 @@
+"""Tests for the query instrumentation middleware and metrics endpoint."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import AsyncGenerator, Iterator
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from chronovista.api.deps import require_auth
+from chronovista.api.main import app as main_app
+from chronovista.api.middleware import (
+    QueryInstrumentationMiddleware,
+    RequestIdMiddleware,
+)
+from chronovista.api.middleware.instrumentation import (
+    SERVER_TIMING_HEADER,
+    format_server_timing,
+)
+from chronovista.db.instrumentation import (
+    RequestQueryStats,
+    install_query_instrumentation,
+    query_metrics,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics() -> Iterator[None]:
+    query_metrics.reset()
+    yield
+    query_metrics.reset()
+
+
+def _build_app() -> FastAPI:
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    install_query_instrumentation(engine)
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int, repeats: int = 1) -> dict[str, int]:
+        with engine.connect() as conn:
+            for _ in range(repeats):
+                conn.execute(text("SELECT :id"), {"id": item_id})
+        return {"item_id": item_id}
+
+    app.add_middleware(QueryInstrumentationMiddleware)
+    app.add_middleware(RequestIdMiddleware)
+    return app
+
+
+@pytest.fixture
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    transport = ASGITransport(app=_build_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+class TestQueryInstrumentationMiddleware:
+    async def test_sets_server_timing_with_query_counts(
+        self, client: AsyncClient
+    ) -> None:
+        response = await client.get("/items/7", params={"repeats": 3})
+
+        header = response.headers[SERVER_TIMING_HEADER]
+        assert header.startswith("db;dur=")
+        assert 'desc="3 queries' in header
+        assert "pool;dur=" in header and "app;dur=" in header
+
+    async def test_aggregates_under_the_route_template(
+        self, client: AsyncClient
+    ) -> None:
+        await client.get("/items/1")
+        await client.get("/items/2", params={"repeats": 2})
+        await client.get("/nowhere")
+
+        routes = {r.route: r for r in query_metrics.snapshot().routes}
+
+        assert routes["GET /items/{item_id}"].requests == 2
+        assert routes["GET /items/{item_id}"].statements == 3
+        assert routes["GET <unmatched>"].statements == 0
+
+    async def test_flags_n_plus_one_with_the_request_id(
+        self, client: AsyncClient, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        with caplog.at_level(logging.WARNING):
+            response = await client.get(
+                "/items/1",
+                params={"repeats": 11},
+                headers={"X-Request-ID": "req-n1"},
+            )
+
+        assert response.status_code == 200
+        (flag,) = query_metrics.snapshot().n_plus_one
+        assert flag.max_repeats == 11
+        assert flag.last_request_id == "req-n1"
+        assert "Possible N+1" in caplog.text
+        assert "req-n1" in caplog.text
+
+    def test_app_time_excludes_db_and_pool_time(self) -> None:
+        stats = RequestQueryStats(
+            statements=2, rows=5, db_seconds=0.030, pool_wait_seconds=0.005
+        )
+
+        assert format_server_timing(stats, 0.050) == (
+            'db;dur=30.0;desc="2 queries, 5 rows", pool;dur=5.0, app;dur=15.0'
+        )
+
+
+class TestMetricsEndpoint:
+    async def test_reports_registry_and_heavy_query_counters(self) -> None:
+        async def mock_require_auth() -> None:
+            return None
+
+        main_app.dependency_overrides[require_auth] = mock_require_auth
+        query_metrics.record_statement("SELECT 1", 0.002, 1, attributed=False)
+        try:
+            transport = ASGITransport(app=main_app)
+            async with AsyncClient(transport=transport, base_url="http://test") as c:
+                response = await c.get("/api/v1/metrics")
+        finally:
+            main_app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["instrumentation_enabled"] is False
+        assert data["n_plus_one_threshold"] == 10
+        assert data["queries"]["statements"][0]["statement"] == "SELECT 1"
+        assert data["queries"]["unattributed_statements"] == 1
+        assert "pool_checkout_wait" in data["queries"]
+        assert isinstance(data["heavy_queries"], dict)
+        assert isinstance(data["pools"], list)
@@ -15,12 +15,15 @@ from collections import defaultdict
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from chronovista.api.query_protection import (
     QUERY_TIMEOUT_SECONDS,
     RATE_LIMIT_WINDOW_SECONDS,
     check_rate_limit,
     get_client_id,
+    heavy_query_metrics,
     run_with_timeout,
 )
 from chronovista.exceptions import QueryTimeoutError
@@ -147,6 +150,142 @@ class TestRunWithTimeout:
         assert await run_with_timeout(work(), operation="test") == 8
 
 
+def _postgres_session(backend_pid: int = 4242) -> MagicMock:
+    """A session that reports a Postgres bind and a cancellable engine."""
+    session = MagicMock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    budget_result = MagicMock()
+    budget_result.one.return_value = ("8000ms", backend_pid)
+    session.execute = AsyncMock(return_value=budget_result)
+    session.rollback = AsyncMock()
+
+    cancel_result = MagicMock()
+    cancel_result.scalar.return_value = True
+    conn = MagicMock()
+    conn.execute = AsyncMock(return_value=cancel_result)
+    engine = MagicMock(spec=AsyncEngine)
+    engine.connect.return_value.__aenter__ = AsyncMock(return_value=conn)
+    engine.connect.return_value.__aexit__ = AsyncMock(return_value=False)
+    session.bind = engine
+    session.cancel_conn = conn
+    return session
+
+
+class _Canceled(Exception):
+    sqlstate = "57014"
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics() -> None:
+    heavy_query_metrics.reset()
+
+
+@pytest.mark.asyncio
+class TestServerSideCancellation:
+    """The ceiling stops the SQL too, not just the Python wait."""
+
+    async def test_transaction_budget_matches_the_ceiling(self) -> None:
+        session = _postgres_session()
+
+        async def work() -> str:
+            return "ok"
+
+        assert (
+            await run_with_timeout(
+                work(), operation="x", session=session, timeout_seconds=3
+            )
+            == "ok"
+        )
+
+        statement, params = session.execute.await_args.args
+        assert "set_config('statement_timeout'" in str(statement)
+        assert "pg_backend_pid()" in str(statement)
+        assert params == {"budget": "3000ms"}
+        session.cancel_conn.execute.assert_not_awaited()
+
+    async def test_timeout_cancels_the_backend_then_rolls_back(self) -> None:
+        session = _postgres_session(backend_pid=777)
+        # The cancel must land before the rollback: the rollback waits on the
+        # very connection that is still busy with the runaway query.
+        order = MagicMock()
+        order.attach_mock(session.cancel_conn.execute, "cancel")
+        order.attach_mock(session.rollback, "rollback")
+
+        async def slow() -> None:
+            await asyncio.sleep(10)
+
+        with pytest.raises(QueryTimeoutError):
+            await run_with_timeout(
+                slow(), operation="x", session=session, timeout_seconds=0.01  # type: ignore[arg-type]
+            )
+
+        statement, params = session.cancel_conn.execute.await_args.args
+        assert "pg_cancel_backend" in str(statement)
+        assert params == {"pid": 777}
+        assert [c[0] for c in order.mock_calls] == ["cancel", "rollback"]
+
+    async def test_a_failed_cancel_still_raises_the_timeout(self) -> None:
+        session = _postgres_session()
+        session.cancel_conn.execute.side_effect = OSError("pool exhausted")
+
+        async def slow() -> None:
+            await asyncio.sleep(10)
+
+        with pytest.raises(QueryTimeoutError):
+            await run_with_timeout(
+                slow(), operation="x", session=session, timeout_seconds=0.01  # type: ignore[arg-type]
+            )
+        session.rollback.assert_awaited_once()
+
+    async def test_postgres_statement_timeout_is_reported_as_a_504(self) -> None:
+        session = _postgres_session()
+
+        async def canceled() -> None:
+            raise DBAPIError("SELECT ...", {}, _Canceled())
+
+        with pytest.raises(QueryTimeoutError):
+            await run_with_timeout(canceled(), operation="x", session=session)
+
+        session.cancel_conn.execute.assert_not_awaited()
+        session.rollback.assert_awaited_once()
+
+    async def test_other_database_errors_propagate(self) -> None:
+        session = _postgres_session()
+
+        async def broken() -> None:
+            raise DBAPIError("SELECT ...", {}, ValueError("syntax"))
+
+        with pytest.raises(DBAPIError):
+            await run_with_timeout(broken(), operation="x", session=session)
+        assert heavy_query_metrics.snapshot() == {}
+
+
+@pytest.mark.asyncio
+class TestHeavyQueryMetrics:
+    async def test_counts_completed_and_cancelled_per_operation(self) -> None:
+        async def work() -> None:
+            return None
+
+        async def slow() -> None:
+            await asyncio.sleep(10)
+
+        await run_with_timeout(work(), operation="entity video list")
+        await run_with_timeout(work(), operation="entity video list")
+        with pytest.raises(QueryTimeoutError):
+            await run_with_timeout(
+                slow(), operation="entity video list", timeout_seconds=0.01  # type: ignore[arg-type]
+            )
+        with pytest.raises(QueryTimeoutError):
+            await run_with_timeout(
+                slow(), operation="phonetic matches", timeout_seconds=0.01  # type: ignore[arg-type]
+            )
+
+        assert heavy_query_metrics.snapshot() == {
+            "entity video list": {"completed": 2, "cancelled": 1},
+            "phonetic matches": {"completed": 0, "cancelled": 1},
+        }
+
+
 def test_server_ceiling_stays_below_the_client_timeout() -> None:
     """The server budget must beat the client's, or the 504 never arrives.
 
@@ -30,6 +30,7 @@ from chronovista.cli.commands.takeout import (
     _display_watch_history_json,
     _inspect_csv_file,
     _inspect_json_file,
+    _parse_peek_date,
     _peek_comments,
     _peek_live_chats,
     _peek_playlists,
@@ -1034,6 +1035,211 @@ class TestPeekCommentsAndChats:
 
         mock_console.print.assert_called()
 
+    @staticmethod
+    def _write_takeout_comments(takeout_service, rows):
+        """Write *rows* in the Takeout comments CSV layout."""
+        comments_dir = takeout_service.youtube_path / "comments"
+        comments_dir.mkdir(parents=True, exist_ok=True)
+        with open(
+            comments_dir / "comments.csv", "w", newline="", encoding="utf-8"
+        ) as f:
+            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+            writer.writerow(
+                [
+                    "Comment ID",
+                    "Channel ID",
+                    "Comment Create Timestamp",
+                    "Video ID",
+                    "Comment Text",
+                ]
+            )
+            writer.writerows(rows)
+
+    @staticmethod
+    def _printed_table(mock_console):
+        """Return the first rich Table the command printed."""
+        from rich.table import Table
+
+        return next(
+            call.args[0]
+            for call in mock_console.print.call_args_list
+            if call.args and isinstance(call.args[0], Table)
+        )
+
+    async def test_peek_comments_streams_the_newest_n(
+        self, temp_takeout_dir, mock_progress
+    ):
+        """Recent order keeps only the newest rows, filtered while reading."""
+        takeout_service = MagicMock(spec=TakeoutService)
+        takeout_service.youtube_path = temp_takeout_dir / "YouTube and YouTube Music"
+        self._write_takeout_comments(
+            takeout_service,
+            [
+                ["c1", "UCa", "2023-01-01T00:00:00Z", "vid1", '{"text":"python one"}'],
+                ["c2", "UCa", "2023-01-03T00:00:00Z", "vid1", '{"text":"python two"}'],
+                ["c3", "UCa", "2023-01-02T00:00:00Z", "vid2", '{"text":"python 3"}'],
+                ["c4", "UCa", "2023-01-04T00:00:00Z", "vid2", '{"text":"other"}'],
+            ],
+        )
+
+        with (
+            patch("chronovista.cli.commands.takeout.console") as mock_console,
+            patch(
+                "chronovista.cli.commands.takeout._build_video_title_lookup",
+                new=AsyncMock(return_value={}),
+            ),
+        ):
+            await _peek_comments(
+                takeout_service,
+                limit=2,
+                sort_order="recent",
+                progress=mock_progress,
+                task_id="test_task",
+                filter_name="python",
+            )
+
+        table = self._printed_table(mock_console)
+        assert table.title == "💬 Your Comments (3 total)"
+        assert list(table.columns[0].cells) == ["python two", "python 3"]
+        mock_console.print.assert_any_call("   • Found 3 comments matching 'python'")
+
+    async def test_peek_comments_no_match_reports_rows_read(
+        self, temp_takeout_dir, mock_progress
+    ):
+        """An empty result still says how many rows were read."""
+        takeout_service = MagicMock(spec=TakeoutService)
+        takeout_service.youtube_path = temp_takeout_dir / "YouTube and YouTube Music"
+        self._write_takeout_comments(
+            takeout_service,
+            [["c1", "UCa", "2023-01-01T00:00:00Z", "vid1", "hello"]],
+        )
+
+        with patch("chronovista.cli.commands.takeout.console") as mock_console:
+            await _peek_comments(
+                takeout_service,
+                limit=10,
+                sort_order="default",
+                progress=mock_progress,
+                task_id="test_task",
+                since=datetime(2024, 1, 1, tzinfo=UTC),
+            )
+
+        mock_console.print.assert_any_call("📭 No comments found in that date range")
+        mock_console.print.assert_any_call(
+            "💡 Found 1 total comments. Try a wider --since/--until range."
+        )
+
+    async def test_peek_comments_store_saves_every_row(
+        self, temp_takeout_dir, mock_progress
+    ):
+        """--store writes unfiltered rows while the display stays filtered."""
+        from contextlib import asynccontextmanager
+
+        takeout_service = MagicMock(spec=TakeoutService)
+        takeout_service.youtube_path = temp_takeout_dir / "YouTube and YouTube Music"
+        self._write_takeout_comments(
+            takeout_service,
+            [
+                ["c1", "UCa", "2023-01-01T00:00:00Z", "vid1", "keep"],
+                ["c2", "UCa", "2023-01-02T00:00:00Z", "vid2", "skip"],
+            ],
+        )
+        session = MagicMock()
+        written: list = []
+
+        @asynccontextmanager
+        async def fake_session():
+            yield session
+
+        async def store_all(_session, messages):
+            written.extend(messages)
+            return len(written)
+
+        with (
+            patch("chronovista.cli.commands.takeout.console") as mock_console,
+            patch("chronovista.cli.commands.takeout.db_manager") as mock_db,
+            patch(
+                "chronovista.cli.commands.takeout.TakeoutMessageRepository"
+            ) as mock_repo_class,
+            patch(
+                "chronovista.cli.commands.takeout._build_video_title_lookup",
+                new=AsyncMock(return_value={}),
+            ),
+        ):
+            mock_db.session = fake_session
+            mock_repo_class.return_value.store_all = AsyncMock(side_effect=store_all)
+            await _peek_comments(
+                takeout_service,
+                limit=10,
+                sort_order="default",
+                progress=mock_progress,
+                task_id="test_task",
+                filter_name="keep",
+                store=True,
+            )
+
+        assert [m.message_id for m in written] == ["c1", "c2"]
+        mock_console.print.assert_any_call("🗄️ Stored 2 comments in the database")
+        assert list(self._printed_table(mock_console).columns[0].cells) == ["keep"]
+
+    async def test_peek_comments_stored_skips_the_csvs(
+        self, temp_takeout_dir, mock_progress
+    ):
+        """--stored answers from the repository without a comments folder."""
+        from contextlib import asynccontextmanager
+
+        from chronovista.parsers.takeout_message_parser import (
+            MessageDigest,
+            MessageFilter,
+            TakeoutMessage,
+        )
+
+        takeout_service = MagicMock(spec=TakeoutService)
+        takeout_service.youtube_path = temp_takeout_dir / "missing"
+        message = TakeoutMessage(
+            kind="comment",
+            message_id="c1",
+            video_id="vid1",
+            channel_id="UCa",
+            posted_at=datetime(2023, 1, 1, tzinfo=UTC),
+            text="from the table",
+        )
+        digest = MessageDigest(limit=5).extend([message])
+
+        @asynccontextmanager
+        async def fake_session():
+            yield MagicMock()
+
+        with (
+            patch("chronovista.cli.commands.takeout.console") as mock_console,
+            patch("chronovista.cli.commands.takeout.db_manager") as mock_db,
+            patch(
+                "chronovista.cli.commands.takeout.TakeoutMessageRepository"
+            ) as mock_repo_class,
+            patch(
+                "chronovista.cli.commands.takeout._build_video_title_lookup",
+                new=AsyncMock(return_value={}),
+            ),
+        ):
+            mock_db.session = fake_session
+            summarise = AsyncMock(return_value=digest)
+            mock_repo_class.return_value.summarise = summarise
+            await _peek_comments(
+                takeout_service,
+                limit=5,
+                sort_order="recent",
+                progress=mock_progress,
+                task_id="test_task",
+                filter_name="table",
+                stored=True,
+            )
+
+        assert summarise.call_args.args[1:] == ("comment", MessageFilter(text="table"))
+        assert summarise.call_args.kwargs == {"limit": 5, "sort_order": "recent"}
+        assert list(self._printed_table(mock_console).columns[0].cells) == [
+            "from the table"
+        ]
+
     async def test_peek_live_chats_empty_directory(
         self, temp_takeout_dir, mock_progress
     ):
@@ -1055,3 +1261,27 @@ class TestPeekCommentsAndChats:
             )
 
         mock_console.print.assert_called()
+
+
+class TestParsePeekDate:
+    """--since/--until values become aware, inclusive bounds."""
+
+    def test_naive_values_are_utc(self):
+        """A naive datetime is taken as UTC."""
+        assert _parse_peek_date("2023-01-15T10:00", "--since") == datetime(
+            2023, 1, 15, 10, tzinfo=UTC
+        )
+
+    def test_bare_until_date_covers_the_whole_day(self):
+        """--until 2023-01-15 includes messages posted late that day."""
+        assert _parse_peek_date("2023-01-15", "--until", end_of_day=True) == (
+            datetime(2023, 1, 15, 23, 59, 59, 999999, tzinfo=UTC)
+        )
+
+    def test_invalid_value_exits(self):
+        """An unparseable date exits with code 1."""
+        with patch("chronovista.cli.commands.takeout.console"):
+            with pytest.raises(typer.Exit) as exc_info:
+                _parse_peek_date("last week", "--since")
+
+        assert exc_info.value.exit_code == 1
@@ -13,7 +13,7 @@ in the existing test_takeout.py file.
 
 from datetime import UTC, datetime
 from pathlib import Path
-from unittest.mock import AsyncMock, mock_open, patch
+from unittest.mock import ANY, AsyncMock, mock_open, patch
 
 import pytest
 import typer
@@ -25,6 +25,7 @@ from chronovista.models.takeout import (
     TakeoutSubscription,
     ViewingPatterns,
 )
+from chronovista.services.takeout_snapshot import TakeoutSnapshotStats
 from tests.factories.takeout_data_factory import create_takeout_data
 from tests.factories.takeout_playlist_factory import create_takeout_playlist
 from tests.factories.takeout_playlist_item_factory import create_takeout_playlist_item
@@ -80,6 +81,7 @@ class TestPeekDataCommand:
 
         # Setup mock
         mock_service = AsyncMock()
+        mock_service.snapshot_stats = TakeoutSnapshotStats()
         mock_service.parse_playlists.return_value = sample_takeout_data.playlists
         mock_takeout_service_class.return_value = mock_service
 
@@ -93,10 +95,16 @@ class TestPeekDataCommand:
             oldest=False,
             all_items=False,
             topic_filter=None,
+            since=None,
+            until=None,
+            store=False,
+            stored=False,
         )
 
         # Verify TakeoutService was created correctly
-        mock_takeout_service_class.assert_called_once_with(Path("test/takeout"))
+        mock_takeout_service_class.assert_called_once_with(
+            Path("test/takeout"), snapshot_store=ANY
+        )
 
         # Verify console output was called
         mock_console.print.assert_called()
@@ -111,6 +119,7 @@ class TestPeekDataCommand:
 
         # Setup mock
         mock_service = AsyncMock()
+        mock_service.snapshot_stats = TakeoutSnapshotStats()
         mock_service.parse_watch_history.return_value = (
             sample_takeout_data.watch_history
         )
@@ -126,10 +135,16 @@ class TestPeekDataCommand:
             oldest=False,
             all_items=False,
             topic_filter=None,
+            since=None,
+            until=None,
+            store=False,
+            stored=False,
         )
 
         # Verify TakeoutService was created correctly
-        mock_takeout_service_class.assert_called_once_with(Path("test/takeout"))
+        mock_takeout_service_class.assert_called_once_with(
+            Path("test/takeout"), snapshot_store=ANY
+        )
 
         # Verify console output was called
         mock_console.print.assert_called()
@@ -144,6 +159,7 @@ class TestPeekDataCommand:
 
         # Setup mock
         mock_service = AsyncMock()
+        mock_service.snapshot_stats = TakeoutSnapshotStats()
         mock_service.parse_subscriptions.return_value = (
             sample_takeout_data.subscriptions
         )
@@ -159,10 +175,16 @@ class TestPeekDataCommand:
             oldest=False,
             all_items=True,
             topic_filter=None,
+            since=None,
+            until=None,
+            store=False,
+            stored=False,
         )
 
         # Verify TakeoutService was created correctly
-        mock_takeout_service_class.assert_called_once_with(Path("test/takeout"))
+        mock_takeout_service_class.assert_called_once_with(
+            Path("test/takeout"), snapshot_store=ANY
+        )
 
         # Verify console output was called
         mock_console.print.assert_called()
@@ -177,6 +199,7 @@ class TestPeekDataCommand:
 
         # Setup mock
         mock_service = AsyncMock()
+        mock_service.snapshot_stats = TakeoutSnapshotStats()
         mock_takeout_service_class.return_value = mock_service
 
         # Call function - should exit with error
@@ -190,6 +213,10 @@ class TestPeekDataCommand:
                 oldest=False,
                 all_items=False,
                 topic_filter=None,
+                since=None,
+                until=None,
+                store=False,
+                stored=False,
             )
 
         # Verify exit code
@@ -208,6 +235,7 @@ class TestPeekDataCommand:
 
         # Setup mock
         mock_service = AsyncMock()
+        mock_service.snapshot_stats = TakeoutSnapshotStats()
         mock_takeout_service_class.return_value = mock_service
 
         # Call function - should exit with error
@@ -221,6 +249,10 @@ class TestPeekDataCommand:
                 oldest=True,
                 all_items=False,
                 topic_filter=None,
+                since=None,
+                until=None,
+                store=False,
+                stored=False,
             )
 
         # Verify exit code
@@ -276,6 +308,7 @@ class TestPeekDataCommand:
 
         # Setup mock
         mock_service = AsyncMock()
+        mock_service.snapshot_stats = TakeoutSnapshotStats()
         mock_takeout_service_class.return_value = mock_service
 
         # Call function
@@ -288,10 +321,16 @@ class TestPeekDataCommand:
             oldest=False,
             all_items=False,
             topic_filter=None,
+            since=None,
+            until=None,
+            store=False,
+            stored=False,
         )
 
         # Verify TakeoutService was created correctly
-        mock_takeout_service_class.assert_called_once_with(Path("test/takeout"))
+        mock_takeout_service_class.assert_called_once_with(
+            Path("test/takeout"), snapshot_store=ANY
+        )
 
         # Verify console output was called
         mock_console.print.assert_called()
@@ -306,6 +345,7 @@ class TestPeekDataCommand:
 
         # Setup mock
         mock_service = AsyncMock()
+        mock_service.snapshot_stats = TakeoutSnapshotStats()
         mock_takeout_service_class.return_value = mock_service
 
         # Call function
@@ -318,10 +358,16 @@ class TestPeekDataCommand:
             oldest=False,
             all_items=False,
             topic_filter=None,
+            since=None,
+            until=None,
+            store=False,
+            stored=False,
         )
 
         # Verify TakeoutService was created correctly
-        mock_takeout_service_class.assert_called_once_with(Path("test/takeout"))
+        mock_takeout_service_class.assert_called_once_with(
+            Path("test/takeout"), snapshot_store=ANY
+        )
 
         # Verify console output was called
         mock_console.print.assert_called()
@@ -371,6 +417,7 @@ class TestAnalyzeComprehensiveCommand:
 
         # Setup mock
         mock_service = AsyncMock()
+        mock_service.snapshot_stats = TakeoutSnapshotStats()
         mock_service.generate_comprehensive_analysis.return_value = sample_analysis_data
         mock_takeout_service_class.return_value = mock_service
 
@@ -383,7 +430,9 @@ class TestAnalyzeComprehensiveCommand:
         )
 
         # Verify TakeoutService was created correctly
-        mock_takeout_service_class.assert_called_once_with(Path("test/takeout"))
+        mock_takeout_service_class.assert_called_once_with(
+            Path("test/takeout"), snapshot_store=ANY
+        )
 
         # Verify analysis was called
         mock_service.generate_comprehensive_analysis.assert_called_once()
@@ -406,6 +455,7 @@ class TestAnalyzeComprehensiveCommand:
 
         # Setup mock
         mock_service = AsyncMock()
+        mock_service.snapshot_stats = TakeoutSnapshotStats()
         mock_service.generate_comprehensive_analysis.return_value = sample_analysis_data
         mock_takeout_service_class.return_value = mock_service
 
@@ -418,7 +468,9 @@ class TestAnalyzeComprehensiveCommand:
         )
 
         # Verify TakeoutService was created correctly
-        mock_takeout_service_class.assert_called_once_with(Path("test/takeout"))
+        mock_takeout_service_class.assert_called_once_with(
+            Path("test/takeout"), snapshot_store=ANY
+        )
 
         # Verify analysis was called
         mock_service.generate_comprehensive_analysis.assert_called_once()
@@ -554,6 +606,7 @@ class TestAnalyzeRelationshipsCommand:
 
         # Setup mock
         mock_service = AsyncMock()
+        mock_service.snapshot_stats = TakeoutSnapshotStats()
         mock_service.parse_all.return_value = sample_takeout_data_with_relationships
         mock_service.analyze_playlist_overlap.return_value = {
             "Playlist A": {"Playlist B": 1}
@@ -566,7 +619,9 @@ class TestAnalyzeRelationshipsCommand:
         )
 
         # Verify TakeoutService was created correctly
-        mock_takeout_service_class.assert_called_once_with(Path("test/takeout"))
+        mock_takeout_service_class.assert_called_once_with(
+            Path("test/takeout"), snapshot_store=ANY
+        )
 
         # Verify analysis was called
         mock_service.analyze_playlist_overlap.assert_called_once()
@@ -589,6 +644,7 @@ class TestAnalyzeRelationshipsCommand:
 
         # Setup mocks
         mock_service = AsyncMock()
+        mock_service.snapshot_stats = TakeoutSnapshotStats()
         mock_takeout_service_class.return_value = mock_service
         mock_analyze_channel_clusters.return_value = None  # async function returns None
 
@@ -598,7 +654,9 @@ class TestAnalyzeRelationshipsCommand:
         )
 
         # Verify TakeoutService was created correctly
-        mock_takeout_service_class.assert_called_once_with(Path("test/takeout"))
+        mock_takeout_service_class.assert_called_once_with(
+            Path("test/takeout"), snapshot_store=ANY
+        )
 
         # Verify the helper function was called
         mock_analyze_channel_clusters.assert_called_once()
@@ -618,6 +676,7 @@ class TestAnalyzeRelationshipsCommand:
 
         # Setup mocks
         mock_service = AsyncMock()
+        mock_service.snapshot_stats = TakeoutSnapshotStats()
         mock_takeout_service_class.return_value = mock_service
         mock_analyze_temporal_patterns.return_value = (
             None  # async function returns None
@@ -629,7 +688,9 @@ class TestAnalyzeRelationshipsCommand:
         )
 
         # Verify TakeoutService was created correctly
-        mock_takeout_service_class.assert_called_once_with(Path("test/takeout"))
+        mock_takeout_service_class.assert_called_once_with(
+            Path("test/takeout"), snapshot_store=ANY
+        )
 
         # Verify the helper function was called
         mock_analyze_temporal_patterns.assert_called_once()
@@ -644,6 +705,7 @@ class TestAnalyzeRelationshipsCommand:
 
         # Setup mock
         mock_service = AsyncMock()
+        mock_service.snapshot_stats = TakeoutSnapshotStats()
         mock_takeout_service_class.return_value = mock_service
 
         # Call function - should exit with error
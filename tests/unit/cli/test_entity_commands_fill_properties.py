@@ -0,0 +1,84 @@
+"""
+Unit tests for ``entities fill-properties``.
+
+Exercises the selection and write logic of ``_fill_missing_properties`` with a
+mocked session, repository and Wikidata client: only grounded entities are
+fetched, in one bulk call, and dry runs roll back.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from chronovista.cli.entity_commands import _fill_missing_properties, _grounded_qid
+
+_BAG: dict[str, Any] = {"occupation": {"values": ["Placeholder"], "qids": []}}
+
+
+def _session(rows: list[tuple[uuid.UUID, dict[str, Any]]]) -> AsyncMock:
+    session = AsyncMock()
+    result = MagicMock()
+    result.all.return_value = rows
+    session.execute.return_value = result
+    return session
+
+
+class TestGroundedQid:
+    def test_both_external_id_shapes(self) -> None:
+        assert _grounded_qid({"wikidata": "Q1"}) == "Q1"
+        assert _grounded_qid({"wikidata": {"id": "Q1", "status": "verified"}}) == "Q1"
+        assert _grounded_qid({"wikidata": {"id": None, "status": "absent"}}) is None
+        assert _grounded_qid({"dbpedia": {"id": "http://x"}}) is None
+        assert _grounded_qid(None) is None
+
+
+class TestFillMissingProperties:
+    async def test_fetches_grounded_entities_in_one_bulk_call(self) -> None:
+        grounded, empty, ungrounded = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        session = _session(
+            [
+                (grounded, {"wikidata": {"id": "Q1", "status": "confirmed"}}),
+                (empty, {"wikidata": "Q2"}),
+                (ungrounded, {}),
+            ]
+        )
+        client = MagicMock()
+        client.fetch_properties_many = AsyncMock(return_value={"Q1": _BAG, "Q2": {}})
+
+        with patch("chronovista.cli.entity_commands.NamedEntityRepository") as repo_cls:
+            repo_cls.return_value.replace_properties = AsyncMock(return_value=1)
+            counts = await _fill_missing_properties(
+                session, client, apply=True, limit=None
+            )
+
+        assert counts == (2, 1, 1)
+        client.fetch_properties_many.assert_awaited_once_with(["Q1", "Q2"])
+        repo_cls.return_value.replace_properties.assert_awaited_once_with(
+            session, grounded, properties=_BAG
+        )
+        session.commit.assert_awaited_once()
+
+    async def test_dry_run_rolls_back_and_limit_applies(self) -> None:
+        session = _session([(uuid.uuid4(), {"wikidata": f"Q{i}"}) for i in range(5)])
+        client = MagicMock()
+        client.fetch_properties_many = AsyncMock(return_value={})
+
+        counts = await _fill_missing_properties(session, client, apply=False, limit=2)
+
+        assert counts == (2, 0, 2)
+        client.fetch_properties_many.assert_awaited_once_with(["Q0", "Q1"])
+        session.rollback.assert_awaited_once()
+        session.commit.assert_not_awaited()
+
+    async def test_nothing_to_fill_makes_no_request(self) -> None:
+        client = MagicMock()
+        client.fetch_properties_many = AsyncMock()
+
+        counts = await _fill_missing_properties(
+            _session([]), client, apply=True, limit=None
+        )
+
+        assert counts == (0, 0, 0)
+        client.fetch_properties_many.assert_not_awaited()
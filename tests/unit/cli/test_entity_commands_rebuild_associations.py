@@ -0,0 +1,43 @@
+"""
+Unit tests for ``entities rebuild-associations``.
+
+Exercises ``_rebuild_associations`` with a mocked session and repository: a
+dry run computes the whole table and rolls it back, an apply commits it.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from chronovista.cli.entity_commands import _rebuild_associations
+
+
+class TestRebuildAssociations:
+    async def test_apply_rebuilds_everything_and_commits(self) -> None:
+        session = AsyncMock()
+
+        with patch(
+            "chronovista.cli.entity_commands.EntityMentionRepository"
+        ) as repo_cls:
+            repo = repo_cls.return_value
+            repo.refresh_associations = AsyncMock(return_value=42)
+            written = await _rebuild_associations(session, dry_run=False)
+
+        assert written == 42
+        # No scope: the whole table is recomputed.
+        repo.refresh_associations.assert_awaited_once_with(session)
+        session.commit.assert_awaited_once()
+        session.rollback.assert_not_awaited()
+
+    async def test_dry_run_rolls_back(self) -> None:
+        session = AsyncMock()
+
+        with patch(
+            "chronovista.cli.entity_commands.EntityMentionRepository"
+        ) as repo_cls:
+            repo_cls.return_value.refresh_associations = AsyncMock(return_value=7)
+            written = await _rebuild_associations(session, dry_run=True)
+
+        assert written == 7
+        session.rollback.assert_awaited_once()
+        session.commit.assert_not_awaited()
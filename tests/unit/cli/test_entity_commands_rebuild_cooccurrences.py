@@ -0,0 +1,42 @@
+"""
+Unit tests for ``entities rebuild-cooccurrences``.
+
+Exercises ``_rebuild_cooccurrences`` with a mocked session and repository: a
+dry run recounts every pair and rolls it back, an apply commits it.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from chronovista.cli.entity_commands import _rebuild_cooccurrences
+
+
+class TestRebuildCooccurrences:
+    async def test_apply_rebuilds_everything_and_commits(self) -> None:
+        session = AsyncMock()
+
+        with patch(
+            "chronovista.cli.entity_commands.EntityMentionRepository"
+        ) as repo_cls:
+            repo = repo_cls.return_value
+            repo.refresh_cooccurrences = AsyncMock(return_value=18)
+            written = await _rebuild_cooccurrences(session, dry_run=False)
+
+        assert written == 18
+        repo.refresh_cooccurrences.assert_awaited_once_with(session)
+        session.commit.assert_awaited_once()
+        session.rollback.assert_not_awaited()
+
+    async def test_dry_run_rolls_back(self) -> None:
+        session = AsyncMock()
+
+        with patch(
+            "chronovista.cli.entity_commands.EntityMentionRepository"
+        ) as repo_cls:
+            repo_cls.return_value.refresh_cooccurrences = AsyncMock(return_value=4)
+            written = await _rebuild_cooccurrences(session, dry_run=True)
+
+        assert written == 4
+        session.rollback.assert_awaited_once()
+        session.commit.assert_not_awaited()
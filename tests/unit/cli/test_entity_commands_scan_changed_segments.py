@@ -0,0 +1,122 @@
+"""
+Unit tests for the ``--changed-since-last-scan`` flag on ``entities scan``.
+
+The database session and scan service are mocked, so only option validation
+and dispatch to ``scan_changed_segments()`` are exercised.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from chronovista.cli.entity_commands import entity_app
+
+
+def _run_coro_via_fake_asyncio_run(coro: object) -> None:
+    """Execute a coroutine synchronously (replaces asyncio.run in CLI tests)."""
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(coro)  # type: ignore[arg-type]
+    finally:
+        loop.close()
+
+
+def _make_scan_result(dry_run: bool = False) -> MagicMock:
+    """Build a mock ScanResult with sensible defaults."""
+    result = MagicMock()
+    result.segments_scanned = 4
+    result.mentions_found = 2
+    result.mentions_skipped = 0
+    result.mentions_removed = 3
+    result.unique_entities = 1
+    result.unique_videos = 1
+    result.duration_seconds = 0.2
+    result.dry_run = dry_run
+    result.dry_run_matches = [] if dry_run else None
+    result.failed_batches = 0
+    result.skipped_longest_match = 0
+    result.skipped_exclusion_pattern = 0
+    return result
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Return a Typer CliRunner."""
+    return CliRunner()
+
+
+class TestChangedSinceLastScanValidation:
+    """Narrowing or widening options are rejected."""
+
+    @pytest.mark.parametrize(
+        "extra",
+        [
+            ["--full"],
+            ["--new-entities-only"],
+            ["--entity-type", "person"],
+            ["--video-id", "dQw4w9WgXcQ"],
+            ["--language", "en"],
+            ["--sources", "transcript,title"],
+        ],
+    )
+    def test_conflicting_option_is_a_usage_error(
+        self, runner: CliRunner, extra: list[str]
+    ) -> None:
+        with patch("chronovista.cli.entity_commands.asyncio.run") as mock_run:
+            result = runner.invoke(
+                entity_app, ["scan", "--changed-since-last-scan", *extra]
+            )
+
+        assert result.exit_code == 2
+        assert "--changed-since-last-scan" in result.output
+        mock_run.assert_not_called()
+
+
+class TestChangedSinceLastScanDispatch:
+    """The flag routes to ``scan_changed_segments()`` instead of ``scan()``."""
+
+    @pytest.mark.parametrize("dry_run", [False, True])
+    @patch("chronovista.cli.entity_commands.EntityMentionScanService")
+    @patch("chronovista.cli.entity_commands.db_manager")
+    def test_calls_scan_changed_segments_only(
+        self,
+        mock_db_manager: MagicMock,
+        mock_service_cls: MagicMock,
+        runner: CliRunner,
+        dry_run: bool,
+    ) -> None:
+        mock_db_manager.get_session_factory.return_value = MagicMock()
+        captured: list[dict[str, Any]] = []
+        mock_service = MagicMock()
+
+        async def capture_changed(**kwargs: Any) -> Any:
+            captured.append(kwargs)
+            return _make_scan_result(dry_run=kwargs["dry_run"])
+
+        async def unexpected_scan(**kwargs: Any) -> Any:
+            raise AssertionError("scan() should not be called")
+
+        mock_service.scan_changed_segments = capture_changed
+        mock_service.scan = unexpected_scan
+        mock_service_cls.return_value = mock_service
+
+        args = ["scan", "--changed-since-last-scan", "--batch-size", "100"]
+        if dry_run:
+            args.append("--dry-run")
+        with patch(
+            "chronovista.cli.entity_commands.asyncio.run",
+            side_effect=_run_coro_via_fake_asyncio_run,
+        ):
+            result = runner.invoke(entity_app, args)
+
+        assert result.exit_code == 0, result.output
+        assert len(captured) == 1
+        assert captured[0]["batch_size"] == 100
+        assert captured[0]["dry_run"] is dry_run
+        if not dry_run:
+            assert "Stale mentions removed" in result.output
@@ -0,0 +1,75 @@
+"""
+Unit tests for ``entities verify-counters``.
+
+Exercises ``_verify_counters`` with a mocked session and repository: a check
+never writes, and ``--fix`` recomputes only the entities that drifted.
+"""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import AsyncMock, patch
+
+from chronovista.cli.entity_commands import _verify_counters
+
+
+def _session() -> AsyncMock:
+    return AsyncMock()
+
+
+class TestVerifyCounters:
+    async def test_check_only_rolls_back(self) -> None:
+        drifted = uuid.uuid4()
+        session = _session()
+
+        with patch(
+            "chronovista.cli.entity_commands.EntityMentionRepository"
+        ) as repo_cls:
+            repo = repo_cls.return_value
+            repo.find_counter_drift = AsyncMock(
+                return_value=([(drifted, 3, 1, 2, 1)], [])
+            )
+            repo.update_entity_counters = AsyncMock()
+            entity_drift, alias_drift = await _verify_counters(session, fix=False)
+
+        assert entity_drift == [(drifted, 3, 1, 2, 1)]
+        assert alias_drift == []
+        repo.update_entity_counters.assert_not_awaited()
+        session.rollback.assert_awaited_once()
+        session.commit.assert_not_awaited()
+
+    async def test_fix_recomputes_only_drifted_entities(self) -> None:
+        drifted, alias_only = uuid.uuid4(), uuid.uuid4()
+        session = _session()
+
+        with patch(
+            "chronovista.cli.entity_commands.EntityMentionRepository"
+        ) as repo_cls:
+            repo = repo_cls.return_value
+            repo.find_counter_drift = AsyncMock(
+                return_value=([(drifted, 0, 0, 4, 2)], [alias_only])
+            )
+            repo.update_entity_counters = AsyncMock()
+            repo.update_alias_counters = AsyncMock()
+            await _verify_counters(session, fix=True)
+
+        repo.update_entity_counters.assert_awaited_once_with(session, [drifted])
+        assert set(repo.update_alias_counters.call_args.args[1]) == {
+            drifted,
+            alias_only,
+        }
+        session.commit.assert_awaited_once()
+
+    async def test_fix_without_drift_writes_nothing(self) -> None:
+        session = _session()
+
+        with patch(
+            "chronovista.cli.entity_commands.EntityMentionRepository"
+        ) as repo_cls:
+            repo = repo_cls.return_value
+            repo.find_counter_drift = AsyncMock(return_value=([], []))
+            repo.update_entity_counters = AsyncMock()
+            await _verify_counters(session, fix=True)
+
+        repo.update_entity_counters.assert_not_awaited()
+        session.commit.assert_not_awaited()
@@ -175,11 +175,17 @@ class TestSyncTranscriptsDryRun:
             mock_session,
             mock_session,
         ]
+        mock_db_manager.session.return_value.__aenter__.return_value = mock_session
 
         # Mock repository to return videos without transcripts
 
         mock_video_repo.search_videos = AsyncMock(return_value=mock_video_db_list)
 
+        # The sync plan looks up stored transcripts in one query
+        mock_container.create_video_transcript_repository.return_value = MagicMock(
+            get_stored_language_keys=AsyncMock(return_value=set())
+        )
+
         # Execute command with dry-run
         result = runner.invoke(app, ["sync", "transcripts", "--dry-run"])
 
@@ -1051,3 +1057,117 @@ class TestSyncTranscriptsSummaryTable:
 
         # Verify summary table elements are present
         assert "created" in result.stdout.lower() or "summary" in result.stdout.lower()
+
+
+class TestSyncTranscriptsSinglePass:
+    """The sync plans up front and writes through one session."""
+
+    @patch("chronovista.cli.sync_commands._TRANSCRIPT_COMMIT_BATCH_SIZE", 2)
+    @patch("chronovista.cli.sync_commands.check_authenticated")
+    @patch("chronovista.cli.sync_commands.container")
+    @patch("chronovista.cli.sync_commands.db_manager")
+    def test_prefetches_stored_pairs_and_commits_in_chunks(
+        self,
+        mock_db_manager: MagicMock,
+        mock_container: MagicMock,
+        mock_check_auth: MagicMock,
+        runner: CliRunner,
+        mock_video_db_list: list[MagicMock],
+        mock_enhanced_transcript: EnhancedVideoTranscriptBase,
+    ) -> None:
+        """One stored-pair query, savepoint per write, a commit per chunk."""
+        mock_check_auth.return_value = True
+        for i, video in enumerate(mock_video_db_list):
+            video.video_id = f"syncVideo{i:02d}"
+
+        mock_video_repo = AsyncMock()
+        mock_video_repo.get_multi = AsyncMock(return_value=mock_video_db_list)
+        mock_video_transcript_repo = AsyncMock()
+        mock_video_transcript_repo.get_stored_language_keys = AsyncMock(
+            return_value={("syncVideo01", "en")}
+        )
+        mock_user_lang_pref_repo = AsyncMock()
+        mock_user_lang_pref_repo.get_user_preferences = AsyncMock(return_value=[])
+        mock_container.create_video_repository.return_value = mock_video_repo
+        mock_container.create_video_transcript_repository.return_value = (
+            mock_video_transcript_repo
+        )
+        mock_container.create_user_language_preference_repository.return_value = (
+            mock_user_lang_pref_repo
+        )
+        mock_container.transcript_service.get_transcript = AsyncMock(
+            return_value=mock_enhanced_transcript
+        )
+
+        mock_session = AsyncMock()
+        mock_session.begin_nested = MagicMock()
+        mock_db_manager.get_session.return_value.__aiter__.return_value = [mock_session]
+        mock_db_manager.session.return_value.__aenter__.return_value = mock_session
+
+        result = runner.invoke(app, ["sync", "transcripts", "--force"])
+
+        mock_db_manager.session.assert_called_once_with()
+        mock_video_transcript_repo.get_stored_language_keys.assert_awaited_once_with(
+            mock_session, ["syncVideo00", "syncVideo01", "syncVideo02"]
+        )
+        mock_video_transcript_repo.get_by_composite_key.assert_not_called()
+        assert mock_video_transcript_repo.create_or_update.await_count == 3
+        assert mock_session.begin_nested.call_count == 3
+        mock_session.commit.assert_awaited_once()
+        assert result.stdout.count("Updated transcript") == 1
+        assert result.stdout.count("Downloaded transcript") == 2
+
+    @patch("chronovista.cli.sync_commands.check_authenticated")
+    @patch("chronovista.cli.sync_commands.container")
+    @patch("chronovista.cli.sync_commands.db_manager")
+    def test_dry_run_summarises_the_plan(
+        self,
+        mock_db_manager: MagicMock,
+        mock_container: MagicMock,
+        mock_check_auth: MagicMock,
+        runner: CliRunner,
+        mock_video_db_list: list[MagicMock],
+    ) -> None:
+        """The preview reports planned downloads and skips without downloading."""
+        mock_check_auth.return_value = True
+        for video in mock_video_db_list:
+            video.channel_name_hint = "Test Channel"
+
+        mock_video_repo = AsyncMock()
+        mock_video_repo.search_videos = AsyncMock(return_value=mock_video_db_list)
+        mock_video_transcript_repo = AsyncMock()
+        mock_video_transcript_repo.get_stored_language_keys = AsyncMock(
+            return_value={("test_video_2", "es")}
+        )
+        mock_user_lang_pref_repo = AsyncMock()
+        mock_user_lang_pref_repo.get_user_preferences = AsyncMock(return_value=[])
+        mock_container.create_video_repository.return_value = mock_video_repo
+        mock_container.create_video_transcript_repository.return_value = (
+            mock_video_transcript_repo
+        )
+        mock_container.create_user_language_preference_repository.return_value = (
+            mock_user_lang_pref_repo
+        )
+        mock_container.transcript_service.get_transcript = AsyncMock()
+
+        mock_session = AsyncMock()
+        mock_db_manager.get_session.return_value.__aiter__.return_value = [mock_session]
+        mock_db_manager.session.return_value.__aenter__.return_value = mock_session
+
+        result = runner.invoke(
+            app,
+            [
+                "sync",
+                "transcripts",
+                "--dry-run",
+                "--language",
+                "en",
+                "--language",
+                "es",
+            ],
+        )
+
+        assert "Download 4 transcripts for 2 videos" in result.stdout
+        assert "Skip 1 videos" in result.stdout
+        assert "Transcript already exists" in result.stdout
+        mock_container.transcript_service.get_transcript.assert_not_called()
@@ -196,6 +196,73 @@ class TestDatabaseManager:
         mock_create_engine.assert_called_once()
 
 
+class TestConnectionPools:
+    """Interactive and batch pools are separate and independently sized."""
+
+    @patch("chronovista.config.database.create_async_engine")
+    def test_batch_engine_is_separate_and_uses_batch_sizing(self, mock_create_engine):
+        mock_create_engine.side_effect = lambda *a, **kw: MagicMock()
+
+        manager = DatabaseManager()
+        interactive = manager.get_engine()
+        batch = manager.get_batch_engine()
+
+        assert interactive is not batch
+        assert manager.get_batch_engine() is batch
+        _args, kwargs = mock_create_engine.call_args_list[1]
+        assert kwargs["pool_size"] == 3
+        assert kwargs["max_overflow"] == 2
+        assert kwargs["pool_timeout"] == 60.0
+        assert kwargs["connect_args"]["server_settings"]["statement_timeout"]
+
+    def test_interactive_pool_settings_override_environment_defaults(self):
+        with patch("chronovista.config.database.settings") as mock_settings:
+            mock_settings.is_development_database = True
+            mock_settings.db_pool_size = 8
+            mock_settings.db_max_overflow = None
+            mock_settings.db_pool_timeout = 4.5
+
+            kwargs = DatabaseManager._pool_kwargs()
+
+        assert kwargs == {"pool_size": 8, "max_overflow": 0, "pool_timeout": 4.5}
+
+    @pytest.mark.asyncio
+    async def test_pool_stats_reports_created_pools(self):
+        manager = DatabaseManager()
+        assert manager.pool_stats() == []
+
+        with patch("chronovista.config.database.settings") as mock_settings:
+            mock_settings.effective_database_url = (
+                "postgresql+asyncpg://u:p@localhost:5432/db"
+            )
+            mock_settings.db_log_queries = False
+            mock_settings.api_instrumentation = False
+            mock_settings.db_batch_pool_size = 2
+            mock_settings.db_batch_max_overflow = 1
+            mock_settings.db_batch_pool_timeout = 15.0
+            manager.get_batch_engine()
+
+        (batch,) = manager.pool_stats()
+        assert batch.name == "batch"
+        assert (batch.size, batch.max_overflow, batch.checked_out) == (2, 1, 0)
+        assert batch.timeout_seconds == 15.0
+
+        await manager.close()
+        assert manager._batch_engine is None
+
+    @pytest.mark.asyncio
+    async def test_close_disposes_both_engines(self):
+        manager = DatabaseManager()
+        manager._engine = AsyncMock()
+        manager._batch_engine = batch = AsyncMock()
+        manager._batch_session_factory = MagicMock()
+
+        await manager.close()
+
+        batch.dispose.assert_awaited_once()
+        assert manager._batch_session_factory is None
+
+
 def test_global_db_manager():
     """Test global database manager instance."""
     assert isinstance(db_manager, DatabaseManager)
@@ -0,0 +1 @@
+"""Tests for the db package."""
@@ -0,0 +1,212 @@
+"""Tests for the two-level aggregate cache and its invalidation hooks."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import chronovista.db.aggregate_cache as aggregate_cache_module
+from chronovista.db.aggregate_cache import AggregateCache, compute_etag
+from chronovista.db.models import AppIdentity, VideoCategory
+
+
+class _Computer:
+    """Counts computations and returns a payload that changes each time."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self, session: AsyncSession) -> dict[str, Any]:
+        self.calls += 1
+        return {"data": {"calls": self.calls}}
+
+
+def _session() -> AsyncSession:
+    return MagicMock(spec=AsyncSession)
+
+
+@asynccontextmanager
+async def _refresh_scope() -> AsyncIterator[AsyncSession]:
+    yield _session()
+
+
+def _cache(directory: Path | None, ttl: float = 60, swr: bool = True) -> AggregateCache:
+    return AggregateCache(directory, ttl_seconds=ttl, stale_while_revalidate=swr)
+
+
+@pytest.mark.asyncio
+class TestAggregateCache:
+    async def test_computes_once_then_serves_from_memory(self, tmp_path: Path) -> None:
+        cache = _cache(tmp_path)
+        compute = _Computer()
+
+        first = await cache.get_or_compute("overview", compute, _session())
+        second = await cache.get_or_compute("overview", compute, _session())
+
+        assert compute.calls == 1
+        assert second is first
+        assert first.etag == compute_etag({"data": {"calls": 1}})
+        assert cache.stats().hits == 1 and cache.stats().misses == 1
+
+    async def test_invalidate_forces_a_recompute(self, tmp_path: Path) -> None:
+        cache = _cache(tmp_path)
+        compute = _Computer()
+        before = await cache.get_or_compute("overview", compute, _session())
+
+        cache.invalidate()
+        after = await cache.get_or_compute("overview", compute, _session())
+
+        assert compute.calls == 2
+        assert after.etag != before.etag
+
+    async def test_second_process_starts_warm_from_disk(self, tmp_path: Path) -> None:
+        compute = _Computer()
+        await _cache(tmp_path).get_or_compute("overview", compute, _session())
+
+        restarted = _cache(tmp_path)
+        entry = await restarted.get_or_compute("overview", compute, _session())
+
+        assert compute.calls == 1
+        assert entry.payload == {"data": {"calls": 1}}
+        assert restarted.stats().disk_hits == 1
+
+    async def test_invalidation_reaches_other_processes(self, tmp_path: Path) -> None:
+        """A CLI sync bumps the shared generation; the API must notice."""
+        api, cli = _cache(tmp_path), _cache(tmp_path)
+        compute = _Computer()
+        await api.get_or_compute("overview", compute, _session())
+
+        cli.invalidate()
+        await api.get_or_compute("overview", compute, _session())
+
+        assert compute.calls == 2
+
+    async def test_generation_does_not_depend_on_marker_mtime(
+        self, tmp_path: Path
+    ) -> None:
+        """Coarse mtimes must not let two invalidations share a generation."""
+        cache = _cache(tmp_path)
+        marker = tmp_path / "generation"
+        cache.invalidate()
+        first = cache.generation()
+        stat = marker.stat()
+
+        cache.invalidate()
+        os.utime(marker, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert cache.generation() != first
+
+    async def test_expired_entry_is_served_while_revalidating(
+        self, tmp_path: Path
+    ) -> None:
+        cache = _cache(tmp_path, ttl=0.05)
+        compute = _Computer()
+        await cache.get_or_compute("overview", compute, _session())
+        await asyncio.sleep(0.06)
+
+        stale = await cache.get_or_compute(
+            "overview", compute, _session(), refresh_session=_refresh_scope
+        )
+        assert stale.payload == {"data": {"calls": 1}}
+        await asyncio.sleep(0)  # let the background refresh run
+        await asyncio.sleep(0)
+
+        fresh = await cache.get_or_compute("overview", compute, _session())
+        assert fresh.payload == {"data": {"calls": 2}}
+        assert cache.stats().stale_hits == 1
+        assert cache.stats().refreshes == 1
+
+    async def test_expired_entry_without_revalidation_recomputes_inline(
+        self, tmp_path: Path
+    ) -> None:
+        cache = _cache(tmp_path, ttl=0.05, swr=False)
+        compute = _Computer()
+        await cache.get_or_compute("overview", compute, _session())
+        await asyncio.sleep(0.06)
+
+        entry = await cache.get_or_compute(
+            "overview", compute, _session(), refresh_session=_refresh_scope
+        )
+
+        assert entry.payload == {"data": {"calls": 2}}
+
+    async def test_zero_ttl_disables_caching(self, tmp_path: Path) -> None:
+        cache = _cache(tmp_path, ttl=0)
+        compute = _Computer()
+
+        await cache.get_or_compute("overview", compute, _session())
+        await cache.get_or_compute("overview", compute, _session())
+
+        assert compute.calls == 2
+        assert not list(tmp_path.iterdir())
+
+    async def test_result_racing_an_invalidation_is_not_kept(self) -> None:
+        cache = _cache(None)
+
+        async def compute(session: AsyncSession) -> dict[str, Any]:
+            cache.invalidate()  # a write commits mid-computation
+            return {"data": "pre-write"}
+
+        await cache.get_or_compute("overview", compute, _session())
+
+        assert cache.stats().entries == 0
+
+
+@pytest.fixture
+def hooked_cache(monkeypatch: pytest.MonkeyPatch) -> AggregateCache:
+    cache = _cache(None)
+    monkeypatch.setattr(aggregate_cache_module, "aggregate_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    tables = [VideoCategory.__table__, AppIdentity.__table__]
+    VideoCategory.metadata.create_all(engine, tables=tables)  # type: ignore[arg-type]
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+class TestInvalidationHooks:
+    def test_committed_orm_write_bumps_the_generation(
+        self, hooked_cache: AggregateCache, session: Session
+    ) -> None:
+        before = hooked_cache.generation()
+        session.add(VideoCategory(category_id="10", name="Music", assignable=True))
+        session.commit()
+
+        assert hooked_cache.generation() != before
+
+    def test_bulk_statement_bumps_the_generation(
+        self, hooked_cache: AggregateCache, session: Session
+    ) -> None:
+        before = hooked_cache.generation()
+        session.execute(delete(VideoCategory))
+        session.commit()
+
+        assert hooked_cache.generation() != before
+
+    def test_rollback_and_unrelated_tables_do_not(
+        self, hooked_cache: AggregateCache, session: Session
+    ) -> None:
+        before = hooked_cache.generation()
+        session.add(VideoCategory(category_id="10", name="Music", assignable=True))
+        session.flush()
+        session.rollback()
+        session.execute(delete(AppIdentity))
+        session.commit()
+
+        assert hooked_cache.generation() == before
@@ -0,0 +1,85 @@
+"""Tests for the shared commit-time refresh queues."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import cast
+from unittest.mock import MagicMock
+
+from sqlalchemy.orm import Session, SessionTransaction
+
+from chronovista.db import commit_refresh
+from chronovista.db.commit_refresh import (
+    _discard_after_transaction_end,
+    _refresh_before_commit,
+    register_commit_refresh,
+)
+from chronovista.db.entity_associations import _PENDING_KEY as ASSOCIATIONS_KEY
+from chronovista.db.watch_rollups import _PENDING_KEY as ROLLUPS_KEY
+
+
+def _session(dialect: str = "postgresql") -> MagicMock:
+    session = MagicMock(spec=Session)
+    session.info = {}
+    session.connection.return_value.dialect.name = dialect
+    return session
+
+
+def test_derived_tables_share_the_hooks() -> None:
+    keys = [queue.info_key for queue in commit_refresh._QUEUES]
+
+    assert ASSOCIATIONS_KEY in keys
+    assert ROLLUPS_KEY in keys
+
+
+def test_refresh_pops_non_empty_queues_after_flushing() -> None:
+    refresh = MagicMock()
+    queue = register_commit_refresh("test_commit_refresh_queue", set, refresh)
+    try:
+        session = _session()
+        queue.pending(session).add("key")
+
+        _refresh_before_commit(session)
+
+        session.flush.assert_called_once_with()
+        refresh.assert_called_once_with(session, {"key"})
+        assert "test_commit_refresh_queue" not in session.info
+
+        _refresh_before_commit(session)
+        refresh.assert_called_once()
+    finally:
+        commit_refresh._QUEUES.remove(queue)
+
+
+def test_non_postgres_dialect_only_drops_the_queue() -> None:
+    refresh = MagicMock()
+    queue = register_commit_refresh("test_commit_refresh_queue", set, refresh)
+    try:
+        session = _session(dialect="sqlite")
+        queue.pending(session).add("key")
+
+        _refresh_before_commit(session)
+
+        refresh.assert_not_called()
+        assert "test_commit_refresh_queue" not in session.info
+    finally:
+        commit_refresh._QUEUES.remove(queue)
+
+
+def test_only_the_outermost_transaction_end_drops_queues() -> None:
+    queue = register_commit_refresh("test_commit_refresh_queue", set, MagicMock())
+    try:
+        session = _session()
+        queue.pending(session).add("key")
+
+        _discard_after_transaction_end(
+            session, cast(SessionTransaction, SimpleNamespace(parent=object()))
+        )
+        assert session.info["test_commit_refresh_queue"] == {"key"}
+
+        _discard_after_transaction_end(
+            session, cast(SessionTransaction, SimpleNamespace(parent=None))
+        )
+        assert "test_commit_refresh_queue" not in session.info
+    finally:
+        commit_refresh._QUEUES.remove(queue)
@@ -0,0 +1,201 @@
+"""Tests for the opt-in query instrumentation hooks and registry."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
+
+from chronovista.db.instrumentation import (
+    InstrumentedAsyncQueuePool,
+    LatencyHistogram,
+    RequestQueryStats,
+    _row_count,
+    current_request_stats,
+    install_query_instrumentation,
+    normalize_statement,
+    query_metrics,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics() -> Iterator[None]:
+    query_metrics.reset()
+    yield
+    query_metrics.reset()
+
+
+@pytest.fixture
+def engine():  # type: ignore[no-untyped-def]
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    install_query_instrumentation(engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)"))
+        conn.execute(text("INSERT INTO t (v) VALUES ('a'), ('b'), ('c')"))
+    query_metrics.reset()
+    yield engine
+    engine.dispose()
+
+
+class TestNormalizeStatement:
+    def test_collapses_expanded_in_lists(self) -> None:
+        short = normalize_statement("SELECT * FROM v WHERE id IN ($1, $2)")
+        long = normalize_statement("SELECT * FROM v WHERE id IN ($1, $2, $3, $4)")
+
+        assert short == long == "SELECT * FROM v WHERE id IN (?)"
+
+    def test_collapses_whitespace_and_casts(self) -> None:
+        statement = "SELECT *\n  FROM v\n WHERE id = $1::VARCHAR AND n > $2"
+
+        assert normalize_statement(statement) == (
+            "SELECT * FROM v WHERE id = ? AND n > ?"
+        )
+
+
+class TestLatencyHistogram:
+    def test_percentiles_are_bucket_bounds(self) -> None:
+        histogram = LatencyHistogram()
+        for ms in (0.5, 3, 3, 3, 40, 40, 40, 40, 40, 900):
+            histogram.observe(ms)
+
+        snapshot = histogram.to_model()
+
+        assert snapshot.count == 10
+        assert snapshot.p50_ms == 50
+        assert snapshot.p99_ms == 1000
+        assert snapshot.max_ms == 900
+        assert snapshot.buckets["le_1"] == 1
+        assert snapshot.buckets["le_5"] == 3
+        assert snapshot.buckets["le_inf"] == 0
+
+    def test_overflow_percentile_reports_the_max(self) -> None:
+        histogram = LatencyHistogram()
+        histogram.observe(20_000)
+
+        assert histogram.percentile(0.5) == 20_000
+        assert histogram.to_model().buckets["le_inf"] == 1
+
+    def test_empty_histogram(self) -> None:
+        snapshot = LatencyHistogram().to_model()
+
+        assert snapshot.count == 0
+        assert snapshot.p50_ms is None
+        assert snapshot.mean_ms is None
+
+
+class TestCursorHooks:
+    def test_statements_are_attributed_to_the_current_request(self, engine) -> None:  # type: ignore[no-untyped-def]
+        stats = RequestQueryStats(request_id="req-1")
+        token = current_request_stats.set(stats)
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT v FROM t")).all()
+                conn.execute(
+                    text("UPDATE t SET v = :v WHERE id > :id"), {"v": "x", "id": 1}
+                )
+        finally:
+            current_request_stats.reset(token)
+
+        assert stats.statements == 2
+        assert stats.rows == 2  # sqlite reports DML rowcounts only
+        assert stats.db_seconds > 0
+        snapshot = query_metrics.snapshot()
+        assert snapshot.unattributed_statements == 0
+        assert {s.statement for s in snapshot.statements} == {
+            "SELECT v FROM t",
+            "UPDATE t SET v = ? WHERE id > ?",
+        }
+
+    def test_statements_outside_a_request_are_unattributed(self, engine) -> None:  # type: ignore[no-untyped-def]
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        snapshot = query_metrics.snapshot()
+        assert snapshot.unattributed_statements == 1
+        assert snapshot.statements[0].calls == 1
+
+    def test_failed_statements_do_not_leak_start_times(self, engine) -> None:  # type: ignore[no-untyped-def]
+        with engine.connect() as conn:
+            with pytest.raises(Exception):
+                conn.execute(text("SELECT * FROM missing_table"))
+            assert not conn.info.get("chronovista_query_start")
+            conn.execute(text("SELECT 1"))
+
+        assert query_metrics.snapshot().statements[0].calls == 1
+
+    def test_install_is_idempotent(self, engine) -> None:  # type: ignore[no-untyped-def]
+        install_query_instrumentation(engine)
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert query_metrics.snapshot().statements[0].calls == 1
+
+
+class TestRowCount:
+    def test_prefers_rowcount_then_the_buffered_result(self) -> None:
+        class _Cursor:
+            def __init__(self, rowcount: int, rows: list[tuple[int]] | None) -> None:
+                self.rowcount = rowcount
+                self._rows = rows
+
+        assert _row_count(_Cursor(3, None)) == 3
+        assert _row_count(_Cursor(-1, [(1,), (2,)])) == 2
+        assert _row_count(_Cursor(-1, None)) == 0
+
+
+class TestRegistry:
+    def test_repeated_statements_are_flagged_per_route(self) -> None:
+        stats = RequestQueryStats(request_id="req-9", route="GET /api/v1/videos")
+        stats.per_statement["SELECT a"] = 12
+        stats.per_statement["SELECT b"] = 3
+        stats.statements = 15
+
+        repeated = query_metrics.record_request(stats, 0.05, n_plus_one_threshold=10)
+
+        assert repeated == {"SELECT a": 12}
+        snapshot = query_metrics.snapshot()
+        (flag,) = snapshot.n_plus_one
+        assert (flag.route, flag.statement, flag.max_repeats) == (
+            "GET /api/v1/videos",
+            "SELECT a",
+            12,
+        )
+        assert flag.last_request_id == "req-9"
+        (route,) = snapshot.routes
+        assert route.requests == 1
+        assert route.statements == 15
+        assert route.latency.count == 1
+
+    def test_distinct_statements_are_bounded(self, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+        monkeypatch.setattr("chronovista.db.instrumentation.MAX_TRACKED_STATEMENTS", 2)
+        for i in range(5):
+            query_metrics.record_statement(f"SELECT {i}", 0.001, 1, attributed=False)
+
+        statements = {s.statement: s.calls for s in query_metrics.snapshot().statements}
+
+        assert statements == {"SELECT 0": 1, "SELECT 1": 1, "<other>": 3}
+
+
+class TestInstrumentedPool:
+    def test_checkout_wait_is_recorded_and_attributed(self, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+        def slow_get(self):  # type: ignore[no-untyped-def]
+            time.sleep(0.01)
+            return "connection"
+
+        monkeypatch.setattr(AsyncAdaptedQueuePool, "_do_get", slow_get)
+        pool = object.__new__(InstrumentedAsyncQueuePool)
+        stats = RequestQueryStats()
+        token = current_request_stats.set(stats)
+        try:
+            assert pool._do_get() == "connection"
+        finally:
+            current_request_stats.reset(token)
+
+        wait = query_metrics.snapshot().pool_checkout_wait
+        assert wait.count == 1
+        assert wait.max_ms >= 10
+        assert stats.pool_wait_seconds >= 0.01
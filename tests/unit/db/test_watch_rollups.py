@@ -0,0 +1,155 @@
+"""Tests for the watch-history rollup statements and commit-time queue."""
+
+from __future__ import annotations
+
+import datetime
+import re
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from chronovista.db.models import UserVideo
+from chronovista.db.watch_rollups import (
+    _PENDING_KEY,
+    queue_full_refresh,
+    rebuild_statements,
+    refresh_statements,
+)
+
+UTC = datetime.UTC
+MORNING = datetime.datetime(2025, 3, 1, 9, 15, tzinfo=UTC)
+EVENING = datetime.datetime(2025, 3, 4, 21, 40, tzinfo=UTC)
+
+
+def _sql(statement) -> str:  # type: ignore[no-untyped-def]
+    raw = str(statement.compile(dialect=postgresql.dialect()))
+    return re.sub(r"\s+", " ", raw).strip()
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    # SQLite: the hooks queue as usual, but the refresh itself only runs on
+    # PostgreSQL, so these tests observe the queue rather than rollup rows.
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    UserVideo.metadata.create_all(engine, tables=[UserVideo.__table__])  # type: ignore[list-item]
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def _pending(session: Session) -> dict[str, set[datetime.datetime] | None]:
+    return dict(session.info.get(_PENDING_KEY, {}))
+
+
+class TestStatements:
+    def test_refresh_recomputes_whole_days_for_one_user(self) -> None:
+        statements = refresh_statements("u1", [MORNING, EVENING])
+
+        assert len(statements) == 4
+        delete_daily, insert_daily, delete_hourly, insert_hourly = map(_sql, statements)
+        assert delete_daily.startswith("DELETE FROM user_watch_daily")
+        assert "GROUP BY uv.user_id, date(uv.watched_at)" in insert_daily
+        assert delete_hourly.startswith("DELETE FROM user_watch_hourly")
+        assert "date_trunc('hour', uv.watched_at)" in insert_hourly
+        # Index-friendly range on watched_at, not only a date() comparison.
+        assert "uv.watched_at >= CAST(" in insert_daily
+
+    def test_refresh_binds_the_user_and_utc_stamps(self) -> None:
+        naive = datetime.datetime(2025, 3, 1, 9, 15)
+        statement = refresh_statements("u1", [naive])[1]
+
+        params = statement.compile(dialect=postgresql.dialect()).params
+        assert params["user_id"] == "u1"
+        assert params["stamps"] == [MORNING]
+
+    def test_rebuild_all_users_has_no_user_filter(self) -> None:
+        statements = rebuild_statements()
+
+        assert [s.split(" ")[0] for s in map(_sql, statements)] == [
+            "DELETE",
+            "INSERT",
+            "DELETE",
+            "INSERT",
+        ]
+        assert all(":user_id" not in str(s) for s in statements)
+
+    def test_rebuild_one_user_filters_source_and_target(self) -> None:
+        statements = rebuild_statements("u1")
+
+        assert all(
+            s.compile(dialect=postgresql.dialect()).params["user_id"] == "u1"
+            for s in statements
+        )
+        assert "uv.user_id = %(user_id)s" in _sql(statements[1])
+
+
+class TestQueue:
+    def test_new_rows_queue_their_watch_time(self, session: Session) -> None:
+        session.add(UserVideo(user_id="u1", video_id="v1", watched_at=MORNING))
+        session.add(UserVideo(user_id="u1", video_id="v2", watched_at=None))
+        session.flush()
+
+        # The unwatched row has no bucket to refresh.
+        assert _pending(session) == {"u1": {MORNING}}
+
+    def test_moving_a_watch_queues_both_days(self, session: Session) -> None:
+        row = UserVideo(user_id="u1", video_id="v1", watched_at=MORNING)
+        session.add(row)
+        session.commit()
+
+        row.watched_at = EVENING
+        session.flush()
+
+        assert {s.day for s in _pending(session)["u1"] or ()} == {1, 4}
+
+    def test_rekeying_a_row_queues_the_old_user(self, session: Session) -> None:
+        row = UserVideo(user_id="u1", video_id="v1", watched_at=MORNING)
+        session.add(row)
+        session.commit()
+
+        row.user_id = "u2"
+        session.flush()
+
+        assert set(_pending(session)) == {"u1", "u2"}
+
+    def test_unrelated_changes_queue_nothing(self, session: Session) -> None:
+        row = UserVideo(user_id="u1", video_id="v1", watched_at=MORNING)
+        session.add(row)
+        session.commit()
+
+        row.liked = True
+        session.flush()
+
+        assert _pending(session) == {}
+
+    def test_deletes_queue_the_removed_watch(self, session: Session) -> None:
+        row = UserVideo(user_id="u1", video_id="v1", watched_at=MORNING)
+        session.add(row)
+        session.commit()
+
+        session.delete(row)
+        session.flush()
+
+        assert set(_pending(session)) == {"u1"}
+
+    def test_full_refresh_supersedes_stamps(self, session: Session) -> None:
+        queue_full_refresh(session, "u1")
+        session.add(UserVideo(user_id="u1", video_id="v1", watched_at=MORNING))
+        session.flush()
+
+        assert _pending(session) == {"u1": None}
+
+    def test_commit_and_rollback_clear_the_queue(self, session: Session) -> None:
+        session.add(UserVideo(user_id="u1", video_id="v1", watched_at=MORNING))
+        session.commit()
+        assert _pending(session) == {}
+
+        session.add(UserVideo(user_id="u1", video_id="v2", watched_at=EVENING))
+        session.flush()
+        assert _pending(session)
+        session.rollback()
+        assert _pending(session) == {}
@@ -136,6 +136,7 @@ class TestEnrichmentSummary:
             "categories_assigned": 48,
             "errors": 1,
             "quota_used": 750,
+            "topic_cache": None,  # Only set when topic URLs were resolved
             # Playlist enrichment fields (defaults to 0)
             "playlists_processed": 0,
             "playlists_updated": 0,
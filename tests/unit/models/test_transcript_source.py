@@ -0,0 +1,50 @@
+"""
+Tests for transcript source helpers.
+
+``canonical_language_code`` defines the single spelling stored in every
+``language_code`` column, so read paths can compare the column directly.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from chronovista.models.enums import LanguageCode
+from chronovista.models.transcript_source import canonical_language_code
+
+
+class TestCanonicalLanguageCode:
+    """Tests for ``canonical_language_code``."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("en-US", "en-US"),
+            ("EN-us", "en-US"),
+            ("en-us", "en-US"),
+            ("ES-MX", "es-MX"),
+            ("es-419", "es-419"),
+            ("EN", "en"),
+            ("FIL", "fil"),
+            ("es-xx", "es-XX"),
+            ("sr-Latn-RS", "sr-latn-rs"),
+        ],
+    )
+    def test_canonical_spelling(self, raw: str, expected: str) -> None:
+        """Language is lowercased, a two-part region uppercased."""
+        assert canonical_language_code(raw) == expected
+
+    def test_enum_input(self) -> None:
+        """Enum members map to their value."""
+        assert canonical_language_code(LanguageCode.ENGLISH_US) == "en-US"
+
+    @pytest.mark.parametrize("raw", ["EN-us", "fil", "zh-hans", "es-419", "xyz"])
+    def test_idempotent(self, raw: str) -> None:
+        """Canonicalizing a canonical code is a no-op."""
+        once = canonical_language_code(raw)
+        assert canonical_language_code(once) == once
+
+    def test_case_variants_collapse(self) -> None:
+        """Every casing of a code shares one stored spelling."""
+        variants = {"en-us", "EN-US", "En-Us", "en-US"}
+        assert {canonical_language_code(v) for v in variants} == {"en-US"}
@@ -0,0 +1,226 @@
+"""
+Tests for the streaming Takeout comment and live-chat parser.
+"""
+
+from __future__ import annotations
+
+import csv
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from chronovista.parsers.takeout_message_parser import (
+    MessageDigest,
+    MessageFilter,
+    TakeoutMessage,
+    clean_message_text,
+    iter_takeout_messages,
+    parse_message_timestamp,
+)
+
+_COMMENT_HEADER = [
+    "Comment ID",
+    "Channel ID",
+    "Comment Create Timestamp",
+    "Price",
+    "Video ID",
+    "Comment Text",
+]
+
+
+def _write_comments(path: Path, rows: list[list[str]]) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(_COMMENT_HEADER)
+        writer.writerows(rows)
+
+
+def _comment(comment_id: str, timestamp: str, video_id: str, text: str) -> list[str]:
+    return [comment_id, "UCauthor", timestamp, "0", video_id, text]
+
+
+def _message(
+    message_id: str, posted_at: datetime | None, video_id: str = "vid"
+) -> TakeoutMessage:
+    return TakeoutMessage(
+        kind="comment",
+        message_id=message_id,
+        video_id=video_id,
+        channel_id="UCauthor",
+        posted_at=posted_at,
+        text=f"text {message_id}",
+    )
+
+
+def _day(day: int) -> datetime:
+    return datetime(2023, 1, day, tzinfo=UTC)
+
+
+class TestCleanMessageText:
+    """Takeout's JSON text runs flatten to display text."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ('{"text":"Great video!"}', "Great video!"),
+            ('{"text":"Great "},{"text":"@9:20"}', "Great @9:20"),
+            ('[{"text":"a  b"},{"text":"\\nc"}]', "a b c"),
+            ("plain text ", "plain text"),
+            ('{"text": broken', '{"text": broken'),
+            ("", ""),
+        ],
+    )
+    def test_flattens_runs(self, raw: str, expected: str) -> None:
+        assert clean_message_text(raw) == expected
+
+
+class TestParseMessageTimestamp:
+    """Create timestamps parse as aware datetimes or not at all."""
+
+    def test_zulu_suffix_is_utc(self) -> None:
+        assert parse_message_timestamp("2023-01-15T14:30:00Z") == datetime(
+            2023, 1, 15, 14, 30, tzinfo=UTC
+        )
+
+    @pytest.mark.parametrize("value", ["", "yesterday"])
+    def test_missing_or_malformed_is_none(self, value: str) -> None:
+        assert parse_message_timestamp(value) is None
+
+
+class TestIterTakeoutMessages:
+    """Rows stream from every CSV, filtered as they are read."""
+
+    def test_streams_every_file_in_name_order(self, tmp_path: Path) -> None:
+        _write_comments(
+            tmp_path / "b.csv",
+            [_comment("c3", "2023-01-03T00:00:00Z", "vid3", '{"text":"three"}')],
+        )
+        _write_comments(
+            tmp_path / "a.csv",
+            [
+                _comment("c1", "2023-01-01T00:00:00Z", "vid1", '{"text":"one"}'),
+                _comment("c2", "", "vid2", "two"),
+            ],
+        )
+        read: list[int] = []
+
+        messages = list(
+            iter_takeout_messages(tmp_path, "comment", progress_callback=read.append)
+        )
+
+        assert [m.message_id for m in messages] == ["c1", "c2", "c3"]
+        assert messages[0].text == "one"
+        assert messages[0].posted_at == _day(1)
+        assert messages[1].posted_at is None
+        assert read == [2, 1]
+
+    def test_filters_by_text_video_and_date(self, tmp_path: Path) -> None:
+        _write_comments(
+            tmp_path / "comments.csv",
+            [
+                _comment("c1", "2023-01-01T00:00:00Z", "vid1", "Python tips"),
+                _comment("c2", "2023-01-05T00:00:00Z", "vid2", "python again"),
+                _comment("c3", "2023-01-09T00:00:00Z", "pyVid", "unrelated"),
+                _comment("c4", "", "vid4", "python, undated"),
+            ],
+        )
+        read: list[int] = []
+
+        messages = iter_takeout_messages(
+            tmp_path,
+            "comment",
+            MessageFilter(text="PY", since=_day(2), until=_day(9)),
+            progress_callback=read.append,
+        )
+
+        assert [m.message_id for m in messages] == ["c2", "c3"]
+        assert read == [4]
+
+    def test_live_chat_columns(self, tmp_path: Path) -> None:
+        with open(tmp_path / "chats.csv", "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                [
+                    "Live Chat ID",
+                    "Channel ID",
+                    "Live Chat Create Timestamp",
+                    "Video ID",
+                    "Live Chat Text",
+                ]
+            )
+            writer.writerow(
+                ["l1", "UCa", "2023-01-01T00:00:00Z", "vid", '{"text":"hi"}']
+            )
+
+        (message,) = iter_takeout_messages(tmp_path, "live_chat")
+
+        assert (message.kind, message.message_id, message.text) == (
+            "live_chat",
+            "l1",
+            "hi",
+        )
+
+
+class TestMessageDigest:
+    """Totals cover every message; only the top N are kept."""
+
+    def test_recent_keeps_the_newest_n(self) -> None:
+        messages = [_message(f"m{d}", _day(d)) for d in (3, 1, 5, 2, 4)]
+
+        digest = MessageDigest(limit=2, sort_order="recent").extend(messages)
+
+        assert [m.message_id for m in digest.rows] == ["m5", "m4"]
+        assert digest.total == 5
+        assert (digest.first_posted, digest.last_posted) == (_day(1), _day(5))
+        assert len(digest._kept) == 2
+
+    def test_oldest_puts_undated_last(self) -> None:
+        messages = [_message("undated", None), _message("m2", _day(2))]
+
+        digest = MessageDigest(limit=None, sort_order="oldest").extend(messages)
+
+        assert [m.message_id for m in digest.rows] == ["m2", "undated"]
+
+    def test_default_keeps_the_first_n_read(self) -> None:
+        messages = [_message(f"m{i}", _day(10 - i)) for i in range(1, 6)]
+
+        digest = MessageDigest(limit=3).extend(messages)
+
+        assert [m.message_id for m in digest.rows] == ["m1", "m2", "m3"]
+
+    def test_ties_keep_read_order(self) -> None:
+        messages = [_message(f"m{i}", _day(1)) for i in range(4)]
+
+        digest = MessageDigest(limit=2, sort_order="recent").extend(messages)
+
+        assert [m.message_id for m in digest.rows] == ["m0", "m1"]
+
+    def test_counts_videos_and_skips_empty_ids(self) -> None:
+        messages = [
+            _message("a", _day(1), "vid1"),
+            _message("b", _day(2), "vid1"),
+            _message("c", _day(3), ""),
+        ]
+
+        digest = MessageDigest(limit=0).extend(messages)
+
+        assert digest.video_counts == {"vid1": 2}
+        assert digest.rows == []
+
+    def test_from_totals_preserves_row_order(self) -> None:
+        rows = [_message("new", _day(5)), _message("old", _day(1))]
+
+        digest = MessageDigest.from_totals(
+            rows,
+            limit=2,
+            sort_order="recent",
+            total=7,
+            first_posted=_day(1),
+            last_posted=_day(5),
+            video_counts={"vid": 7},
+        )
+
+        assert digest.rows == rows
+        assert digest.total == 7
+        assert digest.video_counts == {"vid": 7}
@@ -100,21 +100,23 @@ class TestCountAggregationShape:
     """The count path aggregates in SQL, not by materialising triples in Python."""
 
     async def test_counts_aggregate_in_sql_not_per_row(self) -> None:
-        """One bounded aggregating query with COUNT(DISTINCT)/GROUP BY over a union.
+        """One aggregating query over the stored associations, whatever the page.
 
-        With an all-empty mock the alias arm short-circuits, so the counter
-        issues two statements: the alias-fetch and the aggregating count query.
-        Its shape is what keeps a heavy entity's thousands of rows inside
-        Postgres rather than crossing into Python (the 2.4s→0.7s fix).
+        The counts read ``entity_video_associations`` (one row per entity and
+        video), so ``COUNT(*)`` is the distinct-video total and no association
+        arm is rebuilt or unioned per request. The per-source parts test the
+        evidence bitmask.
         """
         one = await _capture_count_sql([uuid.uuid4()])
         many = await _capture_count_sql([uuid.uuid4() for _ in range(25)])
-        assert len(one) == len(many), "count query grows with page size"
-
-        agg = next(s for s in one if "GROUP BY" in s.upper())
-        assert "COUNT(DISTINCT" in agg.upper(), "distinct-video counting in SQL"
-        assert "UNION ALL" in agg.upper(), "the association paths are unioned"
-        assert "FILTER" in agg.upper(), "per-source breakdown via FILTER (WHERE ...)"
+        assert len(one) == len(many) == 1, "count query grows with page size"
+
+        agg = one[0].upper()
+        assert "FROM ENTITY_VIDEO_ASSOCIATIONS" in agg
+        assert "GROUP BY" in agg
+        assert "UNION" not in agg, "association arms rebuilt per request"
+        assert "FILTER" in agg, "per-source breakdown via FILTER (WHERE ...)"
+        assert "EVIDENCE &" in agg, "per-source parts read the evidence bits"
 
     async def test_count_query_has_no_correlated_exists(self) -> None:
         for sql in await _capture_count_sql([uuid.uuid4(), uuid.uuid4()]):
@@ -0,0 +1,232 @@
+"""
+Tests for the entity-video association maintenance hooks.
+
+Covers the Python side of ``chronovista.db.entity_associations``: which flushed
+objects queue a refresh, the explicit queue for Core writes, and what the
+commit hook hands to the materialiser.
+"""
+
+from __future__ import annotations
+
+import uuid
+from types import SimpleNamespace
+from typing import cast
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.orm import Session, SessionTransaction
+
+from chronovista.db.commit_refresh import (
+    _discard_after_transaction_end,
+    _refresh_before_commit,
+)
+from chronovista.db.entity_associations import (
+    _PENDING_KEY,
+    _collect_after_flush,
+    queue_association_refresh,
+)
+from chronovista.db.models import EntityAlias as EntityAliasDB
+from chronovista.db.models import EntityMention as EntityMentionDB
+from chronovista.db.models import TagAlias as TagAliasDB
+from chronovista.db.models import Video as VideoDB
+from chronovista.db.models import VideoTag as VideoTagDB
+from chronovista.models.enums import AvailabilityStatus
+
+_ENTITY = uuid.UUID(int=1)
+_MATERIALIZE = (
+    "chronovista.repositories.entity_mention_repository."
+    "EntityMentionRepository.materialize_associations"
+)
+_COOCCURRENCES = (
+    "chronovista.repositories.entity_mention_repository."
+    "EntityMentionRepository.materialize_cooccurrences"
+)
+
+
+def _session(
+    new: list[object] | None = None,
+    dirty: list[object] | None = None,
+    deleted: list[object] | None = None,
+    dialect: str = "postgresql",
+) -> MagicMock:
+    session = MagicMock(spec=Session)
+    session.info = {}
+    session.new = new or []
+    session.dirty = dirty or []
+    session.deleted = deleted or []
+    session.connection.return_value.dialect.name = dialect
+    return session
+
+
+def _mention(video_id: str) -> EntityMentionDB:
+    return EntityMentionDB(
+        entity_id=_ENTITY,
+        video_id=video_id,
+        mention_text="Ada Lovelace",
+        mention_source="manual",
+        detection_method="manual",
+    )
+
+
+class TestCollectAfterFlush:
+    """Which flushed objects queue a refresh, and of what."""
+
+    def test_mentions_and_tags_queue_their_videos(self) -> None:
+        session = _session(
+            new=[_mention("vid_a"), object()],
+            deleted=[VideoTagDB(video_id="vid_b", tag="ada")],
+        )
+
+        _collect_after_flush(session, MagicMock())
+
+        pending = session.info[_PENDING_KEY]
+        assert pending.video_ids == {"vid_a", "vid_b"}
+        assert not pending.entity_ids
+
+    def test_aliases_queue_their_entity(self) -> None:
+        alias = EntityAliasDB(entity_id=_ENTITY, alias_name="Ada", alias_type="name")
+        session = _session(new=[alias])
+
+        _collect_after_flush(session, MagicMock())
+
+        assert session.info[_PENDING_KEY].entity_ids == {_ENTITY}
+
+    def test_tag_aliases_queue_their_raw_form(self) -> None:
+        tag_alias = TagAliasDB(raw_form="Ada", normalized_form="ada")
+        session = _session(deleted=[tag_alias])
+
+        _collect_after_flush(session, MagicMock())
+
+        assert session.info[_PENDING_KEY].tags == {"Ada"}
+
+    def test_video_availability_queues_a_cooccurrence_recount(self) -> None:
+        video = VideoDB(
+            video_id="vid_a",
+            title="Ada",
+            availability_status=AvailabilityStatus.UNAVAILABLE,
+        )
+        session = _session(new=[video])
+
+        _collect_after_flush(session, MagicMock())
+
+        pending = session.info[_PENDING_KEY]
+        assert pending.availability_video_ids == {"vid_a"}
+        assert not pending.video_ids
+
+    def test_dirty_objects_need_an_association_change(self) -> None:
+        session = _session(dirty=[_mention("vid_a")])
+
+        with patch(
+            "chronovista.db.entity_associations.get_history",
+            return_value=MagicMock(
+                has_changes=MagicMock(return_value=False), deleted=()
+            ),
+        ):
+            _collect_after_flush(session, MagicMock())
+
+        assert _PENDING_KEY not in session.info
+
+    def test_moved_rows_queue_the_old_key_too(self) -> None:
+        mention = _mention("vid_new")
+        session = _session(dirty=[mention])
+
+        with patch(
+            "chronovista.db.entity_associations.get_history",
+            return_value=MagicMock(
+                has_changes=MagicMock(return_value=True), deleted=["vid_old"]
+            ),
+        ):
+            _collect_after_flush(session, MagicMock())
+
+        assert session.info[_PENDING_KEY].video_ids == {"vid_new", "vid_old"}
+
+
+class TestRefreshBeforeCommit:
+    """What the commit hook hands to the materialiser."""
+
+    def test_queued_keys_are_refreshed_once(self) -> None:
+        session = _session()
+        queue_association_refresh(session, video_ids=["vid_a"])
+        queue_association_refresh(session, entity_ids=[_ENTITY], video_ids=["vid_b"])
+
+        with patch(_MATERIALIZE) as materialize:
+            _refresh_before_commit(session)
+
+        materialize.assert_called_once_with(
+            session, entity_ids={_ENTITY}, video_ids={"vid_a", "vid_b"}
+        )
+        assert _PENDING_KEY not in session.info
+
+    def test_everything_rebuilds_the_table(self) -> None:
+        session = _session()
+        queue_association_refresh(session, video_ids=["vid_a"], everything=True)
+
+        with patch(_MATERIALIZE) as materialize:
+            _refresh_before_commit(session)
+
+        materialize.assert_called_once_with(session)
+
+    def test_tags_resolve_to_the_videos_carrying_them(self) -> None:
+        session = _session()
+        session.execute.return_value.scalars.return_value = ["vid_t"]
+        queue_association_refresh(session, tags=["Ada"])
+
+        with patch(_MATERIALIZE) as materialize:
+            _refresh_before_commit(session)
+
+        params = session.execute.call_args.args[1]
+        assert params["tags"] == ["Ada"]
+        assert materialize.call_args.kwargs["video_ids"] == {"vid_t"}
+
+    def test_availability_changes_recount_cooccurrences_only(self) -> None:
+        session = _session()
+        queue_association_refresh(session, availability_video_ids=["vid_a"])
+
+        with (
+            patch(_MATERIALIZE) as materialize,
+            patch(_COOCCURRENCES) as cooccurrences,
+        ):
+            _refresh_before_commit(session)
+
+        materialize.assert_not_called()
+        cooccurrences.assert_called_once_with(session, video_ids={"vid_a"})
+
+    def test_empty_queue_refreshes_nothing(self) -> None:
+        session = _session()
+
+        with patch(_MATERIALIZE) as materialize:
+            _refresh_before_commit(session)
+
+        materialize.assert_not_called()
+
+    def test_non_postgres_dialect_is_skipped(self) -> None:
+        session = _session(dialect="sqlite")
+        queue_association_refresh(session, video_ids=["vid_a"])
+
+        with patch(_MATERIALIZE) as materialize:
+            _refresh_before_commit(session)
+
+        materialize.assert_not_called()
+
+
+class TestDiscardAfterTransactionEnd:
+    """A transaction that ends without committing drops its queue."""
+
+    def test_outermost_transaction_drops_the_queue(self) -> None:
+        session = _session()
+        queue_association_refresh(session, video_ids=["vid_a"])
+
+        _discard_after_transaction_end(
+            session, cast(SessionTransaction, SimpleNamespace(parent=None))
+        )
+
+        assert _PENDING_KEY not in session.info
+
+    def test_savepoint_keeps_the_queue(self) -> None:
+        session = _session()
+        queue_association_refresh(session, video_ids=["vid_a"])
+
+        _discard_after_transaction_end(
+            session, cast(SessionTransaction, SimpleNamespace(parent=object()))
+        )
+
+        assert session.info[_PENDING_KEY].video_ids == {"vid_a"}
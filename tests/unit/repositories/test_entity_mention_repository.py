@@ -8,6 +8,8 @@ Covers all public methods with mocked AsyncSession:
 - get_entities_with_zero_mentions() — entities with no mention rows
 - update_entity_counters()        — refreshes mention_count / video_count on named_entities
                                     (Feature 044 T009: ASR-error alias exclusion tests added)
+- apply_counter_deltas()          — incremental counter adjustment for written mentions
+- find_counter_drift()            — stored counters that disagree with a recompute
 - get_video_entity_summary()      — per-entity aggregation for a video
 - get_entity_video_list()         — paginated video list where an entity is mentioned
 - get_statistics()                — aggregate stats with optional entity_type filter
@@ -26,6 +28,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import UTC, datetime
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -33,6 +36,7 @@ import pytest
 from sqlalchemy.dialects import postgresql as pg_dialect
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 from uuid_utils import uuid7
 
 from chronovista.db.models import EntityMention as EntityMentionDB
@@ -731,16 +735,23 @@ class TestDeleteByCorrectionIds:
     ) -> None:
         """Deletes mentions whose correction_id is in the given list."""
         session = MagicMock(spec=AsyncSession)
+        session.info = {}
         session.execute = AsyncMock()
         mock_result = MagicMock()
-        mock_result.rowcount = 5
+        mock_result.scalars.return_value.all.return_value = [
+            "vid_a",
+            "vid_a",
+            "vid_b",
+        ]
         session.execute.return_value = mock_result
 
         corr_ids = [uuid.uuid4(), uuid.uuid4()]
         count = await repository.delete_by_correction_ids(session, corr_ids)
 
-        assert count == 5
+        assert count == 3
         session.execute.assert_called_once()
+        pending = session.info["chronovista_entity_associations_pending"]
+        assert pending.video_ids == {"vid_a", "vid_b"}
 
     async def test_empty_list_returns_zero(
         self, repository: EntityMentionRepository
@@ -1321,6 +1332,179 @@ class TestUpdateAliasCounters:
         assert "occurrence_count" in sql_str
 
 
+# ---------------------------------------------------------------------------
+# TestApplyCounterDeltas
+# ---------------------------------------------------------------------------
+
+
+def _rows_result(rows: list[Any]) -> MagicMock:
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+class TestApplyCounterDeltas:
+    """Tests for apply_counter_deltas() and the writers that use it.
+
+    Three statements: the alias UPDATE, the per-(entity, video) delta query
+    and the entity UPDATE. ``video_count`` moves only for pairs whose visible
+    mention count crosses zero.
+    """
+
+    @pytest.fixture
+    def repository(self) -> EntityMentionRepository:
+        """Provide a fresh repository instance for each test."""
+        return EntityMentionRepository()
+
+    @pytest.fixture
+    def mock_session(self) -> MagicMock:
+        """Provide a mock async session for each test."""
+        return _make_mock_session()
+
+    async def test_no_net_change_is_noop(
+        self,
+        repository: EntityMentionRepository,
+        mock_session: MagicMock,
+    ) -> None:
+        """An added and removed copy of the same key cancel out without SQL."""
+        key = (_uuid(), "dQw4w9WgXcQ", "Ada")
+
+        await repository.apply_counter_deltas(mock_session)
+        await repository.apply_counter_deltas(mock_session, added=[key], removed=[key])
+
+        mock_session.execute.assert_not_called()
+
+    async def test_video_count_moves_only_when_pair_crosses_zero(
+        self,
+        repository: EntityMentionRepository,
+        mock_session: MagicMock,
+    ) -> None:
+        """First mention in a video +1, last mention gone -1, otherwise 0."""
+        first, last, more = _uuid(), _uuid(), _uuid()
+        mock_session.execute.side_effect = [
+            MagicMock(),
+            _rows_result([(first, 1, 1), (last, -1, 0), (more, 2, 5)]),
+            MagicMock(),
+        ]
+
+        await repository.apply_counter_deltas(
+            mock_session,
+            added=[
+                (first, "v1", "Ada"),
+                (more, "v2", "Grace"),
+                (more, "v2", "Grace"),
+            ],
+            removed=[(last, "v3", "Alan")],
+        )
+
+        assert mock_session.execute.call_count == 3
+        params = mock_session.execute.call_args_list[2].args[0].compile().params
+        by_entity = dict(
+            zip(
+                params["counter_entity_ids"],
+                zip(params["mention_deltas"], params["video_deltas"], strict=True),
+                strict=True,
+            )
+        )
+        assert by_entity == {first: (1, 1), last: (-1, -1), more: (2, 0)}
+
+    async def test_invisible_only_change_skips_entity_update(
+        self,
+        repository: EntityMentionRepository,
+        mock_session: MagicMock,
+    ) -> None:
+        """Mentions matching only ASR-error aliases move alias counts alone."""
+        mock_session.execute.side_effect = [MagicMock(), _rows_result([])]
+
+        await repository.apply_counter_deltas(
+            mock_session, added=[(_uuid(), "v1", "asr form")]
+        )
+
+        assert mock_session.execute.call_count == 2
+        alias_sql = str(mock_session.execute.call_args_list[0].args[0])
+        assert "UPDATE entity_aliases" in alias_sql
+        assert "occurrence_count=(entity_aliases.occurrence_count +" in alias_sql
+
+    async def test_bulk_create_adjusting_counters_passes_inserted_rows(
+        self,
+        repository: EntityMentionRepository,
+        mock_session: MagicMock,
+    ) -> None:
+        """Only rows RETURNING from the insert (not conflicts) become deltas."""
+        entity_id = _uuid()
+        inserted = MagicMock(
+            entity_id=entity_id, video_id="dQw4w9WgXcQ", mention_text="Ada"
+        )
+        mock_session.execute.return_value = _rows_result([inserted])
+        mention = EntityMentionCreate(
+            entity_id=entity_id,
+            segment_id=1,
+            video_id="dQw4w9WgXcQ",
+            language_code="en",
+            mention_text="Ada",
+            detection_method=DetectionMethod.RULE_MATCH,
+            confidence=1.0,
+        )
+
+        with patch.object(
+            repository, "apply_counter_deltas", new=AsyncMock()
+        ) as mock_deltas:
+            count = await repository.bulk_create_with_conflict_skip(
+                mock_session, [mention, mention], adjust_counters=True
+            )
+
+        assert count == 1
+        assert "RETURNING" in str(mock_session.execute.call_args.args[0])
+        mock_deltas.assert_awaited_once_with(
+            mock_session, added=[(entity_id, "dQw4w9WgXcQ", "Ada")]
+        )
+
+    async def test_delete_rule_matches_subtracts_deleted_rows(
+        self,
+        repository: EntityMentionRepository,
+        mock_session: MagicMock,
+    ) -> None:
+        """The changed-segment delete returns its count and subtracts its rows."""
+        entity_id = _uuid()
+        gone = MagicMock(entity_id=entity_id, video_id="v1", mention_text="Ada")
+        mock_session.execute.return_value = _rows_result([gone, gone])
+
+        with patch.object(
+            repository, "apply_counter_deltas", new=AsyncMock()
+        ) as mock_deltas:
+            count = await repository.delete_rule_matches_for_segments(
+                mock_session, [1, 2]
+            )
+
+        assert count == 2
+        mock_deltas.assert_awaited_once_with(
+            mock_session, removed=[(entity_id, "v1", "Ada")] * 2
+        )
+
+
+class TestFindCounterDrift:
+    """Tests for find_counter_drift()."""
+
+    async def test_returns_entity_rows_and_alias_entities(self) -> None:
+        repository = EntityMentionRepository()
+        session = _make_mock_session()
+        entity_id, alias_entity_id = _uuid(), _uuid()
+        alias_result = MagicMock()
+        alias_result.scalars.return_value.all.return_value = [alias_entity_id]
+        session.execute.side_effect = [
+            _rows_result([(entity_id, 5, 2, 4, 2)]),
+            alias_result,
+        ]
+
+        entity_drift, alias_drift = await repository.find_counter_drift(session)
+
+        assert entity_drift == [(entity_id, 5, 2, 4, 2)]
+        assert alias_drift == [alias_entity_id]
+        entity_sql = str(session.execute.call_args_list[0].args[0])
+        assert "LEFT OUTER JOIN" in entity_sql
+        assert "named_entities.mention_count !=" in entity_sql
+
+
 # ---------------------------------------------------------------------------
 # TestGetVideoEntitySummary
 # ---------------------------------------------------------------------------
@@ -3124,7 +3308,7 @@ class TestCreateManualAssociation:
     - Raises APIValidationError (422) if the entity status is 'deprecated'.
     - Raises NotFoundError (404) if video_id does not exist in the videos table.
     - Raises NotFoundError (404) if entity_id does not exist in named_entities.
-    - Calls update_entity_counters() with [entity_id] after a successful insert.
+    - Calls apply_counter_deltas() with the new mention after a successful insert.
     """
 
     @pytest.fixture
@@ -3241,15 +3425,15 @@ class TestCreateManualAssociation:
 
         mock_session.flush.side_effect = _flush_side_effect
 
-        # Patch update_entity_counters to capture calls
+        # Patch apply_counter_deltas to capture calls
         with patch.object(
-            repository, "update_entity_counters", new=AsyncMock()
+            repository, "apply_counter_deltas", new=AsyncMock()
         ) as mock_counters:
             result = await repository.create_manual_association(
                 mock_session, video_id=video_id, entity_id=entity_id
             )
 
-        # The method must call update_entity_counters at least once
+        # The method must adjust the counters exactly once
         mock_counters.assert_called_once()
 
         # The result must be an EntityMentionDB (or compatible mock)
@@ -3388,16 +3572,17 @@ class TestCreateManualAssociation:
                 mock_session, video_id=video_id, entity_id=entity_id
             )
 
-    async def test_create_calls_update_entity_counters(
+    async def test_create_applies_counter_delta(
         self,
         repository: EntityMentionRepository,
         mock_session: MagicMock,
     ) -> None:
-        """create_manual_association() calls update_entity_counters with the correct entity_id.
+        """create_manual_association() adds the new mention to the stored counters.
 
-        After a successful insert, the method must call update_entity_counters
-        passing a list that contains the newly-associated entity_id so that
-        mention_count and video_count on named_entities are kept in sync.
+        After a successful insert, the method must call apply_counter_deltas
+        with the new mention's (entity_id, video_id, mention_text) so that
+        mention_count, video_count and alias occurrence counts stay in sync
+        without recomputing the entity's aggregates.
         """
         entity_id = _uuid()
         video_id = "dQw4w9WgXcQ"
@@ -3425,25 +3610,14 @@ class TestCreateManualAssociation:
         mock_session.refresh = AsyncMock()
 
         with patch.object(
-            repository, "update_entity_counters", new=AsyncMock()
+            repository, "apply_counter_deltas", new=AsyncMock()
         ) as mock_counters:
             await repository.create_manual_association(
                 mock_session, video_id=video_id, entity_id=entity_id
             )
 
-        # update_entity_counters must have been called with a list containing entity_id
-        mock_counters.assert_called_once()
-        call_args = mock_counters.call_args
-        # First positional arg after session is the entity_ids list
-        # Could be positional or keyword depending on impl
-        entity_ids_arg = (
-            call_args.args[1]
-            if len(call_args.args) > 1
-            else call_args.kwargs.get("entity_ids", [])
-        )
-        assert entity_id in entity_ids_arg, (
-            f"Expected entity_id {entity_id} in update_entity_counters call, "
-            f"got: {entity_ids_arg}"
+        mock_counters.assert_called_once_with(
+            mock_session, added=[(entity_id, video_id, canonical_name)]
         )
 
 
@@ -3909,8 +4083,8 @@ class TestDeleteManualAssociation:
       the given (video_id, entity_id) pair.
     - Raises NotFoundError (404) when no such manual row exists.
     - Calls session.delete() on the found row when it does exist.
-    - Calls update_entity_counters() with [entity_id] in the same transaction
-      after the delete so that mention_count / video_count stay accurate.
+    - Calls apply_counter_deltas() with the removed mention in the same
+      transaction after the delete so that mention_count / video_count stay accurate.
     - Only targets rows with detection_method='manual'; transcript-derived
       mentions for the same entity+video are never touched.
     """
@@ -3993,7 +4167,7 @@ class TestDeleteManualAssociation:
         # execute() finds the manual mention
         mock_session.execute.return_value = self._make_scalar_result(manual_mention)
 
-        with patch.object(repository, "update_entity_counters", new=AsyncMock()):
+        with patch.object(repository, "apply_counter_deltas", new=AsyncMock()):
             await repository.delete_manual_association(
                 mock_session, video_id=video_id, entity_id=entity_id
             )
@@ -4030,17 +4204,17 @@ class TestDeleteManualAssociation:
         # session.delete must NOT be called when the row is missing
         mock_session.delete.assert_not_called()
 
-    async def test_delete_calls_update_entity_counters(
+    async def test_delete_applies_counter_delta(
         self,
         repository: EntityMentionRepository,
         mock_session: MagicMock,
     ) -> None:
-        """delete_manual_association() calls update_entity_counters with the entity_id.
+        """delete_manual_association() subtracts the mention from the stored counters.
 
         After deleting the manual mention, the method must call
-        update_entity_counters passing a list that contains the entity_id so
-        that mention_count and video_count on named_entities are refreshed in
-        the same transaction.
+        apply_counter_deltas with the removed mention's key so that
+        mention_count and video_count on named_entities are adjusted in the
+        same transaction.
         """
         entity_id = _uuid()
         video_id = "dQw4w9WgXcQ"
@@ -4051,24 +4225,15 @@ class TestDeleteManualAssociation:
         mock_session.execute.return_value = self._make_scalar_result(manual_mention)
 
         with patch.object(
-            repository, "update_entity_counters", new=AsyncMock()
+            repository, "apply_counter_deltas", new=AsyncMock()
         ) as mock_counters:
             await repository.delete_manual_association(
                 mock_session, video_id=video_id, entity_id=entity_id
             )
 
-        # update_entity_counters must be called exactly once
-        mock_counters.assert_called_once()
-        call_args = mock_counters.call_args
-        # First positional arg after session is the entity_ids list
-        entity_ids_arg = (
-            call_args.args[1]
-            if len(call_args.args) > 1
-            else call_args.kwargs.get("entity_ids", [])
-        )
-        assert entity_id in entity_ids_arg, (
-            f"Expected entity_id {entity_id} in update_entity_counters call, "
-            f"got: {entity_ids_arg}"
+        mock_counters.assert_called_once_with(
+            mock_session,
+            removed=[(entity_id, video_id, manual_mention.mention_text)],
         )
 
     async def test_delete_counters_called_after_delete(
@@ -4076,11 +4241,11 @@ class TestDeleteManualAssociation:
         repository: EntityMentionRepository,
         mock_session: MagicMock,
     ) -> None:
-        """update_entity_counters is called in the same transaction as session.delete().
+        """apply_counter_deltas is called in the same transaction as session.delete().
 
-        The ordering requirement is: delete the row first, then refresh counters.
-        This test verifies that update_entity_counters is always called after
-        the row deletion (i.e., delete precedes counter update in the call log).
+        The ordering requirement is: delete the row first, then adjust counters.
+        The delta computation reads the pair's remaining mentions, so it must
+        run after the row deletion (delete precedes counter update in the call log).
         """
         entity_id = _uuid()
         video_id = "dQw4w9WgXcQ"
@@ -4095,14 +4260,14 @@ class TestDeleteManualAssociation:
         async def _track_delete(obj: Any) -> None:
             call_order.append("delete")
 
-        async def _track_counters(session: Any, entity_ids: Any) -> None:
+        async def _track_counters(session: Any, **deltas: Any) -> None:
             call_order.append("counters")
 
         mock_session.delete.side_effect = _track_delete
 
         with patch.object(
             repository,
-            "update_entity_counters",
+            "apply_counter_deltas",
             new=AsyncMock(side_effect=_track_counters),
         ):
             await repository.delete_manual_association(
@@ -4143,7 +4308,7 @@ class TestDeleteManualAssociation:
         # WHERE detection_method='manual' filter in the repository query.
         mock_session.execute.return_value = self._make_scalar_result(manual_mention)
 
-        with patch.object(repository, "update_entity_counters", new=AsyncMock()):
+        with patch.object(repository, "apply_counter_deltas", new=AsyncMock()):
             await repository.delete_manual_association(
                 mock_session, video_id=video_id, entity_id=entity_id
             )
@@ -4288,78 +4453,246 @@ class TestEntityMentionRepositorySourceMapping:
         assert result["sources"].count("title") == 1
 
 
-class TestTagInclusiveAssociationArms:
-    """T003/T004 (#260) — the shared tag-inclusive association-arm helper.
+class TestStoredAssociations:
+    """#260 — the shared association selectable the entity filter reads.
 
-    ``_tag_inclusive_association_arms`` is the single definition of "associated"
-    the entity filter shares with ``get_association_counts``. These inspect the
-    compiled SQL (not just return values) per the Cross-Feature Data Contract:
-    the tag arms appear only at ``ANY``, mentions weigh 1, tags weigh 0, and the
-    Python-normalised alias pairs are injected via ``unnest`` array binds — never
-    a row-per-pair ``VALUES`` (asyncpg's 32,767 bind-parameter cap).
+    ``_stored_associations`` is the single definition of "associated" the entity
+    filter shares with ``get_association_counts``: both read the materialised
+    ``entity_video_associations`` rows. These inspect the compiled SQL (not just
+    return values) per the Cross-Feature Data Contract: tag-only pairs qualify
+    only at ``ANY`` (weight 0), and ``TRANSCRIPT`` keeps just the pairs with a
+    transcript-scope mention, weighted by those mentions.
     """
 
     _IDS = [uuid.UUID(int=1), uuid.UUID(int=2)]
 
-    async def _compiled(
-        self,
-        scope: EvidenceScope,
-        alias_pairs: list[tuple[uuid.UUID, str]] | None = None,
-        literal_binds: bool = True,
-    ) -> str:
-        repo = EntityMentionRepository()
-        session = MagicMock(spec=AsyncSession)
+    def _compiled(self, scope: EvidenceScope) -> str:
+        assoc = EntityMentionRepository._stored_associations(self._IDS, scope)
+        return str(
+            assoc.element.compile(compile_kwargs={"literal_binds": True})
+        ).lower()
+
+    def test_reads_the_materialised_table_not_the_arms(self) -> None:
+        sql = self._compiled(EvidenceScope.ANY)
+        assert "from entity_video_associations" in sql
+        assert "union" not in sql
+        assert "canonical_tags" not in sql
+        assert "video_tags" not in sql
+
+    def test_any_scope_weighs_all_mentions_and_keeps_tag_only_pairs(self) -> None:
+        sql = self._compiled(EvidenceScope.ANY)
+        assert "mention_count as mention_weight" in sql
+        assert "transcript_mention_count" not in sql
+
+    def test_transcript_scope_keeps_only_transcript_mention_pairs(self) -> None:
+        sql = self._compiled(EvidenceScope.TRANSCRIPT)
+        assert "transcript_mention_count as mention_weight" in sql
+        assert "transcript_mention_count > 0" in sql
+
+
+class TestMaterializeAssociations:
+    """#260 — the statements that refresh the stored associations.
+
+    A scoped refresh deletes and rewrites only the pairs of the scoped entities
+    and videos, binding each scope as one array (never a row per key, for
+    asyncpg's 32,767 bind-parameter cap); a full rebuild is unscoped.
+    """
+
+    _A, _B = uuid.UUID(int=1), uuid.UUID(int=2)
+
+    @staticmethod
+    def _run(
+        before: list[Any] | None = None, after: list[Any] | None = None, **scope: Any
+    ) -> tuple[int, list[str], MagicMock]:
+        session = MagicMock(spec=Session)
+        aliases = MagicMock()
+        aliases.all.return_value = []
+        write = MagicMock()
+        write.__iter__.return_value = iter(after or [])
+        write.rowcount = 3
+        # Scoped refreshes read the RETURNING rows; a full rebuild the rowcount.
+        session.execute.side_effect = [aliases, before or [], write]
         with patch.object(
-            repo, "_alias_tag_pairs", AsyncMock(return_value=alias_pairs or [])
-        ):
-            assoc = await repo._tag_inclusive_association_arms(
-                session, self._IDS, scope
+            EntityMentionRepository, "materialize_cooccurrences"
+        ) as cooccurrences:
+            written = EntityMentionRepository().materialize_associations(
+                session, **scope
             )
-        kwargs = {"literal_binds": True} if literal_binds else {}
-        return str(assoc.element.compile(compile_kwargs=kwargs)).lower()
+        statements = [
+            str(call.args[0].compile(dialect=pg_dialect.dialect()))
+            for call in session.execute.call_args_list
+        ]
+        return written, statements, cooccurrences
 
-    async def test_any_scope_includes_canonical_and_alias_tag_arms(self) -> None:
-        sql = await self._compiled(EvidenceScope.ANY)
-        assert "canonical_tags" in sql
-        assert "tag_aliases" in sql
-        assert "video_tags" in sql
+    def test_scoped_refresh_deletes_then_upserts_the_scope(self) -> None:
+        videos = [f"vid{i:08d}" for i in range(500)]
+        _written, (_aliases, clear, write), _cooc = self._run(
+            entity_ids=[uuid.UUID(int=1)], video_ids=videos
+        )
+        assert clear.startswith("DELETE FROM entity_video_associations")
+        assert "unnest(" in clear
+        assert write.startswith("INSERT INTO entity_video_associations")
+        assert "bit_or(" in write
+        assert "ON CONFLICT (entity_id, video_id) DO UPDATE" in write
+        assert "RETURNING" in clear and "RETURNING" in write
+        # One array bind per scope, however many keys it holds.
+        assert clear.count("%(scope_video_ids") == 1
+
+    def test_video_scope_loads_only_aliases_matching_its_tags(self) -> None:
+        """A video-scoped refresh does not normalise every alias."""
+        _written, (video_aliases, *_), _cooc = self._run(video_ids=["v1"])
+        _written, (entity_aliases, *_), _cooc = self._run(entity_ids=[self._A])
+        _written, (all_aliases, *_), _cooc = self._run()
+
+        assert "entity_aliases.alias_name_normalized IN (SELECT" in video_aliases
+        assert "video_tags.video_id IN (SELECT unnest(" in video_aliases
+        assert "alias_name_normalized" not in entity_aliases
+        assert "entity_aliases.entity_id IN" in entity_aliases
+        assert "WHERE entity_aliases.alias_type !=" in all_aliases
+        assert " IN " not in all_aliases
+
+    def test_scoped_refresh_recounts_only_changed_pairs(self) -> None:
+        """Unchanged pairs leave the co-occurrences alone; moved ones do not."""
+
+        def row(entity_id: uuid.UUID, video_id: str, in_transcript: bool) -> Any:
+            return SimpleNamespace(
+                entity_id=entity_id, video_id=video_id, in_transcript=in_transcript
+            )
 
-    async def test_transcript_scope_omits_tag_arms(self) -> None:
-        sql = await self._compiled(EvidenceScope.TRANSCRIPT)
-        assert "canonical_tags" not in sql
-        assert "video_tags" not in sql
-        # The mention arm keeps today's source restriction under TRANSCRIPT.
-        assert "mention_source in" in sql
-
-    async def test_mention_rows_weigh_one_tag_rows_weigh_zero(self) -> None:
-        sql = await self._compiled(EvidenceScope.ANY)
-        assert "1 as mention_weight" in sql
-        assert "0 as mention_weight" in sql
-
-    async def test_transcript_scope_has_no_zero_weight_rows(self) -> None:
-        sql = await self._compiled(EvidenceScope.TRANSCRIPT)
-        assert "1 as mention_weight" in sql
-        assert "0 as mention_weight" not in sql
-
-    async def test_alias_pairs_injected_via_unnest_not_values(self) -> None:
-        pairs = [(uuid.UUID(int=1), "aliasvid0001")]
-        sql = await self._compiled(
-            EvidenceScope.ANY, alias_pairs=pairs, literal_binds=False
+        written, _statements, cooccurrences = self._run(
+            before=[row(self._A, "v1", True), row(self._B, "v1", True)],
+            after=[
+                row(self._A, "v1", True),
+                row(self._B, "v1", False),
+                row(self._A, "v2", False),
+            ],
+            video_ids=["v1", "v2"],
+        )
+
+        assert written == 3
+        cooccurrences.assert_called_once()
+        assert cooccurrences.call_args.kwargs["changed"] == {
+            (self._B, "v1"),
+            (self._A, "v2"),
+        }
+
+    def test_unchanged_scope_skips_the_recount(self) -> None:
+        same = [SimpleNamespace(entity_id=self._A, video_id="v1", in_transcript=True)]
+        _written, _statements, cooccurrences = self._run(
+            before=same, after=same, video_ids=["v1"]
+        )
+        cooccurrences.assert_not_called()
+
+    def test_full_rebuild_is_unscoped(self) -> None:
+        written, (_aliases, clear, write), cooccurrences = self._run()
+        assert written == 3
+        assert clear == "DELETE FROM entity_video_associations"
+        assert "scope_" not in write
+        assert "RETURNING" not in write
+        # ...and recounts every co-occurrence.
+        cooccurrences.assert_called_once()
+        assert cooccurrences.call_args.kwargs == {}
+
+    def test_empty_scope_writes_nothing(self) -> None:
+        session = MagicMock(spec=Session)
+        written = EntityMentionRepository().materialize_associations(
+            session, entity_ids=[], video_ids=[]
+        )
+        assert written == 0
+        session.execute.assert_not_called()
+
+
+class TestMaterializeCooccurrences:
+    """Maintenance of the stored co-occurrence counts behind appears-with.
+
+    A scoped recount derives the entity pairs that share a changed video,
+    deletes them in both directions and upserts their recount; a full rebuild
+    self-joins the associations once.
+    """
+
+    _A, _B, _C = uuid.UUID(int=1), uuid.UUID(int=2), uuid.UUID(int=3)
+
+    def _session(self, members: list[tuple[uuid.UUID, str]]) -> MagicMock:
+        session = MagicMock(spec=Session)
+        sizes = [(self._A, 50), (self._B, 2), (self._C, 9)]
+        # Members of the scoped videos, association counts, delete, insert.
+        session.execute.side_effect = [members, sizes, MagicMock(), MagicMock()]
+        return session
+
+    def test_changed_association_pairs_with_the_video_members(self) -> None:
+        session = self._session([(self._A, "v1"), (self._B, "v1")])
+
+        pairs = EntityMentionRepository._cooccurrence_pairs(
+            session, [(self._C, "v1")], []
+        )
+
+        # C just left (or joined) v1: only its pairs move, not A-B.
+        assert pairs == {(self._A, self._C), (self._B, self._C)}
+
+    def test_availability_change_pairs_every_member(self) -> None:
+        session = self._session([(self._A, "v1"), (self._B, "v1"), (self._C, "v1")])
+
+        pairs = EntityMentionRepository._cooccurrence_pairs(session, [], ["v1"])
+
+        assert pairs == {(self._A, self._B), (self._A, self._C), (self._B, self._C)}
+
+    def test_scoped_recount_upserts_both_directions(self) -> None:
+        session = self._session([(self._A, "v1"), (self._B, "v1")])
+
+        EntityMentionRepository().materialize_cooccurrences(
+            session, changed=[(self._C, "v1")]
+        )
+
+        _members, _sizes, clear, write = (
+            call.args[0] for call in session.execute.call_args_list
         )
-        assert "unnest" in sql
-        # Never a row-per-pair VALUES literal — that would blow asyncpg's
-        # 32,767 bind cap on a heavy page (research R1).
-        assert "values" not in sql
+        clear_sql = str(clear.compile(dialect=pg_dialect.dialect()))
+        write_sql = str(write.compile(dialect=pg_dialect.dialect()))
+        assert clear_sql.startswith("DELETE FROM entity_cooccurrences")
+        assert "UNION ALL SELECT pairs.b, pairs.a" in clear_sql
+        assert "ON CONFLICT (entity_id, partner_id) DO UPDATE" in write_sql
+        assert "UNION ALL SELECT counted.b, counted.a" in write_sql
+        # The pair list is two array binds, and the smaller side drives.
+        params = write.compile(dialect=pg_dialect.dialect()).params
+        assert list(zip(params["pair_a"], params["pair_b"], strict=True)) == [
+            (self._C, self._A),
+            (self._B, self._C),
+        ]
+
+    def test_full_rebuild_self_joins_available_videos(self) -> None:
+        session = MagicMock(spec=Session)
+        session.execute.return_value.rowcount = 4
 
+        written = EntityMentionRepository().materialize_cooccurrences(session)
 
-class TestQualificationTagArmsSqlInspection:
+        assert written == 4
+        clear, write = (
+            str(call.args[0].compile(dialect=pg_dialect.dialect()))
+            for call in session.execute.call_args_list
+        )
+        assert clear == "DELETE FROM entity_cooccurrences"
+        assert "FILTER (WHERE" in write
+        assert "videos.availability_status" in write
+
+    def test_nothing_to_recount_writes_nothing(self) -> None:
+        session = MagicMock(spec=Session)
+
+        written = EntityMentionRepository().materialize_cooccurrences(
+            session, changed=[], video_ids=[]
+        )
+
+        assert written == 0
+        session.execute.assert_not_called()
+
+
+class TestQualificationSqlInspection:
     """T006 (#260) — SQL inspection of ``build_entity_qualification_subquery``.
 
-    The qualification consumes the shared helper, so at ``ANY`` its statement
-    carries the tag arms and sums mention weight; at ``TRANSCRIPT`` it is
-    mention-only. Asserted over the compiled SQL, since a value-only test cannot
-    distinguish the broadened query from the old mentions-only one on a fixture
-    lacking tag-only videos.
+    The qualification reads the stored associations, so at ``ANY`` tag-only
+    pairs qualify and the mention weight is summed; at ``TRANSCRIPT`` only
+    transcript-mention pairs qualify. Asserted over the compiled SQL, since a
+    value-only test cannot distinguish the two on a fixture lacking tag-only
+    videos.
     """
 
     _IDS = [uuid.UUID(int=1), uuid.UUID(int=2)]
@@ -4367,22 +4700,19 @@ class TestQualificationTagArmsSqlInspection:
     async def _sql(self, scope: EvidenceScope) -> str:
         repo = EntityMentionRepository()
         session = MagicMock(spec=AsyncSession)
-        with patch.object(repo, "_alias_tag_pairs", AsyncMock(return_value=[])):
-            sub = await repo.build_entity_qualification_subquery(
-                session, self._IDS, scope
-            )
+        sub = await repo.build_entity_qualification_subquery(session, self._IDS, scope)
         return str(sub.element.compile(compile_kwargs={"literal_binds": True})).lower()
 
-    async def test_any_scope_statement_includes_tag_arms(self) -> None:
+    async def test_any_scope_statement_reads_stored_associations(self) -> None:
         sql = await self._sql(EvidenceScope.ANY)
-        assert "canonical_tags" in sql
-        assert "tag_aliases" in sql
-        assert "video_tags" in sql
+        assert "entity_video_associations" in sql
+        assert "transcript_mention_count > 0" not in sql
 
-    async def test_transcript_scope_statement_excludes_tag_arms(self) -> None:
+    async def test_transcript_scope_statement_requires_transcript_mentions(
+        self,
+    ) -> None:
         sql = await self._sql(EvidenceScope.TRANSCRIPT)
-        assert "canonical_tags" not in sql
-        assert "video_tags" not in sql
+        assert "transcript_mention_count > 0" in sql
 
     async def test_total_mentions_sums_weight(self) -> None:
         sql = await self._sql(EvidenceScope.ANY)
@@ -4394,15 +4724,14 @@ class TestQualificationTagArmsSqlInspection:
         assert "count(distinct" in sql
         assert "= 2" in sql  # HAVING count(distinct entity_id) = len(required)
 
-    async def test_mention_arm_uses_visible_name_rule_not_raw_in(self) -> None:
-        """Mutation check (R6): the mention arm is ``_mention_assoc_stmt`` (the
-        visible-name / manual rule), not the old ``entity_id IN (…)``. The join
-        to ``entity_aliases`` with the accent fold (``unaccent``) is the
-        fingerprint the raw-IN form lacked — reverting to raw-IN drops it.
-        """
-        sql = await self._sql(EvidenceScope.ANY)
-        assert "entity_aliases" in sql
-        assert "unaccent" in sql
+    async def test_issues_no_query_while_building(self) -> None:
+        """The stored table replaces the per-request alias-tag lookup."""
+        session = MagicMock(spec=AsyncSession)
+        session.execute = AsyncMock()
+        await EntityMentionRepository().build_entity_qualification_subquery(
+            session, self._IDS, EvidenceScope.ANY
+        )
+        session.execute.assert_not_called()
 
 
 class TestQualificationExclusionSymmetry:
@@ -4411,9 +4740,8 @@ class TestQualificationExclusionSymmetry:
     FR-003 symmetry: the excluded video set must be exactly the video set the
     same ``entity_id`` would include, so no request considers a video both
     associated and not-associated. Both builders derive their association set
-    from :meth:`_tag_inclusive_association_arms`; these prove that shared
-    sourcing (a spy on the helper) and that the tag arms appear on **both**
-    sides at ``ANY`` and on **neither** at ``TRANSCRIPT``.
+    from :meth:`_stored_associations`; these prove that shared sourcing (a spy
+    on the helper) and that tag-only pairs are excludable at ``ANY``.
     """
 
     _IDS = [uuid.UUID(int=1), uuid.UUID(int=2)]
@@ -4423,14 +4751,11 @@ class TestQualificationExclusionSymmetry:
     ) -> None:
         repo = EntityMentionRepository()
         session = MagicMock(spec=AsyncSession)
-        with (
-            patch.object(repo, "_alias_tag_pairs", AsyncMock(return_value=[])),
-            patch.object(
-                repo,
-                "_tag_inclusive_association_arms",
-                wraps=repo._tag_inclusive_association_arms,
-            ) as spy,
-        ):
+        with patch.object(
+            EntityMentionRepository,
+            "_stored_associations",
+            wraps=EntityMentionRepository._stored_associations,
+        ) as spy:
             await repo.build_entity_qualification_subquery(
                 session, self._IDS, EvidenceScope.ANY
             )
@@ -4439,29 +4764,28 @@ class TestQualificationExclusionSymmetry:
             )
         assert spy.call_count == 2
         qual_call, excl_call = spy.call_args_list
-        # Same session, same deduplicated entity ids, same scope — so the
-        # included set and the excluded set are built from one definition.
+        # Same deduplicated entity ids, same scope — so the included set and
+        # the excluded set are built from one definition.
         assert qual_call.args == excl_call.args
 
     async def _exclusion_sql(self, scope: EvidenceScope) -> str:
         repo = EntityMentionRepository()
         session = MagicMock(spec=AsyncSession)
-        with patch.object(repo, "_alias_tag_pairs", AsyncMock(return_value=[])):
-            sub = await repo.build_entity_exclusion_subquery(session, self._IDS, scope)
+        sub = await repo.build_entity_exclusion_subquery(session, self._IDS, scope)
         return str(sub.compile(compile_kwargs={"literal_binds": True})).lower()
 
     async def test_tag_associated_video_is_excludable_at_any_scope(self) -> None:
         """A tag-only video is *includable* by ``entity_id=E`` (proved by the
         qualification tests) and, symmetrically, *excludable* by
-        ``exclude_entity_id=E``: the exclusion statement carries the same tag
-        arms at ``ANY``.
+        ``exclude_entity_id=E``: the exclusion reads every stored pair at
+        ``ANY``, tag-only ones included.
         """
         sql = await self._exclusion_sql(EvidenceScope.ANY)
-        assert "canonical_tags" in sql
-        assert "tag_aliases" in sql
-        assert "video_tags" in sql
+        assert "entity_video_associations" in sql
+        assert "transcript_mention_count > 0" not in sql
 
-    async def test_exclusion_omits_tag_arms_at_transcript_scope(self) -> None:
+    async def test_exclusion_requires_transcript_mentions_at_transcript_scope(
+        self,
+    ) -> None:
         sql = await self._exclusion_sql(EvidenceScope.TRANSCRIPT)
-        assert "canonical_tags" not in sql
-        assert "video_tags" not in sql
+        assert "transcript_mention_count > 0" in sql
@@ -439,3 +439,41 @@ class TestPlaylistMembershipRepository:
 
         # Verify all calls were made
         assert mock_session.execute.call_count == 3
+
+    async def test_get_membership_pairs_excludes_hidden_playlists(
+        self, repository, mock_session
+    ):
+        """Membership pairs select two columns and skip hidden playlists."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = [("PL1", "vid1"), ("PL2", "vid1")]
+        mock_session.execute.return_value = mock_result
+
+        pairs = await repository.get_membership_pairs(mock_session)
+
+        assert pairs == [("PL1", "vid1"), ("PL2", "vid1")]
+        sql = str(mock_session.execute.call_args[0][0])
+        assert "playlists.deleted_flag IS false" in sql
+
+    async def test_get_membership_pairs_can_include_hidden(
+        self, repository, mock_session
+    ):
+        """include_deleted=True skips the playlists join."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        await repository.get_membership_pairs(mock_session, include_deleted=True)
+
+        sql = str(mock_session.execute.call_args[0][0])
+        assert "deleted_flag" not in sql
+
+    async def test_get_membership_version(self, repository, mock_session):
+        """The version combines row count, latest insert and hidden count."""
+        latest = datetime(2026, 1, 2, tzinfo=UTC)
+        mock_result = MagicMock()
+        mock_result.one.return_value = (12, latest, 1)
+        mock_session.execute.return_value = mock_result
+
+        version = await repository.get_membership_version(mock_session)
+
+        assert version == (12, latest.isoformat(), 1)
@@ -610,7 +610,7 @@ class TestPlaylistRepository:
     async def test_find_similar_playlists(
         self, repository: PlaylistRepository, mock_session: AsyncMock
     ):
-        """Test finding similar playlists."""
+        """Test similarity from shared playlist memberships (Jaccard)."""
         target_playlist = MagicMock()
         target_playlist.title = "Music Playlist"
         with patch.object(
@@ -618,24 +618,54 @@ class TestPlaylistRepository:
             "get_by_playlist_id",
             new=AsyncMock(return_value=target_playlist),
         ):
+            count_result = MagicMock()
+            count_result.scalar_one.return_value = 4
+            close_playlist = MagicMock()
+            far_playlist = MagicMock()
+            rows_result = MagicMock()
+            # (playlist, shared, size)
+            rows_result.all.return_value = [
+                (far_playlist, 1, 10),
+                (close_playlist, 3, 5),
+            ]
+            mock_session.execute.side_effect = [count_result, rows_result]
+
+            result = await repository.find_similar_playlists(
+                mock_session, "PL1", limit=5
+            )
 
-            # Mock similar playlists
+            assert [playlist for playlist, _ in result] == [
+                close_playlist,
+                far_playlist,
+            ]
+            assert result[0][1] == pytest.approx(3 / 6)
+            assert result[1][1] == pytest.approx(1 / 13)
+
+    @pytest.mark.asyncio
+    async def test_find_similar_playlists_falls_back_to_titles(
+        self, repository: PlaylistRepository, mock_session: AsyncMock
+    ):
+        """A playlist without memberships is compared by title words."""
+        target_playlist = MagicMock()
+        target_playlist.title = "Music Playlist"
+        with patch.object(
+            repository,
+            "get_by_playlist_id",
+            new=AsyncMock(return_value=target_playlist),
+        ):
+            count_result = MagicMock()
+            count_result.scalar_one.return_value = 0
             similar_playlist = MagicMock()
             similar_playlist.title = "Music Collection"
-            mock_result = MagicMock()
-            mock_scalars = MagicMock()
-            mock_scalars.all.return_value = [similar_playlist]
-            mock_result.scalars.return_value = mock_scalars
-            mock_session.execute.return_value = mock_result
+            title_result = MagicMock()
+            title_result.scalars.return_value.all.return_value = [similar_playlist]
+            mock_session.execute.side_effect = [count_result, title_result]
 
             result = await repository.find_similar_playlists(
                 mock_session, "PL1", limit=5
             )
 
-            assert len(result) > 0
-            assert all(
-                len(item) == 2 for item in result
-            )  # (playlist, similarity_score) tuples
+            assert result == [(similar_playlist, pytest.approx(1 / 3))]
 
     @pytest.mark.asyncio
     async def test_find_similar_playlists_not_found(
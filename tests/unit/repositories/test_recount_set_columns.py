@@ -12,7 +12,7 @@ from __future__ import annotations
 import re
 import uuid
 from typing import Any
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from sqlalchemy.dialects import postgresql
@@ -92,3 +92,30 @@ class TestRecountSetColumns:
             "occurrence_count",
             "updated_at",
         }, f"unexpected non-counter column in SET: {cols}"
+
+    async def test_counter_deltas_set_only_counter_columns(self) -> None:
+        entity_id = uuid.uuid4()
+        captured: list[str] = []
+
+        async def _execute(stmt: Any, *a: Any, **kw: Any) -> Any:
+            text = str(stmt.compile(dialect=postgresql.dialect())).lower()
+            if "update " in text:
+                captured.append(text)
+            result = MagicMock()
+            result.all.return_value = [(entity_id, 1, 1)]
+            return result
+
+        session = AsyncMock()
+        session.execute = AsyncMock(side_effect=_execute)
+
+        await EntityMentionRepository().apply_counter_deltas(
+            session, added=[(entity_id, "dQw4w9WgXcQ", "Ada")]
+        )
+
+        assert len(captured) == 2
+        # The alias UPDATE is prefixed by the deltas CTE; look past it.
+        alias_cols = _set_columns(captured[0].split("update entity_aliases", 1)[1])
+        entity_cols = _set_columns(captured[1])
+        assert alias_cols == {"occurrence_count"}
+        assert entity_cols <= {"mention_count", "video_count", "updated_at"}
+        assert not ((alias_cols | entity_cols) & _DISPLAY_FIELDS)
@@ -0,0 +1,105 @@
+"""
+Tests for the transcript segment change log.
+
+Covers the Python side of ``chronovista.db.segment_changes``: the combined
+delete-and-log statement and which flushed segments the ``after_flush`` hook
+logs.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from chronovista.db.models import TranscriptSegment as TranscriptSegmentDB
+from chronovista.db.segment_changes import (
+    _log_segment_changes_after_flush,
+    logged_segment_delete,
+)
+
+
+def _segment(id: int) -> TranscriptSegmentDB:
+    return TranscriptSegmentDB(
+        id=id,
+        video_id="dQw4w9WgXcQ",
+        language_code="en",
+        text="hello world",
+        start_time=0.0,
+        duration=1.0,
+        end_time=1.0,
+        sequence_number=id,
+        created_at=datetime.now(UTC),
+    )
+
+
+class TestLoggedSegmentDelete:
+    """The delete statement logs what it deletes."""
+
+    def test_delete_and_log_in_one_statement(self) -> None:
+        statement = logged_segment_delete(TranscriptSegmentDB.video_id == "dQw4w9WgXcQ")
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert sql.startswith("WITH gone AS")
+        assert "DELETE FROM transcript_segments" in sql
+        assert "RETURNING transcript_segments.id" in sql
+        assert "INSERT INTO transcript_segment_changes" in sql
+        assert "true" in sql
+
+
+class TestLogAfterFlush:
+    """Which flushed segments are logged."""
+
+    @staticmethod
+    def _session(
+        new: list[object] | None = None,
+        dirty: list[object] | None = None,
+        deleted: list[object] | None = None,
+    ) -> MagicMock:
+        session = MagicMock(spec=Session)
+        session.new = new or []
+        session.dirty = dirty or []
+        session.deleted = deleted or []
+        session.connection.return_value.dialect.name = "postgresql"
+        return session
+
+    @staticmethod
+    def _logged(session: MagicMock) -> list[tuple[int, bool]]:
+        rows = session.connection.return_value.execute.call_args.args[1]
+        return [(r["segment_id"], r["deleted"]) for r in rows]
+
+    def test_new_and_deleted_segments_are_logged(self) -> None:
+        session = self._session(new=[_segment(7), object()], deleted=[_segment(9)])
+
+        _log_segment_changes_after_flush(session, MagicMock())
+
+        assert self._logged(session) == [(7, False), (9, True)]
+
+    def test_dirty_segments_need_a_text_change(self) -> None:
+        edited, retimed = _segment(1), _segment(2)
+        session = self._session(dirty=[edited, retimed])
+
+        with patch(
+            "chronovista.db.segment_changes._text_changed",
+            side_effect=lambda seg: seg is edited,
+        ):
+            _log_segment_changes_after_flush(session, MagicMock())
+
+        assert self._logged(session) == [(1, False)]
+
+    def test_nothing_to_log_issues_no_statement(self) -> None:
+        session = self._session(new=[object()])
+
+        _log_segment_changes_after_flush(session, MagicMock())
+
+        session.connection.assert_not_called()
+
+    def test_non_postgres_dialect_is_skipped(self) -> None:
+        session = self._session(new=[_segment(7)])
+        session.connection.return_value.dialect.name = "sqlite"
+
+        _log_segment_changes_after_flush(session, MagicMock())
+
+        session.connection.return_value.execute.assert_not_called()
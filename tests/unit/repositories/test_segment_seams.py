@@ -0,0 +1,189 @@
+"""
+Tests for the transcript segment seam keys and lookup conditions.
+
+Covers the Python side of ``chronovista.db.segment_seams``: normalization and
+key derivation, the LIKE conditions built for boundary lookups, and which
+segments the ``after_flush`` hook refreshes. The SQL side is exercised by
+``tests/integration/repositories/test_segment_seam_queries.py``.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from chronovista.db.models import TranscriptSegment as TranscriptSegmentDB
+from chronovista.db.segment_seams import (
+    _refresh_seams_after_flush,
+    normalize_seam_text,
+    refresh_seams_statement,
+    seam_boundary_condition,
+    seam_head_key,
+    seam_tail_key,
+)
+from chronovista.repositories.transcript_segment_repository import (
+    TranscriptSegmentRepository,
+)
+
+
+def _compile(clause: object) -> str:
+    return str(
+        clause.compile(  # type: ignore[attr-defined]
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+
+
+class TestSeamKeys:
+    """Normalization and key derivation."""
+
+    def test_normalize_folds_case_and_whitespace(self) -> None:
+        assert normalize_seam_text("  Ada\t\tLOVELACE\n ") == "ada lovelace"
+
+    def test_tail_key_is_reversed_last_words(self) -> None:
+        assert seam_tail_key("one two three four five six seven") == (
+            "three four five six seven"[::-1]
+        )
+
+    def test_head_key_is_first_words(self) -> None:
+        assert seam_head_key("One two three four five six") == (
+            "one two three four five"
+        )
+
+    def test_short_fragments_are_kept_whole(self) -> None:
+        assert seam_tail_key("Ada") == "ada"
+        assert seam_head_key("Love lace") == "love lace"
+
+
+class TestSeamBoundaryCondition:
+    """LIKE conditions built for a (tail, head) boundary."""
+
+    def test_both_sides_are_left_anchored_prefixes(self) -> None:
+        sql = _compile(seam_boundary_condition("about Ada", "Lovelace"))
+
+        assert "tail_reversed LIKE 'ada tuoba%%'" in sql
+        assert "head_text LIKE 'lovelace%%'" in sql
+
+    def test_one_sided_boundary_constrains_one_column(self) -> None:
+        sql = _compile(seam_boundary_condition(None, "Lovelace"))
+
+        assert "head_text LIKE" in sql
+        assert "tail_reversed" not in sql
+
+    def test_blank_boundary_returns_none(self) -> None:
+        assert seam_boundary_condition(None, None) is None
+        assert seam_boundary_condition("  ", "") is None
+
+    def test_like_wildcards_are_escaped(self) -> None:
+        sql = _compile(seam_boundary_condition(None, "100%_x"))
+
+        # The offline dialect doubles backslashes in literals; either way the
+        # wildcards are escaped and only the trailing '%' is a wildcard.
+        assert sql.replace("\\\\", "\\").count("\\%") == 1
+        assert "\\_x" in sql
+        assert "ESCAPE" in sql
+
+
+class TestRefreshAfterFlush:
+    """Which flushed segments trigger a seam refresh."""
+
+    @staticmethod
+    def _segment(id: int) -> TranscriptSegmentDB:
+        return TranscriptSegmentDB(
+            id=id,
+            video_id="dQw4w9WgXcQ",
+            language_code="en",
+            text="hello world",
+            start_time=0.0,
+            duration=1.0,
+            end_time=1.0,
+            sequence_number=id,
+            created_at=datetime.now(UTC),
+        )
+
+    def _session(self, new: list[object]) -> MagicMock:
+        session = MagicMock(spec=Session)
+        session.new = new
+        session.dirty = []
+        session.connection.return_value.dialect.name = "postgresql"
+        return session
+
+    def test_new_segments_are_refreshed(self) -> None:
+        session = self._session([self._segment(7), self._segment(8), object()])
+
+        _refresh_seams_after_flush(session, MagicMock())
+
+        statement = session.connection.return_value.execute.call_args.args[0]
+        assert statement.compile().params["segment_ids"] == [7, 8]
+
+    def test_no_segments_issue_no_statement(self) -> None:
+        session = self._session([object()])
+
+        _refresh_seams_after_flush(session, MagicMock())
+
+        session.connection.assert_not_called()
+
+    def test_non_postgres_dialect_is_skipped(self) -> None:
+        session = self._session([self._segment(7)])
+        session.connection.return_value.dialect.name = "sqlite"
+
+        _refresh_seams_after_flush(session, MagicMock())
+
+        session.connection.return_value.execute.assert_not_called()
+
+    def test_refresh_statement_upserts_both_pair_directions(self) -> None:
+        sql = str(refresh_seams_statement([1]))
+
+        assert "n.id = ANY(:segment_ids)" in sql
+        assert "n1.id = ANY(:segment_ids)" in sql
+        assert "ON CONFLICT (segment_n_id) DO UPDATE" in sql
+
+
+class TestFindSegmentsAtSeams:
+    """Repository lookup shape (database I/O mocked)."""
+
+    @pytest.fixture
+    def repository(self) -> TranscriptSegmentRepository:
+        return TranscriptSegmentRepository()
+
+    @pytest.fixture
+    def mock_session(self) -> AsyncMock:
+        session = AsyncMock(spec=AsyncSession)
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = []
+        session.execute.return_value = result
+        return session
+
+    async def test_blank_boundaries_skip_the_query(
+        self, repository: TranscriptSegmentRepository, mock_session: AsyncMock
+    ) -> None:
+        result = await repository.find_segments_at_seams(
+            mock_session, boundaries=[(None, " "), ("", None)]
+        )
+
+        assert result == []
+        mock_session.execute.assert_not_called()
+
+    async def test_query_unions_both_seam_sides_with_scope(
+        self, repository: TranscriptSegmentRepository, mock_session: AsyncMock
+    ) -> None:
+        await repository.find_segments_at_seams(
+            mock_session,
+            boundaries=[("Johnsen", "Bomb")],
+            language="en",
+            channel="UCzzzz",
+        )
+
+        sql = _compile(mock_session.execute.call_args.args[0])
+        assert "transcript_segment_seams.segment_n_id" in sql
+        assert "transcript_segment_seams.segment_n1_id" in sql
+        assert "UNION" in sql
+        assert "videos.channel_id = 'UCzzzz'" in sql
+        assert "transcript_segments.language_code = 'en'" in sql
+        assert "ILIKE" not in sql
@@ -0,0 +1,115 @@
+"""
+Tests for TakeoutMessageRepository.
+
+Covers the statements the repository builds; the round trip through
+PostgreSQL is in ``tests/integration/repositories/test_takeout_messages.py``.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from chronovista.db.models import TakeoutMessage as TakeoutMessageDB
+from chronovista.parsers.takeout_message_parser import MessageFilter, TakeoutMessage
+from chronovista.repositories.takeout_message_repository import (
+    TakeoutMessageRepository,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+def _message(message_id: str, text: str = "hello") -> TakeoutMessage:
+    return TakeoutMessage(
+        kind="comment",
+        message_id=message_id,
+        video_id="vid",
+        channel_id="UCa",
+        posted_at=datetime(2023, 1, 1, tzinfo=UTC),
+        text=text,
+    )
+
+
+def _sql(statement: object) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))  # type: ignore[attr-defined]
+
+
+class TestStore:
+    """Batches upsert through array binds."""
+
+    async def test_upserts_one_row_per_message_id(self) -> None:
+        session = AsyncMock()
+
+        written = await TakeoutMessageRepository().store(
+            session, [_message("c1", "old"), _message("c2"), _message("c1", "new")]
+        )
+
+        assert written == 2
+        statement = session.execute.call_args.args[0]
+        sql = _sql(statement)
+        assert "unnest" in sql
+        assert "ON CONFLICT (kind, message_id) DO UPDATE" in sql
+        params = statement.compile(dialect=postgresql.dialect()).params
+        assert params["message_ids"] == ["c1", "c2"]
+        assert params["message_texts"] == ["new", "hello"]
+
+    async def test_rows_without_an_id_are_skipped(self) -> None:
+        session = AsyncMock()
+
+        assert await TakeoutMessageRepository().store(session, [_message("")]) == 0
+        session.execute.assert_not_called()
+
+    async def test_store_all_chunks_the_stream(self) -> None:
+        repository = TakeoutMessageRepository()
+        repository.store = AsyncMock(side_effect=lambda _s, batch: len(batch))  # type: ignore[method-assign]
+
+        written = await repository.store_all(
+            AsyncMock(), (_message(f"c{i}") for i in range(5)), batch_size=2
+        )
+
+        assert written == 5
+        assert [len(c.args[1]) for c in repository.store.call_args_list] == [2, 2, 1]
+
+
+class TestSummarise:
+    """Peek queries filter, aggregate and order in SQL."""
+
+    async def test_filters_and_orders_the_top_rows(self) -> None:
+        session = AsyncMock()
+        session.execute.side_effect = [
+            MagicMock(one=MagicMock(return_value=(0, None, None))),
+            MagicMock(all=MagicMock(return_value=[])),
+            MagicMock(scalars=MagicMock(return_value=MagicMock(all=lambda: []))),
+        ]
+
+        digest = await TakeoutMessageRepository().summarise(
+            session,
+            "live_chat",
+            MessageFilter(text="50%", since=datetime(2023, 1, 1, tzinfo=UTC)),
+            limit=10,
+            sort_order="recent",
+        )
+
+        assert digest.total == 0
+        rows_sql = _sql(session.execute.call_args_list[2].args[0])
+        assert "takeout_messages.kind = " in rows_sql
+        assert "takeout_messages.posted_at >= " in rows_sql
+        assert "ILIKE" in rows_sql.upper()
+        assert "ORDER BY takeout_messages.posted_at DESC NULLS LAST" in rows_sql
+        assert "LIMIT" in rows_sql
+        params = session.execute.call_args_list[2].args[0].compile().params
+        assert "%50\\%%" in params.values()
+
+    async def test_both_text_filter_columns_have_trigram_indexes(self) -> None:
+        """Each ILIKE arm of the OR needs its own index to avoid a seq scan."""
+        trigram_columns = {
+            column.name
+            for index in TakeoutMessageDB.__table__.indexes
+            if index.dialect_options["postgresql"]["using"] == "gin"
+            for column in index.columns
+        }
+
+        assert trigram_columns == {"message_text", "video_id"}
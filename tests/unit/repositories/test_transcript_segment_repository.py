@@ -11,6 +11,7 @@ from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from chronovista.db.models import TranscriptSegment as TranscriptSegmentDB
@@ -178,15 +179,10 @@ class TestTranscriptSegmentRepository:
         Create segments: [0-2.0], [5.0-7.0] (gap from 2.0-5.0)
         Query timestamp 3.0 should return first segment (previous).
         """
-        # First call for exact match returns None (timestamp 3.0 is in gap)
-        mock_result_exact = MagicMock()
-        mock_result_exact.scalar_one_or_none.return_value = None
-
-        # Second call for gap fallback returns first segment
-        mock_result_gap = MagicMock()
-        mock_result_gap.scalar_one_or_none.return_value = sample_segments_with_gap[0]
-
-        mock_session.execute.side_effect = [mock_result_exact, mock_result_gap]
+        # Containment and gap fallback are resolved in one round-trip
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = sample_segments_with_gap[0]
+        mock_session.execute.return_value = mock_result
 
         result = await repository.get_segment_at_time(
             mock_session, "gapTest1234", "en", 3.0
@@ -196,7 +192,7 @@ class TestTranscriptSegmentRepository:
         assert result is not None
         assert result.id == 1
         assert result.end_time == 2.0
-        assert mock_session.execute.call_count == 2
+        mock_session.execute.assert_called_once()
 
     async def test_get_segment_at_time_before_first_returns_none(
         self,
@@ -208,7 +204,7 @@ class TestTranscriptSegmentRepository:
         Create segment starting at 5.0
         Query timestamp 1.0 should return None.
         """
-        # Both exact match and gap fallback return None
+        # No candidate starts at or before the timestamp
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = None
         mock_session.execute.return_value = mock_result
@@ -219,6 +215,91 @@ class TestTranscriptSegmentRepository:
 
         assert result is None
 
+    async def test_get_segments_at_times_single_query(
+        self,
+        repository: TranscriptSegmentRepository,
+        mock_session: AsyncMock,
+        sample_segments: list[TranscriptSegmentDB],
+    ):
+        """Many timestamps are resolved with one round-trip.
+
+        Timestamps before the first segment map to None; duplicates are
+        resolved once.
+        """
+        mock_result = MagicMock()
+        mock_result.all.return_value = [
+            (1.0, sample_segments[0]),
+            (6.0, sample_segments[2]),
+            (-1.0, None),
+        ]
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.get_segments_at_times(
+            mock_session, "dQw4w9WgXcQ", "en", [1.0, 6.0, 1.0, -1.0]
+        )
+
+        mock_session.execute.assert_called_once()
+        assert list(result) == [1.0, 6.0, -1.0]
+        assert result[1.0] is sample_segments[0]
+        assert result[6.0] is sample_segments[2]
+        assert result[-1.0] is None
+
+    async def test_get_segments_at_times_binds_one_array(
+        self,
+        repository: TranscriptSegmentRepository,
+        mock_session: AsyncMock,
+    ):
+        """Timestamps are bound as a single array, not one bind each."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        timestamps = [float(i) for i in range(500)]
+        result = await repository.get_segments_at_times(
+            mock_session, "dQw4w9WgXcQ", "EN-us", timestamps
+        )
+
+        stmt = mock_session.execute.call_args[0][0]
+        params = stmt.compile().params
+        assert list(params.values()).count(timestamps) == 1
+        assert "en-US" in params.values()
+        assert len(params) < 10
+        assert result == dict.fromkeys(timestamps)
+
+    async def test_get_segment_at_time_uses_index_ordered_probes(
+        self,
+        repository: TranscriptSegmentRepository,
+        mock_session: AsyncMock,
+    ):
+        """Containment and gap fallback are two LIMIT 1 probes in index order."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        await repository.get_segment_at_time(mock_session, "dQw4w9WgXcQ", "en", 3.0)
+
+        sql = str(
+            mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+        )
+        assert "UNION ALL" in sql
+        assert "CASE" not in sql
+        assert "ORDER BY transcript_segments.start_time DESC" in sql
+        assert "ORDER BY transcript_segments.end_time DESC" in sql
+        assert sql.count("LIMIT") == 3
+
+    async def test_get_segments_at_times_empty(
+        self,
+        repository: TranscriptSegmentRepository,
+        mock_session: AsyncMock,
+    ):
+        """No timestamps means no query."""
+        result = await repository.get_segments_at_times(
+            mock_session, "dQw4w9WgXcQ", "en", []
+        )
+
+        assert result == {}
+        mock_session.execute.assert_not_called()
+
     async def test_get_segments_in_range_returns_overlapping(
         self,
         repository: TranscriptSegmentRepository,
@@ -494,14 +575,10 @@ class TestTranscriptSegmentRepositoryEdgeCases:
         Per half-open interval [start, end), timestamp at end_time should NOT
         match the segment - it should match the next segment if one starts there.
         """
-        # First query (exact match) returns None because 5.0 is at end of segment 2
-        # and start of segment 3 (if there's a next segment)
-        mock_result_exact = MagicMock()
-        mock_result_exact.scalar_one_or_none.return_value = None
-
-        # Second query (gap fallback) returns the previous segment
-        mock_result_gap = MagicMock()
-        mock_result_gap.scalar_one_or_none.return_value = TranscriptSegmentDB(
+        # 5.0 is the end of segment 2; with no segment starting there the
+        # single ordered query falls back to the previous segment
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = TranscriptSegmentDB(
             id=2,
             video_id="dQw4w9WgXcQ",
             language_code="en",
@@ -515,7 +592,7 @@ class TestTranscriptSegmentRepositoryEdgeCases:
             created_at=datetime.now(UTC),
         )
 
-        mock_session.execute.side_effect = [mock_result_exact, mock_result_gap]
+        mock_session.execute.return_value = mock_result
 
         result = await repository.get_segment_at_time(
             mock_session, "dQw4w9WgXcQ", "en", 5.0
@@ -12,6 +12,7 @@ from typing import cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from chronovista.db.models import UserVideo as UserVideoDB
@@ -613,11 +614,16 @@ class TestUserVideoRepository:
         mock_result = MagicMock()
         mock_result.rowcount = 5
         mock_session.execute.return_value = mock_result  # type: ignore[attr-defined]
+        mock_session.info = {}  # type: ignore[misc]
 
         result = await repository.delete_user_interactions(mock_session, "test_user")
 
         assert result == 5
         mock_session.execute.assert_called_once()  # type: ignore[attr-defined]
+        # The Core delete bypasses the ORM hooks, so a full rebuild is queued.
+        assert mock_session.info["chronovista_watch_rollups_pending"] == {
+            "test_user": None
+        }
 
     @pytest.mark.asyncio
     async def test_get_watch_count_by_date_range(
@@ -647,6 +653,30 @@ class TestUserVideoRepository:
         assert result == expected
         mock_session.execute.assert_called_once()  # type: ignore[attr-defined]
 
+    @pytest.mark.asyncio
+    async def test_get_watch_count_by_date_range_counts_partial_hours_raw(
+        self, repository: UserVideoRepository, mock_session: AsyncSession
+    ):
+        """Whole hours come from the rollup; partial edge hours from user_videos."""
+        mock_result = MagicMock()
+        mock_result.__iter__ = lambda self: iter([])
+        mock_session.execute.return_value = mock_result  # type: ignore[attr-defined]
+
+        await repository.get_watch_count_by_date_range(
+            mock_session,
+            "test_user",
+            datetime(2025, 1, 1, 9, 30, tzinfo=UTC),
+            datetime(2025, 1, 2, 17, 15, tzinfo=UTC),
+        )
+
+        stmt = mock_session.execute.call_args.args[0]  # type: ignore[attr-defined]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "FROM user_watch_hourly" in sql
+        assert "UNION ALL" in sql
+        assert "FROM user_videos" in sql
+        assert "user_watch_hourly.watch_hour < date_trunc(" in sql
+        assert "user_videos.watched_at >= greatest(" in sql
+
     @pytest.mark.asyncio
     async def test_get_with_composite_key_tuple(
         self,
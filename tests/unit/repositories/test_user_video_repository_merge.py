@@ -1,12 +1,12 @@
 """Constitution SQL-shape tests for the identity merge (Feature 060, T017).
 
 Mock strategy: ``MagicMock(spec=AsyncSession)`` with ``AsyncMock`` execute —
-we capture and compile the emitted statements to inspect the SET/DELETE shape,
+we capture and compile the emitted statements to inspect the upsert/DELETE shape,
 not just return values — a column absent from SET returns success while
 writing nothing.
 
 NOTE: the substring assertions below are coupled to SQLAlchemy's compiler output
-(e.g. ``liked=(user_videos.liked or (select``) and a SQLAlchemy version bump can
+(e.g. ``liked = (user_videos.liked or excluded.liked)``) and a SQLAlchemy version bump can
 break them *spuriously*. They are a fast structural tripwire, NOT the semantic
 authority — the merge's actual per-field GREATEST/OR behavior is proven against a
 real database by ``tests/integration/test_identity_dedup.py``. If these break,
@@ -31,11 +31,31 @@ FROM_ID = "takeout_user"
 TO_ID = "UCzYTmeK-6v3DcJ6hzRh1q9w"
 
 
-def _mock_session() -> MagicMock:
-    session = MagicMock(spec=AsyncSession)
+def _result(*, scalar: object = None, rowcount: int = 0) -> MagicMock:
     result = MagicMock()
-    result.rowcount = 0
-    session.execute = AsyncMock(return_value=result)
+    result.scalar_one_or_none.return_value = scalar
+    result.scalar_one.return_value = scalar
+    result.rowcount = rowcount
+    return result
+
+
+def _chunk(upper: str | None, *, overlap: int, moved: int) -> list[MagicMock]:
+    """Results of one chunk: its last key, overlap count, upsert, delete."""
+    return [
+        _result(scalar=upper),
+        _result(scalar=overlap),
+        _result(rowcount=moved),
+        _result(rowcount=moved),
+    ]
+
+
+def _mock_session(*chunks: list[MagicMock]) -> MagicMock:
+    session = MagicMock(spec=AsyncSession)
+    results = [
+        r for chunk in chunks or (_chunk(None, overlap=0, moved=0),) for r in chunk
+    ]
+    session.execute = AsyncMock(side_effect=results)
+    session.sync_session = MagicMock(info={})
     return session
 
 
@@ -51,55 +71,124 @@ def _sql(stmt) -> str:
 
 
 class TestMergeSqlShape:
-    async def test_merge_update_binds_each_column_to_its_merge_formula(self) -> None:
+    async def test_upsert_binds_each_column_to_its_merge_formula(self) -> None:
         repo = UserVideoRepository()
         session = _mock_session()
 
         await repo.merge_user_identity(session, from_user_id=FROM_ID, to_user_id=TO_ID)
 
-        # 3 statements: merge-overlaps UPDATE, delete-overlap DELETE, re-key UPDATE
-        assert session.execute.await_count == 3
-        merge_sql = _sql(session.execute.await_args_list[0].args[0])
+        # One chunk: last-key SELECT, overlap count, upsert, DELETE.
+        assert session.execute.await_count == 4
+        upsert_sql = _sql(session.execute.await_args_list[2].args[0])
 
-        assert merge_sql.startswith("update user_videos set")
+        assert upsert_sql.startswith("insert into user_videos")
+        assert f"select '{TO_ID}'".lower() in upsert_sql
+        assert "on conflict (user_id, video_id) do update set" in upsert_sql
         # Bind the *formula* to the *column* — a regression that swapped GREATEST
         # for a naive overwrite, or OR for AND, would pass a "keyword present
         # somewhere" check but must fail here.
-        assert "watched_at=greatest(user_videos.watched_at," in merge_sql
-        assert "rewatch_count=greatest(user_videos.rewatch_count," in merge_sql
-        assert "liked=(user_videos.liked or (select" in merge_sql
         assert (
-            "saved_to_playlist=(user_videos.saved_to_playlist or (select" in merge_sql
+            "watched_at = greatest(user_videos.watched_at, excluded.watched_at)"
+            in upsert_sql
         )
-        # Only overlapping survivor rows are merged (EXISTS on the placeholder).
-        assert f"user_videos.user_id = '{TO_ID}'".lower() in merge_sql
-        assert "exists (select" in merge_sql
+        assert (
+            "rewatch_count = greatest(user_videos.rewatch_count, "
+            "excluded.rewatch_count)"
+        ) in upsert_sql
+        assert "liked = (user_videos.liked or excluded.liked)" in upsert_sql
+        assert (
+            "saved_to_playlist = (user_videos.saved_to_playlist or "
+            "excluded.saved_to_playlist)"
+        ) in upsert_sql
 
-    async def test_delete_targets_only_overlapping_placeholder_rows(self) -> None:
+    async def test_delete_targets_only_the_chunk_of_placeholder_rows(self) -> None:
         repo = UserVideoRepository()
-        session = _mock_session()
+        session = _mock_session(
+            _chunk("vid_m", overlap=1, moved=2), _chunk(None, overlap=0, moved=1)
+        )
 
-        await repo.merge_user_identity(session, from_user_id=FROM_ID, to_user_id=TO_ID)
+        await repo.merge_user_identity(
+            session, from_user_id=FROM_ID, to_user_id=TO_ID, chunk_size=2
+        )
 
-        delete_sql = _sql(session.execute.await_args_list[1].args[0])
-        assert delete_sql.startswith("delete from user_videos")
-        # Placeholder-scoped AND overlap-scoped: deletes only placeholder rows
-        # whose video_id already exists under the survivor. A regression that
-        # dropped the overlap subquery (deleting ALL placeholder rows before the
-        # re-key merged them in) would fail this assertion.
-        assert f"user_videos.user_id = '{FROM_ID}'".lower() in delete_sql
-        assert (
-            f"user_videos.video_id in (select user_videos.video_id from "
-            f"user_videos where user_videos.user_id = '{TO_ID}'".lower()
-        ) in delete_sql
+        first = _sql(session.execute.await_args_list[3].args[0])
+        second = _sql(session.execute.await_args_list[7].args[0])
+        assert first.startswith("delete from user_videos")
+        # Placeholder-scoped AND key-range-scoped, so each statement's work is
+        # bounded by the chunk, not the history.
+        assert f"user_videos.user_id = '{FROM_ID}'".lower() in first
+        assert "user_videos.video_id <= 'vid_m'" in first
+        assert "user_videos.video_id > 'vid_m'" in second
+        assert "<=" not in second  # the last chunk is open-ended
+
+    async def test_chunks_sum_into_the_merge_stats(self) -> None:
+        repo = UserVideoRepository()
+        session = _mock_session(
+            _chunk("vid_m", overlap=1, moved=2), _chunk(None, overlap=1, moved=3)
+        )
+        progress = MagicMock()
+
+        stats = await repo.merge_user_identity(
+            session,
+            from_user_id=FROM_ID,
+            to_user_id=TO_ID,
+            chunk_size=2,
+            progress_callback=progress,
+        )
 
-    async def test_rekey_sets_user_id_to_survivor(self) -> None:
+        assert (stats.merged, stats.deleted, stats.rekeyed) == (2, 2, 3)
+        assert [c.args[0] for c in progress.call_args_list] == [2, 3]
+
+    async def test_queues_a_rollup_rebuild_for_both_users(self) -> None:
+        """The Core statements bypass the ORM hooks that maintain the rollups."""
         repo = UserVideoRepository()
         session = _mock_session()
 
         await repo.merge_user_identity(session, from_user_id=FROM_ID, to_user_id=TO_ID)
 
-        rekey_sql = _sql(session.execute.await_args_list[2].args[0])
-        assert rekey_sql.startswith("update user_videos set user_id")
-        assert f"user_videos.user_id = '{FROM_ID}'".lower() in rekey_sql
-        assert f"'{TO_ID}'".lower() in rekey_sql
+        assert session.sync_session.info["chronovista_watch_rollups_pending"] == {
+            FROM_ID: None,
+            TO_ID: None,
+        }
+
+
+class TestCopyMergePreImage:
+    async def test_streams_both_sides_through_copy(self) -> None:
+        repo = UserVideoRepository()
+        driver = MagicMock()
+        driver.copy_from_query = AsyncMock(return_value="COPY 3")
+        connection = MagicMock()
+        connection.get_raw_connection = AsyncMock(
+            return_value=MagicMock(driver_connection=driver)
+        )
+        session = MagicMock(spec=AsyncSession)
+        session.connection = AsyncMock(return_value=connection)
+        output = MagicMock()
+
+        written = await repo.copy_merge_pre_image(
+            session,
+            survivor_user_id=TO_ID,
+            placeholder_user_ids=[FROM_ID],
+            output=output,
+        )
+
+        assert written == 3
+        query, placeholders, survivor = driver.copy_from_query.await_args.args
+        assert (placeholders, survivor) == ([FROM_ID], TO_ID)
+        # Placeholder rows, plus the survivor rows that overlap them.
+        assert "user_id = any($1::text[])" in query.lower()
+        assert "user_id = $2" in query
+        kwargs = driver.copy_from_query.await_args.kwargs
+        assert kwargs["output"] is output
+        assert kwargs["format"] == "csv" and kwargs["header"] is True
+
+    async def test_no_placeholders_copies_nothing(self) -> None:
+        session = MagicMock(spec=AsyncSession)
+        session.connection = AsyncMock()
+
+        written = await UserVideoRepository().copy_merge_pre_image(
+            session, survivor_user_id=TO_ID, placeholder_user_ids=[], output=MagicMock()
+        )
+
+        assert written == 0
+        session.connection.assert_not_awaited()
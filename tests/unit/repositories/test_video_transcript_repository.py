@@ -12,6 +12,7 @@ from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from chronovista.db.models import VideoTranscript as VideoTranscriptDB
@@ -19,14 +20,18 @@ from chronovista.models.enums import (
     DownloadReason,
     LanguageCode,
     TrackKind,
+    TranscriptStorageMode,
     TranscriptType,
 )
 from chronovista.models.video_transcript import (
     TranscriptSearchFilters,
+    TranscriptStorageReport,
     VideoTranscriptCreate,
 )
 from chronovista.repositories.video_transcript_repository import (
     VideoTranscriptRepository,
+    _compress_raw_payload,
+    _decompress_raw_payload,
 )
 
 
@@ -181,6 +186,35 @@ class TestVideoTranscriptRepository:
         assert result is False
         mock_session.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_stored_language_keys_one_query(
+        self, repository: VideoTranscriptRepository, mock_session: AsyncMock
+    ):
+        """Stored pairs for many videos come back from a single array-bound query."""
+        mock_session.execute.return_value = iter(
+            [("dQw4w9WgXcQ", "en"), ("9bZkp7q19f0", "es")]
+        )
+
+        result = await repository.get_stored_language_keys(
+            mock_session, ["dQw4w9WgXcQ", "9bZkp7q19f0", "dQw4w9WgXcQ"]
+        )
+
+        assert result == {("dQw4w9WgXcQ", "en"), ("9bZkp7q19f0", "es")}
+        mock_session.execute.assert_called_once()
+        compiled = mock_session.execute.call_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+        assert "= ANY (" in str(compiled)
+        assert compiled.params["video_ids"] == ["dQw4w9WgXcQ", "9bZkp7q19f0"]
+
+    @pytest.mark.asyncio
+    async def test_get_stored_language_keys_empty(
+        self, repository: VideoTranscriptRepository, mock_session: AsyncMock
+    ):
+        """No video IDs means no query."""
+        assert await repository.get_stored_language_keys(mock_session, []) == set()
+        mock_session.execute.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_video_transcripts(
         self,
@@ -301,6 +335,29 @@ class TestVideoTranscriptRepository:
         assert result == sample_transcripts_list
         mock_session.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_language_reads_compare_the_stored_spelling(
+        self,
+        repository: VideoTranscriptRepository,
+        mock_session: AsyncMock,
+    ):
+        """Regional codes are matched as stored ('en-US'), not lowercased."""
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        await repository.get_transcripts_by_language(mock_session, "EN-us")
+        await repository.search_transcripts(
+            mock_session, TranscriptSearchFilters(language_codes=["en-us", "ES"])
+        )
+
+        by_language, search = (
+            call.args[0].compile(dialect=postgresql.dialect()).params
+            for call in mock_session.execute.call_args_list
+        )
+        assert "en-US" in by_language.values()
+        assert ["en-US", "es"] in search.values()
+
     @pytest.mark.asyncio
     async def test_search_transcripts_empty_filters(
         self,
@@ -2211,3 +2268,206 @@ class TestSegmentCreationInCreateOrUpdate:
 
                 # Verify _create_segments_from_raw_data was NOT called
                 mock_create_segments.assert_not_called()
+
+
+class TestVideoTranscriptRepositoryCompactStorage:
+    """Tests for compact storage: derived text, archived raw data, compaction."""
+
+    @pytest.fixture
+    def repository(self) -> VideoTranscriptRepository:
+        """Create repository instance for testing."""
+        return VideoTranscriptRepository()
+
+    @pytest.fixture
+    def mock_session(self) -> AsyncMock:
+        """Create mock async session."""
+        return AsyncMock(spec=AsyncSession)
+
+    @pytest.fixture
+    def raw_data(self) -> dict[str, Any]:
+        """Raw transcript payload with non-ASCII text."""
+        return {
+            "source": "youtube_transcript_api",
+            "snippets": [
+                {"text": "hola señor", "start": 0.0, "duration": 1.5},
+                {"text": "adiós", "start": 1.5, "duration": 1.0},
+            ],
+        }
+
+    @staticmethod
+    def _transcript(storage_mode: str, **overrides: Any) -> VideoTranscriptDB:
+        fields: dict[str, Any] = {
+            "video_id": "dQw4w9WgXcQ",
+            "language_code": "es",
+            "transcript_text": "hola señor adiós",
+            "transcript_type": TranscriptType.AUTO.value,
+            "download_reason": DownloadReason.USER_REQUEST.value,
+            "track_kind": TrackKind.ASR.value,
+            "storage_mode": storage_mode,
+        }
+        fields.update(overrides)
+        return VideoTranscriptDB(**fields)
+
+    @staticmethod
+    def _rows_result(rows: list[tuple[Any, ...]]) -> MagicMock:
+        result = MagicMock()
+        result.all.return_value = rows
+        return result
+
+    def test_payload_round_trip(self, raw_data: dict[str, Any]) -> None:
+        """Compression round-trips the payload exactly."""
+        payload = _compress_raw_payload(raw_data)
+
+        assert _decompress_raw_payload(payload) == raw_data
+        assert isinstance(payload, bytes)
+
+    async def test_full_transcript_text_is_read_inline(
+        self, repository: VideoTranscriptRepository, mock_session: AsyncMock
+    ) -> None:
+        """Full rows return the stored text without a query."""
+        transcript = self._transcript(TranscriptStorageMode.FULL.value)
+
+        text = await repository.get_transcript_text(mock_session, transcript)
+
+        assert text == "hola señor adiós"
+        mock_session.execute.assert_not_called()
+
+    async def test_compact_transcript_text_is_derived(
+        self, repository: VideoTranscriptRepository, mock_session: AsyncMock
+    ) -> None:
+        """Compact rows derive their text from segments."""
+        transcript = self._transcript(
+            TranscriptStorageMode.COMPACT.value, transcript_text=""
+        )
+        result = MagicMock()
+        result.scalar_one.return_value = "hola señor adiós"
+        mock_session.execute.return_value = result
+
+        text = await repository.get_transcript_text(mock_session, transcript)
+
+        assert text == "hola señor adiós"
+        mock_session.execute.assert_called_once()
+
+    async def test_compact_raw_data_is_decompressed_from_archive(
+        self,
+        repository: VideoTranscriptRepository,
+        mock_session: AsyncMock,
+        raw_data: dict[str, Any],
+    ) -> None:
+        """Compact rows read raw data back from the archive table."""
+        transcript = self._transcript(
+            TranscriptStorageMode.COMPACT.value, raw_transcript_data=None
+        )
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = _compress_raw_payload(raw_data)
+        mock_session.execute.return_value = result
+
+        assert await repository.get_raw_transcript_data(mock_session, transcript) == (
+            raw_data
+        )
+
+    async def test_compact_batch_archives_matching_rows(
+        self,
+        repository: VideoTranscriptRepository,
+        mock_session: AsyncMock,
+        raw_data: dict[str, Any],
+    ) -> None:
+        """Matching rows are archived and released; mismatches are skipped."""
+        mock_session.execute.side_effect = [
+            self._rows_result(
+                [
+                    ("aaaaaaaaaaa", "en", "a b", raw_data, 40, 900, "a b"),
+                    ("bbbbbbbbbbb", "en", "stale", None, 30, 0, "fresh"),
+                    ("ccccccccccc", "en", "c", None, 20, 0, "c"),
+                ]
+            ),
+            MagicMock(),  # archive upsert
+            MagicMock(),  # video_transcripts update
+        ]
+
+        result = await repository.compact_batch(mock_session, batch_size=3)
+
+        assert result.compacted == 2
+        assert result.skipped_mismatch == 1
+        assert result.last_key == ("ccccccccccc", "en")
+        assert result.bytes_released == 40 + 900 + 20
+        assert result.bytes_archived == len(_compress_raw_payload(raw_data))
+        assert mock_session.execute.call_count == 3
+
+        archive_rows = mock_session.execute.call_args_list[1][0][1]
+        assert [r["video_id"] for r in archive_rows] == ["aaaaaaaaaaa", "ccccccccccc"]
+        assert archive_rows[1]["raw_payload"] is None
+        assert _decompress_raw_payload(archive_rows[0]["raw_payload"]) == raw_data
+
+    async def test_compact_batch_dry_run_does_not_write(
+        self,
+        repository: VideoTranscriptRepository,
+        mock_session: AsyncMock,
+        raw_data: dict[str, Any],
+    ) -> None:
+        """A dry run measures the batch with a single read."""
+        mock_session.execute.return_value = self._rows_result(
+            [("aaaaaaaaaaa", "en", "a b", raw_data, 40, 900, "a b")]
+        )
+
+        result = await repository.compact_batch(mock_session, dry_run=True)
+
+        assert result.compacted == 1
+        mock_session.execute.assert_called_once()
+
+    async def test_compact_batch_empty(
+        self, repository: VideoTranscriptRepository, mock_session: AsyncMock
+    ) -> None:
+        """No candidates leaves ``last_key`` unset so callers stop."""
+        mock_session.execute.return_value = self._rows_result([])
+
+        result = await repository.compact_batch(mock_session, after=("zzz", "en"))
+
+        assert result.last_key is None
+        assert result.compacted == 0
+
+    async def test_create_or_update_compacts_when_requested(
+        self,
+        repository: VideoTranscriptRepository,
+        mock_session: AsyncMock,
+        raw_data: dict[str, Any],
+    ) -> None:
+        """``compact=True`` compacts once segments have been written."""
+        execute_result = MagicMock()
+        execute_result.rowcount = 0
+        mock_session.execute.return_value = execute_result
+        create = VideoTranscriptCreate(
+            video_id="dQw4w9WgXcQ",
+            language_code=LanguageCode.SPANISH,
+            transcript_text="hola señor adiós",
+            transcript_type=TranscriptType.AUTO,
+            download_reason=DownloadReason.USER_REQUEST,
+            track_kind=TrackKind.ASR,
+        )
+
+        with (
+            patch.object(
+                repository, "get_by_composite_key", new_callable=AsyncMock
+            ) as mock_get,
+            patch.object(
+                repository, "compact_transcript", new_callable=AsyncMock
+            ) as mock_compact,
+        ):
+            mock_get.return_value = None
+            mock_compact.return_value = True
+
+            await repository.create_or_update(
+                mock_session, create, raw_transcript_data=raw_data, compact=True
+            )
+
+        mock_compact.assert_awaited_once_with(mock_session, "dQw4w9WgXcQ", "es")
+        added = mock_session.add.call_args_list[0][0][0]
+        assert added.storage_mode == TranscriptStorageMode.FULL.value
+
+    def test_storage_report_bytes_saved(self) -> None:
+        """Net saving is released bytes minus the compressed archive."""
+        report = TranscriptStorageReport(
+            released_text_bytes=1_000, released_raw_bytes=9_000, archived_bytes=2_500
+        )
+
+        assert report.bytes_saved == 7_500
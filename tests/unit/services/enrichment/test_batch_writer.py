@@ -0,0 +1,358 @@
+"""
+Unit tests for the set-based enrichment page writer.
+
+The writer's statements are PostgreSQL-only, so these tests drive it with a
+scripted session that records each statement (compiled for PostgreSQL) and
+answers the few SELECTs it issues. Behaviour against a real database is
+covered by the enrichment integration tests.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from chronovista.models.enums import AvailabilityStatus
+from chronovista.services.enrichment.batch_writer import EnrichmentBatchWriter
+from chronovista.services.enrichment.enrichment_service import EnrichmentService
+from tests.unit.services.enrichment.conftest import make_video_response
+
+CHANNEL_A = "UCuAXFkgsw1L7xaCfnd5JJOw"
+CHANNEL_B = "UC_x5XG1OV2P6uZZ5FSM9Ttw"
+
+
+class ScriptedSession:
+    """Records executed statements and answers the writer's SELECTs."""
+
+    def __init__(
+        self,
+        videos: dict[str, dict[str, Any]],
+        channels: dict[str, str] | None = None,
+        categories: set[str] | None = None,
+    ) -> None:
+        self.videos = videos
+        self.channels = channels or {}
+        self.categories = categories or {"10"}
+        self.statements: list[tuple[str, dict[str, Any]]] = []
+        self.info: dict[str, Any] = {}
+
+    async def execute(self, statement: Any) -> Any:
+        compiled = statement.compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        self.statements.append((sql, compiled.params))
+        result = MagicMock()
+        if sql.startswith("SELECT videos.video_id"):
+            result.__iter__.return_value = [
+                SimpleNamespace(video_id=video_id, **state)
+                for video_id, state in self.videos.items()
+            ]
+        elif sql.startswith("SELECT channels.channel_id"):
+            result.tuples.return_value = list(self.channels.items())
+        elif sql.startswith("INSERT INTO channels"):
+            rows = [v for k, v in compiled.params.items() if k.startswith("channel_id")]
+            result.scalars.return_value.all.return_value = rows
+        elif sql.startswith("SELECT video_categories.category_id"):
+            result.scalars.return_value = list(self.categories)
+        return result
+
+    def sql(self, prefix: str) -> list[tuple[str, dict[str, Any]]]:
+        return [(s, p) for s, p in self.statements if s.startswith(prefix)]
+
+
+def _state(**overrides: Any) -> dict[str, Any]:
+    state: dict[str, Any] = {
+        "channel_id": CHANNEL_A,
+        "channel_name_hint": None,
+        "availability_status": AvailabilityStatus.AVAILABLE,
+        "unavailability_first_detected": None,
+    }
+    state.update(overrides)
+    return state
+
+
+def _cache(*video_ids: str) -> dict[str, dict[str, Any]]:
+    return {v: {"title": f"[Placeholder] {v}", "channel_id": None} for v in video_ids}
+
+
+@pytest.fixture
+def service() -> EnrichmentService:
+    service = EnrichmentService(
+        video_repository=AsyncMock(),
+        channel_repository=AsyncMock(),
+        video_tag_repository=AsyncMock(),
+        video_topic_repository=AsyncMock(),
+        video_category_repository=AsyncMock(),
+        topic_category_repository=AsyncMock(),
+        youtube_service=AsyncMock(),
+    )
+    service._provenance_repo = AsyncMock()
+    return service
+
+
+class TestWritePage:
+    async def test_page_uses_a_fixed_number_of_statements(
+        self, service: EnrichmentService
+    ) -> None:
+        ids = [f"video{i:06d}" for i in range(50)]
+        session = ScriptedSession({v: _state() for v in ids}, {CHANNEL_A: "Test"})
+        api = {
+            v: make_video_response(
+                v,
+                tags=["a", "b"],
+                topic_categories=["https://en.wikipedia.org/wiki/Music"],
+            )
+            for v in ids
+        }
+        with patch.object(
+            service, "_match_topic_from_url", AsyncMock(return_value="/m/04rlf")
+        ) as match:
+            result = await EnrichmentBatchWriter(service).write_page(
+                session, ids, api, set(), _cache(*ids)  # type: ignore[arg-type]
+            )
+
+        # state, channels, categories, one UPDATE, tags x2, topics x2
+        assert len(session.statements) == 8
+        assert match.await_count == 1
+        assert result.videos_updated == 50
+        assert result.tags_created == 100
+        assert result.topics_created == 50
+        assert result.categories_assigned == 50
+        assert [d.video_id for d in result.details] == ids
+        assert all(d.topics_count == 1 for d in result.details)
+
+    async def test_updates_are_grouped_by_column_set(
+        self, service: EnrichmentService
+    ) -> None:
+        session = ScriptedSession(
+            {
+                "plainVideo1": _state(),
+                "restoredVid": _state(
+                    availability_status=AvailabilityStatus.UNAVAILABLE
+                ),
+                "orphanVideo": _state(channel_id=None, channel_name_hint="Test"),
+            },
+            {CHANNEL_A: "Test"},
+        )
+        ids = list(session.videos)
+        api = {v: make_video_response(v) for v in ids}
+
+        result = await EnrichmentBatchWriter(service).write_page(
+            session, ids, api, set(), _cache(*ids)  # type: ignore[arg-type]
+        )
+
+        updates = session.sql("UPDATE videos")
+        assert len(updates) == 3
+        restored_sql = next(s for s, _ in updates if "availability_status=" in s)
+        assert "unavailability_first_detected" in restored_sql
+        orphan_sql = next(s for s, _ in updates if "channel_name_hint=" in s)
+        assert "channel_id=v.channel_id" in orphan_sql
+        assert result.channels_auto_resolved == 1
+        service._provenance_repo.record_video.assert_awaited_once()  # type: ignore[attr-defined]
+        assert service._provenance_repo.record_video.await_args.args[1] == "restoredVid"  # type: ignore[attr-defined]
+
+    async def test_unknown_category_is_reported_not_written(
+        self, service: EnrichmentService
+    ) -> None:
+        session = ScriptedSession({"video000001": _state()}, {CHANNEL_A: "Test"})
+        api = {"video000001": make_video_response("video000001", category_id="999")}
+
+        result = await EnrichmentBatchWriter(service).write_page(
+            session, ["video000001"], api, set(), _cache("video000001")  # type: ignore[arg-type]
+        )
+
+        assert result.categories_assigned == 0
+        ((update_sql, _),) = session.sql("UPDATE videos")
+        assert "category_id" not in update_sql
+
+    async def test_tags_are_deduplicated_and_truncated(
+        self, service: EnrichmentService
+    ) -> None:
+        session = ScriptedSession({"video000001": _state()}, {CHANNEL_A: "Test"})
+        api = {
+            "video000001": make_video_response(
+                "video000001", tags=["dup", "dup", "x" * 600]
+            )
+        }
+
+        result = await EnrichmentBatchWriter(service).write_page(
+            session, ["video000001"], api, set(), _cache("video000001")  # type: ignore[arg-type]
+        )
+
+        ((_, params),) = session.sql("INSERT INTO video_tags")
+        tags = [v for k, v in params.items() if k.startswith("tag_m")]
+        assert tags == ["dup", "x" * 500]
+        assert result.tags_created == 3
+        assert result.details[0].tags_count == 3
+
+    async def test_creates_new_channels_and_renames_placeholders(
+        self, service: EnrichmentService
+    ) -> None:
+        session = ScriptedSession(
+            {"video000001": _state(), "video000002": _state(channel_id=CHANNEL_B)},
+            {CHANNEL_B: f"[Placeholder] {CHANNEL_B}"},
+        )
+        api = {
+            "video000001": make_video_response("video000001", channel_title="New"),
+            "video000002": make_video_response(
+                "video000002", channel_id=CHANNEL_B, channel_title="Real Name"
+            ),
+        }
+
+        result = await EnrichmentBatchWriter(service).write_page(
+            session, list(api), api, set(), _cache(*api)  # type: ignore[arg-type]
+        )
+
+        assert result.channels_created == 1
+        ((insert_sql, _),) = session.sql("INSERT INTO channels")
+        assert "ON CONFLICT (channel_id) DO NOTHING" in insert_sql
+        ((rename_sql, params),) = session.sql("UPDATE channels")
+        assert "title=v.title" in rename_sql
+        assert "Real Name" in str(params)
+
+    async def test_unmatched_topics_leave_existing_topics_alone(
+        self, service: EnrichmentService
+    ) -> None:
+        session = ScriptedSession({"video000001": _state()}, {CHANNEL_A: "Test"})
+        api = {
+            "video000001": make_video_response(
+                "video000001", topic_categories=["https://en.wikipedia.org/wiki/Nope"]
+            )
+        }
+        with patch.object(
+            service, "_match_topic_from_url", AsyncMock(return_value=None)
+        ):
+            result = await EnrichmentBatchWriter(service).write_page(
+                session, ["video000001"], api, set(), _cache("video000001")  # type: ignore[arg-type]
+            )
+
+        assert session.sql("DELETE FROM video_topics") == []
+        assert result.topics_created == 0
+
+    async def test_missing_and_not_found_videos_are_reported(
+        self, service: EnrichmentService
+    ) -> None:
+        session = ScriptedSession({}, {})
+        with patch.object(
+            service, "_mark_video_deleted_by_id", AsyncMock(return_value=True)
+        ):
+            result = await EnrichmentBatchWriter(service).write_page(
+                session,  # type: ignore[arg-type]
+                ["goneVideo01", "notInDb0001", "noApiData01"],
+                {"notInDb0001": make_video_response("notInDb0001")},
+                {"goneVideo01"},
+                _cache("goneVideo01", "notInDb0001", "noApiData01"),
+            )
+
+        assert [d.status for d in result.details] == ["deleted", "error", "error"]
+        assert result.videos_deleted == 1
+        assert result.errors == 2
+        assert result.videos_updated == 0
+        assert session.sql("UPDATE") == []
+
+
+class TestEnrichVideosPaging:
+    def _postgres_session(self) -> MagicMock:
+        session = MagicMock()
+        session.bind.dialect.name = "postgresql"
+        session.commit = AsyncMock()
+        session.rollback = AsyncMock()
+        session.execute = AsyncMock()
+        session.flush = AsyncMock()
+        return session
+
+    def test_batch_writer_only_on_postgres(self, service: EnrichmentService) -> None:
+        assert service._batch_writer(self._postgres_session()) is not None
+        assert service._batch_writer(AsyncMock()) is None
+
+    def test_batch_writer_can_be_disabled(self, service: EnrichmentService) -> None:
+        with patch(
+            "chronovista.config.settings.settings.enrichment_set_based_writes", False
+        ):
+            assert service._batch_writer(self._postgres_session()) is None
+
+    async def test_failed_page_is_replayed_per_video(
+        self, service: EnrichmentService
+    ) -> None:
+        session = self._postgres_session()
+        video = MagicMock(
+            video_id="video000001",
+            title="[Placeholder] video000001",
+            channel_id=CHANNEL_A,
+            availability_status=AvailabilityStatus.AVAILABLE,
+        )
+        writer = MagicMock()
+        writer.write_page = AsyncMock(side_effect=RuntimeError("boom"))
+        service.youtube_service.fetch_videos_batched = AsyncMock(  # type: ignore[method-assign]
+            return_value=([make_video_response("video000001")], set())
+        )
+
+        with (
+            patch.object(
+                service,
+                "_get_videos_for_enrichment",
+                AsyncMock(return_value=[video]),
+            ),
+            patch.object(service, "_batch_writer", return_value=writer),
+        ):
+            report = await service.enrich_videos(session, check_prerequisites=False)
+
+        writer.write_page.assert_awaited_once()
+        session.rollback.assert_awaited()
+        service.video_repository.get.assert_awaited()  # type: ignore[attr-defined]
+        assert report.summary.videos_processed == 1
+
+    async def test_replay_recreates_topics_from_the_rolled_back_page(
+        self, service: EnrichmentService
+    ) -> None:
+        from chronovista.db.models import TopicCategory as TopicCategoryDB
+        from chronovista.services.enrichment.topic_resolver import TopicResolver
+
+        session = self._postgres_session()
+        session.add = MagicMock()
+        url = "https://en.wikipedia.org/wiki/Chess_boxing"
+        video = MagicMock(
+            video_id="video000001",
+            title="[Placeholder] video000001",
+            channel_id=CHANNEL_A,
+            availability_status=AvailabilityStatus.AVAILABLE,
+        )
+        resolver = TopicResolver()
+
+        async def write_page(*_: Any) -> None:
+            # The page creates the dynamic topic, then fails.
+            await service._match_topic_from_url(session, url, resolver)
+            raise RuntimeError("boom")
+
+        writer = MagicMock()
+        writer.write_page = AsyncMock(side_effect=write_page)
+        service.youtube_service.fetch_videos_batched = AsyncMock(  # type: ignore[method-assign]
+            return_value=(
+                [make_video_response("video000001", topic_categories=[url])],
+                set(),
+            )
+        )
+
+        with (
+            patch.object(
+                service,
+                "_get_videos_for_enrichment",
+                AsyncMock(return_value=[video]),
+            ),
+            patch.object(TopicResolver, "load", AsyncMock(return_value=resolver)),
+            patch.object(service, "_batch_writer", return_value=writer),
+        ):
+            await service.enrich_videos(session, check_prerequisites=False)
+
+        # The rollback dropped the page's topic, so the replay created it again
+        # rather than linking the video to a topic that no longer exists.
+        created = [
+            c.args[0]
+            for c in session.add.call_args_list
+            if isinstance(c.args[0], TopicCategoryDB)
+        ]
+        assert [t.topic_id for t in created] == ["wiki_Chess_boxing"] * 2
+        assert resolver.has_topic("wiki_Chess_boxing")
@@ -0,0 +1,158 @@
+"""
+Unit tests for the in-memory topic URL resolver.
+
+Covers the three lookup stages, URL memoization, dynamic topic registration
+and the statistics reported in ``EnrichmentSummary.topic_cache``.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from chronovista.models.enrichment_report import TopicCacheStats
+from chronovista.services.enrichment.enrichment_service import EnrichmentService
+from chronovista.services.enrichment.topic_resolver import TopicResolver
+
+MUSIC_URL = "https://en.wikipedia.org/wiki/Music"
+
+
+def _result(rows: list[tuple[str | None, ...]]) -> MagicMock:
+    result = MagicMock()
+    result.__iter__.return_value = iter(rows)
+    return result
+
+
+@pytest.fixture
+def resolver() -> TopicResolver:
+    resolver = TopicResolver()
+    resolver.add("/m/04rlf", MUSIC_URL, "music")
+    resolver.add("/m/02jjt", None, "entertainment")
+    resolver._by_alias["Humour"] = "/m/05qjc"
+    return resolver
+
+
+@pytest.fixture
+def service() -> EnrichmentService:
+    return EnrichmentService(
+        video_repository=AsyncMock(),
+        channel_repository=AsyncMock(),
+        video_tag_repository=AsyncMock(),
+        video_topic_repository=AsyncMock(),
+        video_category_repository=AsyncMock(),
+        topic_category_repository=AsyncMock(),
+        youtube_service=AsyncMock(),
+    )
+
+
+class TestTopicResolver:
+    async def test_load_reads_topics_and_aliases_once(self) -> None:
+        session = AsyncMock()
+        session.execute.side_effect = [
+            _result(
+                [
+                    ("/m/04rlf", MUSIC_URL, "music"),
+                    ("wiki_Music", "https://en.wikipedia.org/wiki/music", "music"),
+                ]
+            ),
+            _result([("Humour", "/m/05qjc")]),
+        ]
+
+        resolver = await TopicResolver.load(session)
+
+        assert session.execute.await_count == 2
+        # The lowest topic_id wins a shared normalized name, as in the query.
+        assert resolver.lookup("https://x", "music", "Music") == "/m/04rlf"
+        assert resolver.lookup("https://y", "humor", "Humour") == "/m/05qjc"
+        assert resolver.has_topic("wiki_Music")
+
+    def test_stages_and_stats(self, resolver: TopicResolver) -> None:
+        assert resolver.lookup(MUSIC_URL, "music", "Music") == "/m/04rlf"
+        entertainment = "https://en.wikipedia.org/wiki/Entertainment"
+        assert (
+            resolver.lookup(entertainment, "entertainment", "Entertainment")
+            == "/m/02jjt"
+        )
+        humour = "https://en.wikipedia.org/wiki/Humour"
+        assert resolver.lookup(humour, "humour", "Humour") == "/m/05qjc"
+        assert resolver.lookup("https://z", "unknown", "Unknown") is None
+
+        # Name and alias matches are remembered by URL.
+        assert (
+            resolver.lookup(entertainment, "entertainment", "Entertainment")
+            == "/m/02jjt"
+        )
+
+        assert resolver.stats == TopicCacheStats(
+            lookups=5, url_hits=2, name_hits=1, alias_hits=1
+        )
+        assert resolver.stats.hit_rate == pytest.approx(0.8)
+
+    def test_rollback_drops_pending_topics(self, resolver: TopicResolver) -> None:
+        url = "https://en.wikipedia.org/wiki/Chess_boxing"
+        resolver.add("wiki_Chess_boxing", url, "chess boxing", pending=True)
+        # A name hit on a pending topic memoizes a pending URL entry too.
+        other_url = "https://en.wikipedia.org/wiki/Chess%20boxing"
+        assert resolver.lookup(other_url, "chess boxing", "x") == "wiki_Chess_boxing"
+
+        resolver.rollback()
+
+        assert not resolver.has_topic("wiki_Chess_boxing")
+        assert resolver.lookup(url, "chess boxing", "Chess boxing") is None
+        assert resolver.lookup(other_url, "chess boxing", "x") is None
+        # Committed entries are untouched.
+        assert resolver.lookup(MUSIC_URL, "music", "Music") == "/m/04rlf"
+
+    def test_commit_keeps_pending_topics(self, resolver: TopicResolver) -> None:
+        url = "https://en.wikipedia.org/wiki/Chess_boxing"
+        resolver.add("wiki_Chess_boxing", url, "chess boxing", pending=True)
+
+        resolver.commit()
+        resolver.rollback()
+
+        assert resolver.has_topic("wiki_Chess_boxing")
+        assert resolver.lookup(url, "chess boxing", "x") == "wiki_Chess_boxing"
+
+    def test_hit_rate_is_none_without_lookups(self) -> None:
+        assert TopicCacheStats().hit_rate is None
+        assert "hit_rate" in TopicCacheStats().model_dump()
+
+
+class TestMatchTopicWithResolver:
+    async def test_cached_url_needs_no_query(
+        self, service: EnrichmentService, resolver: TopicResolver
+    ) -> None:
+        session = AsyncMock()
+
+        topic_id = await service._match_topic_from_url(session, MUSIC_URL, resolver)
+
+        assert topic_id == "/m/04rlf"
+        session.execute.assert_not_awaited()
+
+    async def test_dynamic_topic_is_added_to_the_maps(
+        self, service: EnrichmentService, resolver: TopicResolver
+    ) -> None:
+        session = AsyncMock()
+        session.add = MagicMock()
+        url = "https://en.wikipedia.org/wiki/Chess_boxing"
+
+        first = await service._match_topic_from_url(session, url, resolver)
+        second = await service._match_topic_from_url(session, url, resolver)
+
+        assert first == second == "wiki_Chess_boxing"
+        session.add.assert_called_once()
+        session.flush.assert_awaited_once()
+        session.execute.assert_not_awaited()
+        assert resolver.stats.created == 1
+        assert resolver.stats.url_hits == 1
+
+    async def test_non_english_urls_are_not_counted(
+        self, service: EnrichmentService, resolver: TopicResolver
+    ) -> None:
+        topic_id = await service._match_topic_from_url(
+            AsyncMock(), "https://de.wikipedia.org/wiki/Musik", resolver
+        )
+
+        assert topic_id is None
+        assert resolver.stats.lookups == 0
@@ -2314,17 +2314,14 @@ class TestBatchRevert:
 
             result = await service.batch_revert(mock_session, pattern="fixed")
 
-            # Verify mentions were deleted with the correct correction IDs
+            # Verify mentions were deleted with the correct correction IDs,
+            # adjusting the counters in the same transaction
             mock_mention_repo.delete_by_correction_ids.assert_called_once_with(
-                mock_session, [corr_id]
-            )
-            # Verify entity and alias counters were recalculated
-            mock_mention_repo.update_entity_counters.assert_called_once_with(
-                mock_session, [entity_id]
-            )
-            mock_mention_repo.update_alias_counters.assert_called_once_with(
-                mock_session, [entity_id]
+                mock_session, [corr_id], adjust_counters=True
             )
+            # No full recompute is needed on top of the deltas
+            mock_mention_repo.update_entity_counters.assert_not_called()
+            mock_mention_repo.update_alias_counters.assert_not_called()
 
         assert result.total_applied == 1
 
@@ -2413,7 +2410,7 @@ class TestBatchRevert:
 
             # Should only pass seg1's correction ID — not seg2's
             mock_mention_repo.delete_by_correction_ids.assert_called_once_with(
-                mock_session, [corr_id_seg1]
+                mock_session, [corr_id_seg1], adjust_counters=True
             )
 
         assert result.total_applied == 1
@@ -3140,9 +3137,11 @@ class TestFindCrossSegmentMatchesPreFilter:
     """
     Unit tests for the pre-filter optimization in _find_cross_segment_matches().
 
-    These tests validate the branching logic: when video_ids is None the
-    service must call find_candidate_video_ids_for_cross_segment() first;
-    when video_ids is already provided by the caller the pre-filter is skipped.
+    The token pre-filter serves regex patterns (substring patterns use the
+    seam index). These tests validate the branching logic: when video_ids is
+    None the service must call find_candidate_video_ids_for_cross_segment()
+    first; when video_ids is already provided by the caller the pre-filter is
+    skipped.
     """
 
     # ------------------------------------------------------------------
@@ -3160,9 +3159,9 @@ class TestFindCrossSegmentMatchesPreFilter:
 
         await service._find_cross_segment_matches(
             mock_session,
-            pattern="Johnsen Bomb",
+            pattern=r"Johnsen\s+Bomb",
             replacement="JohnsenBomb",
-            regex=False,
+            regex=True,
             case_insensitive=False,
             re_flags=0,
             language=None,
@@ -3197,9 +3196,9 @@ class TestFindCrossSegmentMatchesPreFilter:
 
         await service._find_cross_segment_matches(
             mock_session,
-            pattern="Johnsen Bomb",
+            pattern=r"Johnsen\s+Bomb",
             replacement="JohnsenBomb",
-            regex=False,
+            regex=True,
             case_insensitive=False,
             re_flags=0,
             language=None,
@@ -3228,9 +3227,9 @@ class TestFindCrossSegmentMatchesPreFilter:
 
         result = await service._find_cross_segment_matches(
             mock_session,
-            pattern="xyzzy plugh",
+            pattern=r"xyzzy\s+plugh",
             replacement="other",
-            regex=False,
+            regex=True,
             case_insensitive=False,
             re_flags=0,
             language=None,
@@ -3253,9 +3252,9 @@ class TestFindCrossSegmentMatchesPreFilter:
 
         await service._find_cross_segment_matches(
             mock_session,
-            pattern="foo bar",
+            pattern=r"foo\s+bar",
             replacement="baz",
-            regex=False,
+            regex=True,
             case_insensitive=False,
             re_flags=0,
             language="es",
@@ -3280,9 +3279,9 @@ class TestFindCrossSegmentMatchesPreFilter:
 
         await service._find_cross_segment_matches(
             mock_session,
-            pattern="foo bar",
+            pattern=r"foo\s+bar",
             replacement="baz",
-            regex=False,
+            regex=True,
             case_insensitive=False,
             re_flags=0,
             language=None,
@@ -3297,6 +3296,153 @@ class TestFindCrossSegmentMatchesPreFilter:
         assert call_kwargs.get("channel") == "UCzzzz"
 
 
+# ---------------------------------------------------------------------------
+# TestFindCrossSegmentMatchesSeams
+# ---------------------------------------------------------------------------
+
+
+class TestPatternSeamBoundaries:
+    """Unit tests for _pattern_seam_boundaries() boundary splitting."""
+
+    def test_one_split_per_space(self, service: Any) -> None:
+        """Each space yields the (tail, head) split around it."""
+        assert service._pattern_seam_boundaries("Ada Love lace") == [
+            ("Ada", "Love lace"),
+            ("Ada Love", "lace"),
+        ]
+
+    def test_pattern_without_space_has_no_boundaries(self, service: Any) -> None:
+        """A pattern with no space cannot span the joining space."""
+        assert service._pattern_seam_boundaries("Lovelace") == []
+
+    def test_edge_space_leaves_one_side_unconstrained(self, service: Any) -> None:
+        """Leading/trailing spaces produce an empty side, which is allowed."""
+        assert service._pattern_seam_boundaries(" lace") == [("", "lace")]
+        assert service._pattern_seam_boundaries("Ada ") == [("Ada", "")]
+
+    def test_whitespace_only_split_is_unusable(self, service: Any) -> None:
+        """A split blank on both sides cannot narrow the seam lookup."""
+        assert service._pattern_seam_boundaries(" ") is None
+        assert service._pattern_seam_boundaries(" \t ") is None
+
+
+class TestFindCrossSegmentMatchesSeams:
+    """Substring cross-segment matching driven by the seam index."""
+
+    async def test_substring_pattern_queries_seams_with_scope(
+        self,
+        service: Any,
+        mock_session: AsyncMock,
+        mock_segment_repo: AsyncMock,
+    ) -> None:
+        """Boundaries and scope filters go to find_segments_at_seams only."""
+        mock_segment_repo.find_segments_at_seams.return_value = []
+
+        await service._find_cross_segment_matches(
+            mock_session,
+            pattern="Johnsen Bomb",
+            replacement="JohnsenBomb",
+            regex=False,
+            case_insensitive=False,
+            re_flags=0,
+            language="en",
+            channel="UCzzzz",
+            video_ids=None,
+            single_segment_ids=set(),
+        )
+
+        mock_segment_repo.find_segments_at_seams.assert_called_once_with(
+            mock_session,
+            boundaries=[("Johnsen", "Bomb")],
+            language="en",
+            channel="UCzzzz",
+            video_ids=None,
+        )
+        mock_segment_repo.find_candidate_video_ids_for_cross_segment.assert_not_called()
+        mock_segment_repo.find_segments_in_scope.assert_not_called()
+
+    async def test_pattern_without_space_skips_all_queries(
+        self,
+        service: Any,
+        mock_session: AsyncMock,
+        mock_segment_repo: AsyncMock,
+    ) -> None:
+        """No space in the pattern means no cross-segment match is possible."""
+        result = await service._find_cross_segment_matches(
+            mock_session,
+            pattern="Lovelace",
+            replacement="Lovelace",
+            regex=False,
+            case_insensitive=False,
+            re_flags=0,
+            language=None,
+            channel=None,
+            video_ids=None,
+            single_segment_ids=set(),
+        )
+
+        assert result == []
+        mock_segment_repo.find_segments_at_seams.assert_not_called()
+        mock_segment_repo.find_segments_in_scope.assert_not_called()
+
+    async def test_whitespace_only_pattern_falls_back_to_token_prefilter(
+        self,
+        service: Any,
+        mock_session: AsyncMock,
+        mock_segment_repo: AsyncMock,
+    ) -> None:
+        """Patterns the seam index cannot narrow use the token pre-filter."""
+        mock_segment_repo.find_candidate_video_ids_for_cross_segment.return_value = []
+
+        await service._find_cross_segment_matches(
+            mock_session,
+            pattern=" ",
+            replacement="",
+            regex=False,
+            case_insensitive=False,
+            re_flags=0,
+            language=None,
+            channel=None,
+            video_ids=None,
+            single_segment_ids=set(),
+        )
+
+        mock_segment_repo.find_segments_at_seams.assert_not_called()
+        mock_segment_repo.find_candidate_video_ids_for_cross_segment.assert_called_once()
+
+    async def test_seam_segments_are_paired_and_matched(
+        self,
+        service: Any,
+        mock_session: AsyncMock,
+        mock_segment_repo: AsyncMock,
+    ) -> None:
+        """Segments returned by the seam lookup feed the usual pairing logic."""
+        seg_a = _make_segment(
+            segment_id=10, text="talking about Johnsen", sequence_number=4
+        )
+        seg_b = _make_segment(
+            segment_id=11, text="bomb theory today", sequence_number=5
+        )
+        mock_segment_repo.find_segments_at_seams.return_value = [seg_a, seg_b]
+
+        matches = await service._find_cross_segment_matches(
+            mock_session,
+            pattern="Johnsen Bomb",
+            replacement="JohnsenBomb",
+            regex=False,
+            case_insensitive=True,
+            re_flags=0,
+            language=None,
+            channel=None,
+            video_ids=None,
+            single_segment_ids=set(),
+        )
+
+        assert len(matches) == 1
+        assert matches[0].text_for_seg_a == "talking about JohnsenBomb"
+        assert matches[0].text_for_seg_b == "theory today"
+
+
 # ---------------------------------------------------------------------------
 # Entity-Aware Corrections (T027-T031)
 # ---------------------------------------------------------------------------
@@ -3639,13 +3785,13 @@ class TestApplyToSegmentsEntityMentionCreation:
 class TestApplyToSegmentsEntityCounterUpdate:
     """Tests for T031: entity counter update after all corrections."""
 
-    async def test_counter_update_called_when_entity_and_applied(
+    async def test_counter_deltas_applied_when_entity_and_applied(
         self,
         service: Any,
         mock_session: AsyncMock,
         mock_correction_service: AsyncMock,
     ) -> None:
-        """T031: update_entity_counters is called after successful corrections."""
+        """T031: counters are adjusted as the corrections' mentions are created."""
         entity = _make_entity()
         seg = _make_segment(video_id="vid1_test_x", segment_id=10, text="bad text")
         correction_record = MagicMock()
@@ -3676,13 +3822,12 @@ class TestApplyToSegmentsEntityCounterUpdate:
             )
 
             assert result.total_applied == 1
-            # update_entity_counters and update_alias_counters should have been called
-            mock_repo_instance.update_entity_counters.assert_called_once_with(
-                mock_session, [entity.id]
-            )
-            mock_repo_instance.update_alias_counters.assert_called_once_with(
-                mock_session, [entity.id]
-            )
+            # The insert applies its own counter deltas; no recompute follows
+            mock_repo_instance.bulk_create_with_conflict_skip.assert_called_once()
+            create_call = mock_repo_instance.bulk_create_with_conflict_skip.call_args
+            assert create_call.kwargs == {"adjust_counters": True}
+            mock_repo_instance.update_entity_counters.assert_not_called()
+            mock_repo_instance.update_alias_counters.assert_not_called()
 
     async def test_counter_update_not_called_without_entity(
         self,
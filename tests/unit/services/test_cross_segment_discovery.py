@@ -1929,16 +1929,16 @@ class TestCrossSegmentCandidateDiscoverySource:
 
 
 # ---------------------------------------------------------------------------
-# Performance-regression guard: the batched adjacency query must filter on the
-# RAW text/corrected_text columns (trigram-index friendly) and NOT a CASE
-# expression, which is opaque to idx_segments_text_trgm and forces a full
-# seq-scan of the ~1.5M-row self-join (~20s → endpoint timeout).
+# Performance-regression guard: the batched adjacency query must be driven by
+# left-anchored LIKE lookups on the seam table (text_pattern_ops range scans),
+# never by '%prefix' ILIKE over the segment self-join, which degrades to a full
+# seq-scan of the ~1.5M-row table (~20s → endpoint timeout).
 # See cross_segment_discovery._find_adjacent_pairs_batched.
 # ---------------------------------------------------------------------------
 
 
 class TestBatchedQueryIsIndexFriendly:
-    """Lock in the trigram-index-friendly shape of the batched adjacency query."""
+    """Lock in the seam-index-friendly shape of the batched adjacency query."""
 
     async def _compiled_sql(self) -> str:
         from sqlalchemy.dialects import postgresql
@@ -1961,30 +1961,93 @@ class TestBatchedQueryIsIndexFriendly:
             )
         )
 
-    async def test_filters_on_raw_text_columns_not_case_expression(self) -> None:
-        """The ILIKE candidate filter targets raw text/corrected_text, never CASE."""
+    async def test_filters_on_seam_table_not_segment_text(self) -> None:
+        """The candidate filter targets seam keys, never ILIKE on segment text."""
         sql = await self._compiled_sql()
-        # Both raw columns participate in the filter (trigram indexes cover them).
-        assert "corrected_text" in sql
-        assert sql.count("ILIKE") >= 4  # 2 pairs × (text OR corrected_text) per side
-        # A CASE(has_correction, corrected_text, text) expression would defeat the
-        # pg_trgm GIN index — its reappearance here is the regression we guard against.
-        assert "CASE" not in sql.upper()
-
-    async def test_prefix_and_suffix_wildcards_preserved(self) -> None:
-        """Prefix match is a trailing-anchored '%prefix'; suffix is 'suffix%'."""
+        assert "transcript_segment_seams" in sql
+        assert "tail_reversed LIKE" in sql
+        assert "head_text LIKE" in sql
+        assert "ILIKE" not in sql.upper()
+        # Adjacency comes from the seam row, not a sequence_number self-join.
+        assert "sequence_number" not in sql
+
+    async def test_patterns_are_left_anchored_and_normalized(self) -> None:
+        """Tail keys are reversed and lowercased; both are 'key%' prefixes."""
         sql = await self._compiled_sql()
         # literal_binds under the pyformat paramstyle doubles the '%' wildcard.
-        assert "'%Roy'" in sql or "'%%Roy'" in sql
-        assert "'Cohn%'" in sql or "'Cohn%%'" in sql
+        assert "'yor%" in sql
+        assert "'cohn%" in sql
+        assert "'%" not in sql
+
+    async def test_blank_splits_issue_no_query(self) -> None:
+        """Splits that constrain neither side are dropped before querying."""
+        discovery = CrossSegmentDiscovery(batch_service=_make_batch_service([]))
+        session = _make_mock_session()
+        session.execute = AsyncMock()
+
+        pairs = await discovery._find_adjacent_pairs_batched(session, [(" ", "")])
+
+        assert pairs == []
+        session.execute.assert_not_called()
+
+
+class TestAdjacentPairsFillTheLimit:
+    """The pair limit counts confirmed pairs, not seam candidates."""
+
+    @staticmethod
+    def _pair(seg_id: int, tail: str, head: str) -> tuple[MagicMock, MagicMock]:
+        return (
+            _make_segment_mock(
+                seg_id=seg_id,
+                video_id="v",
+                language_code="en",
+                sequence_number=seg_id,
+                text=tail,
+            ),
+            _make_segment_mock(
+                seg_id=seg_id + 1,
+                video_id="v",
+                language_code="en",
+                sequence_number=seg_id + 1,
+                text=head,
+            ),
+        )
+
+    async def test_pages_past_rejected_candidates(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import chronovista.services.cross_segment_discovery as module
+
+        monkeypatch.setattr(module, "_SEAM_PAGE_SIZE", 2)
+        monkeypatch.setattr(module, "_ADJACENT_PAIR_LIMIT", 2)
+        # Seams are word-truncated, so "roy" also matches "...royal" tails.
+        pages = [
+            [self._pair(1, "the royal", "cohn said"), self._pair(3, "royals", "co")],
+            [self._pair(5, "said Roy", "Cohn was"), self._pair(7, "a royal", "cohn")],
+            [self._pair(9, "and Roy", "Cohn"), self._pair(11, "Roy", "Cohn")],
+        ]
+        results = []
+        for page in pages:
+            result = MagicMock()
+            result.tuples.return_value.all.return_value = page
+            results.append(result)
+        session = _make_mock_session()
+        session.execute = AsyncMock(side_effect=results)
+        discovery = CrossSegmentDiscovery(batch_service=_make_batch_service([]))
+
+        pairs = await discovery._find_adjacent_pairs(session, "Roy", "Cohn")
+
+        assert [(n.id, n1.id) for n, n1 in pairs] == [(5, 6), (9, 10)]
+        assert session.execute.await_count == 3
+        last_sql = str(session.execute.call_args.args[0])
+        assert "transcript_segment_seams.segment_n_id >" in last_sql
 
 
 class TestIsTooShortSplit:
     """Boundary-split length guard: drops low-selectivity noise splits.
 
     Rule: neither side may be a single char, AND at least one side must be a
-    substantial (>= 4 char) anchor so PostgreSQL can drive the self-join from a
-    small row set. This is a quality + performance filter (see
+    substantial (>= 4 char) anchor so the seam range scan stays small. This is a quality + performance filter (see
     _is_too_short_split docstring).
     """
 
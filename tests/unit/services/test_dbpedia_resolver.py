@@ -8,6 +8,7 @@ placeholders (Constitution VI).
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any
 
 import httpx
@@ -18,6 +19,7 @@ from chronovista.services.dbpedia_resolver import (
     PROV_SITELINK,
     DbpediaResolver,
 )
+from chronovista.services.knowledge_base_cache import KnowledgeBaseCache
 
 pytestmark = pytest.mark.asyncio
 
@@ -87,3 +89,51 @@ class TestResolve:
 
         r = DbpediaResolver(http=httpx.AsyncClient(transport=httpx.MockTransport(boom)))
         assert await r.resolve("Q000001") is None  # never raises
+
+
+class TestCaching:
+    def _counting(
+        self, calls: list[str], *, sameas: str | None, fail: bool = False
+    ) -> httpx.MockTransport:
+        def respond(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.host)
+            if fail:
+                raise httpx.ConnectError("boom")
+            if "dbpedia.org" in request.url.host:
+                bindings = [{"resource": {"value": sameas}}] if sameas else []
+                return httpx.Response(200, json={"results": {"bindings": bindings}})
+            return httpx.Response(200, json={"entities": {"Q000001": {}}})
+
+        return httpx.MockTransport(respond)
+
+    async def test_definitive_negative_is_cached(self, tmp_path: Path) -> None:
+        cache = KnowledgeBaseCache(tmp_path / "kb.sqlite3", ttl_seconds=3600)
+        calls: list[str] = []
+        http = httpx.AsyncClient(transport=self._counting(calls, sameas=None))
+
+        assert await DbpediaResolver(http=http, cache=cache).resolve("Q000001") is None
+        assert await DbpediaResolver(http=http, cache=cache).resolve("Q000001") is None
+        assert len(calls) == 2  # sameAs + sitelink, once
+
+    async def test_hit_is_cached(self, tmp_path: Path) -> None:
+        cache = KnowledgeBaseCache(tmp_path / "kb.sqlite3", ttl_seconds=3600)
+        iri = "http://dbpedia.org/resource/Placeholder_Person"
+        calls: list[str] = []
+        http = httpx.AsyncClient(transport=self._counting(calls, sameas=iri))
+
+        for _ in range(3):
+            assert await DbpediaResolver(http=http, cache=cache).resolve("Q000001") == (
+                iri,
+                PROV_SAMEAS,
+            )
+        assert len(calls) == 1
+
+    async def test_failure_is_not_cached(self, tmp_path: Path) -> None:
+        cache = KnowledgeBaseCache(tmp_path / "kb.sqlite3", ttl_seconds=3600)
+        calls: list[str] = []
+        http = httpx.AsyncClient(
+            transport=self._counting(calls, sameas=None, fail=True)
+        )
+
+        assert await DbpediaResolver(http=http, cache=cache).resolve("Q000001") is None
+        assert cache.get("dbpedia", {"qid": "Q000001"}) == (False, None)
@@ -1011,8 +1011,8 @@ class TestBulkCreateConflictSkip:
 class TestCounterUpdate:
     """Verify that update_entity_counters and update_alias_counters are called only in live mode."""
 
-    async def test_update_entity_counters_called_in_live_mode(self) -> None:
-        """In live mode with matches, update_entity_counters must be called."""
+    async def test_incremental_live_scan_applies_counter_deltas(self) -> None:
+        """An incremental live scan adjusts counters with its inserts, no recompute."""
         from chronovista.models.entity_mention import EntityMentionCreate
         from chronovista.models.enums import DetectionMethod
         from chronovista.services.entity_mention_scan_service import _EntityPattern
@@ -1053,12 +1053,57 @@ class TestCounterUpdate:
             patch.object(svc, "_scan_batch", return_value=([mention], 0, [], 0, 0)),
         ):
             await svc.scan(dry_run=False)
+        create_call = svc._mention_repo.bulk_create_with_conflict_skip.call_args
+        assert create_call.args[1] == [mention]
+        assert create_call.kwargs == {"adjust_counters": True}
+        svc._mention_repo.update_entity_counters.assert_not_called()
+        svc._mention_repo.update_alias_counters.assert_not_called()
+
+    async def test_full_rescan_recomputes_counters(self) -> None:
+        """A full rescan inserts without deltas and recomputes scoped entities."""
+        from chronovista.models.entity_mention import EntityMentionCreate
+        from chronovista.models.enums import DetectionMethod
+        from chronovista.services.entity_mention_scan_service import _EntityPattern
+
+        entity_id = _make_uuid()
+        fake_pattern = _EntityPattern(
+            entity_id=entity_id,
+            canonical_name="OpenAI",
+            entity_type="organization",
+            pg_pattern=re.escape("OpenAI"),
+            alias_names=["OpenAI"],
+        )
+
+        session = AsyncMock()
+        svc = _build_service(_make_session_factory(session))
+
+        mention = EntityMentionCreate(
+            entity_id=entity_id,
+            segment_id=1,
+            video_id="dQw4w9WgXcQ",
+            language_code="en",
+            mention_text="OpenAI",
+            detection_method=DetectionMethod.RULE_MATCH,
+            confidence=1.0,
+        )
+        svc._mention_repo.delete_by_scope = AsyncMock(return_value=0)
+        svc._mention_repo.bulk_create_with_conflict_skip = AsyncMock(return_value=1)
+        svc._mention_repo.update_entity_counters = AsyncMock()
+        svc._mention_repo.update_alias_counters = AsyncMock()
+        with (
+            patch.object(svc, "_load_entity_patterns", return_value=[fake_pattern]),
+            patch.object(
+                svc, "_fetch_segment_batch", side_effect=[[_make_segment_row()], []]
+            ),
+            patch.object(svc, "_scan_batch", return_value=([mention], 0, [], 0, 0)),
+        ):
+            await svc.scan(dry_run=False, full_rescan=True)
+        create_call = svc._mention_repo.bulk_create_with_conflict_skip.call_args
+        assert create_call.kwargs == {"adjust_counters": False}
         svc._mention_repo.update_entity_counters.assert_called_once()
-        call_args = svc._mention_repo.update_entity_counters.call_args
-        assert entity_id in call_args[0][1]
+        assert entity_id in svc._mention_repo.update_entity_counters.call_args[0][1]
         svc._mention_repo.update_alias_counters.assert_called_once()
-        alias_call_args = svc._mention_repo.update_alias_counters.call_args
-        assert entity_id in alias_call_args[0][1]
+        assert entity_id in svc._mention_repo.update_alias_counters.call_args[0][1]
 
     async def test_update_entity_counters_not_called_in_dry_run(self) -> None:
         """In dry-run mode, update_entity_counters must NOT be called."""
@@ -1207,6 +1252,7 @@ class TestCounterUpdate:
             ),
         ]
 
+        svc._mention_repo.delete_by_scope = AsyncMock(return_value=0)
         svc._mention_repo.bulk_create_with_conflict_skip = AsyncMock(return_value=2)
         svc._mention_repo.update_entity_counters = AsyncMock()
         svc._mention_repo.update_alias_counters = AsyncMock()
@@ -1217,7 +1263,8 @@ class TestCounterUpdate:
             ),
             patch.object(svc, "_scan_batch", return_value=(mentions, 0, [], 0, 0)),
         ):
-            await svc.scan(dry_run=False)
+            # The recompute runs on full rescans; incremental scans use deltas.
+            await svc.scan(dry_run=False, full_rescan=True)
 
         svc._mention_repo.update_entity_counters.assert_called_once()
         passed_entity_ids = svc._mention_repo.update_entity_counters.call_args[0][1]
@@ -3426,3 +3473,209 @@ class TestCaseSensitivityReachesTheCompiledPattern:
         assert rx.search("I sidetone agree") is None
         # The sibling alias keeps its own rule rather than inheriting.
         assert rx.search("k reed performed") is not None
+
+
+# ---------------------------------------------------------------------------
+# TestScanChangedSegments
+# ---------------------------------------------------------------------------
+
+
+def _make_change_row(change_id: int, segment_id: int, deleted: bool = False) -> Any:
+    """Create a mock transcript_segment_changes row."""
+    row = MagicMock()
+    row.id = change_id
+    row.segment_id = segment_id
+    row.deleted = deleted
+    return row
+
+
+class TestScanChangedSegments:
+    """The change-log scan drains the log and replaces changed segments' mentions."""
+
+    @staticmethod
+    def _pattern(entity_id: uuid.UUID) -> Any:
+        from chronovista.services.entity_mention_scan_service import _EntityPattern
+
+        return _EntityPattern(
+            entity_id=entity_id,
+            canonical_name="OpenAI",
+            entity_type="organization",
+            pg_pattern=re.escape("OpenAI"),
+            alias_names=["OpenAI"],
+        )
+
+    @staticmethod
+    def _mention(entity_id: uuid.UUID) -> Any:
+        from chronovista.models.entity_mention import EntityMentionCreate
+        from chronovista.models.enums import DetectionMethod
+
+        return EntityMentionCreate(
+            entity_id=entity_id,
+            segment_id=2,
+            video_id="dQw4w9WgXcQ",
+            language_code="en",
+            mention_text="OpenAI",
+            detection_method=DetectionMethod.RULE_MATCH,
+            confidence=1.0,
+        )
+
+    def _service(self, session: AsyncMock) -> Any:
+        svc = _build_service(_make_session_factory(session))
+        svc._mention_repo.delete_rule_matches_for_segments = AsyncMock(return_value=1)
+        svc._mention_repo.bulk_create_with_conflict_skip = AsyncMock(return_value=1)
+        svc._mention_repo.update_entity_counters = AsyncMock()
+        svc._mention_repo.update_alias_counters = AsyncMock()
+        return svc
+
+    async def test_live_scan_replaces_mentions_and_drains_log(self) -> None:
+        entity_id = _make_uuid()
+        session = AsyncMock()
+        session.execute = AsyncMock(
+            side_effect=[
+                _raw_execute([_make_change_row(1, 2), _make_change_row(2, 3)]),
+                MagicMock(),  # DELETE of consumed change rows
+                _raw_execute([]),
+            ]
+        )
+        svc = self._service(session)
+        fetch = AsyncMock(return_value=[_make_segment_row(seg_id=2)])
+
+        with (
+            patch.object(
+                svc, "_load_entity_patterns", return_value=[self._pattern(entity_id)]
+            ),
+            patch.object(svc, "_fetch_segment_batch", fetch),
+            patch.object(
+                svc,
+                "_scan_batch",
+                return_value=([self._mention(entity_id)], 0, [], 0, 0),
+            ),
+        ):
+            result = await svc.scan_changed_segments(dry_run=False)
+
+        svc._mention_repo.delete_rule_matches_for_segments.assert_awaited_once_with(
+            session, [2, 3]
+        )
+        assert fetch.call_args.kwargs["segment_ids"] == [2, 3]
+        drain_sql = str(session.execute.call_args_list[1].args[0])
+        assert "DELETE FROM transcript_segment_changes" in drain_sql
+        assert result.segments_scanned == 1
+        assert result.mentions_found == 1
+        assert result.mentions_removed == 1
+        # Both writes adjust the counters themselves; nothing is recomputed.
+        create_call = svc._mention_repo.bulk_create_with_conflict_skip.call_args
+        assert create_call.kwargs == {"adjust_counters": True}
+        svc._mention_repo.update_entity_counters.assert_not_called()
+
+    async def test_deleted_segments_refresh_every_entity(self) -> None:
+        entity_ids = [_make_uuid(), _make_uuid()]
+        session = AsyncMock()
+        session.execute = AsyncMock(
+            side_effect=[
+                _raw_execute([_make_change_row(5, 9, deleted=True)]),
+                MagicMock(),
+                _raw_execute([]),
+            ]
+        )
+        svc = self._service(session)
+        svc._mention_repo.delete_rule_matches_for_segments = AsyncMock(return_value=0)
+        fetch = AsyncMock()
+
+        with (
+            patch.object(
+                svc,
+                "_load_entity_patterns",
+                return_value=[self._pattern(e) for e in entity_ids],
+            ),
+            patch.object(svc, "_fetch_segment_batch", fetch),
+            patch.object(svc, "_scan_batch", return_value=([], 0, [], 0, 0)),
+        ):
+            await svc.scan_changed_segments(dry_run=False)
+
+        fetch.assert_not_called()
+        counted = svc._mention_repo.update_entity_counters.call_args.args[1]
+        assert set(counted) == set(entity_ids)
+
+    async def test_dry_run_writes_nothing(self) -> None:
+        entity_id = _make_uuid()
+        session = AsyncMock()
+        session.execute = AsyncMock(
+            side_effect=[_raw_execute([_make_change_row(1, 2)]), _raw_execute([])]
+        )
+        svc = self._service(session)
+
+        with (
+            patch.object(
+                svc, "_load_entity_patterns", return_value=[self._pattern(entity_id)]
+            ),
+            patch.object(
+                svc,
+                "_fetch_segment_batch",
+                AsyncMock(return_value=[_make_segment_row(seg_id=2)]),
+            ),
+            patch.object(
+                svc,
+                "_scan_batch",
+                return_value=([self._mention(entity_id)], 0, [], 0, 0),
+            ),
+        ):
+            result = await svc.scan_changed_segments(dry_run=True)
+
+        assert result.mentions_found == 1
+        svc._mention_repo.delete_rule_matches_for_segments.assert_not_called()
+        svc._mention_repo.bulk_create_with_conflict_skip.assert_not_called()
+        svc._mention_repo.update_entity_counters.assert_not_called()
+        session.commit.assert_not_called()
+        assert session.execute.await_count == 2
+
+    async def test_failed_batch_is_rolled_back_and_kept(self) -> None:
+        session = AsyncMock()
+        session.execute = AsyncMock(
+            side_effect=[_raw_execute([_make_change_row(1, 2)]), _raw_execute([])]
+        )
+        svc = self._service(session)
+        svc._mention_repo.delete_rule_matches_for_segments = AsyncMock(
+            side_effect=RuntimeError("boom")
+        )
+
+        with patch.object(
+            svc, "_load_entity_patterns", return_value=[self._pattern(_make_uuid())]
+        ):
+            result = await svc.scan_changed_segments(dry_run=False)
+
+        assert result.failed_batches == 1
+        session.rollback.assert_awaited()
+        # The cursor moved past the failed rows without draining them.
+        second_read = str(session.execute.call_args_list[1].args[0])
+        assert "DELETE" not in second_read
+        svc._mention_repo.update_entity_counters.assert_not_called()
+
+    async def test_later_batch_drains_only_its_own_rows(self) -> None:
+        session = AsyncMock()
+        session.execute = AsyncMock(
+            side_effect=[
+                _raw_execute([_make_change_row(1, 2), _make_change_row(2, 3)]),
+                _raw_execute([_make_change_row(3, 4)]),
+                MagicMock(),  # DELETE of batch 2's change rows
+                _raw_execute([]),
+            ]
+        )
+        svc = self._service(session)
+        svc._mention_repo.delete_rule_matches_for_segments = AsyncMock(
+            side_effect=[RuntimeError("boom"), 0]
+        )
+
+        with (
+            patch.object(
+                svc, "_load_entity_patterns", return_value=[self._pattern(_make_uuid())]
+            ),
+            patch.object(svc, "_fetch_segment_batch", AsyncMock(return_value=[])),
+            patch.object(svc, "_scan_batch", return_value=([], 0, [], 0, 0)),
+        ):
+            result = await svc.scan_changed_segments(batch_size=2, dry_run=False)
+
+        assert result.failed_batches == 1
+        drain = session.execute.call_args_list[2].args[0]
+        assert "DELETE FROM transcript_segment_changes" in str(drain)
+        # Batch 1's rows (ids 1 and 2) stay queued for the next run.
+        assert drain.compile().params["change_ids"] == [3]
@@ -6,10 +6,14 @@ add repair/reset/mismatch-write coverage.
 
 from __future__ import annotations
 
+import gzip
+from pathlib import Path
+from typing import BinaryIO
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from chronovista.config.settings import settings
 from chronovista.models.app_identity import (
     AppIdentitySource,
     IdentityInvariants,
@@ -144,7 +148,7 @@ def _uv_repo(
     repo = MagicMock()
     repo.list_distinct_user_ids = AsyncMock(return_value=distinct)
     repo.count_identity_invariants = AsyncMock(side_effect=[before, after])
-    repo.dump_merge_pre_image = AsyncMock(return_value=[])
+    repo.copy_merge_pre_image = AsyncMock(return_value=0)
     repo.merge_user_identity = AsyncMock(
         return_value=MergeStats(merged=1, deleted=1, rekeyed=2)
     )
@@ -175,7 +179,7 @@ class TestRepair:
             user_video_repo=uv_repo,
             lang_pref_repo=_lang_repo(),
         )
-        svc._write_pre_image = MagicMock(return_value="/data/backups/pre.json")
+        svc._write_pre_image = AsyncMock(return_value="/data/backups/pre.csv.gz")
         return svc
 
     async def test_real_run_commits_and_merges(self) -> None:
@@ -191,7 +195,7 @@ class TestRepair:
         session.commit.assert_awaited_once()
         session.rollback.assert_not_awaited()
         assert report.placeholder_user_ids == ["takeout_user"]
-        assert report.pre_image_path == "/data/backups/pre.json"
+        assert report.pre_image_path == "/data/backups/pre.csv.gz"
 
     async def test_dry_run_rolls_back_writes_nothing(self) -> None:
         idrepo = _repo()
@@ -263,7 +267,7 @@ class TestRepair:
         svc = IdentityService(
             identity_repo=idrepo, user_video_repo=uv, lang_pref_repo=lang
         )
-        svc._write_pre_image = MagicMock(return_value="/data/backups/pre.json")
+        svc._write_pre_image = AsyncMock(return_value="/data/backups/pre.csv.gz")
         session = _session()
 
         with pytest.raises(LanguagePrefRekeyError):
@@ -293,7 +297,7 @@ class TestRepair:
         svc = IdentityService(
             identity_repo=idrepo, user_video_repo=uv, lang_pref_repo=_lang_repo()
         )
-        svc._write_pre_image = MagicMock(side_effect=PreImageError("no disk"))
+        svc._write_pre_image = AsyncMock(side_effect=PreImageError("no disk"))
         session = _session()
 
         with pytest.raises(PreImageError):
@@ -382,10 +386,76 @@ class TestRepair:
 
         await svc.repair(_session(), dry_run=False)
 
-        kwargs = uv.dump_merge_pre_image.await_args.kwargs
+        kwargs = svc._write_pre_image.await_args.kwargs
         assert kwargs["survivor_user_id"] == CHANNEL
         assert kwargs["placeholder_user_ids"] == ["takeout_user"]
 
+    async def test_progress_callback_reaches_the_merge(self) -> None:
+        idrepo = _repo()
+        idrepo.get_identity.return_value = _row(CHANNEL, AppIdentitySource.CHANNEL)
+        uv = _uv_repo(distinct=[CHANNEL, "takeout_user"], before=_INV, after=_INV)
+        svc = self._svc(idrepo, uv)
+        progress = MagicMock()
+
+        await svc.repair(_session(), dry_run=False, progress_callback=progress)
+
+        assert uv.merge_user_identity.await_args.kwargs["progress_callback"] is (
+            progress
+        )
+
+
+class TestWritePreImage:
+    """The pre-image is streamed into a gzip file and marked provisional."""
+
+    @staticmethod
+    def _svc(uv: MagicMock) -> IdentityService:
+        return IdentityService(
+            identity_repo=_repo(), user_video_repo=uv, lang_pref_repo=_lang_repo()
+        )
+
+    async def test_streams_rows_into_a_provisional_gzip(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(settings, "data_dir", tmp_path)
+        csv_text = b"user_id,video_id\ntakeout_user,vid_a\n"
+
+        async def copy(*_args: object, output: BinaryIO, **_kw: object) -> int:
+            output.write(csv_text)
+            return 1
+
+        uv = _uv_repo(distinct=[], before=_INV, after=_INV)
+        uv.copy_merge_pre_image = AsyncMock(side_effect=copy)
+        svc = self._svc(uv)
+
+        path = await svc._write_pre_image(
+            MagicMock(), survivor_user_id=CHANNEL, placeholder_user_ids=["takeout_user"]
+        )
+
+        assert path.endswith(".provisional.csv.gz")
+        assert gzip.decompress(Path(path).read_bytes()) == csv_text
+        kwargs = uv.copy_merge_pre_image.await_args.kwargs
+        assert kwargs["survivor_user_id"] == CHANNEL
+        assert kwargs["placeholder_user_ids"] == ["takeout_user"]
+
+        committed = svc._finalize_pre_image(path)
+        assert committed.endswith(".committed.csv.gz")
+        assert Path(committed).exists() and not Path(path).exists()
+
+    async def test_unwritable_location_raises(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        monkeypatch.setattr(settings, "data_dir", blocker)
+        uv = _uv_repo(distinct=[], before=_INV, after=_INV)
+        svc = self._svc(uv)
+
+        with pytest.raises(PreImageError):
+            await svc._write_pre_image(
+                MagicMock(), survivor_user_id=CHANNEL, placeholder_user_ids=["x"]
+            )
+        uv.copy_merge_pre_image.assert_not_awaited()
+
 
 class TestResolveStability:
     """T024: resolving twice is stable — the second call re-establishes nothing."""
@@ -415,7 +485,7 @@ class TestResetIdentity:
             user_video_repo=uv_repo,
             lang_pref_repo=_lang_repo(),
         )
-        svc._write_pre_image = MagicMock(return_value="/data/backups/pre.json")
+        svc._write_pre_image = AsyncMock(return_value="/data/backups/pre.csv.gz")
         return svc
 
     async def test_folds_local_constant_into_channel(self) -> None:
@@ -451,7 +521,7 @@ class TestResetIdentity:
         svc = IdentityService(
             identity_repo=idrepo, user_video_repo=uv, lang_pref_repo=lang
         )
-        svc._write_pre_image = MagicMock(return_value="/data/backups/pre.json")
+        svc._write_pre_image = AsyncMock(return_value="/data/backups/pre.csv.gz")
         session = _session()
 
         report = await svc.reset_identity(
@@ -474,7 +544,7 @@ class TestResetIdentity:
         svc = IdentityService(
             identity_repo=idrepo, user_video_repo=uv, lang_pref_repo=lang
         )
-        svc._write_pre_image = MagicMock(return_value="/data/backups/pre.json")
+        svc._write_pre_image = AsyncMock(return_value="/data/backups/pre.csv.gz")
         session = _session()
 
         with pytest.raises(LanguagePrefRekeyError):
@@ -0,0 +1,142 @@
+"""Unit tests for the Wikidata/DBpedia response cache and the shared HTTP client.
+
+Covers the TTL (default and per-namespace), cached negatives, purging, degradation when the
+database file cannot be opened, search-result caching in ``WikidataClient`` and the per-loop
+pooled client.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from chronovista.services import knowledge_base_cache as kb
+from chronovista.services.knowledge_base_cache import KnowledgeBaseCache
+from chronovista.services.wikidata_client import WikidataClient
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> KnowledgeBaseCache:
+    return KnowledgeBaseCache(
+        tmp_path / "kb.sqlite3",
+        ttl_seconds=3600,
+        namespace_ttls={"wbsearchentities": 60},
+    )
+
+
+class TestKnowledgeBaseCache:
+    async def test_round_trip_and_negative(self, cache: KnowledgeBaseCache) -> None:
+        cache.put("wbgetentities", {"id": "Q000001"}, {"claims": {}})
+        cache.put("dbpedia", {"qid": "Q000001"}, None)
+
+        assert cache.get("wbgetentities", {"id": "Q000001"}) == (True, {"claims": {}})
+        # A cached negative is a hit, distinct from a miss.
+        assert cache.get("dbpedia", {"qid": "Q000001"}) == (True, None)
+        assert cache.get("dbpedia", {"qid": "Q000002"}) == (False, None)
+        # Namespaces and params are part of the key.
+        assert cache.get("wbgetentities", {"id": "Q000001", "props": "x"}) == (
+            False,
+            None,
+        )
+        assert (cache.hits, cache.misses) == (2, 2)
+
+    async def test_get_many(self, cache: KnowledgeBaseCache) -> None:
+        cache.put_many(
+            "wbgetentities",
+            [({"id": f"Q{i}"}, {"n": i}) for i in range(3)],
+        )
+        found = cache.get_many(
+            "wbgetentities", {f"Q{i}": {"id": f"Q{i}"} for i in range(5)}
+        )
+        assert found == {"Q0": {"n": 0}, "Q1": {"n": 1}, "Q2": {"n": 2}}
+
+    async def test_entries_expire_per_namespace(
+        self, cache: KnowledgeBaseCache
+    ) -> None:
+        with patch.object(kb.time, "time", return_value=1_000_000.0):
+            cache.put("wbsearchentities", {"search": "x"}, {"search": []})
+            cache.put("wbgetentities", {"id": "Q1"}, {})
+
+        with patch.object(kb.time, "time", return_value=1_000_000.0 + 120):
+            assert cache.get("wbsearchentities", {"search": "x"})[0] is False
+            assert cache.get("wbgetentities", {"id": "Q1"})[0] is True
+            assert cache.purge_expired() == 1
+
+        assert cache.clear() == 1
+
+    async def test_unusable_path_degrades_to_no_cache(self, tmp_path: Path) -> None:
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        cache = KnowledgeBaseCache(blocker / "kb.sqlite3", ttl_seconds=3600)
+
+        cache.put("dbpedia", {"qid": "Q1"}, None)
+        assert cache.get("dbpedia", {"qid": "Q1"}) == (False, None)
+        assert cache.purge_expired() == 0
+
+    async def test_default_cache_disabled_by_zero_ttl(self) -> None:
+        with (
+            patch(
+                "chronovista.config.settings.settings.knowledge_base_cache_ttl_hours",
+                0,
+            ),
+            patch.object(kb, "_default_cache", None),
+        ):
+            assert kb.default_cache() is None
+            assert WikidataClient()._cache is None
+
+
+class TestSearchCaching:
+    async def test_repeat_search_is_served_from_cache(
+        self, cache: KnowledgeBaseCache
+    ) -> None:
+        calls: list[str] = []
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            action = request.url.params["action"]
+            calls.append(action)
+            if action == "wbsearchentities":
+                return httpx.Response(
+                    200, json={"search": [{"id": "Q000001", "label": "Placeholder"}]}
+                )
+            return httpx.Response(200, json={"entities": {"Q000001": {"claims": {}}}})
+
+        http = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+        for _ in range(2):
+            result = await WikidataClient(http=http, cache=cache).search_candidates(
+                "Placeholder", "person"
+            )
+            assert [c.qid for c in result] == ["Q000001"]
+
+        assert calls == ["wbsearchentities", "wbgetentities"]
+
+    async def test_injected_client_without_cache_always_fetches(self) -> None:
+        calls: list[str] = []
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.params["action"])
+            return httpx.Response(200, json={"search": []})
+
+        http = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+        client = WikidataClient(http=http)
+        assert client._cache is None
+        await client.search_candidates("Placeholder", "person")
+        await client.search_candidates("Placeholder", "person")
+        assert calls == ["wbsearchentities", "wbsearchentities"]
+
+
+class TestSharedHttpClient:
+    async def test_reused_within_a_loop_and_closed_on_shutdown(self) -> None:
+        first = kb.shared_http_client()
+        assert kb.shared_http_client() is first
+        assert first.headers["User-Agent"] == kb.USER_AGENT
+
+        await kb.close_shared_http_client()
+        assert first.is_closed
+        second = kb.shared_http_client()
+        assert second is not first
+        await kb.close_shared_http_client()
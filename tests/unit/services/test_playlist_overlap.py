@@ -0,0 +1,216 @@
+"""
+Tests for the playlist overlap and similarity engine.
+
+The exact paths are checked against a brute-force pairwise set comparison;
+the MinHash/LSH path is checked for determinism, for exact agreement on
+identical playlists, and for recall on clearly similar ones.
+"""
+
+from __future__ import annotations
+
+import random
+from itertools import combinations
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from chronovista.services.playlist_overlap import (
+    MinHashLSH,
+    PlaylistOverlapIndex,
+    PlaylistSimilarityService,
+    SimilarityMethod,
+)
+
+_LIBRARY: dict[str, list[str]] = {
+    "music": ["v1", "v2", "v3", "v4"],
+    "chill": ["v2", "v3", "v4", "v5"],
+    "tech": ["v6", "v7", "v1"],
+    "talks": ["v7", "v8"],
+    "empty": [],
+}
+
+
+def _brute_force(library: dict[str, list[str]]) -> dict[str, dict[str, int]]:
+    matrix: dict[str, dict[str, int]] = {key: {} for key in library}
+    for a, b in combinations(library, 2):
+        shared = len(set(library[a]) & set(library[b]))
+        if shared:
+            matrix[a][b] = shared
+            matrix[b][a] = shared
+    return matrix
+
+
+def _random_library(seed: int) -> dict[str, list[str]]:
+    rng = random.Random(seed)
+    pool = [f"vid{i:05d}" for i in range(400)]
+    return {f"pl{i:03d}": rng.sample(pool, rng.randint(0, 40)) for i in range(60)}
+
+
+class TestExactOverlap:
+    """Inverted-index counting against pairwise comparison."""
+
+    def test_overlap_counts_match_brute_force(self) -> None:
+        index = PlaylistOverlapIndex(_LIBRARY)
+
+        assert index.overlap_counts() == _brute_force(_LIBRARY)
+
+    def test_overlap_counts_match_brute_force_on_random_library(self) -> None:
+        library = _random_library(7)
+
+        assert PlaylistOverlapIndex(library).overlap_counts() == _brute_force(library)
+
+    def test_duplicate_and_empty_video_ids_are_ignored(self) -> None:
+        index = PlaylistOverlapIndex({"a": ["v1", "v1", ""], "b": ["v1"]})
+
+        assert index.overlap_counts() == {"a": {"b": 1}, "b": {"a": 1}}
+
+    def test_from_pairs_groups_rows(self) -> None:
+        index = PlaylistOverlapIndex.from_pairs([("a", "v1"), ("b", "v1"), ("a", "v2")])
+
+        assert index.playlists == {"a": {"v1", "v2"}, "b": {"v1"}}
+        assert sorted(index.postings["v1"]) == ["a", "b"]
+
+    def test_similar_to_ranks_by_jaccard(self) -> None:
+        index = PlaylistOverlapIndex(_LIBRARY)
+
+        results = index.similar_to("music")
+
+        assert [r.playlist for r in results] == ["chill", "tech"]
+        assert results[0].shared_videos == 3
+        assert results[0].jaccard == pytest.approx(3 / 5)
+        assert results[1].jaccard == pytest.approx(1 / 6)
+
+    def test_similar_to_unknown_or_empty_playlist(self) -> None:
+        index = PlaylistOverlapIndex(_LIBRARY)
+
+        assert index.similar_to("missing") == []
+        assert index.similar_to("empty") == []
+
+    def test_top_pairs_match_brute_force_and_respect_min_shared(self) -> None:
+        library = _random_library(11)
+        expected = {
+            tuple(sorted((a, b)))
+            for a, row in _brute_force(library).items()
+            for b, count in row.items()
+            if count >= 3
+        }
+
+        pairs = PlaylistOverlapIndex(library).top_pairs(limit=10_000, min_shared=3)
+
+        assert {(p.playlist_a, p.playlist_b) for p in pairs} == expected
+        jaccards = [p.jaccard for p in pairs]
+        assert jaccards == sorted(jaccards, reverse=True)
+
+
+class TestMinHash:
+    """Approximate similarity via MinHash/LSH."""
+
+    def test_bands_must_divide_num_perm(self) -> None:
+        with pytest.raises(ValueError, match="divisor"):
+            MinHashLSH(num_perm=100, bands=32)
+
+    def test_signatures_are_deterministic(self) -> None:
+        videos = ["v1", "v2", "v3"]
+
+        assert MinHashLSH().signature(videos) == MinHashLSH().signature(videos)
+        assert MinHashLSH().signature([]) == ()
+
+    def test_identical_playlists_estimate_one(self) -> None:
+        index = PlaylistOverlapIndex({"a": ["v1", "v2", "v3"], "b": ["v3", "v2", "v1"]})
+
+        results = index.similar_to("a", method=SimilarityMethod.MINHASH)
+
+        assert [(r.playlist, r.jaccard, r.shared_videos) for r in results] == [
+            ("b", 1.0, 3)
+        ]
+
+    def test_near_duplicates_are_found_and_disjoint_are_not(self) -> None:
+        base = [f"vid{i}" for i in range(50)]
+        index = PlaylistOverlapIndex(
+            {
+                "base": base,
+                "near": base[:45] + [f"other{i}" for i in range(5)],
+                "disjoint": [f"far{i}" for i in range(50)],
+            }
+        )
+
+        results = index.similar_to("base", method=SimilarityMethod.MINHASH)
+
+        assert [r.playlist for r in results] == ["near"]
+        assert results[0].jaccard == pytest.approx(45 / 55, abs=0.15)
+
+    def test_similar_to_minhash_scores_only_candidates(self) -> None:
+        """The MinHash path intersects candidates instead of walking postings."""
+        index = PlaylistOverlapIndex({"a": ["v1", "v2", "v3"], "b": ["v2", "v3"]})
+        index.lsh()
+        index.postings = {}  # the exact path would need these
+
+        results = index.similar_to("a", method=SimilarityMethod.MINHASH)
+
+        assert [(r.playlist, r.shared_videos) for r in results] == [("b", 2)]
+
+    def test_top_pairs_minhash_reports_exact_shared_counts(self) -> None:
+        index = PlaylistOverlapIndex(_LIBRARY)
+
+        pairs = index.top_pairs(method=SimilarityMethod.MINHASH)
+
+        for pair in pairs:
+            expected = len(
+                set(_LIBRARY[pair.playlist_a]) & set(_LIBRARY[pair.playlist_b])
+            )
+            assert pair.shared_videos == expected
+            assert pair.shared_videos >= 1
+
+    def test_lsh_is_built_once(self) -> None:
+        index = PlaylistOverlapIndex(_LIBRARY)
+
+        assert index.lsh() is index.lsh()
+        assert index.lsh(num_perm=64, bands=16).num_perm == 64
+
+
+class TestPlaylistSimilarityService:
+    """Index caching over the membership repository."""
+
+    @pytest.fixture
+    def repository(self) -> MagicMock:
+        repository = MagicMock()
+        repository.get_membership_version = AsyncMock(return_value=(3, "t1", 0))
+        repository.get_membership_pairs = AsyncMock(
+            return_value=[("a", "v1"), ("b", "v1"), ("b", "v2")]
+        )
+        return repository
+
+    async def test_index_is_reused_while_version_is_unchanged(
+        self, repository: MagicMock
+    ) -> None:
+        service = PlaylistSimilarityService(repository)
+        session = AsyncMock()
+
+        first = await service.get_index(session)
+        second = await service.get_index(session)
+
+        assert first is second
+        repository.get_membership_pairs.assert_awaited_once()
+
+    async def test_index_is_rebuilt_when_version_changes(
+        self, repository: MagicMock
+    ) -> None:
+        service = PlaylistSimilarityService(repository)
+        session = AsyncMock()
+
+        first = await service.get_index(session)
+        repository.get_membership_version.return_value = (4, "t2", 0)
+        second = await service.get_index(session)
+
+        assert first is not second
+        assert repository.get_membership_pairs.await_count == 2
+
+    async def test_similar_playlists_and_top_pairs(self, repository: MagicMock) -> None:
+        service = PlaylistSimilarityService(repository)
+        session = AsyncMock()
+
+        similar = await service.similar_playlists(session, "a")
+        pairs = await service.top_pairs(session)
+
+        assert [(r.playlist, r.jaccard) for r in similar] == [("b", 0.5)]
+        assert [(p.playlist_a, p.playlist_b) for p in pairs] == [("a", "b")]
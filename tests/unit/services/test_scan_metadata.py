@@ -96,6 +96,7 @@ def _make_session_factory(
     session.execute = AsyncMock()
     session.flush = AsyncMock()
     session.commit = AsyncMock()
+    session.rollback = AsyncMock()
 
     # Build the sequence of return values for execute()
     call_results: list[MagicMock] = []
@@ -969,6 +970,46 @@ class TestScanMetadataCombined:
 # ---------------------------------------------------------------------------
 
 
+class TestScanMetadataChunking:
+    """Each batch ends its own transaction so the connection is released."""
+
+    @staticmethod
+    def _no_match_factory() -> tuple[MagicMock, MagicMock]:
+        entity_id = _make_uuid()
+        factory = _make_session_factory(
+            entities=[_make_entity_row(entity_id=entity_id, canonical_name="Zed")],
+            aliases=[],
+            video_batches=[
+                [_make_video_row(video_id="vid00000001", title="Nothing here")],
+                [_make_video_row(video_id="vid00000002", title="Nor here")],
+            ],
+        )
+        session = factory.return_value.__aenter__.return_value
+        return factory, session
+
+    async def test_live_scan_commits_per_batch(self) -> None:
+        factory, session = self._no_match_factory()
+
+        result = await EntityMentionScanService(factory).scan_metadata(
+            sources=["title"]
+        )
+
+        assert result.segments_scanned == 2
+        # Setup chunk, two batches, final counter refresh.
+        assert session.commit.await_count == 4
+        session.rollback.assert_not_awaited()
+
+    async def test_dry_run_rolls_back_per_batch(self) -> None:
+        factory, session = self._no_match_factory()
+
+        await EntityMentionScanService(factory).scan_metadata(
+            sources=["title"], dry_run=True
+        )
+
+        session.commit.assert_not_awaited()
+        assert session.rollback.await_count == 3
+
+
 class TestExtractContextSnippet:
     """Unit tests for the context snippet extraction helper."""
 
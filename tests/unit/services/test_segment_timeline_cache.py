@@ -0,0 +1,367 @@
+"""
+Tests for the per-transcript segment timeline cache.
+
+Timeline lookups must return exactly what the equivalent SQL predicates
+return, including for gaps and overlapping auto-caption segments, and the
+cache must respect its byte budget, TTL and invalidation rules.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from chronovista.models.enums import CorrectionType
+from chronovista.services.segment_timeline_cache import (
+    SegmentTimeline,
+    SegmentTimelineCache,
+    _invalidate_after_commit,
+    segment_timeline_cache,
+)
+
+Row = tuple[int, float, float, float, bool, str, str | None]
+
+
+def _rows(intervals: list[tuple[float, float]]) -> list[Row]:
+    """Segment rows in start_time order for the given intervals."""
+    ordered = sorted(enumerate(intervals), key=lambda item: (item[1][0], item[0]))
+    return [
+        (i + 1, start, end, end - start, False, f"segment {i + 1}", None)
+        for i, (start, end) in ordered
+    ]
+
+
+def _random_intervals(rng: random.Random, count: int) -> list[tuple[float, float]]:
+    """Mostly sequential intervals with gaps, overlaps and zero durations."""
+    intervals = []
+    cursor = 0.0
+    for _ in range(count):
+        start = cursor + rng.choice([0.0, 0.0, 0.5, 2.0, -1.0])
+        start = max(0.0, round(start, 1))
+        duration = rng.choice([0.0, 1.0, 2.5, 4.0, 12.0])
+        intervals.append((start, start + duration))
+        cursor = start + rng.choice([1.0, 2.5, 3.0])
+    return intervals
+
+
+def _at_time_reference(rows: list[Row], t: float) -> set[int | None]:
+    """Ids get_segment_at_time may return (SQL leaves ties unordered)."""
+    containing = [r for r in rows if r[1] <= t < r[2]]
+    if containing:
+        best_start = max(r[1] for r in containing)
+        return {r[0] for r in containing if r[1] == best_start}
+    ended = [r for r in rows if r[2] <= t]
+    if not ended:
+        return {None}
+    best_end = max(r[2] for r in ended)
+    return {r[0] for r in ended if r[2] == best_end}
+
+
+@pytest.fixture
+def rows() -> list[Row]:
+    """[0-2.5], [2.5-5.0], gap, [7-20] overlapped by [8-9], zero-length 21."""
+    return _rows([(0.0, 2.5), (2.5, 5.0), (7.0, 20.0), (8.0, 9.0), (21.0, 21.0)])
+
+
+@pytest.fixture
+def timeline(rows: list[Row]) -> SegmentTimeline:
+    return SegmentTimeline.from_rows(rows, {})
+
+
+class TestSegmentTimeline:
+    """Lookups on a packed timeline."""
+
+    def test_segment_round_trip(self) -> None:
+        """Effective text and correction metadata survive packing."""
+        corrected_at = datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=UTC)
+        timeline = SegmentTimeline.from_rows(
+            [
+                (10, 0.0, 1.0, 1.0, True, "teh", "the"),
+                (11, 1.0, 2.0, 1.0, False, "café ☕", None),
+            ],
+            {10: (corrected_at, 2)},
+        )
+
+        first, second = timeline.segment(0), timeline.segment(1)
+        assert (first.id, first.text, first.has_correction) == (10, "the", True)
+        assert first.corrected_at == corrected_at
+        assert first.correction_count == 2
+        assert (second.text, second.corrected_at, second.correction_count) == (
+            "café ☕",
+            None,
+            0,
+        )
+
+    @pytest.mark.parametrize(
+        ("timestamp", "expected_start"),
+        [
+            (-1.0, None),
+            (0.0, 0.0),
+            (2.5, 2.5),  # half-open: the boundary belongs to the next segment
+            (6.0, 2.5),  # gap: previous segment
+            (8.5, 8.0),  # overlap: latest-starting containing segment
+            (9.0, 7.0),  # past the short segment, still inside the long one
+            (20.5, 7.0),
+            (30.0, 21.0),
+        ],
+    )
+    def test_index_at(
+        self, timeline: SegmentTimeline, timestamp: float, expected_start: float | None
+    ) -> None:
+        index = timeline.index_at(timestamp)
+        actual = None if index is None else timeline.segment(index).start_time
+        assert actual == expected_start
+
+    def test_index_at_matches_reference(self) -> None:
+        rng = random.Random(28)
+        for _ in range(25):
+            rows = _rows(_random_intervals(rng, 40))
+            timeline = SegmentTimeline.from_rows(rows, {})
+            for step in range(-4, 300):
+                t = step * 0.5
+                index = timeline.index_at(t)
+                actual = None if index is None else timeline.segment(index).id
+                assert actual in _at_time_reference(rows, t), f"t={t}"
+
+    def test_overlapping_matches_reference(self) -> None:
+        rng = random.Random(29)
+        for _ in range(25):
+            rows = _rows(_random_intervals(rng, 40))
+            timeline = SegmentTimeline.from_rows(rows, {})
+            for _ in range(40):
+                start = rng.uniform(-2, 130)
+                end = start + rng.uniform(0, 20)
+                expected = [r[0] for r in rows if r[1] < end and r[2] > start]
+                actual = [
+                    timeline.segment(i).id for i in timeline.overlapping(start, end)
+                ]
+                assert actual == expected
+
+    def test_contained_matches_reference(self) -> None:
+        rng = random.Random(30)
+        rows = _rows(_random_intervals(rng, 60))
+        timeline = SegmentTimeline.from_rows(rows, {})
+        for start, end in [(None, None), (10.0, None), (None, 50.0), (10.0, 50.0)]:
+            expected = [
+                r[0]
+                for r in rows
+                if (start is None or r[1] >= start) and (end is None or r[2] <= end)
+            ]
+            actual = [timeline.segment(i).id for i in timeline.contained(start, end)]
+            assert actual == expected
+
+    def test_version_tracks_content_not_load_time(self, rows: list[Row]) -> None:
+        """Reloading unchanged rows keeps the version; a correction changes it."""
+        first = SegmentTimeline.from_rows(rows, {})
+        reloaded = SegmentTimeline.from_rows(rows, {})
+        corrected = SegmentTimeline.from_rows(
+            [rows[0][:4] + (True, rows[0][5], "fixed"), *rows[1:]],
+            {rows[0][0]: (datetime(2026, 3, 1, tzinfo=UTC), 1)},
+        )
+
+        assert reloaded.version == first.version
+        assert corrected.version != first.version
+
+    def test_empty_timeline(self) -> None:
+        timeline = SegmentTimeline.from_rows([], {})
+        assert len(timeline) == 0
+        assert timeline.index_at(1.0) is None
+        assert timeline.overlapping(0.0, 10.0) == []
+        assert timeline.contained(None, None) == []
+
+
+class TestSegmentTimelineCache:
+    """LRU, TTL and invalidation behaviour."""
+
+    @pytest.fixture
+    def load(self, timeline: SegmentTimeline) -> Any:
+        with patch(
+            "chronovista.services.segment_timeline_cache.load_timeline",
+            new=AsyncMock(return_value=timeline),
+        ) as mock_load:
+            yield mock_load
+
+    async def test_hit_after_miss(self, load: AsyncMock) -> None:
+        cache = SegmentTimelineCache(max_bytes=1_000_000, ttl_seconds=60)
+        session = AsyncMock()
+
+        await cache.get_timeline(session, "dQw4w9WgXcQ", "EN-us")
+        await cache.get_timeline(session, "dQw4w9WgXcQ", "en-US")
+
+        load.assert_awaited_once_with(session, "dQw4w9WgXcQ", "en-US")
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert 0 < stats.bytes_used <= stats.max_bytes
+
+    async def test_evicts_least_recently_used_to_fit(
+        self, load: AsyncMock, timeline: SegmentTimeline
+    ) -> None:
+        cache = SegmentTimelineCache(max_bytes=timeline.nbytes * 2 + 1, ttl_seconds=60)
+        session = AsyncMock()
+
+        await cache.get_timeline(session, "aaaaaaaaaaa", "en")
+        await cache.get_timeline(session, "bbbbbbbbbbb", "en")
+        await cache.get_timeline(session, "aaaaaaaaaaa", "en")  # refresh a
+        await cache.get_timeline(session, "ccccccccccc", "en")  # evicts b
+
+        assert cache.stats().evictions == 1
+        await cache.get_timeline(session, "aaaaaaaaaaa", "en")
+        assert load.await_count == 3
+        await cache.get_timeline(session, "bbbbbbbbbbb", "en")
+        assert load.await_count == 4
+
+    async def test_zero_budget_disables(self, load: AsyncMock) -> None:
+        cache = SegmentTimelineCache(max_bytes=0, ttl_seconds=60)
+        session = AsyncMock()
+
+        await cache.get_timeline(session, "dQw4w9WgXcQ", "en")
+        await cache.get_timeline(session, "dQw4w9WgXcQ", "en")
+
+        assert load.await_count == 2
+        assert cache.stats().entries == 0
+
+    async def test_empty_timeline_not_cached(self) -> None:
+        cache = SegmentTimelineCache(max_bytes=1_000_000, ttl_seconds=60)
+        with patch(
+            "chronovista.services.segment_timeline_cache.load_timeline",
+            new=AsyncMock(return_value=SegmentTimeline.from_rows([], {})),
+        ):
+            await cache.get_timeline(AsyncMock(), "dQw4w9WgXcQ", "en")
+        assert cache.stats().entries == 0
+
+    async def test_ttl_expiry_reloads(self, load: AsyncMock) -> None:
+        cache = SegmentTimelineCache(max_bytes=1_000_000, ttl_seconds=0)
+        session = AsyncMock()
+
+        await cache.get_timeline(session, "dQw4w9WgXcQ", "en")
+        await cache.get_timeline(session, "dQw4w9WgXcQ", "en")
+
+        assert load.await_count == 2
+
+    async def test_invalidate(self, load: AsyncMock) -> None:
+        cache = SegmentTimelineCache(max_bytes=1_000_000, ttl_seconds=60)
+        session = AsyncMock()
+
+        await cache.get_timeline(session, "dQw4w9WgXcQ", "en")
+        cache.invalidate("dQw4w9WgXcQ", "EN")
+        await cache.get_timeline(session, "dQw4w9WgXcQ", "en")
+
+        assert load.await_count == 2
+        assert cache.stats().invalidations == 1
+
+    async def test_load_racing_invalidation_is_not_stored(
+        self, timeline: SegmentTimeline
+    ) -> None:
+        """A load that started before an invalidation must not be cached."""
+        cache = SegmentTimelineCache(max_bytes=1_000_000, ttl_seconds=60)
+
+        async def load_then_invalidate(*_: Any) -> SegmentTimeline:
+            cache.invalidate("dQw4w9WgXcQ", "en")
+            return timeline
+
+        with patch(
+            "chronovista.services.segment_timeline_cache.load_timeline",
+            new=load_then_invalidate,
+        ):
+            result = await cache.get_timeline(AsyncMock(), "dQw4w9WgXcQ", "en")
+
+        assert result is timeline
+        assert cache.stats().entries == 0
+
+    async def test_generations_only_track_keys_being_loaded(
+        self, load: AsyncMock
+    ) -> None:
+        """Invalidating many transcripts leaves no per-key bookkeeping."""
+        cache = SegmentTimelineCache(max_bytes=1_000_000, ttl_seconds=60)
+
+        for i in range(100):
+            video_id = f"video{i:06d}"
+            await cache.get_timeline(AsyncMock(), video_id, "en")
+            cache.invalidate(video_id, "en")
+
+        assert cache.stats().invalidations == 100
+        assert cache._generations == {}
+        assert cache._loading == {}
+
+    async def test_repository_shaped_reads(self, load: AsyncMock) -> None:
+        """At-time, range and context reads share one cached timeline."""
+        cache = SegmentTimelineCache(max_bytes=1_000_000, ttl_seconds=60)
+        session = AsyncMock()
+
+        at_gap = await cache.get_segment_at_time(session, "dQw4w9WgXcQ", "en", 6.0)
+        at_overlap = await cache.get_segment_at_time(session, "dQw4w9WgXcQ", "en", 9.5)
+        before = await cache.get_segment_at_time(session, "dQw4w9WgXcQ", "en", -1.0)
+        in_range = await cache.get_segments_in_range(
+            session, "dQw4w9WgXcQ", "en", 4.0, 8.5
+        )
+        context = await cache.get_context_window(session, "dQw4w9WgXcQ", "en", 1.0, 2.0)
+
+        load.assert_awaited_once()
+        assert at_gap is not None and at_gap.display_text == "segment 2"
+        assert at_overlap is not None and at_overlap.id == 3
+        assert before is None
+        assert [s.id for s in in_range] == [2, 3, 4]
+        assert [s.id for s in context] == [1, 2]
+
+    async def test_invalidate_on_commit(self, load: AsyncMock) -> None:
+        """Entries are dropped immediately and again after commit."""
+        session = AsyncMock()
+        sync_session = Session()
+        session.info = sync_session.info
+        segment_timeline_cache.clear()
+
+        await segment_timeline_cache.get_timeline(session, "dQw4w9WgXcQ", "en")
+        segment_timeline_cache.invalidate_on_commit(session, "dQw4w9WgXcQ", "en")
+        assert segment_timeline_cache.stats().entries == 0
+
+        # Re-populated by a concurrent reader before the writer commits...
+        await segment_timeline_cache.get_timeline(session, "dQw4w9WgXcQ", "en")
+        assert segment_timeline_cache.stats().entries == 1
+
+        # ...and dropped again once the transaction commits.
+        _invalidate_after_commit(sync_session)
+        assert segment_timeline_cache.stats().entries == 0
+        assert "segment_timeline_invalidations" not in sync_session.info
+
+
+class TestCorrectionServiceInvalidation:
+    """The correction service invalidates the corrected transcript."""
+
+    async def test_apply_correction_invalidates(self) -> None:
+        from chronovista.services.transcript_correction_service import (
+            TranscriptCorrectionService,
+        )
+
+        segment = MagicMock(has_correction=False, corrected_text=None, text="teh", id=1)
+        segment_repo = MagicMock()
+        segment_repo.get = AsyncMock(return_value=segment)
+        correction_repo = MagicMock()
+        correction_repo.get_latest_version = AsyncMock(return_value=0)
+        correction_repo.create = AsyncMock(return_value=MagicMock())
+        transcript_repo = MagicMock()
+        transcript_repo.get = AsyncMock(return_value=None)
+        service = TranscriptCorrectionService(
+            correction_repo, segment_repo, transcript_repo
+        )
+        service._record_asr_alias_if_entity_match = AsyncMock()  # type: ignore[method-assign]
+
+        with patch(
+            "chronovista.services.transcript_correction_service."
+            "segment_timeline_cache"
+        ) as cache:
+            session = AsyncMock()
+            await service.apply_correction(
+                session,
+                video_id="dQw4w9WgXcQ",
+                language_code="en",
+                segment_id=1,
+                corrected_text="the",
+                correction_type=CorrectionType.SPELLING,
+            )
+
+        cache.invalidate_on_commit.assert_called_once_with(session, "dQw4w9WgXcQ", "en")
@@ -112,7 +112,10 @@ def service(
 @pytest.fixture
 def mock_session() -> AsyncMock:
     """Provide a mock AsyncSession."""
-    return AsyncMock()
+    session = AsyncMock()
+    # A real dict: the association refresh queue lives in session.info.
+    session.info = {}
+    return session
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,175 @@
+"""
+Tests for the memoized, parallel tag normalization engine.
+
+The engine must return exactly what ``TagNormalizationService.normalize``
+returns, whether a tag comes from the memo, the in-process path, or the
+process pool.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from chronovista.services.tag_normalization import (
+    NORMALIZATION_VERSION,
+    TagNormalizationService,
+)
+from chronovista.services.tag_normalization_engine import (
+    NormalizationStats,
+    TagNormalizationEngine,
+    default_memo_path,
+)
+
+SAMPLE_TAGS = ["#PERÚ", "Python", "python", "  ", "München", "café", "#", "año"]
+
+
+@pytest.fixture
+def normalization_service() -> TagNormalizationService:
+    """Use the REAL normalization service (it's pure, no I/O)."""
+    return TagNormalizationService()
+
+
+class TestNormalizeMany:
+    """Tests for ``normalize_many``."""
+
+    def test_matches_pipeline(
+        self, normalization_service: TagNormalizationService
+    ) -> None:
+        """Engine output equals per-tag ``normalize`` output."""
+        engine = TagNormalizationEngine(normalization_service)
+        result = engine.normalize_many(SAMPLE_TAGS)
+
+        assert result == {t: normalization_service.normalize(t) for t in SAMPLE_TAGS}
+
+    def test_second_pass_served_from_memo(self) -> None:
+        """Tags already seen are not re-run through the pipeline."""
+        service = MagicMock(spec=TagNormalizationService)
+        service.normalize.side_effect = lambda t: t.casefold()
+        engine = TagNormalizationEngine(service)
+
+        engine.normalize_many(["A", "B"])
+        engine.normalize_many(["A", "B", "C"])
+
+        assert service.normalize.call_count == 3
+        assert engine.last_stats.memo_hits == 2
+        assert engine.last_stats.computed == 1
+        assert engine.last_stats.total == 3
+
+    def test_duplicates_resolved_once(self) -> None:
+        """Repeated raw tags in one call are normalized once."""
+        service = MagicMock(spec=TagNormalizationService)
+        service.normalize.side_effect = lambda t: t.casefold()
+        engine = TagNormalizationEngine(service)
+
+        result = engine.normalize_many(["A", "A", "A"])
+
+        assert result == {"A": "a"}
+        service.normalize.assert_called_once_with("A")
+
+    def test_parallel_path_matches_pipeline(
+        self, normalization_service: TagNormalizationService
+    ) -> None:
+        """Cold batches above the threshold go through the process pool."""
+        tags = [f"#Tag {i} Ñandú" for i in range(40)] + SAMPLE_TAGS
+        engine = TagNormalizationEngine(
+            normalization_service,
+            max_workers=2,
+            parallel_threshold=10,
+            chunk_size=16,
+        )
+
+        result = engine.normalize_many(tags)
+
+        assert engine.last_stats.workers == 2
+        assert result == {t: normalization_service.normalize(t) for t in tags}
+
+    def test_rejects_invalid_chunk_size(
+        self, normalization_service: TagNormalizationService
+    ) -> None:
+        """A chunk size below 1 is a programming error."""
+        with pytest.raises(ValueError):
+            TagNormalizationEngine(normalization_service, chunk_size=0)
+
+
+class TestMemoPersistence:
+    """Tests for ``load`` / ``save``."""
+
+    def test_round_trip(
+        self, normalization_service: TagNormalizationService, tmp_path: Path
+    ) -> None:
+        """A saved memo is reused by a fresh engine."""
+        memo_path = tmp_path / "memo.json"
+        first = TagNormalizationEngine(normalization_service, memo_path=memo_path)
+        first.normalize_many(SAMPLE_TAGS)
+        first.save()
+
+        second = TagNormalizationEngine(normalization_service, memo_path=memo_path)
+        second.normalize_many(SAMPLE_TAGS)
+
+        assert second.last_stats.memo_hits == len(SAMPLE_TAGS)
+        assert second.last_stats.computed == 0
+
+    def test_stale_version_ignored(
+        self, normalization_service: TagNormalizationService, tmp_path: Path
+    ) -> None:
+        """A memo written by another pipeline version is not trusted."""
+        memo_path = tmp_path / "memo.json"
+        memo_path.write_text(
+            json.dumps(
+                {
+                    "normalization_version": NORMALIZATION_VERSION + 1,
+                    "entries": {"Python": "WRONG"},
+                }
+            )
+        )
+        engine = TagNormalizationEngine(normalization_service, memo_path=memo_path)
+
+        assert engine.normalize_many(["Python"]) == {"Python": "python"}
+        assert engine.last_stats.memo_hits == 0
+
+    def test_corrupt_memo_deleted(
+        self, normalization_service: TagNormalizationService, tmp_path: Path
+    ) -> None:
+        """An unreadable memo file is removed and rebuilt."""
+        memo_path = tmp_path / "memo.json"
+        memo_path.write_text("{not json")
+        engine = TagNormalizationEngine(normalization_service, memo_path=memo_path)
+
+        engine.normalize_many(["Python"])
+
+        assert not memo_path.exists()
+        engine.save()
+        assert memo_path.exists()
+
+    def test_save_without_path_is_noop(
+        self, normalization_service: TagNormalizationService
+    ) -> None:
+        """In-memory engines never touch the filesystem."""
+        engine = TagNormalizationEngine(normalization_service)
+        engine.normalize_many(SAMPLE_TAGS)
+        engine.save()  # must not raise
+
+    def test_default_memo_path_is_versioned(self, tmp_path: Path) -> None:
+        """The default memo file name carries the pipeline version."""
+        path = default_memo_path(tmp_path)
+        assert path.parent == tmp_path / "tag_normalization"
+        assert path.name == f"memo_v{NORMALIZATION_VERSION}.json"
+
+
+class TestNormalizationStats:
+    """Tests for derived statistics."""
+
+    def test_tags_per_second(self) -> None:
+        stats = NormalizationStats(total=1000, elapsed_seconds=0.5)
+        assert stats.tags_per_second == pytest.approx(2000.0)
+
+    def test_hit_rate_empty(self) -> None:
+        assert NormalizationStats().hit_rate == 0.0
+
+    def test_hit_rate(self) -> None:
+        stats = NormalizationStats(total=4, memo_hits=3, computed=1)
+        assert stats.hit_rate == pytest.approx(0.75)
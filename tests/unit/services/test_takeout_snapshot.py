@@ -0,0 +1,242 @@
+"""
+Tests for the parsed-Takeout snapshot cache.
+
+Covers the snapshot store (round-trip fidelity, fingerprinting, stale and
+corrupt files) and its use by ``TakeoutService``: a full parse writes a
+snapshot, an unchanged export is served from it, and any file change forces
+a re-parse.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from chronovista.models.takeout import HistoricalTakeout, TakeoutData
+from chronovista.services.takeout_service import TakeoutService
+from chronovista.services.takeout_snapshot import (
+    TakeoutSnapshotStats,
+    TakeoutSnapshotStore,
+    default_snapshot_dir,
+)
+
+_WATCH_HISTORY = [
+    {
+        "header": "YouTube",
+        "title": "Watched Test Video 1",
+        "titleUrl": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "subtitles": [
+            {"name": "Test Channel 1", "url": "https://www.youtube.com/channel/UC1"}
+        ],
+        "time": "2023-01-15T14:30:00Z",
+    },
+    {
+        "header": "YouTube",
+        "title": "Watched Test Video 2",
+        "titleUrl": "https://www.youtube.com/watch?v=test2video",
+        "time": "2023-01-16T15:45:00.123Z",
+    },
+]
+
+
+@pytest.fixture
+def export_dir(tmp_path: Path) -> Path:
+    """A small Takeout export with history, one playlist and subscriptions."""
+    root = tmp_path / "takeout"
+    youtube = root / "YouTube and YouTube Music"
+    (youtube / "history").mkdir(parents=True)
+    (youtube / "playlists").mkdir()
+    (youtube / "subscriptions").mkdir()
+    (youtube / "history" / "watch-history.json").write_text(
+        json.dumps(_WATCH_HISTORY), encoding="utf-8"
+    )
+    (youtube / "playlists" / "Music-videos.csv").write_text(
+        "Video ID,Playlist Video Creation Timestamp\n"
+        "dQw4w9WgXcQ,2023-01-15T14:30:00+00:00\n"
+        "test2video,\n",
+        encoding="utf-8",
+    )
+    (youtube / "playlists" / "Empty.csv").write_text(
+        "Video ID,Playlist Video Creation Timestamp\n", encoding="utf-8"
+    )
+    (youtube / "subscriptions" / "subscriptions.csv").write_text(
+        "Channel Id,Channel Url,Channel Title\n"
+        "UC1,https://www.youtube.com/channel/UC1,Test Channel 1\n",
+        encoding="utf-8",
+    )
+    return root
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> TakeoutSnapshotStore:
+    return TakeoutSnapshotStore(default_snapshot_dir(tmp_path / "cache"))
+
+
+def _touch_later(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestSnapshotStore:
+    """Store-level behaviour."""
+
+    async def test_round_trip_preserves_parsed_data(
+        self, export_dir: Path, store: TakeoutSnapshotStore
+    ) -> None:
+        parsed = await TakeoutService(export_dir).parse_all()
+        source = export_dir / "YouTube and YouTube Music"
+        fingerprint = store.fingerprint(source)
+
+        assert store.save(source, fingerprint, parsed, parse_seconds=1.5)
+        loaded = store.load(source, fingerprint)
+
+        assert loaded is not None
+        data, parse_seconds = loaded
+        assert parse_seconds == 1.5
+        assert data.model_dump() == parsed.model_dump()
+        assert isinstance(data.playlists[0].videos, list)
+
+    def test_missing_snapshot_loads_none(
+        self, export_dir: Path, store: TakeoutSnapshotStore
+    ) -> None:
+        assert store.load(export_dir, "0" * 64) is None
+
+    def test_fingerprint_tracks_size_mtime_and_new_files(
+        self, export_dir: Path, store: TakeoutSnapshotStore
+    ) -> None:
+        source = export_dir / "YouTube and YouTube Music"
+        history = source / "history" / "watch-history.json"
+        original = store.fingerprint(source)
+
+        assert store.fingerprint(source) == original
+
+        _touch_later(history)
+        touched = store.fingerprint(source)
+        assert touched != original
+
+        (source / "playlists" / "New.csv").write_text("Video ID\n", encoding="utf-8")
+        assert store.fingerprint(source) != touched
+
+    async def test_stale_fingerprint_is_not_loaded(
+        self, export_dir: Path, store: TakeoutSnapshotStore
+    ) -> None:
+        source = export_dir / "YouTube and YouTube Music"
+        store.save(
+            source, "stale", TakeoutData(takeout_path=export_dir), parse_seconds=0.1
+        )
+
+        assert store.load(source, "current") is None
+        assert store.path_for(source).exists()
+
+    def test_corrupt_snapshot_is_deleted(
+        self, export_dir: Path, store: TakeoutSnapshotStore
+    ) -> None:
+        path = store.path_for(export_dir)
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"not a snapshot at all")
+
+        assert store.load(export_dir, "anything") is None
+        assert not path.exists()
+
+    def test_kinds_are_stored_separately(
+        self, export_dir: Path, store: TakeoutSnapshotStore
+    ) -> None:
+        assert store.path_for(export_dir) != store.path_for(export_dir, "watch_history")
+
+
+class TestTakeoutServiceSnapshots:
+    """``TakeoutService`` with a snapshot store attached."""
+
+    async def test_first_parse_writes_snapshot_second_loads_it(
+        self, export_dir: Path, store: TakeoutSnapshotStore
+    ) -> None:
+        first = TakeoutService(export_dir, snapshot_store=store)
+        parsed = await first.parse_all()
+        assert first.snapshot_stats.misses == 1
+        assert first.snapshot_stats.rebuilt == 1
+
+        second = TakeoutService(export_dir, snapshot_store=store)
+        loaded = await second.parse_all()
+
+        assert second.snapshot_stats.hits == 1
+        assert second.snapshot_stats.rebuilt == 0
+        assert second.snapshot_stats.parse_seconds_saved > 0
+        assert loaded.model_dump() == parsed.model_dump()
+
+    async def test_individual_parsers_are_served_from_snapshot(
+        self, export_dir: Path, store: TakeoutSnapshotStore
+    ) -> None:
+        await TakeoutService(export_dir, snapshot_store=store).parse_all()
+        service = TakeoutService(export_dir, snapshot_store=store)
+
+        history = await service.parse_watch_history()
+        playlists = await service.parse_playlists()
+        subscriptions = await service.parse_subscriptions()
+
+        assert [e.video_id for e in history] == ["dQw4w9WgXcQ", "test2video"]
+        assert {p.name for p in playlists} == {"Music", "Empty"}
+        assert [s.channel_id for s in subscriptions] == ["UC1"]
+        assert service.snapshot_stats.hits == 1
+
+    async def test_changed_export_is_reparsed(
+        self, export_dir: Path, store: TakeoutSnapshotStore
+    ) -> None:
+        await TakeoutService(export_dir, snapshot_store=store).parse_all()
+        history = export_dir / "YouTube and YouTube Music/history/watch-history.json"
+        history.write_text(json.dumps(_WATCH_HISTORY[:1]), encoding="utf-8")
+        _touch_later(history)
+
+        service = TakeoutService(export_dir, snapshot_store=store)
+        data = await service.parse_all()
+
+        assert service.snapshot_stats.hits == 0
+        assert service.snapshot_stats.rebuilt == 1
+        assert len(data.watch_history) == 1
+
+    async def test_without_store_nothing_is_written(
+        self, export_dir: Path, store: TakeoutSnapshotStore
+    ) -> None:
+        service = TakeoutService(export_dir)
+
+        await service.parse_all()
+
+        assert service.snapshot_stats == TakeoutSnapshotStats()
+        assert not store.directory.exists()
+
+    async def test_historical_watch_history_uses_its_own_snapshot(
+        self, export_dir: Path, store: TakeoutSnapshotStore
+    ) -> None:
+        takeout = HistoricalTakeout(
+            path=export_dir / "YouTube and YouTube Music",
+            export_date=datetime(2024, 1, 1, tzinfo=UTC),
+            has_watch_history=True,
+        )
+
+        first = TakeoutService(export_dir, snapshot_store=store)
+        parsed = await first.parse_historical_watch_history(takeout)
+        second = TakeoutService(export_dir, snapshot_store=store)
+        loaded = await second.parse_historical_watch_history(takeout)
+
+        assert first.snapshot_stats.rebuilt == 1
+        assert second.snapshot_stats.hits == 1
+        assert [e.model_dump() for e in loaded] == [e.model_dump() for e in parsed]
+        assert store.path_for(takeout.path, "watch_history").exists()
+        assert not store.path_for(takeout.path).exists()
+
+
+class TestSnapshotStats:
+    """Derived reporting values."""
+
+    def test_net_seconds_saved_subtracts_load_time(self) -> None:
+        stats = TakeoutSnapshotStats(hits=1, load_seconds=0.5, parse_seconds_saved=4)
+
+        assert stats.net_seconds_saved == 3.5
+
+    def test_net_seconds_saved_never_negative(self) -> None:
+        stats = TakeoutSnapshotStats(hits=1, load_seconds=2, parse_seconds_saved=1)
+
+        assert stats.net_seconds_saved == 0.0
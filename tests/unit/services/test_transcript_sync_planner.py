@@ -0,0 +1,166 @@
+"""
+Tests for TranscriptSyncPlanner.
+
+The planner decides every candidate's languages before ``sync transcripts``
+downloads anything, with one stored-pair query for the whole list.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from chronovista.models.enums import LanguageCode, LanguagePreferenceType
+from chronovista.models.user_language_preference import UserLanguagePreference
+from chronovista.services.preference_aware_transcript_filter import DownloadPlan
+from chronovista.services.transcript_sync_planner import (
+    ALREADY_STORED,
+    NO_PREFERENCE_MATCH,
+    NO_TRANSCRIPTS,
+    TranscriptSyncPlan,
+    TranscriptSyncPlanner,
+    VideoTranscriptPlan,
+    languages_from_download_plan,
+)
+
+
+def _video(video_id: str, title: str | None = None) -> MagicMock:
+    return MagicMock(video_id=video_id, title=title)
+
+
+def _preference(
+    language_code: LanguageCode, preference_type: LanguagePreferenceType
+) -> UserLanguagePreference:
+    return UserLanguagePreference(
+        user_id="test_user_001",
+        language_code=language_code,
+        preference_type=preference_type,
+        priority=1,
+        auto_download_transcripts=True,
+        created_at=datetime.now(UTC),
+    )
+
+
+def _planner(
+    stored: set[tuple[str, str]] | None = None,
+    available: dict[str, list[str]] | None = None,
+) -> TranscriptSyncPlanner:
+    repository = MagicMock()
+    repository.get_stored_language_keys = AsyncMock(return_value=stored or set())
+    service = MagicMock()
+
+    async def get_available_languages(video_id: str) -> list[dict[str, str]]:
+        codes = (available or {}).get(video_id)
+        if codes is None:
+            raise RuntimeError("Transcript API unavailable")
+        return [{"language_code": code} for code in codes]
+
+    service.get_available_languages = AsyncMock(side_effect=get_available_languages)
+    return TranscriptSyncPlanner(repository, service)
+
+
+class TestLanguagesFromDownloadPlan:
+    """Preference plans flatten to download order."""
+
+    def test_fluent_then_learning_pairs_without_repeats(self) -> None:
+        plan = DownloadPlan(
+            fluent_downloads=["en", "es"],
+            learning_pairs=[("ja", "en"), ("ko", None), ("es", "en")],
+            skipped_curious=["fr"],
+            blocked_excluded=["de"],
+        )
+
+        assert languages_from_download_plan(plan) == ["en", "es", "ja", "ko"]
+
+
+class TestTranscriptSyncPlanner:
+    """The whole candidate list is planned with one stored-pair query."""
+
+    async def test_language_flag_skips_videos_with_a_stored_language(self) -> None:
+        planner = _planner(stored={("vid1", "es")})
+        session = AsyncMock()
+
+        plan = await planner.plan(
+            session, [_video("vid1", "One"), _video("vid2")], languages=["en", "ES"]
+        )
+
+        planner.transcript_repository.get_stored_language_keys.assert_awaited_once_with(  # type: ignore[attr-defined]
+            session, ["vid1", "vid2"]
+        )
+        planner.transcript_service.get_available_languages.assert_not_called()  # type: ignore[attr-defined]
+        first, second = plan.videos
+        assert (first.skip_reason, first.existing_language) == (ALREADY_STORED, "ES")
+        assert second.title == "vid2"
+        assert plan.downloads == [second]
+        assert plan.download_count == 2
+        assert plan.language_counts() == {"en": 1, "ES": 1}
+        assert plan.skip_reasons() == {ALREADY_STORED: 1}
+
+    async def test_force_plans_stored_languages_and_keeps_the_stored_set(
+        self,
+    ) -> None:
+        planner = _planner(stored={("vid1", "en")})
+        progress: list[int] = []
+
+        plan = await planner.plan(
+            AsyncMock(),
+            [_video("vid1")],
+            languages=["en"],
+            force=True,
+            progress_callback=progress.append,
+        )
+
+        assert [v.video_id for v in plan.downloads] == ["vid1"]
+        assert plan.is_stored("vid1", "EN")
+        assert progress == [1]
+
+    async def test_preferences_pick_languages_per_video(self) -> None:
+        planner = _planner(available={"vid1": ["en", "fr"], "vid2": [], "vid3": ["de"]})
+        preferences = [
+            _preference(LanguageCode.ENGLISH, LanguagePreferenceType.FLUENT),
+            _preference(LanguageCode.GERMAN, LanguagePreferenceType.EXCLUDE),
+        ]
+
+        plan = await planner.plan(
+            AsyncMock(),
+            [_video("vid1"), _video("vid2"), _video("vid3")],
+            languages=["en"],
+            user_preferences=preferences,
+        )
+
+        matched, unavailable, unmatched = plan.videos
+        assert matched.languages == ["en"]
+        assert matched.available == ["en", "fr"]
+        assert matched.preference_plan is not None
+        assert unavailable.skip_reason == NO_TRANSCRIPTS
+        assert unmatched.skip_reason == NO_PREFERENCE_MATCH
+        assert unmatched.preference_plan is not None
+        assert unmatched.preference_plan.blocked_excluded == ["de"]
+
+    async def test_availability_errors_are_kept_per_video(self) -> None:
+        planner = _planner(available={"vid2": ["en"]})
+        preferences = [_preference(LanguageCode.ENGLISH, LanguagePreferenceType.FLUENT)]
+
+        plan = await planner.plan(
+            AsyncMock(),
+            [_video("vid1"), _video("vid2")],
+            languages=["en"],
+            user_preferences=preferences,
+        )
+
+        assert plan.errors[0].video_id == "vid1"
+        assert plan.errors[0].error == "Transcript API unavailable"
+        assert [v.video_id for v in plan.downloads] == ["vid2"]
+
+
+class TestTranscriptSyncPlan:
+    """Writes during the run update the stored-pair set."""
+
+    def test_mark_stored_uses_the_stored_spelling(self) -> None:
+        plan = TranscriptSyncPlan(videos=[VideoTranscriptPlan("vid", "Title")])
+
+        plan.mark_stored("vid", "en-us")
+
+        assert plan.stored == {("vid", "en-US")}
+        assert plan.is_stored("vid", "EN-US")
+        assert not plan.is_stored("vid", "en")
@@ -9,11 +9,13 @@ no-wanted-property case, and graceful degradation (FR-006). Fixture values are n
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any
 
 import httpx
 import pytest
 
+from chronovista.services.knowledge_base_cache import KnowledgeBaseCache
 from chronovista.services.wikidata_client import WikidataClient, WikidataUnavailable
 
 pytestmark = pytest.mark.asyncio
@@ -201,3 +203,93 @@ class TestFetchProperties:
         )
         with pytest.raises(WikidataUnavailable):
             await client.fetch_properties("Q000001")
+
+
+class TestFetchPropertiesMany:
+    @staticmethod
+    def _bulk_transport(calls: list[tuple[str, int]]) -> httpx.MockTransport:
+        """Every item has one occupation whose value-QID is ``V`` + its own number."""
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            props = request.url.params["props"]
+            ids = request.url.params["ids"].split("|")
+            calls.append((props, len(ids)))
+            if props == "claims":
+                entities = {
+                    qid: {
+                        "claims": {
+                            "P106": [
+                                {
+                                    "mainsnak": {
+                                        "snaktype": "value",
+                                        "datavalue": {
+                                            "type": "wikibase-entityid",
+                                            "value": {"id": f"Q9{qid[1:]}"},
+                                        },
+                                    }
+                                }
+                            ]
+                        }
+                    }
+                    for qid in ids
+                }
+            else:
+                entities = {
+                    qid: {"labels": {"en": {"value": f"Occupation {qid}"}}}
+                    for qid in ids
+                }
+            return httpx.Response(200, json={"entities": entities})
+
+        return httpx.MockTransport(respond)
+
+    async def test_requests_are_chunked_and_labels_shared(self) -> None:
+        calls: list[tuple[str, int]] = []
+        client = _client(self._bulk_transport(calls))
+        qids = [f"Q{i:06d}" for i in range(120)]
+
+        bags = await client.fetch_properties_many(qids)
+
+        assert calls == [
+            ("claims", 50),
+            ("claims", 50),
+            ("claims", 20),
+            ("labels", 50),
+            ("labels", 50),
+            ("labels", 20),
+        ]
+        assert client.request_count == 6
+        assert bags["Q000007"]["occupation"]["values"] == ["Occupation Q9000007"]
+        assert set(bags) == set(qids)
+
+    async def test_cache_answers_repeat_lookups(self, tmp_path: Path) -> None:
+        calls: list[tuple[str, int]] = []
+        cache = KnowledgeBaseCache(tmp_path / "kb.sqlite3", ttl_seconds=3600)
+        http = httpx.AsyncClient(transport=self._bulk_transport(calls))
+
+        first = await WikidataClient(http=http, cache=cache).fetch_properties_many(
+            ["Q000001", "Q000002"]
+        )
+        assert len(calls) == 2
+
+        # A single lookup of a cached item, and a bulk call that adds one new item.
+        again = WikidataClient(http=http, cache=cache)
+        assert (await again.fetch_properties("Q000001"))["occupation"]["values"] == (
+            first["Q000001"]["occupation"]["values"]
+        )
+        assert again.request_count == 0
+        await again.fetch_properties_many(["Q000002", "Q000003"])
+        assert calls[2:] == [("claims", 1), ("labels", 1)]
+
+    async def test_failure_caches_nothing(self, tmp_path: Path) -> None:
+        cache = KnowledgeBaseCache(tmp_path / "kb.sqlite3", ttl_seconds=3600)
+
+        def boom(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(503)
+
+        client = WikidataClient(
+            http=httpx.AsyncClient(transport=httpx.MockTransport(boom)), cache=cache
+        )
+        with pytest.raises(WikidataUnavailable):
+            await client.fetch_properties_many(["Q000001"])
+        assert cache.hits == 0 and cache.misses == 1
+        assert cache.get_many("wbgetentities", {"q": {"id": "Q000001"}}) == {}